@@ -6,6 +6,7 @@ from .forum_tag_update import *
 from .permission_overwrite import *
 from .voice_channel_effect import *
 
+from .message_cache_budget import *
 from .message_history import *
 from .message_iterator import *
 
@@ -19,6 +20,7 @@ __all__ = (
     *permission_overwrite.__all__,
     *voice_channel_effect.__all__,
     
+    *message_cache_budget.__all__,
     *message_history.__all__,
     *message_iterator.__all__,
 )
@@ -1,6 +1,5 @@
 __all__ = ('Channel',)
 
-from collections import deque
 from re import I as re_ignore_case, compile as re_compile, escape as re_escape, match as re_match, search as re_search
 
 from scarletio import LOOP_TIME, copy_docs, export, include
@@ -24,7 +23,8 @@ from ...utils import DATETIME_FORMAT_CODE
 
 from ..channel_metadata import ChannelMetadataBase, ChannelMetadataGuildMainBase
 from ..forum_tag import create_partial_forum_tag_from_id
-from ..message_history import MessageHistory, MessageHistoryCollector, message_relative_index
+from ..message_cache_budget import MESSAGE_CACHE_BUDGET
+from ..message_history import MessageHistory, MessageHistoryCollector, MessageRing, message_relative_index
 
 from .preinstanced import ChannelType
 from .fields import (
@@ -2339,6 +2339,8 @@ class Channel(DiscordEntity, immortal = True):
                 if messages_length != len(messages):
                     self.message_history_reached_end = False
         
+            MESSAGE_CACHE_BUDGET.touch(self)
+        
         return message
     
     
@@ -2372,6 +2374,7 @@ class Channel(DiscordEntity, immortal = True):
         else:
             self._maybe_increase_queue_size().append(message)
         
+        MESSAGE_CACHE_BUDGET.touch(self)
         return message
     
     
@@ -2399,12 +2402,15 @@ class Channel(DiscordEntity, immortal = True):
             if index != len(messages):
                 message = messages[index]
                 if message.id == message_id:
+                    MESSAGE_CACHE_BUDGET.hit_count += 1
                     return message, True
         
+        MESSAGE_CACHE_BUDGET.miss_count += 1
         message = Message.from_data(message_data)
         
         if chained:
             self._maybe_increase_queue_size().append(message)
+            MESSAGE_CACHE_BUDGET.touch(self)
         
         return message, False
     
@@ -2441,12 +2447,12 @@ class Channel(DiscordEntity, immortal = True):
         
         Returns
         -------
-        messages : `deque`
+        messages : ``MessageRing``
         """
         messages = self.messages
         if messages is None:
             # Create unlimited size.
-            self.messages = messages = deque()
+            self.messages = messages = MessageRing()
             self._add_message_collection_delay(110.0)
         else:
             max_length = messages.maxlen
@@ -2456,7 +2462,7 @@ class Channel(DiscordEntity, immortal = True):
             else:
                 # Switch to unlimited if we hit our current limit.
                 if len(messages) == max_length:
-                    self.messages = messages = deque(messages)
+                    messages.set_maxlen(None)
                     self._add_message_collection_delay(110.0)
         
         return messages
@@ -2468,7 +2474,7 @@ class Channel(DiscordEntity, immortal = True):
         
         Returns
         -------
-        messages : `deque`, `None`
+        messages : ``None | MessageRing``
         """
         messages = self.messages
         if messages is None:
@@ -2477,9 +2483,9 @@ class Channel(DiscordEntity, immortal = True):
                 if self._message_history_collector is None:
                     messages = None
                 else:
-                    self.messages = messages = deque(maxlen = None)
+                    self.messages = messages = MessageRing()
             else:
-                self.messages = messages = deque(maxlen = message_keep_limit)
+                self.messages = messages = MessageRing(None, message_keep_limit)
         else:
             
             max_length = messages.maxlen
@@ -2487,7 +2493,7 @@ class Channel(DiscordEntity, immortal = True):
                 if self._message_history_collector is None:
                     self.message_history_reached_end = False
                 else:
-                    self.messages = messages = deque(messages, maxlen = None)
+                    messages.set_maxlen(None)
         
         return messages
     
@@ -2496,20 +2502,14 @@ class Channel(DiscordEntity, immortal = True):
         """
         Switches a channel's `.messages` to limited from unlimited.
         """
-        old_messages = self.messages
-        if old_messages is None:
-            new_messages = None
-        else:
+        messages = self.messages
+        if (messages is not None):
             limit = self._message_keep_limit
             if limit == 0:
-                new_messages = None
+                self.messages = None
             else:
-                new_messages = deque(
-                    (old_messages[index] for index in range(min(limit, len(old_messages)))),
-                    maxlen = limit,
-                )
+                messages.set_maxlen(limit)
         
-        self.messages = new_messages
         self._cancel_message_collection()
         self.message_history_reached_end = False
     
@@ -2533,6 +2533,7 @@ class Channel(DiscordEntity, immortal = True):
             if index != len(messages):
                 message = messages[index]
                 if message.id == delete_id:
+                    MESSAGE_CACHE_BUDGET.hit_count += 1
                     del messages[index]
                     if (self._message_history_collector is not None):
                         if len(messages) < self._message_keep_limit:
@@ -2546,6 +2547,8 @@ class Channel(DiscordEntity, immortal = True):
                     message.deleted = True
                     return message
         
+        MESSAGE_CACHE_BUDGET.miss_count += 1
+        
         try:
             message = MESSAGES.pop(delete_id)
         except KeyError:
@@ -2591,6 +2594,9 @@ class Channel(DiscordEntity, immortal = True):
             messages_index = message_relative_index(messages, delete_ids[0])
         delete_index = 0
         
+        # The found messages are removed from the history at once at the end.
+        history_delete_indexes = []
+        
         while True:
             if delete_index == delete_length:
                 break
@@ -2618,7 +2624,7 @@ class Channel(DiscordEntity, immortal = True):
             message_id = message.id
             
             if message_id == delete_id:
-                del messages[messages_index]
+                history_delete_indexes.append(messages_index)
                 try:
                     del MESSAGES[delete_id]
                 except KeyError:
@@ -2627,7 +2633,7 @@ class Channel(DiscordEntity, immortal = True):
                 message.deleted = True
                 found.append(message)
                 
-                messages_length -= 1
+                messages_index += 1
                 delete_index += 1
                 continue
             
@@ -2647,6 +2653,12 @@ class Channel(DiscordEntity, immortal = True):
             
             continue
         
+        if history_delete_indexes:
+            messages.delete_indexes(history_delete_indexes)
+        
+        MESSAGE_CACHE_BUDGET.hit_count += len(history_delete_indexes)
+        MESSAGE_CACHE_BUDGET.miss_count += delete_length - len(history_delete_indexes)
+        
         if (
             (messages is not None) and
             (self._message_history_collector is not None) and
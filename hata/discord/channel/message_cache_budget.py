@@ -0,0 +1,287 @@
+__all__ = ('MESSAGE_CACHE_BUDGET', 'MessageCacheBudget',)
+
+from collections import OrderedDict
+
+from scarletio import RichAttributeErrorBaseType, WeakReferer
+
+from ...env import MESSAGE_CACHE_LIMIT, MESSAGE_CACHE_MINIMUM
+
+
+# When evicting, the message count is reduced by the limit's `1 / (2 ** EVICTION_HEADROOM_SHIFT)` part under the limit.
+EVICTION_HEADROOM_SHIFT = 3
+
+
+def _validate_count(value, name):
+    """
+    Validates the given non-negative integer.
+    
+    Parameters
+    ----------
+    value : `int`
+        The value to validate.
+    name : `str`
+        The parameter's name.
+    
+    Returns
+    -------
+    value : `int`
+    
+    Raises
+    ------
+    TypeError
+        - If `value`'s type is incorrect.
+    ValueError
+        - If `value` is negative.
+    """
+    if type(value) is int:
+        pass
+    elif isinstance(value, int):
+        value = int(value)
+    else:
+        raise TypeError(
+            f'`{name}` can be `int`, got {value.__class__.__name__}; {value!r}.'
+        )
+    
+    if value < 0:
+        raise ValueError(
+            f'`{name}` cannot be negative, got {value!r}.'
+        )
+    
+    return value
+
+
+class MessageCacheBudget(RichAttributeErrorBaseType):
+    """
+    Process-wide budget of the messages kept in the channels' message histories.
+    
+    Channels are ordered by when a message was added to their history the last time. When there are more messages
+    than the limit, the least recently active channels' message histories are shrunk to the per channel minimum,
+    dropping their oldest messages first, till the message count is an eighth of the limit under it. Dropped messages
+    are removed from `MESSAGES` as well when nothing else references them, since it is a weak cache.
+    
+    Channels which are collecting their history (for example because of message iteration) are not shrunk.
+    
+    Attributes
+    ----------
+    _channels : `OrderedDict<int, list<WeakReferer<Channel> | int>>`
+        Channel identifier to channel reference and message count relation. Ordered from the least recently
+        active channel to the most recently active one.
+    evicted_message_count : `int`
+        The amount of messages dropped from the message histories because of the budget.
+    hit_count : `int`
+        The amount of times a looked up message was found in its channel's message history.
+    limit : `int`
+        The maximal amount of messages to keep in all channels' message histories combined. `0` if unlimited.
+    message_count : `int`
+        The amount of tracked messages.
+    minimum : `int`
+        The amount of messages every channel is allowed to keep even when over budget.
+    miss_count : `int`
+        The amount of times a looked up message was not found in its channel's message history.
+    """
+    __slots__ = (
+        '_channels', 'evicted_message_count', 'hit_count', 'limit', 'message_count', 'minimum', 'miss_count'
+    )
+    
+    def __new__(cls, limit = 0, minimum = 1):
+        """
+        Creates a new message cache budget.
+        
+        Parameters
+        ----------
+        limit : `int` = `0`, Optional
+            The maximal amount of messages to keep in all channels' message histories combined. `0` if unlimited.
+        minimum : `int` = `1`, Optional
+            The amount of messages every channel is allowed to keep even when over budget.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        limit = _validate_count(limit, 'limit')
+        minimum = _validate_count(minimum, 'minimum')
+        
+        self = object.__new__(cls)
+        self._channels = OrderedDict()
+        self.evicted_message_count = 0
+        self.hit_count = 0
+        self.limit = limit
+        self.message_count = 0
+        self.minimum = minimum
+        self.miss_count = 0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the message cache budget's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        limit = self.limit
+        if limit:
+            repr_parts.append(' limit = ')
+            repr_parts.append(repr(limit))
+            
+            repr_parts.append(', minimum = ')
+            repr_parts.append(repr(self.minimum))
+            
+            repr_parts.append(', message_count = ')
+            repr_parts.append(repr(self.message_count))
+            
+            repr_parts.append(',')
+        
+        repr_parts.append(' hit_count = ')
+        repr_parts.append(repr(self.hit_count))
+        
+        repr_parts.append(', miss_count = ')
+        repr_parts.append(repr(self.miss_count))
+        
+        repr_parts.append(', evicted_message_count = ')
+        repr_parts.append(repr(self.evicted_message_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def set_limit(self, limit, minimum = ...):
+        """
+        Sets the budget's limit. If there are more messages than the new limit, drops the extra ones.
+        
+        Parameters
+        ----------
+        limit : `int`
+            The maximal amount of messages to keep in all channels' message histories combined. `0` if unlimited.
+        minimum : `int`, Optional
+            The amount of messages every channel is allowed to keep even when over budget.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        limit = _validate_count(limit, 'limit')
+        if (minimum is not ...):
+            self.minimum = _validate_count(minimum, 'minimum')
+        
+        self.limit = limit
+        if not limit:
+            self._channels.clear()
+            self.message_count = 0
+        
+        elif self.message_count > limit:
+            self._evict()
+    
+    
+    def get_statistics(self):
+        """
+        Returns the budget's statistics.
+        
+        Returns
+        -------
+        statistics : `dict<str, int>`
+        """
+        return {
+            'channel_count': len(self._channels),
+            'evicted_message_count': self.evicted_message_count,
+            'hit_count': self.hit_count,
+            'limit': self.limit,
+            'message_count': self.message_count,
+            'miss_count': self.miss_count,
+        }
+    
+    
+    def reset_statistics(self):
+        """
+        Resets the budget's hit, miss and eviction counters.
+        """
+        self.evicted_message_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+    
+    
+    def touch(self, channel):
+        """
+        Marks the channel as the most recently active one and updates its message count. Called when a message is
+        added to the channel's message history. If the budget is exceeded, drops messages from the least recently
+        active channels.
+        
+        Parameters
+        ----------
+        channel : ``Channel``
+            The channel to touch.
+        """
+        if not self.limit:
+            return
+        
+        messages = channel.messages
+        if messages is None:
+            message_count = 0
+        else:
+            message_count = len(messages)
+        
+        channels = self._channels
+        channel_id = channel.id
+        entry = channels.get(channel_id, None)
+        if entry is None:
+            channels[channel_id] = [WeakReferer(channel), message_count]
+            self.message_count += message_count
+        else:
+            channels.move_to_end(channel_id)
+            self.message_count += message_count - entry[1]
+            entry[1] = message_count
+        
+        if self.message_count > self.limit:
+            self._evict()
+    
+    
+    def _evict(self):
+        """
+        Drops messages from the least recently active channels till the message count is back at the budget's
+        low-water mark.
+        
+        The checked channels are moved to the most recently active end, so the next eviction does not re-scan the
+        channels which are already at their minimum.
+        """
+        channels = self._channels
+        minimum = self.minimum
+        limit = self.limit
+        # Evict a bit under the limit, so not every touch has to evict once the budget is full.
+        low_water_mark = limit - (limit >> EVICTION_HEADROOM_SHIFT)
+        
+        for counter in range(len(channels)):
+            if self.message_count <= low_water_mark:
+                break
+            
+            channel_id, entry = channels.popitem(last = False)
+            channel_reference, tracked_count = entry
+            channel = channel_reference()
+            messages = None if channel is None else channel.messages
+            if messages is None:
+                self.message_count -= tracked_count
+                continue
+            
+            # Correct the count, messages might have been deleted since the last touch.
+            message_count = len(messages)
+            self.message_count += message_count - tracked_count
+            
+            # Do not shrink channels which are collecting their history.
+            if channel._message_history_collector is None:
+                drop_count = min(message_count - minimum, self.message_count - low_water_mark)
+                if drop_count > 0:
+                    messages.drop_oldest(drop_count)
+                    channel.message_history_reached_end = False
+                    
+                    message_count -= drop_count
+                    self.message_count -= drop_count
+                    self.evicted_message_count += drop_count
+            
+            if message_count:
+                entry[1] = message_count
+                channels[channel_id] = entry
+
+
+MESSAGE_CACHE_BUDGET = MessageCacheBudget(MESSAGE_CACHE_LIMIT, MESSAGE_CACHE_MINIMUM)
@@ -1,7 +1,7 @@
-__all__ = ('message_relative_index',)
+__all__ = ('MessageRing', 'message_relative_index',)
 
-from collections import deque
 from datetime import datetime as DateTime, timezone as TimeZone
+from itertools import islice
 from time import time as current_time
 
 from scarletio import LOOP_TIME, WeakReferer
@@ -20,7 +20,7 @@ def message_relative_index(messages, message_id):
     
     Parameters
     ----------
-    messages : `deque` of ``Message``
+    messages : ``MessageRing``, `sequence` of ``Message``
         The message history of a channel.
     message_id : `int`
         A messages' id to search.
@@ -29,6 +29,9 @@ def message_relative_index(messages, message_id):
     -------
     index : `int`
     """
+    if type(messages) is MessageRing:
+        return messages.relative_index(message_id)
+    
     bot = 0
     top = len(messages)
     while True:
@@ -44,6 +47,407 @@ def message_relative_index(messages, message_id):
     return bot
 
 
+MESSAGE_RING_HEAD_RESERVE_MIN = 8
+
+
+class MessageRing:
+    """
+    Container of a channel's message history, ordered from the newest message to the oldest.
+    
+    Supports the same operations as a `deque`, but indexing is `O(1)`, so searching a message by its identifier is
+    `O(log n)`. Both ends can be extended and shrunk in amortized `O(1)`, because the messages are stored
+    in a list with free space reserved before its head.
+    
+    Attributes
+    ----------
+    _items : `list<None | Message>`
+        The messages. The slots before `_start` are free.
+    _start : `int`
+        The index of the newest message in `_items`.
+    maxlen : `None | int`
+        The maximal amount of messages to store. `None` if unlimited.
+    """
+    __slots__ = ('_items', '_start', 'maxlen')
+    
+    def __new__(cls, iterable = None, maxlen = None):
+        """
+        Creates a new message ring.
+        
+        Parameters
+        ----------
+        iterable : `None | iterable<Message>` = `None`, Optional
+            Messages to fill the ring with, ordered from the newest to the oldest. If there are more than `maxlen`,
+            only the last ones are kept, like with a `deque`.
+        maxlen : `None | int` = `None`, Optional
+            The maximal amount of messages to store. `None` if unlimited.
+        """
+        if iterable is None:
+            items = []
+        else:
+            items = [*iterable]
+            if (maxlen is not None) and (len(items) > maxlen):
+                del items[: len(items) - maxlen]
+        
+        self = object.__new__(cls)
+        self._items = items
+        self._start = 0
+        self.maxlen = maxlen
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the message ring's representation."""
+        repr_parts = [type(self).__name__, '([']
+        
+        for index, message in enumerate(self):
+            if index:
+                repr_parts.append(', ')
+            repr_parts.append(repr(message))
+        
+        repr_parts.append(']')
+        
+        maxlen = self.maxlen
+        if (maxlen is not None):
+            repr_parts.append(', maxlen = ')
+            repr_parts.append(repr(maxlen))
+        
+        repr_parts.append(')')
+        return ''.join(repr_parts)
+    
+    
+    def __len__(self):
+        """Returns the amount of messages in the ring."""
+        return len(self._items) - self._start
+    
+    
+    def __iter__(self):
+        """Iterates over the messages from the newest to the oldest."""
+        return islice(self._items, self._start, None)
+    
+    
+    def __reversed__(self):
+        """Iterates over the messages from the oldest to the newest."""
+        return islice(reversed(self._items), len(self._items) - self._start)
+    
+    
+    def _get_item_index(self, index):
+        """
+        Converts the given message index to an index of `._items`.
+        
+        Parameters
+        ----------
+        index : `int`
+            Message index. Can be negative.
+        
+        Returns
+        -------
+        index : `int`
+        
+        Raises
+        ------
+        IndexError
+            - If the index is out of range.
+        """
+        start = self._start
+        items_length = len(self._items)
+        
+        if index < 0:
+            index += items_length
+            if index < start:
+                raise IndexError('message ring index out of range')
+        
+        else:
+            index += start
+            if index >= items_length:
+                raise IndexError('message ring index out of range')
+        
+        return index
+    
+    
+    def __getitem__(self, index):
+        """Returns the message at the given index."""
+        return self._items[self._get_item_index(index)]
+    
+    
+    def __setitem__(self, index, message):
+        """Sets the message at the given index."""
+        self._items[self._get_item_index(index)] = message
+    
+    
+    def __delitem__(self, index):
+        """Removes the message at the given index."""
+        index = self._get_item_index(index)
+        if index == self._start:
+            self._items[index] = None
+            self._start = index + 1
+        else:
+            del self._items[index]
+    
+    
+    def _reserve_head(self):
+        """
+        Reserves free space before the newest message. Called when there is no free space left.
+        
+        The reserved space is proportional to the amount of messages, so prepending is amortized `O(1)`.
+        """
+        items = self._items
+        reserve = max(len(items), MESSAGE_RING_HEAD_RESERVE_MIN)
+        new_items = [None] * reserve
+        new_items.extend(items)
+        self._items = new_items
+        self._start = reserve
+    
+    
+    def appendleft(self, message):
+        """
+        Adds a new newest message. If the ring is full, its oldest message is dropped.
+        
+        Parameters
+        ----------
+        message : ``Message``
+            The message to add.
+        """
+        maxlen = self.maxlen
+        if (maxlen is not None) and (len(self._items) - self._start >= maxlen):
+            if not maxlen:
+                return
+            
+            self._items.pop()
+        
+        start = self._start
+        if not start:
+            self._reserve_head()
+            start = self._start
+        
+        start -= 1
+        self._items[start] = message
+        self._start = start
+    
+    
+    def append(self, message):
+        """
+        Adds a new oldest message. If the ring is full, its newest message is dropped.
+        
+        Parameters
+        ----------
+        message : ``Message``
+            The message to add.
+        """
+        maxlen = self.maxlen
+        if (maxlen is not None) and (len(self._items) - self._start >= maxlen):
+            if not maxlen:
+                return
+            
+            self.popleft()
+        
+        self._items.append(message)
+    
+    
+    def pop(self):
+        """
+        Removes and returns the oldest message.
+        
+        Returns
+        -------
+        message : ``Message``
+        
+        Raises
+        ------
+        IndexError
+            - If the ring is empty.
+        """
+        if len(self._items) == self._start:
+            raise IndexError('pop from an empty message ring')
+        
+        return self._items.pop()
+    
+    
+    def drop_oldest(self, count):
+        """
+        Removes the given amount of the oldest messages in one step.
+        
+        Parameters
+        ----------
+        count : `int`
+            The amount of messages to remove. If greater than the amount of messages, every message is removed.
+        """
+        if count <= 0:
+            return
+        
+        items = self._items
+        start = self._start
+        if count >= len(items) - start:
+            self.clear()
+        else:
+            del items[len(items) - count :]
+    
+    
+    def popleft(self):
+        """
+        Removes and returns the newest message.
+        
+        Returns
+        -------
+        message : ``Message``
+        
+        Raises
+        ------
+        IndexError
+            - If the ring is empty.
+        """
+        start = self._start
+        items = self._items
+        if len(items) == start:
+            raise IndexError('pop from an empty message ring')
+        
+        message = items[start]
+        items[start] = None
+        self._start = start + 1
+        return message
+    
+    
+    def insert(self, index, message):
+        """
+        Inserts the message before the given index.
+        
+        Parameters
+        ----------
+        index : `int`
+            The index to insert the message at.
+        message : ``Message``
+            The message to insert.
+        
+        Raises
+        ------
+        IndexError
+            - If the ring is full.
+        """
+        length = len(self._items) - self._start
+        maxlen = self.maxlen
+        if (maxlen is not None) and (length >= maxlen):
+            raise IndexError('message ring already at its maximum size')
+        
+        if index < 0:
+            index = max(index + length, 0)
+        
+        if index == 0:
+            self.appendleft(message)
+        else:
+            self._items.insert(self._start + min(index, length), message)
+    
+    
+    def set_maxlen(self, maxlen):
+        """
+        Sets the maximal amount of messages to store. If there are more messages, the oldest ones are dropped.
+        
+        Parameters
+        ----------
+        maxlen : `None | int`
+            The maximal amount of messages to store. `None` if unlimited.
+        """
+        self.maxlen = maxlen
+        if (maxlen is not None) and (len(self._items) - self._start > maxlen):
+            # Copy the kept messages, so the reserved space is released too.
+            start = self._start
+            self._items = self._items[start : start + maxlen]
+            self._start = 0
+    
+    
+    def clear(self):
+        """
+        Removes all messages.
+        """
+        self._items = []
+        self._start = 0
+    
+    
+    def relative_index(self, message_id):
+        """
+        Searches the relative index of the given message's id. If the message is not found, the returned index is
+        where it should be inserted.
+        
+        Parameters
+        ----------
+        message_id : `int`
+            A messages' id to search.
+        
+        Returns
+        -------
+        index : `int`
+        """
+        items = self._items
+        start = self._start
+        bot = start
+        top = len(items)
+        while bot < top:
+            half = (bot + top) >> 1
+            if items[half].id > message_id:
+                bot = half + 1
+            else:
+                top = half
+        
+        return bot - start
+    
+    
+    def get(self, message_id):
+        """
+        Returns the message with the given identifier.
+        
+        Parameters
+        ----------
+        message_id : `int`
+            The message's identifier.
+        
+        Returns
+        -------
+        message : `None | Message`
+        """
+        items = self._items
+        index = self.relative_index(message_id) + self._start
+        if index < len(items):
+            message = items[index]
+            if message.id == message_id:
+                return message
+        
+        return None
+    
+    
+    def delete_indexes(self, indexes):
+        """
+        Removes the messages at the given indexes in one pass.
+        
+        Parameters
+        ----------
+        indexes : `list<int>`
+            The indexes of the messages to remove in ascending order. Cannot be negative.
+        """
+        if not indexes:
+            return
+        
+        items = self._items
+        start = self._start
+        
+        # Copy the kept runs between the removed messages, then drop the tail.
+        write_index = indexes[0] + start
+        read_index = write_index + 1
+        for index in islice(indexes, 1, None):
+            index += start
+            if index > read_index:
+                end_index = write_index + index - read_index
+                items[write_index : end_index] = items[read_index : index]
+                write_index = end_index
+            
+            read_index = index + 1
+        
+        items_length = len(items)
+        if items_length > read_index:
+            end_index = write_index + items_length - read_index
+            items[write_index : end_index] = items[read_index : items_length]
+            write_index = end_index
+        
+        del items[write_index:]
+
+
 class MessageHistoryCollector:
     """
     Attributes
@@ -144,7 +548,7 @@ class MessageHistory:
     message_history_reached_end : `bool`
         Whether the channel's message's are loaded till their end. If the channel's message history reach it's end
         no requests will be requested to get older messages.
-    messages : `deque` of ``Message`` objects
+    messages : `None | MessageRing`
         The channel's message history.
     """
     __slots__ = ('_message_keep_limit', '_message_history_collector', 'message_history_reached_end', 'messages',)
@@ -175,16 +579,10 @@ class MessageHistory:
         """
         if self._message_keep_limit != message_keep_limit:
             if message_keep_limit == 0:
-                new_messages = None
+                self.messages = None
             else:
-                old_messages = self.messages
-                if old_messages is None:
-                    new_messages = None
-                else:
-                    new_messages = deque(
-                        (old_messages[i] for i in range(min(message_keep_limit, len(old_messages)))),
-                        maxlen = message_keep_limit,
-                    )
+                messages = self.messages
+                if (messages is not None):
+                    messages.set_maxlen(message_keep_limit)
             
-            self.messages = new_messages
             self._message_keep_limit = message_keep_limit
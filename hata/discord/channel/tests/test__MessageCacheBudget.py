@@ -0,0 +1,244 @@
+import vampytest
+
+from ...message import Message
+
+from ..channel import Channel, ChannelType
+from ..message_cache_budget import MessageCacheBudget
+from ..message_history import MessageRing
+
+
+def _assert_fields_set(message_cache_budget):
+    """
+    Asserts whether every attribute is set of the given message cache budget.
+    
+    Parameters
+    ----------
+    message_cache_budget : ``MessageCacheBudget``
+        The message cache budget to check.
+    """
+    vampytest.assert_instance(message_cache_budget, MessageCacheBudget)
+    vampytest.assert_instance(message_cache_budget._channels, dict)
+    vampytest.assert_instance(message_cache_budget.evicted_message_count, int)
+    vampytest.assert_instance(message_cache_budget.hit_count, int)
+    vampytest.assert_instance(message_cache_budget.limit, int)
+    vampytest.assert_instance(message_cache_budget.message_count, int)
+    vampytest.assert_instance(message_cache_budget.minimum, int)
+    vampytest.assert_instance(message_cache_budget.miss_count, int)
+
+
+def _create_channel(channel_id, message_count):
+    """
+    Creates a channel with the given amount of messages in its message history.
+    
+    Parameters
+    ----------
+    channel_id : `int`
+        The channel's identifier.
+    message_count : `int`
+        The amount of messages to create.
+    
+    Returns
+    -------
+    channel : ``Channel``
+    """
+    channel = Channel.precreate(channel_id, channel_type = ChannelType.guild_text)
+    channel.messages = MessageRing(
+        [Message.precreate(channel_id + message_count - index) for index in range(message_count)]
+    )
+    return channel
+
+
+def test__MessageCacheBudget__new__no_fields():
+    """
+    Tests whether ``MessageCacheBudget.__new__`` works as intended.
+    
+    Case: No fields given.
+    """
+    message_cache_budget = MessageCacheBudget()
+    _assert_fields_set(message_cache_budget)
+    
+    vampytest.assert_eq(message_cache_budget.limit, 0)
+    vampytest.assert_eq(message_cache_budget.minimum, 1)
+
+
+def test__MessageCacheBudget__new__all_fields():
+    """
+    Tests whether ``MessageCacheBudget.__new__`` works as intended.
+    
+    Case: All fields given.
+    """
+    limit = 100
+    minimum = 5
+    
+    message_cache_budget = MessageCacheBudget(limit, minimum)
+    _assert_fields_set(message_cache_budget)
+    
+    vampytest.assert_eq(message_cache_budget.limit, limit)
+    vampytest.assert_eq(message_cache_budget.minimum, minimum)
+
+
+def _iter_options__new__type_error():
+    yield 'a', 1
+    yield 1, 'a'
+
+
+def _iter_options__new__value_error():
+    yield -1, 1
+    yield 1, -1
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__new__value_error()).raising(ValueError))
+def test__MessageCacheBudget__new__error(limit, minimum):
+    """
+    Tests whether ``MessageCacheBudget.__new__`` works as intended.
+    
+    Case: Invalid parameters.
+    
+    Parameters
+    ----------
+    limit : `object`
+        Limit to create the budget with.
+    minimum : `object`
+        Minimum to create the budget with.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    MessageCacheBudget(limit, minimum)
+
+
+def test__MessageCacheBudget__repr():
+    """
+    Tests whether ``MessageCacheBudget.__repr__`` works as intended.
+    """
+    message_cache_budget = MessageCacheBudget(100, 5)
+    
+    output = repr(message_cache_budget)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(message_cache_budget).__name__, output)
+    vampytest.assert_in('limit = 100', output)
+
+
+def test__MessageCacheBudget__touch__disabled():
+    """
+    Tests whether ``MessageCacheBudget.touch`` works as intended.
+    
+    Case: Unlimited budget.
+    """
+    channel = _create_channel(202510180200, 10)
+    
+    message_cache_budget = MessageCacheBudget(0, 1)
+    message_cache_budget.touch(channel)
+    
+    vampytest.assert_eq(message_cache_budget.message_count, 0)
+    vampytest.assert_eq(len(channel.messages), 10)
+
+
+def test__MessageCacheBudget__touch__evict():
+    """
+    Tests whether ``MessageCacheBudget.touch`` works as intended.
+    
+    Case: Over budget, the least recently active channel is shrunk first down to the low-water mark.
+    """
+    channel_0 = _create_channel(202510180300, 6)
+    channel_1 = _create_channel(202510180400, 6)
+    channel_2 = _create_channel(202510180500, 6)
+    kept_message_ids = [message.id for message in channel_0.messages][:2]
+    
+    message_cache_budget = MessageCacheBudget(16, 2)
+    message_cache_budget.touch(channel_0)
+    message_cache_budget.touch(channel_1)
+    message_cache_budget.touch(channel_2)
+    
+    vampytest.assert_eq(message_cache_budget.message_count, 14)
+    vampytest.assert_eq(message_cache_budget.evicted_message_count, 4)
+    vampytest.assert_eq([message.id for message in channel_0.messages], kept_message_ids)
+    vampytest.assert_eq(len(channel_1.messages), 6)
+    vampytest.assert_eq(len(channel_2.messages), 6)
+    
+    # The shrunk channel is moved to the end, so it is not scanned again first.
+    vampytest.assert_eq([*message_cache_budget._channels.keys()], [channel_1.id, channel_2.id, channel_0.id])
+    
+    # Under the limit nothing is evicted.
+    channel_0.messages.appendleft(Message.precreate(202510180307))
+    channel_0.messages.appendleft(Message.precreate(202510180308))
+    message_cache_budget.touch(channel_0)
+    
+    vampytest.assert_eq(message_cache_budget.message_count, 16)
+    vampytest.assert_eq(message_cache_budget.evicted_message_count, 4)
+    
+    # Over the limit again, the second channel is the least recently active.
+    channel_0.messages.appendleft(Message.precreate(202510180309))
+    message_cache_budget.touch(channel_0)
+    
+    vampytest.assert_eq(message_cache_budget.message_count, 14)
+    vampytest.assert_eq(len(channel_0.messages), 5)
+    vampytest.assert_eq(len(channel_1.messages), 3)
+    vampytest.assert_eq(len(channel_2.messages), 6)
+
+
+def test__MessageCacheBudget__touch__minimum():
+    """
+    Tests whether ``MessageCacheBudget.touch`` works as intended.
+    
+    Case: Channels are not shrunk below the minimum.
+    """
+    channel_0 = _create_channel(202510180600, 4)
+    channel_1 = _create_channel(202510180700, 4)
+    
+    message_cache_budget = MessageCacheBudget(2, 3)
+    message_cache_budget.touch(channel_0)
+    message_cache_budget.touch(channel_1)
+    
+    vampytest.assert_eq(len(channel_0.messages), 3)
+    vampytest.assert_eq(len(channel_1.messages), 3)
+    vampytest.assert_eq(message_cache_budget.evicted_message_count, 2)
+
+
+def test__MessageCacheBudget__set_limit():
+    """
+    Tests whether ``MessageCacheBudget.set_limit`` works as intended.
+    """
+    channel = _create_channel(202510180800, 6)
+    
+    message_cache_budget = MessageCacheBudget(10, 1)
+    message_cache_budget.touch(channel)
+    message_cache_budget.set_limit(4, 2)
+    
+    vampytest.assert_eq(message_cache_budget.limit, 4)
+    vampytest.assert_eq(message_cache_budget.minimum, 2)
+    vampytest.assert_eq(len(channel.messages), 4)
+    
+    message_cache_budget.set_limit(0)
+    vampytest.assert_eq(message_cache_budget.message_count, 0)
+    vampytest.assert_eq(message_cache_budget.get_statistics()['channel_count'], 0)
+
+
+def test__MessageCacheBudget__statistics():
+    """
+    Tests whether ``MessageCacheBudget.get_statistics`` and ``.reset_statistics`` works as intended.
+    """
+    message_cache_budget = MessageCacheBudget(10, 1)
+    message_cache_budget.hit_count = 2
+    message_cache_budget.miss_count = 3
+    message_cache_budget.evicted_message_count = 4
+    
+    vampytest.assert_eq(
+        message_cache_budget.get_statistics(),
+        {
+            'channel_count': 0,
+            'evicted_message_count': 4,
+            'hit_count': 2,
+            'limit': 10,
+            'message_count': 0,
+            'miss_count': 3,
+        },
+    )
+    
+    message_cache_budget.reset_statistics()
+    vampytest.assert_eq(message_cache_budget.hit_count, 0)
+    vampytest.assert_eq(message_cache_budget.miss_count, 0)
+    vampytest.assert_eq(message_cache_budget.evicted_message_count, 0)
@@ -0,0 +1,290 @@
+import vampytest
+
+from ...message import Message
+
+from ..message_history import MessageRing, message_relative_index
+
+
+def _assert_fields_set(message_ring):
+    """
+    Asserts whether every attribute is set of the given message ring.
+    
+    Parameters
+    ----------
+    message_ring : ``MessageRing``
+        The message ring to check.
+    """
+    vampytest.assert_instance(message_ring, MessageRing)
+    vampytest.assert_instance(message_ring._items, list)
+    vampytest.assert_instance(message_ring._start, int)
+    vampytest.assert_instance(message_ring.maxlen, int, nullable = True)
+
+
+def _create_messages(*message_ids):
+    """
+    Creates messages with the given identifiers.
+    
+    Parameters
+    ----------
+    *message_ids : `int`
+        Message identifiers.
+    
+    Returns
+    -------
+    messages : `list<Message>`
+    """
+    return [Message.precreate(message_id) for message_id in message_ids]
+
+
+def test__MessageRing__new__no_fields():
+    """
+    Tests whether ``MessageRing.__new__`` works as intended.
+    
+    Case: No fields given.
+    """
+    message_ring = MessageRing()
+    _assert_fields_set(message_ring)
+    
+    vampytest.assert_eq(len(message_ring), 0)
+    vampytest.assert_is(message_ring.maxlen, None)
+
+
+def test__MessageRing__new__all_fields():
+    """
+    Tests whether ``MessageRing.__new__`` works as intended.
+    
+    Case: All fields given.
+    """
+    messages = _create_messages(202510180005, 202510180004, 202510180003)
+    
+    message_ring = MessageRing(messages, 2)
+    _assert_fields_set(message_ring)
+    
+    vampytest.assert_eq([*message_ring], messages[1:])
+    vampytest.assert_eq(message_ring.maxlen, 2)
+
+
+def test__MessageRing__repr():
+    """
+    Tests whether ``MessageRing.__repr__`` works as intended.
+    """
+    messages = _create_messages(202510180006)
+    
+    message_ring = MessageRing(messages, 2)
+    
+    output = repr(message_ring)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(message_ring).__name__, output)
+    vampytest.assert_in('maxlen = 2', output)
+
+
+def test__MessageRing__iter():
+    """
+    Tests whether ``MessageRing.__iter__`` and ``.__reversed__`` works as intended.
+    """
+    messages = _create_messages(202510180012, 202510180011, 202510180010)
+    
+    message_ring = MessageRing(messages[1:])
+    message_ring.appendleft(messages[0])
+    
+    vampytest.assert_eq([*message_ring], messages)
+    vampytest.assert_eq([*reversed(message_ring)], messages[::-1])
+
+
+def test__MessageRing__appendleft():
+    """
+    Tests whether ``MessageRing.appendleft`` works as intended.
+    
+    Case: The ring is full, so the oldest message is dropped.
+    """
+    messages = _create_messages(202510180022, 202510180021, 202510180020)
+    
+    message_ring = MessageRing(None, 2)
+    for message in reversed(messages):
+        message_ring.appendleft(message)
+    
+    vampytest.assert_eq([*message_ring], messages[:2])
+
+
+def test__MessageRing__append():
+    """
+    Tests whether ``MessageRing.append`` works as intended.
+    
+    Case: The ring is full, so the newest message is dropped.
+    """
+    messages = _create_messages(202510180032, 202510180031, 202510180030)
+    
+    message_ring = MessageRing(None, 2)
+    for message in messages:
+        message_ring.append(message)
+    
+    vampytest.assert_eq([*message_ring], messages[1:])
+
+
+def test__MessageRing__pop():
+    """
+    Tests whether ``MessageRing.pop`` and ``.popleft`` works as intended.
+    """
+    messages = _create_messages(202510180042, 202510180041, 202510180040)
+    
+    message_ring = MessageRing(messages)
+    
+    vampytest.assert_is(message_ring.pop(), messages[2])
+    vampytest.assert_is(message_ring.popleft(), messages[0])
+    vampytest.assert_is(message_ring.popleft(), messages[1])
+    
+    with vampytest.assert_raises(IndexError):
+        message_ring.pop()
+    
+    with vampytest.assert_raises(IndexError):
+        message_ring.popleft()
+
+
+def test__MessageRing__drop_oldest():
+    """
+    Tests whether ``MessageRing.drop_oldest`` works as intended.
+    """
+    messages = _create_messages(202610210013, 202610210012, 202610210011, 202610210010)
+    
+    message_ring = MessageRing(messages[1:])
+    message_ring.appendleft(messages[0])
+    
+    message_ring.drop_oldest(0)
+    vampytest.assert_eq([*message_ring], messages)
+    
+    message_ring.drop_oldest(2)
+    vampytest.assert_eq([*message_ring], messages[:2])
+    
+    message_ring.drop_oldest(5)
+    vampytest.assert_eq([*message_ring], [])
+    vampytest.assert_eq(len(message_ring), 0)
+
+
+def test__MessageRing__insert():
+    """
+    Tests whether ``MessageRing.insert`` works as intended.
+    """
+    messages = _create_messages(202510180052, 202510180051, 202510180050)
+    
+    message_ring = MessageRing([messages[0], messages[2]], 3)
+    message_ring.insert(1, messages[1])
+    
+    vampytest.assert_eq([*message_ring], messages)
+    
+    with vampytest.assert_raises(IndexError):
+        message_ring.insert(0, Message.precreate(202510180053))
+
+
+def test__MessageRing__item():
+    """
+    Tests whether ``MessageRing.__getitem__``, ``.__setitem__`` and ``.__delitem__`` works as intended.
+    """
+    messages = _create_messages(202510180062, 202510180061, 202510180060)
+    
+    message_ring = MessageRing(messages[1:])
+    message_ring.appendleft(messages[0])
+    
+    vampytest.assert_is(message_ring[0], messages[0])
+    vampytest.assert_is(message_ring[-1], messages[2])
+    
+    with vampytest.assert_raises(IndexError):
+        message_ring[3]
+    
+    with vampytest.assert_raises(IndexError):
+        message_ring[-4]
+    
+    message_ring[1] = messages[2]
+    vampytest.assert_is(message_ring[1], messages[2])
+    
+    del message_ring[0]
+    vampytest.assert_eq([*message_ring], [messages[2], messages[2]])
+
+
+def _iter_options__relative_index():
+    messages = _create_messages(202510180074, 202510180072, 202510180070)
+    
+    yield messages, 202510180074, 0
+    yield messages, 202510180073, 1
+    yield messages, 202510180070, 2
+    yield messages, 202510180069, 3
+    yield [], 202510180070, 0
+
+
+@vampytest._(vampytest.call_from(_iter_options__relative_index()).returning_last())
+def test__MessageRing__relative_index(messages, message_id):
+    """
+    Tests whether ``MessageRing.relative_index`` works as intended.
+    
+    Parameters
+    ----------
+    messages : `list<Message>`
+        Messages to create the ring with.
+    message_id : `int`
+        The message identifier to search.
+    
+    Returns
+    -------
+    output : `int`
+    """
+    message_ring = MessageRing(messages)
+    output = message_ring.relative_index(message_id)
+    
+    # Should match the generic search
+    vampytest.assert_eq(output, message_relative_index(messages, message_id))
+    vampytest.assert_eq(output, message_relative_index(message_ring, message_id))
+    return output
+
+
+def test__MessageRing__get():
+    """
+    Tests whether ``MessageRing.get`` works as intended.
+    """
+    messages = _create_messages(202510180084, 202510180082)
+    
+    message_ring = MessageRing(messages)
+    
+    vampytest.assert_is(message_ring.get(202510180082), messages[1])
+    vampytest.assert_is(message_ring.get(202510180083), None)
+    vampytest.assert_is(message_ring.get(202510180080), None)
+
+
+def test__MessageRing__delete_indexes():
+    """
+    Tests whether ``MessageRing.delete_indexes`` works as intended.
+    """
+    messages = _create_messages(202510180094, 202510180093, 202510180092, 202510180091, 202510180090)
+    
+    message_ring = MessageRing(messages[1:])
+    message_ring.appendleft(messages[0])
+    message_ring.delete_indexes([0, 2, 3])
+    
+    vampytest.assert_eq([*message_ring], [messages[1], messages[4]])
+
+
+def test__MessageRing__set_maxlen():
+    """
+    Tests whether ``MessageRing.set_maxlen`` works as intended.
+    """
+    messages = _create_messages(202510180102, 202510180101, 202510180100)
+    
+    message_ring = MessageRing(messages)
+    message_ring.set_maxlen(2)
+    
+    vampytest.assert_eq(message_ring.maxlen, 2)
+    vampytest.assert_eq([*message_ring], messages[:2])
+    
+    message_ring.set_maxlen(None)
+    message_ring.append(messages[2])
+    vampytest.assert_eq([*message_ring], messages)
+
+
+def test__MessageRing__clear():
+    """
+    Tests whether ``MessageRing.clear`` works as intended.
+    """
+    messages = _create_messages(202510180110)
+    
+    message_ring = MessageRing(messages)
+    message_ring.clear()
+    
+    vampytest.assert_eq(len(message_ring), 0)
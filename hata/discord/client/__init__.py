@@ -1,5 +1,6 @@
 from .compounds import *
 
+from .cache_policy import *
 from .client import *
 from .client_wrapper import *
 from .fields import *
@@ -12,6 +13,7 @@ from .utils import *
 __all__ = (
     *compounds.__all__,
     
+    *cache_policy.__all__,
     *client.__all__,
     *client_wrapper.__all__,
     *fields.__all__,
@@ -0,0 +1,549 @@
+__all__ = ('CachePolicy',)
+
+from scarletio import LOOP_TIME, RichAttributeErrorBaseType
+
+from ..core import CLIENTS, GUILDS, KOKORO, USERS
+from ..user import Status
+
+
+def _validate_limit(value, name):
+    """
+    Validates the given entity limit.
+    
+    Parameters
+    ----------
+    value : `None | int`
+        The value to validate.
+    name : `str`
+        The parameter's name.
+    
+    Returns
+    -------
+    value : `None | int`
+    
+    Raises
+    ------
+    TypeError
+        - If `value`'s type is incorrect.
+    ValueError
+        - If `value` is negative.
+    """
+    if value is None:
+        return None
+    
+    if (not isinstance(value, int)) or isinstance(value, bool):
+        raise TypeError(
+            f'`{name}` can be `None`, `int`, got {value.__class__.__name__}; {value!r}.'
+        )
+    
+    value = int(value)
+    if value < 0:
+        raise ValueError(
+            f'`{name}` cannot be negative, got {value!r}.'
+        )
+    
+    return value
+
+
+def _validate_presence_expiry(presence_expiry):
+    """
+    Validates the given presence expiry.
+    
+    Parameters
+    ----------
+    presence_expiry : `None | float`
+        The value to validate.
+    
+    Returns
+    -------
+    presence_expiry : `None | float`
+    
+    Raises
+    ------
+    TypeError
+        - If `presence_expiry`'s type is incorrect.
+    ValueError
+        - If `presence_expiry` is not positive.
+    """
+    if presence_expiry is None:
+        return None
+    
+    if (not isinstance(presence_expiry, (int, float))) or isinstance(presence_expiry, bool):
+        raise TypeError(
+            f'`presence_expiry` can be `None`, `float`, got {presence_expiry.__class__.__name__}; '
+            f'{presence_expiry!r}.'
+        )
+    
+    presence_expiry = float(presence_expiry)
+    if presence_expiry <= 0.0:
+        raise ValueError(
+            f'`presence_expiry` must be positive, got {presence_expiry!r}.'
+        )
+    
+    return presence_expiry
+
+
+def _limit_entities(entities, limit):
+    """
+    Removes the oldest entities from the given entity dictionary over the given limit.
+    
+    Parameters
+    ----------
+    entities : `dict<int, object>`
+        Entities in the order they were received.
+    limit : `int`
+        The maximal amount of entities to keep.
+    """
+    over_limit = len(entities) - limit
+    if over_limit <= 0:
+        return
+    
+    for entity_id in [*entities.keys()][:over_limit]:
+        del entities[entity_id]
+
+
+def _rebuild_cache_policy(emoji_limit, guild_user_limit, presence_expiry, sticker_limit, user_role_required):
+    """
+    Rebuilds a cache policy. Used when unpickling.
+    
+    Parameters
+    ----------
+    emoji_limit : `None | int`
+        The maximal amount of emojis to keep per guild.
+    guild_user_limit : `None | int`
+        Users are only kept of guilds with at most this many users.
+    presence_expiry : `None | float`
+        After how much time without an update a user's presence is dropped.
+    sticker_limit : `None | int`
+        The maximal amount of stickers to keep per guild.
+    user_role_required : `bool`
+        Whether only users with roles should be kept.
+    
+    Returns
+    -------
+    cache_policy : ``CachePolicy``
+    """
+    return CachePolicy(
+        emoji_limit = emoji_limit,
+        guild_user_limit = guild_user_limit,
+        presence_expiry = presence_expiry,
+        sticker_limit = sticker_limit,
+        user_role_required = user_role_required,
+    )
+
+
+class CachePolicy(RichAttributeErrorBaseType):
+    """
+    Describes which entities a client keeps in its cache.
+    
+    While `HATA_CACHE_USERS` and `HATA_CACHE_PRESENCE` switch caching on or off for every guild, a cache policy can
+    drop a part of the entities per guild, so memory usage can be kept down without losing them everywhere.
+    
+    The clients themselves are always kept in the guilds' users. Since the entities are shared between the clients,
+    an entity is only dropped if none of the other clients' policies would keep it.
+    
+    Attributes
+    ----------
+    _presence_expiry_handle : `None | TimerHandle`
+        Handle expiring the outdated presences.
+    _presence_update_ats : `dict<int, float>`
+        The users' identifiers to when their presence was last updated (monotonic) in update order.
+    emoji_limit : `None | int`
+        The maximal amount of emojis to keep per guild. If exceeded, the ones received first are dropped.
+    guild_user_limit : `None | int`
+        Users are only kept of guilds with at most this many users. Their users are not requested either.
+    presence_expiry : `None | float`
+        After how much time without an update a user's presence is dropped (the user is set as offline).
+    sticker_limit : `None | int`
+        The maximal amount of stickers to keep per guild. If exceeded, the ones received first are dropped.
+    user_role_required : `bool`
+        Whether only users with at least one role should be kept in the guilds' users.
+    """
+    __slots__ = (
+        '_presence_expiry_handle', '_presence_update_ats', 'emoji_limit', 'guild_user_limit', 'presence_expiry',
+        'sticker_limit', 'user_role_required'
+    )
+    
+    def __new__(
+        cls,
+        *,
+        emoji_limit = None,
+        guild_user_limit = None,
+        presence_expiry = None,
+        sticker_limit = None,
+        user_role_required = False,
+    ):
+        """
+        Creates a new cache policy. By default every entity is kept.
+        
+        Parameters
+        ----------
+        emoji_limit : `None | int` = `None`, Optional (Keyword only)
+            The maximal amount of emojis to keep per guild.
+        guild_user_limit : `None | int` = `None`, Optional (Keyword only)
+            Users are only kept of guilds with at most this many users.
+        presence_expiry : `None | float` = `None`, Optional (Keyword only)
+            After how much time without an update a user's presence is dropped.
+        sticker_limit : `None | int` = `None`, Optional (Keyword only)
+            The maximal amount of stickers to keep per guild.
+        user_role_required : `bool` = `False`, Optional (Keyword only)
+            Whether only users with at least one role should be kept in the guilds' users.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        emoji_limit = _validate_limit(emoji_limit, 'emoji_limit')
+        guild_user_limit = _validate_limit(guild_user_limit, 'guild_user_limit')
+        presence_expiry = _validate_presence_expiry(presence_expiry)
+        sticker_limit = _validate_limit(sticker_limit, 'sticker_limit')
+        
+        if not isinstance(user_role_required, bool):
+            raise TypeError(
+                f'`user_role_required` can be `bool`, got {user_role_required.__class__.__name__}; '
+                f'{user_role_required!r}.'
+            )
+        
+        self = object.__new__(cls)
+        self._presence_expiry_handle = None
+        self._presence_update_ats = {}
+        self.emoji_limit = emoji_limit
+        self.guild_user_limit = guild_user_limit
+        self.presence_expiry = presence_expiry
+        self.sticker_limit = sticker_limit
+        self.user_role_required = user_role_required
+        return self
+    
+    
+    def __reduce__(self):
+        """Reduces the cache policy to picklable parts."""
+        return _rebuild_cache_policy, (
+            self.emoji_limit, self.guild_user_limit, self.presence_expiry, self.sticker_limit,
+            self.user_role_required,
+        )
+    
+    
+    def __repr__(self):
+        """Returns the cache policy's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        field_added = False
+        
+        for name in ('emoji_limit', 'guild_user_limit', 'presence_expiry', 'sticker_limit'):
+            value = getattr(self, name)
+            if value is None:
+                continue
+            
+            if field_added:
+                repr_parts.append(',')
+            else:
+                field_added = True
+            
+            repr_parts.append(' ')
+            repr_parts.append(name)
+            repr_parts.append(' = ')
+            repr_parts.append(repr(value))
+        
+        if self.user_role_required:
+            if field_added:
+                repr_parts.append(',')
+            
+            repr_parts.append(' user_role_required')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two cache policies are the same."""
+        if type(self) is not type(other):
+            return NotImplemented
+        
+        if self.emoji_limit != other.emoji_limit:
+            return False
+        
+        if self.guild_user_limit != other.guild_user_limit:
+            return False
+        
+        if self.presence_expiry != other.presence_expiry:
+            return False
+        
+        if self.sticker_limit != other.sticker_limit:
+            return False
+        
+        if self.user_role_required != other.user_role_required:
+            return False
+        
+        return True
+    
+    
+    def __hash__(self):
+        """Returns the cache policy's hash value."""
+        return hash((
+            self.emoji_limit, self.guild_user_limit, self.presence_expiry, self.sticker_limit,
+            self.user_role_required,
+        ))
+    
+    
+    def should_cache_guild_users(self, guild):
+        """
+        Returns whether the users of the given guild should be kept (and requested).
+        
+        Parameters
+        ----------
+        guild : ``Guild``
+            The respective guild.
+        
+        Returns
+        -------
+        should_cache_guild_users : `bool`
+        """
+        guild_user_limit = self.guild_user_limit
+        return (guild_user_limit is None) or (guild.user_count <= guild_user_limit)
+    
+    
+    def should_cache_guild_user(self, guild, user):
+        """
+        Returns whether the given user should be kept in the given guild's users.
+        
+        Parameters
+        ----------
+        guild : ``Guild``
+            The respective guild.
+        user : ``ClientUserBase``
+            The user to check.
+        
+        Returns
+        -------
+        should_cache_guild_user : `bool`
+        """
+        if user.id in CLIENTS:
+            return True
+        
+        if not self.should_cache_guild_users(guild):
+            return False
+        
+        if self.user_role_required:
+            guild_profile = user.guild_profiles.get(guild.id, None)
+            if (guild_profile is None) or (guild_profile.role_ids is None):
+                return False
+        
+        return True
+    
+    
+    def apply_to_guild(self, guild):
+        """
+        Applies the cache policy on the given guild's users, emojis and stickers.
+        
+        Parameters
+        ----------
+        guild : ``Guild``
+            The guild to apply the policy on.
+        """
+        users = guild.users
+        if (self.guild_user_limit is not None) or self.user_role_required:
+            self.apply_to_guild_users(guild, [*users.values()])
+        
+        self.touch_presences(users.values())
+        
+        self.apply_to_guild_emojis(guild)
+        self.apply_to_guild_stickers(guild)
+    
+    
+    def _is_guild_user_kept_by_other_client(self, guild, user):
+        """
+        Returns whether the given user is kept in the given guild's users by an other client's cache policy.
+        
+        Parameters
+        ----------
+        guild : ``Guild``
+            The respective guild.
+        user : ``ClientUserBase``
+            The user to check.
+        
+        Returns
+        -------
+        is_guild_user_kept_by_other_client : `bool`
+        """
+        for client in guild.clients:
+            cache_policy = client.cache_policy
+            if (cache_policy is not self) and cache_policy.should_cache_guild_user(guild, user):
+                return True
+        
+        return False
+    
+    
+    def apply_to_guild_user(self, guild, user):
+        """
+        Applies the cache policy on the given user of the given guild. If the user is kept it is put into the guild's
+        users, else it is removed from it together with its guild profile.
+        
+        Parameters
+        ----------
+        guild : ``Guild``
+            The respective guild.
+        user : ``ClientUserBase``
+            The user to apply the policy on.
+        """
+        if self.should_cache_guild_user(guild, user) or self._is_guild_user_kept_by_other_client(guild, user):
+            guild.users[user.id] = user
+            return
+        
+        guild.users.pop(user.id, None)
+        user.guild_profiles.pop(guild.id, None)
+    
+    
+    def apply_to_guild_users(self, guild, users):
+        """
+        Applies the cache policy on the given users of the given guild.
+        
+        Parameters
+        ----------
+        guild : ``Guild``
+            The respective guild.
+        users : `iterable<ClientUserBase>`
+            The users to apply the policy on.
+        """
+        for user in users:
+            self.apply_to_guild_user(guild, user)
+    
+    
+    def apply_to_guild_emojis(self, guild):
+        """
+        Applies the cache policy on the given guild's emojis.
+        
+        Parameters
+        ----------
+        guild : ``Guild``
+            The guild to apply the policy on.
+        """
+        emoji_limit = self.emoji_limit
+        if (emoji_limit is not None):
+            _limit_entities(guild.emojis, emoji_limit)
+    
+    
+    def apply_to_guild_stickers(self, guild):
+        """
+        Applies the cache policy on the given guild's stickers.
+        
+        Parameters
+        ----------
+        guild : ``Guild``
+            The guild to apply the policy on.
+        """
+        sticker_limit = self.sticker_limit
+        if (sticker_limit is not None):
+            _limit_entities(guild.stickers, sticker_limit)
+    
+    
+    def touch_presence(self, user):
+        """
+        Marks the given user's presence as updated. If the user is offline, its presence is no longer tracked.
+        
+        Parameters
+        ----------
+        user : ``ClientUserBase``
+            The user whose presence was updated.
+        """
+        presence_expiry = self.presence_expiry
+        if presence_expiry is None:
+            return
+        
+        user_id = user.id
+        presence_update_ats = self._presence_update_ats
+        presence_update_ats.pop(user_id, None)
+        
+        if user.status is Status.offline:
+            return
+        
+        now = LOOP_TIME()
+        presence_update_ats[user_id] = now
+        
+        if self._presence_expiry_handle is None:
+            self._presence_expiry_handle = KOKORO.call_at(now + presence_expiry, type(self)._expire_presences, self)
+    
+    
+    def touch_presences(self, users):
+        """
+        Marks the given users' presences as updated.
+        
+        Parameters
+        ----------
+        users : `iterable<ClientUserBase>`
+            The users whose presence was updated.
+        """
+        if self.presence_expiry is None:
+            return
+        
+        for user in users:
+            self.touch_presence(user)
+    
+    
+    def _is_presence_kept_by_other_client(self, user):
+        """
+        Returns whether the given user's presence is kept by an other client's cache policy. It is, if an other client
+        shares a guild with the user and its policy does not expire presences or it has not expired the user's one yet.
+        
+        Parameters
+        ----------
+        user : ``ClientUserBase``
+            The user to check.
+        
+        Returns
+        -------
+        is_presence_kept_by_other_client : `bool`
+        """
+        user_id = user.id
+        
+        for guild_id in user.guild_profiles.keys():
+            guild = GUILDS.get(guild_id, None)
+            if guild is None:
+                continue
+            
+            for client in guild.clients:
+                cache_policy = client.cache_policy
+                if cache_policy is self:
+                    continue
+                
+                if (cache_policy.presence_expiry is None) or (user_id in cache_policy._presence_update_ats):
+                    return True
+        
+        return False
+    
+    
+    def _expire_presences(self):
+        """
+        Drops the outdated presences and schedules the next expiration if there is any presence left.
+        
+        The presences still kept by an other client's cache policy are not dropped.
+        """
+        self._presence_expiry_handle = None
+        
+        presence_expiry = self.presence_expiry
+        presence_update_ats = self._presence_update_ats
+        expire_before = LOOP_TIME() - presence_expiry
+        
+        expired_user_ids = []
+        next_expire_at = 0.0
+        
+        # Presences are in update order, so we can stop at the first not expired one.
+        for user_id, update_at in presence_update_ats.items():
+            if update_at > expire_before:
+                next_expire_at = update_at + presence_expiry
+                break
+            
+            expired_user_ids.append(user_id)
+        
+        for user_id in expired_user_ids:
+            del presence_update_ats[user_id]
+            
+            user = USERS.get(user_id, None)
+            if (user is not None) and (not self._is_presence_kept_by_other_client(user)):
+                user._update_presence({})
+        
+        if next_expire_at:
+            self._presence_expiry_handle = KOKORO.call_at(next_expire_at, type(self)._expire_presences, self)
+
@@ -0,0 +1,200 @@
+__all__ = ()
+
+from zlib import compress as zlib_compress, decompress as zlib_decompress, error as ZlibError
+
+from ..channel import Channel
+from ..gateway.encodings import GatewayEncoding__etf
+from ..guild import Guild
+
+
+CACHE_SNAPSHOT_MAGIC = b'HCS'
+CACHE_SNAPSHOT_VERSION = 1
+CACHE_SNAPSHOT_HEADER = CACHE_SNAPSHOT_MAGIC + bytes((CACHE_SNAPSHOT_VERSION,))
+
+
+def _get_shard_id_of_guild(guild_id, shard_count):
+    """
+    Returns the shard's identifier the given guild belongs to.
+    
+    Parameters
+    ----------
+    guild_id : `int`
+        The guild's identifier.
+    shard_count : `int`
+        The client's shard count.
+    
+    Returns
+    -------
+    shard_id : `int`
+    """
+    if shard_count:
+        return (guild_id >> 22) % shard_count
+    
+    return 0
+
+
+def create_cache_snapshot(client):
+    """
+    Creates a snapshot of the entity caches of the given client.
+    
+    The guilds are serialized with their channels, roles, emojis, members and every other internal field, so the
+    snapshot covers the client's part of the channel, role, emoji and user caches as well.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client to create snapshot of.
+    
+    Returns
+    -------
+    cache_snapshot : `dict<str, object>`
+    """
+    return {
+        'guilds': [guild.to_data(include_internals = True) for guild in client.guilds],
+        'private_channels': [
+            *(channel.to_data(include_internals = True) for channel in client.private_channels.values()),
+            *(channel.to_data(include_internals = True) for channel in client.group_channels.values()),
+        ],
+    }
+
+
+def encode_cache_snapshot(cache_snapshot):
+    """
+    Encodes the given cache snapshot into its compact binary form.
+    
+    The snapshot is encoded as erlang term format, compressed and prefixed with a header. This function is blocking,
+    so should be ran in an executor.
+    
+    Parameters
+    ----------
+    cache_snapshot : `dict<str, object>`
+        The snapshot to encode.
+    
+    Returns
+    -------
+    data : `bytes`
+    """
+    return CACHE_SNAPSHOT_HEADER + zlib_compress(GatewayEncoding__etf.encode(cache_snapshot))
+
+
+def decode_cache_snapshot(data):
+    """
+    Decodes the given binary cache snapshot. This function is blocking, so should be ran in an executor.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The snapshot to decode.
+    
+    Returns
+    -------
+    cache_snapshot : `dict<str, object>`
+    
+    Raises
+    ------
+    ValueError
+        - If `data` is not a valid cache snapshot.
+    """
+    header_length = len(CACHE_SNAPSHOT_HEADER)
+    if data[:header_length] != CACHE_SNAPSHOT_HEADER:
+        raise ValueError(
+            f'Not a cache snapshot or its version is not supported, got header {data[:header_length]!r}.'
+        )
+    
+    try:
+        cache_snapshot = GatewayEncoding__etf.decode(zlib_decompress(data[header_length:]))
+    except ZlibError as exception:
+        raise ValueError(f'Corrupted cache snapshot: {exception!s}.') from exception
+    
+    if not isinstance(cache_snapshot, dict):
+        raise ValueError(
+            f'Cache snapshot should be a `dict`, got {cache_snapshot.__class__.__name__}; {cache_snapshot!r}.'
+        )
+    
+    return cache_snapshot
+
+
+def restore_cache_snapshot(client, cache_snapshot, shard_ids):
+    """
+    Restores the entity caches of the given client from the given snapshot.
+    
+    The guilds of the given (resuming) shards are added to the client, since Discord will not send them again.
+    The rest of the guilds are only warmed up: they are not added to the client and are updated from scratch when their
+    `GUILD_CREATE` event is received (``release_cache_snapshot_guild``). Because the caches are weak, the warmed up
+    guilds are returned, so the caller can keep them alive till then.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client to restore the caches of.
+    cache_snapshot : `dict<str, object>`
+        The snapshot to restore from.
+    shard_ids : `set<int>`
+        The resuming shards' identifiers.
+    
+    Returns
+    -------
+    warm_guilds : `None | dict<int, Guild>`
+        The guilds waiting for their `GUILD_CREATE` event by their identifier.
+    """
+    shard_count = client.shard_count
+    warm_guilds = None
+    
+    guild_datas = cache_snapshot.get('guilds', None)
+    if (guild_datas is not None):
+        for guild_data in guild_datas:
+            if _get_shard_id_of_guild(int(guild_data['id']), shard_count) in shard_ids:
+                Guild.from_data(guild_data, client)
+                continue
+            
+            if warm_guilds is None:
+                warm_guilds = {}
+            
+            guild = Guild.from_data(guild_data, None)
+            warm_guilds[guild.id] = guild
+    
+    channel_datas = cache_snapshot.get('private_channels', None)
+    if (channel_datas is not None):
+        for channel_data in channel_datas:
+            Channel.from_data(channel_data, client, 0)
+    
+    return warm_guilds
+
+
+def release_cache_snapshot_guild(client, guild_id):
+    """
+    Releases the given guild restored from a cache snapshot. Should be called when its `GUILD_CREATE` event is
+    received, before it is parsed.
+    
+    The guild's members restored from the snapshot are removed, so only the ones received again are kept.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client who received the guild.
+    guild_id : `int`
+        The guild's identifier.
+    """
+    warm_guilds = client._cache_snapshot_guilds
+    if warm_guilds is None:
+        return
+    
+    guild = warm_guilds.pop(guild_id, None)
+    if guild is None:
+        return
+    
+    if not warm_guilds:
+        client._cache_snapshot_guilds = None
+    
+    # If an other client received it meanwhile, its members are up to date.
+    if guild.clients:
+        return
+    
+    users = guild.users
+    for user in users.values():
+        try:
+            del user.guild_profiles[guild_id]
+        except KeyError:
+            pass
+    
+    users.clear()
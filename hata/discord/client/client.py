@@ -6,8 +6,8 @@ from math import inf
 from warnings import warn
 
 from scarletio import (
-    CancelledError, CompoundMetaType, EventThread, Future, LOOP_TIME, Task, copy_docs, export, from_json, methodize,
-    run_coroutine, sleep, write_exception_async
+    CancelledError, CompoundMetaType, EventThread, Future, LOOP_TIME, Task, alchemy_incendiary, copy_docs, export,
+    from_json, methodize, run_coroutine, sleep, write_exception_async
 )
 
 from ...env import CACHE_USER
@@ -23,6 +23,9 @@ from ..events.handling_helpers import ensure_shutdown_event_handlers, ensure_voi
 from ..exceptions import (
     DiscordException, DiscordGatewayException, INTENT_ERROR_CODES, InvalidToken, RESHARD_ERROR_CODES
 )
+from ..gateway.encodings import GATEWAY_ENCODING_DEFAULT
+from ..gateway.identify_coordinators import IdentifyCoordinatorLocal
+from ..gateway.transport_compressions import TRANSPORT_COMPRESSION_DEFAULT
 from ..gateway.utils import DiscordGatewayClientBase, create_gateway, reshard_gateway
 from ..http import DiscordApiClient, RateLimitProxy
 from ..localization.utils import LOCALE_DEFAULT
@@ -37,14 +40,21 @@ from ..user.user.fields import (
     validate_premium_type, validate_primary_guild_badge, validate_status
 )
 
+from .cache_policy import CachePolicy
+from .cache_snapshot import (
+    create_cache_snapshot, decode_cache_snapshot, encode_cache_snapshot, release_cache_snapshot_guild,
+    restore_cache_snapshot
+)
 from .compounds import CLIENT_COMPOUNDS
 from .fields import (
-    validate_activity, validate_additional_owner_ids, validate_api, validate_application_id, validate_client_id,
-    validate_extensions, validate_http, validate_http_debug_options, validate_intents, validate_secret,
-    validate_shard_count, validate_should_request_users, validate_token
+    validate_activity, validate_additional_owner_ids, validate_api, validate_application_id, validate_cache_policy,
+    validate_client_id, validate_extensions, validate_gateway_encoding, validate_gateway_transport_compression,
+    validate_http, validate_http_debug_options, validate_identify_coordinator, validate_intents, validate_secret,
+    validate_session_store, validate_shard_count, validate_shard_ids, validate_should_request_users, validate_token
 )
 from .functionality_helpers import _check_is_client_duped, try_get_user_id_from_token
 from .ready_state import ReadyState
+from .session_state import create_session_state, restore_session_state, store_session_state
 
 
 AUTO_CLIENT_ID_LIMIT = 1 << 22
@@ -68,6 +78,10 @@ class Client(
     _additional_owner_ids : `None`, `set` of `int`
         Additional users' (as id) to be passed by the ``.is_owner`` check.
     
+    _cache_snapshot_guilds : `None | dict<int, Guild>`
+        Guilds restored from a cache snapshot waiting for their `GUILD_CREATE` event by their identifier. They are kept
+        alive till the client is ready.
+    
     _gateway_max_concurrency : `int`
         The maximal amount of shards that can be launched at the same time.
     
@@ -85,6 +99,10 @@ class Client(
         When client gateway is being requested multiple times at the same time, this future is set and awaited at the
         secondary requests.
     
+    _lazy_user_requests : `dict<int, None | Task>`
+        Guild identifier to the task requesting its users relation. `None` if the request is deferred till first
+        needed.
+    
     _should_request_users : `bool`
         Whether the client should try to request the users of it's guilds.
     
@@ -127,6 +145,9 @@ class Client(
     bot : `bool`
         Whether the client is a bot.
     
+    cache_policy : ``CachePolicy``
+        Describes which entities the client keeps in its cache.
+    
     discriminator : `int`
         The client's discriminator. Given to avoid overlapping names.
     
@@ -148,6 +169,12 @@ class Client(
     gateway : ``DiscordGatewayClientBase``
         The gateway of the client towards Discord.
     
+    gateway_encoding : ``type<GatewayEncodingBase>``
+        The encoding used by the client's gateways.
+    
+    gateway_transport_compression : ``type<TransportCompressionBase>``
+        The transport compression used by the client's gateways.
+    
     group_channels : `dict` of (`int`, ``Channel``) items
         The group channels of the client. They can be accessed by their id as the key.
     
@@ -164,6 +191,9 @@ class Client(
     id : `int`
         The client's unique identifier number.
     
+    identify_coordinator : ``IdentifyCoordinatorBase``
+        Identify coordinator deciding when the client's shards can identify.
+    
     intents : ``IntentFlag``
         The intent flags of the client.
     
@@ -205,9 +235,16 @@ class Client(
     secret : `str`
         The client's secret used when interacting with oauth2 endpoints.
     
+    session_store : ``None | SessionStoreBase``
+        Session store to persist the shards' sessions on disconnect and to restore them on connect.
+    
     shard_count : `int`
         The client's shard count. Set as `0` if the bot is not using sharding.
     
+    shard_ids : `None | tuple<int>`
+        The shards' identifiers ran by the client. Used when the client runs only a part of its shards, like when the
+        shards are spread across multiple processes. Defaults to `None`, meaning every shard is ran.
+    
     status : `Status`
         The client's display status.
     
@@ -247,11 +284,13 @@ class Client(
     Client supports weakreferencing and dynamic attribute names as well for extension support.
     """
     __slots__ = (
-        '__dict__', '_activity', '_additional_owner_ids', '_gateway_max_concurrency', '_gateway_requesting',
-        '_gateway_time', '_gateway_url', '_gateway_waiter', '_should_request_users', '_status', '_user_chunker_nonce',
-        'api', 'application', 'email', 'email_verified', 'events', 'gateway', 'group_channels', 'guilds', 'http',
-        'intents', 'locale', 'mfa_enabled', 'premium_type', 'private_channels', 'ready_state', 'relationships',
-        'running', 'secret', 'shard_count', 'token', 'voice_clients'
+        '__dict__', '_activity', '_additional_owner_ids', '_cache_snapshot_guilds', '_gateway_max_concurrency',
+        '_gateway_requesting', '_gateway_time', '_gateway_url', '_gateway_waiter', '_lazy_user_requests',
+        '_should_request_users', '_status', '_user_chunker_nonce', 'api', 'application', 'cache_policy', 'email',
+        'email_verified', 'events', 'gateway', 'gateway_encoding', 'gateway_transport_compression', 'group_channels',
+        'guilds', 'http', 'identify_coordinator', 'intents', 'locale', 'mfa_enabled', 'premium_type', 'private_channels',
+        'ready_state', 'relationships', 'running', 'secret', 'session_store', 'shard_count', 'shard_ids', 'token',
+        'voice_clients'
     )
     
     loop = KOKORO
@@ -270,6 +309,7 @@ class Client(
         banner = ...,
         banner_color = ...,
         bot = ...,
+        cache_policy = ...,
         client_id = ...,
         discriminator = ...,
         display_name = ...,
@@ -277,8 +317,11 @@ class Client(
         email_verified = ...,
         extensions = ...,
         flags = ...,
+        gateway_encoding = ...,
+        gateway_transport_compression = ...,
         http = ...,
         http_debug_options = ...,
+        identify_coordinator = ...,
         intents = ...,
         locale = ...,
         mfa_enabled = ...,
@@ -286,7 +329,9 @@ class Client(
         premium_type = ...,
         primary_guild_badge = ...,
         secret = ...,
+        session_store = ...,
         shard_count = ...,
+        shard_ids = ...,
         should_request_users = ...,
         status = ...,
         **keyword_parameters,
@@ -327,6 +372,9 @@ class Client(
         bot : `bool`, Optional (Keyword only)
             Whether the client is a bot.
         
+        cache_policy : ``None | CachePolicy``, Optional (Keyword only)
+            Describes which entities the client keeps in its cache. By default every entity is kept.
+        
         client_id : `None | int | str`, Optional (Keyword only)
             The client's `.id`. If passed as `str` will be converted to `int`. Defaults to `None`.
             
@@ -352,12 +400,24 @@ class Client(
         flags : `int`, ``UserFlag``, Optional (Keyword only)
             The user's flags.
         
+        gateway_encoding : ``str | type<GatewayEncodingBase>``, Optional (Keyword only)
+            The encoding to use with the gateway. Can be `'json'` (default) or `'etf'`.
+        
+        gateway_transport_compression : ``None | str | type<TransportCompressionBase>``, Optional (Keyword only)
+            The transport compression to use with the gateway. Can be `'zlib-stream'` (default), `'zstd-stream'`
+            (requires the `zstandard` package) or `None` to disable it.
+        
         http : `None | HTTPClient`, Optional (Keyword only)
             The http client to use.
         
         http_debug_options: `None | str | iterable<str>`, Optional (Keyword only)
             Http client debug options for the client.
         
+        identify_coordinator : ``None | IdentifyCoordinatorBase``, Optional (Keyword only)
+            Identify coordinator deciding when the client's shards can identify. Pass an
+            ``IdentifyCoordinatorFile`` to coordinate identifies of multiple processes of the same bot.
+            Defaults to an ``IdentifyCoordinatorLocal``.
+        
         intents : `int`, ``IntentFlag``, Optional (Keyword only)
              By default the client will launch up using all the intent flags. Negative values will be interpreted as
              using all the intents, meanwhile if passed as positive, non existing intent flags are removed.
@@ -380,9 +440,18 @@ class Client(
         secret: `str`, Optional (Keyword only)
             Client secret used when interacting with oauth2 endpoints.
         
+        session_store : ``None | SessionStoreBase``, Optional (Keyword only)
+            Session store to persist the shards' sessions on disconnect and to restore them on connect, so a
+            restarted process can resume instead of identifying again. Pass a ``SessionStoreFile`` to enable it.
+            Defaults to `None`.
+        
         shard_count : `int`, Optional (Keyword only)
             The client's shard count. If passed as lower as the recommended one, will reshard itself.
         
+        shard_ids : `None | iterable<int>`, Optional (Keyword only)
+            The shards' identifiers to run. Use it to run only a part of the shards in the process.
+            If given `shard_count` must be given as well and the client will not reshard itself.
+        
         should_request_users : `int`, Optional (Keyword only)
             Whether the client should try to request the users of it's guilds.
         
@@ -472,6 +541,12 @@ class Client(
         else:
             bot = validate_bot(bot)
         
+        # cache_policy
+        if cache_policy is ...:
+            cache_policy = CachePolicy()
+        else:
+            cache_policy = validate_cache_policy(cache_policy)
+        
         # client_id
         if client_id is ...:
             client_id = try_get_user_id_from_token(token)
@@ -514,6 +589,18 @@ class Client(
         else:
             flags = validate_flags(flags)
         
+        # gateway_encoding
+        if gateway_encoding is ...:
+            gateway_encoding = GATEWAY_ENCODING_DEFAULT
+        else:
+            gateway_encoding = validate_gateway_encoding(gateway_encoding)
+        
+        # gateway_transport_compression
+        if gateway_transport_compression is ...:
+            gateway_transport_compression = TRANSPORT_COMPRESSION_DEFAULT
+        else:
+            gateway_transport_compression = validate_gateway_transport_compression(gateway_transport_compression)
+        
         # http
         if http is ...:
             http = None
@@ -526,6 +613,12 @@ class Client(
         else:
             http_debug_options = validate_http_debug_options(http_debug_options)
         
+        # identify_coordinator
+        if identify_coordinator is ...:
+            identify_coordinator = IdentifyCoordinatorLocal()
+        else:
+            identify_coordinator = validate_identify_coordinator(identify_coordinator)
+        
         # intents
         if intents is ...:
             intents = IntentFlag(-1)
@@ -568,12 +661,36 @@ class Client(
         else:
             secret = validate_secret(secret)
         
+        # session_store
+        if session_store is ...:
+            session_store = None
+        else:
+            session_store = validate_session_store(session_store)
+        
         # shard count
         if shard_count is ...:
             shard_count = 0
         else:
             shard_count = validate_shard_count(shard_count)
         
+        # shard_ids
+        if shard_ids is ...:
+            shard_ids = None
+        else:
+            shard_ids = validate_shard_ids(shard_ids)
+        
+        if (shard_ids is not None):
+            if shard_count == 0:
+                raise ValueError(
+                    f'`shard_ids` can only be given if `shard_count` is given as well; got shard_ids = {shard_ids!r}.'
+                )
+            
+            if shard_ids[-1] >= shard_count:
+                raise ValueError(
+                    f'`shard_ids` can contain only shard identifiers lower than `shard_count`; got '
+                    f'shard_count = {shard_count!r}; shard_ids = {shard_ids!r}.'
+                )
+        
         # should_request_users
         if should_request_users is ...:
             should_request_users = True
@@ -618,9 +735,11 @@ class Client(
         
         self._activity = activity
         self._additional_owner_ids = additional_owner_ids
+        self._cache_snapshot_guilds = None
         self._gateway_max_concurrency = 1
         self._gateway_requesting = False
         self._gateway_time = -inf
+        self._lazy_user_requests = {}
         self._gateway_url = ''
         self._gateway_waiter = None
         self._should_request_users = should_request_users
@@ -635,6 +754,7 @@ class Client(
         self.banner = banner
         self.banner_color = banner_color
         self.bot = bot
+        self.cache_policy = cache_policy
         self.discriminator = discriminator
         self.display_name = display_name
         self.email = email
@@ -642,10 +762,13 @@ class Client(
         self.events = EventHandlerManager(self)
         self.flags = flags
         self.gateway = DiscordGatewayClientBase()
+        self.gateway_encoding = gateway_encoding
+        self.gateway_transport_compression = gateway_transport_compression
         self.group_channels = {}
         self.guild_profiles = {}
         self.guilds = set()
         self.http = http
+        self.identify_coordinator = identify_coordinator
         self.intents = intents
         self.locale = locale
         self.mfa_enabled = mfa_enabled
@@ -656,7 +779,9 @@ class Client(
         self.relationships = {}
         self.running = False
         self.secret = secret
+        self.session_store = session_store
         self.shard_count = shard_count
+        self.shard_ids = shard_ids
         self.status = Status.offline
         self.statuses = None
         self.thread_profiles = None
@@ -1089,7 +1214,8 @@ class Client(
         """
         Reshards the client. And also updates it's gateway's url as a side note.
         
-        Should be called only if every shard is down.
+        Should be called only if every shard is down. If the client runs only a part of its shards (``.shard_ids``)
+        only the gateway's url is updated.
         
         This method is a coroutine.
         
@@ -1111,6 +1237,10 @@ class Client(
         self._gateway_url = data['url']
         self._gateway_time = LOOP_TIME()
         
+        # If we run only a part of the shards, the shard count is managed outside of the client.
+        if (self.shard_ids is not None):
+            return
+        
         old_shard_count = self.shard_count
         if old_shard_count <= 0:
             old_shard_count = 1
@@ -1248,6 +1378,10 @@ class Client(
         if self.running:
             raise RuntimeError(f'{self!r} is already running!')
         
+        session_store = self.session_store
+        if (session_store is not None):
+            await restore_session_state(self, session_store)
+        
         self.running = True
         register_client(self)
         Task(KOKORO, self._connect())
@@ -1287,7 +1421,7 @@ class Client(
                     continue
                 
                 except DiscordGatewayException as err:
-                    if err.code in RESHARD_ERROR_CODES:
+                    if (err.code in RESHARD_ERROR_CODES) and (self.shard_ids is None):
                         sys.stderr.write(
                             f'{err.__class__.__name__} occurred, at {self!r}._connect:\n'
                             f'{err!r}\n'
@@ -1364,6 +1498,7 @@ class Client(
             finally:
                 unregister_client(self)
                 self.running = False
+                self._cache_snapshot_guilds = None
                 
                 if not self.guild_profiles:
                     return
@@ -1406,6 +1541,90 @@ class Client(
         ready_state.shard_ready(self, guild_datas, shard_id)
     
     
+    def _shard_resumed(self, shard_id):
+        """
+        Called when a shard resumed a session restored from the session store. At this case no `READY` is received,
+        so the shard is marked as ready without guilds to receive.
+        
+        Parameters
+        ----------
+        shard_id : `int`
+            The resumed shard's identifier.
+        """
+        ready_state = self.ready_state
+        if (ready_state is None):
+            ready_state = ReadyState(self)
+            self.ready_state = ready_state
+        
+        ready_state.shard_resumed(shard_id)
+    
+    
+    def _release_cache_snapshot_guild(self, guild_id):
+        """
+        Releases the given guild restored from a cache snapshot. Called when its `GUILD_CREATE` event is received.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The guild's identifier.
+        """
+        release_cache_snapshot_guild(self, guild_id)
+    
+    
+    async def save_cache_snapshot(self):
+        """
+        Creates a snapshot of the client's entity caches and encodes it.
+        
+        The returned data can be stored anywhere and passed to ``.restore_cache_snapshot`` after restart.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        data : `bytes`
+        """
+        cache_snapshot = create_cache_snapshot(self)
+        return await KOKORO.run_in_executor(alchemy_incendiary(encode_cache_snapshot, (cache_snapshot,)))
+    
+    
+    async def restore_cache_snapshot(self, data):
+        """
+        Restores the client's entity caches from the given snapshot created by ``.save_cache_snapshot``.
+        
+        Should be called before connecting. The guilds of the shards resuming a restored session are added to the
+        client, since Discord will not send them again. The rest of the guilds are only warmed up till their
+        `GUILD_CREATE` event is received.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        data : `bytes`
+            The cache snapshot.
+        
+        Raises
+        ------
+        RuntimeError
+            - If the client is running.
+        ValueError
+            - If `data` is not a valid cache snapshot.
+        """
+        if self.running:
+            raise RuntimeError(f'Cache snapshot can be restored only before connecting; {self!r} is running.')
+        
+        cache_snapshot = await KOKORO.run_in_executor(alchemy_incendiary(decode_cache_snapshot, (data,)))
+        
+        shard_ids = {gateway.shard_id for gateway in self.gateway.iter_gateways() if gateway._session_restored}
+        warm_guilds = restore_cache_snapshot(self, cache_snapshot, shard_ids)
+        if (warm_guilds is not None):
+            # Keep the warmed up guilds alive till the client is ready.
+            cache_snapshot_guilds = self._cache_snapshot_guilds
+            if cache_snapshot_guilds is None:
+                self._cache_snapshot_guilds = warm_guilds
+            else:
+                cache_snapshot_guilds.update(warm_guilds)
+    
+    
     
     async def disconnect(self):
         """
@@ -1427,7 +1646,20 @@ class Client(
         
         # Close gateways
         # cancel shards
-        await self.gateway.close()
+        session_store = self.session_store
+        if session_store is None:
+            await self.gateway.close()
+            
+            # Closing the connection invalidates the session, so do not try to resume it on the next connect.
+            for gateway in self.gateway.iter_gateways():
+                gateway._clear_session()
+        
+        else:
+            # Collect the state before closing, so nothing is cleared meanwhile.
+            # Terminating the connection keeps the session alive, so we can resume it after restart.
+            sessions, cache_snapshot = create_session_state(self, session_store)
+            await self.gateway.terminate()
+            await store_session_state(session_store, sessions, cache_snapshot)
         
         await ensure_shutdown_event_handlers(self)
     
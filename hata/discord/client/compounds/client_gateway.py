@@ -22,6 +22,7 @@ from ...user import Status
 from ...voice import VoiceClient
 
 from ..functionality_helpers import MassUserChunker, SingleUserChunker
+from ..ready_state import ensure_lazy_user_request
 from ..request_helpers import get_guild_and_id, get_guild_id
 
 
@@ -350,6 +351,30 @@ class ClientCompoundClientGateway(Compound):
         await self._request_users(guild_id)
     
     
+    async def ensure_all_users_of(self, guild):
+        """
+        Ensures that the users of the given guild are loaded.
+        
+        Guilds with at least `HATA_USER_REQUEST_LAZY_THRESHOLD` users do not have their users requested on startup.
+        Their users are requested when this method is called with them the first time instead. If the guild's users
+        are already loaded (or are not deferred), returns instantly.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        guild : ``int | Guild``
+            The guild, what's members should be loaded.
+        
+        Raises
+        ------
+        TypeError
+            - If `guild` was not given neither as ``Guild`` or `int`.
+        """
+        guild_id = get_guild_id(guild)
+        await ensure_lazy_user_request(self, guild_id)
+    
+    
     async def _request_users(self, guild_id):
         """
         Requests the members of the given guild. Called when the client joins a guild and user caching is enabled
@@ -1006,6 +1006,49 @@ class ClientCompoundGuildEndpoints(Compound):
         return users
     
     
+    async def guild_user_iter_all(self, guild):
+        """
+        Iterates over all the users of the guild.
+        
+        Unlike ``.guild_user_get_all``, the users are yielded while their chunks are received, so they do not need
+        to be kept in memory at once.
+        
+        This method is an async generator.
+        
+        Parameters
+        ----------
+        guild : ``Guild | int``
+            The guild what's users will be requested.
+        
+        Yields
+        ------
+        user : ``ClientUserBase``
+        
+        Raises
+        ------
+        TypeError
+            If `guild` was not given neither as ``Guild``, nor as `int`.
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
+        guild_id = get_guild_id(guild)
+        
+        query_parameters = {'limit': 1000, 'after': 0}
+        while True:
+            user_count = 0
+            async for guild_profile_data in self.api.guild_user_get_chunk_stream(guild_id, query_parameters):
+                user = User.from_data(guild_profile_data['user'], guild_profile_data, guild_id)
+                user_count += 1
+                yield user
+            
+            if user_count < 1000:
+                break
+            
+            query_parameters['after'] = user.id
+    
+    
     async def guild_get_all(self):
         """
         Requests all the guilds of the client.
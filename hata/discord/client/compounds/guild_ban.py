@@ -266,6 +266,50 @@ class ClientCompoundGuildBanEndpoints(Compound):
         return ban_entries
     
     
+    async def guild_ban_iter_all(self, guild):
+        """
+        Iterates over the guild's ban entries.
+        
+        Unlike ``.guild_ban_get_all``, the ban entries are yielded while their chunks are received, so they do not
+        need to be kept in memory at once.
+        
+        This method is an async generator.
+        
+        Parameters
+        ----------
+        guild : ``int | Guild``
+            The guild, what's bans will be requested
+        
+        Yields
+        ------
+        ban_entry : ``BanEntry``
+            User - reason pair of a ban entry.
+        
+        Raises
+        ------
+        TypeError
+            If `guild` was not given as ``int | Guild``.
+        ConnectionError
+            No internet connection.
+        DiscordException
+            If any exception was received from the Discord API.
+        """
+        guild_id = get_guild_id(guild)
+        
+        query_parameters = {'after': 0}
+        while True:
+            ban_entry_count = 0
+            async for ban_entry_data in self.api.guild_ban_get_chunk_stream(guild_id, query_parameters):
+                ban_entry = BanEntry.from_data(ban_entry_data)
+                ban_entry_count += 1
+                yield ban_entry
+            
+            if ban_entry_count < 1000:
+                break
+            
+            query_parameters['after'] = ban_entry.user.id
+    
+    
     async def guild_ban_get(self, guild, user):
         """
         Returns the guild's ban entry for the given user id.
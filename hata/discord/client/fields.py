@@ -8,9 +8,17 @@ from ..events import IntentFlag
 from ..field_validators import (
     bool_validator_factory, entity_id_validator_factory, flag_validator_factory, nullable_entity_validator_factory
 )
+from ..gateway.encodings import GATEWAY_ENCODINGS, GatewayEncodingBase
+from ..gateway.identify_coordinators import IdentifyCoordinatorBase, IdentifyCoordinatorLocal
+from ..gateway.session_stores import SessionStoreBase
+from ..gateway.transport_compressions import (
+    TRANSPORT_COMPRESSIONS, TransportCompressionBase, TransportCompression__none
+)
 from ..http import DiscordApiClient
 from ..user import ClientUserBase
 
+from .cache_policy import CachePolicy
+
 # activity
 
 def validate_activity(activity):
@@ -120,6 +128,38 @@ validate_api = nullable_entity_validator_factory('api', DiscordApiClient)
 validate_application_id = entity_id_validator_factory('application_id', Application)
 
 
+# cache_policy
+
+def validate_cache_policy(cache_policy):
+    """
+    Validates the given cache policy.
+    
+    Parameters
+    ----------
+    cache_policy : ``None | CachePolicy``
+        Describes which entities the client keeps in its cache.
+    
+    Returns
+    -------
+    cache_policy : ``CachePolicy``
+    
+    Raises
+    ------
+    TypeError
+        - If `cache_policy`'s type is incorrect.
+    """
+    if cache_policy is None:
+        return CachePolicy()
+    
+    if not isinstance(cache_policy, CachePolicy):
+        raise TypeError(
+            f'`cache_policy` can be `None`, `{CachePolicy.__name__}`, got '
+            f'{cache_policy.__class__.__name__}; {cache_policy!r}.'
+        )
+    
+    return cache_policy
+
+
 # client_id
 
 validate_client_id = entity_id_validator_factory('client_id')
@@ -182,6 +222,111 @@ def validate_extensions(extensions):
     return extensions_validated
 
 
+# gateway_encoding
+
+def validate_gateway_encoding(gateway_encoding):
+    """
+    Validates the given gateway encoding.
+    
+    Parameters
+    ----------
+    gateway_encoding : ``str | type<GatewayEncodingBase>``
+        Gateway encoding. Can be given as its name, like `'json'` or `'etf'`.
+    
+    Returns
+    -------
+    gateway_encoding : ``type<GatewayEncodingBase>``
+    
+    Raises
+    ------
+    TypeError
+        - If `gateway_encoding`'s type is incorrect.
+    ValueError
+        - If `gateway_encoding`'s value is incorrect.
+    """
+    if isinstance(gateway_encoding, str):
+        try:
+            encoding = GATEWAY_ENCODINGS[gateway_encoding]
+        except KeyError:
+            raise ValueError(
+                f'`gateway_encoding` can be any of {sorted(GATEWAY_ENCODINGS.keys())!r}, got {gateway_encoding!r}.'
+            ) from None
+    
+    elif isinstance(gateway_encoding, type) and issubclass(gateway_encoding, GatewayEncodingBase):
+        encoding = gateway_encoding
+    
+    else:
+        raise TypeError(
+            f'`gateway_encoding` can be `str`, `type<{GatewayEncodingBase.__name__}>`, got '
+            f'{gateway_encoding.__class__.__name__}; {gateway_encoding!r}.'
+        )
+    
+    if not encoding.available:
+        raise ValueError(
+            f'`gateway_encoding` {encoding.name!r} is not available.'
+        )
+    
+    return encoding
+
+# gateway_transport_compression
+
+def validate_gateway_transport_compression(gateway_transport_compression):
+    """
+    Validates the given gateway transport compression.
+    
+    Parameters
+    ----------
+    gateway_transport_compression : ``None | str | type<TransportCompressionBase>``
+        Gateway transport compression. Can be given as its name, like `'zlib-stream'` or `'zstd-stream'`.
+        Passing it as `None` or as `'none'` disables transport compression.
+    
+    Returns
+    -------
+    gateway_transport_compression : ``type<TransportCompressionBase>``
+    
+    Raises
+    ------
+    TypeError
+        - If `gateway_transport_compression`'s type is incorrect.
+    ValueError
+        - If `gateway_transport_compression`'s value is incorrect.
+        - If `gateway_transport_compression` is not available, because its backend is not installed.
+    """
+    if gateway_transport_compression is None:
+        return TransportCompression__none
+    
+    if isinstance(gateway_transport_compression, str):
+        if gateway_transport_compression == 'none':
+            gateway_transport_compression = ''
+        
+        try:
+            transport_compression = TRANSPORT_COMPRESSIONS[gateway_transport_compression]
+        except KeyError:
+            raise ValueError(
+                f'`gateway_transport_compression` can be any of '
+                f'{sorted(name for name in TRANSPORT_COMPRESSIONS.keys() if name)!r} or `\'none\'`, '
+                f'got {gateway_transport_compression!r}.'
+            ) from None
+    
+    elif isinstance(gateway_transport_compression, type) and issubclass(
+        gateway_transport_compression, TransportCompressionBase
+    ):
+        transport_compression = gateway_transport_compression
+    
+    else:
+        raise TypeError(
+            f'`gateway_transport_compression` can be `None`, `str`, `type<{TransportCompressionBase.__name__}>`, got '
+            f'{gateway_transport_compression.__class__.__name__}; {gateway_transport_compression!r}.'
+        )
+    
+    if not transport_compression.available:
+        raise ValueError(
+            f'`gateway_transport_compression` {transport_compression.name!r} is not available, '
+            f'probably its backend is not installed.'
+        )
+    
+    return transport_compression
+
 # http
 
 validate_http = nullable_entity_validator_factory('http', HTTPClient)
@@ -249,6 +394,37 @@ def validate_http_debug_options(http_debug_options):
     
     return http_debug_options_validated
 
+# identify_coordinator
+
+def validate_identify_coordinator(identify_coordinator):
+    """
+    Validates the given identify coordinator.
+    
+    Parameters
+    ----------
+    identify_coordinator : ``None | IdentifyCoordinatorBase``
+        Identify coordinator deciding when the shards can identify.
+    
+    Returns
+    -------
+    identify_coordinator : ``IdentifyCoordinatorBase``
+    
+    Raises
+    ------
+    TypeError
+        - If `identify_coordinator`'s type is incorrect.
+    """
+    if identify_coordinator is None:
+        return IdentifyCoordinatorLocal()
+    
+    if not isinstance(identify_coordinator, IdentifyCoordinatorBase):
+        raise TypeError(
+            f'`identify_coordinator` can be `None`, `{IdentifyCoordinatorBase.__name__}`, got '
+            f'{identify_coordinator.__class__.__name__}; {identify_coordinator!r}.'
+        )
+    
+    return identify_coordinator
+
 # intents
 
 validate_intents = flag_validator_factory('intents', IntentFlag)
@@ -284,6 +460,37 @@ def validate_secret(secret):
     
     return secret
 
+# session_store
+
+def validate_session_store(session_store):
+    """
+    Validates the given session store.
+    
+    Parameters
+    ----------
+    session_store : ``None | SessionStoreBase``
+        Session store to persist the shards' sessions with.
+    
+    Returns
+    -------
+    session_store : ``None | SessionStoreBase``
+    
+    Raises
+    ------
+    TypeError
+        - If `session_store`'s type is incorrect.
+    """
+    if session_store is None:
+        return None
+    
+    if not isinstance(session_store, SessionStoreBase):
+        raise TypeError(
+            f'`session_store` can be `None`, `{SessionStoreBase.__name__}`, got '
+            f'{session_store.__class__.__name__}; {session_store!r}.'
+        )
+    
+    return session_store
+
 # should_request_users
 
 validate_should_request_users = bool_validator_factory('should_request_users', True)
@@ -326,6 +533,64 @@ def validate_shard_count(shard_count):
     
     return shard_count
 
+# shard_ids
+
+def validate_shard_ids(shard_ids):
+    """
+    Validates the shard identifiers ran by the client.
+    
+    Parameters
+    ----------
+    shard_ids : `None | iterable<int>`
+        The shards' identifiers.
+    
+    Returns
+    -------
+    shard_ids : `None | tuple<int>`
+    
+    Raises
+    ------
+    TypeError
+        - If `shard_ids`'s type is incorrect.
+    ValueError
+        - If `shard_ids` contains a negative value.
+    """
+    if shard_ids is None:
+        return None
+    
+    if (getattr(shard_ids, '__iter__', None) is None):
+        raise TypeError(
+            f'`shard_ids` can be `None | iterable<int>`, got {shard_ids.__class__.__name__}; {shard_ids!r}.'
+        )
+    
+    shard_ids_validated = None
+    
+    for shard_id in shard_ids:
+        if type(shard_id) is int:
+            pass
+        elif isinstance(shard_id, int):
+            shard_id = int(shard_id)
+        else:
+            raise TypeError(
+                f'`shard_ids` can contain `int` elements, got {shard_id.__class__.__name__}; {shard_id!r}; '
+                f'shard_ids = {shard_ids!r}.'
+            )
+        
+        if shard_id < 0:
+            raise ValueError(
+                f'`shard_ids` cannot contain negative values, got {shard_id!r}; shard_ids = {shard_ids!r}.'
+            )
+        
+        if shard_ids_validated is None:
+            shard_ids_validated = set()
+        
+        shard_ids_validated.add(shard_id)
+    
+    if shard_ids_validated is None:
+        return None
+    
+    return tuple(sorted(shard_ids_validated))
+
 # token
 
 def validate_token(token):
@@ -1,10 +1,10 @@
 __all__ = ()
 
-from collections import deque
+from heapq import heappop, heappush
 
-from scarletio import CancelledError, Future, Task, TaskGroup, WeakReferer, set_docs, sleep
+from scarletio import CancelledError, Future, LOOP_TIME, Task, TaskGroup, WeakReferer, set_docs, shield, sleep
 
-from ...env import CACHE_PRESENCE, CACHE_USER
+from ...env import CACHE_PRESENCE, CACHE_USER, USER_REQUEST_LAZY_THRESHOLD
 
 from ..core import KOKORO
 from ..events.intent import INTENT_MASK_GUILD_PRESENCES, INTENT_MASK_GUILD_USERS
@@ -15,6 +15,9 @@ READY_STATE_TO_DO_GUILD_IDS = set()
 GUILD_RECEIVE_TIMEOUT = 5.0
 SHARD_CONNECT_TIMEOUT = 12.0
 
+# Gateway commands kept free for heartbeats, presence and voice state updates while requesting users.
+USER_REQUEST_GATEWAY_BUDGET_RESERVE = 10
+
 USER_REQUEST_STATE_NONE = 0
 USER_REQUEST_STATE_TIMEOUT = 1
 USER_REQUEST_STATE_DONE = 2
@@ -32,23 +35,34 @@ class ShardUserRequester:
         Whether the client can request users with it's gateway.
     gateway : ``DiscordGateway``
         The shard's gateway.
+    guild_count : `int`
+        The amount of guilds of the shard.
     guild_create_waiter : `None`, ``Future``
         Water to wait for guild create event. Used when no more guild id is received to use up.
     guild_ids : `set` of `int`
         The guild's id to request the users of.
-    received_guild_ids : `deque` of `tuple` (`int`, `bool`)
-        A queue of received tuples. Each tuple contains a guild's identifier and whether it's users should be
-        requested.
+    lazy_count : `int`
+        The amount of guilds, which users' request was deferred till first needed.
+    lazy_threshold : `int`
+        Guilds with at least this many users have their users' request deferred till first needed. `0` if disabled.
+    lazy_user_requests : `dict<int, None | Task>`
+        The client's deferred user requests to put the deferred guilds into.
+    received_guilds : `list<(int, int, bool)>`
+        A heap of received guilds ordered by their size. Each element contains a guild's user count, identifier and
+        whether it's users should be requested.
+    requested_count : `int`
+        The amount of guilds, which users were requested.
     state : `int`
         A state containing the requester's state.
     task : `None`, ``Task`` of ``._runner``
         A task executing the user requesting.
     """
     __slots__ = (
-        'can_request_users', 'gateway', 'guild_create_waiter', 'guild_ids', 'received_guild_ids', 'state', 'task'
+        'can_request_users', 'gateway', 'guild_count', 'guild_create_waiter', 'guild_ids', 'lazy_count',
+        'lazy_threshold', 'lazy_user_requests', 'received_guilds', 'requested_count', 'state', 'task'
     )
     
-    def __new__(cls, gateway, guild_ids, can_request_users):
+    def __new__(cls, gateway, guild_ids, can_request_users, lazy_threshold, lazy_user_requests):
         """
         Creates a new user requester.
         
@@ -60,17 +74,39 @@ class ShardUserRequester:
             The guild's id to request the users of.
         can_request_users : `bool`
             Whether the client can request users with it's gateway.
+        lazy_threshold : `int`
+            Guilds with at least this many users have their users' request deferred till first needed. `0` if
+            disabled.
+        lazy_user_requests : `dict<int, None | Task>`
+            The client's deferred user requests to put the deferred guilds into.
         """
         self = object.__new__(cls)
         self.can_request_users = can_request_users
         self.gateway = gateway
+        self.guild_count = len(guild_ids)
         self.guild_ids = guild_ids
-        self.received_guild_ids = deque()
+        self.lazy_count = 0
+        self.lazy_threshold = lazy_threshold
+        self.lazy_user_requests = lazy_user_requests
+        self.received_guilds = []
+        self.requested_count = 0
         self.guild_create_waiter = None
         self.state = USER_REQUEST_STATE_NONE
         self.task = Task(KOKORO, self._runner())
         return self
     
+    
+    async def _wait_for_gateway_budget(self):
+        """
+        Waits till the shard's gateway can send more commands than the reserved amount.
+        
+        This method is a coroutine.
+        """
+        rate_limit_handler = self.gateway.rate_limit_handler
+        while rate_limit_handler.get_remaining() <= USER_REQUEST_GATEWAY_BUDGET_RESERVE:
+            await sleep(max(rate_limit_handler.resets_at - LOOP_TIME(), 0.0), KOKORO)
+    
+    
     async def _runner(self):
         """
         Requests the users of the represented shard's guilds.
@@ -79,8 +115,9 @@ class ShardUserRequester:
         """
         try:
             guild_ids = self.guild_ids
-            received_guild_ids = self.received_guild_ids
+            received_guilds = self.received_guilds
             can_request_users = self.can_request_users
+            lazy_threshold = self.lazy_threshold
             
             if can_request_users:
                 sub_data = {
@@ -97,7 +134,7 @@ class ShardUserRequester:
             
             while guild_ids:
                 
-                if not received_guild_ids:
+                if not received_guilds:
                     guild_create_waiter = Future(KOKORO)
                     guild_create_waiter.apply_timeout(GUILD_RECEIVE_TIMEOUT)
                     self.guild_create_waiter = guild_create_waiter
@@ -110,7 +147,8 @@ class ShardUserRequester:
                     finally:
                         self.guild_create_waiter = None
                 
-                guild_id, should_request_users = received_guild_ids.popleft()
+                # Request the smaller guilds first, so the most guilds are completed the soonest.
+                user_count, guild_id, should_request_users = heappop(received_guilds)
                 guild_ids.discard(guild_id)
                 
                 if not can_request_users:
@@ -124,9 +162,16 @@ class ShardUserRequester:
                 if not should_request_users:
                     continue
                 
+                if lazy_threshold and (user_count >= lazy_threshold):
+                    self.lazy_user_requests[guild_id] = None
+                    self.lazy_count += 1
+                    continue
+                
+                await self._wait_for_gateway_budget()
+                
                 sub_data['guild_id'] = guild_id
                 await self.gateway.send_as_json(data)
-                await sleep(0.6, KOKORO)
+                self.requested_count += 1
         
         except (CancelledError, GeneratorExit):
             self.state = USER_REQUEST_STATE_CANCELLED
@@ -153,7 +198,7 @@ class ShardUserRequester:
             task.cancel()
     
     
-    def feed(self, guild_id, should_request_users):
+    def feed(self, guild_id, user_count, should_request_users):
         """
         Feeds a guild identifier to the shard user requesters.
         
@@ -161,6 +206,8 @@ class ShardUserRequester:
         ----------
         guild_id : `int`
             The guild's identifier.
+        user_count : `int`
+            The guild's user count.
         should_request_users : `bool`
             Whether the guild's users should be requested.
         
@@ -170,7 +217,7 @@ class ShardUserRequester:
             Whether the request is queued up.
         """
         if guild_id in self.guild_ids:
-            self.received_guild_ids.append((guild_id, should_request_users))
+            heappush(self.received_guilds, (user_count, guild_id, should_request_users))
             
             request_enqueued = True
         else:
@@ -192,11 +239,28 @@ class ShardUserRequester:
             The guild's identifier.
         """
         self.guild_ids.discard(guild_id)
+    
+    
+    def get_progress(self):
+        """
+        Returns the user requester's progress.
+        
+        Returns
+        -------
+        progress : `dict<str, int>`
+        """
+        guild_count = self.guild_count
+        return {
+            'guild_count': guild_count,
+            'lazy_count': self.lazy_count,
+            'received_count': guild_count - len(self.guild_ids),
+            'requested_count': self.requested_count,
+        }
 
 
 if CACHE_PRESENCE:
     def should_request_users_of(client, guild):
-        if client._should_request_users:
+        if client._should_request_users and client.cache_policy.should_cache_guild_users(guild):
             if client.intents & INTENT_MASK_GUILD_PRESENCES:
                 should_request_users = guild.large
             else:
@@ -208,7 +272,7 @@ if CACHE_PRESENCE:
 
 elif CACHE_USER:
     def should_request_users_of(client, guild):
-        return client._should_request_users
+        return client._should_request_users and client.cache_policy.should_cache_guild_users(guild)
 
 else:
     def should_request_users_of(client, guild):
@@ -241,6 +305,9 @@ class ReadyState:
     ----------
     client_reference : ``WeakReferer`` to ``Client``
         Reference to the ready state's client.
+    resumed_shard_ids : `set<int>`
+        The shards which resumed a session restored from the session store. These receive no `READY` and no guilds,
+        so they are not waited for.
     shard_count : `int`
         The amount of shards of the client.
     shard_user_requesters : `dict` of (`int`, ``ShardUserRequester``) items.
@@ -250,7 +317,9 @@ class ReadyState:
     task : `None`, ``Task`` to ``._runner``
         Task, which waits for all the user requests to finish.
     """
-    __slots__ = ('client_reference', 'shard_count', 'shard_user_requesters', 'shard_ready_waiter', 'task')
+    __slots__ = (
+        'client_reference', 'resumed_shard_ids', 'shard_count', 'shard_user_requesters', 'shard_ready_waiter', 'task'
+    )
     
     def __new__(cls, client):
         """
@@ -262,6 +331,7 @@ class ReadyState:
             The respective client instance.
         """
         self = object.__new__(cls)
+        self.resumed_shard_ids = set()
         self.shard_count = client.shard_count
         self.shard_user_requesters = {}
         self.task = Task(KOKORO, self._runner())
@@ -282,6 +352,8 @@ class ReadyState:
         shard_id : `int`
             The shard's identifier.
         """
+        self.resumed_shard_ids.discard(shard_id)
+        
         shard_user_requesters = self.shard_user_requesters
         try:
             shard_user_requester = shard_user_requesters[shard_id]
@@ -293,7 +365,7 @@ class ReadyState:
         shard_count = client.shard_count
         gateway = client.gateway
         if shard_count:
-            gateway = gateway.gateways[shard_id]
+            gateway = gateway.get_gateway_of_shard(shard_id)
         
         guild_ids = set(int(guild_data['id']) for guild_data in guild_datas)
         
@@ -302,12 +374,33 @@ class ReadyState:
         if can_request_users:
             READY_STATE_TO_DO_GUILD_IDS.update(guild_ids)
         
-        shard_user_requesters[shard_id] = ShardUserRequester(gateway, guild_ids, can_request_users)
+        shard_user_requesters[shard_id] = ShardUserRequester(
+            gateway, guild_ids, can_request_users, USER_REQUEST_LAZY_THRESHOLD, client._lazy_user_requests
+        )
+        
+        shard_ready_waiter = self.shard_ready_waiter
+        if (shard_ready_waiter is not None):
+            shard_ready_waiter.set_result_if_pending(None)
+    
+    def shard_resumed(self, shard_id):
+        """
+        Marks the given shard as resumed. Called when a shard resumed a session restored from the session store.
+        
+        Parameters
+        ----------
+        shard_id : `int`
+            The shard's identifier.
+        """
+        if shard_id in self.shard_user_requesters:
+            return
+        
+        self.resumed_shard_ids.add(shard_id)
         
         shard_ready_waiter = self.shard_ready_waiter
         if (shard_ready_waiter is not None):
             shard_ready_waiter.set_result_if_pending(None)
     
+    
     def call_ready(self):
         """
         Calls the ready event handler of the respective client.
@@ -315,6 +408,8 @@ class ReadyState:
         client = self.client_reference()
         if (client is not None):
             client.ready_state = None
+            # Every guild is received, release the not received ones restored from cache snapshot.
+            client._cache_snapshot_guilds = None
             Task(KOKORO, client.events.ready(client))
     
     
@@ -351,7 +446,7 @@ class ReadyState:
             request_enqueued = False
         else:
             if shard_user_requester.state == USER_REQUEST_STATE_NONE:
-                request_enqueued = shard_user_requester.feed(guild_id, should_request_users)
+                request_enqueued = shard_user_requester.feed(guild_id, guild.user_count, should_request_users)
             else:
                 request_enqueued = False
         
@@ -365,9 +460,16 @@ class ReadyState:
         This method is a coroutine.
         """
         try:
-            shard_count = self.shard_count
-            if not shard_count:
-                shard_count = 1
+            client = self.client_reference()
+            shard_ids = None if client is None else client.shard_ids
+            if (shard_ids is not None):
+                shard_count = len(shard_ids)
+            else:
+                shard_count = self.shard_count
+                if not shard_count:
+                    shard_count = 1
+            
+            client = None
             
             while True:
                 tasks = None
@@ -386,7 +488,8 @@ class ReadyState:
                     await TaskGroup(KOKORO, tasks).wait_all()
                     continue
                 
-                if done_tasks == shard_count:
+                # Resumed shards receive no guilds, so they are done as well.
+                if done_tasks + len(self.resumed_shard_ids) >= shard_count:
                     break
                 
                 shard_ready_waiter = Future(KOKORO)
@@ -404,6 +507,30 @@ class ReadyState:
             self.task = None
             self.call_ready()
     
+    def get_progress(self):
+        """
+        Returns the ready state's progress summed up over its shards.
+        
+        Returns
+        -------
+        progress : `dict<str, int>`
+            Contains how much guilds the connected shards have, how much of them were received, how much of them
+            had their users requested and how much of them had their users' request deferred till first needed.
+        """
+        progress = {
+            'guild_count': 0,
+            'lazy_count': 0,
+            'received_count': 0,
+            'requested_count': 0,
+        }
+        
+        for shard_user_requester in self.shard_user_requesters.values():
+            for key, value in shard_user_requester.get_progress().items():
+                progress[key] += value
+        
+        return progress
+    
+    
     def cancel(self):
         """
         Cancels the ready state.
@@ -461,3 +588,75 @@ class ReadyState:
             else:
                 if guild.partial:
                     READY_STATE_TO_DO_GUILD_IDS.discard(guild_id)
+
+
+async def ensure_lazy_user_request(client, guild_id):
+    """
+    Requests the users of the given guild if their request was deferred on startup. If they are already being
+    requested, waits for it.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client to request with.
+    guild_id : `int`
+        The guild's identifier.
+    """
+    lazy_user_requests = client._lazy_user_requests
+    try:
+        task = lazy_user_requests[guild_id]
+    except KeyError:
+        return
+    
+    if task is None:
+        task = Task(KOKORO, client._request_users(guild_id))
+        task.add_done_callback(_LazyUserRequestRemover(lazy_user_requests, guild_id))
+        lazy_user_requests[guild_id] = task
+    
+    await shield(task, KOKORO)
+
+
+class _LazyUserRequestRemover:
+    """
+    Removes a finished lazy user request.
+    
+    Attributes
+    ----------
+    guild_id : `int`
+        The guild's identifier.
+    lazy_user_requests : `dict<int, None | Task>`
+        The client's deferred user requests.
+    """
+    __slots__ = ('guild_id', 'lazy_user_requests')
+    
+    def __new__(cls, lazy_user_requests, guild_id):
+        """
+        Creates a new lazy user request remover.
+        
+        Parameters
+        ----------
+        lazy_user_requests : `dict<int, None | Task>`
+            The client's deferred user requests.
+        guild_id : `int`
+            The guild's identifier.
+        """
+        self = object.__new__(cls)
+        self.guild_id = guild_id
+        self.lazy_user_requests = lazy_user_requests
+        return self
+    
+    
+    def __call__(self, task):
+        """
+        Removes the finished request.
+        
+        Parameters
+        ----------
+        task : ``Task``
+            The finished request's task.
+        """
+        lazy_user_requests = self.lazy_user_requests
+        if lazy_user_requests.get(self.guild_id, None) is task:
+            del lazy_user_requests[self.guild_id]
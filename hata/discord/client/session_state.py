@@ -0,0 +1,95 @@
+__all__ = ()
+
+from scarletio import alchemy_incendiary
+
+from ..core import KOKORO
+
+from .cache_snapshot import create_cache_snapshot, encode_cache_snapshot
+
+
+def create_session_state(client, session_store):
+    """
+    Collects the session of each of the client's shards. If the session store asks for it, creates a snapshot of the
+    entity caches as well.
+    
+    Should be called before the client's gateway is closed, so the sessions and the snapshot are collected at the same
+    point of time.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client to create the session state of.
+    session_store : ``SessionStoreBase``
+        The session store to create the session state for.
+    
+    Returns
+    -------
+    sessions : `list<(int, dict<str, object>)>`
+        Shard identifier - session pairs.
+    cache_snapshot : `None | dict<str, object>`
+        Snapshot of the entity caches.
+    """
+    sessions = []
+    for gateway in client.gateway.iter_gateways():
+        session = gateway.get_session()
+        if (session is not None):
+            sessions.append((gateway.shard_id, session))
+    
+    if session_store.cache_snapshot:
+        cache_snapshot = create_cache_snapshot(client)
+    else:
+        cache_snapshot = None
+    
+    return sessions, cache_snapshot
+
+
+async def store_session_state(session_store, sessions, cache_snapshot):
+    """
+    Stores the given session state.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    session_store : ``SessionStoreBase``
+        The session store to use.
+    sessions : `list<(int, dict<str, object>)>`
+        Shard identifier - session pairs.
+    cache_snapshot : `None | dict<str, object>`
+        Snapshot of the entity caches.
+    """
+    for shard_id, session in sessions:
+        await session_store.store_session(shard_id, session)
+    
+    if (cache_snapshot is not None):
+        data = await KOKORO.run_in_executor(alchemy_incendiary(encode_cache_snapshot, (cache_snapshot,)))
+        await session_store.store_cache_snapshot(data)
+
+
+async def restore_session_state(client, session_store):
+    """
+    Restores the session of each of the client's shards, so they will resume instead of identifying. If the session
+    store has a snapshot of the entity caches, restores it as well.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client to restore the session state of.
+    session_store : ``SessionStoreBase``
+        The session store to use.
+    """
+    for gateway in client.gateway.iter_gateways():
+        session = await session_store.load_session(gateway.shard_id)
+        if (session is not None):
+            gateway.set_session(session)
+    
+    data = await session_store.load_cache_snapshot()
+    if (data is None):
+        return
+    
+    try:
+        await client.restore_cache_snapshot(data)
+    except ValueError:
+        return
@@ -0,0 +1,47 @@
+from scarletio import copy_docs
+
+from ...gateway.session_stores import SessionStoreBase
+
+
+class TestSessionStore(SessionStoreBase):
+    """
+    Session store keeping the stored values in memory.
+    
+    Attributes
+    ----------
+    cache_snapshot : `bool`
+        Whether a snapshot of the entity caches should be stored as well.
+    stored_cache_snapshot : `None | bytes`
+        The stored cache snapshot.
+    stored_sessions : `dict<int, dict<str, object>>`
+        The stored sessions.
+    """
+    __slots__ = ('stored_cache_snapshot', 'stored_sessions')
+    
+    def __new__(cls, *, cache_snapshot = False):
+        self = SessionStoreBase.__new__(cls, cache_snapshot = cache_snapshot)
+        self.stored_cache_snapshot = None
+        self.stored_sessions = {}
+        return self
+    
+    
+    @copy_docs(SessionStoreBase.load_session)
+    async def load_session(self, shard_id):
+        return self.stored_sessions.pop(shard_id, None)
+    
+    
+    @copy_docs(SessionStoreBase.store_session)
+    async def store_session(self, shard_id, session):
+        self.stored_sessions[shard_id] = session
+    
+    
+    @copy_docs(SessionStoreBase.load_cache_snapshot)
+    async def load_cache_snapshot(self):
+        cache_snapshot = self.stored_cache_snapshot
+        self.stored_cache_snapshot = None
+        return cache_snapshot
+    
+    
+    @copy_docs(SessionStoreBase.store_cache_snapshot)
+    async def store_cache_snapshot(self, cache_snapshot):
+        self.stored_cache_snapshot = cache_snapshot
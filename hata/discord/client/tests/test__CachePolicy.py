@@ -0,0 +1,507 @@
+from pickle import dumps as pickle_dumps, loads as pickle_loads
+
+import vampytest
+
+from ...emoji import Emoji
+from ...guild import Guild
+from ...sticker import Sticker
+from ...user import GuildProfile, Status, User
+
+from ..cache_policy import CachePolicy
+from ..client import Client
+
+
+def _assert_fields_set(cache_policy):
+    """
+    Asserts whether every attribute is set of the given cache policy.
+    
+    Parameters
+    ----------
+    cache_policy : ``CachePolicy``
+        The cache policy to check.
+    """
+    vampytest.assert_instance(cache_policy, CachePolicy)
+    vampytest.assert_instance(cache_policy._presence_expiry_handle, object, nullable = True)
+    vampytest.assert_instance(cache_policy._presence_update_ats, dict)
+    vampytest.assert_instance(cache_policy.emoji_limit, int, nullable = True)
+    vampytest.assert_instance(cache_policy.guild_user_limit, int, nullable = True)
+    vampytest.assert_instance(cache_policy.presence_expiry, float, nullable = True)
+    vampytest.assert_instance(cache_policy.sticker_limit, int, nullable = True)
+    vampytest.assert_instance(cache_policy.user_role_required, bool)
+
+
+def test__CachePolicy__new__no_fields():
+    """
+    Tests whether ``CachePolicy.__new__`` works as intended.
+    
+    Case: no fields given.
+    """
+    cache_policy = CachePolicy()
+    _assert_fields_set(cache_policy)
+    
+    vampytest.assert_is(cache_policy.emoji_limit, None)
+    vampytest.assert_is(cache_policy.guild_user_limit, None)
+    vampytest.assert_is(cache_policy.presence_expiry, None)
+    vampytest.assert_is(cache_policy.sticker_limit, None)
+    vampytest.assert_eq(cache_policy.user_role_required, False)
+
+
+def test__CachePolicy__new__all_fields():
+    """
+    Tests whether ``CachePolicy.__new__`` works as intended.
+    
+    Case: all fields given.
+    """
+    emoji_limit = 20
+    guild_user_limit = 1000
+    presence_expiry = 600
+    sticker_limit = 5
+    user_role_required = True
+    
+    cache_policy = CachePolicy(
+        emoji_limit = emoji_limit,
+        guild_user_limit = guild_user_limit,
+        presence_expiry = presence_expiry,
+        sticker_limit = sticker_limit,
+        user_role_required = user_role_required,
+    )
+    _assert_fields_set(cache_policy)
+    
+    vampytest.assert_eq(cache_policy.emoji_limit, emoji_limit)
+    vampytest.assert_eq(cache_policy.guild_user_limit, guild_user_limit)
+    vampytest.assert_eq(cache_policy.presence_expiry, 600.0)
+    vampytest.assert_eq(cache_policy.sticker_limit, sticker_limit)
+    vampytest.assert_eq(cache_policy.user_role_required, user_role_required)
+
+
+def _iter_options__new__type_error():
+    yield {'emoji_limit': 'mister'}
+    yield {'emoji_limit': True}
+    yield {'guild_user_limit': 12.5}
+    yield {'presence_expiry': 'mister'}
+    yield {'sticker_limit': 'mister'}
+    yield {'user_role_required': 1}
+
+
+def _iter_options__new__value_error():
+    yield {'emoji_limit': -1}
+    yield {'guild_user_limit': -1}
+    yield {'presence_expiry': 0.0}
+    yield {'sticker_limit': -1}
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__new__value_error()).raising(ValueError))
+def test__CachePolicy__new__invalid(keyword_parameters):
+    """
+    Tests whether ``CachePolicy.__new__`` works as intended.
+    
+    Case: invalid parameters.
+    
+    Parameters
+    ----------
+    keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the cache policy with.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    CachePolicy(**keyword_parameters)
+
+
+def test__CachePolicy__repr():
+    """
+    Tests whether ``CachePolicy.__repr__`` works as intended.
+    """
+    cache_policy = CachePolicy(guild_user_limit = 1000, user_role_required = True)
+    
+    output = repr(cache_policy)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in('guild_user_limit = 1000', output)
+    vampytest.assert_in('user_role_required', output)
+
+
+def _iter_options__eq():
+    keyword_parameters = {
+        'emoji_limit': 20,
+        'guild_user_limit': 1000,
+        'presence_expiry': 600.0,
+        'sticker_limit': 5,
+        'user_role_required': True,
+    }
+    
+    yield keyword_parameters, keyword_parameters, True
+    yield keyword_parameters, {**keyword_parameters, 'emoji_limit': 10}, False
+    yield keyword_parameters, {**keyword_parameters, 'guild_user_limit': None}, False
+    yield keyword_parameters, {**keyword_parameters, 'presence_expiry': 60.0}, False
+    yield keyword_parameters, {**keyword_parameters, 'sticker_limit': 10}, False
+    yield keyword_parameters, {**keyword_parameters, 'user_role_required': False}, False
+
+
+@vampytest._(vampytest.call_from(_iter_options__eq()).returning_last())
+def test__CachePolicy__eq(keyword_parameters_0, keyword_parameters_1):
+    """
+    Tests whether ``CachePolicy.__eq__`` works as intended.
+    
+    Parameters
+    ----------
+    keyword_parameters_0 : `dict<str, object>`
+        Keyword parameters to create instance with.
+    keyword_parameters_1 : `dict<str, object>`
+        Keyword parameters to create instance with.
+    
+    Returns
+    -------
+    output : `bool`
+    """
+    cache_policy_0 = CachePolicy(**keyword_parameters_0)
+    cache_policy_1 = CachePolicy(**keyword_parameters_1)
+    
+    output = cache_policy_0 == cache_policy_1
+    vampytest.assert_instance(output, bool)
+    return output
+
+
+def test__CachePolicy__hash():
+    """
+    Tests whether ``CachePolicy.__hash__`` works as intended.
+    """
+    cache_policy = CachePolicy(guild_user_limit = 1000)
+    
+    output = hash(cache_policy)
+    vampytest.assert_instance(output, int)
+    vampytest.assert_eq(output, hash(CachePolicy(guild_user_limit = 1000)))
+
+
+def test__CachePolicy__pickle():
+    """
+    Tests whether ``CachePolicy`` can be pickled.
+    """
+    cache_policy = CachePolicy(emoji_limit = 20, presence_expiry = 600.0, user_role_required = True)
+    
+    output = pickle_loads(pickle_dumps(cache_policy))
+    _assert_fields_set(output)
+    vampytest.assert_eq(output, cache_policy)
+
+
+def _iter_options__should_cache_guild_users():
+    yield None, 2000, True
+    yield 1000, 2000, False
+    yield 1000, 1000, True
+
+
+@vampytest._(vampytest.call_from(_iter_options__should_cache_guild_users()).returning_last())
+def test__CachePolicy__should_cache_guild_users(guild_user_limit, user_count):
+    """
+    Tests whether ``CachePolicy.should_cache_guild_users`` works as intended.
+    
+    Parameters
+    ----------
+    guild_user_limit : `None | int`
+        Guild user limit to create the policy with.
+    user_count : `int`
+        The guild's user count.
+    
+    Returns
+    -------
+    output : `bool`
+    """
+    guild = Guild.precreate(202610180100, user_count = user_count)
+    cache_policy = CachePolicy(guild_user_limit = guild_user_limit)
+    
+    output = cache_policy.should_cache_guild_users(guild)
+    vampytest.assert_instance(output, bool)
+    return output
+
+
+def _iter_options__should_cache_guild_user():
+    yield {}, 2000, None, True
+    yield {'guild_user_limit': 1000}, 2000, None, False
+    yield {'user_role_required': True}, 2000, None, False
+    yield {'user_role_required': True}, 2000, [202610180103], True
+    yield {'guild_user_limit': 1000, 'user_role_required': True}, 2000, [202610180103], False
+
+
+@vampytest._(vampytest.call_from(_iter_options__should_cache_guild_user()).returning_last())
+def test__CachePolicy__should_cache_guild_user(keyword_parameters, user_count, role_ids):
+    """
+    Tests whether ``CachePolicy.should_cache_guild_user`` works as intended.
+    
+    Parameters
+    ----------
+    keyword_parameters : `dict<str, object>`
+        Keyword parameters to create the policy with.
+    user_count : `int`
+        The guild's user count.
+    role_ids : `None | list<int>`
+        The user's roles' identifiers in the guild.
+    
+    Returns
+    -------
+    output : `bool`
+    """
+    guild_id = 202610180101
+    guild = Guild.precreate(guild_id, user_count = user_count)
+    user = User.precreate(202610180102)
+    user.guild_profiles[guild_id] = GuildProfile(role_ids = role_ids)
+    
+    cache_policy = CachePolicy(**keyword_parameters)
+    
+    output = cache_policy.should_cache_guild_user(guild, user)
+    vampytest.assert_instance(output, bool)
+    return output
+
+
+def test__CachePolicy__apply_to_guild():
+    """
+    Tests whether ``CachePolicy.apply_to_guild`` works as intended.
+    """
+    guild_id = 202610180110
+    role_id = 202610180111
+    
+    user_0 = User.precreate(202610180112)
+    user_0.guild_profiles[guild_id] = GuildProfile(role_ids = [role_id])
+    user_1 = User.precreate(202610180113)
+    user_1.guild_profiles[guild_id] = GuildProfile()
+    
+    emoji_0 = Emoji.precreate(202610180114, guild_id = guild_id)
+    emoji_1 = Emoji.precreate(202610180115, guild_id = guild_id)
+    emoji_2 = Emoji.precreate(202610180116, guild_id = guild_id)
+    
+    sticker_0 = Sticker.precreate(202610180117, guild_id = guild_id)
+    sticker_1 = Sticker.precreate(202610180118, guild_id = guild_id)
+    
+    guild = Guild.precreate(
+        guild_id,
+        emojis = [emoji_0, emoji_1, emoji_2],
+        stickers = [sticker_0, sticker_1],
+        users = [user_0, user_1],
+    )
+    
+    cache_policy = CachePolicy(emoji_limit = 2, sticker_limit = 2, user_role_required = True)
+    cache_policy.apply_to_guild(guild)
+    
+    vampytest.assert_eq(guild.users, {user_0.id: user_0})
+    vampytest.assert_eq(guild.emojis, {emoji_1.id: emoji_1, emoji_2.id: emoji_2})
+    vampytest.assert_eq(guild.stickers, {sticker_0.id: sticker_0, sticker_1.id: sticker_1})
+
+
+def test__CachePolicy__apply_to_guild_user():
+    """
+    Tests whether ``CachePolicy.apply_to_guild_user`` works as intended.
+    """
+    guild_id = 202610180120
+    role_id = 202610180121
+    
+    user = User.precreate(202610180122)
+    user.guild_profiles[guild_id] = GuildProfile()
+    
+    guild = Guild.precreate(guild_id)
+    
+    cache_policy = CachePolicy(user_role_required = True)
+    
+    cache_policy.apply_to_guild_user(guild, user)
+    vampytest.assert_eq(guild.users, {})
+    vampytest.assert_not_in(guild_id, user.guild_profiles)
+    
+    user.guild_profiles[guild_id] = GuildProfile(role_ids = [role_id])
+    cache_policy.apply_to_guild_user(guild, user)
+    vampytest.assert_eq(guild.users, {user.id: user})
+    
+    user.guild_profiles[guild_id] = GuildProfile()
+    cache_policy.apply_to_guild_user(guild, user)
+    vampytest.assert_eq(guild.users, {})
+    vampytest.assert_not_in(guild_id, user.guild_profiles)
+
+
+def test__CachePolicy__apply_to_guild_user__kept_by_other_client():
+    """
+    Tests whether ``CachePolicy.apply_to_guild_user`` works as intended.
+    
+    Case: an other client's cache policy keeps the user.
+    """
+    guild_id = 202610180123
+    
+    user = User.precreate(202610180124)
+    user.guild_profiles[guild_id] = GuildProfile()
+    
+    cache_policy = CachePolicy(user_role_required = True)
+    
+    client_0 = Client(
+        'token_20261018_0125',
+        client_id = 202610180125,
+        cache_policy = cache_policy,
+    )
+    
+    client_1 = Client(
+        'token_20261018_0126',
+        client_id = 202610180126,
+    )
+    
+    try:
+        guild = Guild.precreate(guild_id)
+        guild.clients.append(client_0)
+        guild.clients.append(client_1)
+        
+        cache_policy.apply_to_guild_user(guild, user)
+        vampytest.assert_eq(guild.users, {user.id: user})
+        vampytest.assert_in(guild_id, user.guild_profiles)
+    
+    finally:
+        client_0._delete()
+        client_0 = None
+        client_1._delete()
+        client_1 = None
+
+
+def test__CachePolicy__touch_presence():
+    """
+    Tests whether ``CachePolicy.touch_presence`` works as intended.
+    """
+    now = 1000.0
+    scheduled = []
+    
+    def mock_loop_time():
+        nonlocal now
+        return now
+    
+    class mock_loop:
+        def call_at(when, callback, *parameters):
+            nonlocal scheduled
+            scheduled.append(when)
+            return object()
+    
+    mocked = vampytest.mock_globals(
+        CachePolicy.touch_presence,
+        KOKORO = mock_loop,
+        LOOP_TIME = mock_loop_time,
+    )
+    
+    user_0 = User.precreate(202610180130, status = Status.online)
+    user_1 = User.precreate(202610180131, status = Status.offline)
+    
+    cache_policy = CachePolicy(presence_expiry = 60.0)
+    
+    mocked(cache_policy, user_0)
+    mocked(cache_policy, user_1)
+    vampytest.assert_eq(cache_policy._presence_update_ats, {user_0.id: 1000.0})
+    vampytest.assert_eq(scheduled, [1060.0])
+    
+    # Touching again moves it to the end and does not schedule again.
+    now = 1010.0
+    mocked(cache_policy, user_0)
+    vampytest.assert_eq(cache_policy._presence_update_ats, {user_0.id: 1010.0})
+    vampytest.assert_eq(scheduled, [1060.0])
+    
+    # Going offline stops tracking.
+    user_0.status = Status.offline
+    mocked(cache_policy, user_0)
+    vampytest.assert_eq(cache_policy._presence_update_ats, {})
+
+
+def test__CachePolicy__touch_presence__no_expiry():
+    """
+    Tests whether ``CachePolicy.touch_presence`` works as intended.
+    
+    Case: no presence expiry.
+    """
+    user = User.precreate(202610180132, status = Status.online)
+    
+    cache_policy = CachePolicy()
+    cache_policy.touch_presence(user)
+    vampytest.assert_eq(cache_policy._presence_update_ats, {})
+    vampytest.assert_is(cache_policy._presence_expiry_handle, None)
+
+
+def test__CachePolicy__expire_presences():
+    """
+    Tests whether ``CachePolicy._expire_presences`` works as intended.
+    """
+    now = 1060.0
+    scheduled = []
+    
+    def mock_loop_time():
+        nonlocal now
+        return now
+    
+    class mock_loop:
+        def call_at(when, callback, *parameters):
+            nonlocal scheduled
+            scheduled.append(when)
+            return object()
+    
+    mocked = vampytest.mock_globals(
+        CachePolicy._expire_presences,
+        KOKORO = mock_loop,
+        LOOP_TIME = mock_loop_time,
+    )
+    
+    user_0 = User.precreate(202610180133, status = Status.online)
+    user_1 = User.precreate(202610180134, status = Status.idle)
+    
+    cache_policy = CachePolicy(presence_expiry = 60.0)
+    cache_policy._presence_update_ats[user_0.id] = 1000.0
+    cache_policy._presence_update_ats[user_1.id] = 1030.0
+    
+    mocked(cache_policy)
+    
+    vampytest.assert_is(user_0.status, Status.offline)
+    vampytest.assert_is(user_1.status, Status.idle)
+    vampytest.assert_eq(cache_policy._presence_update_ats, {user_1.id: 1030.0})
+    vampytest.assert_eq(scheduled, [1090.0])
+    vampytest.assert_is_not(cache_policy._presence_expiry_handle, None)
+
+
+def test__CachePolicy__expire_presences__kept_by_other_client():
+    """
+    Tests whether ``CachePolicy._expire_presences`` works as intended.
+    
+    Case: an other client's cache policy keeps the presence.
+    """
+    now = 1060.0
+    
+    def mock_loop_time():
+        nonlocal now
+        return now
+    
+    mocked = vampytest.mock_globals(
+        CachePolicy._expire_presences,
+        LOOP_TIME = mock_loop_time,
+    )
+    
+    guild_id = 202610180135
+    
+    user = User.precreate(202610180136, status = Status.online)
+    user.guild_profiles[guild_id] = GuildProfile()
+    
+    cache_policy = CachePolicy(presence_expiry = 60.0)
+    cache_policy._presence_update_ats[user.id] = 1000.0
+    
+    client_0 = Client(
+        'token_20261018_0137',
+        client_id = 202610180137,
+        cache_policy = cache_policy,
+    )
+    
+    client_1 = Client(
+        'token_20261018_0138',
+        client_id = 202610180138,
+    )
+    
+    try:
+        guild = Guild.precreate(guild_id, users = [user])
+        guild.clients.append(client_0)
+        guild.clients.append(client_1)
+        
+        mocked(cache_policy)
+        
+        vampytest.assert_is(user.status, Status.online)
+        vampytest.assert_eq(cache_policy._presence_update_ats, {})
+    
+    finally:
+        client_0._delete()
+        client_0 = None
+        client_1._delete()
+        client_1 = None
@@ -0,0 +1,104 @@
+import vampytest
+
+from ...core import GUILDS
+from ...guild import Guild
+
+from ..client import Client
+
+
+async def test__Client__save_cache_snapshot__restore_cache_snapshot():
+    """
+    Tests whether ``Client.save_cache_snapshot`` and ``Client.restore_cache_snapshot`` works as intended.
+    
+    This function is a coroutine.
+    """
+    client_0 = Client(
+        'token_20261018_0070',
+        client_id = 202610180070,
+    )
+    
+    client_1 = Client(
+        'token_20261018_0071',
+        client_id = 202610180071,
+    )
+    
+    guild_id = 202610180072
+    
+    try:
+        guild = Guild.precreate(guild_id, name = 'satori')
+        guild.clients.append(client_0)
+        client_0.guilds.add(guild)
+        
+        data = await client_0.save_cache_snapshot()
+        vampytest.assert_instance(data, bytes)
+        
+        await client_1.restore_cache_snapshot(data)
+        
+        # Nothing is resuming, so the guild is only warmed up.
+        vampytest.assert_eq(client_1._cache_snapshot_guilds, {guild_id: guild})
+        vampytest.assert_eq(client_1.guilds, set())
+        vampytest.assert_is(GUILDS.get(guild_id, None), guild)
+    
+    finally:
+        client_0._delete()
+        client_0 = None
+        client_1._delete()
+        client_1 = None
+
+
+async def test__Client__restore_cache_snapshot__invalid():
+    """
+    Tests whether ``Client.restore_cache_snapshot`` works as intended.
+    
+    Case: invalid data.
+    
+    This function is a coroutine.
+    """
+    client = Client(
+        'token_20261018_0073',
+        client_id = 202610180073,
+    )
+    
+    try:
+        with vampytest.assert_raises(ValueError):
+            await client.restore_cache_snapshot(b'koishi')
+        
+        vampytest.assert_is(client._cache_snapshot_guilds, None)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__Client__restore_cache_snapshot__running():
+    """
+    Tests whether ``Client.restore_cache_snapshot`` works as intended.
+    
+    Case: client running.
+    
+    This function is a coroutine.
+    """
+    client_0 = Client(
+        'token_20261018_0074',
+        client_id = 202610180074,
+    )
+    
+    client_1 = Client(
+        'token_20261018_0075',
+        client_id = 202610180075,
+    )
+    
+    try:
+        data = await client_0.save_cache_snapshot()
+        
+        client_1.running = True
+        with vampytest.assert_raises(RuntimeError):
+            await client_1.restore_cache_snapshot(data)
+    
+    finally:
+        client_1.running = False
+        
+        client_0._delete()
+        client_0 = None
+        client_1._delete()
+        client_1 = None
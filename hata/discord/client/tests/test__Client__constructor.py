@@ -11,11 +11,16 @@ from ...core import KOKORO
 from ...events import IntentFlag
 from ...events.event_handler_manager import EventHandlerManager
 from ...gateway.client_base import DiscordGatewayClientBase
+from ...gateway.encodings import GatewayEncodingBase, GatewayEncoding__etf
+from ...gateway.identify_coordinators import IdentifyCoordinatorBase, IdentifyCoordinatorLocal
+from ...gateway.session_stores import SessionStoreBase, SessionStoreFile
+from ...gateway.transport_compressions import TransportCompressionBase, TransportCompression__none
 from ...guild import GuildBadge
 from ...http import DiscordApiClient
 from ...localization import Locale
 from ...user import AvatarDecoration, PremiumType, Status, UserFlag
 
+from ..cache_policy import CachePolicy
 from ..client import Client
 from ..ready_state import ReadyState
 
@@ -32,10 +37,12 @@ def _assert_fields_set(client):
     vampytest.assert_instance(client, Client)
     vampytest.assert_instance(client._activity, Activity)
     vampytest.assert_instance(client._additional_owner_ids, set, nullable = True)
+    vampytest.assert_instance(client._cache_snapshot_guilds, dict, nullable = True)
     vampytest.assert_instance(client._gateway_requesting, bool)
     vampytest.assert_instance(client._gateway_time, float)
     vampytest.assert_instance(client._gateway_url, str)
     vampytest.assert_instance(client._gateway_waiter, Future, nullable = True)
+    vampytest.assert_instance(client._lazy_user_requests, dict)
     vampytest.assert_instance(client._should_request_users, bool)
     vampytest.assert_instance(client._status, Status)
     vampytest.assert_instance(client._user_chunker_nonce, int)
@@ -47,6 +54,7 @@ def _assert_fields_set(client):
     vampytest.assert_instance(client.banner_color, int, nullable = True)
     vampytest.assert_instance(client.banner, Icon)
     vampytest.assert_instance(client.bot, bool)
+    vampytest.assert_instance(client.cache_policy, CachePolicy)
     vampytest.assert_instance(client.discriminator, int)
     vampytest.assert_instance(client.display_name, str, nullable = True)
     vampytest.assert_instance(client.email, str, nullable = True)
@@ -54,11 +62,14 @@ def _assert_fields_set(client):
     vampytest.assert_instance(client.events, EventHandlerManager)
     vampytest.assert_instance(client.flags, UserFlag)
     vampytest.assert_instance(client.gateway, DiscordGatewayClientBase)
+    vampytest.assert_subtype(client.gateway_encoding, GatewayEncodingBase)
+    vampytest.assert_subtype(client.gateway_transport_compression, TransportCompressionBase)
     vampytest.assert_instance(client.group_channels, dict)
     vampytest.assert_instance(client.guild_profiles, dict)
     vampytest.assert_instance(client.guilds, set)
     vampytest.assert_instance(client.http, HTTPClient)
     vampytest.assert_instance(client.id, int)
+    vampytest.assert_instance(client.identify_coordinator, IdentifyCoordinatorBase)
     vampytest.assert_instance(client.intents, IntentFlag)
     vampytest.assert_instance(client.locale, Locale)
     vampytest.assert_instance(client.mfa_enabled, bool)
@@ -70,7 +81,9 @@ def _assert_fields_set(client):
     vampytest.assert_instance(client.relationships, dict)
     vampytest.assert_instance(client.running, bool)
     vampytest.assert_instance(client.secret, str)
+    vampytest.assert_instance(client.session_store, SessionStoreBase, nullable = True)
     vampytest.assert_instance(client.shard_count, int)
+    vampytest.assert_instance(client.shard_ids, tuple, nullable = True)
     vampytest.assert_instance(client.status, Status)
     vampytest.assert_instance(client.statuses, dict, nullable = True)
     vampytest.assert_instance(client.thread_profiles, dict, nullable = True)
@@ -120,6 +133,14 @@ def test__Client__new__all_fields():
     mfa_enabled = True
     premium_type = PremiumType.nitro_basic
     
+    cache_policy = CachePolicy(guild_user_limit = 1000)
+    gateway_encoding = 'etf'
+    gateway_transport_compression = None
+    identify_coordinator = IdentifyCoordinatorLocal()
+    session_store = SessionStoreFile('/tmp/sessions')
+    shard_count = 4
+    shard_ids = [3, 2]
+    
     http = HTTPClient(KOKORO)
     api = DiscordApiClient(True, 'koishi', http = http)
     
@@ -142,6 +163,14 @@ def test__Client__new__all_fields():
         mfa_enabled = mfa_enabled,
         premium_type = premium_type,
         
+        cache_policy = cache_policy,
+        gateway_encoding = gateway_encoding,
+        gateway_transport_compression = gateway_transport_compression,
+        identify_coordinator = identify_coordinator,
+        session_store = session_store,
+        shard_count = shard_count,
+        shard_ids = shard_ids,
+        
         api = api,
         http = http,
     )
@@ -166,6 +195,14 @@ def test__Client__new__all_fields():
         vampytest.assert_eq(client.mfa_enabled, mfa_enabled)
         vampytest.assert_is(client.premium_type, premium_type)
         
+        vampytest.assert_is(client.cache_policy, cache_policy)
+        vampytest.assert_is(client.gateway_encoding, GatewayEncoding__etf)
+        vampytest.assert_is(client.gateway_transport_compression, TransportCompression__none)
+        vampytest.assert_is(client.identify_coordinator, identify_coordinator)
+        vampytest.assert_is(client.session_store, session_store)
+        vampytest.assert_eq(client.shard_count, shard_count)
+        vampytest.assert_eq(client.shard_ids, (2, 3))
+        
         vampytest.assert_is(client.api, api)
         vampytest.assert_is(client.http, http)
     
@@ -173,3 +210,35 @@ def test__Client__new__all_fields():
     finally:
         client._delete()
         client = None
+
+
+def _iter_options__shard_ids__value_error():
+    yield 0, [2]
+    yield 4, [2, 4]
+
+
+@vampytest._(vampytest.call_from(_iter_options__shard_ids__value_error()).raising(ValueError))
+def test__Client__new__shard_ids__value_error(shard_count, shard_ids):
+    """
+    Tests whether ``Client.__new__`` works as intended.
+    
+    Case: `shard_ids` not matching `shard_count`.
+    
+    Parameters
+    ----------
+    shard_count : `int`
+        The client's shard count.
+    shard_ids : `list<int>`
+        The shards' identifiers to run.
+    
+    Raises
+    ------
+    ValueError
+    """
+    client = Client(
+        'token_202505110006',
+        client_id = 202505110007,
+        shard_count = shard_count,
+        shard_ids = shard_ids,
+    )
+    client._delete()
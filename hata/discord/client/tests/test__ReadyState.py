@@ -0,0 +1,110 @@
+import vampytest
+from scarletio import skip_ready_cycle
+
+from ..client import Client
+from ..ready_state import ReadyState
+
+
+async def test__ReadyState__shard_resumed__all_shards():
+    """
+    Tests whether ``ReadyState.shard_resumed`` works as intended.
+    
+    Case: every shard resumed.
+    
+    This function is a coroutine.
+    """
+    client = Client(
+        'token_20261020_0002',
+        client_id = 202610200002,
+        shard_count = 2,
+    )
+    
+    try:
+        client._shard_resumed(0)
+        ready_state = client.ready_state
+        vampytest.assert_instance(ready_state, ReadyState)
+        
+        await skip_ready_cycle()
+        vampytest.assert_is_not(ready_state.task, None)
+        
+        client._shard_resumed(1)
+        vampytest.assert_is(client.ready_state, ready_state)
+        vampytest.assert_eq(ready_state.resumed_shard_ids, {0, 1})
+        
+        await ready_state
+        vampytest.assert_is(client.ready_state, None)
+    
+    finally:
+        ready_state = client.ready_state
+        if (ready_state is not None):
+            client.ready_state = None
+            ready_state.cancel()
+        
+        client._delete()
+        client = None
+
+
+async def test__ReadyState__shard_resumed__mixed():
+    """
+    Tests whether ``ReadyState.shard_resumed`` works as intended.
+    
+    Case: a shard resumed and an other one received ready.
+    
+    This function is a coroutine.
+    """
+    client = Client(
+        'token_20261020_0003',
+        client_id = 202610200003,
+        shard_count = 2,
+    )
+    
+    try:
+        client._delay_ready([], 0)
+        ready_state = client.ready_state
+        
+        await skip_ready_cycle()
+        vampytest.assert_is_not(ready_state.task, None)
+        
+        client._shard_resumed(1)
+        
+        await ready_state
+        vampytest.assert_is(client.ready_state, None)
+    
+    finally:
+        ready_state = client.ready_state
+        if (ready_state is not None):
+            client.ready_state = None
+            ready_state.cancel()
+        
+        client._delete()
+        client = None
+
+
+def test__ReadyState__shard_ready__after_resumed():
+    """
+    Tests whether ``ReadyState.shard_ready`` works as intended.
+    
+    Case: the shard resumed before, but it had to identify since.
+    """
+    client = Client(
+        'token_20261020_0004',
+        client_id = 202610200004,
+        shard_count = 2,
+    )
+    
+    try:
+        client._shard_resumed(1)
+        ready_state = client.ready_state
+        
+        client._delay_ready([], 1)
+        vampytest.assert_eq(ready_state.resumed_shard_ids, set())
+        vampytest.assert_in(1, ready_state.shard_user_requesters)
+    
+    finally:
+        ready_state = client.ready_state
+        if (ready_state is not None):
+            client.ready_state = None
+            ready_state.cancel()
+        
+        client._delete()
+        client = None
@@ -0,0 +1,165 @@
+import vampytest
+from scarletio import LOOP_TIME, Task, skip_ready_cycle
+
+from ...core import KOKORO
+from ...gateway.rate_limit import GatewayRateLimiter
+
+from ..ready_state import (
+    READY_STATE_TO_DO_GUILD_IDS, ShardUserRequester, USER_REQUEST_STATE_DONE, USER_REQUEST_STATE_NONE
+)
+
+
+class GatewayStub:
+    """
+    Gateway stub collecting the sent data.
+    
+    Attributes
+    ----------
+    rate_limit_handler : ``GatewayRateLimiter``
+        The gateway's rate limiter.
+    sent : `list<object>`
+        The sent data.
+    """
+    __slots__ = ('rate_limit_handler', 'sent')
+    
+    def __new__(cls):
+        """
+        Creates a new gateway stub.
+        """
+        self = object.__new__(cls)
+        self.rate_limit_handler = GatewayRateLimiter()
+        self.sent = []
+        return self
+    
+    
+    async def send_as_json(self, data):
+        """
+        Collects the given data.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        data : `object`
+            The data to send.
+        """
+        await self.rate_limit_handler
+        self.sent.append(data['d']['guild_id'])
+
+
+def _assert_fields_set(shard_user_requester):
+    """
+    Asserts whether every attribute is set of the given shard user requester.
+    
+    Parameters
+    ----------
+    shard_user_requester : ``ShardUserRequester``
+        The shard user requester to check.
+    """
+    vampytest.assert_instance(shard_user_requester, ShardUserRequester)
+    vampytest.assert_instance(shard_user_requester.can_request_users, int)
+    vampytest.assert_instance(shard_user_requester.gateway, GatewayStub)
+    vampytest.assert_instance(shard_user_requester.guild_count, int)
+    vampytest.assert_is(shard_user_requester.guild_create_waiter, None)
+    vampytest.assert_instance(shard_user_requester.guild_ids, set)
+    vampytest.assert_instance(shard_user_requester.lazy_count, int)
+    vampytest.assert_instance(shard_user_requester.lazy_threshold, int)
+    vampytest.assert_instance(shard_user_requester.lazy_user_requests, dict)
+    vampytest.assert_instance(shard_user_requester.received_guilds, list)
+    vampytest.assert_instance(shard_user_requester.requested_count, int)
+    vampytest.assert_instance(shard_user_requester.state, int)
+    vampytest.assert_instance(shard_user_requester.task, Task, nullable = True)
+
+
+async def test__ShardUserRequester__new():
+    """
+    Tests whether ``ShardUserRequester.__new__`` works as intended.
+    
+    This function is a coroutine.
+    """
+    gateway = GatewayStub()
+    guild_ids = {202510190000, 202510190001}
+    
+    shard_user_requester = ShardUserRequester(gateway, guild_ids, True, 0, {})
+    try:
+        _assert_fields_set(shard_user_requester)
+        vampytest.assert_eq(shard_user_requester.guild_count, 2)
+        vampytest.assert_eq(shard_user_requester.state, USER_REQUEST_STATE_NONE)
+    finally:
+        shard_user_requester.cancel()
+
+
+async def test__ShardUserRequester__request_order():
+    """
+    Tests whether ``ShardUserRequester`` works as intended.
+    
+    Case: The received guilds' users are requested ordered by the guilds' size, deferring the large ones.
+    
+    This function is a coroutine.
+    """
+    guild_id_0 = 202510190010
+    guild_id_1 = 202510190011
+    guild_id_2 = 202510190012
+    guild_id_3 = 202510190013
+    guild_id_4 = 202510190014
+    guild_ids = {guild_id_0, guild_id_1, guild_id_2, guild_id_3, guild_id_4}
+    
+    gateway = GatewayStub()
+    READY_STATE_TO_DO_GUILD_IDS.update(guild_ids)
+    
+    lazy_user_requests = {}
+    
+    shard_user_requester = ShardUserRequester(gateway, guild_ids.copy(), True, 1000, lazy_user_requests)
+    try:
+        vampytest.assert_true(shard_user_requester.feed(guild_id_0, 500, True))
+        vampytest.assert_true(shard_user_requester.feed(guild_id_1, 50, True))
+        vampytest.assert_true(shard_user_requester.feed(guild_id_2, 5000, True))
+        vampytest.assert_true(shard_user_requester.feed(guild_id_3, 5, False))
+        vampytest.assert_true(shard_user_requester.feed(guild_id_4, 100, True))
+        vampytest.assert_false(shard_user_requester.feed(202510190015, 100, True))
+        
+        for counter in range(5):
+            await skip_ready_cycle()
+        
+        vampytest.assert_eq(shard_user_requester.state, USER_REQUEST_STATE_DONE)
+        vampytest.assert_eq(gateway.sent, [guild_id_1, guild_id_4, guild_id_0])
+        vampytest.assert_eq(lazy_user_requests, {guild_id_2: None})
+        vampytest.assert_eq(
+            shard_user_requester.get_progress(),
+            {
+                'guild_count': 5,
+                'lazy_count': 1,
+                'received_count': 5,
+                'requested_count': 3,
+            },
+        )
+    
+    finally:
+        shard_user_requester.cancel()
+        READY_STATE_TO_DO_GUILD_IDS.difference_update(guild_ids)
+
+
+async def test__ShardUserRequester__wait_for_gateway_budget():
+    """
+    Tests whether ``ShardUserRequester._wait_for_gateway_budget`` works as intended.
+    
+    Case: The gateway's rate limit is almost exhausted, so it waits for its reset.
+    
+    This function is a coroutine.
+    """
+    gateway = GatewayStub()
+    rate_limit_handler = gateway.rate_limit_handler
+    rate_limit_handler.remaining = 1
+    rate_limit_handler.resets_at = LOOP_TIME() + 0.01
+    
+    shard_user_requester = ShardUserRequester(gateway, set(), True, 0, {})
+    try:
+        task = Task(KOKORO, shard_user_requester._wait_for_gateway_budget())
+        await skip_ready_cycle()
+        vampytest.assert_false(task.is_done())
+        
+        await task
+        vampytest.assert_true(LOOP_TIME() >= rate_limit_handler.resets_at)
+    
+    finally:
+        shard_user_requester.cancel()
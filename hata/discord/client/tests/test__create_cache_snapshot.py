@@ -0,0 +1,45 @@
+import vampytest
+
+from ...channel import Channel, ChannelType
+from ...guild import Guild
+from ...role import Role
+
+from ..client import Client
+from ..cache_snapshot import create_cache_snapshot
+
+
+def test__create_cache_snapshot():
+    """
+    Tests whether ``create_cache_snapshot`` works as intended.
+    """
+    client = Client(
+        'token_20261018_0010',
+        client_id = 202610180010,
+    )
+    
+    guild_id = 202610180011
+    channel = Channel.precreate(202610180012, channel_type = ChannelType.guild_text, name = 'koishi')
+    role = Role.precreate(202610180013, name = 'orin')
+    guild = Guild.precreate(guild_id, name = 'satori', channels = [channel], roles = [role])
+    
+    try:
+        guild.clients.append(client)
+        client.guilds.add(guild)
+        
+        output = create_cache_snapshot(client)
+        vampytest.assert_instance(output, dict)
+        vampytest.assert_eq({*output.keys()}, {'guilds', 'private_channels'})
+        
+        guild_datas = output['guilds']
+        vampytest.assert_eq(len(guild_datas), 1)
+        
+        guild_data = guild_datas[0]
+        vampytest.assert_eq(guild_data, guild.to_data(include_internals = True))
+        vampytest.assert_eq(guild_data['id'], str(guild_id))
+    
+        vampytest.assert_eq(output['private_channels'], [])
+    
+    finally:
+        guild.clients.clear()
+        client._delete()
+        client = None
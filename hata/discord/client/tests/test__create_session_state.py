@@ -0,0 +1,64 @@
+import vampytest
+
+from ...guild import Guild
+
+from ..client import Client
+from ..session_state import create_session_state
+
+from .helpers_session_store import TestSessionStore
+
+
+def _iter_options():
+    yield False, False
+    yield True, True
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__create_session_state(cache_snapshot):
+    """
+    Tests whether ``create_session_state`` works as intended.
+    
+    Parameters
+    ----------
+    cache_snapshot : `bool`
+        Whether the session store asks for cache snapshot.
+    
+    Returns
+    -------
+    has_cache_snapshot : `bool`
+    """
+    client = Client(
+        'token_20261018_0030',
+        client_id = 202610180030,
+        shard_count = 4,
+        shard_ids = [1, 2],
+    )
+    
+    guild = Guild.precreate(202610180031, name = 'satori')
+    
+    session = {
+        'session_id': 'okuu',
+        'resume_gateway_url': 'wss://koishi.nyan/',
+        'sequence': 12,
+    }
+    
+    try:
+        guild.clients.append(client)
+        client.guilds.add(guild)
+        
+        client.gateway.get_gateway_of_shard(2).set_session(session)
+        
+        output = create_session_state(client, TestSessionStore(cache_snapshot = cache_snapshot))
+        vampytest.assert_instance(output, tuple)
+        vampytest.assert_eq(len(output), 2)
+        
+        sessions, output_cache_snapshot = output
+        vampytest.assert_eq(sessions, [(2, session)])
+        
+        vampytest.assert_instance(output_cache_snapshot, dict, nullable = True)
+        return output_cache_snapshot is not None
+    
+    finally:
+        guild.clients.clear()
+        client._delete()
+        client = None
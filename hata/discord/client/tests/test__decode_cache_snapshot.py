@@ -0,0 +1,43 @@
+from zlib import compress as zlib_compress
+
+import vampytest
+
+from ...gateway.encodings import GatewayEncoding__etf
+
+from ..cache_snapshot import CACHE_SNAPSHOT_HEADER, decode_cache_snapshot
+
+
+def _iter_options__passing():
+    cache_snapshot = {'guilds': [{'id': '202610180060', 'name': 'satori'}]}
+    yield CACHE_SNAPSHOT_HEADER + zlib_compress(GatewayEncoding__etf.encode(cache_snapshot)), cache_snapshot
+
+
+def _iter_options__value_error():
+    yield b''
+    yield b'HCS\x00' + zlib_compress(GatewayEncoding__etf.encode({}))
+    yield CACHE_SNAPSHOT_HEADER + b'mister'
+    yield CACHE_SNAPSHOT_HEADER + zlib_compress(GatewayEncoding__etf.encode([]))
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+@vampytest._(vampytest.call_from(_iter_options__value_error()).raising(ValueError))
+def test__decode_cache_snapshot(input_value):
+    """
+    Tests whether ``decode_cache_snapshot`` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `bytes`
+        Value to decode.
+    
+    Returns
+    -------
+    output : `dict<str, object>`
+    
+    Raises
+    ------
+    ValueError
+    """
+    output = decode_cache_snapshot(input_value)
+    vampytest.assert_instance(output, dict)
+    return output
@@ -0,0 +1,27 @@
+import vampytest
+
+from ..cache_snapshot import CACHE_SNAPSHOT_HEADER, decode_cache_snapshot, encode_cache_snapshot
+
+
+def test__encode_cache_snapshot():
+    """
+    Tests whether ``encode_cache_snapshot`` works as intended.
+    """
+    cache_snapshot = {
+        'guilds': [
+            {
+                'id': '202610180050',
+                'name': 'satori',
+                'roles': [{'id': '202610180051', 'name': 'orin', 'position': 1}],
+                'widget_enabled': False,
+                'description': None,
+            },
+        ],
+        'private_channels': [],
+    }
+    
+    output = encode_cache_snapshot(cache_snapshot)
+    vampytest.assert_instance(output, bytes)
+    vampytest.assert_true(output.startswith(CACHE_SNAPSHOT_HEADER))
+    
+    vampytest.assert_eq(decode_cache_snapshot(output), cache_snapshot)
@@ -0,0 +1,51 @@
+import vampytest
+
+from ..client import Client
+from ..ready_state import ensure_lazy_user_request
+
+
+async def test__ensure_lazy_user_request():
+    """
+    Tests whether ``ensure_lazy_user_request`` works as intended.
+    
+    This function is a coroutine.
+    """
+    guild_id = 202610180150
+    requested = []
+    
+    async def mock_request_users(guild_id):
+        nonlocal requested
+        requested.append(guild_id)
+    
+    client_0 = Client(
+        'token_20261018_0151',
+        client_id = 202610180151,
+    )
+    
+    client_1 = Client(
+        'token_20261018_0152',
+        client_id = 202610180152,
+    )
+    
+    try:
+        client_0._request_users = mock_request_users
+        client_1._request_users = mock_request_users
+        client_0._lazy_user_requests[guild_id] = None
+        
+        # The deferred requests are per client.
+        await ensure_lazy_user_request(client_1, guild_id)
+        vampytest.assert_eq(requested, [])
+        
+        await ensure_lazy_user_request(client_0, guild_id)
+        vampytest.assert_eq(requested, [guild_id])
+        vampytest.assert_eq(client_0._lazy_user_requests, {})
+        
+        # Already requested.
+        await ensure_lazy_user_request(client_0, guild_id)
+        vampytest.assert_eq(requested, [guild_id])
+    
+    finally:
+        client_0._delete()
+        client_0 = None
+        client_1._delete()
+        client_1 = None
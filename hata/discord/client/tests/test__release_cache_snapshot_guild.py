@@ -0,0 +1,83 @@
+import vampytest
+
+from ...core import USERS
+
+from ..client import Client
+from ..cache_snapshot import release_cache_snapshot_guild, restore_cache_snapshot
+
+
+def test__release_cache_snapshot_guild():
+    """
+    Tests whether ``release_cache_snapshot_guild`` works as intended.
+    """
+    client = Client(
+        'token_20261018_0060',
+        client_id = 202610180060,
+    )
+    
+    guild_id = 202610180061
+    user_id = 202610180062
+    
+    cache_snapshot = {
+        'guilds': [
+            {
+                'id': str(guild_id),
+                'name': 'satori',
+                'members': [
+                    {'user': {'id': str(user_id), 'username': 'koishi'}, 'nick': 'okuu'},
+                ],
+            },
+        ],
+    }
+    
+    try:
+        client._cache_snapshot_guilds = restore_cache_snapshot(client, cache_snapshot, set())
+        
+        user = USERS.get(user_id, None)
+        vampytest.assert_is_not(user, None)
+        vampytest.assert_in(guild_id, user.guild_profiles)
+        
+        guild = client._cache_snapshot_guilds[guild_id]
+        vampytest.assert_in(user_id, guild.users)
+        
+        release_cache_snapshot_guild(client, guild_id)
+        
+        # The restored members are dropped, so only the ones received again are kept.
+        vampytest.assert_is(client._cache_snapshot_guilds, None)
+        vampytest.assert_eq(guild.users, {})
+        vampytest.assert_not_in(guild_id, user.guild_profiles)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def test__release_cache_snapshot_guild__not_restored():
+    """
+    Tests whether ``release_cache_snapshot_guild`` works as intended.
+    
+    Case: guild not restored from snapshot.
+    """
+    client = Client(
+        'token_20261018_0063',
+        client_id = 202610180063,
+    )
+    
+    guild_id_0 = 202610180064
+    guild_id_1 = 202610180065
+    
+    cache_snapshot = {
+        'guilds': [
+            {'id': str(guild_id_0), 'name': 'satori'},
+        ],
+    }
+    
+    try:
+        client._cache_snapshot_guilds = restore_cache_snapshot(client, cache_snapshot, set())
+        
+        release_cache_snapshot_guild(client, guild_id_1)
+        vampytest.assert_eq([*client._cache_snapshot_guilds.keys()], [guild_id_0])
+    
+    finally:
+        client._delete()
+        client = None
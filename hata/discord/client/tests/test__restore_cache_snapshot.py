@@ -0,0 +1,60 @@
+import vampytest
+
+from ...core import GUILDS
+from ...guild import Guild
+
+from ..client import Client
+from ..cache_snapshot import restore_cache_snapshot
+
+
+def test__restore_cache_snapshot():
+    """
+    Tests whether ``restore_cache_snapshot`` works as intended.
+    """
+    client = Client(
+        'token_20261018_0020',
+        client_id = 202610180020,
+        shard_count = 2,
+    )
+    
+    # Guild identifiers on shard 0 and 1
+    guild_id_0 = 202610180020 << 22
+    guild_id_1 = 202610180021 << 22
+    
+    cache_snapshot = {
+        'guilds': [
+            {
+                'id': str(guild_id_0),
+                'name': 'satori',
+                'channels': [
+                    {'id': '202610180023', 'name': 'koishi', 'type': 0},
+                ],
+            },
+            {
+                'id': str(guild_id_1),
+                'name': 'orin',
+            },
+        ],
+    }
+    
+    try:
+        output = restore_cache_snapshot(client, cache_snapshot, {0})
+        
+        guild = GUILDS.get(guild_id_0, None)
+        vampytest.assert_instance(guild, Guild)
+        vampytest.assert_eq(guild.name, 'satori')
+        vampytest.assert_eq([*guild.channels.keys()], [202610180023])
+        vampytest.assert_in(client, guild.clients)
+        vampytest.assert_eq(client.guilds, {guild})
+        
+        # Guilds of the not resuming shards are only warmed up.
+        vampytest.assert_instance(output, dict)
+        vampytest.assert_eq([*output.keys()], [guild_id_1])
+        warm_guild = output[guild_id_1]
+        vampytest.assert_is(GUILDS.get(guild_id_1, None), warm_guild)
+        vampytest.assert_eq(warm_guild.name, 'orin')
+        vampytest.assert_eq(warm_guild.clients, [])
+    
+    finally:
+        client._delete()
+        client = None
@@ -0,0 +1,103 @@
+import vampytest
+
+from ...core import GUILDS
+
+from ..client import Client
+from ..cache_snapshot import encode_cache_snapshot
+from ..session_state import restore_session_state
+
+from .helpers_session_store import TestSessionStore
+
+
+async def test__restore_session_state():
+    """
+    Tests whether ``restore_session_state`` works as intended.
+    
+    This function is a coroutine.
+    """
+    client = Client(
+        'token_20261018_0040',
+        client_id = 202610180040,
+        shard_count = 2,
+    )
+    
+    session = {
+        'session_id': 'okuu',
+        'resume_gateway_url': 'wss://koishi.nyan/',
+        'sequence': 12,
+    }
+    
+    # Guild identifiers on shard 0 and 1
+    guild_id_0 = 202610180040 << 22
+    guild_id_1 = 202610180041 << 22
+    
+    session_store = TestSessionStore(cache_snapshot = True)
+    session_store.stored_sessions[1] = session
+    session_store.stored_cache_snapshot = encode_cache_snapshot({
+        'guilds': [
+            {'id': str(guild_id_0), 'name': 'satori'},
+            {'id': str(guild_id_1), 'name': 'orin'},
+        ],
+    })
+    
+    try:
+        output = await restore_session_state(client, session_store)
+        vampytest.assert_is(output, None)
+        
+        vampytest.assert_is(client.gateway.get_gateway_of_shard(0).get_session(), None)
+        vampytest.assert_eq(client.gateway.get_gateway_of_shard(1).get_session(), session)
+        
+        # Only the guilds of the resuming shards are added to the client, the rest are kept alive till ready.
+        guild = GUILDS.get(guild_id_1, None)
+        vampytest.assert_is_not(guild, None)
+        vampytest.assert_eq(client.guilds, {guild})
+        
+        warm_guild = GUILDS.get(guild_id_0, None)
+        vampytest.assert_is_not(warm_guild, None)
+        vampytest.assert_eq(client._cache_snapshot_guilds, {warm_guild.id: warm_guild})
+        
+        # The store is consumed.
+        vampytest.assert_eq(session_store.stored_sessions, {})
+        vampytest.assert_is(session_store.stored_cache_snapshot, None)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__restore_session_state__no_sessions():
+    """
+    Tests whether ``restore_session_state`` works as intended.
+    
+    Case: no sessions stored.
+    
+    This function is a coroutine.
+    """
+    client = Client(
+        'token_20261018_0043',
+        client_id = 202610180043,
+    )
+    
+    guild_id = 202610180044
+    
+    session_store = TestSessionStore(cache_snapshot = True)
+    session_store.stored_cache_snapshot = encode_cache_snapshot({
+        'guilds': [
+            {'id': str(guild_id), 'name': 'satori'},
+        ],
+    })
+    
+    try:
+        await restore_session_state(client, session_store)
+        
+        vampytest.assert_is(client.gateway.get_session(), None)
+        
+        warm_guild = GUILDS.get(guild_id, None)
+        vampytest.assert_is_not(warm_guild, None)
+        vampytest.assert_eq(warm_guild.clients, [])
+        vampytest.assert_eq(client.guilds, set())
+        vampytest.assert_eq(client._cache_snapshot_guilds, {warm_guild.id: warm_guild})
+    
+    finally:
+        client._delete()
+        client = None
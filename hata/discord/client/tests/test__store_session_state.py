@@ -0,0 +1,34 @@
+import vampytest
+
+from ..cache_snapshot import decode_cache_snapshot
+from ..session_state import store_session_state
+
+from .helpers_session_store import TestSessionStore
+
+
+async def test__store_session_state():
+    """
+    Tests whether ``store_session_state`` works as intended.
+    
+    This function is a coroutine.
+    """
+    session_0 = {
+        'session_id': 'okuu',
+        'resume_gateway_url': 'wss://koishi.nyan/',
+        'sequence': 12,
+    }
+    session_1 = {
+        'session_id': 'orin',
+        'resume_gateway_url': None,
+        'sequence': 56,
+    }
+    cache_snapshot = {'guilds': []}
+    
+    session_store = TestSessionStore(cache_snapshot = True)
+    
+    output = await store_session_state(session_store, [(1, session_0), (3, session_1)], cache_snapshot)
+    vampytest.assert_is(output, None)
+    
+    vampytest.assert_eq(session_store.stored_sessions, {1: session_0, 3: session_1})
+    vampytest.assert_instance(session_store.stored_cache_snapshot, bytes)
+    vampytest.assert_eq(decode_cache_snapshot(session_store.stored_cache_snapshot), cache_snapshot)
@@ -0,0 +1,49 @@
+import vampytest
+
+from ..cache_policy import CachePolicy
+from ..fields import validate_cache_policy
+
+
+def _iter_options__passing():
+    cache_policy = CachePolicy(guild_user_limit = 1000)
+    yield cache_policy, cache_policy
+
+
+def _iter_options__type_error():
+    yield 12.6
+    yield CachePolicy
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+@vampytest._(vampytest.call_from(_iter_options__type_error()).raising(TypeError))
+def test__validate_cache_policy(input_value):
+    """
+    Tests whether `validate_cache_policy` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Value to validate.
+    
+    Returns
+    -------
+    output : ``CachePolicy``
+    
+    Raises
+    ------
+    TypeError
+    """
+    output = validate_cache_policy(input_value)
+    vampytest.assert_instance(output, CachePolicy)
+    return output
+
+
+def test__validate_cache_policy__none():
+    """
+    Tests whether `validate_cache_policy` works as intended.
+    
+    Case: `None`.
+    """
+    output = validate_cache_policy(None)
+    vampytest.assert_instance(output, CachePolicy)
+    vampytest.assert_eq(output, CachePolicy())
@@ -0,0 +1,49 @@
+import vampytest
+
+from ...gateway.encodings import GatewayEncodingBase, GatewayEncoding__etf, GatewayEncoding__json
+
+from ..fields import validate_gateway_encoding
+
+
+def _iter_options__passing():
+    yield 'json', GatewayEncoding__json
+    yield 'etf', GatewayEncoding__etf
+    yield GatewayEncoding__json, GatewayEncoding__json
+    yield GatewayEncoding__etf, GatewayEncoding__etf
+
+
+def _iter_options__type_error():
+    yield None
+    yield 12.6
+    yield object
+
+
+def _iter_options__value_error():
+    yield 'xml'
+    yield GatewayEncodingBase
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+@vampytest._(vampytest.call_from(_iter_options__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__value_error()).raising(ValueError))
+def test__validate_gateway_encoding(input_value):
+    """
+    Tests whether `validate_gateway_encoding` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Value to validate.
+    
+    Returns
+    -------
+    output : ``type<GatewayEncodingBase>``
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    output = validate_gateway_encoding(input_value)
+    vampytest.assert_subtype(output, GatewayEncodingBase)
+    return output
@@ -0,0 +1,59 @@
+import vampytest
+
+from ...gateway.transport_compressions import (
+    TransportCompressionBase, TransportCompression__none, TransportCompression__zlib_stream,
+    TransportCompression__zstd_stream
+)
+
+from ..fields import validate_gateway_transport_compression
+
+
+def _iter_options__passing():
+    yield None, TransportCompression__none
+    yield 'none', TransportCompression__none
+    yield 'zlib-stream', TransportCompression__zlib_stream
+    yield TransportCompression__zlib_stream, TransportCompression__zlib_stream
+    
+    if TransportCompression__zstd_stream.available:
+        yield 'zstd-stream', TransportCompression__zstd_stream
+        yield TransportCompression__zstd_stream, TransportCompression__zstd_stream
+
+
+def _iter_options__type_error():
+    yield 12.6
+    yield TransportCompressionBase.__new__
+    yield object
+
+
+def _iter_options__value_error():
+    yield 'deflate'
+    yield TransportCompressionBase
+    
+    if not TransportCompression__zstd_stream.available:
+        yield 'zstd-stream'
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+@vampytest._(vampytest.call_from(_iter_options__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__value_error()).raising(ValueError))
+def test__validate_gateway_transport_compression(input_value):
+    """
+    Tests whether `validate_gateway_transport_compression` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Value to validate.
+    
+    Returns
+    -------
+    output : ``type<TransportCompressionBase>``
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    output = validate_gateway_transport_compression(input_value)
+    vampytest.assert_subtype(output, TransportCompressionBase)
+    return output
@@ -0,0 +1,52 @@
+import vampytest
+
+from ...gateway.identify_coordinators import IdentifyCoordinatorBase, IdentifyCoordinatorLocal
+
+from ..fields import validate_identify_coordinator
+
+
+def test__validate_identify_coordinator__none():
+    """
+    Tests whether `validate_identify_coordinator` works as intended.
+    
+    Case: `None`.
+    """
+    output = validate_identify_coordinator(None)
+    vampytest.assert_instance(output, IdentifyCoordinatorLocal)
+
+
+def _iter_options__passing():
+    identify_coordinator = IdentifyCoordinatorLocal()
+    yield identify_coordinator, identify_coordinator
+    
+    identify_coordinator = IdentifyCoordinatorBase()
+    yield identify_coordinator, identify_coordinator
+
+
+def _iter_options__type_error():
+    yield 12.6
+    yield IdentifyCoordinatorLocal
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+@vampytest._(vampytest.call_from(_iter_options__type_error()).raising(TypeError))
+def test__validate_identify_coordinator(input_value):
+    """
+    Tests whether `validate_identify_coordinator` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Value to validate.
+    
+    Returns
+    -------
+    output : ``IdentifyCoordinatorBase``
+    
+    Raises
+    ------
+    TypeError
+    """
+    output = validate_identify_coordinator(input_value)
+    vampytest.assert_instance(output, IdentifyCoordinatorBase)
+    return output
@@ -0,0 +1,44 @@
+import vampytest
+
+from ...gateway.session_stores import SessionStoreBase, SessionStoreFile
+
+from ..fields import validate_session_store
+
+
+def _iter_options__passing():
+    yield None, None
+    
+    session_store = SessionStoreBase()
+    yield session_store, session_store
+    
+    session_store = SessionStoreFile('/tmp/sessions')
+    yield session_store, session_store
+
+
+def _iter_options__type_error():
+    yield 12.6
+    yield SessionStoreFile
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+@vampytest._(vampytest.call_from(_iter_options__type_error()).raising(TypeError))
+def test__validate_session_store(input_value):
+    """
+    Tests whether `validate_session_store` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Value to validate.
+    
+    Returns
+    -------
+    output : ``None | SessionStoreBase``
+    
+    Raises
+    ------
+    TypeError
+    """
+    output = validate_session_store(input_value)
+    vampytest.assert_instance(output, SessionStoreBase, nullable = True)
+    return output
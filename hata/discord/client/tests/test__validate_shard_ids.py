@@ -0,0 +1,47 @@
+import vampytest
+
+from ..fields import validate_shard_ids
+
+
+def _iter_options__passing():
+    yield None, None
+    yield [], None
+    yield [2], (2,)
+    yield [3, 1, 3], (1, 3)
+    yield range(2, 4), (2, 3)
+
+
+def _iter_options__type_error():
+    yield 12.6
+    yield 2
+    yield [12.6]
+
+
+def _iter_options__value_error():
+    yield [-1]
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+@vampytest._(vampytest.call_from(_iter_options__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__value_error()).raising(ValueError))
+def test__validate_shard_ids(input_value):
+    """
+    Tests whether `validate_shard_ids` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Value to validate.
+    
+    Returns
+    -------
+    output : `None | tuple<int>`
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    output = validate_shard_ids(input_value)
+    vampytest.assert_instance(output, tuple, nullable = True)
+    return output
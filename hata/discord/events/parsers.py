@@ -4,7 +4,7 @@ from datetime import datetime as DateTime, timezone as TimeZone
 
 from scarletio import Task, include
 
-from ...env import CACHE_PRESENCE, CACHE_USER
+from ...env import CACHE_PRESENCE, CACHE_USER, PRESENCE_FAST_PATH
 
 from ..application import Entitlement, Subscription
 from ..application.entitlement.fields import parse_id as parse_entitlement_id
@@ -38,6 +38,10 @@ from ..guild.guild.constants import (
     STICKER_EVENT_UPDATE, VOICE_STATE_EVENT_JOIN, VOICE_STATE_EVENT_LEAVE, VOICE_STATE_EVENT_MOVE,
     VOICE_STATE_EVENT_UPDATE
 )
+from ..http.response_cache import (
+    RESPONSE_CACHE_GROUPS_GUILD, RESPONSE_CACHE_GROUPS_GUILD_ALL, RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS,
+    RESPONSE_CACHE_GROUPS_GUILD_ROLES
+)
 from ..integration import Integration
 from ..interaction import InteractionEvent
 from ..invite import Invite, create_partial_invite_from_data
@@ -55,8 +59,8 @@ from ..soundboard import SoundboardSound, SoundboardSoundsEvent, create_partial_
 from ..soundboard.soundboard_sound.fields import parse_guild_id as parse_soundboard_guild_id
 from ..stage import Stage
 from ..user import (
-    User, create_partial_user_from_id, thread_user_create, thread_user_delete, thread_user_difference_update,
-    thread_user_pop
+    PRESENCE_CACHE, User, create_partial_user_from_id, thread_user_create, thread_user_delete,
+    thread_user_difference_update, thread_user_pop
 )
 from ..user.voice_state.fields import parse_user as parse_voice_state_user
 from ..utils import Gift, Relationship
@@ -74,6 +78,7 @@ from .intent import (
     INTENT_MASK_GUILD_POLLS, INTENT_MASK_GUILD_PRESENCES, INTENT_MASK_GUILD_REACTIONS, INTENT_MASK_GUILD_USERS,
     INTENT_MASK_GUILD_VOICE_STATES, INTENT_SHIFT_GUILD_USERS
 )
+from .response_cache_invalidation import invalidate_channel_responses, invalidate_responses
 
 
 Client = include('Client')
@@ -145,6 +150,8 @@ add_parser(
 del READY
 
 def RESUMED(client, data):
+    # If the session was restored from a session store, we do not receive `READY`.
+    maybe_ensure_launch(client)
     return ...
 
 add_parser(
@@ -901,6 +908,14 @@ del (
 
 
 if CACHE_PRESENCE:
+    if PRESENCE_FAST_PATH:
+        # Presence updates with the same data as the last one are skipped.
+        update_user_presence = PRESENCE_CACHE.update_presence
+        difference_update_user_presence = PRESENCE_CACHE.difference_update_presence
+    else:
+        update_user_presence = User._update_presence
+        difference_update_user_presence = User._difference_update_presence
+    
     def PRESENCE_UPDATE__CAL_SC(client, data):
         user_data = data['user']
         user_id = int(user_data.pop('id'))
@@ -916,7 +931,7 @@ if CACHE_PRESENCE:
                     presence = False
                     break
             
-            old_attributes = user._difference_update_presence(data)
+            old_attributes = difference_update_user_presence(user, data)
             if old_attributes:
                 presence = True
                 break
@@ -924,6 +939,7 @@ if CACHE_PRESENCE:
             return
         
         if presence:
+            client.cache_policy.touch_presence(user)
             event_handler = client.events.user_presence_update
         else:
             event_handler = client.events.user_update
@@ -945,13 +961,16 @@ if CACHE_PRESENCE:
                     presence = False
                     break
             
-            old_attributes = user._difference_update_presence(data)
+            old_attributes = difference_update_user_presence(user, data)
             if old_attributes:
                 presence = True
                 break
             
             return
         
+        if presence:
+            client.cache_policy.touch_presence(user)
+        
         for client_ in CLIENTS.values():
             if client_.intents & INTENT_MASK_GUILD_PRESENCES:
                 if presence:
@@ -974,7 +993,8 @@ if CACHE_PRESENCE:
         if user_data:
             user._update_attributes(user_data)
         
-        user._update_presence(data)
+        update_user_presence(user, data)
+        client.cache_policy.touch_presence(user)
 
 else:
     def PRESENCE_UPDATE__CAL_SC(client, data):
@@ -1007,6 +1027,7 @@ if CACHE_USER:
             return
         
         user, old_attributes = User._from_data_and_difference_update_profile(data, guild)
+        client.cache_policy.apply_to_guild_user(guild, user)
         
         if (old_attributes is not None) and (not old_attributes):
             return
@@ -1028,6 +1049,7 @@ if CACHE_USER:
             return
         
         user, old_attributes = User._from_data_and_difference_update_profile(data, guild)
+        client.cache_policy.apply_to_guild_user(guild, user)
 
         if (old_attributes is not None) and (not old_attributes):
             clients.close()
@@ -1048,7 +1070,8 @@ if CACHE_USER:
             guild_sync(client, data, 'GUILD_MEMBER_UPDATE')
             return
         
-        User._from_data_and_update_profile(data, guild)
+        user = User._from_data_and_update_profile(data, guild)
+        client.cache_policy.apply_to_guild_user(guild, user)
     
     
     def GUILD_MEMBER_UPDATE__OPT_MC(client, data):
@@ -1062,7 +1085,8 @@ if CACHE_USER:
         if first_client_or_me(guild.clients, INTENT_MASK_GUILD_USERS, client) is not client:
             return
         
-        User._from_data_and_update_profile(data, guild)
+        user = User._from_data_and_update_profile(data, guild)
+        client.cache_policy.apply_to_guild_user(guild, user)
 
 else:
     def GUILD_MEMBER_UPDATE__CAL_SC(client, data):
@@ -1122,6 +1146,8 @@ del (
 
 
 def CHANNEL_DELETE__CAL_SC(client, data):
+    invalidate_channel_responses(client, data)
+    
     channel_id = int(data['id'])
     try:
         channel = CHANNELS[channel_id]
@@ -1135,6 +1161,8 @@ def CHANNEL_DELETE__CAL_SC(client, data):
 
 
 def CHANNEL_DELETE__CAL_MC(client, data):
+    invalidate_channel_responses(client, data)
+    
     channel_id = int(data['id'])
     try:
         channel = CHANNELS[channel_id]
@@ -1158,6 +1186,8 @@ def CHANNEL_DELETE__CAL_MC(client, data):
 
 
 def CHANNEL_DELETE__OPT(client, data):
+    invalidate_channel_responses(client, data)
+    
     channel_id = int(data['id'])
     try:
         channel = CHANNELS[channel_id]
@@ -1183,6 +1213,8 @@ del (
 
 
 def CHANNEL_UPDATE__CAL_SC(client, data):
+    invalidate_channel_responses(client, data)
+    
     channel_id = int(data['id'])
     try:
         channel = CHANNELS[channel_id]
@@ -1197,6 +1229,8 @@ def CHANNEL_UPDATE__CAL_SC(client, data):
     Task(KOKORO, client.events.channel_update(client, channel, old_attributes))
 
 def CHANNEL_UPDATE__CAL_MC(client, data):
+    invalidate_channel_responses(client, data)
+    
     channel_id = int(data['id'])
     try:
         channel = CHANNELS[channel_id]
@@ -1221,6 +1255,8 @@ def CHANNEL_UPDATE__CAL_MC(client, data):
 
 
 def CHANNEL_UPDATE__OPT_SC(client, data):
+    invalidate_channel_responses(client, data)
+    
     channel_id = int(data['id'])
     try:
         channel = CHANNELS[channel_id]
@@ -1231,6 +1267,8 @@ def CHANNEL_UPDATE__OPT_SC(client, data):
     channel._update_attributes(data)
 
 def CHANNEL_UPDATE__OPT_MC(client, data):
+    invalidate_channel_responses(client, data)
+    
     channel_id = int(data['id'])
     try:
         channel = CHANNELS[channel_id]
@@ -1457,6 +1495,8 @@ del (
 
 
 def CHANNEL_CREATE__CAL(client, data):
+    invalidate_channel_responses(client, data)
+    
     guild_id = data.get('guild_id', None)
     if guild_id is None:
         Channel.from_data(data, client, 0)
@@ -1468,6 +1508,8 @@ def CHANNEL_CREATE__CAL(client, data):
     Task(KOKORO, client.events.channel_create(client, channel))
 
 def CHANNEL_CREATE__OPT(client, data):
+    invalidate_channel_responses(client, data)
+    
     guild_id = data.get('guild_id', None)
     if guild_id is None:
         guild_id = 0
@@ -1622,6 +1664,7 @@ del (
 
 def GUILD_EMOJIS_UPDATE__CAL_SC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -1629,6 +1672,7 @@ def GUILD_EMOJIS_UPDATE__CAL_SC(client, data):
         return
 
     changes = guild._difference_update_emojis(data['emojis'])
+    client.cache_policy.apply_to_guild_emojis(guild)
     
     if not changes:
         return
@@ -1658,6 +1702,7 @@ def GUILD_EMOJIS_UPDATE__CAL_SC(client, data):
 
 def GUILD_EMOJIS_UPDATE__CAL_MC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -1670,6 +1715,7 @@ def GUILD_EMOJIS_UPDATE__CAL_MC(client, data):
         return
     
     changes = guild._difference_update_emojis(data['emojis'])
+    client.cache_policy.apply_to_guild_emojis(guild)
     
     if not changes:
         clients.close()
@@ -1701,6 +1747,7 @@ def GUILD_EMOJIS_UPDATE__CAL_MC(client, data):
 
 def GUILD_EMOJIS_UPDATE__OPT_SC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -1708,10 +1755,12 @@ def GUILD_EMOJIS_UPDATE__OPT_SC(client, data):
         return
     
     guild._update_emojis(data['emojis'])
+    client.cache_policy.apply_to_guild_emojis(guild)
 
 
 def GUILD_EMOJIS_UPDATE__OPT_MC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -1722,6 +1771,7 @@ def GUILD_EMOJIS_UPDATE__OPT_MC(client, data):
         return
     
     guild._update_emojis(data['emojis'])
+    client.cache_policy.apply_to_guild_emojis(guild)
 
 
 add_parser(
@@ -1741,6 +1791,7 @@ del (
 
 def GUILD_STICKERS_UPDATE__CAL_SC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -1748,6 +1799,7 @@ def GUILD_STICKERS_UPDATE__CAL_SC(client, data):
         return
 
     changes = guild._difference_update_stickers(data['stickers'])
+    client.cache_policy.apply_to_guild_stickers(guild)
     
     if not changes:
         return
@@ -1775,6 +1827,7 @@ def GUILD_STICKERS_UPDATE__CAL_SC(client, data):
 
 def GUILD_STICKERS_UPDATE__CAL_MC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -1787,6 +1840,7 @@ def GUILD_STICKERS_UPDATE__CAL_MC(client, data):
         return
     
     changes = guild._difference_update_stickers(data['stickers'])
+    client.cache_policy.apply_to_guild_stickers(guild)
     
     if not changes:
         clients.close()
@@ -1817,6 +1871,7 @@ def GUILD_STICKERS_UPDATE__CAL_MC(client, data):
 
 def GUILD_STICKERS_UPDATE__OPT_SC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -1824,10 +1879,12 @@ def GUILD_STICKERS_UPDATE__OPT_SC(client, data):
         return
     
     guild._update_stickers(data['stickers'])
+    client.cache_policy.apply_to_guild_stickers(guild)
 
 
 def GUILD_STICKERS_UPDATE__OPT_MC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -1838,6 +1895,7 @@ def GUILD_STICKERS_UPDATE__OPT_MC(client, data):
         return
     
     guild._update_stickers(data['stickers'])
+    client.cache_policy.apply_to_guild_stickers(guild)
 
 
 add_parser(
@@ -1864,6 +1922,7 @@ def GUILD_MEMBER_ADD__CAL_SC(client, data):
     
     user = User.from_data(data['user'], data, guild_id)
     guild.user_count += 1
+    client.cache_policy.apply_to_guild_user(guild, user)
     
     Task(KOKORO, client.events.guild_user_add(client, guild, user))
 
@@ -1884,6 +1943,7 @@ def GUILD_MEMBER_ADD__CAL_MC(client, data):
     
     user = User.from_data(data['user'], data, guild_id)
     guild.user_count += 1
+    client.cache_policy.apply_to_guild_user(guild, user)
     
     if clients is None:
         event_handler = client.events.guild_user_add
@@ -1903,8 +1963,9 @@ if CACHE_USER:
         except KeyError:
             return
         
-        User.from_data(data['user'], data, guild_id)
+        user = User.from_data(data['user'], data, guild_id)
         guild.user_count += 1
+        client.cache_policy.apply_to_guild_user(guild, user)
     
     def GUILD_MEMBER_ADD__OPT_MC(client, data):
         guild_id = int(data['guild_id'])
@@ -1916,8 +1977,9 @@ if CACHE_USER:
         if first_client(guild.clients, INTENT_MASK_GUILD_USERS, client) is not client:
             return
         
-        User.from_data(data['user'], data, guild_id)
+        user = User.from_data(data['user'], data, guild_id)
         guild.user_count += 1
+        client.cache_policy.apply_to_guild_user(guild, user)
 else:
     def GUILD_MEMBER_ADD__OPT_SC(client, data):
         guild_id = int(data['guild_id'])
@@ -2209,11 +2271,17 @@ if CACHE_PRESENCE:
         if guild_state:
             return
         
+        if (client._cache_snapshot_guilds is not None):
+            client._release_cache_snapshot_guild(int(data['id']))
+        
         guild = Guild.from_data(data, client)
         
         ready_state = client.ready_state
         if (ready_state is None) or (not ready_state.feed_guild(client, guild)):
-            if (client.intents & INTENT_SHIFT_GUILD_USERS) and guild.large and client._should_request_users:
+            if (
+                (client.intents & INTENT_SHIFT_GUILD_USERS) and guild.large and client._should_request_users and
+                client.cache_policy.should_cache_guild_users(guild)
+            ):
                 Task(KOKORO, client._request_users(guild.id))
             
             Task(KOKORO, client.events.guild_create(client, guild))
@@ -2224,11 +2292,17 @@ if CACHE_PRESENCE:
         if guild_state:
             return
         
+        if (client._cache_snapshot_guilds is not None):
+            client._release_cache_snapshot_guild(int(data['id']))
+        
         guild = Guild.from_data(data, client)
         
         ready_state = client.ready_state
         if (ready_state is None) or (not ready_state.feed_guild(client, guild)):
-            if (client.intents & INTENT_SHIFT_GUILD_USERS) and guild.large and client._should_request_users:
+            if (
+                (client.intents & INTENT_SHIFT_GUILD_USERS) and guild.large and client._should_request_users and
+                client.cache_policy.should_cache_guild_users(guild)
+            ):
                 Task(KOKORO, client._request_users(guild.id))
 
 elif CACHE_USER:
@@ -2237,11 +2311,17 @@ elif CACHE_USER:
         if guild_state:
             return
         
+        if (client._cache_snapshot_guilds is not None):
+            client._release_cache_snapshot_guild(int(data['id']))
+        
         guild = Guild.from_data(data, client)
         
         ready_state = client.ready_state
         if (ready_state is None) or (not ready_state.feed_guild(client, guild)):
-            if (client.intents & INTENT_SHIFT_GUILD_USERS) and client._should_request_users:
+            if (
+                (client.intents & INTENT_SHIFT_GUILD_USERS) and client._should_request_users and
+                client.cache_policy.should_cache_guild_users(guild)
+            ):
                 Task(KOKORO, client._request_users(guild.id))
             
             Task(KOKORO, client.events.guild_create(client, guild))
@@ -2251,11 +2331,17 @@ elif CACHE_USER:
         if guild_state:
             return
         
+        if (client._cache_snapshot_guilds is not None):
+            client._release_cache_snapshot_guild(int(data['id']))
+        
         guild = Guild.from_data(data, client)
         
         ready_state = client.ready_state
         if (ready_state is None) or (not ready_state.feed_guild(client, guild)):
-            if (client.intents & INTENT_SHIFT_GUILD_USERS) and client._should_request_users:
+            if (
+                (client.intents & INTENT_SHIFT_GUILD_USERS) and client._should_request_users and
+                client.cache_policy.should_cache_guild_users(guild)
+            ):
                 Task(KOKORO, client._request_users(guild.id))
 
 else:
@@ -2264,6 +2350,9 @@ else:
         if guild_state:
             return
         
+        if (client._cache_snapshot_guilds is not None):
+            client._release_cache_snapshot_guild(int(data['id']))
+        
         guild = Guild.from_data(data, client)
         
         ready_state = client.ready_state
@@ -2275,6 +2364,9 @@ else:
         if guild_state:
             return
         
+        if (client._cache_snapshot_guilds is not None):
+            client._release_cache_snapshot_guild(int(data['id']))
+        
         guild = Guild.from_data(data, client)
         
         ready_state = client.ready_state
@@ -2297,6 +2389,7 @@ del (
 
 def GUILD_UPDATE__CAL_SC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -2311,6 +2404,7 @@ def GUILD_UPDATE__CAL_SC(client, data):
 
 def GUILD_UPDATE__CAL_MC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -2334,6 +2428,7 @@ def GUILD_UPDATE__CAL_MC(client, data):
 
 def GUILD_UPDATE__OPT_SC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -2344,6 +2439,7 @@ def GUILD_UPDATE__OPT_SC(client, data):
 
 def GUILD_UPDATE__OPT_MC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -2373,6 +2469,7 @@ del (
 
 def GUILD_DELETE__CAL(client, data):
     guild_id = int(data['id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ALL, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -2381,6 +2478,7 @@ def GUILD_DELETE__CAL(client, data):
     if data.get('unavailable', 2) == 1:
         return
     
+    client._lazy_user_requests.pop(guild_id, None)
     guild_profile = client.guild_profiles.pop(guild, None)
     
     ready_state = client.ready_state
@@ -2393,6 +2491,7 @@ def GUILD_DELETE__CAL(client, data):
 
 def GUILD_DELETE__OPT(client, data):
     guild_id = int(data['id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ALL, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -2401,6 +2500,8 @@ def GUILD_DELETE__OPT(client, data):
     if data.get('unavailable', 2) == 1:
         return
     
+    client._lazy_user_requests.pop(guild_id, None)
+    
     try:
         del client.guild_profiles[guild_id]
     except KeyError:
@@ -2508,6 +2609,12 @@ del (
 def GUILD_MEMBERS_CHUNK(client, data):
     event = GuildUserChunkEvent.from_data(data)
     
+    guild = GUILDS.get(event.guild_id, None)
+    if (guild is not None):
+        cache_policy = client.cache_policy
+        cache_policy.apply_to_guild_users(guild, event.users)
+        cache_policy.touch_presences(event.users)
+    
     Task(KOKORO, client.events.guild_user_chunk(client, event))
 
 
@@ -2642,6 +2749,7 @@ del (
 
 def GUILD_ROLE_CREATE__CAL_SC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ROLES, guild_id)
     
     role = Role.from_data(data['role'], guild_id)
     
@@ -2650,6 +2758,7 @@ def GUILD_ROLE_CREATE__CAL_SC(client, data):
 
 def GUILD_ROLE_CREATE__CAL_MC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ROLES, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -2676,12 +2785,14 @@ def GUILD_ROLE_CREATE__CAL_MC(client, data):
 
 def GUILD_ROLE_CREATE__OPT_SC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ROLES, guild_id)
     
     Role.from_data(data['role'], guild_id)
 
 
 def GUILD_ROLE_CREATE__OPT_MC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ROLES, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -2710,6 +2821,7 @@ del (
 
 def GUILD_ROLE_DELETE__CAL_SC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ROLES, guild_id)
     role_id = int(data['role_id'])
     role = create_partial_role_from_id(role_id, guild_id)
     role._delete()
@@ -2719,6 +2831,7 @@ def GUILD_ROLE_DELETE__CAL_SC(client, data):
 
 def GUILD_ROLE_DELETE__CAL_MC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ROLES, guild_id)
     guild = GUILDS.get(guild_id, None)
     
     if (guild is None):
@@ -2745,6 +2858,8 @@ def GUILD_ROLE_DELETE__CAL_MC(client, data):
 
 
 def GUILD_ROLE_DELETE__OPT_SC(client, data):
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ROLES, int(data['guild_id']))
+    
     role_id = int(data['role_id'])
     try:
         role = ROLES[role_id]
@@ -2756,6 +2871,7 @@ def GUILD_ROLE_DELETE__OPT_SC(client, data):
 
 def GUILD_ROLE_DELETE__OPT_MC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ROLES, guild_id)
     guild = GUILDS.get(guild_id, None)
     
     if (guild is not None) and first_client(guild.clients, INTENT_MASK_GUILDS, client) is not client:
@@ -2787,6 +2903,7 @@ del (
 
 def GUILD_ROLE_UPDATE__CAL_SC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ROLES, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -2809,6 +2926,7 @@ def GUILD_ROLE_UPDATE__CAL_SC(client, data):
 
 def GUILD_ROLE_UPDATE__CAL_MC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ROLES, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -2841,6 +2959,7 @@ def GUILD_ROLE_UPDATE__CAL_MC(client, data):
 
 def GUILD_ROLE_UPDATE__OPT_SC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ROLES, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -2859,6 +2978,7 @@ def GUILD_ROLE_UPDATE__OPT_SC(client, data):
 
 def GUILD_ROLE_UPDATE__OPT_MC(client, data):
     guild_id = int(data['guild_id'])
+    invalidate_responses(client, RESPONSE_CACHE_GROUPS_GUILD_ROLES, guild_id)
     try:
         guild = GUILDS[guild_id]
     except KeyError:
@@ -0,0 +1,43 @@
+__all__ = ()
+
+from ..http.response_cache import RESPONSE_CACHE_GROUPS_CHANNEL, RESPONSE_CACHE_GROUPS_GUILD_CHANNELS
+
+
+def invalidate_responses(client, groups, limiter_id):
+    """
+    Invalidates the client's cached responses of the given rate limit groups with the given limiter identifier.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client, who received the dispatch event.
+    groups : `tuple<RateLimitGroup>`
+        The rate limit groups to invalidate.
+    limiter_id : `int`
+        The limiter's identifier, like a guild's or a channel's.
+    """
+    response_cache = client.api.response_cache
+    if (response_cache is not None):
+        response_cache.invalidate(groups, limiter_id)
+
+
+def invalidate_channel_responses(client, data):
+    """
+    Invalidates the client's cached responses of the channel and of its guild's channels.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client, who received the dispatch event.
+    data : `dict<str, object>`
+        Channel data.
+    """
+    response_cache = client.api.response_cache
+    if (response_cache is None):
+        return
+    
+    response_cache.invalidate(RESPONSE_CACHE_GROUPS_CHANNEL, int(data['id']))
+    
+    guild_id = data.get('guild_id', None)
+    if (guild_id is not None):
+        response_cache.invalidate(RESPONSE_CACHE_GROUPS_GUILD_CHANNELS, int(guild_id))
@@ -0,0 +1,409 @@
+__all__ = ()
+
+from linecache import cache as LINE_CACHE
+from types import FunctionType
+
+from scarletio import RichAttributeErrorBaseType
+
+from .field_parsers import (
+    _field_parser_factory, default_date_time_parser_factory, default_entity_parser_factory,
+    entity_id_array_parser_factory, entity_id_parser_factory, field_parser_factory, flag_parser_factory,
+    force_string_parser_factory, int_postprocess_parser_factory, negated_bool_parser_factory,
+    nullable_entity_array_parser_factory, nullable_flag_parser_factory, nullable_int_parser_factory,
+    nullable_object_array_parser_factory, nullable_string_parser_factory, preinstanced_parser_factory
+)
+from .utils import timestamp_to_datetime
+
+
+# Values of these types are put into the generated source as literals, every other one is passed in the namespace.
+LITERAL_TYPES = {type(None), bool, int, str}
+
+# parser code -> template
+PARSER_TEMPLATES = {}
+
+
+def _register_parser_template(parser, template):
+    """
+    Registers a template to inline the parsers created by the same factory as the given one.
+    
+    Parameters
+    ----------
+    parser : `FunctionType`
+        A parser created by the factory.
+    template : `str`
+        Source template. Sets the parsed value into `value`. The parser's free variables can be referenced by their
+        names within braces.
+    """
+    PARSER_TEMPLATES[parser.__code__] = template
+
+
+_register_parser_template(
+    entity_id_parser_factory(''),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is None):\n'
+        '    value = 0\n'
+        'else:\n'
+        '    value = int(value)\n'
+    ),
+)
+
+_register_parser_template(
+    entity_id_array_parser_factory('', ordered = True),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is None) or (not value):\n'
+        '    value = None\n'
+        'else:\n'
+        '    value = tuple(sorted(int(entity_id) for entity_id in value))\n'
+    ),
+)
+
+_register_parser_template(
+    entity_id_array_parser_factory('', ordered = False),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is None) or (not value):\n'
+        '    value = None\n'
+        'else:\n'
+        '    value = (*(int(entity_id) for entity_id in value),)\n'
+    ),
+)
+
+_register_parser_template(
+    preinstanced_parser_factory('', None, None),
+    (
+        'try:\n'
+        '    value = data[{field_key}]\n'
+        'except KeyError:\n'
+        '    value = {default_value}\n'
+        'else:\n'
+        '    value = {preinstanced_type}(value)\n'
+    ),
+)
+
+# bool, float & int
+_register_parser_template(
+    _field_parser_factory('', None),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is None):\n'
+        '    value = {default_value}\n'
+    ),
+)
+
+_register_parser_template(
+    int_postprocess_parser_factory('', None, None),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is None):\n'
+        '    value = {default_value}\n'
+        'else:\n'
+        '    value = {postprocessor}(value)\n'
+    ),
+)
+
+_register_parser_template(
+    flag_parser_factory('', int),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is None):\n'
+        '    value = {default_value}\n'
+        'else:\n'
+        '    value = {flag_type}(value)\n'
+    ),
+)
+
+_register_parser_template(
+    nullable_flag_parser_factory('', int),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is not None):\n'
+        '    value = {flag_type}(value)\n'
+    ),
+)
+
+_register_parser_template(
+    negated_bool_parser_factory('', None),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if value is None:\n'
+        '    value = {default_value}\n'
+        'else:\n'
+        '    value = not value\n'
+    ),
+)
+
+# nullable date time too
+_register_parser_template(
+    default_date_time_parser_factory('', None),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is None):\n'
+        '    value = {default}\n'
+        'else:\n'
+        '    value = timestamp_to_datetime(value)\n'
+    ),
+)
+
+_register_parser_template(
+    force_string_parser_factory(''),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is None):\n'
+        '    value = \'\'\n'
+    ),
+)
+
+_register_parser_template(
+    field_parser_factory(''),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is not None) and isinstance(value, str) and (not value):\n'
+        '    value = None\n'
+    ),
+)
+
+_register_parser_template(
+    nullable_string_parser_factory(''),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is not None) and (not value):\n'
+        '    value = None\n'
+    ),
+)
+
+_register_parser_template(
+    nullable_int_parser_factory(''),
+    (
+        'value = data.get({field_key}, None)\n'
+    ),
+)
+
+# nullable entity too
+_register_parser_template(
+    default_entity_parser_factory('', None, default = None),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if value is None:\n'
+        '    value = {default}\n'
+        'else:\n'
+        '    value = {entity_type}.from_data(value)\n'
+    ),
+)
+
+_register_parser_template(
+    nullable_entity_array_parser_factory('', None),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is None) or (not value):\n'
+        '    value = None\n'
+        'else:\n'
+        '    value = tuple(sorted({entity_type}.from_data(entity_data) for entity_data in value))\n'
+    ),
+)
+
+_register_parser_template(
+    nullable_object_array_parser_factory('', None),
+    (
+        'value = data.get({field_key}, None)\n'
+        'if (value is None) or (not value):\n'
+        '    value = None\n'
+        'else:\n'
+        '    value = (*({object_type}.from_data(object_data) for object_data in value),)\n'
+    ),
+)
+
+
+def _get_parser_source(parser, parser_index, namespace):
+    """
+    Returns the source setting the parsed value into `value`.
+    
+    Parameters
+    ----------
+    parser : `FunctionType`
+        The parser to inline.
+    parser_index : `int`
+        The parser's index used to generate unique names.
+    namespace : `dict<str, object>`
+        Namespace of the generated function to extend.
+    
+    Returns
+    -------
+    source : `str`
+    """
+    code = getattr(parser, '__code__', None)
+    template = PARSER_TEMPLATES.get(code, None)
+    if template is None:
+        # Not created by a known factory, call it instead.
+        name = f'parser_{parser_index}'
+        namespace[name] = parser
+        return f'value = {name}(data)\n'
+    
+    # Read the free variables now, so values `include`-d after the parser's creation are used.
+    expressions = {}
+    for variable_name, cell in zip(code.co_freevars, parser.__closure__):
+        value = cell.cell_contents
+        if type(value) in LITERAL_TYPES:
+            expression = repr(value)
+        else:
+            expression = f'{variable_name}_{parser_index}'
+            namespace[expression] = value
+        
+        expressions[variable_name] = expression
+    
+    return template.format_map(expressions)
+
+
+def compile_field_setter(name, attribute_parsers):
+    """
+    Compiles a function that parses out every given field of a payload and sets them to an entity.
+    
+    Parameters
+    ----------
+    name : `str`
+        The generated function's name.
+    attribute_parsers : `tuple<(str, FunctionType)>`
+        Attribute name - parser pairs.
+    
+    Returns
+    -------
+    function : `(object, dict<str, object>) -> None`
+    """
+    namespace = {'timestamp_to_datetime': timestamp_to_datetime}
+    body_parts = []
+    
+    for parser_index, (attribute_name, parser) in enumerate(attribute_parsers):
+        body_parts.append(f'    # {attribute_name}\n')
+        
+        for line in _get_parser_source(parser, parser_index, namespace).splitlines(True):
+            body_parts.append('    ')
+            body_parts.append(line)
+        
+        body_parts.append(f'    entity.{attribute_name} = value\n')
+        body_parts.append('    \n')
+    
+    if not attribute_parsers:
+        body_parts.append('    pass\n')
+    
+    # The namespace's values are bound as keyword only parameters, so they are accessed as local variables.
+    source_parts = [f'def {name}(entity, data, *']
+    for variable_name in namespace.keys():
+        source_parts.append(f', {variable_name} = {variable_name}')
+    source_parts.append('):\n')
+    source_parts.extend(body_parts)
+    
+    source = ''.join(source_parts)
+    
+    # Register the source, so tracebacks show the generated lines.
+    file_name = f'<generated field setter {name} {id(namespace):x}>'
+    LINE_CACHE[file_name] = (len(source), None, source.splitlines(True), file_name)
+    
+    exec(compile(source, file_name, 'exec'), namespace)
+    return namespace[name]
+
+
+class FieldSetter(RichAttributeErrorBaseType):
+    """
+    Parses out fields of a payload and sets them to an entity with one generated function instead of calling every
+    field's parser one after the other.
+    
+    The function is compiled on first call, so types `include`-d into the parsers are already resolved.
+    
+    Attributes
+    ----------
+    attribute_parsers : `tuple<(str, FunctionType)>`
+        Attribute name - parser pairs.
+    function : `(object, dict<str, object>) -> None`
+        The generated function. Till the first call it is a method compiling it.
+        Call this instead of the field setter itself on hot paths.
+    name : `str`
+        The field setter's name.
+    """
+    __slots__ = ('attribute_parsers', 'function', 'name')
+    
+    def __new__(cls, name, attribute_parsers):
+        """
+        Creates a new field setter.
+        
+        Parameters
+        ----------
+        name : `str`
+            The field setter's name.
+        attribute_parsers : `tuple<(str, FunctionType)>`
+            Attribute name - parser pairs.
+        """
+        self = object.__new__(cls)
+        self.attribute_parsers = attribute_parsers
+        self.function = self._compile_and_call
+        self.name = name
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the field setter's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' name = ')
+        repr_parts.append(repr(self.name))
+        
+        repr_parts.append(', attribute_names = ')
+        repr_parts.append(repr([attribute_name for attribute_name, parser in self.attribute_parsers]))
+        
+        repr_parts.append(', compiled = ')
+        repr_parts.append(repr(self.is_compiled()))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __call__(self, entity, data):
+        """
+        Parses out the fields of the given payload and sets them to the entity.
+        
+        Parameters
+        ----------
+        entity : `object`
+            The entity to set the fields to.
+        data : `dict<str, object>`
+            Entity data.
+        """
+        self.function(entity, data)
+    
+    
+    def _compile_and_call(self, entity, data):
+        """
+        Compiles the field setter's function, then calls it.
+        
+        Parameters
+        ----------
+        entity : `object`
+            The entity to set the fields to.
+        data : `dict<str, object>`
+            Entity data.
+        """
+        self.compile()(entity, data)
+    
+    
+    def compile(self):
+        """
+        Compiles the field setter's function.
+        
+        Returns
+        -------
+        function : `(object, dict<str, object>) -> None`
+        """
+        function = compile_field_setter(self.name, self.attribute_parsers)
+        self.function = function
+        return function
+    
+    
+    def is_compiled(self):
+        """
+        Returns whether the field setter's function is already compiled.
+        
+        Returns
+        -------
+        is_compiled : `bool`
+        """
+        return isinstance(self.function, FunctionType)
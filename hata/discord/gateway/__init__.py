@@ -4,7 +4,9 @@ from .client_shard import *
 from .client_sharder import *
 from .constants import *
 from .heartbeat import *
+from .identify_coordinators import *
 from .rate_limit import *
+from .session_stores import *
 from .utils import *
 from .voice import *
 from .voice_base import *
@@ -17,7 +19,9 @@ __all__ = (
     *client_sharder.__all__,
     *constants.__all__,
     *heartbeat.__all__,
+    *identify_coordinators.__all__,
     *rate_limit.__all__,
+    *session_stores.__all__,
     *utils.__all__,
     *voice.__all__,
     *voice_base.__all__,
@@ -43,3 +43,17 @@ class DiscordGatewayClientBase(DiscordGatewayBase):
         gateway : ``DiscordGatewayClientBase``
         """
         return self
+    
+    
+    def iter_gateways(self):
+        """
+        Iterates over the shard gateways of the gateway.
+        
+        This method is an iterable generator.
+        
+        Yields
+        ------
+        gateway : ``DiscordGatewayClientShard``
+        """
+        return
+        yield
@@ -1,9 +1,8 @@
 __all__ = ()
 
 from sys import platform as PLATFORM
-from zlib import decompressobj as create_zlib_decompressor, error as ZlibError
 
-from scarletio import Task, copy_docs, from_json, repeat_timeout, skip_ready_cycle, sleep, to_json
+from scarletio import Task, copy_docs, repeat_timeout, skip_ready_cycle, sleep
 from scarletio.web_common import ConnectionClosed, InvalidHandshake, URL, WebSocketProtocolError
 
 from ...env import API_VERSION, CACHE_PRESENCE, LIBRARY_NAME
@@ -25,45 +24,7 @@ from .constants import (
 )
 from .heartbeat import Kokoro
 from .rate_limit import GatewayRateLimiter
-
-
-async def _poll_compressed_message(web_socket):
-    """
-    Polls a compressed message from the given web socket.
-    
-    This function is a coroutine.
-    
-    Parameters
-    ----------
-    web_socket : ``WebSocketClient``
-        The web socket to poll with.
-    
-    Returns
-    -------
-    raw_message : `bytes`
-    
-    Raises
-    ------
-    ConnectionClosed
-        If the web socket connection closed.
-    """
-    buffer = None
-    
-    while True:
-        data = await web_socket.receive()
-        if data.endswith(b'\x00\x00\xff\xff'):
-            if buffer is None:
-                compressed_message = data
-            else:
-                buffer.append(data)
-                compressed_message = b''.join(buffer)
-            return compressed_message
-        
-        if buffer is None:
-            buffer = []
-        
-        buffer.append(data)
-        continue
+from .send_queue import GatewaySendQueue, get_command_key, is_priority_command
 
 
 class DiscordGatewayClientShard(DiscordGatewayClientBase):
@@ -74,19 +35,26 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
     ----------
     _buffer : `list<bytes>`
         A buffer used to store not finished received payloads.
-    _decompressor : `ZlibDecompressorType`
-        Zlib decompressor used to decompress the received data.
+    _decompressor : `None | object`
+        Decompressor used to decompress the received data. Created by ``.transport_compression``.
     _operation_handlers : `dict<int, (instance, dict<str, object>) -> int>`
         Handler for each expected operation.
+    _session_restored : `bool`
+        Whether the gateway's session was restored (``.set_session``) and it is not yet resumed. Restored sessions
+        are resumed only on the first connection.
     _should_run : `bool`
         Whether the gateway should be running.
     client : ``Client``
         The owner client of the gateway.
+    encoding : ``type<GatewayEncodingBase>``
+        The encoding used by the connection. Updated from the client's on every connect.
     kokoro : `None | Kokoro`
         The heart of the gateway, sends beat-data at set intervals. If does not receives answer in time, restarts
         the gateway.
     rate_limit_handler : ``GatewayRateLimiter``
         The rate limit handler of the gateway.
+    send_queue : ``GatewaySendQueue``
+        Outbound queue of the commands, except of heartbeats, identifies and resumes.
     resume_gateway_url : `None | str`
         The new gateway url to which we should connect on resuming.
     sequence : `None | int`
@@ -95,12 +63,15 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         Last session id received at `READY` event.
     shard_id : `int`
         The shard id of the gateway. If the respective client is not using sharding, it is set to `0` every time.
+    transport_compression : ``type<TransportCompressionBase>``
+        The transport compression used by the connection. Updated from the client's on every connect.
     web_socket : `None | WebSocketClient`
         The web socket client of the gateway.
     """
     __slots__ = (
-        '_buffer', '_decompressor', '_operation_handlers', '_should_run', 'client', 'kokoro', 'rate_limit_handler',
-        'resume_gateway_url', 'sequence', 'session_id', 'shard_id', 'web_socket',
+        '_buffer', '_decompressor', '_operation_handlers', '_session_restored', '_should_run', 'client', 'encoding', 'kokoro',
+        'rate_limit_handler', 'resume_gateway_url', 'send_queue', 'sequence', 'session_id', 'shard_id',
+        'transport_compression', 'web_socket',
     )
     
     def __new__(cls, client, shard_id):
@@ -127,14 +98,18 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         self._buffer = []
         self._decompressor = None
         self._operation_handlers = operation_handlers
+        self._session_restored = False
         self._should_run = False
         self.client = client
+        self.encoding = client.gateway_encoding
         self.kokoro = None
-        self.rate_limit_handler = GatewayRateLimiter()
+        self.rate_limit_handler = rate_limit_handler = GatewayRateLimiter()
         self.resume_gateway_url = None
+        self.send_queue = GatewaySendQueue(rate_limit_handler, self._send_json_now)
         self.sequence = -1
         self.session_id = None
         self.shard_id = shard_id
+        self.transport_compression = client.gateway_transport_compression
         self.web_socket = None
         return self
     
@@ -175,7 +150,14 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         """
         self._should_run = True
         client = self.client
-        action = GATEWAY_ACTION_CONNECT
+        
+        # If we have a session restored from a session store, resume it. Only on the first connection, after that we
+        # have no use of it.
+        if self._session_restored and (self.session_id is not None):
+            action = GATEWAY_ACTION_RESUME
+        else:
+            self._session_restored = False
+            action = GATEWAY_ACTION_CONNECT
         
         try:
             while True:
@@ -217,6 +199,7 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
                 else:
                     continue
                 
+                self._session_restored = False
                 action = GATEWAY_ACTION_CONNECT
                 continue    
                 
@@ -227,6 +210,7 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
                 waiter = None
             
             # we are not running anymore.
+            self._session_restored = False
             self._should_run = False
             
         return False
@@ -255,6 +239,8 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         if (kokoro is not None):
             kokoro.stop()
         
+        self.send_queue.clear()
+        
         web_socket = self.web_socket
         if web_socket is None:
             return None
@@ -292,17 +278,13 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
     
     @copy_docs(DiscordGatewayClientBase.send_as_json)
     async def send_as_json(self, data):
-        web_socket = self.web_socket
-        if web_socket is None:
-            return
-        
-        if not (await self.rate_limit_handler):
+        if self.web_socket is None:
             return
         
-        try:
-            await web_socket.send(to_json(data))
-        except ConnectionClosed:
-            pass
+        if is_priority_command(data):
+            await self._send_json_now(self.encoding.encode(data))
+        else:
+            await self.send_queue.put(self.encoding.encode(data), get_command_key(data))
     
     
     @copy_docs(DiscordGatewayClientBase.beat)
@@ -343,6 +325,11 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         await self.send_as_json(data)
     
     
+    @copy_docs(DiscordGatewayClientBase.iter_gateways)
+    def iter_gateways(self):
+        yield self
+    
+    
     # connecting, message receive and processing
     
     async def _connect(self, resume):
@@ -369,6 +356,8 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         DiscordException
         """
         self._create_kokoro()
+        # Do not send the commands queued for the old connection before identifying or resuming.
+        self.send_queue.clear()
         
         web_socket = self.web_socket
         if (web_socket is not None) and (not web_socket.closed):
@@ -383,9 +372,19 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         if gateway_url is None:
             gateway_url = await self.client.client_gateway_url()
         
-        gateway_url = URL(f'{gateway_url}?encoding=json&v={API_VERSION}&compress=zlib-stream', True)
+        client = self.client
+        encoding = client.gateway_encoding
+        self.encoding = encoding
+        transport_compression = client.gateway_transport_compression
+        self.transport_compression = transport_compression
+        
+        gateway_url = f'{gateway_url}?encoding={encoding.name}&v={API_VERSION}'
+        if transport_compression.name:
+            gateway_url = f'{gateway_url}&compress={transport_compression.name}'
         
-        self._decompressor = create_zlib_decompressor()
+        gateway_url = URL(gateway_url, True)
+        
+        self._decompressor = transport_compression.create_decompressor()
         
         self.web_socket = await self.client.http.connect_web_socket(gateway_url)
         self.kokoro.start()
@@ -467,8 +466,10 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
             # No web_socket? Were the connection closed?
             return GATEWAY_ACTION_CONNECT
         
+        transport_compression = self.transport_compression
+        
         try:
-            raw_message = await _poll_compressed_message(web_socket)
+            raw_message = await transport_compression.poll_message(web_socket)
         except ConnectionClosed as exception:
             # propagate a few kind of `ConnectionClosed` exceptions while swallow the rest for reconnection.
             if exception.code in (1000, 1006, 4004, 4010, 4011, 4013, 4014):
@@ -477,13 +478,14 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
             return GATEWAY_ACTION_CONNECT
         
         try:
-            decompressed_message = self._decompressor.decompress(raw_message)
-        except ZlibError:
+            decompressed_message = transport_compression.decompress(self._decompressor, raw_message)
+        except transport_compression.decompression_error_types:
             # we need a full reset
             return GATEWAY_ACTION_CONNECT
         
         # This may raise `TimeoutError`
-        return (await self._handle_received_operation(decompressed_message.decode('utf-8')))
+        # Pass the message as `bytes`, most decoders can decode it without an intermediate utf-8 decoding.
+        return (await self._handle_received_operation(decompressed_message))
     
     
     async def _handle_received_operation(self, message):
@@ -495,7 +497,7 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         
         Parameters
         ----------
-        message : `bytes`
+        message : `bytes | str`
             The received message.
         
         Returns
@@ -503,7 +505,7 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         gateway_action : `int`
         """
         # return True if we should reconnect
-        message = from_json(message)
+        message = self.encoding.decode(message)
         
         sequence = message.get('s', None)
         if (sequence is not None):
@@ -689,16 +691,57 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
             self.session_id = data.get('session_id', None)
             self.resume_gateway_url = data.get('resume_gateway_url', None)
         
-        # elif event == 'RESUMED':
-            # pass
+        elif event == 'RESUMED':
+            # If we resumed a restored session, we will not receive `READY`, so tell the client we are ready.
+            if self._session_restored:
+                self._session_restored = False
+                client._shard_resumed(self.shard_id)
         
         return GATEWAY_ACTION_KEEP_GOING
     
     
+    def get_session(self):
+        """
+        Returns the gateway's session to resume with.
+        
+        Returns
+        -------
+        session : `None | dict<str, object>`
+            The session's `'session_id'`, `'resume_gateway_url'` and `'sequence'`. `None` if there is no session.
+        """
+        session_id = self.session_id
+        if session_id is None:
+            return None
+        
+        return {
+            'session_id': session_id,
+            'resume_gateway_url': self.resume_gateway_url,
+            'sequence': self.sequence,
+        }
+    
+    
+    def set_session(self, session):
+        """
+        Sets the gateway's session to resume with on the first connection of the next ``.run``.
+        
+        Since no `READY` event is received when the session is resumed, the client is notified on `RESUMED` instead.
+        
+        Parameters
+        ----------
+        session : `dict<str, object>`
+            The session's `'session_id'`, `'resume_gateway_url'` and `'sequence'`.
+        """
+        self.session_id = session['session_id']
+        self.resume_gateway_url = session['resume_gateway_url']
+        self.sequence = session['sequence']
+        self._session_restored = True
+    
+    
     def _clear_session(self):
         """
         Clears current session data, disabling the option of resuming the connection.
         """
+        self._session_restored = False
         self.session_id = None
         self.sequence = -1
         self.resume_gateway_url = None
@@ -708,6 +751,8 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         """
         Sends an `GATEWAY_OPERATION_CLIENT_IDENTIFY` packet to Discord.
         
+        Reserves the shard's identify bucket from the client's identify coordinator right before sending it.
+        
         This method is a coroutine.
         """
         client = self.client
@@ -718,6 +763,7 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
             activity_data = activity.to_data(user = not client.bot)
         
         status_value = client._status.value
+        payload_compression = self.transport_compression.payload_compression
         
         data = {
             'op': GATEWAY_OPERATION_CLIENT_IDENTIFY,
@@ -728,7 +774,7 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
                     'browser': LIBRARY_NAME,
                     'device': LIBRARY_NAME,
                 },
-                'compress': True,                       # Whether we support compression | Discord default: False
+                'compress': payload_compression,        # Whether we support compression | Discord default: False
                 'large_threshold': LARGE_GUILD_LIMIT,   # between 50 and 250             | Discord default: 50
                 'guild_subscriptions': CACHE_PRESENCE,  # optional                       | Discord default: False
                 'intents': client.intents,              # Grip & Break down              | Discord Default: all-p-gu
@@ -746,6 +792,7 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         if shard_count:
             data['d']['shard'] = [self.shard_id, shard_count]
         
+        await client.identify_coordinator.acquire([self.shard_id], client._gateway_max_concurrency)
         await self.send_as_json(data)
     
     
@@ -767,9 +814,30 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         await self.send_as_json(data)
 
     
-    async def _send_json(self, data):
+    async def _send_json(self, data, command_key = None):
+        """
+        Internal function to queue up already encoded data to be sent.
+        
+        If the given gateway has no web_socket, or if it is closed, will not raise.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        data : `bytes | str`
+            The already encoded data to send.
+        command_key : `None | (int, None | str)` = `None`, Optional
+            The command's key. Queued commands with the same key supersede each other.
+        """
+        if self.web_socket is None:
+            return
+        
+        await self.send_queue.put(data, command_key)
+    
+    
+    async def _send_json_now(self, data):
         """
-        Internal function to send already converted json data.
+        Sends the already encoded data bypassing the send queue.
         
         If the given gateway has no web_socket, or if it is closed, will not raise.
         
@@ -777,8 +845,8 @@ class DiscordGatewayClientShard(DiscordGatewayClientBase):
         
         Parameters
         ----------
-        data : `str`
-            The data to send.
+        data : `bytes | str`
+            The already encoded data to send.
         """
         web_socket = self.web_socket
         if web_socket is None:
@@ -1,20 +1,21 @@
 __all__ = ()
 
-from itertools import islice
-
-from scarletio import Task, TaskGroup, copy_docs, sleep, to_json
+from scarletio import Task, TaskGroup, copy_docs
 
 from ..core import KOKORO
 
 from .client_base import DiscordGatewayClientBase
 from .client_shard import DiscordGatewayClientShard
 from .heartbeat import LATENCY_DEFAULT
+from .send_queue import get_command_key
 
 
 def _create_gateways(client, shard_count, gateways):
     """
     Creates the amount of gateways requested.
     
+    If the client runs only a part of its shards (``Client.shard_ids``), creates gateways only for those.
+    
     Parameters
     ----------
     client : ``Client``
@@ -29,30 +30,31 @@ def _create_gateways(client, shard_count, gateways):
     -------
     gateways : `tuple<DiscordGatewayClientShard>`
     """
-    # Process input
-    if gateways is None:
-        gateways = []
-    else:
-        gateways = [*gateways]
-    
-    gateway_count = len(gateways)
-    
-    # Adjust gateway count
-    if shard_count == gateway_count:
-        # nothing to do, should not happen
-        pass
-    
-    elif shard_count > gateway_count:
-        # Add new gateways
-        gateways.extend(DiscordGatewayClientShard(client, shard_id) for shard_id in range(gateway_count, shard_count))
+    shard_ids = client.shard_ids
+    if shard_ids is None:
+        shard_ids = range(shard_count)
+    
+    # Collect existing gateways
+    gateways_by_shard_id = {}
+    if (gateways is not None):
+        for gateway in gateways:
+            gateways_by_shard_id[gateway.shard_id] = gateway
+    
+    # Reuse existing and add new gateways
+    new_gateways = []
+    for shard_id in shard_ids:
+        gateway = gateways_by_shard_id.pop(shard_id, None)
+        if gateway is None:
+            gateway = DiscordGatewayClientShard(client, shard_id)
+        
+        new_gateways.append(gateway)
     
-    else:
-        # Remove extra gateways
-        for _ in range(shard_count, gateway_count):
-            gateways.pop().abort()
+    # Remove extra gateways
+    for gateway in gateways_by_shard_id.values():
+        gateway.abort()
     
     # return
-    return tuple(gateways)
+    return tuple(new_gateways)
 
 
 async def _close_and_abort_gateway(gateway):
@@ -72,21 +74,32 @@ async def _close_and_abort_gateway(gateway):
         gateway.abort()
 
 
-async def _connect_gateway_batch(task_group, gateways):
+async def _connect_gateway_batch(task_group, gateways, max_concurrency, identify_coordinator):
     """
-    Connects a batch of gateways.
+    Connects a batch of gateways. Before connecting waits till the identify coordinator lets them identify.
+    
+    This function is a coroutine.
     
     Parameters
     ----------
     task_group : ``TaskGroup``
         Task group to use for waiters and the runner tasks.
-    gateways : `iterable<DiscordGatewayClientShard>`
+    gateways : `list<DiscordGatewayClientShard>`
         The gateways to run.
+    max_concurrency : `int`
+        The maximal amount of shards that can be launched at the same time.
+    identify_coordinator : ``IdentifyCoordinatorBase``
+        Identify coordinator to wait for.
     
     Returns
     -------
     success : `bool`
     """
+    # Each gateway does an `IDENTIFY` on connection. You can send `max_concurrency` amount of identifies every
+    # 5 seconds. The gateways reserve their identify bucket from the coordinator right before identifying, so we
+    # only wait till the buckets are free, so the gateways do not connect just to wait.
+    await identify_coordinator.wait([gateway.shard_id for gateway in gateways], max_concurrency)
+    
     batch_size = 0
     
     # Add gateways
@@ -111,7 +124,7 @@ async def _connect_gateway_batch(task_group, gateways):
     return True
 
 
-async def _connect_gateways(task_group, gateways, max_concurrency):
+async def _connect_gateways(task_group, gateways, max_concurrency, identify_coordinator):
     """
     Connects the given gateways adding each runner's into `task_group`.
     Connects them in batches of `max_concurrency`. If there is more, we wait for rate limits and continue.
@@ -126,6 +139,8 @@ async def _connect_gateways(task_group, gateways, max_concurrency):
         The gateways to run.
     max_concurrency : `int`
         The maximal amount of shards that can be launched at the same time.
+    identify_coordinator : ``IdentifyCoordinatorBase``
+        Identify coordinator deciding when a batch can be launched.
     
     Returns
     -------
@@ -133,11 +148,13 @@ async def _connect_gateways(task_group, gateways, max_concurrency):
     """
     chunk_start = 0
     limit = len(gateways)
-    # At every step we add up to `max_concurrency` gateways to launch up. When a gateway is launched up
+    # At every step we add up to `max_concurrency` gateways to launch up.
     while True:
         chunk_end = min(chunk_start + max_concurrency, limit)
         
-        result = await _connect_gateway_batch(task_group, islice(gateways, chunk_start, chunk_end))
+        result = await _connect_gateway_batch(
+            task_group, gateways[chunk_start : chunk_end], max_concurrency, identify_coordinator
+        )
         if not result:
             return False
             
@@ -145,9 +162,6 @@ async def _connect_gateways(task_group, gateways, max_concurrency):
         if chunk_start >= limit:
             break
         
-        # Each gateway does an `IDENTIFY` on connection. You can send `max_concurrency` amount of identifies every
-        # second. That means here we sleep `5` seconds. We could rush this 5 seconds, but no need.
-        await sleep(5.0, KOKORO)
         continue
     
     return True
@@ -163,8 +177,13 @@ class DiscordGatewayClientSharder(DiscordGatewayClientBase):
         The owner client of the gateway.
     gateways : `tuple<DiscordGatewayClientShard>`
         The controlled gateways.
+    gateways_by_shard_id : `dict<int, DiscordGatewayClientShard>`
+        The controlled gateways by their shard's identifier.
+    shard_count : `int`
+        The total amount of shards. Might be more than the amount of the controlled gateways, if the client runs
+        only a part of its shards.
     """
-    __slots__ = ('client', 'gateways')
+    __slots__ = ('client', 'gateways', 'gateways_by_shard_id', 'shard_count')
     
     def __new__(cls, client, shard_count, gateways):
         """
@@ -184,6 +203,8 @@ class DiscordGatewayClientSharder(DiscordGatewayClientBase):
         self = object.__new__(cls)
         self.client = client
         self.gateways = gateways
+        self.gateways_by_shard_id = {gateway.shard_id: gateway for gateway in gateways}
+        self.shard_count = shard_count
         return self
     
     
@@ -193,7 +214,12 @@ class DiscordGatewayClientSharder(DiscordGatewayClientBase):
         repr_parts.append(repr(self.client.full_name))
         
         repr_parts.append(', shard_count = ')
-        repr_parts.append(repr(len(self.gateways)))
+        repr_parts.append(repr(self.shard_count))
+        
+        gateway_count = len(self.gateways)
+        if gateway_count != self.shard_count:
+            repr_parts.append(', gateway_count = ')
+            repr_parts.append(repr(gateway_count))
     
     
     @copy_docs(DiscordGatewayClientBase.run)
@@ -201,7 +227,10 @@ class DiscordGatewayClientSharder(DiscordGatewayClientBase):
         task_group = TaskGroup(KOKORO)
         
         try:
-            result = await _connect_gateways(task_group, self.gateways, self.client._gateway_max_concurrency)
+            client = self.client
+            result = await _connect_gateways(
+                task_group, self.gateways, client._gateway_max_concurrency, client.identify_coordinator
+            )
             
             if result:
                 # If all shards successfully connected we wait till the first is cancelled.
@@ -264,9 +293,12 @@ class DiscordGatewayClientSharder(DiscordGatewayClientBase):
     
     @copy_docs(DiscordGatewayClientBase.send_as_json)
     async def send_as_json(self, data):
-        data = to_json(data)
+        command_key = get_command_key(data)
+        data = self.client.gateway_encoding.encode(data)
         
-        task_group = TaskGroup(KOKORO, (Task(KOKORO, gateway._send_json(data)) for gateway in self.gateways))
+        task_group = TaskGroup(
+            KOKORO, (Task(KOKORO, gateway._send_json(data, command_key)) for gateway in self.gateways)
+        )
         failed_task = await task_group.wait_exception()
         if (failed_task is not None):
             task_group.cancel_all()
@@ -281,10 +313,38 @@ class DiscordGatewayClientSharder(DiscordGatewayClientBase):
     
     @copy_docs(DiscordGatewayClientBase.get_gateway)
     def get_gateway(self, guild_id):
-        gateways = self.gateways
         if guild_id:
-            gateway = gateways[(guild_id >> 22) % len(gateways)]
+            gateway = self.get_gateway_of_shard((guild_id >> 22) % self.shard_count)
         else:
-            gateway = gateways[0]
+            gateway = self.gateways[0]
         
         return gateway
+    
+    
+    @copy_docs(DiscordGatewayClientBase.iter_gateways)
+    def iter_gateways(self):
+        yield from self.gateways
+    
+    
+    def get_gateway_of_shard(self, shard_id):
+        """
+        Returns the gateway of the given shard.
+        
+        Parameters
+        ----------
+        shard_id : `int`
+            The shard's identifier.
+        
+        Returns
+        -------
+        gateway : ``DiscordGatewayClientShard``
+        
+        Raises
+        ------
+        LookupError
+            If the shard is not ran by the client.
+        """
+        try:
+            return self.gateways_by_shard_id[shard_id]
+        except KeyError:
+            raise LookupError(f'Shard is not ran by the client: {shard_id!r}.') from None
@@ -10,9 +10,18 @@ LATENCY_DEFAULT = 9999.0
 GATEWAY_CONNECT_TIMEOUT = 30.0
 POLL_TIMEOUT = 60.0
 
+# identify
+IDENTIFY_INTERVAL = 5.0
+
+# session
+CACHE_SNAPSHOT_MAX_AGE = 86400.0
+SESSION_MAX_AGE = 120.0
+
 # rate limit
 GATEWAY_RATE_LIMIT_LIMIT = 120
 GATEWAY_RATE_LIMIT_RESET = 60.0
+# Commands kept free for heartbeats, identifies and resumes. Queued commands do not use them up.
+GATEWAY_RATE_LIMIT_RESERVED = 5
 
 # gateway control
 GATEWAY_ACTION_KEEP_GOING = 0
@@ -0,0 +1,32 @@
+from .base import *
+from .encoding_etf import *
+from .encoding_json import *
+from .erlang_term_format import *
+
+
+__all__ = (
+    *base.__all__,
+    *encoding_etf.__all__,
+    *encoding_json.__all__,
+    *erlang_term_format.__all__,
+)
+
+# Construct `GATEWAY_ENCODINGS`
+
+from .encoding_etf import GatewayEncoding__etf
+from .encoding_json import GatewayEncoding__json
+
+
+GATEWAY_ENCODINGS = {
+    gateway_encoding.name : gateway_encoding for gateway_encoding in (
+        GatewayEncoding__etf,
+        GatewayEncoding__json,
+    )
+}
+
+GATEWAY_ENCODING_DEFAULT = GatewayEncoding__json
+
+
+# Import `GatewayEncodingBase` to shorten imports
+
+from .base import GatewayEncodingBase
@@ -0,0 +1,78 @@
+__all__ = ()
+
+from scarletio import RichAttributeErrorBaseType
+
+
+class GatewayEncodingBase(RichAttributeErrorBaseType):
+    """
+    Base gateway encoding.
+    
+    Gateway encodings are not instanced, their static methods are used directly.
+    
+    Class Attributes
+    ----------------
+    available : `bool` = `False`
+        Whether the encoding is available.
+    name : `str` = `''`
+        The encoding's name. This is the value of the `encoding` query parameter of the gateway url.
+    """
+    __slots__ = ()
+    
+    available = False
+    name = ''
+    
+    
+    def __new__(cls):
+        """
+        Gateway encodings are not instanced.
+        
+        Raises
+        ------
+        RuntimeError
+        """
+        raise RuntimeError(f'{cls.__name__} cannot be instanced.')
+    
+    
+    @staticmethod
+    def decode(data):
+        """
+        Decodes a received (already decompressed) gateway message.
+        
+        Parameters
+        ----------
+        data : `bytes | str`
+            The data to decode.
+        
+        Returns
+        -------
+        message : `object`
+        
+        Raises
+        ------
+        ValueError
+            - If the given data cannot be decoded.
+        """
+        raise NotImplementedError
+    
+    
+    @staticmethod
+    def encode(data):
+        """
+        Encodes a gateway message to send.
+        
+        Parameters
+        ----------
+        data : `object`
+            The value to encode.
+        
+        Returns
+        -------
+        message : `bytes | str`
+            `str` is sent as a text frame, meanwhile `bytes` as a binary one.
+        
+        Raises
+        ------
+        TypeError
+            - If the given object is / or contains an object with a non convertible type.
+        """
+        raise NotImplementedError
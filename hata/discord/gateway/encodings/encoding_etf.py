@@ -0,0 +1,30 @@
+__all__ = ()
+
+from .base import GatewayEncodingBase
+from .erlang_term_format import etf_decode, etf_encode
+
+try:
+    from erlpack import ErlangTermDecoder, pack as erlpack_pack
+except ImportError:
+    ErlangTermDecoder = None
+    erlpack_pack = None
+
+
+class GatewayEncoding__etf(GatewayEncodingBase):
+    """
+    `etf` (erlang term format) gateway encoding.
+    
+    Produces smaller frames and the snowflakes are received as integers. If `erlpack` is installed, it is used,
+    else the pure python implementation.
+    """
+    __slots__ = ()
+    
+    available = True
+    name = 'etf'
+    
+    if (ErlangTermDecoder is None):
+        decode = staticmethod(etf_decode)
+        encode = staticmethod(etf_encode)
+    else:
+        decode = staticmethod(ErlangTermDecoder(encoding = 'utf-8').loads)
+        encode = staticmethod(erlpack_pack)
@@ -0,0 +1,18 @@
+__all__ = ()
+
+from ...json_codecs import JSON_CODEC
+
+from .base import GatewayEncodingBase
+
+
+class GatewayEncoding__json(GatewayEncodingBase):
+    """
+    `json` gateway encoding. Uses the selected json codec.
+    """
+    __slots__ = ()
+    
+    available = True
+    name = 'json'
+    
+    decode = staticmethod(JSON_CODEC.decode)
+    encode = staticmethod(JSON_CODEC.encode)
@@ -0,0 +1,358 @@
+__all__ = ()
+
+from enum import Enum
+from struct import Struct, error as StructError
+from zlib import decompress as zlib_decompress, error as ZlibError
+
+
+FORMAT_VERSION = 131
+
+TAG_NEW_FLOAT = 70
+TAG_COMPRESSED = 80
+TAG_SMALL_INTEGER = 97
+TAG_INTEGER = 98
+TAG_FLOAT = 99
+TAG_ATOM = 100
+TAG_SMALL_TUPLE = 104
+TAG_LARGE_TUPLE = 105
+TAG_NIL = 106
+TAG_STRING = 107
+TAG_LIST = 108
+TAG_BINARY = 109
+TAG_SMALL_BIG = 110
+TAG_LARGE_BIG = 111
+TAG_SMALL_ATOM = 115
+TAG_MAP = 116
+TAG_ATOM_UTF8 = 118
+TAG_SMALL_ATOM_UTF8 = 119
+
+STRUCT_UINT16 = Struct('>H')
+STRUCT_UINT32 = Struct('>L')
+STRUCT_INT32 = Struct('>l')
+STRUCT_FLOAT64 = Struct('>d')
+
+ATOM_TO_VALUE = {
+    'nil': None,
+    'true': True,
+    'false': False,
+}
+
+ENCODED_NIL = bytes((TAG_SMALL_ATOM_UTF8, 3)) + b'nil'
+ENCODED_TRUE = bytes((TAG_SMALL_ATOM_UTF8, 4)) + b'true'
+ENCODED_FALSE = bytes((TAG_SMALL_ATOM_UTF8, 5)) + b'false'
+
+
+def _decode_atom(atom_name):
+    """
+    Converts the given atom name to its python representation.
+    
+    Parameters
+    ----------
+    atom_name : `str`
+        The atom's name.
+    
+    Returns
+    -------
+    value : `None | bool | str`
+    """
+    return ATOM_TO_VALUE.get(atom_name, atom_name)
+
+
+def _decode_big_integer(data, offset, length):
+    """
+    Decodes a big integer's magnitude and sign.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The data to decode from.
+    offset : `int`
+        The offset of the sign byte.
+    length : `int`
+        The amount of digit bytes.
+    
+    Returns
+    -------
+    value : `int`
+    offset : `int`
+    """
+    sign = data[offset]
+    offset += 1
+    value = int.from_bytes(data[offset : offset + length], 'little')
+    if sign:
+        value = -value
+    
+    return value, offset + length
+
+
+def _decode_term(data, offset):
+    """
+    Decodes an erlang term starting at the given offset.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The data to decode from.
+    offset : `int`
+        The offset of the term's tag.
+    
+    Returns
+    -------
+    value : `object`
+    offset : `int`
+        The offset after the term.
+    
+    Raises
+    ------
+    ValueError
+        - Unknown or not supported tag.
+    """
+    tag = data[offset]
+    offset += 1
+    
+    if tag == TAG_BINARY:
+        length = STRUCT_UINT32.unpack_from(data, offset)[0]
+        offset += 4
+        return data[offset : offset + length].decode('utf-8'), offset + length
+    
+    if tag == TAG_MAP:
+        length = STRUCT_UINT32.unpack_from(data, offset)[0]
+        offset += 4
+        value = {}
+        for _ in range(length):
+            key, offset = _decode_term(data, offset)
+            value[key], offset = _decode_term(data, offset)
+        
+        return value, offset
+    
+    if tag == TAG_SMALL_INTEGER:
+        return data[offset], offset + 1
+    
+    if tag == TAG_SMALL_ATOM_UTF8 or tag == TAG_SMALL_ATOM:
+        length = data[offset]
+        offset += 1
+        return _decode_atom(data[offset : offset + length].decode('utf-8')), offset + length
+    
+    if tag == TAG_SMALL_BIG:
+        return _decode_big_integer(data, offset + 1, data[offset])
+    
+    if tag == TAG_INTEGER:
+        return STRUCT_INT32.unpack_from(data, offset)[0], offset + 4
+    
+    if tag == TAG_LIST:
+        length = STRUCT_UINT32.unpack_from(data, offset)[0]
+        offset += 4
+        value = []
+        for _ in range(length):
+            element, offset = _decode_term(data, offset)
+            value.append(element)
+        
+        # Tail, always `NIL` for proper lists.
+        tail, offset = _decode_term(data, offset)
+        if tail != []:
+            raise ValueError(f'Improper lists are not supported, got tail: {tail!r}.')
+        
+        return value, offset
+    
+    if tag == TAG_NIL:
+        return [], offset
+    
+    if tag == TAG_NEW_FLOAT:
+        return STRUCT_FLOAT64.unpack_from(data, offset)[0], offset + 8
+    
+    if tag == TAG_STRING:
+        # Lists of small integers are encoded as "strings".
+        length = STRUCT_UINT16.unpack_from(data, offset)[0]
+        offset += 2
+        return [*data[offset : offset + length]], offset + length
+    
+    if tag == TAG_ATOM_UTF8 or tag == TAG_ATOM:
+        length = STRUCT_UINT16.unpack_from(data, offset)[0]
+        offset += 2
+        return _decode_atom(data[offset : offset + length].decode('utf-8')), offset + length
+    
+    if tag == TAG_SMALL_TUPLE or tag == TAG_LARGE_TUPLE:
+        if tag == TAG_SMALL_TUPLE:
+            length = data[offset]
+            offset += 1
+        else:
+            length = STRUCT_UINT32.unpack_from(data, offset)[0]
+            offset += 4
+        
+        value = []
+        for _ in range(length):
+            element, offset = _decode_term(data, offset)
+            value.append(element)
+        
+        return (*value,), offset
+    
+    if tag == TAG_LARGE_BIG:
+        return _decode_big_integer(data, offset + 4, STRUCT_UINT32.unpack_from(data, offset)[0])
+    
+    if tag == TAG_FLOAT:
+        return float(data[offset : offset + 31].rstrip(b'\x00')), offset + 31
+    
+    raise ValueError(f'Unknown or not supported erlang term tag: {tag!r} at offset {offset - 1!r}.')
+
+
+def etf_decode(data):
+    """
+    Decodes the given erlang term format data.
+    
+    Binaries are decoded as `str`, atoms as `str` except `nil`, `true` and `false`, which are decoded as `None`, `True`
+    and `False` respectively. This produces the same structures as decoding the respective json.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The data to decode.
+    
+    Returns
+    -------
+    value : `object`
+    
+    Raises
+    ------
+    ValueError
+        - If the data is not a valid erlang term format data.
+    """
+    try:
+        if data[0] != FORMAT_VERSION:
+            raise ValueError(f'Unknown erlang term format version: {data[0]!r}.')
+        
+        if data[1] == TAG_COMPRESSED:
+            data = zlib_decompress(data[6:])
+            offset = 0
+        else:
+            offset = 1
+        
+        value, offset = _decode_term(data, offset)
+    
+    except (IndexError, StructError, UnicodeDecodeError, ZlibError) as exception:
+        raise ValueError(f'Invalid erlang term format data: {exception!s}.') from exception
+    
+    return value
+
+
+def _encode_term_into(value, buffer):
+    """
+    Encodes the given value into the given buffer.
+    
+    Parameters
+    ----------
+    value : `object`
+        The value to encode.
+    buffer : `bytearray`
+        Buffer to encode into.
+    
+    Raises
+    ------
+    TypeError
+        - If the given object is / or contains an object with a non convertible type.
+    """
+    if value is None:
+        buffer.extend(ENCODED_NIL)
+        return
+    
+    if value is True:
+        buffer.extend(ENCODED_TRUE)
+        return
+    
+    if value is False:
+        buffer.extend(ENCODED_FALSE)
+        return
+    
+    if isinstance(value, str):
+        encoded = value.encode('utf-8')
+        buffer.append(TAG_BINARY)
+        buffer.extend(STRUCT_UINT32.pack(len(encoded)))
+        buffer.extend(encoded)
+        return
+    
+    if isinstance(value, int):
+        if 0 <= value < 256:
+            buffer.append(TAG_SMALL_INTEGER)
+            buffer.append(value)
+            return
+        
+        if -2147483648 <= value < 2147483648:
+            buffer.append(TAG_INTEGER)
+            buffer.extend(STRUCT_INT32.pack(value))
+            return
+        
+        magnitude = -value if value < 0 else value
+        length = (magnitude.bit_length() + 7) >> 3
+        if length < 256:
+            buffer.append(TAG_SMALL_BIG)
+            buffer.append(length)
+        else:
+            buffer.append(TAG_LARGE_BIG)
+            buffer.extend(STRUCT_UINT32.pack(length))
+        
+        buffer.append(1 if value < 0 else 0)
+        buffer.extend(magnitude.to_bytes(length, 'little'))
+        return
+    
+    if isinstance(value, float):
+        buffer.append(TAG_NEW_FLOAT)
+        buffer.extend(STRUCT_FLOAT64.pack(value))
+        return
+    
+    if isinstance(value, dict):
+        buffer.append(TAG_MAP)
+        buffer.extend(STRUCT_UINT32.pack(len(value)))
+        for key, element in value.items():
+            _encode_term_into(key, buffer)
+            _encode_term_into(element, buffer)
+        return
+    
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        buffer.append(TAG_BINARY)
+        buffer.extend(STRUCT_UINT32.pack(len(value)))
+        buffer.extend(value)
+        return
+    
+    if isinstance(value, Enum):
+        _encode_term_into(value.value, buffer)
+        return
+    
+    if hasattr(value, '__iter__'):
+        if not isinstance(value, (list, tuple)):
+            value = [*value]
+        
+        if value:
+            buffer.append(TAG_LIST)
+            buffer.extend(STRUCT_UINT32.pack(len(value)))
+            for element in value:
+                _encode_term_into(element, buffer)
+        
+        buffer.append(TAG_NIL)
+        return
+    
+    raise TypeError(f'Object of type {type(value).__name__!r} is not erlang term format serializable, got {value!r}.')
+
+
+def etf_encode(value):
+    """
+    Encodes the given value to erlang term format.
+    
+    `str`-s are encoded as binaries, `None`, `True` and `False` as their respective atoms.
+    
+    Parameters
+    ----------
+    value : `object`
+        The value to encode.
+    
+    Returns
+    -------
+    data : `bytes`
+    
+    Raises
+    ------
+    TypeError
+        - If the given object is / or contains an object with a non convertible type.
+    """
+    buffer = bytearray()
+    buffer.append(FORMAT_VERSION)
+    _encode_term_into(value, buffer)
+    return bytes(buffer)
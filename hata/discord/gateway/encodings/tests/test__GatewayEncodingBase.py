@@ -0,0 +1,19 @@
+import vampytest
+
+from ..base import GatewayEncodingBase
+
+
+def test__GatewayEncodingBase__new():
+    """
+    Tests whether ``GatewayEncodingBase.__new__`` works as intended.
+    """
+    with vampytest.assert_raises(RuntimeError):
+        GatewayEncodingBase()
+
+
+def test__GatewayEncodingBase__class_attributes():
+    """
+    Tests whether ``GatewayEncodingBase``'s class attributes are set as intended.
+    """
+    vampytest.assert_instance(GatewayEncodingBase.available, bool)
+    vampytest.assert_instance(GatewayEncodingBase.name, str)
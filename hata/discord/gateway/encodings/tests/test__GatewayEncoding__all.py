@@ -0,0 +1,59 @@
+import vampytest
+
+from .. import GATEWAY_ENCODINGS, GATEWAY_ENCODING_DEFAULT
+from ..base import GatewayEncodingBase
+from ..encoding_etf import GatewayEncoding__etf
+from ..encoding_json import GatewayEncoding__json
+
+
+def test__GATEWAY_ENCODINGS():
+    """
+    Tests whether ``GATEWAY_ENCODINGS`` is built as intended.
+    """
+    vampytest.assert_instance(GATEWAY_ENCODINGS, dict)
+    
+    for name, gateway_encoding in GATEWAY_ENCODINGS.items():
+        vampytest.assert_subtype(gateway_encoding, GatewayEncodingBase)
+        vampytest.assert_eq(gateway_encoding.name, name)
+        vampytest.assert_true(gateway_encoding.available)
+    
+    vampytest.assert_is(GATEWAY_ENCODING_DEFAULT, GatewayEncoding__json)
+
+
+def _iter_options():
+    yield {'op': 11, 'd': None}
+    yield {'op': 1, 'd': 12}
+    yield {
+        'op': 0,
+        's': 2,
+        't': 'GUILD_ROLE_CREATE',
+        'd': {
+            'guild_id': '202505100003',
+            'role': {
+                'id': '202505100004',
+                'name': 'koishi',
+                'hoist': True,
+                'icon': None,
+                'permissions': '8',
+                'position': 3,
+            },
+        },
+    }
+
+
+@vampytest._(vampytest.call_from(_iter_options()))
+def test__GatewayEncoding__roundtrip(input_value):
+    """
+    Tests whether the gateway encodings produce the same structures after decoding their own encoded output.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Value to encode.
+    """
+    for gateway_encoding in (GatewayEncoding__etf, GatewayEncoding__json):
+        encoded = gateway_encoding.encode(input_value)
+        vampytest.assert_instance(encoded, bytes, str)
+        
+        output = gateway_encoding.decode(encoded)
+        vampytest.assert_eq(output, input_value)
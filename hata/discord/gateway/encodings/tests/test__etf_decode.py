@@ -0,0 +1,82 @@
+from zlib import compress as zlib_compress
+
+import vampytest
+
+from ..erlang_term_format import etf_decode
+
+
+def _iter_options__passing():
+    # nil
+    yield b'\x83w\x03nil', None
+    # true, false
+    yield b'\x83w\x04true', True
+    yield b'\x83s\x05false', False
+    # other atom
+    yield b'\x83d\x00\x05hello', 'hello'
+    # small integer
+    yield b'\x83a\x0b', 11
+    # integer
+    yield b'\x83b\xff\xff\xff\xfe', -2
+    # small big
+    yield b'\x83n\x08\x00\x00\x00\x00\x00\x00\x00\x00\x01', 1 << 56
+    yield b'\x83n\x01\x01\x05', -5
+    # large big
+    yield b'\x83o\x00\x00\x00\x01\x00\x07', 7
+    # new float
+    yield b'\x83F?\xf8\x00\x00\x00\x00\x00\x00', 1.5
+    # binary
+    yield b'\x83m\x00\x00\x00\x0akoishi \xe3\x81\x93', 'koishi こ'
+    # nil list
+    yield b'\x83j', []
+    # string (list of small integers)
+    yield b'\x83k\x00\x03\x01\x02\x03', [1, 2, 3]
+    # list
+    yield b'\x83l\x00\x00\x00\x02a\x01m\x00\x00\x00\x01aj', [1, 'a']
+    # small tuple
+    yield b'\x83h\x02a\x01a\x02', (1, 2)
+    # map
+    yield (
+        b'\x83t\x00\x00\x00\x02m\x00\x00\x00\x02opa\x0bm\x00\x00\x00\x01dw\x03nil',
+        {'op': 11, 'd': None},
+    )
+    # map with atom keys
+    yield (
+        b'\x83t\x00\x00\x00\x01d\x00\x02idn\x08\x00\x00x\xb4\xc6Pq\xcf\x02',
+        {'id': 202505100000000000},
+    )
+    # compressed
+    yield b'\x83P\x00\x00\x00\x0a' + zlib_compress(b'm\x00\x00\x00\x05hello'), 'hello'
+
+
+def _iter_options__value_error():
+    # Bad version
+    yield b'\x82a\x01'
+    # Truncated
+    yield b'\x83m\x00\x00'
+    yield b'\x83'
+    # Unknown tag
+    yield b'\x83\x01'
+    # Improper list
+    yield b'\x83l\x00\x00\x00\x01a\x01a\x02'
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+@vampytest._(vampytest.call_from(_iter_options__value_error()).raising(ValueError))
+def test__etf_decode(input_value):
+    """
+    Tests whether ``etf_decode`` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `bytes`
+        Value to decode.
+    
+    Returns
+    -------
+    output : `object`
+    
+    Raises
+    ------
+    ValueError
+    """
+    return etf_decode(input_value)
@@ -0,0 +1,99 @@
+from enum import Enum
+
+import vampytest
+
+from ..erlang_term_format import etf_decode, etf_encode
+
+
+class TestEnum(Enum):
+    koishi = 'koishi'
+
+
+def _iter_options__passing():
+    yield None, b'\x83w\x03nil'
+    yield True, b'\x83w\x04true'
+    yield False, b'\x83w\x05false'
+    yield 11, b'\x83a\x0b'
+    yield -2, b'\x83b\xff\xff\xff\xfe'
+    yield 202505100000000000, b'\x83n\x08\x00\x00x\xb4\xc6Pq\xcf\x02'
+    yield -(1 << 64), b'\x83n\x09\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01'
+    yield 1.5, b'\x83F?\xf8\x00\x00\x00\x00\x00\x00'
+    yield 'koishi こ', b'\x83m\x00\x00\x00\x0akoishi \xe3\x81\x93'
+    yield b'\x01\x02', b'\x83m\x00\x00\x00\x02\x01\x02'
+    yield [], b'\x83j'
+    yield [1, 'a'], b'\x83l\x00\x00\x00\x02a\x01m\x00\x00\x00\x01aj'
+    yield (1,), b'\x83l\x00\x00\x00\x01a\x01j'
+    yield {'op': 1, 'd': None}, b'\x83t\x00\x00\x00\x02m\x00\x00\x00\x02opa\x01m\x00\x00\x00\x01dw\x03nil'
+    yield TestEnum.koishi, b'\x83m\x00\x00\x00\x06koishi'
+
+
+def _iter_options__type_error():
+    yield object()
+    yield {'d': object()}
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+@vampytest._(vampytest.call_from(_iter_options__type_error()).raising(TypeError))
+def test__etf_encode(input_value):
+    """
+    Tests whether ``etf_encode`` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Value to encode.
+    
+    Returns
+    -------
+    output : `bytes`
+    
+    Raises
+    ------
+    TypeError
+    """
+    output = etf_encode(input_value)
+    vampytest.assert_instance(output, bytes)
+    return output
+
+
+def _iter_options__roundtrip():
+    yield None
+    yield True
+    yield 0
+    yield 255
+    yield 256
+    yield -2147483648
+    yield 2147483648
+    yield 202505100000000000
+    yield -(1 << 2048)
+    yield 0.25
+    yield ''
+    yield 'koishi'
+    yield []
+    yield {}
+    yield {
+        'op': 0,
+        's': 12,
+        't': 'MESSAGE_CREATE',
+        'd': {
+            'id': '202505100000000001',
+            'content': 'hey mister',
+            'mentions': [{'id': '202505100000000002', 'bot': False}],
+            'embeds': [],
+            'nonce': None,
+        },
+    }
+
+
+@vampytest._(vampytest.call_from(_iter_options__roundtrip()))
+def test__etf_encode__roundtrip(input_value):
+    """
+    Tests whether ``etf_encode`` output can be decoded by ``etf_decode`` resulting the original value.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Value to encode.
+    """
+    output = etf_decode(etf_encode(input_value))
+    vampytest.assert_eq(output, input_value)
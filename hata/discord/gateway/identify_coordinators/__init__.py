@@ -0,0 +1,12 @@
+from .base import *
+from .file import *
+from .local import *
+from .utils import *
+
+
+__all__ = (
+    *base.__all__,
+    *file.__all__,
+    *local.__all__,
+    *utils.__all__,
+)
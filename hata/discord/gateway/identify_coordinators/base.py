@@ -0,0 +1,106 @@
+__all__ = ('IdentifyCoordinatorBase',)
+
+from scarletio import RichAttributeErrorBaseType
+
+
+class IdentifyCoordinatorBase(RichAttributeErrorBaseType):
+    """
+    Base identify coordinator.
+    
+    Identify coordinators decide when shards can identify. Each shard belongs to the `shard_id % max_concurrency`
+    identify bucket and each bucket can be used once every 5 seconds.
+    
+    The base coordinator does not coordinate, lets every shard to identify instantly.
+    """
+    __slots__ = ()
+    
+    def __new__(cls):
+        """
+        Creates a new identify coordinator.
+        """
+        return object.__new__(cls)
+    
+    
+    def __repr__(self):
+        """Returns the identify coordinator's representation."""
+        repr_parts = ['<', type(self).__name__]
+        self._put_repr_parts_into(repr_parts)
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def _put_repr_parts_into(self, repr_parts):
+        """
+        Helper function for ``.__repr__`` to put the identify coordinator's representation parts into.
+        
+        Parameters
+        ----------
+        repr_parts : `list<str>`
+            Representation parts to extend.
+        """
+        pass
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two identify coordinators are the same."""
+        if type(self) is not type(other):
+            return NotImplemented
+        
+        return self._is_equal_same_type(other)
+    
+    
+    def _is_equal_same_type(self, other):
+        """
+        Returns whether the two identify coordinators of the same type are equal.
+        
+        Parameters
+        ----------
+        other : `instance<type<self>>`
+            The other identify coordinator.
+        
+        Returns
+        -------
+        is_equal : `bool`
+        """
+        return self is other
+    
+    
+    def __hash__(self):
+        """Returns the identify coordinator's hash value."""
+        return object.__hash__(self)
+    
+    
+    async def wait(self, shard_ids, max_concurrency):
+        """
+        Waits till the given shards can identify, without reserving their identify buckets.
+        
+        Used before connecting the shards, so they do not connect just to wait for their identify buckets.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        shard_ids : `list<int>`
+            The identifiers of the shards to identify.
+        max_concurrency : `int`
+            The maximal amount of shards that can be launched at the same time.
+        """
+        pass
+    
+    
+    async def acquire(self, shard_ids, max_concurrency):
+        """
+        Waits till the given shards can identify, then reserves their identify buckets.
+        
+        Should be called right before sending the identify.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        shard_ids : `list<int>`
+            The identifiers of the shards to identify.
+        max_concurrency : `int`
+            The maximal amount of shards that can be launched at the same time.
+        """
+        pass
@@ -0,0 +1,193 @@
+__all__ = ('IdentifyCoordinatorFile',)
+
+from os import O_CREAT, O_RDWR, fspath, open as open_file_descriptor
+from time import time as time_now
+
+from scarletio import alchemy_incendiary, copy_docs, from_json, sleep, to_json
+
+try:
+    from fcntl import LOCK_EX, LOCK_UN, flock
+except ImportError:
+    LOCK_EX = 0
+    LOCK_UN = 0
+    flock = None
+
+from ...core import KOKORO
+
+from ..constants import IDENTIFY_INTERVAL
+
+from .base import IdentifyCoordinatorBase
+from .utils import get_bucket_ids
+
+
+def _try_acquire_buckets(path, bucket_ids, reserve):
+    """
+    Tries to reserve the given identify buckets in the given file. If `reserve` is `False` only checks whether they
+    could be reserved.
+    
+    The file is locked while it is read and written, so it can be shared between processes. It contains a json
+    object mapping the buckets' identifiers to when they can be used again (unix time).
+    
+    This function is blocking, so should be ran in an executor.
+    
+    Parameters
+    ----------
+    path : `str`
+        Path to the file.
+    bucket_ids : `set<int>`
+        The identify buckets to reserve.
+    reserve : `bool`
+        Whether the buckets should be reserved.
+    
+    Returns
+    -------
+    delay : `float`
+        How much time needs to pass before the buckets can be reserved. `0.0` if they were reserved.
+    """
+    with open(open_file_descriptor(path, O_RDWR | O_CREAT, 0o600), 'r+b') as file:
+        flock(file.fileno(), LOCK_EX)
+        try:
+            data = file.read()
+            
+            bucket_resets_ats = None
+            if data:
+                try:
+                    bucket_resets_ats = from_json(data)
+                except ValueError:
+                    pass
+            
+            if not isinstance(bucket_resets_ats, dict):
+                bucket_resets_ats = {}
+            
+            now = time_now()
+            resets_at = max(
+                (bucket_resets_ats.get(str(bucket_id), 0.0) for bucket_id in bucket_ids),
+                default = 0.0,
+            )
+            if resets_at > now:
+                return resets_at - now
+            
+            if not reserve:
+                return 0.0
+            
+            resets_at = now + IDENTIFY_INTERVAL
+            for bucket_id in bucket_ids:
+                bucket_resets_ats[str(bucket_id)] = resets_at
+            
+            # Drop the expired buckets
+            bucket_resets_ats = {
+                bucket_id: bucket_resets_at for bucket_id, bucket_resets_at in bucket_resets_ats.items()
+                if bucket_resets_at > now
+            }
+            
+            file.seek(0)
+            file.truncate()
+            file.write(to_json(bucket_resets_ats).encode())
+            file.flush()
+        
+        finally:
+            flock(file.fileno(), LOCK_UN)
+    
+    return 0.0
+
+
+class IdentifyCoordinatorFile(IdentifyCoordinatorBase):
+    """
+    Identify coordinator coordinating the shards between processes on the same machine using a locked file.
+    
+    Every process of the same bot should use the same file.
+    
+    Attributes
+    ----------
+    path : `str`
+        Path to the file used to store when each identify bucket can be used again.
+    """
+    __slots__ = ('path',)
+    
+    def __new__(cls, path):
+        """
+        Creates a new file identify coordinator.
+        
+        Parameters
+        ----------
+        path : `str | PathLike`
+            Path to the file used to store when each identify bucket can be used again. Created if not exists.
+        
+        Raises
+        ------
+        RuntimeError
+            - If file locking is not supported on the platform.
+        TypeError
+            - If `path`'s type is incorrect.
+        """
+        if flock is None:
+            raise RuntimeError(
+                f'{cls.__name__} is not supported on this platform, since it requires `fcntl`.'
+            )
+        
+        path = fspath(path)
+        if not isinstance(path, str):
+            path = path.decode()
+        
+        self = object.__new__(cls)
+        self.path = path
+        return self
+    
+    
+    def __reduce__(self):
+        """Reduces the identify coordinator to picklable parts."""
+        return type(self), (self.path,)
+    
+    
+    @copy_docs(IdentifyCoordinatorBase._put_repr_parts_into)
+    def _put_repr_parts_into(self, repr_parts):
+        repr_parts.append(' path = ')
+        repr_parts.append(repr(self.path))
+    
+    
+    @copy_docs(IdentifyCoordinatorBase._is_equal_same_type)
+    def _is_equal_same_type(self, other):
+        return self.path == other.path
+    
+    
+    @copy_docs(IdentifyCoordinatorBase.__hash__)
+    def __hash__(self):
+        return hash(self.path)
+    
+    
+    @copy_docs(IdentifyCoordinatorBase.wait)
+    async def wait(self, shard_ids, max_concurrency):
+        await self._acquire(shard_ids, max_concurrency, False)
+    
+    
+    @copy_docs(IdentifyCoordinatorBase.acquire)
+    async def acquire(self, shard_ids, max_concurrency):
+        await self._acquire(shard_ids, max_concurrency, True)
+    
+    
+    async def _acquire(self, shard_ids, max_concurrency, reserve):
+        """
+        Waits till the given shards can identify. If `reserve` is `True` reserves their identify buckets as well.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        shard_ids : `list<int>`
+            The identifiers of the shards to identify.
+        max_concurrency : `int`
+            The maximal amount of shards that can be launched at the same time.
+        reserve : `bool`
+            Whether the identify buckets should be reserved.
+        """
+        bucket_ids = get_bucket_ids(shard_ids, max_concurrency)
+        
+        while True:
+            delay = await KOKORO.run_in_executor(
+                alchemy_incendiary(_try_acquire_buckets, (self.path, bucket_ids, reserve))
+            )
+            if delay <= 0.0:
+                break
+            
+            await sleep(delay, KOKORO)
+            continue
@@ -0,0 +1,68 @@
+__all__ = ('IdentifyCoordinatorLocal',)
+
+from scarletio import LOOP_TIME, Lock, copy_docs, sleep
+
+from ...core import KOKORO
+
+from ..constants import IDENTIFY_INTERVAL
+
+from .base import IdentifyCoordinatorBase
+from .utils import get_bucket_ids
+
+
+class IdentifyCoordinatorLocal(IdentifyCoordinatorBase):
+    """
+    Identify coordinator coordinating the shards inside of the process.
+    
+    Attributes
+    ----------
+    bucket_resets_ats : `dict<int, float>`
+        The identify buckets' identifiers to when they can be used again (monotonic).
+    lock : ``Lock``
+        Lock to serialize acquiring.
+    """
+    __slots__ = ('bucket_resets_ats', 'lock')
+    
+    def __new__(cls):
+        """
+        Creates a new local identify coordinator.
+        """
+        self = object.__new__(cls)
+        self.bucket_resets_ats = {}
+        self.lock = Lock(KOKORO)
+        return self
+    
+    
+    @copy_docs(IdentifyCoordinatorBase.wait)
+    async def wait(self, shard_ids, max_concurrency):
+        bucket_ids = get_bucket_ids(shard_ids, max_concurrency)
+        bucket_resets_ats = self.bucket_resets_ats
+        
+        while True:
+            now = LOOP_TIME()
+            resets_at = max((bucket_resets_ats.get(bucket_id, 0.0) for bucket_id in bucket_ids), default = 0.0)
+            if resets_at <= now:
+                break
+            
+            await sleep(resets_at - now, KOKORO)
+            continue
+    
+    
+    @copy_docs(IdentifyCoordinatorBase.acquire)
+    async def acquire(self, shard_ids, max_concurrency):
+        bucket_ids = get_bucket_ids(shard_ids, max_concurrency)
+        bucket_resets_ats = self.bucket_resets_ats
+        
+        async with self.lock:
+            while True:
+                now = LOOP_TIME()
+                resets_at = max((bucket_resets_ats.get(bucket_id, 0.0) for bucket_id in bucket_ids), default = 0.0)
+                if resets_at <= now:
+                    break
+                
+                await sleep(resets_at - now, KOKORO)
+                continue
+            
+            resets_at = now + IDENTIFY_INTERVAL
+            for bucket_id in bucket_ids:
+                bucket_resets_ats[bucket_id] = resets_at
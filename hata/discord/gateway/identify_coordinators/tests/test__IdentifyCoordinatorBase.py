@@ -0,0 +1,54 @@
+import vampytest
+
+from ..base import IdentifyCoordinatorBase
+
+
+def test__IdentifyCoordinatorBase__new():
+    """
+    Tests whether ``IdentifyCoordinatorBase.__new__`` works as intended.
+    """
+    identify_coordinator = IdentifyCoordinatorBase()
+    vampytest.assert_instance(identify_coordinator, IdentifyCoordinatorBase)
+
+
+def test__IdentifyCoordinatorBase__repr():
+    """
+    Tests whether ``IdentifyCoordinatorBase.__repr__`` works as intended.
+    """
+    identify_coordinator = IdentifyCoordinatorBase()
+    
+    output = repr(identify_coordinator)
+    vampytest.assert_instance(output, str)
+
+
+def test__IdentifyCoordinatorBase__eq():
+    """
+    Tests whether ``IdentifyCoordinatorBase.__eq__`` works as intended.
+    """
+    identify_coordinator = IdentifyCoordinatorBase()
+    
+    vampytest.assert_eq(identify_coordinator, identify_coordinator)
+    vampytest.assert_ne(identify_coordinator, IdentifyCoordinatorBase())
+    vampytest.assert_ne(identify_coordinator, object())
+
+
+def test__IdentifyCoordinatorBase__hash():
+    """
+    Tests whether ``IdentifyCoordinatorBase.__hash__`` works as intended.
+    """
+    identify_coordinator = IdentifyCoordinatorBase()
+    
+    output = hash(identify_coordinator)
+    vampytest.assert_instance(output, int)
+
+
+async def test__IdentifyCoordinatorBase__acquire():
+    """
+    Tests whether ``IdentifyCoordinatorBase.acquire`` works as intended.
+    
+    This function is a coroutine.
+    """
+    identify_coordinator = IdentifyCoordinatorBase()
+    
+    output = await identify_coordinator.acquire([0, 1], 2)
+    vampytest.assert_is(output, None)
@@ -0,0 +1,193 @@
+from os.path import join as join_paths
+from pickle import dumps as pickle_dumps, loads as pickle_loads
+from tempfile import TemporaryDirectory
+
+import vampytest
+from scarletio import from_json
+
+from ...constants import IDENTIFY_INTERVAL
+
+from ..file import IdentifyCoordinatorFile, _try_acquire_buckets, flock
+
+
+def _assert_fields_set(identify_coordinator):
+    """
+    Asserts whether every attribute is set of the given identify coordinator.
+    
+    Parameters
+    ----------
+    identify_coordinator : ``IdentifyCoordinatorFile``
+        The identify coordinator to check.
+    """
+    vampytest.assert_instance(identify_coordinator, IdentifyCoordinatorFile)
+    vampytest.assert_instance(identify_coordinator.path, str)
+
+
+@vampytest.skip_if(flock is None)
+def test__IdentifyCoordinatorFile__new():
+    """
+    Tests whether ``IdentifyCoordinatorFile.__new__`` works as intended.
+    """
+    path = '/tmp/identify'
+    
+    identify_coordinator = IdentifyCoordinatorFile(path)
+    _assert_fields_set(identify_coordinator)
+    
+    vampytest.assert_eq(identify_coordinator.path, path)
+
+
+@vampytest.skip_if(flock is None)
+def test__IdentifyCoordinatorFile__repr():
+    """
+    Tests whether ``IdentifyCoordinatorFile.__repr__`` works as intended.
+    """
+    identify_coordinator = IdentifyCoordinatorFile('/tmp/identify')
+    
+    output = repr(identify_coordinator)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in('/tmp/identify', output)
+
+
+def _iter_options__eq():
+    yield '/tmp/identify', '/tmp/identify', True
+    yield '/tmp/identify', '/tmp/satori', False
+
+
+@vampytest.skip_if(flock is None)
+@vampytest._(vampytest.call_from(_iter_options__eq()).returning_last())
+def test__IdentifyCoordinatorFile__eq(path_0, path_1):
+    """
+    Tests whether ``IdentifyCoordinatorFile.__eq__`` works as intended.
+    
+    Parameters
+    ----------
+    path_0 : `str`
+        Path to create instance with.
+    path_1 : `str`
+        Path to create instance with.
+    
+    Returns
+    -------
+    output : `bool`
+    """
+    identify_coordinator_0 = IdentifyCoordinatorFile(path_0)
+    identify_coordinator_1 = IdentifyCoordinatorFile(path_1)
+    
+    output = identify_coordinator_0 == identify_coordinator_1
+    vampytest.assert_instance(output, bool)
+    return output
+
+
+@vampytest.skip_if(flock is None)
+def test__IdentifyCoordinatorFile__pickle():
+    """
+    Tests whether ``IdentifyCoordinatorFile`` can be pickled.
+    """
+    identify_coordinator = IdentifyCoordinatorFile('/tmp/identify')
+    
+    output = pickle_loads(pickle_dumps(identify_coordinator))
+    _assert_fields_set(output)
+    vampytest.assert_eq(output, identify_coordinator)
+
+
+@vampytest.skip_if(flock is None)
+def test__try_acquire_buckets():
+    """
+    Tests whether ``_try_acquire_buckets`` works as intended.
+    """
+    with TemporaryDirectory() as directory_path:
+        path = join_paths(directory_path, 'identify')
+        
+        # First is instant.
+        output = _try_acquire_buckets(path, {0, 1}, True)
+        vampytest.assert_eq(output, 0.0)
+        
+        with open(path, 'rb') as file:
+            data = from_json(file.read())
+        
+        vampytest.assert_eq({*data.keys()}, {'0', '1'})
+        
+        # An other bucket is also instant.
+        output = _try_acquire_buckets(path, {2}, True)
+        vampytest.assert_eq(output, 0.0)
+        
+        # Same bucket should return delay.
+        output = _try_acquire_buckets(path, {1, 3}, True)
+        vampytest.assert_instance(output, float)
+        vampytest.assert_true(0.0 < output <= IDENTIFY_INTERVAL)
+
+
+@vampytest.skip_if(flock is None)
+def test__try_acquire_buckets__no_reserve():
+    """
+    Tests whether ``_try_acquire_buckets`` works as intended.
+    
+    Case: not reserving.
+    """
+    with TemporaryDirectory() as directory_path:
+        path = join_paths(directory_path, 'identify')
+        
+        # Checking does not reserve.
+        output = _try_acquire_buckets(path, {0}, False)
+        vampytest.assert_eq(output, 0.0)
+        
+        output = _try_acquire_buckets(path, {0}, True)
+        vampytest.assert_eq(output, 0.0)
+        
+        # Checking a reserved bucket should return delay.
+        output = _try_acquire_buckets(path, {0}, False)
+        vampytest.assert_instance(output, float)
+        vampytest.assert_true(0.0 < output <= IDENTIFY_INTERVAL)
+
+
+@vampytest.skip_if(flock is None)
+def test__try_acquire_buckets__invalid_data():
+    """
+    Tests whether ``_try_acquire_buckets`` works as intended.
+    
+    Case: invalid data in the file.
+    """
+    with TemporaryDirectory() as directory_path:
+        path = join_paths(directory_path, 'identify')
+        
+        with open(path, 'wb') as file:
+            file.write(b'[')
+        
+        output = _try_acquire_buckets(path, {0}, True)
+        vampytest.assert_eq(output, 0.0)
+
+
+@vampytest.skip_if(flock is None)
+async def test__IdentifyCoordinatorFile__acquire():
+    """
+    Tests whether ``IdentifyCoordinatorFile.acquire`` works as intended.
+    
+    This function is a coroutine.
+    """
+    with TemporaryDirectory() as directory_path:
+        identify_coordinator = IdentifyCoordinatorFile(join_paths(directory_path, 'identify'))
+        
+        await identify_coordinator.acquire([0, 1], 2)
+        
+        with open(identify_coordinator.path, 'rb') as file:
+            data = from_json(file.read())
+        
+        vampytest.assert_eq({*data.keys()}, {'0', '1'})
+
+
+@vampytest.skip_if(flock is None)
+async def test__IdentifyCoordinatorFile__wait():
+    """
+    Tests whether ``IdentifyCoordinatorFile.wait`` works as intended.
+    
+    This function is a coroutine.
+    """
+    with TemporaryDirectory() as directory_path:
+        identify_coordinator = IdentifyCoordinatorFile(join_paths(directory_path, 'identify'))
+        
+        await identify_coordinator.wait([0, 1], 2)
+        
+        with open(identify_coordinator.path, 'rb') as file:
+            data = file.read()
+        
+        vampytest.assert_eq(data, b'')
@@ -0,0 +1,111 @@
+import vampytest
+from scarletio import Lock
+
+from ...constants import IDENTIFY_INTERVAL
+
+from ..local import IdentifyCoordinatorLocal
+
+
+def _assert_fields_set(identify_coordinator):
+    """
+    Asserts whether every attribute is set of the given identify coordinator.
+    
+    Parameters
+    ----------
+    identify_coordinator : ``IdentifyCoordinatorLocal``
+        The identify coordinator to check.
+    """
+    vampytest.assert_instance(identify_coordinator, IdentifyCoordinatorLocal)
+    vampytest.assert_instance(identify_coordinator.bucket_resets_ats, dict)
+    vampytest.assert_instance(identify_coordinator.lock, Lock)
+
+
+def test__IdentifyCoordinatorLocal__new():
+    """
+    Tests whether ``IdentifyCoordinatorLocal.__new__`` works as intended.
+    """
+    identify_coordinator = IdentifyCoordinatorLocal()
+    _assert_fields_set(identify_coordinator)
+
+
+async def test__IdentifyCoordinatorLocal__acquire():
+    """
+    Tests whether ``IdentifyCoordinatorLocal.acquire`` works as intended.
+    
+    This function is a coroutine.
+    """
+    now = 1000.0
+    sleeps = []
+    
+    def mock_loop_time():
+        nonlocal now
+        return now
+    
+    async def mock_sleep(duration, loop):
+        nonlocal now
+        nonlocal sleeps
+        sleeps.append(duration)
+        now += duration
+    
+    mocked = vampytest.mock_globals(
+        IdentifyCoordinatorLocal.acquire,
+        LOOP_TIME = mock_loop_time,
+        sleep = mock_sleep,
+    )
+    
+    identify_coordinator = IdentifyCoordinatorLocal()
+    
+    # First batch is instant.
+    await mocked(identify_coordinator, [0, 1], 2)
+    vampytest.assert_eq(sleeps, [])
+    vampytest.assert_eq(identify_coordinator.bucket_resets_ats, {0: 1000.0 + IDENTIFY_INTERVAL, 1: 1000.0 + IDENTIFY_INTERVAL})
+    
+    # An other bucket is also instant.
+    await mocked(identify_coordinator, [2], 4)
+    vampytest.assert_eq(sleeps, [])
+    
+    # The same bucket should wait.
+    now += 1.0
+    await mocked(identify_coordinator, [2, 3], 2)
+    vampytest.assert_eq(sleeps, [IDENTIFY_INTERVAL - 1.0])
+    vampytest.assert_eq(identify_coordinator.bucket_resets_ats[0], now + IDENTIFY_INTERVAL)
+
+
+async def test__IdentifyCoordinatorLocal__wait():
+    """
+    Tests whether ``IdentifyCoordinatorLocal.wait`` works as intended.
+    
+    This function is a coroutine.
+    """
+    now = 1000.0
+    sleeps = []
+    
+    def mock_loop_time():
+        nonlocal now
+        return now
+    
+    async def mock_sleep(duration, loop):
+        nonlocal now
+        nonlocal sleeps
+        sleeps.append(duration)
+        now += duration
+    
+    mocked = vampytest.mock_globals(
+        IdentifyCoordinatorLocal.wait,
+        LOOP_TIME = mock_loop_time,
+        sleep = mock_sleep,
+    )
+    
+    identify_coordinator = IdentifyCoordinatorLocal()
+    
+    # Free bucket is instant and is not reserved.
+    await mocked(identify_coordinator, [0, 1], 2)
+    vampytest.assert_eq(sleeps, [])
+    vampytest.assert_eq(identify_coordinator.bucket_resets_ats, {})
+    
+    # Reserved bucket should wait.
+    identify_coordinator.bucket_resets_ats[1] = now + IDENTIFY_INTERVAL
+    now += 1.0
+    await mocked(identify_coordinator, [1], 2)
+    vampytest.assert_eq(sleeps, [IDENTIFY_INTERVAL - 1.0])
+    vampytest.assert_eq(identify_coordinator.bucket_resets_ats, {1: now})
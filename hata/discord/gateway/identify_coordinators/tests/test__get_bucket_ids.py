@@ -0,0 +1,30 @@
+import vampytest
+
+from ..utils import get_bucket_ids
+
+
+def _iter_options():
+    yield [0, 1, 2, 3], 1, {0}
+    yield [0, 1, 2, 3], 4, {0, 1, 2, 3}
+    yield [4, 5, 20], 16, {4, 5}
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__get_bucket_ids(shard_ids, max_concurrency):
+    """
+    Tests whether ``get_bucket_ids`` works as intended.
+    
+    Parameters
+    ----------
+    shard_ids : `list<int>`
+        The identifiers of the shards.
+    max_concurrency : `int`
+        The maximal amount of shards that can be launched at the same time.
+    
+    Returns
+    -------
+    output : `set<int>`
+    """
+    output = get_bucket_ids(shard_ids, max_concurrency)
+    vampytest.assert_instance(output, set)
+    return output
@@ -0,0 +1,19 @@
+__all__ = ()
+
+
+def get_bucket_ids(shard_ids, max_concurrency):
+    """
+    Returns the identify buckets' identifiers of the given shards.
+    
+    Parameters
+    ----------
+    shard_ids : `list<int>`
+        The identifiers of the shards.
+    max_concurrency : `int`
+        The maximal amount of shards that can be launched at the same time.
+    
+    Returns
+    -------
+    bucket_ids : `set<int>`
+    """
+    return {shard_id % max_concurrency for shard_id in shard_ids}
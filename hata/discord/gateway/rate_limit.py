@@ -94,6 +94,20 @@ class GatewayRateLimiter(RichAttributeErrorBaseType):
     __await__ = __iter__
     
     
+    def get_remaining(self):
+        """
+        Returns how much actions can be executed before the limit is exhausted.
+        
+        Returns
+        -------
+        remaining : `int`
+        """
+        if LOOP_TIME() >= self.resets_at:
+            return GATEWAY_RATE_LIMIT_LIMIT
+        
+        return self.remaining
+    
+    
     def wake_up(self):
         """
         Wake ups the waiting futures of the gateway rate limiter.
@@ -0,0 +1,252 @@
+__all__ = ()
+
+from collections import deque
+
+from scarletio import CancelledError, Future, LOOP_TIME, RichAttributeErrorBaseType, Task, shield, sleep
+
+from ..core import KOKORO
+
+from .constants import (
+    GATEWAY_OPERATION_CLIENT_HEARTBEAT, GATEWAY_OPERATION_CLIENT_IDENTIFY, GATEWAY_OPERATION_CLIENT_PRESENCE,
+    GATEWAY_OPERATION_CLIENT_RESUME, GATEWAY_OPERATION_CLIENT_VOICE_STATE, GATEWAY_RATE_LIMIT_RESERVED
+)
+
+
+PRIORITY_OPERATIONS = frozenset((
+    GATEWAY_OPERATION_CLIENT_HEARTBEAT,
+    GATEWAY_OPERATION_CLIENT_IDENTIFY,
+    GATEWAY_OPERATION_CLIENT_RESUME,
+))
+
+
+def is_priority_command(data):
+    """
+    Returns whether the given command should be sent bypassing the send queue. Heartbeats, identifies and resumes
+    are such.
+    
+    Parameters
+    ----------
+    data : `dict<str, object>`
+        The command to send.
+    
+    Returns
+    -------
+    is_priority : `bool`
+    """
+    return data.get('op', None) in PRIORITY_OPERATIONS
+
+
+def get_command_key(data):
+    """
+    Returns the key of the given command. Queued commands with the same key supersede each other.
+    
+    Parameters
+    ----------
+    data : `dict<str, object>`
+        The command to send.
+    
+    Returns
+    -------
+    command_key : `None | (int, None | str)`
+        Returns `None` if the command cannot be superseded.
+    """
+    operation = data.get('op', None)
+    if operation == GATEWAY_OPERATION_CLIENT_PRESENCE:
+        return (operation, None)
+    
+    if operation == GATEWAY_OPERATION_CLIENT_VOICE_STATE:
+        return (operation, data['d'].get('guild_id', None))
+    
+    return None
+
+
+class GatewaySendQueue(RichAttributeErrorBaseType):
+    """
+    Outbound command queue of a gateway.
+    
+    The queued commands are sent in order while more than the reserved amount of the gateway's rate limit remains,
+    so heartbeats always have room. If a command is queued while an other one with the same key is still waiting,
+    the waiting one is replaced, like repeated presence updates.
+    
+    Attributes
+    ----------
+    coalesced_count : `int`
+        How much commands replaced an already queued one.
+    entries : `deque<list<(None | (int, None | str), bytes | str, Future)>>`
+        The queued commands. Each element contains the command's key, its encoded data and a waiter resolved when it
+        is sent.
+    keyed_entries : `dict<(int, None | str), list<(None | (int, None | str), bytes | str, Future)>>`
+        Command key to queued entry relation.
+    maximal_depth : `int`
+        The maximal amount of commands queued at the same time.
+    rate_limiter : ``GatewayRateLimiter``
+        The gateway's rate limiter.
+    send : `CoroutineFunctionType`
+        Sends the encoded data over the gateway.
+    sent_count : `int`
+        How much commands were sent from the queue.
+    task : `None | Task<._drain>`
+        Task sending the queued commands.
+    """
+    __slots__ = (
+        'coalesced_count', 'entries', 'keyed_entries', 'maximal_depth', 'rate_limiter', 'send', 'sent_count', 'task'
+    )
+    
+    def __new__(cls, rate_limiter, send):
+        """
+        Creates a new gateway send queue.
+        
+        Parameters
+        ----------
+        rate_limiter : ``GatewayRateLimiter``
+            The gateway's rate limiter.
+        send : `CoroutineFunctionType`
+            Sends the encoded data over the gateway.
+        """
+        self = object.__new__(cls)
+        self.coalesced_count = 0
+        self.entries = deque()
+        self.keyed_entries = {}
+        self.maximal_depth = 0
+        self.rate_limiter = rate_limiter
+        self.send = send
+        self.sent_count = 0
+        self.task = None
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the gateway send queue's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' depth = ')
+        repr_parts.append(repr(len(self.entries)))
+        
+        repr_parts.append(', sent_count = ')
+        repr_parts.append(repr(self.sent_count))
+        
+        repr_parts.append(', coalesced_count = ')
+        repr_parts.append(repr(self.coalesced_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __len__(self):
+        """Returns the amount of the queued commands."""
+        return len(self.entries)
+    
+    
+    async def put(self, data, command_key):
+        """
+        Queues the given command and waits till it is sent.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        data : `bytes | str`
+            The encoded command.
+        command_key : `None | (int, None | str)`
+            The command's key. Queued commands with the same key supersede each other.
+        """
+        entry = None
+        if (command_key is not None):
+            entry = self.keyed_entries.get(command_key, None)
+        
+        if (entry is not None):
+            entry[1] = data
+            self.coalesced_count += 1
+        
+        else:
+            entry = [command_key, data, Future(KOKORO)]
+            entries = self.entries
+            entries.append(entry)
+            if (command_key is not None):
+                self.keyed_entries[command_key] = entry
+            
+            depth = len(entries)
+            if depth > self.maximal_depth:
+                self.maximal_depth = depth
+            
+            if self.task is None:
+                self.task = Task(KOKORO, self._drain())
+        
+        # Shield, so a cancelled caller does not cancel the waiter of the commands coalesced into the same entry.
+        await shield(entry[2], KOKORO)
+    
+    
+    async def _drain(self):
+        """
+        Sends the queued commands.
+        
+        This method is a coroutine.
+        """
+        entries = self.entries
+        keyed_entries = self.keyed_entries
+        rate_limiter = self.rate_limiter
+        
+        try:
+            while entries:
+                if rate_limiter.get_remaining() <= GATEWAY_RATE_LIMIT_RESERVED:
+                    await sleep(max(rate_limiter.resets_at - LOOP_TIME(), 0.0), KOKORO)
+                    continue
+                
+                command_key, data, waiter = entries.popleft()
+                if (command_key is not None):
+                    del keyed_entries[command_key]
+                
+                try:
+                    await self.send(data)
+                except CancelledError:
+                    waiter.set_result_if_pending(None)
+                    raise
+                except BaseException as exception:
+                    waiter.set_exception_if_pending(exception)
+                    raise
+                
+                self.sent_count += 1
+                waiter.set_result_if_pending(None)
+        
+        except CancelledError:
+            # Cancelled by `.clear`, which already removed the task.
+            raise
+        
+        except:
+            self.task = None
+            raise
+        
+        else:
+            self.task = None
+    
+    
+    def clear(self):
+        """
+        Drops the queued commands, releasing their senders.
+        """
+        task = self.task
+        if (task is not None):
+            self.task = None
+            task.cancel()
+        
+        entries = self.entries
+        while entries:
+            entries.popleft()[2].set_result_if_pending(None)
+        
+        self.keyed_entries.clear()
+    
+    
+    def get_statistics(self):
+        """
+        Returns the send queue's statistics.
+        
+        Returns
+        -------
+        statistics : `dict<str, int>`
+        """
+        return {
+            'coalesced_count': self.coalesced_count,
+            'depth': len(self.entries),
+            'maximal_depth': self.maximal_depth,
+            'sent_count': self.sent_count,
+        }
@@ -0,0 +1,8 @@
+from .base import *
+from .file import *
+
+
+__all__ = (
+    *base.__all__,
+    *file.__all__,
+)
@@ -0,0 +1,163 @@
+__all__ = ('SessionStoreBase',)
+
+from scarletio import RichAttributeErrorBaseType
+
+
+class SessionStoreBase(RichAttributeErrorBaseType):
+    """
+    Base session store.
+    
+    Session stores persist the shards' resume state (and optionally a snapshot of the entity caches) when the client
+    is stopped, so after a restart the shards can resume their sessions instead of identifying again.
+    
+    The base session store does not store anything.
+    
+    Attributes
+    ----------
+    cache_snapshot : `bool`
+        Whether a snapshot of the entity caches should be stored as well.
+    """
+    __slots__ = ('cache_snapshot',)
+    
+    def __new__(cls, *, cache_snapshot = False):
+        """
+        Creates a new session store.
+        
+        Parameters
+        ----------
+        cache_snapshot : `bool` = `False`, Optional (Keyword only)
+            Whether a snapshot of the entity caches should be stored as well.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        """
+        if not isinstance(cache_snapshot, bool):
+            raise TypeError(
+                f'`cache_snapshot` can be `bool`, got {cache_snapshot.__class__.__name__}; {cache_snapshot!r}.'
+            )
+        
+        self = object.__new__(cls)
+        self.cache_snapshot = cache_snapshot
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the session store's representation."""
+        repr_parts = ['<', type(self).__name__]
+        self._put_repr_parts_into(repr_parts)
+        
+        if self.cache_snapshot:
+            repr_parts.append(' cache_snapshot')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def _put_repr_parts_into(self, repr_parts):
+        """
+        Helper function for ``.__repr__`` to put the session store's representation parts into.
+        
+        Parameters
+        ----------
+        repr_parts : `list<str>`
+            Representation parts to extend.
+        """
+        pass
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two session stores are the same."""
+        if type(self) is not type(other):
+            return NotImplemented
+        
+        if self.cache_snapshot != other.cache_snapshot:
+            return False
+        
+        return self._is_equal_same_type(other)
+    
+    
+    def _is_equal_same_type(self, other):
+        """
+        Returns whether the two session stores of the same type are equal.
+        
+        Parameters
+        ----------
+        other : `instance<type<self>>`
+            The other session store.
+        
+        Returns
+        -------
+        is_equal : `bool`
+        """
+        return self is other
+    
+    
+    def __hash__(self):
+        """Returns the session store's hash value."""
+        return object.__hash__(self)
+    
+    
+    async def load_session(self, shard_id):
+        """
+        Loads the stored session of the given shard. A stored session can be loaded only once.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        shard_id : `int`
+            The shard's identifier.
+        
+        Returns
+        -------
+        session : `None | dict<str, object>`
+            The session's `'session_id'`, `'resume_gateway_url'` and `'sequence'`. `None` if there is no stored
+            session or if it is outdated.
+        """
+        return None
+    
+    
+    async def store_session(self, shard_id, session):
+        """
+        Stores the session of the given shard.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        shard_id : `int`
+            The shard's identifier.
+        session : `dict<str, object>`
+            The session's `'session_id'`, `'resume_gateway_url'` and `'sequence'`.
+        """
+        pass
+    
+    
+    async def load_cache_snapshot(self):
+        """
+        Loads the stored entity cache snapshot. A stored snapshot can be loaded only once.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        cache_snapshot : `None | bytes`
+            The snapshot in its binary form. `None` if there is no stored snapshot or if it is outdated.
+        """
+        return None
+    
+    
+    async def store_cache_snapshot(self, cache_snapshot):
+        """
+        Stores the given entity cache snapshot.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        cache_snapshot : `bytes`
+            The snapshot of the entity caches in its binary form.
+        """
+        pass
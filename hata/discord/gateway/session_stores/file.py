@@ -0,0 +1,293 @@
+__all__ = ('SessionStoreFile',)
+
+from os import fspath, makedirs, remove as remove_file, replace as replace_file, stat as get_file_stat
+from os.path import join as join_paths
+from time import time as time_now
+
+from scarletio import alchemy_incendiary, copy_docs, from_json, to_json
+
+from ...core import KOKORO
+
+from ..constants import CACHE_SNAPSHOT_MAX_AGE, SESSION_MAX_AGE
+
+from .base import SessionStoreBase
+
+
+FILE_NAME_CACHE_SNAPSHOT = 'cache_snapshot.bin'
+
+
+def _read_and_remove(path):
+    """
+    Reads the stored value from the given file, then removes the file.
+    
+    This function is blocking, so should be ran in an executor.
+    
+    Parameters
+    ----------
+    path : `str`
+        Path to the file.
+    
+    Returns
+    -------
+    value : `None | object`
+        `None` if the file does not exist, is invalid or outdated.
+    """
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+    except FileNotFoundError:
+        return None
+    
+    try:
+        remove_file(path)
+    except FileNotFoundError:
+        pass
+    
+    try:
+        data = from_json(data)
+    except ValueError:
+        return None
+    
+    if not isinstance(data, dict):
+        return None
+    
+    stored_at = data.get('stored_at', None)
+    if (not isinstance(stored_at, float)) or (time_now() - stored_at > SESSION_MAX_AGE):
+        return None
+    
+    return data.get('value', None)
+
+
+def _read_bytes_and_remove(path, max_age):
+    """
+    Reads the given file's content, then removes the file.
+    
+    This function is blocking, so should be ran in an executor.
+    
+    Parameters
+    ----------
+    path : `str`
+        Path to the file.
+    max_age : `float`
+        The maximal age of the file in seconds.
+    
+    Returns
+    -------
+    data : `None | bytes`
+        `None` if the file does not exist or is outdated.
+    """
+    try:
+        modified_at = get_file_stat(path).st_mtime
+        with open(path, 'rb') as file:
+            data = file.read()
+    except FileNotFoundError:
+        return None
+    
+    try:
+        remove_file(path)
+    except FileNotFoundError:
+        pass
+    
+    if time_now() - modified_at > max_age:
+        return None
+    
+    return data
+
+
+def _write_bytes(directory_path, file_name, data):
+    """
+    Writes the given data into the given file. The file is replaced atomically.
+    
+    This function is blocking, so should be ran in an executor.
+    
+    Parameters
+    ----------
+    directory_path : `str`
+        Path to the directory to write into. Created if not exists.
+    file_name : `str`
+        The file's name.
+    data : `bytes`
+        The data to write.
+    """
+    makedirs(directory_path, exist_ok = True)
+    
+    path = join_paths(directory_path, file_name)
+    temporary_path = f'{path}.tmp'
+    
+    with open(temporary_path, 'wb') as file:
+        file.write(data)
+    
+    replace_file(temporary_path, path)
+
+
+def _write(directory_path, file_name, value):
+    """
+    Writes the given value into the given file. The file is replaced atomically.
+    
+    This function is blocking, so should be ran in an executor.
+    
+    Parameters
+    ----------
+    directory_path : `str`
+        Path to the directory to write into. Created if not exists.
+    file_name : `str`
+        The file's name.
+    value : `object`
+        Json serializable value to write.
+    """
+    _write_bytes(directory_path, file_name, to_json({'stored_at': time_now(), 'value': value}).encode())
+
+
+def _validate_session(session):
+    """
+    Validates a loaded session.
+    
+    Parameters
+    ----------
+    session : `None | object`
+        The loaded session.
+    
+    Returns
+    -------
+    session : `None | dict<str, object>`
+    """
+    if not isinstance(session, dict):
+        return None
+    
+    if not isinstance(session.get('session_id', None), str):
+        return None
+    
+    resume_gateway_url = session.get('resume_gateway_url', None)
+    if (resume_gateway_url is not None) and (not isinstance(resume_gateway_url, str)):
+        return None
+    
+    sequence = session.get('sequence', None)
+    if (not isinstance(sequence, int)) or isinstance(sequence, bool):
+        return None
+    
+    return session
+
+
+class SessionStoreFile(SessionStoreBase):
+    """
+    Session store storing each shard's session in a separate json file in a directory.
+    
+    The stored sessions are only loaded if they are not older than 2 minutes, since Discord drops them anyways.
+    The cache snapshot is stored in its binary form and is loaded if not older than a day.
+    
+    Attributes
+    ----------
+    cache_snapshot : `bool`
+        Whether a snapshot of the entity caches should be stored as well.
+    directory_path : `str`
+        Path to the directory to store the files in.
+    """
+    __slots__ = ('directory_path',)
+    
+    def __new__(cls, directory_path, *, cache_snapshot = False):
+        """
+        Creates a new file session store.
+        
+        Parameters
+        ----------
+        directory_path : `str | PathLike`
+            Path to the directory to store the files in. Created if not exists.
+        cache_snapshot : `bool` = `False`, Optional (Keyword only)
+            Whether a snapshot of the entity caches should be stored as well.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        """
+        directory_path = fspath(directory_path)
+        if not isinstance(directory_path, str):
+            directory_path = directory_path.decode()
+        
+        self = SessionStoreBase.__new__(cls, cache_snapshot = cache_snapshot)
+        self.directory_path = directory_path
+        return self
+    
+    
+    def __reduce__(self):
+        """Reduces the session store to picklable parts."""
+        return _rebuild_session_store_file, (self.directory_path, self.cache_snapshot)
+    
+    
+    @copy_docs(SessionStoreBase._put_repr_parts_into)
+    def _put_repr_parts_into(self, repr_parts):
+        repr_parts.append(' directory_path = ')
+        repr_parts.append(repr(self.directory_path))
+    
+    
+    @copy_docs(SessionStoreBase._is_equal_same_type)
+    def _is_equal_same_type(self, other):
+        return self.directory_path == other.directory_path
+    
+    
+    @copy_docs(SessionStoreBase.__hash__)
+    def __hash__(self):
+        return hash(self.directory_path) ^ self.cache_snapshot
+    
+    
+    def _get_session_file_name(self, shard_id):
+        """
+        Returns the file name used to store the given shard's session.
+        
+        Parameters
+        ----------
+        shard_id : `int`
+            The shard's identifier.
+        
+        Returns
+        -------
+        file_name : `str`
+        """
+        return f'session_{shard_id}.json'
+    
+    
+    @copy_docs(SessionStoreBase.load_session)
+    async def load_session(self, shard_id):
+        session = await KOKORO.run_in_executor(alchemy_incendiary(
+            _read_and_remove, (join_paths(self.directory_path, self._get_session_file_name(shard_id)),),
+        ))
+        return _validate_session(session)
+    
+    
+    @copy_docs(SessionStoreBase.store_session)
+    async def store_session(self, shard_id, session):
+        await KOKORO.run_in_executor(alchemy_incendiary(
+            _write, (self.directory_path, self._get_session_file_name(shard_id), session),
+        ))
+    
+    
+    @copy_docs(SessionStoreBase.load_cache_snapshot)
+    async def load_cache_snapshot(self):
+        return await KOKORO.run_in_executor(alchemy_incendiary(
+            _read_bytes_and_remove, (join_paths(self.directory_path, FILE_NAME_CACHE_SNAPSHOT), CACHE_SNAPSHOT_MAX_AGE),
+        ))
+    
+    
+    @copy_docs(SessionStoreBase.store_cache_snapshot)
+    async def store_cache_snapshot(self, cache_snapshot):
+        await KOKORO.run_in_executor(alchemy_incendiary(
+            _write_bytes, (self.directory_path, FILE_NAME_CACHE_SNAPSHOT, cache_snapshot),
+        ))
+
+
+def _rebuild_session_store_file(directory_path, cache_snapshot):
+    """
+    Rebuilds a pickled file session store.
+    
+    Parameters
+    ----------
+    directory_path : `str`
+        Path to the directory to store the files in.
+    cache_snapshot : `bool`
+        Whether a snapshot of the entity caches should be stored as well.
+    
+    Returns
+    -------
+    session_store : ``SessionStoreFile``
+    """
+    return SessionStoreFile(directory_path, cache_snapshot = cache_snapshot)
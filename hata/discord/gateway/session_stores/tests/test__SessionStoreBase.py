@@ -0,0 +1,109 @@
+import vampytest
+
+from ..base import SessionStoreBase
+
+
+def _assert_fields_set(session_store):
+    """
+    Asserts whether every attribute is set of the given session store.
+    
+    Parameters
+    ----------
+    session_store : ``SessionStoreBase``
+        The session store to check.
+    """
+    vampytest.assert_instance(session_store, SessionStoreBase)
+    vampytest.assert_instance(session_store.cache_snapshot, bool)
+
+
+def test__SessionStoreBase__new__no_fields():
+    """
+    Tests whether ``SessionStoreBase.__new__`` works as intended.
+    
+    Case: no fields given.
+    """
+    session_store = SessionStoreBase()
+    _assert_fields_set(session_store)
+    
+    vampytest.assert_eq(session_store.cache_snapshot, False)
+
+
+def test__SessionStoreBase__new__all_fields():
+    """
+    Tests whether ``SessionStoreBase.__new__`` works as intended.
+    
+    Case: all fields given.
+    """
+    cache_snapshot = True
+    
+    session_store = SessionStoreBase(cache_snapshot = cache_snapshot)
+    _assert_fields_set(session_store)
+    
+    vampytest.assert_eq(session_store.cache_snapshot, cache_snapshot)
+
+
+def test__SessionStoreBase__new__type_error():
+    """
+    Tests whether ``SessionStoreBase.__new__`` works as intended.
+    
+    Case: type error.
+    """
+    with vampytest.assert_raises(TypeError):
+        SessionStoreBase(cache_snapshot = 1)
+
+
+def test__SessionStoreBase__repr():
+    """
+    Tests whether ``SessionStoreBase.__repr__`` works as intended.
+    """
+    session_store = SessionStoreBase(cache_snapshot = True)
+    
+    output = repr(session_store)
+    vampytest.assert_instance(output, str)
+
+
+def test__SessionStoreBase__eq():
+    """
+    Tests whether ``SessionStoreBase.__eq__`` works as intended.
+    """
+    session_store = SessionStoreBase()
+    
+    vampytest.assert_eq(session_store, session_store)
+    vampytest.assert_ne(session_store, SessionStoreBase())
+    vampytest.assert_ne(session_store, object())
+
+
+def test__SessionStoreBase__hash():
+    """
+    Tests whether ``SessionStoreBase.__hash__`` works as intended.
+    """
+    session_store = SessionStoreBase()
+    
+    output = hash(session_store)
+    vampytest.assert_instance(output, int)
+
+
+async def test__SessionStoreBase__sessions():
+    """
+    Tests whether ``SessionStoreBase.store_session`` and ``.load_session`` works as intended.
+    
+    This function is a coroutine.
+    """
+    session_store = SessionStoreBase()
+    
+    await session_store.store_session(0, {'session_id': 'okuu', 'resume_gateway_url': None, 'sequence': 12})
+    output = await session_store.load_session(0)
+    vampytest.assert_is(output, None)
+
+
+async def test__SessionStoreBase__cache_snapshot():
+    """
+    Tests whether ``SessionStoreBase.store_cache_snapshot`` and ``.load_cache_snapshot`` works as intended.
+    
+    This function is a coroutine.
+    """
+    session_store = SessionStoreBase(cache_snapshot = True)
+    
+    await session_store.store_cache_snapshot(b'HCS\x01satori')
+    output = await session_store.load_cache_snapshot()
+    vampytest.assert_is(output, None)
@@ -0,0 +1,266 @@
+from os import utime as set_file_times
+from os.path import exists, join as join_paths
+from pickle import dumps as pickle_dumps, loads as pickle_loads
+from tempfile import TemporaryDirectory
+
+import vampytest
+from scarletio import to_json
+
+from ..file import SessionStoreFile, _validate_session
+
+
+def _assert_fields_set(session_store):
+    """
+    Asserts whether every attribute is set of the given session store.
+    
+    Parameters
+    ----------
+    session_store : ``SessionStoreFile``
+        The session store to check.
+    """
+    vampytest.assert_instance(session_store, SessionStoreFile)
+    vampytest.assert_instance(session_store.cache_snapshot, bool)
+    vampytest.assert_instance(session_store.directory_path, str)
+
+
+def test__SessionStoreFile__new():
+    """
+    Tests whether ``SessionStoreFile.__new__`` works as intended.
+    """
+    directory_path = '/tmp/sessions'
+    cache_snapshot = True
+    
+    session_store = SessionStoreFile(directory_path, cache_snapshot = cache_snapshot)
+    _assert_fields_set(session_store)
+    
+    vampytest.assert_eq(session_store.directory_path, directory_path)
+    vampytest.assert_eq(session_store.cache_snapshot, cache_snapshot)
+
+
+def test__SessionStoreFile__repr():
+    """
+    Tests whether ``SessionStoreFile.__repr__`` works as intended.
+    """
+    session_store = SessionStoreFile('/tmp/sessions', cache_snapshot = True)
+    
+    output = repr(session_store)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in('/tmp/sessions', output)
+
+
+def _iter_options__eq():
+    keyword_parameters = {
+        'directory_path': '/tmp/sessions',
+        'cache_snapshot': True,
+    }
+    
+    yield keyword_parameters, keyword_parameters, True
+    
+    yield (
+        keyword_parameters,
+        {
+            **keyword_parameters,
+            'directory_path': '/tmp/satori',
+        },
+        False,
+    )
+    
+    yield (
+        keyword_parameters,
+        {
+            **keyword_parameters,
+            'cache_snapshot': False,
+        },
+        False,
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__eq()).returning_last())
+def test__SessionStoreFile__eq(keyword_parameters_0, keyword_parameters_1):
+    """
+    Tests whether ``SessionStoreFile.__eq__`` works as intended.
+    
+    Parameters
+    ----------
+    keyword_parameters_0 : `dict<str, object>`
+        Keyword parameters to create instance with.
+    keyword_parameters_1 : `dict<str, object>`
+        Keyword parameters to create instance with.
+    
+    Returns
+    -------
+    output : `bool`
+    """
+    session_store_0 = SessionStoreFile(**keyword_parameters_0)
+    session_store_1 = SessionStoreFile(**keyword_parameters_1)
+    
+    output = session_store_0 == session_store_1
+    vampytest.assert_instance(output, bool)
+    return output
+
+
+def test__SessionStoreFile__hash():
+    """
+    Tests whether ``SessionStoreFile.__hash__`` works as intended.
+    """
+    session_store = SessionStoreFile('/tmp/sessions', cache_snapshot = True)
+    
+    output = hash(session_store)
+    vampytest.assert_instance(output, int)
+
+
+def test__SessionStoreFile__pickle():
+    """
+    Tests whether ``SessionStoreFile`` can be pickled.
+    """
+    session_store = SessionStoreFile('/tmp/sessions', cache_snapshot = True)
+    
+    output = pickle_loads(pickle_dumps(session_store))
+    _assert_fields_set(output)
+    vampytest.assert_eq(output, session_store)
+
+
+async def test__SessionStoreFile__sessions():
+    """
+    Tests whether ``SessionStoreFile.store_session`` and ``.load_session`` works as intended.
+    
+    This function is a coroutine.
+    """
+    session = {
+        'session_id': 'okuu',
+        'resume_gateway_url': 'wss://koishi.nyan/',
+        'sequence': 12,
+    }
+    
+    with TemporaryDirectory() as directory_path:
+        session_store = SessionStoreFile(join_paths(directory_path, 'sessions'))
+        
+        await session_store.store_session(2, session)
+        
+        output = await session_store.load_session(1)
+        vampytest.assert_is(output, None)
+        
+        output = await session_store.load_session(2)
+        vampytest.assert_eq(output, session)
+        
+        # Can be loaded only once.
+        output = await session_store.load_session(2)
+        vampytest.assert_is(output, None)
+
+
+async def test__SessionStoreFile__load_session__outdated():
+    """
+    Tests whether ``SessionStoreFile.load_session`` works as intended.
+    
+    Case: outdated.
+    
+    This function is a coroutine.
+    """
+    with TemporaryDirectory() as directory_path:
+        session_store = SessionStoreFile(directory_path)
+        
+        with open(join_paths(directory_path, 'session_0.json'), 'wb') as file:
+            file.write(to_json({
+                'stored_at': 1.0,
+                'value': {'session_id': 'okuu', 'resume_gateway_url': None, 'sequence': 12},
+            }).encode())
+        
+        output = await session_store.load_session(0)
+        vampytest.assert_is(output, None)
+        vampytest.assert_false(exists(join_paths(directory_path, 'session_0.json')))
+
+
+async def test__SessionStoreFile__load_session__invalid():
+    """
+    Tests whether ``SessionStoreFile.load_session`` works as intended.
+    
+    Case: invalid file.
+    
+    This function is a coroutine.
+    """
+    with TemporaryDirectory() as directory_path:
+        session_store = SessionStoreFile(directory_path)
+        
+        with open(join_paths(directory_path, 'session_0.json'), 'wb') as file:
+            file.write(b'{')
+        
+        output = await session_store.load_session(0)
+        vampytest.assert_is(output, None)
+
+
+async def test__SessionStoreFile__cache_snapshot():
+    """
+    Tests whether ``SessionStoreFile.store_cache_snapshot`` and ``.load_cache_snapshot`` works as intended.
+    
+    This function is a coroutine.
+    """
+    cache_snapshot = b'HCS\x01satori'
+    
+    with TemporaryDirectory() as directory_path:
+        session_store = SessionStoreFile(directory_path, cache_snapshot = True)
+        
+        output = await session_store.load_cache_snapshot()
+        vampytest.assert_is(output, None)
+        
+        await session_store.store_cache_snapshot(cache_snapshot)
+        
+        output = await session_store.load_cache_snapshot()
+        vampytest.assert_eq(output, cache_snapshot)
+        
+        # Can be loaded only once.
+        output = await session_store.load_cache_snapshot()
+        vampytest.assert_is(output, None)
+
+
+async def test__SessionStoreFile__load_cache_snapshot__outdated():
+    """
+    Tests whether ``SessionStoreFile.load_cache_snapshot`` works as intended.
+    
+    Case: outdated.
+    
+    This function is a coroutine.
+    """
+    with TemporaryDirectory() as directory_path:
+        session_store = SessionStoreFile(directory_path, cache_snapshot = True)
+        
+        await session_store.store_cache_snapshot(b'HCS\x01satori')
+        
+        path = join_paths(directory_path, 'cache_snapshot.bin')
+        set_file_times(path, (1.0, 1.0))
+        
+        output = await session_store.load_cache_snapshot()
+        vampytest.assert_is(output, None)
+        vampytest.assert_false(exists(path))
+
+
+def _iter_options__validate_session():
+    yield None, None
+    yield [], None
+    yield {'session_id': 'okuu', 'resume_gateway_url': None, 'sequence': 12}, True
+    yield {'session_id': 'okuu', 'resume_gateway_url': 'wss://koishi.nyan/', 'sequence': 12}, True
+    yield {'session_id': 12, 'resume_gateway_url': None, 'sequence': 12}, None
+    yield {'session_id': 'okuu', 'resume_gateway_url': 12, 'sequence': 12}, None
+    yield {'session_id': 'okuu', 'resume_gateway_url': None, 'sequence': '12'}, None
+    yield {'session_id': 'okuu', 'resume_gateway_url': None, 'sequence': True}, None
+
+
+@vampytest._(vampytest.call_from(_iter_options__validate_session()).returning_last())
+def test__validate_session(input_value):
+    """
+    Tests whether ``_validate_session`` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Value to validate.
+    
+    Returns
+    -------
+    output : `None | bool`
+        Whether the input was returned.
+    """
+    output = _validate_session(input_value)
+    if output is None:
+        return None
+    
+    return output is input_value
@@ -6,9 +6,9 @@ from ..client_base import DiscordGatewayClientBase
 
 
 class TestGatewayShard(DiscordGatewayClientBase):
-    __slots__ = ('run_end_waiter', 'waiter', 'out_operations', 'in_operations')
+    __slots__ = ('run_end_waiter', 'shard_id', 'waiter', 'out_operations', 'in_operations')
     
-    def __new__(cls, *, in_operations = None):
+    def __new__(cls, *, in_operations = None, shard_id = 0):
         
         if in_operations is not None:
             in_operations.reverse()
@@ -16,6 +16,7 @@ class TestGatewayShard(DiscordGatewayClientBase):
         self = object.__new__(cls)
         self.waiter = None
         self.run_end_waiter = Future(KOKORO)
+        self.shard_id = shard_id
         self.out_operations = []
         self.in_operations = in_operations
         return self
@@ -50,7 +51,7 @@ class TestGatewayShard(DiscordGatewayClientBase):
         ))
     
     
-    async def _send_json(self, data):
+    async def _send_json(self, data, command_key = None):
         self.out_operations.append((
             'send_as_json',
             from_json(data),
@@ -26,6 +26,10 @@ class TestClientResponse:
         return self.response_value
     
     
+    async def read(self):
+        return self.response_value.encode()
+    
+    
     def release(self):
         pass
     
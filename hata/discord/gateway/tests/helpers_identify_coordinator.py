@@ -0,0 +1,28 @@
+from scarletio import skip_poll_cycle
+
+from ..identify_coordinators import IdentifyCoordinatorBase
+
+
+class TestIdentifyCoordinator(IdentifyCoordinatorBase):
+    __slots__ = ('acquire_calls', 'calls', 'finished_call_count')
+    
+    def __new__(cls):
+        self = object.__new__(cls)
+        self.acquire_calls = []
+        self.calls = []
+        self.finished_call_count = 0
+        return self
+    
+    
+    async def wait(self, shard_ids, max_concurrency):
+        self.calls.append((shard_ids, max_concurrency))
+        
+        # Every call after the first one should wait.
+        if len(self.calls) > 1:
+            await skip_poll_cycle()
+        
+        self.finished_call_count += 1
+    
+    
+    async def acquire(self, shard_ids, max_concurrency):
+        self.acquire_calls.append((shard_ids, max_concurrency))
@@ -47,3 +47,14 @@ def test__DiscordGatewayClientBase__get_gateway__guild_id_is_not_zero():
     output = gateway.get_gateway(guild_id)
     
     vampytest.assert_is(output, gateway)
+
+
+def test__DiscordGatewayClientBase__iter_gateways():
+    """
+    Tests whether ``DiscordGatewayClientBase.iter_gateways`` works as intended.
+    """
+    gateway = DiscordGatewayClientBase()
+    
+    output = [*gateway.iter_gateways()]
+    
+    vampytest.assert_eq(output, [])
@@ -21,10 +21,17 @@ from ..constants import (
     GATEWAY_OPERATION_CLIENT_INVALIDATE_SESSION, GATEWAY_OPERATION_CLIENT_RECONNECT, GATEWAY_OPERATION_CLIENT_RESUME,
     GATEWAY_OPERATION_CLIENT_VOICE_STATE, LATENCY_DEFAULT, INTERVAL_DEFAULT
 )
+from ..encodings import GatewayEncodingBase, GatewayEncoding__etf
+from ..encodings.erlang_term_format import etf_decode, etf_encode
 from ..heartbeat import Kokoro
 from ..rate_limit import GatewayRateLimiter
+from ..send_queue import GatewaySendQueue
+from ..transport_compressions import (
+    TransportCompressionBase, TransportCompression__none, TransportCompression__zstd_stream
+)
 
 from .helpers_http_client import TestHTTPClient
+from .helpers_identify_coordinator import TestIdentifyCoordinator
 from .helpers_web_socket_client import TestWebSocketClient
 
 
@@ -44,14 +51,18 @@ def _assert_fields_set(gateway):
     vampytest.assert_instance(gateway._buffer, list)
     vampytest.assert_instance(gateway._decompressor, ZlibDecompressorType, nullable = True)
     vampytest.assert_instance(gateway._operation_handlers, dict)
+    vampytest.assert_instance(gateway._session_restored, bool)
     vampytest.assert_instance(gateway._should_run, bool)
     vampytest.assert_instance(gateway.client, Client)
+    vampytest.assert_subtype(gateway.encoding, GatewayEncodingBase)
     vampytest.assert_instance(gateway.kokoro, Kokoro, nullable = True)
     vampytest.assert_instance(gateway.rate_limit_handler, GatewayRateLimiter)
     vampytest.assert_instance(gateway.resume_gateway_url, str, nullable = True)
+    vampytest.assert_instance(gateway.send_queue, GatewaySendQueue)
     vampytest.assert_instance(gateway.sequence, int)
     vampytest.assert_instance(gateway.session_id, str, nullable = True)
     vampytest.assert_instance(gateway.shard_id, int)
+    vampytest.assert_subtype(gateway.transport_compression, TransportCompressionBase)
     vampytest.assert_instance(gateway.web_socket, WebSocketClient, nullable = True)
 
 
@@ -439,6 +450,39 @@ async def test__DiscordGatewayClientShard__identify__with_activity_with_shard():
         client = None
 
 
+async def test__DiscordGatewayClientShard__identify__identify_coordinator():
+    """
+    Tests whether ``DiscordGatewayClientShard._identify`` works as intended.
+    
+    Case: reserving the identify bucket.
+    
+    This function is a coroutine.
+    """
+    shard_id = 1
+    shard_count = 4
+    identify_coordinator = TestIdentifyCoordinator()
+    
+    client = Client(
+        'token_202510200000',
+        client_id = 202510200001,
+        shard_count = shard_count,
+        identify_coordinator = identify_coordinator,
+    )
+    
+    try:
+        web_socket = await TestWebSocketClient(KOKORO, '')
+        gateway = DiscordGatewayClientShard(client, shard_id)
+        gateway.web_socket = web_socket
+        
+        await gateway._identify()
+        
+        vampytest.assert_eq(identify_coordinator.acquire_calls, [([shard_id], client._gateway_max_concurrency)])
+        vampytest.assert_eq(len(web_socket.out_operations), 1)
+    finally:
+        client._delete()
+        client = None
+
+
 def test__DiscordGatewayClientShard__clear_session():
     """
     Tests whether ``DiscordGatewayClientShard._clear_session`` works as intended.
@@ -1096,6 +1140,65 @@ async def test__DiscordGatewayClientShard__handle_operation_dispatch__ready_even
         client = None
 
 
+async def test__DiscordGatewayClientShard__handle_operation_dispatch__resumed_event():
+    """
+    Tests whether ``DiscordGatewayClientShard._handle_operation_dispatch`` works as intended.
+    
+    Case: resumed event of a restored session.
+    
+    This function is a coroutine.
+    """
+    client = Client(
+        'token_20261020_0001',
+        client_id = 202610200001,
+        shard_count = 2,
+    )
+    
+    shard_id = 1
+    event_name = 'RESUMED'
+    
+    message = {
+        'd': {},
+        't': event_name,
+    }
+    
+    def mock_event_parser(parser_client, parser_data):
+        return ...
+    
+    mock_parsers = {event_name : mock_event_parser}
+    
+    try:
+        gateway = DiscordGatewayClientShard(client, shard_id)
+        gateway.set_session({
+            'session_id': 'okuu',
+            'resume_gateway_url': 'wss://koishi.nyan/',
+            'sequence': 69,
+        })
+        
+        mocked = vampytest.mock_globals(
+            type(gateway)._handle_operation_dispatch,
+            PARSERS = mock_parsers,
+        )
+        
+        output = await mocked(gateway, message)
+        
+        vampytest.assert_instance(output, int)
+        vampytest.assert_eq(output, GATEWAY_ACTION_KEEP_GOING)
+        
+        vampytest.assert_false(gateway._session_restored)
+        vampytest.assert_is_not(client.ready_state, None)
+        vampytest.assert_eq(client.ready_state.resumed_shard_ids, {shard_id})
+    
+    finally:
+        ready_state = client.ready_state
+        if (ready_state is not None):
+            client.ready_state = None
+            ready_state.cancel()
+        
+        client._delete()
+        client = None
+
+
 async def test__DiscordGatewayClientShard__handle_operation_hello__with_kokoro():
     """
     Tests whether ``DiscordGatewayClientShard._handle_operation_hello`` works as intended.
@@ -1888,6 +1991,100 @@ async def test__DiscordGatewayClientShard__poll_and_handle_received_operation__h
         client = None
 
 
+@vampytest.skip_if(not TransportCompression__zstd_stream.available)
+async def test__DiscordGatewayClientShard__poll_and_handle_received_operation__zstd_stream():
+    """
+    Tests whether ``DiscordGatewayClientShard._poll_and_handle_received_operation`` works as intended.
+    
+    Case: Handling a heartbeat acknowledge operation with zstd stream transport compression.
+    
+    This function is a coroutine.
+    """
+    client = Client(
+        'token_202505100000',
+        client_id = 202505100001,
+        gateway_transport_compression = 'zstd-stream',
+    )
+    
+    shard_id = 2
+    
+    # Recorded `{"op":11,"d":{}}` message.
+    data = b'(\xb5/\xfd\x00X\x80\x00\x00{"op":11,"d":{}}'
+    
+    try:
+        web_socket = await TestWebSocketClient(
+            KOKORO,
+            '',
+            in_operations = [
+                ('receive', False, data),
+            ],
+        )
+        gateway = DiscordGatewayClientShard(client, shard_id)
+        gateway._create_kokoro()
+        gateway.web_socket = web_socket
+        gateway._decompressor = TransportCompression__zstd_stream.create_decompressor()
+        
+        output = await gateway._poll_and_handle_received_operation()
+        
+        vampytest.assert_instance(output, int)
+        vampytest.assert_eq(output, GATEWAY_ACTION_KEEP_GOING)
+        
+        await skip_ready_cycle()
+        
+        vampytest.assert_ne(gateway.latency, LATENCY_DEFAULT)
+        vampytest.assert_eq(len(web_socket.out_operations), 0)
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__DiscordGatewayClientShard__poll_and_handle_received_operation__transport_compression_none():
+    """
+    Tests whether ``DiscordGatewayClientShard._poll_and_handle_received_operation`` works as intended.
+    
+    Case: Handling a heartbeat acknowledge operation without transport compression.
+    
+    This function is a coroutine.
+    """
+    client = Client(
+        'token_202505100002',
+        client_id = 202505100003,
+        gateway_transport_compression = None,
+    )
+    
+    shard_id = 2
+    
+    message = {
+        'op': GATEWAY_OPERATION_CLIENT_HEARTBEAT_ACKNOWLEDGE,
+        'd': {},
+    }
+    
+    try:
+        web_socket = await TestWebSocketClient(
+            KOKORO,
+            '',
+            in_operations = [
+                ('receive', False, to_json(message)),
+            ],
+        )
+        gateway = DiscordGatewayClientShard(client, shard_id)
+        gateway._create_kokoro()
+        gateway.web_socket = web_socket
+        
+        output = await gateway._poll_and_handle_received_operation()
+        
+        vampytest.assert_instance(output, int)
+        vampytest.assert_eq(output, GATEWAY_ACTION_KEEP_GOING)
+        
+        await skip_ready_cycle()
+        
+        vampytest.assert_ne(gateway.latency, LATENCY_DEFAULT)
+        vampytest.assert_eq(len(web_socket.out_operations), 0)
+    finally:
+        client._delete()
+        client = None
+
+
 async def test__DiscordGatewayClientShard__connect__unexpected_closes_with_resume():
     """
     Tests whether ``DiscordGatewayClientShard._connect`` works as intended.
@@ -2081,6 +2278,134 @@ async def test__DiscordGatewayClientShard__connect__success_default():
         client = None
 
 
+async def test__DiscordGatewayClientShard__connect__transport_compression_none():
+    """
+    Tests whether ``DiscordGatewayClientShard._connect`` works as intended.
+    
+    Case: Transport compression disabled.
+    
+    This function is a coroutine.
+    """
+    heartbeat_interval = 40.0
+    
+    message_0 = {
+        'op': GATEWAY_OPERATION_CLIENT_HELLO,
+        'd': {
+            'heartbeat_interval': int(heartbeat_interval * 1000.0),
+        },
+    }
+    
+    web_socket = await TestWebSocketClient(
+        KOKORO,
+        '',
+        in_operations = [
+            ('receive', False, to_json(message_0)),
+        ],
+    )
+
+    http = TestHTTPClient(KOKORO, out_web_socket = web_socket)
+    
+    client = Client(
+        'token_202505100004',
+        client_id = 202505100005,
+        http = http,
+        gateway_transport_compression = None,
+    )
+    
+    shard_id = 2
+    
+    try:
+        gateway = DiscordGatewayClientShard(client, shard_id)
+        
+        output = await gateway._connect(False)
+        
+        await skip_ready_cycle()
+        await skip_ready_cycle()
+        
+        vampytest.assert_instance(output, int)
+        vampytest.assert_eq(output, GATEWAY_ACTION_KEEP_GOING)
+        
+        vampytest.assert_not_in('compress', web_socket.url.value_encoded)
+        vampytest.assert_is(gateway.transport_compression, TransportCompression__none)
+        vampytest.assert_is(gateway._decompressor, None)
+        
+        vampytest.assert_eq(len(web_socket.out_operations), 2)
+        operation, data = web_socket.out_operations[1]
+        vampytest.assert_eq(operation, 'send')
+        data = from_json(data)
+        vampytest.assert_eq(data['op'], GATEWAY_OPERATION_CLIENT_IDENTIFY)
+        vampytest.assert_eq(data['d']['compress'], False)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+async def test__DiscordGatewayClientShard__connect__gateway_encoding_etf():
+    """
+    Tests whether ``DiscordGatewayClientShard._connect`` works as intended.
+    
+    Case: Erlang term format gateway encoding.
+    
+    This function is a coroutine.
+    """
+    heartbeat_interval = 40.0
+    
+    message_0 = {
+        'op': GATEWAY_OPERATION_CLIENT_HELLO,
+        'd': {
+            'heartbeat_interval': int(heartbeat_interval * 1000.0),
+        },
+    }
+    
+    web_socket = await TestWebSocketClient(
+        KOKORO,
+        '',
+        in_operations = [
+            ('receive', False, etf_encode(message_0)),
+        ],
+    )
+
+    http = TestHTTPClient(KOKORO, out_web_socket = web_socket)
+    
+    client = Client(
+        'token_202505100006',
+        client_id = 202505100007,
+        http = http,
+        gateway_encoding = 'etf',
+        gateway_transport_compression = None,
+    )
+    
+    shard_id = 2
+    
+    try:
+        gateway = DiscordGatewayClientShard(client, shard_id)
+        
+        output = await gateway._connect(False)
+        
+        await skip_ready_cycle()
+        await skip_ready_cycle()
+        
+        vampytest.assert_instance(output, int)
+        vampytest.assert_eq(output, GATEWAY_ACTION_KEEP_GOING)
+        
+        vampytest.assert_in('encoding=etf', web_socket.url.value_encoded)
+        vampytest.assert_is(gateway.encoding, GatewayEncoding__etf)
+        vampytest.assert_eq(gateway.kokoro.interval, heartbeat_interval)
+        
+        vampytest.assert_eq(len(web_socket.out_operations), 2)
+        operation, data = web_socket.out_operations[1]
+        vampytest.assert_eq(operation, 'send')
+        vampytest.assert_instance(data, bytes)
+        data = etf_decode(data)
+        vampytest.assert_eq(data['op'], GATEWAY_OPERATION_CLIENT_IDENTIFY)
+        vampytest.assert_eq(data['d']['token'], 'token_202505100006')
+    
+    finally:
+        client._delete()
+        client = None
+
+
 async def test__DiscordGatewayClientShard__keep_polling_and_handling():
     """
     Tests whether ``DiscordGatewayClientShard._keep_polling_and_handling`` works as intended.
@@ -2200,3 +2525,250 @@ async def test__DiscordGatewayClientShard__run__default():
         client.running = False
         client._delete()
         client = None
+
+
+async def test__DiscordGatewayClientShard__run__with_session():
+    """
+    Tests whether ``DiscordGatewayClientShard.run`` works as intended.
+    
+    Case: Has session, so it should resume.
+    """
+    heartbeat_interval = 40.0
+    
+    message_0 = {
+        'op': GATEWAY_OPERATION_CLIENT_HELLO,
+        'd': {
+            'heartbeat_interval': int(heartbeat_interval * 1000.0),
+        },
+    }
+    
+    compressor = create_zlib_compressor()
+    data_0 = compressor.compress(to_json(message_0).encode()) + compressor.flush(Z_SYNC_FLUSH)
+    
+    exception = RuntimeError('hiss')
+    
+    web_socket = await TestWebSocketClient(
+        KOKORO,
+        '',
+        in_operations = [
+            ('receive', False, data_0),
+            ('ensure_open', False, None),
+            ('receive', True, exception),
+        ],
+    )
+    
+    http = TestHTTPClient(KOKORO, out_web_socket = web_socket)
+    
+    client = Client(
+        'token_20261018_0000',
+        client_id = 202610180000,
+        http = http,
+    )
+    # yep, we are running.
+    client.running = True
+    
+    shard_id = 2
+    sequence = 69
+    session_id = 'okuu'
+    resume_gateway_url = 'wss://koishi.nyan/'
+    
+    waiter = Future(KOKORO)
+    
+    try:
+        gateway = DiscordGatewayClientShard(client, shard_id)
+        gateway.set_session({
+            'session_id': session_id,
+            'resume_gateway_url': resume_gateway_url,
+            'sequence': sequence,
+        })
+        
+        with vampytest.assert_raises(exception):
+            await gateway.run(waiter)
+        
+        output = waiter.get_result()
+        vampytest.assert_instance(output, bool)
+        vampytest.assert_eq(output, True)
+        
+        vampytest.assert_in(resume_gateway_url, web_socket.url.value_encoded)
+        
+        sent_operations = [
+            from_json(data)['op'] for operation, data in web_socket.out_operations if operation == 'send'
+        ]
+        vampytest.assert_in(GATEWAY_OPERATION_CLIENT_RESUME, sent_operations)
+        vampytest.assert_not_in(GATEWAY_OPERATION_CLIENT_IDENTIFY, sent_operations)
+        
+        # The restored session should be used only on the first connection.
+        vampytest.assert_false(gateway._session_restored)
+    
+    finally:
+        client.running = False
+        client._delete()
+        client = None
+
+
+async def test__DiscordGatewayClientShard__run__with_session_not_restored():
+    """
+    Tests whether ``DiscordGatewayClientShard.run`` works as intended.
+    
+    Case: Has session, but it was not restored, so it should identify.
+    """
+    heartbeat_interval = 40.0
+    
+    message_0 = {
+        'op': GATEWAY_OPERATION_CLIENT_HELLO,
+        'd': {
+            'heartbeat_interval': int(heartbeat_interval * 1000.0),
+        },
+    }
+    
+    compressor = create_zlib_compressor()
+    data_0 = compressor.compress(to_json(message_0).encode()) + compressor.flush(Z_SYNC_FLUSH)
+    
+    exception = RuntimeError('hiss')
+    
+    web_socket = await TestWebSocketClient(
+        KOKORO,
+        '',
+        in_operations = [
+            ('receive', False, data_0),
+            ('receive', True, exception),
+        ],
+    )
+    
+    http = TestHTTPClient(KOKORO, out_web_socket = web_socket)
+    
+    client = Client(
+        'token_20261020_0000',
+        client_id = 202610200000,
+        http = http,
+    )
+    # yep, we are running.
+    client.running = True
+    
+    shard_id = 2
+    
+    waiter = Future(KOKORO)
+    
+    try:
+        gateway = DiscordGatewayClientShard(client, shard_id)
+        gateway.sequence = 69
+        gateway.session_id = 'okuu'
+        gateway.resume_gateway_url = 'wss://koishi.nyan/'
+        
+        with vampytest.assert_raises(exception):
+            await gateway.run(waiter)
+        
+        sent_operations = [
+            from_json(data)['op'] for operation, data in web_socket.out_operations if operation == 'send'
+        ]
+        vampytest.assert_in(GATEWAY_OPERATION_CLIENT_IDENTIFY, sent_operations)
+        vampytest.assert_not_in(GATEWAY_OPERATION_CLIENT_RESUME, sent_operations)
+    
+    finally:
+        client.running = False
+        client._delete()
+        client = None
+
+
+def test__DiscordGatewayClientShard__get_session__no_session():
+    """
+    Tests whether ``DiscordGatewayClientShard.get_session`` works as intended.
+    
+    Case: no session.
+    """
+    client = Client(
+        'token_20261018_0001',
+        client_id = 202610180001,
+    )
+    
+    try:
+        gateway = DiscordGatewayClientShard(client, 0)
+        
+        output = gateway.get_session()
+        vampytest.assert_is(output, None)
+    finally:
+        client._delete()
+        client = None
+
+
+def test__DiscordGatewayClientShard__get_session__with_session():
+    """
+    Tests whether ``DiscordGatewayClientShard.get_session`` works as intended.
+    
+    Case: with session.
+    """
+    client = Client(
+        'token_20261018_0002',
+        client_id = 202610180002,
+    )
+    
+    sequence = 69
+    session_id = 'okuu'
+    resume_gateway_url = 'wss://koishi.nyan/'
+    
+    try:
+        gateway = DiscordGatewayClientShard(client, 0)
+        gateway.sequence = sequence
+        gateway.session_id = session_id
+        gateway.resume_gateway_url = resume_gateway_url
+        
+        output = gateway.get_session()
+        vampytest.assert_eq(
+            output,
+            {
+                'session_id': session_id,
+                'resume_gateway_url': resume_gateway_url,
+                'sequence': sequence,
+            },
+        )
+    finally:
+        client._delete()
+        client = None
+
+
+def test__DiscordGatewayClientShard__set_session():
+    """
+    Tests whether ``DiscordGatewayClientShard.set_session`` works as intended.
+    """
+    client = Client(
+        'token_20261018_0003',
+        client_id = 202610180003,
+    )
+    
+    sequence = 69
+    session_id = 'okuu'
+    resume_gateway_url = 'wss://koishi.nyan/'
+    
+    try:
+        gateway = DiscordGatewayClientShard(client, 0)
+        gateway.set_session({
+            'session_id': session_id,
+            'resume_gateway_url': resume_gateway_url,
+            'sequence': sequence,
+        })
+        
+        vampytest.assert_eq(gateway.session_id, session_id)
+        vampytest.assert_eq(gateway.resume_gateway_url, resume_gateway_url)
+        vampytest.assert_eq(gateway.sequence, sequence)
+    finally:
+        client._delete()
+        client = None
+
+
+def test__DiscordGatewayClientShard__iter_gateways():
+    """
+    Tests whether ``DiscordGatewayClientShard.iter_gateways`` works as intended.
+    """
+    client = Client(
+        'token_20261018_0004',
+        client_id = 202610180004,
+    )
+    
+    try:
+        gateway = DiscordGatewayClientShard(client, 0)
+        
+        output = [*gateway.iter_gateways()]
+        vampytest.assert_eq(output, [gateway])
+    finally:
+        client._delete()
+        client = None
@@ -23,6 +23,8 @@ def _assert_fields_set(gateway):
     vampytest.assert_instance(gateway, DiscordGatewayClientSharder)
     vampytest.assert_instance(gateway.client, Client)
     vampytest.assert_instance(gateway.gateways, tuple)
+    vampytest.assert_instance(gateway.gateways_by_shard_id, dict)
+    vampytest.assert_instance(gateway.shard_count, int)
 
 
 def test__DiscordGatewayClientSharder__new__no_gateways():
@@ -62,7 +64,7 @@ def test__DiscordGatewayClientSharder__new__with_gateways():
     
     shard_count = 4
     
-    gateways = (TestGatewayShard(), TestGatewayShard(), TestGatewayShard(), TestGatewayShard())
+    gateways = (*(TestGatewayShard(shard_id = shard_id) for shard_id in range(shard_count)),)
     
     try:
         gateway = DiscordGatewayClientSharder(client, shard_count, gateways)
@@ -121,6 +123,118 @@ def test__DiscordGatewayClientSharder__get_gateway():
         client = None
 
 
+def test__DiscordGatewayClientSharder__get_gateway__shard_ids():
+    """
+    Tests whether ``DiscordGatewayClientSharder.get_gateway`` works as intended.
+    
+    Case: Running only a part of the shards.
+    """
+    client = Client(
+        'token_202505110000',
+        client_id = 202505110001,
+        shard_count = 4,
+        shard_ids = [2, 3],
+    )
+    
+    guild_id = 6 << 22
+    
+    try:
+        gateway = client.gateway
+        vampytest.assert_instance(gateway, DiscordGatewayClientSharder)
+        vampytest.assert_eq(gateway.shard_count, 4)
+        vampytest.assert_eq([shard_gateway.shard_id for shard_gateway in gateway.gateways], [2, 3])
+        
+        output = gateway.get_gateway(guild_id)
+        vampytest.assert_is(gateway.gateways[0], output)
+        
+        output = gateway.get_gateway(guild_id + (1 << 22))
+        vampytest.assert_is(gateway.gateways[1], output)
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def _iter_options__get_gateway_of_shard__passing():
+    yield None, 2, 2
+    yield (1, 3), 3, 3
+    yield (1, 3), 1, 1
+
+
+def _iter_options__get_gateway_of_shard__lookup_error():
+    yield (1, 3), 2
+    yield None, 4
+
+
+@vampytest._(vampytest.call_from(_iter_options__get_gateway_of_shard__passing()).returning_last())
+@vampytest._(vampytest.call_from(_iter_options__get_gateway_of_shard__lookup_error()).raising(LookupError))
+def test__DiscordGatewayClientSharder__get_gateway_of_shard(shard_ids, shard_id):
+    """
+    Tests whether ``DiscordGatewayClientSharder.get_gateway_of_shard`` works as intended.
+    
+    Parameters
+    ----------
+    shard_ids : `None | tuple<int>`
+        The shards' identifiers ran by the client.
+    shard_id : `int`
+        The shard's identifier to get the gateway of.
+    
+    Returns
+    -------
+    output : `int`
+        The returned gateway's shard identifier.
+    """
+    client = Client(
+        'token_202505110002',
+        client_id = 202505110003,
+        shard_count = 4,
+        shard_ids = shard_ids,
+    )
+    
+    try:
+        output = client.gateway.get_gateway_of_shard(shard_id)
+        return output.shard_id
+    
+    finally:
+        client._delete()
+        client = None
+
+
+def _iter_options__iter_gateways():
+    yield None, [0, 1, 2, 3]
+    yield (1, 3), [1, 3]
+
+
+@vampytest._(vampytest.call_from(_iter_options__iter_gateways()).returning_last())
+def test__DiscordGatewayClientSharder__iter_gateways(shard_ids):
+    """
+    Tests whether ``DiscordGatewayClientSharder.iter_gateways`` works as intended.
+    
+    Parameters
+    ----------
+    shard_ids : `None | tuple<int>`
+        The shards' identifiers ran by the client.
+    
+    Returns
+    -------
+    output : `list<int>`
+        The yielded gateways' shard identifiers.
+    """
+    client = Client(
+        'token_20261018_0005',
+        client_id = 202610180005,
+        shard_count = 4,
+        shard_ids = shard_ids,
+    )
+    
+    try:
+        return [gateway.shard_id for gateway in client.gateway.iter_gateways()]
+    
+    finally:
+        client._delete()
+        client = None
+
+
 async def test__DiscordGatewayClientSharder__change_voice_state():
     """
     Tests whether ``DiscordGatewayClientSharder.change_voice_state`` works as intended.
@@ -141,6 +255,7 @@ async def test__DiscordGatewayClientSharder__change_voice_state():
     try:
         gateway = DiscordGatewayClientSharder(client, shard_count, None)
         gateway.gateways = (*(TestGatewayShard() for _ in range(shard_count)),)
+        gateway.gateways_by_shard_id = dict(enumerate(gateway.gateways))
         
         await gateway.change_voice_state(guild_id, channel_id, self_deaf = self_deaf, self_mute = self_mute)
         
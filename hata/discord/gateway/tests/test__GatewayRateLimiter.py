@@ -1,7 +1,7 @@
 from collections import deque
 
 import vampytest
-from scarletio import Task, TimerHandle, skip_ready_cycle, sleep
+from scarletio import LOOP_TIME, Task, TimerHandle, skip_ready_cycle, sleep
 
 from ...core import KOKORO
 
@@ -212,3 +212,18 @@ async def test__GatewayRateLimiter__cancel():
         vampytest.assert_is(rate_limiter.wake_up_handle, None)
     finally:
         rate_limiter.cancel()
+
+
+def test__GatewayRateLimiter__get_remaining():
+    """
+    Tests whether ``GatewayRateLimiter.get_remaining`` works as intended.
+    """
+    rate_limiter = GatewayRateLimiter()
+    vampytest.assert_eq(rate_limiter.get_remaining(), 120)
+    
+    rate_limiter.remaining = 5
+    rate_limiter.resets_at = LOOP_TIME() + 60.0
+    vampytest.assert_eq(rate_limiter.get_remaining(), 5)
+    
+    rate_limiter.resets_at = LOOP_TIME() - 1.0
+    vampytest.assert_eq(rate_limiter.get_remaining(), 120)
@@ -0,0 +1,132 @@
+from collections import deque
+
+import vampytest
+from scarletio import Task, TaskGroup, skip_ready_cycle
+
+from ...core import KOKORO
+
+from ..constants import GATEWAY_RATE_LIMIT_RESERVED
+from ..rate_limit import GatewayRateLimiter
+from ..send_queue import GatewaySendQueue
+
+
+def _assert_fields_set(send_queue):
+    """
+    Asserts whether every attribute is set of the given gateway send queue.
+    
+    Parameters
+    ----------
+    send_queue : ``GatewaySendQueue``
+        The send queue to check.
+    """
+    vampytest.assert_instance(send_queue, GatewaySendQueue)
+    vampytest.assert_instance(send_queue.coalesced_count, int)
+    vampytest.assert_instance(send_queue.entries, deque)
+    vampytest.assert_instance(send_queue.keyed_entries, dict)
+    vampytest.assert_instance(send_queue.maximal_depth, int)
+    vampytest.assert_instance(send_queue.rate_limiter, GatewayRateLimiter)
+    vampytest.assert_true(callable(send_queue.send))
+    vampytest.assert_instance(send_queue.sent_count, int)
+    vampytest.assert_instance(send_queue.task, Task, nullable = True)
+
+
+def _create_send_queue():
+    """
+    Creates a send queue collecting the sent data.
+    
+    Returns
+    -------
+    send_queue : ``GatewaySendQueue``
+    sent : `list<str>`
+    """
+    sent = []
+    
+    async def send(data):
+        nonlocal rate_limiter
+        if (await rate_limiter):
+            sent.append(data)
+    
+    rate_limiter = GatewayRateLimiter()
+    return GatewaySendQueue(rate_limiter, send), sent
+
+
+def test__GatewaySendQueue__new():
+    """
+    Tests whether ``GatewaySendQueue.__new__`` works as intended.
+    """
+    send_queue, sent = _create_send_queue()
+    _assert_fields_set(send_queue)
+    
+    vampytest.assert_eq(len(send_queue), 0)
+
+
+def test__GatewaySendQueue__repr():
+    """
+    Tests whether ``GatewaySendQueue.__repr__`` works as intended.
+    """
+    send_queue, sent = _create_send_queue()
+    
+    output = repr(send_queue)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(send_queue).__name__, output)
+
+
+async def test__GatewaySendQueue__put():
+    """
+    Tests whether ``GatewaySendQueue.put`` works as intended.
+    
+    Case: Commands with the same key supersede each other while queued.
+    
+    This function is a coroutine.
+    """
+    send_queue, sent = _create_send_queue()
+    
+    tasks = [
+        Task(KOKORO, send_queue.put('a', None)),
+        Task(KOKORO, send_queue.put('presence 0', (3, None))),
+        Task(KOKORO, send_queue.put('voice 0', (4, '1'))),
+        Task(KOKORO, send_queue.put('presence 1', (3, None))),
+        Task(KOKORO, send_queue.put('voice 1', (4, '2'))),
+        Task(KOKORO, send_queue.put('b', None)),
+    ]
+    
+    await TaskGroup(KOKORO, tasks).wait_all()
+    
+    vampytest.assert_eq(sent, ['a', 'presence 1', 'voice 0', 'voice 1', 'b'])
+    vampytest.assert_eq(
+        send_queue.get_statistics(),
+        {
+            'coalesced_count': 1,
+            'depth': 0,
+            'maximal_depth': 5,
+            'sent_count': 5,
+        },
+    )
+
+
+async def test__GatewaySendQueue__put__reserved():
+    """
+    Tests whether ``GatewaySendQueue.put`` works as intended.
+    
+    Case: Only the reserved part of the rate limit is left.
+    
+    This function is a coroutine.
+    """
+    send_queue, sent = _create_send_queue()
+    rate_limiter = send_queue.rate_limiter
+    await rate_limiter
+    rate_limiter.remaining = GATEWAY_RATE_LIMIT_RESERVED
+    
+    task = Task(KOKORO, send_queue.put('a', None))
+    try:
+        await skip_ready_cycle()
+        
+        vampytest.assert_eq(sent, [])
+        vampytest.assert_eq(len(send_queue), 1)
+    
+    finally:
+        send_queue.clear()
+    
+    await task
+    vampytest.assert_eq(len(send_queue), 0)
+    vampytest.assert_is(send_queue.task, None)
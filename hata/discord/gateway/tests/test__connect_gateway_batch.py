@@ -6,6 +6,7 @@ from ...core import KOKORO
 from ..client_sharder import _connect_gateway_batch
 
 from .helpers_gateway_shard import TestGatewayShard
+from .helpers_identify_coordinator import TestIdentifyCoordinator
 
 
 async def test__connect_gateway_batch__success():
@@ -20,9 +21,11 @@ async def test__connect_gateway_batch__success():
     task = None
     
     try:
-        gateways = [TestGatewayShard(), TestGatewayShard(), TestGatewayShard(), TestGatewayShard()]
+        gateways = [TestGatewayShard(shard_id = shard_id) for shard_id in range(4)]
+        identify_coordinator = TestIdentifyCoordinator()
+        max_concurrency = 4
         
-        task = Task(KOKORO, _connect_gateway_batch(task_group, gateways))
+        task = Task(KOKORO, _connect_gateway_batch(task_group, gateways, max_concurrency, identify_coordinator))
         
         await skip_ready_cycle()
         await skip_ready_cycle()
@@ -32,6 +35,8 @@ async def test__connect_gateway_batch__success():
         for gateway in gateways:
             vampytest.assert_is_not(gateway.waiter, None)
         
+        vampytest.assert_eq(identify_coordinator.calls, [([0, 1, 2, 3], max_concurrency)])
+        
         # set waiters
         for gateway in gateways[:2]:
             gateway.set_waiter(False, True)
@@ -77,9 +82,11 @@ async def test__connect_gateway_batch__failing_return():
     task = None
     
     try:
-        gateways = [TestGatewayShard(), TestGatewayShard(), TestGatewayShard(), TestGatewayShard()]
+        gateways = [TestGatewayShard(shard_id = shard_id) for shard_id in range(4)]
+        identify_coordinator = TestIdentifyCoordinator()
+        max_concurrency = 4
         
-        task = Task(KOKORO, _connect_gateway_batch(task_group, gateways))
+        task = Task(KOKORO, _connect_gateway_batch(task_group, gateways, max_concurrency, identify_coordinator))
         
         await skip_ready_cycle()
         await skip_ready_cycle()
@@ -89,6 +96,8 @@ async def test__connect_gateway_batch__failing_return():
         for gateway in gateways:
             vampytest.assert_is_not(gateway.waiter, None)
         
+        vampytest.assert_eq(identify_coordinator.calls, [([0, 1, 2, 3], max_concurrency)])
+        
         # set waiter to False now
         gateways[2].set_waiter(False, False)
         
@@ -122,10 +131,12 @@ async def test__connect_gateway_batch__failing_exception():
     task = None
     
     try:
-        gateways = [TestGatewayShard(), TestGatewayShard(), TestGatewayShard(), TestGatewayShard()]
+        gateways = [TestGatewayShard(shard_id = shard_id) for shard_id in range(4)]
+        identify_coordinator = TestIdentifyCoordinator()
+        max_concurrency = 4
         exception = RuntimeError('hey mister')
         
-        task = Task(KOKORO, _connect_gateway_batch(task_group, gateways))
+        task = Task(KOKORO, _connect_gateway_batch(task_group, gateways, max_concurrency, identify_coordinator))
         
         await skip_ready_cycle()
         await skip_ready_cycle()
@@ -135,6 +146,8 @@ async def test__connect_gateway_batch__failing_exception():
         for gateway in gateways:
             vampytest.assert_is_not(gateway.waiter, None)
         
+        vampytest.assert_eq(identify_coordinator.calls, [([0, 1, 2, 3], max_concurrency)])
+        
         # set waiter to False now
         gateways[2].set_waiter(True, exception)
         
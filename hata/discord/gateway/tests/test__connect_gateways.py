@@ -6,6 +6,7 @@ from ...core import KOKORO
 from ..client_sharder import _connect_gateways
 
 from .helpers_gateway_shard import TestGatewayShard
+from .helpers_identify_coordinator import TestIdentifyCoordinator
 
 
 async def test__connect_gateways__success__single_batch():
@@ -21,22 +22,12 @@ async def test__connect_gateways__success__single_batch():
     
     try:
         max_concurrency = 4
-        gateways = (TestGatewayShard(), TestGatewayShard(), TestGatewayShard(), TestGatewayShard())
+        gateways = (*(TestGatewayShard(shard_id = shard_id) for shard_id in range(4)),)
         
-        sleep_counter = 0
+        identify_coordinator = TestIdentifyCoordinator()
         
-        async def mock_sleep(duration, loop = None):
-            nonlocal sleep_counter
-            sleep_counter += 1
-            return
         
-        
-        mocked = vampytest.mock_globals(
-            _connect_gateways,
-            sleep = mock_sleep,
-        )
-        
-        task = Task(KOKORO, mocked(task_group, gateways, max_concurrency))
+        task = Task(KOKORO, _connect_gateways(task_group, gateways, max_concurrency, identify_coordinator))
         
         await skip_ready_cycle()
         await skip_ready_cycle()
@@ -82,23 +73,12 @@ async def test__connect_gateways__success__more_batch():
     
     try:
         max_concurrency = 2
-        gateways = (TestGatewayShard(), TestGatewayShard(), TestGatewayShard(), TestGatewayShard())
-        
-        sleep_counter = 0
+        gateways = (*(TestGatewayShard(shard_id = shard_id) for shard_id in range(4)),)
         
-        async def mock_sleep(duration, loop = None):
-            nonlocal sleep_counter
-            await skip_poll_cycle()
-            sleep_counter += 1
-            return
+        identify_coordinator = TestIdentifyCoordinator()
         
         
-        mocked = vampytest.mock_globals(
-            _connect_gateways,
-            sleep = mock_sleep,
-        )
-        
-        task = Task(KOKORO, mocked(task_group, gateways, max_concurrency))
+        task = Task(KOKORO, _connect_gateways(task_group, gateways, max_concurrency, identify_coordinator))
         
         await skip_ready_cycle()
         await skip_ready_cycle()
@@ -120,10 +100,15 @@ async def test__connect_gateways__success__more_batch():
         vampytest.assert_false(task.is_done())
         vampytest.assert_eq(len(task_group.pending), 2)
         
-        vampytest.assert_eq(sleep_counter, 0)
+        # The second batch should not be launched till the identify coordinator lets it.
+        vampytest.assert_eq(len(identify_coordinator.calls), 2)
+        vampytest.assert_eq(identify_coordinator.finished_call_count, 1)
+        for gateway in gateways[max_concurrency : max_concurrency << 1]:
+            vampytest.assert_is(gateway.waiter, None)
+        
         await skip_poll_cycle()
         await skip_ready_cycle()
-        vampytest.assert_eq(sleep_counter, 1)
+        vampytest.assert_eq(identify_coordinator.finished_call_count, 2)
         
         vampytest.assert_false(task.is_done())
         vampytest.assert_eq(len(task_group.pending), 6)
@@ -141,7 +126,10 @@ async def test__connect_gateways__success__more_batch():
         
         vampytest.assert_true(task.is_done())
         vampytest.assert_eq(len(task_group.pending), 4)
-        vampytest.assert_eq(sleep_counter, 1)
+        vampytest.assert_eq(
+            identify_coordinator.calls,
+            [([0, 1], max_concurrency), ([2, 3], max_concurrency)],
+        )
         
         output = task.get_result()
         vampytest.assert_instance(output, bool)
@@ -167,22 +155,12 @@ async def test__connect_gateways__failure_return():
     
     try:
         max_concurrency = 4
-        gateways = (TestGatewayShard(), TestGatewayShard(), TestGatewayShard(), TestGatewayShard())
-        
-        sleep_counter = 0
+        gateways = (*(TestGatewayShard(shard_id = shard_id) for shard_id in range(4)),)
         
-        async def mock_sleep(duration, loop = None):
-            nonlocal sleep_counter
-            sleep_counter += 1
-            return
+        identify_coordinator = TestIdentifyCoordinator()
         
         
-        mocked = vampytest.mock_globals(
-            _connect_gateways,
-            sleep = mock_sleep,
-        )
-        
-        task = Task(KOKORO, mocked(task_group, gateways, max_concurrency))
+        task = Task(KOKORO, _connect_gateways(task_group, gateways, max_concurrency, identify_coordinator))
         
         await skip_ready_cycle()
         await skip_ready_cycle()
@@ -227,23 +205,12 @@ async def test__connect_gateways__failure_exception():
     
     try:
         max_concurrency = 4
-        gateways = (TestGatewayShard(), TestGatewayShard(), TestGatewayShard(), TestGatewayShard())
-        
-        sleep_counter = 0
-        
-        async def mock_sleep(duration, loop = None):
-            nonlocal sleep_counter
-            sleep_counter += 1
-            return
+        gateways = (*(TestGatewayShard(shard_id = shard_id) for shard_id in range(4)),)
         
+        identify_coordinator = TestIdentifyCoordinator()
         exception = RuntimeError('hey mister')
         
-        mocked = vampytest.mock_globals(
-            _connect_gateways,
-            sleep = mock_sleep,
-        )
-        
-        task = Task(KOKORO, mocked(task_group, gateways, max_concurrency))
+        task = Task(KOKORO, _connect_gateways(task_group, gateways, max_concurrency, identify_coordinator))
         
         await skip_ready_cycle()
         await skip_ready_cycle()
@@ -104,3 +104,39 @@ def test__create_gateways__decrease():
     finally:
         client._delete()
         client = None
+
+
+def test__create_gateways__shard_ids():
+    """
+    Tests whether ``_create_gateways`` works as intended.
+    
+    Case: Running only a part of the shards.
+    """
+    client = Client(
+        'token_202505110004',
+        client_id = 202505110005,
+        shard_count = 6,
+        shard_ids = [2, 3, 4],
+    )
+    
+    shard_count = 6
+    
+    try:
+        gateways = (
+            DiscordGatewayClientShard(client, 0),
+            DiscordGatewayClientShard(client, 3),
+        )
+        output = _create_gateways(client, shard_count, gateways)
+        
+        vampytest.assert_instance(output, tuple)
+        vampytest.assert_eq(len(output), 3)
+        
+        for gateway, shard_id in zip(output, (2, 3, 4)):
+            vampytest.assert_instance(gateway, DiscordGatewayClientShard)
+            vampytest.assert_eq(gateway.shard_id, shard_id)
+        
+        vampytest.assert_is(output[1], gateways[1])
+        
+    finally:
+        client._delete()
+        client = None
@@ -0,0 +1,34 @@
+from .base import *
+from .none import *
+from .zlib_stream import *
+from .zstd_stream import *
+
+
+__all__ = (
+    *base.__all__,
+    *none.__all__,
+    *zlib_stream.__all__,
+    *zstd_stream.__all__,
+)
+
+# Construct `TRANSPORT_COMPRESSIONS`
+
+from .none import TransportCompression__none
+from .zlib_stream import TransportCompression__zlib_stream
+from .zstd_stream import TransportCompression__zstd_stream
+
+
+TRANSPORT_COMPRESSIONS = {
+    transport_compression.name : transport_compression for transport_compression in (
+        TransportCompression__none,
+        TransportCompression__zlib_stream,
+        TransportCompression__zstd_stream,
+    )
+}
+
+TRANSPORT_COMPRESSION_DEFAULT = TransportCompression__zlib_stream
+
+
+# Import `TransportCompressionBase` to shorten imports
+
+from .base import TransportCompressionBase
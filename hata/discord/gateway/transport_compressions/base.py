@@ -0,0 +1,101 @@
+__all__ = ()
+
+from scarletio import RichAttributeErrorBaseType
+
+
+class TransportCompressionBase(RichAttributeErrorBaseType):
+    """
+    Base gateway transport compression.
+    
+    Transport compressions are not instanced, their static methods are used directly. The state of the compression
+    is hold by the decompressor they create.
+    
+    Class Attributes
+    ----------------
+    available : `bool` = `False`
+        Whether the transport compression's backend is installed.
+    decompression_error_types : `tuple<type<BaseException>>` = `()`
+        The exception types which may be raised when decompressing.
+    name : `str` = `''`
+        The transport compression's name. This is the value of the `compress` query parameter of the gateway url.
+        If empty string, then the query parameter is omitted.
+    payload_compression : `bool` = `False`
+        Whether payload compression should be requested when identifying.
+    """
+    __slots__ = ()
+    
+    available = False
+    decompression_error_types = ()
+    name = ''
+    payload_compression = False
+    
+    
+    def __new__(cls):
+        """
+        Transport compressions are not instanced.
+        
+        Raises
+        ------
+        RuntimeError
+        """
+        raise RuntimeError(f'{cls.__name__} cannot be instanced.')
+    
+    
+    @staticmethod
+    def create_decompressor():
+        """
+        Creates a new decompressor. Called every time when the gateway (re)connects.
+        
+        Returns
+        -------
+        decompressor : `None | object`
+        """
+        return None
+    
+    
+    @staticmethod
+    async def poll_message(web_socket):
+        """
+        Polls a full (compressed) message from the given web socket.
+        
+        This function is a coroutine.
+        
+        Parameters
+        ----------
+        web_socket : ``WebSocketClient``
+            The web socket to poll with.
+        
+        Returns
+        -------
+        raw_message : `bytes | str`
+        
+        Raises
+        ------
+        ConnectionClosed
+            If the web socket connection closed.
+        """
+        return await web_socket.receive()
+    
+    
+    @staticmethod
+    def decompress(decompressor, raw_message):
+        """
+        Decompresses the given raw message.
+        
+        Parameters
+        ----------
+        decompressor : `None | object`
+            Decompressor created by ``.create_decompressor``.
+        raw_message : `bytes | str`
+            The message to decompress.
+        
+        Returns
+        -------
+        message : `bytes | str`
+        
+        Raises
+        ------
+        BaseException
+            Any exception from ``.decompression_error_types``.
+        """
+        return raw_message
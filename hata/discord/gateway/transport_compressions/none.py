@@ -0,0 +1,15 @@
+__all__ = ()
+
+from .base import TransportCompressionBase
+
+
+class TransportCompression__none(TransportCompressionBase):
+    """
+    No transport compression, every web socket message is a full payload.
+    """
+    __slots__ = ()
+    
+    available = True
+    decompression_error_types = ()
+    name = ''
+    payload_compression = False
@@ -0,0 +1,59 @@
+import vampytest
+
+from ....core import KOKORO
+
+from ...tests.helpers_web_socket_client import TestWebSocketClient
+
+from ..base import TransportCompressionBase
+
+
+def test__TransportCompressionBase__new():
+    """
+    Tests whether ``TransportCompressionBase.__new__`` works as intended.
+    """
+    with vampytest.assert_raises(RuntimeError):
+        TransportCompressionBase()
+
+
+def test__TransportCompressionBase__class_attributes():
+    """
+    Tests whether ``TransportCompressionBase``'s class attributes are set as intended.
+    """
+    vampytest.assert_instance(TransportCompressionBase.available, bool)
+    vampytest.assert_instance(TransportCompressionBase.decompression_error_types, tuple)
+    vampytest.assert_instance(TransportCompressionBase.name, str)
+    vampytest.assert_instance(TransportCompressionBase.payload_compression, bool)
+
+
+def test__TransportCompressionBase__create_decompressor():
+    """
+    Tests whether ``TransportCompressionBase.create_decompressor`` works as intended.
+    """
+    output = TransportCompressionBase.create_decompressor()
+    vampytest.assert_is(output, None)
+
+
+async def test__TransportCompressionBase__poll_message():
+    """
+    Tests whether ``TransportCompressionBase.poll_message`` works as intended.
+    
+    This function is a coroutine.
+    """
+    web_socket = await TestWebSocketClient(
+        KOKORO,
+        '',
+        in_operations = [
+            ('receive', False, '{"op":11,"d":null}'),
+        ],
+    )
+    
+    output = await TransportCompressionBase.poll_message(web_socket)
+    vampytest.assert_eq(output, '{"op":11,"d":null}')
+
+
+def test__TransportCompressionBase__decompress():
+    """
+    Tests whether ``TransportCompressionBase.decompress`` works as intended.
+    """
+    output = TransportCompressionBase.decompress(None, b'{"op":11,"d":null}')
+    vampytest.assert_eq(output, b'{"op":11,"d":null}')
@@ -0,0 +1,104 @@
+from zlib import Z_SYNC_FLUSH, compressobj as create_zlib_compressor
+
+import vampytest
+
+from .. import TRANSPORT_COMPRESSIONS, TRANSPORT_COMPRESSION_DEFAULT
+from ..base import TransportCompressionBase
+from ..none import TransportCompression__none
+from ..zlib_stream import TransportCompression__zlib_stream
+from ..zstd_stream import TransportCompression__zstd_stream
+
+
+MESSAGES = (
+    b'{"op":10,"d":{"heartbeat_interval":41250}}',
+    b'{"op":11,"d":null}',
+    b'{"op":0,"s":1,"t":"RESUMED","d":{}}',
+)
+
+
+def _create_zlib_stream_frames():
+    """
+    Creates zlib stream frames of ``MESSAGES``.
+    
+    Returns
+    -------
+    frames : `list<bytes>`
+    """
+    compressor = create_zlib_compressor()
+    return [compressor.compress(message) + compressor.flush(Z_SYNC_FLUSH) for message in MESSAGES]
+
+
+# Recorded with `zstandard`, each frame is flushed with `COMPRESSOBJ_FLUSH_BLOCK` as Discord does.
+ZSTD_STREAM_FRAMES = (
+    b'(\xb5/\xfd\x00XP\x01\x00{"op":10,"d":{"heartbeat_interval":41250}}',
+    b't\x00\x0001null}\x02\x00@H\xcb\x14\x10',
+    b'\x18\x01\x00{"op":0,"s":1,"t":"RESUMED","d":{}}',
+)
+
+
+def _iter_options():
+    yield TransportCompression__none, [*MESSAGES]
+    yield TransportCompression__zlib_stream, _create_zlib_stream_frames()
+    
+    if TransportCompression__zstd_stream.available:
+        yield TransportCompression__zstd_stream, [*ZSTD_STREAM_FRAMES]
+
+
+@vampytest._(vampytest.call_from(_iter_options()))
+def test__TransportCompression__decompress(transport_compression, frames):
+    """
+    Tests whether the transport compressions' `decompress` works as intended.
+    
+    Parameters
+    ----------
+    transport_compression : ``type<TransportCompressionBase>``
+        The transport compression to test.
+    frames : `list<bytes>`
+        The frames to decompress.
+    """
+    decompressor = transport_compression.create_decompressor()
+    output = [transport_compression.decompress(decompressor, frame) for frame in frames]
+    vampytest.assert_eq(output, [*MESSAGES])
+
+
+def _iter_options__invalid():
+    yield TransportCompression__zlib_stream, b'hey mister\x00\x00\xff\xff'
+    
+    if TransportCompression__zstd_stream.available:
+        yield TransportCompression__zstd_stream, b'hey mister'
+
+
+@vampytest._(vampytest.call_from(_iter_options__invalid()))
+def test__TransportCompression__decompress__invalid(transport_compression, frame):
+    """
+    Tests whether the transport compressions' `decompress` works as intended.
+    
+    Case: invalid data.
+    
+    Parameters
+    ----------
+    transport_compression : ``type<TransportCompressionBase>``
+        The transport compression to test.
+    frame : `bytes`
+        The frame to decompress.
+    """
+    decompressor = transport_compression.create_decompressor()
+    
+    with vampytest.assert_raises(*transport_compression.decompression_error_types):
+        transport_compression.decompress(decompressor, frame)
+
+
+def test__TRANSPORT_COMPRESSIONS():
+    """
+    Tests whether ``TRANSPORT_COMPRESSIONS`` is built as intended.
+    """
+    vampytest.assert_instance(TRANSPORT_COMPRESSIONS, dict)
+    
+    for name, transport_compression in TRANSPORT_COMPRESSIONS.items():
+        vampytest.assert_subtype(transport_compression, TransportCompressionBase)
+        vampytest.assert_eq(transport_compression.name, name)
+    
+    vampytest.assert_is(TRANSPORT_COMPRESSIONS['zlib-stream'], TransportCompression__zlib_stream)
+    vampytest.assert_is(TRANSPORT_COMPRESSIONS['zstd-stream'], TransportCompression__zstd_stream)
+    vampytest.assert_is(TRANSPORT_COMPRESSIONS[''], TransportCompression__none)
+    vampytest.assert_true(TRANSPORT_COMPRESSION_DEFAULT.available)
@@ -1,16 +1,16 @@
 import vampytest
 from scarletio import Task
 
-from ...core import KOKORO
+from ....core import KOKORO
 
-from ..client_shard import _poll_compressed_message
+from ...tests.helpers_web_socket_client import TestWebSocketClient
 
-from .helpers_web_socket_client import TestWebSocketClient
+from ..zlib_stream import poll_zlib_stream_message
 
 
-async def test__poll_compressed_message__chunked():
+async def test__poll_zlib_stream_message__chunked():
     """
-    Tests whether ``_poll_compressed_message`` works as intended.
+    Tests whether ``poll_zlib_stream_message`` works as intended.
     
     Case: Chunked.
     
@@ -25,7 +25,7 @@ async def test__poll_compressed_message__chunked():
             ('receive', False, b'ef\x00\x00\xff\xff'),
         ],
     )
-    task = Task(KOKORO, _poll_compressed_message(web_socket))
+    task = Task(KOKORO, poll_zlib_stream_message(web_socket))
     task.apply_timeout(0.01)
     output = await task
     
@@ -33,9 +33,9 @@ async def test__poll_compressed_message__chunked():
     vampytest.assert_eq(output, b'abcdef\x00\x00\xff\xff')
 
 
-async def test__poll_compressed_message__single():
+async def test__poll_zlib_stream_message__single():
     """
-    Tests whether ``_poll_compressed_message`` works as intended.
+    Tests whether ``poll_zlib_stream_message`` works as intended.
     
     Case: Single.
     
@@ -49,7 +49,7 @@ async def test__poll_compressed_message__single():
         ],
     )
     
-    task = Task(KOKORO, _poll_compressed_message(web_socket))
+    task = Task(KOKORO, poll_zlib_stream_message(web_socket))
     task.apply_timeout(0.01)
     output = await task
     
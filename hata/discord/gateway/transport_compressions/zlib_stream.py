@@ -0,0 +1,86 @@
+__all__ = ()
+
+from zlib import decompressobj as create_zlib_decompressor, error as ZlibError
+
+from .base import TransportCompressionBase
+
+
+ZLIB_STREAM_SUFFIX = b'\x00\x00\xff\xff'
+
+
+async def poll_zlib_stream_message(web_socket):
+    """
+    Polls a compressed message from the given web socket.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    web_socket : ``WebSocketClient``
+        The web socket to poll with.
+    
+    Returns
+    -------
+    raw_message : `bytes`
+    
+    Raises
+    ------
+    ConnectionClosed
+        If the web socket connection closed.
+    """
+    buffer = None
+    
+    while True:
+        data = await web_socket.receive()
+        if data.endswith(ZLIB_STREAM_SUFFIX):
+            if buffer is None:
+                compressed_message = data
+            else:
+                buffer.append(data)
+                compressed_message = b''.join(buffer)
+            return compressed_message
+        
+        if buffer is None:
+            buffer = []
+        
+        buffer.append(data)
+        continue
+
+
+def decompress_zlib_stream_message(decompressor, raw_message):
+    """
+    Decompresses the given zlib stream message.
+    
+    Parameters
+    ----------
+    decompressor : `ZlibDecompressorType`
+        The zlib decompressor of the connection.
+    raw_message : `bytes`
+        The message to decompress.
+    
+    Returns
+    -------
+    message : `bytes`
+    
+    Raises
+    ------
+    ZlibError
+    """
+    return decompressor.decompress(raw_message)
+
+
+class TransportCompression__zlib_stream(TransportCompressionBase):
+    """
+    `zlib-stream` transport compression. Messages can be split between multiple web socket messages. A message is
+    complete when it ends with the `Z_SYNC_FLUSH` suffix.
+    """
+    __slots__ = ()
+    
+    available = True
+    decompression_error_types = (ZlibError,)
+    name = 'zlib-stream'
+    payload_compression = True
+    
+    create_decompressor = staticmethod(create_zlib_decompressor)
+    poll_message = staticmethod(poll_zlib_stream_message)
+    decompress = staticmethod(decompress_zlib_stream_message)
@@ -0,0 +1,59 @@
+__all__ = ()
+
+from .base import TransportCompressionBase
+
+try:
+    from zstandard import ZstdDecompressor, ZstdError
+except ImportError:
+    ZstdDecompressor = None
+    ZstdError = None
+
+
+def create_zstd_decompressor():
+    """
+    Creates a streaming zstd decompressor.
+    
+    Returns
+    -------
+    decompressor : `ZstdDecompressionObj`
+    """
+    return ZstdDecompressor().decompressobj()
+
+
+def decompress_zstd_stream_message(decompressor, raw_message):
+    """
+    Decompresses the given zstd stream message.
+    
+    Parameters
+    ----------
+    decompressor : `ZstdDecompressionObj`
+        The zstd decompressor of the connection.
+    raw_message : `bytes`
+        The message to decompress.
+    
+    Returns
+    -------
+    message : `bytes`
+    
+    Raises
+    ------
+    ZstdError
+    """
+    return decompressor.decompress(raw_message)
+
+
+class TransportCompression__zstd_stream(TransportCompressionBase):
+    """
+    `zstd-stream` transport compression. Every web socket message is flushed by Discord, so each of them can be
+    decompressed alone, there is no need to look for a frame boundary. Requires the `zstandard` package.
+    """
+    __slots__ = ()
+    
+    available = True if (ZstdDecompressor is not None) else False
+    name = 'zstd-stream'
+    payload_compression = False
+    
+    if (ZstdDecompressor is not None):
+        decompression_error_types = (ZstdError,)
+        create_decompressor = staticmethod(create_zstd_decompressor)
+        decompress = staticmethod(decompress_zstd_stream_message)
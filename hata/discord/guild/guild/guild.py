@@ -38,6 +38,7 @@ from ...user import VoiceState, ZEROUSER, create_partial_user_from_id
 from ...user.guild_profile.constants import (
     NICK_LENGTH_MAX as USER_NICK_LENGTH_MAX, NICK_LENGTH_MIN as USER_NICK_LENGTH_MIN
 )
+from ...user.guild_profile.member_store import GUILD_MEMBER_STORES, create_guild_member_store
 from ...user.user.constants import NAME_LENGTH_MAX as USER_NAME_LENGTH_MAX, NAME_LENGTH_MIN as USER_NAME_LENGTH_MIN
 from ...user.user.matching import (
     _user_date_sort_key, _user_match_sort_key, USER_MATCH_WEIGHT_DISPLAY_NAME, USER_MATCH_WEIGHT_NAME,
@@ -1157,19 +1158,24 @@ class Guild(DiscordEntity, immortal = True):
         """
         guild_id = parse_id(data)
         
+        if client is None:
+            cache_policy = None
+        else:
+            cache_policy = client.cache_policy
+        
         try:
             self = GUILDS[guild_id]
         except KeyError:
             self = object.__new__(cls)
             self.id = guild_id
-            self._set_attributes(data, True)
+            self._set_attributes(data, True, cache_policy)
             GUILDS[guild_id] = self
         else:
             if self.clients:
                 # Update just available
                 self.available = parse_available(data)
             else:
-                self._set_attributes(data, False)
+                self._set_attributes(data, False, cache_policy)
         
         self.users = parse_client_guild_profile(data, self.users, guild_id)
         
@@ -1261,7 +1267,7 @@ class Guild(DiscordEntity, immortal = True):
         return data
     
     
-    def _set_attributes(self, data, creation):
+    def _set_attributes(self, data, creation, cache_policy = None):
         """
         Finishes the guild's initialization process by setting it's attributes.
          
@@ -1273,6 +1279,8 @@ class Guild(DiscordEntity, immortal = True):
             Guild data.
         creation : `bool`
             Whether the entity was just created.
+        cache_policy : ``None | CachePolicy`` = `None`, Optional
+            Cache policy to apply on the guild's entities.
         """
         guild_id = self.id
         
@@ -1303,6 +1311,7 @@ class Guild(DiscordEntity, immortal = True):
             self.stages = parse_stages(data, None)
             self.stickers = parse_stickers(data, {})
             self.threads = parse_threads(data, None, guild_id)
+            create_guild_member_store(guild_id, user_count)
             self.users = parse_users(data, GUILD_USERS_TYPE(), guild_id)
             self.voice_states = parse_voice_states(data, None, guild_id)
             
@@ -1326,6 +1335,9 @@ class Guild(DiscordEntity, immortal = True):
             self.users = parse_users(data, self.users, guild_id)
             self.voice_states = parse_voice_states(data, self.voice_states, guild_id)
         
+        if (cache_policy is not None):
+            cache_policy.apply_to_guild(self)
+        
         self._update_attributes(data)
     
     
@@ -2541,7 +2553,9 @@ class Guild(DiscordEntity, immortal = True):
                 pass
         
         else:
-            # Clean up all guild profile.
+            # Clean up all guild profile. Stored ones are dropped at once.
+            GUILD_MEMBER_STORES.pop(guild_id, None)
+            
             for user in self.users.values():
                 try:
                     del user.guild_profiles[guild_id]
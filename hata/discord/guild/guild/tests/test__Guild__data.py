@@ -4,7 +4,7 @@ import vampytest
 
 from ....bases import Icon, IconType
 from ....channel import Channel, ChannelType
-from ....client import Client
+from ....client import CachePolicy, Client
 from ....embedded_activity import EmbeddedActivity
 from ....emoji import Emoji
 from ....localization import Locale
@@ -979,6 +979,45 @@ def test__Guild__set_attributes__existing():
     vampytest.assert_eq(guild.widget_enabled, widget_enabled)
 
 
+def test__Guild__set_attributes__cache_policy():
+    """
+    Tests whether ``Guild._set_attributes`` works as intended.
+    
+    Case: with cache policy.
+    """
+    guild_id = 202610180140
+    role_id = 202610180141
+    
+    user_0 = User.precreate(202610180142)
+    user_1 = User.precreate(202610180143)
+    emoji_0 = Emoji.precreate(202610180144)
+    emoji_1 = Emoji.precreate(202610180145)
+    
+    data = {
+        'emojis': [emoji.to_data(include_internals = True) for emoji in (emoji_0, emoji_1)],
+        'member_count': 2,
+        'members': [
+            {
+                **GuildProfile(role_ids = [role_id]).to_data(include_internals = True),
+                'user': user_0.to_data(include_internals = True),
+            },
+            {
+                **GuildProfile().to_data(include_internals = True),
+                'user': user_1.to_data(include_internals = True),
+            },
+        ],
+    }
+    
+    cache_policy = CachePolicy(emoji_limit = 1, user_role_required = True)
+    
+    guild = object.__new__(Guild)
+    guild.id = guild_id
+    guild._set_attributes(data, True, cache_policy)
+    
+    vampytest.assert_eq(guild.users, {user_0.id: user_0})
+    vampytest.assert_eq(guild.emojis, {emoji_1.id: emoji_1})
+
+
 def test__Guild__update_attributes():
     """
     Tests whether ``Guild._update_attributes`` works as intended.
@@ -1,9 +1,12 @@
 from .api_client import *
 from .connector_cache import *
 from .headers import *
+from .http2 import *
 from .rate_limit import *
+from .rate_limit_brokers import *
 from .rate_limit_groups import *
 from .rate_limit_proxy import *
+from .request_priority import *
 from .urls import *
 
 from . import rate_limit_groups as RATE_LIMIT_GROUPS
@@ -15,8 +18,11 @@ __all__ = (
     *api_client.__all__,
     *connector_cache.__all__,
     *headers.__all__,
+    *http2.__all__,
     *rate_limit.__all__,
+    *rate_limit_brokers.__all__,
     *rate_limit_groups.__all__,
     *rate_limit_proxy.__all__,
+    *request_priority.__all__,
     *urls.__all__,
 )
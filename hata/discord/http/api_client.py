@@ -1,22 +1,39 @@
 __all__ = ('DiscordApiClient',)
 
+from functools import partial as partial_func
 from warnings import warn
 
 from scarletio import (
-    CauseGroup, Future, IgnoreCaseMultiValueDictionary, LOOP_TIME, RichAttributeErrorBaseType, WeakMap, from_json,
-    sleep, to_json
+    CauseGroup, Future, IgnoreCaseMultiValueDictionary, LOOP_TIME, RichAttributeErrorBaseType, Task, WeakMap, sleep
 )
 from scarletio.http_client import HTTPClient, RequestContextManager
 from scarletio.web_common import FormData, PayloadError, quote
 from scarletio.web_common.headers import CONTENT_TYPE, METHOD_DELETE, METHOD_GET, METHOD_PATCH, METHOD_POST, METHOD_PUT
 
+from ...env import (
+    HTTP2, HTTP2_MAX_CONCURRENT_STREAMS, HTTP2_MAX_CONNECTIONS, RATE_LIMIT_BROKER_PATH, RATE_LIMIT_BUCKET_DISCOVERY,
+    RESPONSE_CACHE_TIME_TO_LIVE
+)
+
 from ..core import KOKORO
 from ..exceptions import DiscordException
+from ..json_codecs import JSON_CODEC
 
 from . import rate_limit_groups as RATE_LIMIT_GROUPS
 from .connector_cache import get_connector
 from .headers import AUDIT_LOG_REASON, build_headers
+from .http2 import HTTP2Client
 from .rate_limit import NO_SPECIFIC_RATE_LIMITER, RateLimitHandler, StackedStaticRateLimitHandler
+from .rate_limit_brokers import RateLimitBrokerBase, RateLimitBrokerUnixSocket
+from .rate_limit_brokers.utils import get_bucket_key, get_token_key
+from .rate_limit_discovery import RateLimitBucketDiscovery
+from .request_coalescing import RequestCoalescer, copy_response_data
+from .request_priority import (
+    REQUEST_PRIORITY_BACKGROUND, REQUEST_PRIORITY_DEFAULT, REQUEST_PRIORITY_INTERACTION, RequestPriorityQueue,
+    RequestQueueStatistics, validate_priority
+)
+from .response_cache import ResponseCache
+from .response_stream import ResponseStream
 from .urls import API_ENDPOINT, STATUS_ENDPOINT
 
 
@@ -24,6 +41,8 @@ NON_JSON_TYPES = (FormData, bytes, type(None))
 
 REQUEST_RETRY_LIMIT = 5
 
+RESPONSE_STREAM_BUFFER_LIMIT = 1000
+
 
 class DiscordApiClient(RichAttributeErrorBaseType):
     """
@@ -33,20 +52,52 @@ class DiscordApiClient(RichAttributeErrorBaseType):
     
     Attributes
     ----------
+    bucket_discovery : `None | RateLimitBucketDiscovery`
+        Rate limit bucket discovery. `None` if disabled.
     debug_options : `None | set<str>`
         Debug options used when requesting towards Discord.
     http : ``HTTPClient``
         The used http client.
+    http2 : `None | HTTP2Client`
+        Http/2 client to do the requests with. `None` if disabled.
     global_rate_limit_expires_at : `float`
         The time when global rate limit will expire in monotonic time.
+    global_rate_limit_waiters : ``RequestPriorityQueue``
+        Requests waiting for the global rate limit to expire ordered by their priority.
     handlers : `WeakMap<RateLimitHandler>`
         Rate limit handlers of the Discord requests.
     headers : ``IgnoreCaseMultiValueDictionary``
         Headers used by every every Discord request.
+    queue_statistics : ``RequestQueueStatistics``
+        For how long the requests waited for the rate limits for each priority.
+    rate_limit_broker : ``RateLimitBrokerBase``
+        Rate limit broker to share the rate limits with.
+    request_coalescer : `None | RequestCoalescer`
+        Coalesces concurrent identical `GET` requests. `None` if disabled.
+    response_cache : `None | ResponseCache`
+        Caches the responses of read endpoints for a short time. `None` if disabled.
+    token_key : `str`
+        The token's owner identifying part. Prefixes the bucket keys shared with the rate limit broker.
     """
-    __slots__ = ('debug_options', 'http', 'global_rate_limit_expires_at', 'handlers', 'headers')
-    
-    def __new__(cls, bot, token, *, debug_options = None, http = None):
+    __slots__ = (
+        'bucket_discovery', 'debug_options', 'http', 'http2', 'global_rate_limit_expires_at',
+        'global_rate_limit_waiters', 'handlers', 'headers', 'queue_statistics', 'rate_limit_broker', 'request_coalescer',
+        'response_cache', 'token_key'
+    )
+    
+    def __new__(
+        cls,
+        bot,
+        token,
+        *,
+        bucket_discovery = RATE_LIMIT_BUCKET_DISCOVERY,
+        debug_options = None,
+        http = None,
+        http2 = HTTP2,
+        rate_limit_broker = None,
+        request_coalescing = True,
+        response_cache_time_to_live = RESPONSE_CACHE_TIME_TO_LIVE,
+    ):
         """
         Creates a new Discord api client.
         
@@ -57,11 +108,29 @@ class DiscordApiClient(RichAttributeErrorBaseType):
         token : `str`
             The client's token.
         
+        bucket_discovery : `bool` = `RATE_LIMIT_BUCKET_DISCOVERY`, Optional (Keyword only)
+            Whether the rate limit buckets of the endpoints should be discovered from the response headers, instead of
+            relying only on the predefined rate limit groups.
+        
         debug_options: `None | set<str>` = `None`, Optional (Keyword only)
             Http debug options, like `'canary'` (I don't know more either).
         
         http : `None | HTTPClient`` = `None`, Optional (Keyword only)
             The http client to use instead of creating a new one.
+        
+        http2 : `bool | HTTP2Client` = `HTTP2`, Optional (Keyword only)
+            Whether the requests should be done over http/2, or the http/2 client to use. The requests which cannot be
+            done over http/2 fall back to the http client.
+        
+        rate_limit_broker : `None | RateLimitBrokerBase` = `None`, Optional (Keyword only)
+            Rate limit broker to share the rate limits with. If not given and `HATA_RATE_LIMIT_BROKER_PATH` is set,
+            connects to the broker server listening on it, else the rate limits are handled only in-process.
+        
+        request_coalescing : `bool` = `True`, Optional (Keyword only)
+            Whether concurrent identical `GET` requests should share one response.
+        
+        response_cache_time_to_live : `float` = `RESPONSE_CACHE_TIME_TO_LIVE`, Optional (Keyword only)
+            For how long the responses of the cacheable read endpoints should be cached. `0.0` to disable.
         """
         connector = get_connector()
         headers = build_headers(bot, token, debug_options)
@@ -69,17 +138,56 @@ class DiscordApiClient(RichAttributeErrorBaseType):
         if http is None:
             http = HTTPClient(KOKORO, connector = connector)
         
+        if isinstance(http2, HTTP2Client):
+            pass
+        elif http2:
+            http2 = HTTP2Client(
+                KOKORO,
+                http,
+                max_concurrent_streams = HTTP2_MAX_CONCURRENT_STREAMS,
+                max_connections = HTTP2_MAX_CONNECTIONS,
+            )
+        else:
+            http2 = None
+        
+        if rate_limit_broker is None:
+            if RATE_LIMIT_BROKER_PATH is None:
+                rate_limit_broker = RateLimitBrokerBase()
+            else:
+                rate_limit_broker = RateLimitBrokerUnixSocket(RATE_LIMIT_BROKER_PATH)
+        
         self = object.__new__(cls)
+        self.bucket_discovery = RateLimitBucketDiscovery() if bucket_discovery else None
         self.debug_options = debug_options
         self.http = http
+        self.http2 = http2
         self.global_rate_limit_expires_at = 0.0
+        self.global_rate_limit_waiters = RequestPriorityQueue()
         self.handlers = WeakMap()
         self.headers = headers
+        self.queue_statistics = RequestQueueStatistics()
+        self.rate_limit_broker = rate_limit_broker
+        self.request_coalescer = RequestCoalescer() if request_coalescing else None
+        self.response_cache = ResponseCache(response_cache_time_to_live) if response_cache_time_to_live > 0 else None
+        self.token_key = get_token_key(token)
         return self
     
     
     async def discord_request(
-        self, handler, method, url, data = None, query = None, headers = None, reason = None, *, params = ...
+        self,
+        handler,
+        method,
+        url,
+        data = None,
+        query = None,
+        headers = None,
+        reason = None,
+        *,
+        cache = True,
+        coalesce = True,
+        params = ...,
+        priority = REQUEST_PRIORITY_DEFAULT,
+        stream = None,
     ):
         """
         Does a request towards Discord.
@@ -109,6 +217,23 @@ class DiscordApiClient(RichAttributeErrorBaseType):
         reason : `None`, `str` = `None`, Optional
             Shows up at the request's respective guild if applicable.
         
+        cache : `bool` = `True`, Optional (Keyword only)
+            Whether the response can be served from and stored in the response cache. Only applicable for the
+            cacheable read endpoints.
+        
+        coalesce : `bool` = `True`, Optional (Keyword only)
+            Whether the request can share its response with an identical in-flight request. Only applicable for
+            `GET` requests done with the api client's own headers. Coalesced requests get their own copy of the
+            response data.
+        
+        priority : `int` = `REQUEST_PRIORITY_DEFAULT`, Optional (Keyword only)
+            The request's priority. When waiting for rate limits, more urgent requests are started first. Can be
+            `REQUEST_PRIORITY_INTERACTION`, `REQUEST_PRIORITY_DEFAULT` or `REQUEST_PRIORITY_BACKGROUND`.
+        
+        stream : `None | ResponseStream` = `None`, Optional (Keyword only)
+            If given, a successful response's body is decoded as a json array into it while being received, and
+            `None` is returned.
+        
         Returns
         -------
         response_data : `object`
@@ -117,6 +242,8 @@ class DiscordApiClient(RichAttributeErrorBaseType):
         ------
         TypeError
             `data`'s or `query`'s type is bad, or they contain object(s) with bad type.
+        ValueError
+            `priority`'s value is incorrect, or a streamed response's body is not a valid json array.
         ConnectionError
             No internet connection.
         DiscordException
@@ -135,6 +262,54 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             )
             query = params
         
+        priority = validate_priority(priority)
+        
+        if cache and (stream is None):
+            response_cache = self.response_cache
+            if (response_cache is not None):
+                request_key = response_cache.get_request_key(handler, method, url, data, query, headers)
+                if (request_key is not None):
+                    entry = response_cache.get(request_key)
+                    if (entry is not None):
+                        return copy_response_data(entry[1])
+                    
+                    generation = response_cache.generation
+                    response_data = await self.discord_request(
+                        handler,
+                        method,
+                        url,
+                        data,
+                        query,
+                        headers,
+                        reason,
+                        cache = False,
+                        coalesce = coalesce,
+                        priority = priority,
+                    )
+                    response_cache.put(request_key, response_data, generation)
+                    return response_data
+        
+        if coalesce and (stream is None):
+            request_coalescer = self.request_coalescer
+            if (request_coalescer is not None):
+                request_key = request_coalescer.get_request_key(method, url, data, query, headers)
+                if (request_key is not None):
+                    return await request_coalescer.request(
+                        request_key,
+                        partial_func(
+                            self.discord_request,
+                            handler,
+                            method,
+                            url,
+                            data,
+                            query,
+                            headers,
+                            reason,
+                            cache = False,
+                            coalesce = False,
+                            priority = priority,
+                        ),
+                    )
         
         if headers is None:
             # normal request
@@ -142,7 +317,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             
             if not isinstance(data, NON_JSON_TYPES):
                 headers[CONTENT_TYPE] = 'application/json'
-                data = to_json(data)
+                data = JSON_CODEC.encode(data)
             
             if (reason is not None):
                 headers[AUDIT_LOG_REASON] = quote(reason, safe = '\\ ')
@@ -150,28 +325,67 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             # bearer or webhook request
             if (CONTENT_TYPE not in headers) and (not isinstance(data, NON_JSON_TYPES)):
                 headers[CONTENT_TYPE] = 'application/json'
-                data = to_json(data)
+                data = JSON_CODEC.encode(data)
+        
+        # Resolve the handler of the route's discovered bucket. Only the dynamic rate limit handlers take part in it.
+        bucket_discovery = self.bucket_discovery
+        if (bucket_discovery is None) or (type(handler) is not RateLimitHandler) or handler.is_unlimited():
+            route_key = None
+            bucket_hash = None
+        else:
+            route_key = bucket_discovery.get_route_key(handler, method, url)
+            handler = bucket_discovery.resolve(handler, route_key)
+            bucket_hash = bucket_discovery.get_bucket_hash(route_key)
         
         if not handler.is_unlimited():
             handler = self.handlers.set(handler)
         
+        rate_limit_broker = self.rate_limit_broker
+        bucket_key = get_bucket_key(handler, self.token_key, bucket_hash)
+        
+        http = self.http2
+        if http is None:
+            http = self.http
+        
         causes = None
         
+        queue_statistics = self.queue_statistics
+        
         while True:
-            global_rate_limit_expires_at = self.global_rate_limit_expires_at
-            if global_rate_limit_expires_at > LOOP_TIME():
-                future = Future(KOKORO)
-                KOKORO.call_at(global_rate_limit_expires_at, Future.set_result_if_pending, future, None)
-                await future
+            queued_at = LOOP_TIME()
+            if self.global_rate_limit_expires_at > queued_at:
+                await self._wait_for_global_rate_limit(priority)
+            
+            await handler.enter(priority)
+            queue_statistics.record(priority, LOOP_TIME() - queued_at)
             
-            await handler.enter()
             with handler.ctx() as lock:
+                await rate_limit_broker.acquire(bucket_key)
+                
                 try:
                     async with RequestContextManager(
-                        self.http._request(method, url, headers, data = data, query = query)
+                        http._request(method, url, headers, data = data, query = query)
                     ) as response:
-                        response_data = await response.text(encoding = 'utf-8')
+                        if (stream is None) or (not (199 < response.status < 305)):
+                            response_data = await response.read()
+                        else:
+                            # Release the rate limit before reading the body, it can take a while if the consumer
+                            # is slow.
+                            response_headers = response.headers
+                            rate_limit_broker.release(bucket_key, response_headers)
+                            if (route_key is not None):
+                                bucket_discovery.learn(route_key, response_headers)
+                            
+                            lock.exit(response_headers)
+                            await stream.feed_response(response)
+                            return None
+                
                 except (OSError, PayloadError) as exception:
+                    # Already yielded elements cannot be taken back, so a partially streamed response cannot be
+                    # retried.
+                    if (stream is not None) and stream.started:
+                        raise
+                    
                     if causes is None:
                         causes = []
                     
@@ -193,9 +407,19 @@ class DiscordApiClient(RichAttributeErrorBaseType):
                 response_headers = response.headers
                 status = response.status
                 
-                content_type_headers = response_headers.get(CONTENT_TYPE, None)
-                if (content_type_headers is not None) and content_type_headers.startswith('application/json'):
-                    response_data = from_json(response_data)
+                rate_limit_broker.release(bucket_key, response_headers)
+                
+                if (route_key is not None):
+                    bucket_discovery.learn(route_key, response_headers)
+                
+                # Decode the body directly from `bytes`, most json codecs can do it without an intermediate utf-8
+                # decoding.
+                if (response_data is not None):
+                    content_type_headers = response_headers.get(CONTENT_TYPE, None)
+                    if (content_type_headers is not None) and content_type_headers.startswith('application/json'):
+                        response_data = JSON_CODEC.decode(response_data)
+                    else:
+                        response_data = response_data.decode('utf-8')
                 
                 if 199 < status < 305:
                     lock.exit(response_headers)
@@ -212,11 +436,9 @@ class DiscordApiClient(RichAttributeErrorBaseType):
                     
                     retry_after = response_data.get('retry_after', 0.0)
                     if response_data.get('global', False):
-                        global_rate_limit_expires_at = LOOP_TIME() + retry_after
-                        self.global_rate_limit_expires_at = global_rate_limit_expires_at
-                        future = Future(KOKORO)
-                        KOKORO.call_at(global_rate_limit_expires_at, Future.set_result_if_pending, future, None)
-                        await future
+                        rate_limit_broker.set_global_rate_limit(retry_after)
+                        self.global_rate_limit_expires_at = LOOP_TIME() + retry_after
+                        await self._wait_for_global_rate_limit(priority)
                     else:
                         await sleep(retry_after, KOKORO)
                     continue
@@ -237,6 +459,130 @@ class DiscordApiClient(RichAttributeErrorBaseType):
                     ) from (None if causes is None else CauseGroup(*causes))
                 finally:
                     causes = None
+    
+    
+    async def _wait_for_global_rate_limit(self, priority):
+        """
+        Waits till the global rate limit expires.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        priority : `int`
+            The request's priority. When the global rate limit expires, more urgent requests are woken up first.
+        """
+        global_rate_limit_waiters = self.global_rate_limit_waiters
+        if not global_rate_limit_waiters:
+            KOKORO.call_at(self.global_rate_limit_expires_at, type(self)._wake_up_global_rate_limit_waiters, self)
+        
+        future = Future(KOKORO)
+        global_rate_limit_waiters.append(future, priority)
+        await future
+    
+    
+    def _wake_up_global_rate_limit_waiters(self):
+        """
+        Wakes up the requests waiting for the global rate limit to expire in the order of their priority. If the global
+        rate limit was extended meanwhile, waits for it again.
+        """
+        global_rate_limit_expires_at = self.global_rate_limit_expires_at
+        if global_rate_limit_expires_at > LOOP_TIME():
+            KOKORO.call_at(global_rate_limit_expires_at, type(self)._wake_up_global_rate_limit_waiters, self)
+            return
+        
+        global_rate_limit_waiters = self.global_rate_limit_waiters
+        while global_rate_limit_waiters:
+            global_rate_limit_waiters.popleft().set_result_if_pending(None)
+    
+    
+    async def discord_request_stream(
+        self,
+        handler,
+        method,
+        url,
+        data = None,
+        query = None,
+        headers = None,
+        reason = None,
+        *,
+        priority = REQUEST_PRIORITY_DEFAULT,
+    ):
+        """
+        Does a request towards Discord, yielding the elements of the json array response while they are received.
+        
+        The elements are decoded one by one, so they can be processed before the whole response is received. The
+        response is not cached and not coalesced with other requests.
+        
+        This method is an async generator.
+        
+        Parameters
+        ----------
+        handler : ``RateLimitHandler``, ``StackedStaticRateLimitHandler``
+            Rate limit handler for the request.
+        
+        method : `str`
+            The method of the request.
+        
+        url : `str`
+            The url to request.
+        
+        data : `None`, `object` = `None`, Optional
+            Payload to request with.
+        
+        query : `None`, `object` = `None`, Optional
+            Query string parameters.
+        
+        headers : `None`, ``IgnoreCaseMultiValueDictionary`` = `None`, Optional
+            Headers to do the request with. If passed then the session's own headers wont be used.
+        
+        reason : `None`, `str` = `None`, Optional
+            Shows up at the request's respective guild if applicable.
+        
+        priority : `int` = `REQUEST_PRIORITY_DEFAULT`, Optional (Keyword only)
+            The request's priority.
+        
+        Yields
+        ------
+        item : `object`
+        
+        Raises
+        ------
+        TypeError
+            `data`'s or `query`'s type is bad, or they contain object(s) with bad type.
+        ValueError
+            `priority`'s value is incorrect, or the response's body is not a valid json array.
+        ConnectionError
+            No internet connection.
+        DiscordException
+            Any exception raised by the Discord API.
+        """
+        stream = ResponseStream(JSON_CODEC, RESPONSE_STREAM_BUFFER_LIMIT)
+        task = Task(
+            KOKORO,
+            self.discord_request(
+                handler,
+                method,
+                url,
+                data,
+                query,
+                headers,
+                reason,
+                cache = False,
+                coalesce = False,
+                priority = priority,
+                stream = stream,
+            ),
+        )
+        task.add_done_callback(stream)
+        
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            # Stop reading the response if the consumer stopped early.
+            if not task.is_done():
+                task.cancel()
 
     # client
     
@@ -600,6 +946,15 @@ class DiscordApiClient(RichAttributeErrorBaseType):
         )
     
     
+    def message_get_chunk_stream(self, channel_id, query):
+        return self.discord_request_stream(
+            RateLimitHandler(RATE_LIMIT_GROUPS.message_get_chunk, channel_id),
+            METHOD_GET,
+            f'{API_ENDPOINT}/channels/{channel_id}/messages',
+            query = query,
+        )
+    
+    
     async def message_create(self, channel_id, data):
         return await self.discord_request(
             RateLimitHandler(RATE_LIMIT_GROUPS.message_create, channel_id),
@@ -624,6 +979,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             METHOD_DELETE,
             f'{API_ENDPOINT}/channels/{channel_id}/messages/{message_id}',
             reason = reason,
+            priority = REQUEST_PRIORITY_BACKGROUND,
         )
     
     
@@ -634,6 +990,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             f'{API_ENDPOINT}/channels/{channel_id}/messages/bulk-delete',
             data,
             reason = reason,
+            priority = REQUEST_PRIORITY_BACKGROUND,
         )
     
     
@@ -1017,6 +1374,16 @@ class DiscordApiClient(RichAttributeErrorBaseType):
         )
     
     
+    def guild_ban_get_chunk_stream(self, guild_id, query):
+        return self.discord_request_stream(
+            RateLimitHandler(RATE_LIMIT_GROUPS.guild_ban_get_chunk, guild_id),
+            METHOD_GET,
+            f'{API_ENDPOINT}/guilds/{guild_id}/bans',
+            query = query,
+            priority = REQUEST_PRIORITY_BACKGROUND,
+        )
+    
+    
     async def guild_ban_get(self, guild_id, user_id):
         return await self.discord_request(
             RateLimitHandler(RATE_LIMIT_GROUPS.guild_ban_get, guild_id),
@@ -1049,6 +1416,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             METHOD_GET,
             f'{API_ENDPOINT}/guilds/{guild_id}/audit-logs',
             query = query,
+            priority = REQUEST_PRIORITY_BACKGROUND,
         )
     
     
@@ -1174,6 +1542,17 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             METHOD_GET,
             f'{API_ENDPOINT}/guilds/{guild_id}/members',
             query = query,
+            priority = REQUEST_PRIORITY_BACKGROUND,
+        )
+    
+    
+    def guild_user_get_chunk_stream(self, guild_id, query):
+        return self.discord_request_stream(
+            RateLimitHandler(RATE_LIMIT_GROUPS.guild_user_get_chunk, guild_id),
+            METHOD_GET,
+            f'{API_ENDPOINT}/guilds/{guild_id}/members',
+            query = query,
+            priority = REQUEST_PRIORITY_BACKGROUND,
         )
     
     
@@ -2229,6 +2608,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             f'{API_ENDPOINT}/interactions/{interaction_id}/{interaction_token}/callback',
             data,
             query_string_parameters,
+            priority = REQUEST_PRIORITY_INTERACTION,
         )
     
     
@@ -2238,6 +2618,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             METHOD_PATCH,
             f'{API_ENDPOINT}/webhooks/{application_id}/{interaction_token}/messages/@original',
             data,
+            priority = REQUEST_PRIORITY_INTERACTION,
         )
     
     
@@ -2246,6 +2627,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             RateLimitHandler(RATE_LIMIT_GROUPS.interaction_response_message_delete, interaction_id),
             METHOD_DELETE,
             f'{API_ENDPOINT}/webhooks/{application_id}/{interaction_token}/messages/@original',
+            priority = REQUEST_PRIORITY_INTERACTION,
         )
     
     
@@ -2254,6 +2636,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             RateLimitHandler(RATE_LIMIT_GROUPS.interaction_response_message_get, interaction_id),
             METHOD_GET,
             f'{API_ENDPOINT}/webhooks/{application_id}/{interaction_token}/messages/@original',
+            priority = REQUEST_PRIORITY_INTERACTION,
         )
     
     
@@ -2263,6 +2646,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             METHOD_POST,
             f'{API_ENDPOINT}/webhooks/{application_id}/{interaction_token}',
             data,
+            priority = REQUEST_PRIORITY_INTERACTION,
         )
     
     
@@ -2274,6 +2658,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             METHOD_PATCH,
             f'{API_ENDPOINT}/webhooks/{application_id}/{interaction_token}/messages/{message_id}',
             data,
+            priority = REQUEST_PRIORITY_INTERACTION,
         )
     
     
@@ -2282,6 +2667,7 @@ class DiscordApiClient(RichAttributeErrorBaseType):
             RateLimitHandler(RATE_LIMIT_GROUPS.interaction_followup_message_delete, interaction_id),
             METHOD_DELETE,
             f'{API_ENDPOINT}/webhooks/{application_id}/{interaction_token}/messages/{message_id}',
+            priority = REQUEST_PRIORITY_INTERACTION,
         )
     
     
@@ -2289,7 +2675,8 @@ class DiscordApiClient(RichAttributeErrorBaseType):
         return await self.discord_request(
             RateLimitHandler(RATE_LIMIT_GROUPS.interaction_followup_message_get, interaction_id),
             METHOD_GET,
-            f'{API_ENDPOINT}/webhooks/{application_id}/{interaction_token}/messages/{message_id}'
+            f'{API_ENDPOINT}/webhooks/{application_id}/{interaction_token}/messages/{message_id}',
+            priority = REQUEST_PRIORITY_INTERACTION,
         )
     
     # User account only
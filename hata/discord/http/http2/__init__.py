@@ -0,0 +1,12 @@
+from .client import *
+from .connection import *
+from .response import *
+from .utils import *
+
+
+__all__ = (
+    *client.__all__,
+    *connection.__all__,
+    *response.__all__,
+    *utils.__all__,
+)
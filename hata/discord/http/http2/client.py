@@ -0,0 +1,359 @@
+__all__ = ('HTTP2Client',)
+
+from functools import partial as partial_func
+from ssl import create_default_context as create_default_ssl_context
+
+from scarletio import Future, RichAttributeErrorBaseType
+from scarletio.web_common import URL
+
+from .connection import HTTP2Connection
+from .utils import ALPN_PROTOCOL_HTTP2, HTTP2_AVAILABLE, build_request_headers, get_authority, get_path
+
+
+BODY_TYPES = (bytes, str, type(None))
+
+
+class HTTP2Client(RichAttributeErrorBaseType):
+    """
+    Http client multiplexing requests over a few http/2 connections per origin.
+    
+    Requests which cannot be done over http/2 are done by the fallback http client:
+    - If the `h2` library is not installed.
+    - If the server did not negotiate http/2.
+    - If the request's body is not `bytes` or `str` (for example multipart form data).
+    
+    Attributes
+    ----------
+    _capacity_waiters : `dict<(str, str, int), list<Future>>`
+        Origin to waiters relation waiting for a stream to be released.
+    _connecting_counts : `dict<(str, str, int), int>`
+        Origin to the amount of connections being opened relation.
+    _connections : `dict<(str, str, int), list<HTTP2Connection>>`
+        Origin to connections relation.
+    fallback : ``HTTPClient``
+        Http client to use for the requests which cannot be done over http/2.
+    loop : ``EventThread``
+        The event loop to what the client is bound to.
+    max_concurrent_streams : `int`
+        The maximal amount of concurrent streams per connection.
+    max_connections : `int`
+        The maximal amount of connections per origin.
+    ssl_context : `SSLContext`
+        Ssl context advertising http/2 over alpn.
+    unsupported_origins : `set<(str, str, int)>`
+        Origins which did not negotiate http/2.
+    """
+    __slots__ = (
+        '_capacity_waiters', '_connecting_counts', '_connections', 'fallback', 'loop', 'max_concurrent_streams',
+        'max_connections', 'ssl_context', 'unsupported_origins'
+    )
+    
+    def __new__(cls, loop, fallback, *, max_concurrent_streams = 100, max_connections = 2):
+        """
+        Creates a new http/2 client.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop to what the client is bound to.
+        fallback : ``HTTPClient``
+            Http client to use for the requests which cannot be done over http/2.
+        max_concurrent_streams : `int` = `100`, Optional (Keyword only)
+            The maximal amount of concurrent streams per connection. Lowered to the server's limit if it is less.
+        max_connections : `int` = `2`, Optional (Keyword only)
+            The maximal amount of connections per origin.
+        
+        Raises
+        ------
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        if max_concurrent_streams < 1:
+            raise ValueError(
+                f'`max_concurrent_streams` cannot be less than `1`, got {max_concurrent_streams!r}.'
+            )
+        
+        if max_connections < 1:
+            raise ValueError(
+                f'`max_connections` cannot be less than `1`, got {max_connections!r}.'
+            )
+        
+        ssl_context = create_default_ssl_context()
+        ssl_context.set_alpn_protocols([ALPN_PROTOCOL_HTTP2])
+        
+        self = object.__new__(cls)
+        self._capacity_waiters = {}
+        self._connecting_counts = {}
+        self._connections = {}
+        self.fallback = fallback
+        self.loop = loop
+        self.max_concurrent_streams = max_concurrent_streams
+        self.max_connections = max_connections
+        self.ssl_context = ssl_context
+        self.unsupported_origins = set()
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the http/2 client's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' connection_count = ')
+        repr_parts.append(repr(sum(len(connections) for connections in self._connections.values())))
+        
+        repr_parts.append(', max_connections = ')
+        repr_parts.append(repr(self.max_connections))
+        
+        repr_parts.append(', max_concurrent_streams = ')
+        repr_parts.append(repr(self.max_concurrent_streams))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def is_supported(self, origin, data):
+        """
+        Returns whether the request can be done over http/2.
+        
+        Parameters
+        ----------
+        origin : `(str, str, int)`
+            The requested origin.
+        data : `object`
+            The request's body.
+        
+        Returns
+        -------
+        supported : `bool`
+        """
+        if not HTTP2_AVAILABLE:
+            return False
+        
+        if not isinstance(data, BODY_TYPES):
+            return False
+        
+        if origin in self.unsupported_origins:
+            return False
+        
+        return True
+    
+    
+    async def _request(self, method, url, headers, *, data = None, query = None):
+        """
+        Does a request.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        method : `str`
+            The method of the request.
+        url : `str | URL`
+            The url to request.
+        headers : ``IgnoreCaseMultiValueDictionary``
+            Request headers.
+        data : `None | object` = `None`, Optional (Keyword only)
+            Data to send as the body of the request.
+        query : `None | object` = `None`, Optional (Keyword only)
+            Query parameters.
+        
+        Returns
+        -------
+        response : ``HTTP2Response``, ``ClientResponse``
+        
+        Raises
+        ------
+        ConnectionError
+            - The connection was lost or the stream was reset.
+        OSError
+            - Cannot connect to the server.
+        """
+        url = URL(url)
+        origin = (url.scheme, url.raw_host, url.port)
+        
+        if not self.is_supported(origin, data):
+            return await self.fallback._request(method, url, headers, data = data, query = query)
+        
+        connection = await self._acquire_connection(origin)
+        if connection is None:
+            return await self.fallback._request(method, url, headers, data = data, query = query)
+        
+        if (query is not None):
+            url = url.extend_query(query)
+        
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        
+        request_headers = build_request_headers(
+            method, get_authority(url), url.scheme, get_path(url), headers, data
+        )
+        return await connection.request(method, url, request_headers, data)
+    
+    
+    async def _acquire_connection(self, origin):
+        """
+        Acquires a connection to the given origin reserving a stream on it. Picks the least used connection, opens a
+        new one if all is full, or waits till a stream is released if the connection limit is reached.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        origin : `(str, str, int)`
+            The origin to connect to.
+        
+        Returns
+        -------
+        connection : `None | HTTP2Connection`
+            Returns `None` if the origin does not support http/2.
+        
+        Raises
+        ------
+        OSError
+            - Cannot connect to the server.
+        """
+        while True:
+            connections = self._connections.get(origin, None)
+            if (connections is not None):
+                selected_connection = None
+                for connection in connections:
+                    if not connection.has_capacity():
+                        continue
+                    
+                    if (
+                        (selected_connection is None) or
+                        (connection.active_stream_count < selected_connection.active_stream_count)
+                    ):
+                        selected_connection = connection
+                
+                if (selected_connection is not None):
+                    selected_connection.reserve_stream()
+                    return selected_connection
+                
+                connection_count = len(connections)
+            else:
+                connection_count = 0
+            
+            connecting_count = self._connecting_counts.get(origin, 0)
+            if connection_count + connecting_count < self.max_connections:
+                self._connecting_counts[origin] = connecting_count + 1
+                try:
+                    connection = await self._open_connection(origin)
+                finally:
+                    connecting_count = self._connecting_counts[origin] - 1
+                    if connecting_count:
+                        self._connecting_counts[origin] = connecting_count
+                    else:
+                        del self._connecting_counts[origin]
+                    
+                    # Either a connection is added or failed, in both case the waiters should retry.
+                    self._wake_up_capacity_waiters(origin)
+                
+                if connection is None:
+                    return None
+                
+                self._connections.setdefault(origin, []).append(connection)
+                continue
+            
+            if origin in self.unsupported_origins:
+                return None
+            
+            waiter = Future(self.loop)
+            self._capacity_waiters.setdefault(origin, []).append(waiter)
+            await waiter
+    
+    
+    async def _open_connection(self, origin):
+        """
+        Opens a new http/2 connection to the given origin.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        origin : `(str, str, int)`
+            The origin to connect to.
+        
+        Returns
+        -------
+        connection : `None | HTTP2Connection`
+            Returns `None` if the origin does not support http/2.
+        
+        Raises
+        ------
+        OSError
+            - Cannot connect to the server.
+        """
+        scheme, host, port = origin
+        # Plain text connections are done with prior knowledge.
+        ssl_context = self.ssl_context if scheme == 'https' else None
+        
+        connection = await self.loop.create_connection_to(
+            partial_func(
+                HTTP2Connection,
+                self.loop,
+                self.max_concurrent_streams,
+                partial_func(self._connection_released_stream, origin),
+            ),
+            host,
+            port,
+            ssl_context = ssl_context,
+        )
+        
+        if not connection.is_http2_negotiated():
+            connection.close_transport()
+            self.unsupported_origins.add(origin)
+            return None
+        
+        return connection
+    
+    
+    def _connection_released_stream(self, origin, connection):
+        """
+        Called when a connection released a stream or got closed.
+        
+        Parameters
+        ----------
+        origin : `(str, str, int)`
+            The connection's origin.
+        connection : ``HTTP2Connection``
+            The connection.
+        """
+        if connection.closed:
+            connections = self._connections.get(origin, None)
+            if (connections is not None):
+                try:
+                    connections.remove(connection)
+                except ValueError:
+                    pass
+                else:
+                    if not connections:
+                        del self._connections[origin]
+        
+        self._wake_up_capacity_waiters(origin)
+    
+    
+    def _wake_up_capacity_waiters(self, origin):
+        """
+        Wakes up the requests waiting for capacity towards the given origin.
+        
+        Parameters
+        ----------
+        origin : `(str, str, int)`
+            The origin.
+        """
+        capacity_waiters = self._capacity_waiters.pop(origin, None)
+        if (capacity_waiters is not None):
+            for waiter in capacity_waiters:
+                waiter.set_result_if_pending(None)
+    
+    
+    def close(self):
+        """
+        Closes the client's connections.
+        """
+        connections = self._connections
+        self._connections = {}
+        for origin_connections in connections.values():
+            for connection in origin_connections:
+                connection.close()
@@ -0,0 +1,497 @@
+__all__ = ('HTTP2Connection',)
+
+from scarletio import Future, RichAttributeErrorBaseType, skip_ready_cycle
+from scarletio.core.protocols_and_transports.abstract import AbstractProtocolBase
+
+from .response import HTTP2Response
+from .utils import (
+    ALPN_PROTOCOL_HTTP2, ConnectionTerminated, DataReceived, H2Configuration, H2Connection, H2ProtocolError,
+    RemoteSettingsChanged, ResponseReceived, StreamEnded, StreamReset, TrailersReceived, WindowUpdated,
+    build_response_headers
+)
+
+
+class HTTP2Connection(AbstractProtocolBase, RichAttributeErrorBaseType):
+    """
+    Http/2 client connection multiplexing requests over streams.
+    
+    Attributes
+    ----------
+    _h2 : `H2Connection`
+        The http/2 state machine.
+    _transport : `None | AbstractTransportLayerBase`
+        The connection's transport.
+    _window_waiters : `list<Future>`
+        Waiters waiting for the flow control window to be increased.
+    active_stream_count : `int`
+        The amount of streams reserved or in use.
+    closed : `bool`
+        Whether the connection is closed.
+    loop : ``EventThread``
+        The event loop to what the connection is bound to.
+    max_concurrent_streams : `int`
+        The maximal amount of concurrent streams. Lowered if the server allows less.
+    on_stream_released : `None | callable`
+        Called when a stream is released with the connection as its parameter.
+    responses : `dict<int, HTTP2Response>`
+        Stream identifier to response relation of the active streams.
+    """
+    __slots__ = (
+        '_h2', '_transport', '_window_waiters', 'active_stream_count', 'closed', 'loop', 'max_concurrent_streams',
+        'on_stream_released', 'responses'
+    )
+    
+    def __new__(cls, loop, max_concurrent_streams, on_stream_released):
+        """
+        Creates a new http/2 connection.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop to what the connection is bound to.
+        max_concurrent_streams : `int`
+            The maximal amount of concurrent streams.
+        on_stream_released : `None | callable`
+            Called when a stream is released with the connection as its parameter.
+        """
+        self = object.__new__(cls)
+        self._h2 = H2Connection(H2Configuration(client_side = True, header_encoding = None))
+        self._transport = None
+        self._window_waiters = []
+        self.active_stream_count = 0
+        self.closed = False
+        self.loop = loop
+        self.max_concurrent_streams = max_concurrent_streams
+        self.on_stream_released = on_stream_released
+        self.responses = {}
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the connection's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        if self.closed:
+            repr_parts.append(' closed')
+        else:
+            repr_parts.append(' active_stream_count = ')
+            repr_parts.append(repr(self.active_stream_count))
+            
+            repr_parts.append(', max_concurrent_streams = ')
+            repr_parts.append(repr(self.max_concurrent_streams))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def connection_made(self, transport):
+        """
+        Called when a connection is made. Sends the http/2 connection preface.
+        
+        Parameters
+        ----------
+        transport : ``AbstractTransportLayerBase``
+            The connection's transport.
+        """
+        self._transport = transport
+        
+        # If http/2 is not negotiated, the connection is closed by the client.
+        if not self.is_http2_negotiated():
+            return
+        
+        self._h2.initiate_connection()
+        self._flush()
+    
+    
+    def connection_lost(self, exception):
+        """
+        Called when the connection is lost or closed. Fails every active stream.
+        
+        Parameters
+        ----------
+        exception : `None | BaseException`
+            The exception the connection was lost with.
+        """
+        self._transport = None
+        self._set_closed(ConnectionError('Http/2 connection lost.') if exception is None else exception)
+    
+    
+    def get_transport(self):
+        """
+        Returns the connection's transport.
+        
+        Returns
+        -------
+        transport : `None | AbstractTransportLayerBase`
+        """
+        return self._transport
+    
+    
+    def get_extra_info(self, name, default = None):
+        """
+        Gets optional transport information.
+        
+        Parameters
+        ----------
+        name : `str`
+            The extra information's name to get.
+        default : `object` = `None`, Optional
+            Default value to return if `name` could not be matched.
+        
+        Returns
+        -------
+        info : `default | object`
+        """
+        transport = self._transport
+        if transport is None:
+            return default
+        
+        return transport.get_extra_info(name, default)
+    
+    
+    def is_http2_negotiated(self):
+        """
+        Returns whether http/2 was negotiated over tls. Connections without tls are expected to have prior knowledge.
+        
+        Returns
+        -------
+        negotiated : `bool`
+        """
+        ssl_object = self.get_extra_info('ssl_object')
+        if ssl_object is None:
+            return True
+        
+        return ssl_object.selected_alpn_protocol() == ALPN_PROTOCOL_HTTP2
+    
+    
+    def close(self):
+        """
+        Closes the connection.
+        """
+        if self.closed:
+            return
+        
+        try:
+            self._h2.close_connection()
+            self._flush()
+        except H2ProtocolError:
+            pass
+        
+        transport = self._transport
+        if (transport is not None):
+            transport.close()
+        
+        self._set_closed(ConnectionError('Http/2 connection closed.'))
+    
+    
+    def close_transport(self, force = False):
+        """
+        Closes the connection's transport.
+        
+        Parameters
+        ----------
+        force : `bool` = `False`, Optional
+            Whether the transport should be closed without waiting for its buffer to be flushed.
+        """
+        transport = self._transport
+        if (transport is not None):
+            if force:
+                transport.abort()
+            else:
+                transport.close()
+    
+    
+    def pause_writing(self):
+        """
+        Called when the transport's buffer goes over the high-water mark.
+        """
+        pass
+    
+    
+    def resume_writing(self):
+        """
+        Called when the transport's buffer drains below the low-water mark.
+        """
+        pass
+    
+    
+    def eof_received(self):
+        """
+        Called when the other end signals it won't send any more data.
+        
+        Returns
+        -------
+        transport_closes : `bool`
+        """
+        return False
+    
+    
+    def has_capacity(self):
+        """
+        Returns whether a new stream can be opened on the connection.
+        
+        Returns
+        -------
+        has_capacity : `bool`
+        """
+        if self.closed:
+            return False
+        
+        max_concurrent_streams = self.max_concurrent_streams
+        remote_max_concurrent_streams = self._h2.remote_settings.max_concurrent_streams
+        if remote_max_concurrent_streams < max_concurrent_streams:
+            max_concurrent_streams = remote_max_concurrent_streams
+        
+        return self.active_stream_count < max_concurrent_streams
+    
+    
+    def reserve_stream(self):
+        """
+        Reserves a stream. Should be called before ``.request`` when the connection has capacity.
+        """
+        self.active_stream_count += 1
+    
+    
+    def release_stream(self):
+        """
+        Releases a reserved stream.
+        """
+        self.active_stream_count -= 1
+        
+        on_stream_released = self.on_stream_released
+        if (on_stream_released is not None):
+            on_stream_released(self)
+    
+    
+    async def request(self, method, url, request_headers, body):
+        """
+        Does a request on a previously reserved stream. The stream is released when the response is fully received.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        method : `str`
+            The method of the request.
+        url : ``URL``
+            The requested url.
+        request_headers : `list<(str, str)>`
+            Request headers including the pseudo headers.
+        body : `None | bytes`
+            The request's body.
+        
+        Returns
+        -------
+        response : ``HTTP2Response``
+        
+        Raises
+        ------
+        ConnectionError
+            - The connection is closed.
+            - The stream was reset.
+        """
+        if self.closed:
+            self.release_stream()
+            raise ConnectionError('Http/2 connection closed.')
+        
+        h2 = self._h2
+        try:
+            stream_id = h2.get_next_available_stream_id()
+            response = HTTP2Response(self.loop, stream_id, method, url)
+            self.responses[stream_id] = response
+            h2.send_headers(stream_id, request_headers, end_stream = (body is None))
+            self._flush()
+        except H2ProtocolError as exception:
+            self.release_stream()
+            raise ConnectionError('Http/2 protocol error.') from exception
+        
+        if (body is not None):
+            try:
+                await self._send_body(stream_id, body)
+            except H2ProtocolError as exception:
+                self._end_stream(stream_id, ConnectionError('Http/2 protocol error.'))
+                raise ConnectionError('Http/2 protocol error.') from exception
+        
+        await response.wait_for_headers()
+        return response
+    
+    
+    async def _send_body(self, stream_id, body):
+        """
+        Sends the given body over the stream respecting the flow control window.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        stream_id : `int`
+            The stream's identifier.
+        body : `bytes`
+            The body to send.
+        
+        Raises
+        ------
+        ConnectionError
+            - The connection is closed.
+        H2ProtocolError
+        """
+        h2 = self._h2
+        body = memoryview(body)
+        
+        while True:
+            if self.closed:
+                raise ConnectionError('Http/2 connection closed.')
+            
+            if stream_id not in self.responses:
+                # Stream reset by the server, it already told us what is wrong.
+                return
+            
+            size = min(h2.local_flow_control_window(stream_id), h2.max_outbound_frame_size, len(body))
+            if size <= 0:
+                waiter = Future(self.loop)
+                self._window_waiters.append(waiter)
+                await waiter
+                continue
+            
+            end_stream = (size == len(body))
+            h2.send_data(stream_id, body[:size].tobytes(), end_stream = end_stream)
+            self._flush()
+            
+            if end_stream:
+                return
+            
+            body = body[size:]
+            # Let others send as well.
+            await skip_ready_cycle()
+    
+    
+    def data_received(self, data):
+        """
+        Called when data is received. Feeds it to the http/2 state machine and handles its events.
+        
+        Parameters
+        ----------
+        data : `bytes`
+            The received data.
+        """
+        try:
+            events = self._h2.receive_data(data)
+        except H2ProtocolError as exception:
+            self._flush()
+            self.close_transport()
+            self._set_closed(ConnectionError(f'Http/2 protocol error: {exception!s}.'))
+            return
+        
+        for event in events:
+            event_type = type(event)
+            
+            if event_type is ResponseReceived:
+                response = self.responses.get(event.stream_id, None)
+                if (response is not None):
+                    response.set_headers(*build_response_headers(event.headers))
+                continue
+            
+            if event_type is DataReceived:
+                response = self.responses.get(event.stream_id, None)
+                if (response is not None):
+                    response.feed_data(event.data)
+                
+                # Acknowledge the data even if nobody waits for it, else the window of the connection shrinks.
+                self._h2.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                continue
+            
+            if event_type is StreamEnded:
+                self._end_stream(event.stream_id, None)
+                continue
+            
+            if event_type is StreamReset:
+                self._end_stream(
+                    event.stream_id, ConnectionError(f'Http/2 stream reset; error_code = {event.error_code!r}.')
+                )
+                continue
+            
+            if (event_type is WindowUpdated) or (event_type is RemoteSettingsChanged):
+                self._wake_up_window_waiters()
+                continue
+            
+            if event_type is ConnectionTerminated:
+                self.close_transport()
+                self._set_closed(ConnectionError(f'Http/2 connection terminated; error_code = {event.error_code!r}.'))
+                return
+            
+            if event_type is TrailersReceived:
+                continue
+        
+        self._flush()
+    
+    
+    def _end_stream(self, stream_id, exception):
+        """
+        Ends the given stream.
+        
+        Parameters
+        ----------
+        stream_id : `int`
+            The stream's identifier.
+        exception : `None | BaseException`
+            Exception to fail the response with.
+        """
+        response = self.responses.pop(stream_id, None)
+        if response is None:
+            return
+        
+        if exception is None:
+            response.feed_eof()
+        else:
+            response.set_exception(exception)
+        
+        self.release_stream()
+    
+    
+    def _wake_up_window_waiters(self):
+        """
+        Wakes up the waiters waiting for the flow control window to be increased.
+        """
+        window_waiters = self._window_waiters
+        if window_waiters:
+            self._window_waiters = []
+            for waiter in window_waiters:
+                waiter.set_result_if_pending(None)
+    
+    
+    def _set_closed(self, exception):
+        """
+        Marks the connection as closed, failing every active stream.
+        
+        Parameters
+        ----------
+        exception : `BaseException`
+            The exception to fail the active streams with.
+        """
+        if self.closed:
+            return
+        
+        self.closed = True
+        
+        responses = self.responses
+        self.responses = {}
+        for response in responses.values():
+            response.set_exception(exception)
+            self.release_stream()
+        
+        self._wake_up_window_waiters()
+        
+        on_stream_released = self.on_stream_released
+        if (on_stream_released is not None):
+            on_stream_released(self)
+    
+    
+    def _flush(self):
+        """
+        Writes the data produced by the http/2 state machine to the transport.
+        """
+        data = self._h2.data_to_send()
+        if data:
+            transport = self._transport
+            if (transport is not None):
+                transport.write(data)
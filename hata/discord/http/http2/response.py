@@ -0,0 +1,202 @@
+__all__ = ('HTTP2Response',)
+
+from http import HTTPStatus
+
+from scarletio import Future, RichAttributeErrorBaseType
+
+from .utils import decode_body
+
+
+class HTTP2Response(RichAttributeErrorBaseType):
+    """
+    Response received over a http/2 stream.
+    
+    Implements the parts of ``ClientResponse`` used by ``DiscordApiClient``.
+    
+    Attributes
+    ----------
+    _body_parts : `None | list<bytes>`
+        The received body parts. Set as `None` when the body is fully received.
+    _body_waiter : ``Future``
+        Waiter resolved with the body when it is fully received.
+    _headers_waiter : ``Future``
+        Waiter resolved when the response's headers are received.
+    headers : `None | IgnoreCaseMultiValueDictionary`
+        The response's headers.
+    method : `str`
+        The method of the request.
+    payload_stream : `None`
+        Always `None`, the body is read at once.
+    reason : `None | str`
+        The reason phrase of the response's status.
+    status : `int`
+        The response's status.
+    stream_id : `int`
+        The http/2 stream's identifier.
+    url : ``URL``
+        The requested url.
+    """
+    __slots__ = (
+        '_body_parts', '_body_waiter', '_headers_waiter', 'headers', 'method', 'payload_stream', 'reason', 'status',
+        'stream_id', 'url'
+    )
+    
+    def __new__(cls, loop, stream_id, method, url):
+        """
+        Creates a new http/2 response.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop to what the response is bound to.
+        stream_id : `int`
+            The http/2 stream's identifier.
+        method : `str`
+            The method of the request.
+        url : ``URL``
+            The requested url.
+        """
+        self = object.__new__(cls)
+        self._body_parts = []
+        self._body_waiter = Future(loop)
+        self._headers_waiter = Future(loop)
+        self.headers = None
+        self.method = method
+        self.payload_stream = None
+        self.reason = None
+        self.status = 0
+        self.stream_id = stream_id
+        self.url = url
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the response's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' stream_id = ')
+        repr_parts.append(repr(self.stream_id))
+        
+        status = self.status
+        if status:
+            repr_parts.append(', status = ')
+            repr_parts.append(repr(status))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def set_headers(self, status, headers):
+        """
+        Sets the response's headers.
+        
+        Parameters
+        ----------
+        status : `int`
+            The response's status.
+        headers : ``IgnoreCaseMultiValueDictionary``
+            The response's headers.
+        """
+        self.status = status
+        self.headers = headers
+        
+        # Http/2 has no reason phrase, use the standard one.
+        try:
+            reason = HTTPStatus(status).phrase
+        except ValueError:
+            reason = None
+        
+        self.reason = reason
+        self._headers_waiter.set_result_if_pending(None)
+    
+    
+    def feed_data(self, data):
+        """
+        Feeds a received body part to the response.
+        
+        Parameters
+        ----------
+        data : `bytes`
+            The received body part.
+        """
+        body_parts = self._body_parts
+        if (body_parts is not None):
+            body_parts.append(data)
+    
+    
+    def feed_eof(self):
+        """
+        Marks the response's body as fully received.
+        """
+        body_parts = self._body_parts
+        if body_parts is None:
+            return
+        
+        self._body_parts = None
+        
+        body = b''.join(body_parts)
+        headers = self.headers
+        if (headers is not None):
+            try:
+                body = decode_body(body, headers.get('content-encoding', None))
+            except BaseException as exception:
+                self._body_waiter.set_exception_if_pending(exception)
+                return
+        
+        self._body_waiter.set_result_if_pending(body if body else None)
+    
+    
+    def set_exception(self, exception):
+        """
+        Fails the response with the given exception.
+        
+        Parameters
+        ----------
+        exception : `BaseException`
+            The exception to fail with.
+        """
+        self._body_parts = None
+        self._headers_waiter.set_exception_if_pending(exception)
+        self._body_waiter.set_exception_if_pending(exception)
+        # Whoever waits for the body, also waited for the headers, so silence the headers waiter.
+        self._headers_waiter.silence()
+    
+    
+    async def wait_for_headers(self):
+        """
+        Waits till the response's headers are received.
+        
+        This method is a coroutine.
+        
+        Raises
+        ------
+        ConnectionError
+            - The stream was reset or the connection was lost.
+        """
+        await self._headers_waiter
+    
+    
+    async def read(self):
+        """
+        Reads the response's body.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        body : `None | bytes`
+            Returns `None` if the response has no body.
+        
+        Raises
+        ------
+        ConnectionError
+            - The stream was reset or the connection was lost.
+        """
+        return await self._body_waiter
+    
+    
+    def release(self):
+        """
+        Releases the response. Called when the response is not used anymore.
+        """
+        self._body_waiter.silence()
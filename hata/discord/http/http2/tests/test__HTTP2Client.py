@@ -0,0 +1,263 @@
+import vampytest
+from scarletio import IgnoreCaseMultiValueDictionary, Task, TaskGroup
+from scarletio.core.protocols_and_transports.abstract import AbstractProtocolBase
+from scarletio.http_client import HTTPClient
+from scarletio.web_common import FormData
+
+from ....core import KOKORO
+
+from ..client import HTTP2Client
+from ..response import HTTP2Response
+from ..utils import HTTP2_AVAILABLE
+
+
+if HTTP2_AVAILABLE:
+    from h2.config import H2Configuration
+    from h2.connection import H2Connection
+    from h2.events import DataReceived, RequestReceived
+
+
+def _assert_fields_set(client):
+    """
+    Asserts whether every attribute is set of the given http/2 client.
+    
+    Parameters
+    ----------
+    client : ``HTTP2Client``
+        The client to check.
+    """
+    vampytest.assert_instance(client, HTTP2Client)
+    vampytest.assert_instance(client._capacity_waiters, dict)
+    vampytest.assert_instance(client._connecting_counts, dict)
+    vampytest.assert_instance(client._connections, dict)
+    vampytest.assert_instance(client.fallback, HTTPClient)
+    vampytest.assert_is(client.loop, KOKORO)
+    vampytest.assert_instance(client.max_concurrent_streams, int)
+    vampytest.assert_instance(client.max_connections, int)
+    vampytest.assert_instance(client.unsupported_origins, set)
+
+
+def test__HTTP2Client__new__no_fields():
+    """
+    Tests whether ``HTTP2Client.__new__`` works as intended.
+    
+    Case: No optional fields given.
+    """
+    fallback = HTTPClient(KOKORO)
+    
+    client = HTTP2Client(KOKORO, fallback)
+    _assert_fields_set(client)
+    
+    vampytest.assert_is(client.fallback, fallback)
+    vampytest.assert_eq(client.max_concurrent_streams, 100)
+    vampytest.assert_eq(client.max_connections, 2)
+
+
+def test__HTTP2Client__new__all_fields():
+    """
+    Tests whether ``HTTP2Client.__new__`` works as intended.
+    
+    Case: All fields given.
+    """
+    fallback = HTTPClient(KOKORO)
+    max_concurrent_streams = 20
+    max_connections = 4
+    
+    client = HTTP2Client(
+        KOKORO,
+        fallback,
+        max_concurrent_streams = max_concurrent_streams,
+        max_connections = max_connections,
+    )
+    _assert_fields_set(client)
+    
+    vampytest.assert_eq(client.max_concurrent_streams, max_concurrent_streams)
+    vampytest.assert_eq(client.max_connections, max_connections)
+
+
+def _iter_options__new__value_error():
+    yield 0, 1
+    yield 1, 0
+
+
+@vampytest._(vampytest.call_from(_iter_options__new__value_error()).raising(ValueError))
+def test__HTTP2Client__new__value_error(max_concurrent_streams, max_connections):
+    """
+    Tests whether ``HTTP2Client.__new__`` works as intended.
+    
+    Case: Invalid values.
+    
+    Parameters
+    ----------
+    max_concurrent_streams : `int`
+        The maximal amount of concurrent streams per connection.
+    max_connections : `int`
+        The maximal amount of connections per origin.
+    
+    Raises
+    ------
+    ValueError
+    """
+    HTTP2Client(
+        KOKORO,
+        HTTPClient(KOKORO),
+        max_concurrent_streams = max_concurrent_streams,
+        max_connections = max_connections,
+    )
+
+
+def test__HTTP2Client__repr():
+    """
+    Tests whether ``HTTP2Client.__repr__`` works as intended.
+    """
+    client = HTTP2Client(KOKORO, HTTPClient(KOKORO))
+    
+    output = repr(client)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(client).__name__, output)
+
+
+def _iter_options__is_supported():
+    origin = ('https', 'discord.com', 443)
+    
+    yield origin, None, set(), HTTP2_AVAILABLE
+    yield origin, b'{}', set(), HTTP2_AVAILABLE
+    yield origin, '{}', set(), HTTP2_AVAILABLE
+    yield origin, FormData(), set(), False
+    yield origin, None, {origin}, False
+
+
+@vampytest._(vampytest.call_from(_iter_options__is_supported()).returning_last())
+def test__HTTP2Client__is_supported(origin, data, unsupported_origins):
+    """
+    Tests whether ``HTTP2Client.is_supported`` works as intended.
+    
+    Parameters
+    ----------
+    origin : `(str, str, int)`
+        The requested origin.
+    data : `object`
+        The request's body.
+    unsupported_origins : `set<(str, str, int)>`
+        Origins which did not negotiate http/2.
+    
+    Returns
+    -------
+    output : `bool`
+    """
+    client = HTTP2Client(KOKORO, HTTPClient(KOKORO))
+    client.unsupported_origins.update(unsupported_origins)
+    output = client.is_supported(origin, data)
+    vampytest.assert_instance(output, bool)
+    return output
+
+
+class _EchoServerProtocol(AbstractProtocolBase):
+    """
+    Http/2 server protocol responding with the request's method and body length.
+    
+    Attributes
+    ----------
+    bodies : `dict<int, bytes>`
+        Stream identifier to received body relation.
+    connections : `list<_EchoServerProtocol>`
+        Container to register the connections in.
+    h2 : `H2Connection`
+        The http/2 state machine.
+    methods : `dict<int, str>`
+        Stream identifier to request method relation.
+    transport : `None | AbstractTransportLayerBase`
+        The connection's transport.
+    """
+    __slots__ = ('bodies', 'connections', 'h2', 'methods', 'transport')
+    
+    def __new__(cls, connections):
+        self = object.__new__(cls)
+        self.bodies = {}
+        self.connections = connections
+        self.h2 = H2Connection(H2Configuration(client_side = False, header_encoding = None))
+        self.methods = {}
+        self.transport = None
+        connections.append(self)
+        return self
+    
+    
+    def connection_made(self, transport):
+        self.transport = transport
+        self.h2.initiate_connection()
+        transport.write(self.h2.data_to_send())
+    
+    
+    def data_received(self, data):
+        h2 = self.h2
+        for event in h2.receive_data(data):
+            event_type = type(event)
+            if event_type is RequestReceived:
+                self.methods[event.stream_id] = dict(event.headers)[b':method'].decode()
+                self.bodies[event.stream_id] = b''
+                if event.stream_ended is not None:
+                    self._respond(event.stream_id)
+            
+            elif event_type is DataReceived:
+                self.bodies[event.stream_id] += event.data
+                h2.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                if event.stream_ended is not None:
+                    self._respond(event.stream_id)
+        
+        self.transport.write(h2.data_to_send())
+    
+    
+    def _respond(self, stream_id):
+        body = f'{self.methods.pop(stream_id)} {len(self.bodies.pop(stream_id))}'.encode()
+        self.h2.send_headers(
+            stream_id, [(':status', '200'), ('content-length', str(len(body)))]
+        )
+        self.h2.send_data(stream_id, body, end_stream = True)
+    
+    
+    def connection_lost(self, exception):
+        self.transport = None
+    
+    
+    def eof_received(self):
+        return False
+
+
+@vampytest.skip_if(not HTTP2_AVAILABLE)
+async def test__HTTP2Client__request():
+    """
+    Tests whether ``HTTP2Client._request`` works as intended.
+    
+    Case: Concurrent requests are multiplexed over the limited amount of connections.
+    
+    This function is a coroutine.
+    """
+    server_connections = []
+    server = await KOKORO.create_server_to(lambda: _EchoServerProtocol(server_connections), '127.0.0.1', 0)
+    await server.start()
+    
+    client = HTTP2Client(KOKORO, HTTPClient(KOKORO), max_concurrent_streams = 4, max_connections = 2)
+    try:
+        url = f'http://127.0.0.1:{server.sockets[0].getsockname()[1]}/api'
+        
+        async def request(index):
+            response = await client._request(
+                'POST', url, IgnoreCaseMultiValueDictionary(), data = f'{index}' * 20000
+            )
+            vampytest.assert_instance(response, HTTP2Response)
+            vampytest.assert_eq(response.status, 200)
+            return await response.read()
+        
+        task_group = TaskGroup(KOKORO, (Task(KOKORO, request(index)) for index in range(10)))
+        await task_group.wait_all()
+        
+        outputs = [task.get_result() for task in task_group.done]
+        vampytest.assert_eq(
+            sorted(outputs),
+            [b'POST 20000' for index in range(10)],
+        )
+        vampytest.assert_eq(len(server_connections), 2)
+    
+    finally:
+        client.close()
+        server.close()
@@ -0,0 +1,114 @@
+from zlib import MAX_WBITS, compressobj
+
+import vampytest
+from scarletio import IgnoreCaseMultiValueDictionary
+from scarletio.web_common import URL
+
+from ....core import KOKORO
+
+from ..response import HTTP2Response
+
+
+def _assert_fields_set(response):
+    """
+    Asserts whether every attribute is set of the given response.
+    
+    Parameters
+    ----------
+    response : ``HTTP2Response``
+        The response to check.
+    """
+    vampytest.assert_instance(response, HTTP2Response)
+    vampytest.assert_instance(response._body_parts, list, nullable = True)
+    vampytest.assert_instance(response.headers, IgnoreCaseMultiValueDictionary, nullable = True)
+    vampytest.assert_instance(response.method, str)
+    vampytest.assert_instance(response.reason, str, nullable = True)
+    vampytest.assert_instance(response.status, int)
+    vampytest.assert_instance(response.stream_id, int)
+    vampytest.assert_instance(response.url, URL)
+
+
+def test__HTTP2Response__new():
+    """
+    Tests whether ``HTTP2Response.__new__`` works as intended.
+    """
+    stream_id = 3
+    method = 'GET'
+    url = URL('https://discord.com/api/v10/gateway')
+    
+    response = HTTP2Response(KOKORO, stream_id, method, url)
+    _assert_fields_set(response)
+    
+    vampytest.assert_eq(response.stream_id, stream_id)
+    vampytest.assert_eq(response.method, method)
+    vampytest.assert_eq(response.url, url)
+
+
+def test__HTTP2Response__repr():
+    """
+    Tests whether ``HTTP2Response.__repr__`` works as intended.
+    """
+    response = HTTP2Response(KOKORO, 3, 'GET', URL('https://discord.com/api/v10/gateway'))
+    response.set_headers(200, IgnoreCaseMultiValueDictionary())
+    
+    output = repr(response)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(response).__name__, output)
+    vampytest.assert_in('status = 200', output)
+
+
+async def test__HTTP2Response__read():
+    """
+    Tests whether ``HTTP2Response.read`` works as intended.
+    
+    This function is a coroutine.
+    """
+    data = b'{"url": "wss://gateway.discord.gg"}'
+    compressor = compressobj(wbits = MAX_WBITS | 16)
+    compressed = compressor.compress(data) + compressor.flush()
+    
+    response = HTTP2Response(KOKORO, 3, 'GET', URL('https://discord.com/api/v10/gateway'))
+    response.set_headers(200, IgnoreCaseMultiValueDictionary([('content-encoding', 'gzip')]))
+    await response.wait_for_headers()
+    
+    vampytest.assert_eq(response.status, 200)
+    vampytest.assert_eq(response.reason, 'OK')
+    
+    response.feed_data(compressed[:10])
+    response.feed_data(compressed[10:])
+    response.feed_eof()
+    
+    output = await response.read()
+    vampytest.assert_eq(output, data)
+
+
+async def test__HTTP2Response__read__empty():
+    """
+    Tests whether ``HTTP2Response.read`` works as intended.
+    
+    Case: Empty body.
+    
+    This function is a coroutine.
+    """
+    response = HTTP2Response(KOKORO, 3, 'DELETE', URL('https://discord.com/api/v10/channels/202510190120'))
+    response.set_headers(204, IgnoreCaseMultiValueDictionary())
+    response.feed_eof()
+    
+    output = await response.read()
+    vampytest.assert_is(output, None)
+
+
+async def test__HTTP2Response__set_exception():
+    """
+    Tests whether ``HTTP2Response.set_exception`` works as intended.
+    
+    This function is a coroutine.
+    """
+    response = HTTP2Response(KOKORO, 3, 'GET', URL('https://discord.com/api/v10/gateway'))
+    response.set_exception(ConnectionError())
+    
+    with vampytest.assert_raises(ConnectionError):
+        await response.wait_for_headers()
+    
+    with vampytest.assert_raises(ConnectionError):
+        await response.read()
@@ -0,0 +1,74 @@
+import vampytest
+from scarletio import IgnoreCaseMultiValueDictionary
+
+from ..utils import build_request_headers
+
+
+def _iter_options():
+    yield (
+        'GET',
+        'discord.com',
+        'https',
+        '/api/v10/gateway',
+        None,
+        None,
+        [
+            (':method', 'GET'),
+            (':authority', 'discord.com'),
+            (':scheme', 'https'),
+            (':path', '/api/v10/gateway'),
+            ('accept-encoding', 'gzip, deflate'),
+        ],
+    )
+    
+    yield (
+        'POST',
+        'discord.com',
+        'https',
+        '/api/v10/channels/202510190100/messages',
+        IgnoreCaseMultiValueDictionary([
+            ('Authorization', 'Bot token'),
+            ('Connection', 'keep-alive'),
+            ('Content-Length', '9'),
+            ('Accept-Encoding', 'identity'),
+        ]),
+        b'{"a": 12}',
+        [
+            (':method', 'POST'),
+            (':authority', 'discord.com'),
+            (':scheme', 'https'),
+            (':path', '/api/v10/channels/202510190100/messages'),
+            ('authorization', 'Bot token'),
+            ('accept-encoding', 'identity'),
+            ('content-length', '9'),
+        ],
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__build_request_headers(method, authority, scheme, path, headers, body):
+    """
+    Tests whether ``build_request_headers`` works as intended.
+    
+    Parameters
+    ----------
+    method : `str`
+        The method of the request.
+    authority : `str`
+        The requested host.
+    scheme : `str`
+        The url's scheme.
+    path : `str`
+        The requested path.
+    headers : `None | IgnoreCaseMultiValueDictionary`
+        Request headers.
+    body : `None | bytes`
+        The request's body.
+    
+    Returns
+    -------
+    output : `list<(str, str)>`
+    """
+    output = build_request_headers(method, authority, scheme, path, headers, body)
+    vampytest.assert_instance(output, list)
+    return output
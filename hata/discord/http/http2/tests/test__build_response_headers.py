@@ -0,0 +1,35 @@
+import vampytest
+from scarletio import IgnoreCaseMultiValueDictionary
+
+from ..utils import build_response_headers
+
+
+def _iter_options():
+    yield (
+        [(b':status', b'200'), (b'content-type', b'application/json'), (b'x-ratelimit-limit', b'5')],
+        (200, IgnoreCaseMultiValueDictionary([('content-type', 'application/json'), ('x-ratelimit-limit', '5')])),
+    )
+    
+    yield (
+        [(':status', '429'), ('set-cookie', 'a'), ('set-cookie', 'b')],
+        (429, IgnoreCaseMultiValueDictionary([('set-cookie', 'a'), ('set-cookie', 'b')])),
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__build_response_headers(raw_headers):
+    """
+    Tests whether ``build_response_headers`` works as intended.
+    
+    Parameters
+    ----------
+    raw_headers : `list<(bytes | str, bytes | str)>`
+        The received headers.
+    
+    Returns
+    -------
+    output : `(int, IgnoreCaseMultiValueDictionary)`
+    """
+    output = build_response_headers(raw_headers)
+    vampytest.assert_instance(output, tuple)
+    return output
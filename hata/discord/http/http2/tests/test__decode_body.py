@@ -0,0 +1,55 @@
+from zlib import MAX_WBITS, compressobj
+
+import vampytest
+
+from ..utils import decode_body
+
+
+def _compress(data, wbits):
+    """
+    Compresses the given data.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The data to compress.
+    wbits : `int`
+        The window bits to compress with.
+    
+    Returns
+    -------
+    compressed : `bytes`
+    """
+    compressor = compressobj(wbits = wbits)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _iter_options():
+    data = b'{"url": "wss://gateway.discord.gg"}'
+    
+    yield data, None, data
+    yield data, 'br', data
+    yield b'', 'gzip', b''
+    yield _compress(data, MAX_WBITS | 16), 'gzip', data
+    yield _compress(data, MAX_WBITS), 'Deflate', data
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__decode_body(body, content_encoding):
+    """
+    Tests whether ``decode_body`` works as intended.
+    
+    Parameters
+    ----------
+    body : `bytes`
+        The response's body.
+    content_encoding : `None | str`
+        The response's content encoding.
+    
+    Returns
+    -------
+    output : `bytes`
+    """
+    output = decode_body(body, content_encoding)
+    vampytest.assert_instance(output, bytes)
+    return output
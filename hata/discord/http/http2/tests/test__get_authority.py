@@ -0,0 +1,28 @@
+import vampytest
+from scarletio.web_common import URL
+
+from ..utils import get_authority
+
+
+def _iter_options():
+    yield URL('https://discord.com/api/v10/gateway'), 'discord.com'
+    yield URL('http://127.0.0.1:8000/api'), '127.0.0.1:8000'
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__get_authority(url):
+    """
+    Tests whether ``get_authority`` works as intended.
+    
+    Parameters
+    ----------
+    url : ``URL``
+        The url.
+    
+    Returns
+    -------
+    output : `str`
+    """
+    output = get_authority(url)
+    vampytest.assert_instance(output, str)
+    return output
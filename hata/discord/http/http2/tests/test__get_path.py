@@ -0,0 +1,32 @@
+import vampytest
+from scarletio.web_common import URL
+
+from ..utils import get_path
+
+
+def _iter_options():
+    yield URL('https://discord.com'), '/'
+    yield URL('https://discord.com/api/v10/gateway'), '/api/v10/gateway'
+    yield (
+        URL('https://discord.com/api/v10/guilds/202510190110/members').extend_query({'limit': 10}),
+        '/api/v10/guilds/202510190110/members?limit=10',
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__get_path(url):
+    """
+    Tests whether ``get_path`` works as intended.
+    
+    Parameters
+    ----------
+    url : ``URL``
+        The url.
+    
+    Returns
+    -------
+    output : `str`
+    """
+    output = get_path(url)
+    vampytest.assert_instance(output, str)
+    return output
@@ -0,0 +1,212 @@
+__all__ = ()
+
+from zlib import MAX_WBITS, decompress as zlib_decompress
+
+from scarletio import IgnoreCaseMultiValueDictionary
+
+try:
+    from h2.config import H2Configuration
+    from h2.connection import H2Connection
+    from h2.events import (
+        ConnectionTerminated, DataReceived, RemoteSettingsChanged, ResponseReceived, StreamEnded, StreamReset,
+        TrailersReceived, WindowUpdated
+    )
+    from h2.exceptions import ProtocolError as H2ProtocolError
+except ImportError:
+    H2Configuration = None
+    H2Connection = None
+    ConnectionTerminated = None
+    DataReceived = None
+    RemoteSettingsChanged = None
+    ResponseReceived = None
+    StreamEnded = None
+    StreamReset = None
+    TrailersReceived = None
+    WindowUpdated = None
+    H2ProtocolError = None
+
+
+HTTP2_AVAILABLE = True if (H2Connection is not None) else False
+
+ALPN_PROTOCOL_HTTP2 = 'h2'
+
+# Connection specific headers are not allowed in http/2.
+CONNECTION_SPECIFIC_HEADER_NAMES = frozenset((
+    'connection',
+    'host',
+    'keep-alive',
+    'proxy-connection',
+    'transfer-encoding',
+    'upgrade',
+))
+
+CONTENT_ENCODING_DEFLATE = 'deflate'
+CONTENT_ENCODING_GZIP = 'gzip'
+
+ACCEPT_ENCODING_VALUE = f'{CONTENT_ENCODING_GZIP}, {CONTENT_ENCODING_DEFLATE}'
+
+
+def build_request_headers(method, authority, scheme, path, headers, body):
+    """
+    Builds the http/2 headers of a request.
+    
+    Parameters
+    ----------
+    method : `str`
+        The method of the request.
+    authority : `str`
+        The requested host (with port if not the default one).
+    scheme : `str`
+        The url's scheme.
+    path : `str`
+        The requested path with its query string.
+    headers : `None | IgnoreCaseMultiValueDictionary`
+        Request headers.
+    body : `None | bytes`
+        The request's body.
+    
+    Returns
+    -------
+    request_headers : `list<(str, str)>`
+    """
+    request_headers = [
+        (':method', method),
+        (':authority', authority),
+        (':scheme', scheme),
+        (':path', path),
+    ]
+    
+    accept_encoding_set = False
+    
+    if (headers is not None):
+        for name, value in headers.items():
+            name = name.lower()
+            if name in CONNECTION_SPECIFIC_HEADER_NAMES:
+                continue
+            
+            if name == 'content-length':
+                continue
+            
+            if name == 'accept-encoding':
+                accept_encoding_set = True
+            
+            request_headers.append((name, str(value)))
+    
+    if not accept_encoding_set:
+        request_headers.append(('accept-encoding', ACCEPT_ENCODING_VALUE))
+    
+    if (body is not None):
+        request_headers.append(('content-length', str(len(body))))
+    
+    return request_headers
+
+
+def build_response_headers(raw_headers):
+    """
+    Builds the headers of a response from the received http/2 headers.
+    
+    Parameters
+    ----------
+    raw_headers : `list<(bytes | str, bytes | str)>`
+        The received headers.
+    
+    Returns
+    -------
+    status : `int`
+        The response's status.
+    headers : ``IgnoreCaseMultiValueDictionary``
+        The response's headers without the pseudo headers.
+    """
+    status = 0
+    headers = IgnoreCaseMultiValueDictionary()
+    
+    for name, value in raw_headers:
+        if isinstance(name, bytes):
+            name = name.decode('ascii')
+        
+        if isinstance(value, bytes):
+            value = value.decode('latin-1')
+        
+        if name.startswith(':'):
+            if name == ':status':
+                status = int(value)
+            continue
+        
+        headers[name] = value
+    
+    return status, headers
+
+
+def decode_body(body, content_encoding):
+    """
+    Decodes the given response body based on its content encoding.
+    
+    Parameters
+    ----------
+    body : `bytes`
+        The response's body.
+    content_encoding : `None | str`
+        The response's content encoding.
+    
+    Returns
+    -------
+    body : `bytes`
+    
+    Raises
+    ------
+    zlib.error
+        - Invalid compressed body.
+    """
+    if (content_encoding is None) or (not body):
+        return body
+    
+    content_encoding = content_encoding.strip().lower()
+    if content_encoding == CONTENT_ENCODING_GZIP:
+        return zlib_decompress(body, MAX_WBITS | 16)
+    
+    if content_encoding == CONTENT_ENCODING_DEFLATE:
+        return zlib_decompress(body)
+    
+    return body
+
+
+def get_authority(url):
+    """
+    Returns the authority of the given url.
+    
+    Parameters
+    ----------
+    url : ``URL``
+        The url.
+    
+    Returns
+    -------
+    authority : `str`
+    """
+    host = url.raw_host
+    if url.is_default_port():
+        return host
+    
+    return f'{host}:{url.port}'
+
+
+def get_path(url):
+    """
+    Returns the path of the given url together with its query string.
+    
+    Parameters
+    ----------
+    url : ``URL``
+        The url.
+    
+    Returns
+    -------
+    path : `str`
+    """
+    path = url.raw_path or '/'
+    
+    raw_query_string = url.raw_query_string
+    if raw_query_string:
+        path = f'{path}?{raw_query_string}'
+    
+    return path
@@ -1,6 +1,5 @@
 __all__ = ()
 
-from collections import deque
 from datetime import datetime as DateTime, timezone as TimeZone
 
 from scarletio import Future, LOOP_TIME, ScarletLock
@@ -10,6 +9,7 @@ from ..core import KOKORO
 from ..utils import parse_date_header_to_datetime
 
 from .headers import RATE_LIMIT_HASH, RATE_LIMIT_LIMIT, RATE_LIMIT_REMAINING, RATE_LIMIT_RESET, RATE_LIMIT_RESET_AFTER
+from .request_priority import REQUEST_PRIORITY_DEFAULT, RequestPriorityQueue
 
 
 GLOBALLY_LIMITED = 0x4000000000000000
@@ -424,8 +424,8 @@ class RateLimitHandler:
         The `id` of the Discord Entity based on what the handler is limiter.
     parent : ``RateLimitGroup``
         The rate limit group of the rate limit handler.
-    queue : `None` or (`deque` of ``Future``)
-        Queue of ``Future`` objects of waiting requests.
+    queue : `None | RequestPriorityQueue`
+        Queue of ``Future`` objects of waiting requests ordered by their priority.
     wake_upper : `None`, ``TimerHandle``
         Wake ups the rate limit handler, when it's rate limits are reset.
     
@@ -441,7 +441,7 @@ class RateLimitHandler:
         
         New rate limit handlers have `.queue` set to `None` not because it does not need `.queue` attribute, like the
         `.drops`, ``.wake_upper`` one, but because this rate limit handler might be used just to look up an already
-        existing one with the same ``.limiter_id`` and ``.parent``, so creating an another `deque` and then collecting
+        existing one with the same ``.limiter_id`` and ``.parent``, so creating an another queue and then collecting
         it would be just waste of resources.
         
         Parameters
@@ -588,13 +588,18 @@ class RateLimitHandler:
         return True
     
     
-    async def enter(self):
+    async def enter(self, priority = REQUEST_PRIORITY_DEFAULT):
         """
         Waits till a respective request can be started.
         
         Should be called before the rate limit handler is used inside of it's context manager.
         
         This method is a coroutine.
+        
+        Parameters
+        ----------
+        priority : `int` = `REQUEST_PRIORITY_DEFAULT`, Optional
+            The request's priority. Waiting requests with more urgent priority are started first.
         """
         size = self.parent.size
         if size < 1:
@@ -608,14 +613,14 @@ class RateLimitHandler:
         
         queue = self.queue
         if queue is None:
-            self.queue = queue = deque()
+            self.queue = queue = RequestPriorityQueue()
         
         active = self.active
         left = size - active
         
         if left <= 0:
             future = Future(KOKORO)
-            queue.append(future)
+            queue.append(future, priority)
             await future
             
             self.active += 1
@@ -627,7 +632,7 @@ class RateLimitHandler:
             return
         
         future = Future(KOKORO)
-        queue.append(future)
+        queue.append(future, priority)
         await future
         
         self.active += 1
@@ -1094,13 +1099,18 @@ class StaticRateLimitHandler:
         return False
     
     
-    async def enter(self):
+    async def enter(self, priority = REQUEST_PRIORITY_DEFAULT):
         """
         Waits till a respective request can be started.
         
         Should be called before the rate limit handler is used inside of it's context manager.
         
         This method is a coroutine.
+        
+        Parameters
+        ----------
+        priority : `int` = `REQUEST_PRIORITY_DEFAULT`, Optional
+            The request's priority. Ignored, static rate limit handlers start the requests in the order they arrived.
         """
         lock = self.lock
         if lock is None:
@@ -1218,18 +1228,23 @@ class StackedStaticRateLimitHandler:
         return False
     
     
-    async def enter(self):
+    async def enter(self, priority = REQUEST_PRIORITY_DEFAULT):
         """
         Waits till a respective request can be started.
         
         Should be called before the rate limit handler is used inside of it's context manager.
         
         This method is a coroutine.
+        
+        Parameters
+        ----------
+        priority : `int` = `REQUEST_PRIORITY_DEFAULT`, Optional
+            The request's priority. Ignored, static rate limit handlers start the requests in the order they arrived.
         """
         stack = self.stack
         for handler in stack:
             try:
-                await handler.enter()
+                await handler.enter(priority)
             except:
                 for entered in stack[:stack.index(handler)]:
                     entered.exit(None)
@@ -0,0 +1,14 @@
+from .base import *
+from .local import *
+from .server import *
+from .unix_socket import *
+from .utils import *
+
+
+__all__ = (
+    *base.__all__,
+    *local.__all__,
+    *server.__all__,
+    *unix_socket.__all__,
+    *utils.__all__,
+)
@@ -0,0 +1,91 @@
+__all__ = ('RateLimitBrokerBase',)
+
+from scarletio import RichAttributeErrorBaseType
+
+
+class RateLimitBrokerBase(RichAttributeErrorBaseType):
+    """
+    Base rate limit broker.
+    
+    Rate limit brokers share the rate limits of the requests between multiple api clients, even between processes.
+    They are consulted by ``DiscordApiClient.discord_request`` before each request in addition to its own rate limit
+    handlers.
+    
+    The base broker does not share anything, the rate limits are handled only in the process by the api client.
+    """
+    __slots__ = ()
+    
+    def __new__(cls):
+        """
+        Creates a new rate limit broker.
+        """
+        return object.__new__(cls)
+    
+    
+    def __repr__(self):
+        """Returns the rate limit broker's representation."""
+        repr_parts = ['<', type(self).__name__]
+        self._put_repr_parts_into(repr_parts)
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def _put_repr_parts_into(self, repr_parts):
+        """
+        Helper function for ``.__repr__`` to put the rate limit broker's representation parts into.
+        
+        Parameters
+        ----------
+        repr_parts : `list<str>`
+            Representation parts to extend.
+        """
+        pass
+    
+    
+    async def acquire(self, bucket_key):
+        """
+        Waits till a request can be done in the given bucket, then reserves it.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        bucket_key : `None | str`
+            The bucket's key. `None` if the request is only limited by the global rate limit.
+        """
+        pass
+    
+    
+    def release(self, bucket_key, headers):
+        """
+        Updates the given bucket's state from the response headers of a request.
+        
+        Parameters
+        ----------
+        bucket_key : `None | str`
+            The bucket's key. `None` if the request is only limited by the global rate limit.
+        headers : ``IgnoreCaseMultiValueDictionary``
+            Response headers.
+        """
+        pass
+    
+    
+    def set_global_rate_limit(self, retry_after):
+        """
+        Marks every request to be globally rate limited for the given duration.
+        
+        Parameters
+        ----------
+        retry_after : `float`
+            The time till the global rate limit expires.
+        """
+        pass
+    
+    
+    async def close(self):
+        """
+        Closes the rate limit broker, releasing its resources.
+        
+        This method is a coroutine.
+        """
+        pass
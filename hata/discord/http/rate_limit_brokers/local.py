@@ -0,0 +1,173 @@
+__all__ = ('RateLimitBrokerLocal',)
+
+from scarletio import LOOP_TIME, copy_docs, sleep
+
+from ...core import KOKORO
+
+from ..rate_limit import RATE_LIMIT_DROP_ROUND
+
+from .base import RateLimitBrokerBase
+from .utils import get_bucket_state_from_headers
+
+
+GLOBAL_RATE_LIMIT_SIZE = 50
+GLOBAL_RATE_LIMIT_INTERVAL = 1.0
+
+
+class RateLimitBrokerLocal(RateLimitBrokerBase):
+    """
+    Rate limit broker sharing the rate limits between the api clients of the process.
+    
+    Also used by the ``RateLimitBrokerServer`` to share them between processes.
+    
+    Attributes
+    ----------
+    buckets : `dict<str, list<int | float>>`
+        Bucket key to bucket state relation. A bucket's state contains its size, its remaining requests, when it
+        resets (monotonic) and its reset interval.
+    global_limit : `int`
+        The maximal amount of requests per second.
+    global_rate_limit_expires_at : `float`
+        When the global rate limit expires (monotonic).
+    global_request_count : `int`
+        The amount of requests done in the current global window.
+    global_window_ends_at : `float`
+        When the current global window ends (monotonic).
+    """
+    __slots__ = (
+        'buckets', 'global_limit', 'global_rate_limit_expires_at', 'global_request_count', 'global_window_ends_at'
+    )
+    
+    def __new__(cls, global_limit = GLOBAL_RATE_LIMIT_SIZE):
+        """
+        Creates a new local rate limit broker.
+        
+        Parameters
+        ----------
+        global_limit : `int` = `50`, Optional
+            The maximal amount of requests per second.
+        """
+        self = object.__new__(cls)
+        self.buckets = {}
+        self.global_limit = global_limit
+        self.global_rate_limit_expires_at = 0.0
+        self.global_request_count = 0
+        self.global_window_ends_at = 0.0
+        return self
+    
+    
+    @copy_docs(RateLimitBrokerBase._put_repr_parts_into)
+    def _put_repr_parts_into(self, repr_parts):
+        repr_parts.append(' global_limit = ')
+        repr_parts.append(repr(self.global_limit))
+        
+        repr_parts.append(', bucket_count = ')
+        repr_parts.append(repr(len(self.buckets)))
+    
+    
+    def get_delay(self, bucket_key):
+        """
+        Returns how much time needs to pass before a request can be done in the given bucket. If no time needs to pass,
+        reserves the request.
+        
+        Parameters
+        ----------
+        bucket_key : `None | str`
+            The bucket's key. `None` if the request is only limited by the global rate limit.
+        
+        Returns
+        -------
+        delay : `float`
+        """
+        now = LOOP_TIME()
+        
+        global_rate_limit_expires_at = self.global_rate_limit_expires_at
+        if global_rate_limit_expires_at > now:
+            return global_rate_limit_expires_at - now
+        
+        if self.global_window_ends_at <= now:
+            self.global_window_ends_at = now + GLOBAL_RATE_LIMIT_INTERVAL
+            self.global_request_count = 0
+        
+        elif self.global_request_count >= self.global_limit:
+            return self.global_window_ends_at - now
+        
+        if bucket_key is None:
+            bucket = None
+        else:
+            bucket = self.buckets.get(bucket_key, None)
+            if (bucket is not None):
+                limit, remaining, resets_at, reset_after = bucket
+                if resets_at <= now:
+                    bucket[1] = remaining = limit
+                    bucket[2] = now + reset_after
+                
+                if remaining <= 0:
+                    return resets_at - now
+        
+        self.global_request_count += 1
+        if (bucket is not None):
+            bucket[1] -= 1
+        
+        return 0.0
+    
+    
+    @copy_docs(RateLimitBrokerBase.acquire)
+    async def acquire(self, bucket_key):
+        while True:
+            delay = self.get_delay(bucket_key)
+            if delay <= 0.0:
+                break
+            
+            await sleep(delay, KOKORO)
+            continue
+    
+    
+    @copy_docs(RateLimitBrokerBase.release)
+    def release(self, bucket_key, headers):
+        if bucket_key is None:
+            return
+        
+        bucket_state = get_bucket_state_from_headers(headers)
+        if (bucket_state is not None):
+            self.update_bucket(bucket_key, *bucket_state)
+    
+    
+    def update_bucket(self, bucket_key, limit, remaining, reset_after):
+        """
+        Updates the given bucket's state.
+        
+        Parameters
+        ----------
+        bucket_key : `str`
+            The bucket's key.
+        limit : `int`
+            The bucket's size.
+        remaining : `int`
+            The remaining requests in the bucket.
+        reset_after : `float`
+            The time till the bucket resets.
+        """
+        resets_at = LOOP_TIME() + reset_after
+        
+        bucket = self.buckets.get(bucket_key, None)
+        if bucket is None:
+            self.buckets[bucket_key] = [limit, remaining, resets_at, reset_after]
+            return
+        
+        # If the response is from the same window, requests might have been reserved since, so keep the lower one.
+        if resets_at > bucket[2] + RATE_LIMIT_DROP_ROUND:
+            bucket[1] = remaining
+        else:
+            bucket[1] = min(bucket[1], remaining)
+        
+        bucket[0] = limit
+        bucket[2] = resets_at
+        bucket[3] = reset_after
+    
+    
+    @copy_docs(RateLimitBrokerBase.set_global_rate_limit)
+    def set_global_rate_limit(self, retry_after):
+        global_rate_limit_expires_at = LOOP_TIME() + retry_after
+        if global_rate_limit_expires_at > self.global_rate_limit_expires_at:
+            self.global_rate_limit_expires_at = global_rate_limit_expires_at
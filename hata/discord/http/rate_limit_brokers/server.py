@@ -0,0 +1,189 @@
+__all__ = ('RateLimitBrokerServer',)
+
+from os import remove as remove_file
+from os.path import exists
+
+from scarletio import ReadWriteProtocolBase, RichAttributeErrorBaseType, Task
+
+from ...core import KOKORO
+
+from .local import GLOBAL_RATE_LIMIT_SIZE, RateLimitBrokerLocal
+from .utils import OPERATION_ACQUIRE, OPERATION_GLOBAL, OPERATION_RELEASE, pack_message, read_message
+
+
+class RateLimitBrokerServerProtocol(ReadWriteProtocolBase):
+    """
+    Protocol of a connection to a rate limit broker server.
+    
+    Attributes
+    ----------
+    broker : ``RateLimitBrokerLocal``
+        The broker holding the shared rate limit state.
+    """
+    __slots__ = ('broker',)
+    
+    def __new__(cls, loop, broker):
+        """
+        Creates a new rate limit broker server protocol.
+        
+        Parameters
+        ----------
+        loop : ``EventThread``
+            The event loop to what the protocol is bound to.
+        broker : ``RateLimitBrokerLocal``
+            The broker holding the shared rate limit state.
+        """
+        self = ReadWriteProtocolBase.__new__(cls, loop)
+        self.broker = broker
+        return self
+    
+    
+    def connection_made(self, transport):
+        """
+        Called when a connection is made. Starts to serve the connection.
+        
+        Parameters
+        ----------
+        transport : ``AbstractTransportLayerBase``
+            The connection's transport.
+        """
+        ReadWriteProtocolBase.connection_made(self, transport)
+        Task(KOKORO, self.serve())
+    
+    
+    async def serve(self):
+        """
+        Reads and handles the messages of the connection till it is closed.
+        
+        This method is a coroutine.
+        """
+        broker = self.broker
+        
+        while True:
+            try:
+                data = await read_message(self)
+            except (ConnectionError, ValueError):
+                self.close()
+                return
+            
+            operation = data.get('op', None)
+            if operation == OPERATION_ACQUIRE:
+                Task(KOKORO, self.acquire(data.get('id', 0), data.get('bucket', None)))
+            
+            elif operation == OPERATION_RELEASE:
+                broker.update_bucket(data['bucket'], data['limit'], data['remaining'], data['reset_after'])
+            
+            elif operation == OPERATION_GLOBAL:
+                broker.set_global_rate_limit(data['retry_after'])
+    
+    
+    async def acquire(self, request_id, bucket_key):
+        """
+        Waits till a request can be done in the given bucket, then notifies the client.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        request_id : `int`
+            The client's identifier of the request.
+        bucket_key : `None | str`
+            The bucket's key.
+        """
+        await self.broker.acquire(bucket_key)
+        
+        transport = self.get_transport()
+        if (transport is not None) and (not transport.is_closing()):
+            self.write(pack_message({'id': request_id}))
+
+
+class RateLimitBrokerServer(RichAttributeErrorBaseType):
+    """
+    Rate limit broker server sharing rate limits between the processes connecting to it over a unix socket.
+    
+    Can be run with the `$ python3 -m hata rate-limit-broker PATH` command.
+    
+    Attributes
+    ----------
+    broker : ``RateLimitBrokerLocal``
+        The broker holding the shared rate limit state.
+    path : `str`
+        The unix socket's path.
+    server : `None | Server`
+        The running server.
+    """
+    __slots__ = ('broker', 'path', 'server')
+    
+    def __new__(cls, path, *, global_limit = GLOBAL_RATE_LIMIT_SIZE):
+        """
+        Creates a new rate limit broker server.
+        
+        Parameters
+        ----------
+        path : `str`
+            The unix socket's path.
+        global_limit : `int` = `50`, Optional (Keyword only)
+            The maximal amount of requests per second.
+        """
+        self = object.__new__(cls)
+        self.broker = RateLimitBrokerLocal(global_limit)
+        self.path = path
+        self.server = None
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the rate limit broker server's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' path = ')
+        repr_parts.append(repr(self.path))
+        
+        if (self.server is not None):
+            repr_parts.append(', running')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    async def start(self):
+        """
+        Starts the server. If a socket file is left at the path from a previous run, it is removed.
+        
+        This method is a coroutine.
+        
+        Raises
+        ------
+        RuntimeError
+            - If the server is already running.
+        OSError
+            - If the server could not be started.
+        """
+        if (self.server is not None):
+            raise RuntimeError(f'{self!r} is already running.')
+        
+        path = self.path
+        if exists(path):
+            remove_file(path)
+        
+        broker = self.broker
+        server = await KOKORO.create_unix_server_to(lambda: RateLimitBrokerServerProtocol(KOKORO, broker), path)
+        await server.start()
+        self.server = server
+    
+    
+    def close(self):
+        """
+        Closes the server.
+        """
+        server = self.server
+        if server is None:
+            return
+        
+        self.server = None
+        server.close()
+        
+        try:
+            remove_file(self.path)
+        except FileNotFoundError:
+            pass
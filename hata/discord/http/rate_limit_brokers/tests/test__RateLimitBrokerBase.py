@@ -0,0 +1,51 @@
+import vampytest
+from scarletio import IgnoreCaseMultiValueDictionary
+
+from ..base import RateLimitBrokerBase
+
+
+def _assert_fields_set(rate_limit_broker):
+    """
+    Asserts whether every attribute is set of the given rate limit broker.
+    
+    Parameters
+    ----------
+    rate_limit_broker : ``RateLimitBrokerBase``
+        The rate limit broker to check.
+    """
+    vampytest.assert_instance(rate_limit_broker, RateLimitBrokerBase)
+
+
+def test__RateLimitBrokerBase__new():
+    """
+    Tests whether ``RateLimitBrokerBase.__new__`` works as intended.
+    """
+    rate_limit_broker = RateLimitBrokerBase()
+    _assert_fields_set(rate_limit_broker)
+
+
+def test__RateLimitBrokerBase__repr():
+    """
+    Tests whether ``RateLimitBrokerBase.__repr__`` works as intended.
+    """
+    rate_limit_broker = RateLimitBrokerBase()
+    
+    output = repr(rate_limit_broker)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(rate_limit_broker).__name__, output)
+
+
+async def test__RateLimitBrokerBase__operations():
+    """
+    Tests whether ``RateLimitBrokerBase``'s operations work as intended.
+    
+    This function is a coroutine.
+    
+    Case: They do nothing.
+    """
+    rate_limit_broker = RateLimitBrokerBase()
+    
+    await rate_limit_broker.acquire('0:0')
+    rate_limit_broker.release('0:0', IgnoreCaseMultiValueDictionary())
+    rate_limit_broker.set_global_rate_limit(10.0)
+    await rate_limit_broker.close()
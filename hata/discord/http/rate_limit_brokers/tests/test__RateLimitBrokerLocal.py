@@ -0,0 +1,163 @@
+import vampytest
+from scarletio import IgnoreCaseMultiValueDictionary
+
+from ...headers import RATE_LIMIT_LIMIT, RATE_LIMIT_REMAINING, RATE_LIMIT_RESET_AFTER
+
+from ..local import RateLimitBrokerLocal
+
+
+def _assert_fields_set(rate_limit_broker):
+    """
+    Asserts whether every attribute is set of the given rate limit broker.
+    
+    Parameters
+    ----------
+    rate_limit_broker : ``RateLimitBrokerLocal``
+        The rate limit broker to check.
+    """
+    vampytest.assert_instance(rate_limit_broker, RateLimitBrokerLocal)
+    vampytest.assert_instance(rate_limit_broker.buckets, dict)
+    vampytest.assert_instance(rate_limit_broker.global_limit, int)
+    vampytest.assert_instance(rate_limit_broker.global_rate_limit_expires_at, float)
+    vampytest.assert_instance(rate_limit_broker.global_request_count, int)
+    vampytest.assert_instance(rate_limit_broker.global_window_ends_at, float)
+
+
+def test__RateLimitBrokerLocal__new__no_fields():
+    """
+    Tests whether ``RateLimitBrokerLocal.__new__`` works as intended.
+    
+    Case: No fields given.
+    """
+    rate_limit_broker = RateLimitBrokerLocal()
+    _assert_fields_set(rate_limit_broker)
+    
+    vampytest.assert_eq(rate_limit_broker.global_limit, 50)
+
+
+def test__RateLimitBrokerLocal__new__all_fields():
+    """
+    Tests whether ``RateLimitBrokerLocal.__new__`` works as intended.
+    
+    Case: All fields given.
+    """
+    global_limit = 20
+    
+    rate_limit_broker = RateLimitBrokerLocal(global_limit)
+    _assert_fields_set(rate_limit_broker)
+    
+    vampytest.assert_eq(rate_limit_broker.global_limit, global_limit)
+
+
+def test__RateLimitBrokerLocal__repr():
+    """
+    Tests whether ``RateLimitBrokerLocal.__repr__`` works as intended.
+    """
+    rate_limit_broker = RateLimitBrokerLocal(20)
+    
+    output = repr(rate_limit_broker)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(rate_limit_broker).__name__, output)
+    vampytest.assert_in('global_limit = 20', output)
+
+
+def test__RateLimitBrokerLocal__get_delay__global_limit():
+    """
+    Tests whether ``RateLimitBrokerLocal.get_delay`` works as intended.
+    
+    Case: Global request limit reached.
+    """
+    rate_limit_broker = RateLimitBrokerLocal(2)
+    
+    vampytest.assert_eq(rate_limit_broker.get_delay(None), 0.0)
+    vampytest.assert_eq(rate_limit_broker.get_delay('1:0'), 0.0)
+    vampytest.assert_true(rate_limit_broker.get_delay(None) > 0.0)
+    vampytest.assert_eq(rate_limit_broker.global_request_count, 2)
+
+
+def test__RateLimitBrokerLocal__get_delay__bucket_exhausted():
+    """
+    Tests whether ``RateLimitBrokerLocal.get_delay`` works as intended.
+    
+    Case: Bucket exhausted, other buckets are not affected.
+    """
+    rate_limit_broker = RateLimitBrokerLocal()
+    rate_limit_broker.update_bucket('1:0', 2, 1, 10.0)
+    
+    vampytest.assert_eq(rate_limit_broker.get_delay('1:0'), 0.0)
+    
+    delay = rate_limit_broker.get_delay('1:0')
+    vampytest.assert_true(delay > 9.0)
+    
+    vampytest.assert_eq(rate_limit_broker.get_delay('2:0'), 0.0)
+
+
+def test__RateLimitBrokerLocal__get_delay__bucket_reset():
+    """
+    Tests whether ``RateLimitBrokerLocal.get_delay`` works as intended.
+    
+    Case: Bucket reset since its last update.
+    """
+    rate_limit_broker = RateLimitBrokerLocal()
+    rate_limit_broker.update_bucket('1:0', 2, 0, 10.0)
+    bucket = rate_limit_broker.buckets['1:0']
+    bucket[2] -= 20.0
+    
+    vampytest.assert_eq(rate_limit_broker.get_delay('1:0'), 0.0)
+    vampytest.assert_eq(bucket[1], 1)
+
+
+def test__RateLimitBrokerLocal__get_delay__global_rate_limit():
+    """
+    Tests whether ``RateLimitBrokerLocal.get_delay`` works as intended.
+    
+    Case: Globally rate limited.
+    """
+    rate_limit_broker = RateLimitBrokerLocal()
+    rate_limit_broker.set_global_rate_limit(10.0)
+    
+    delay = rate_limit_broker.get_delay(None)
+    vampytest.assert_true(delay > 9.0)
+    
+    # Shorter global rate limits do not overwrite longer ones.
+    rate_limit_broker.set_global_rate_limit(1.0)
+    delay = rate_limit_broker.get_delay(None)
+    vampytest.assert_true(delay > 9.0)
+
+
+def test__RateLimitBrokerLocal__update_bucket():
+    """
+    Tests whether ``RateLimitBrokerLocal.update_bucket`` works as intended.
+    
+    Case: Responses from the same window keep the lower remaining count.
+    """
+    rate_limit_broker = RateLimitBrokerLocal()
+    rate_limit_broker.update_bucket('1:0', 5, 2, 10.0)
+    rate_limit_broker.update_bucket('1:0', 5, 4, 10.0)
+    
+    bucket = rate_limit_broker.buckets['1:0']
+    vampytest.assert_eq(bucket[0], 5)
+    vampytest.assert_eq(bucket[1], 2)
+    vampytest.assert_eq(bucket[3], 10.0)
+
+
+def test__RateLimitBrokerLocal__release():
+    """
+    Tests whether ``RateLimitBrokerLocal.release`` works as intended.
+    """
+    headers = IgnoreCaseMultiValueDictionary()
+    headers[RATE_LIMIT_LIMIT] = '5'
+    headers[RATE_LIMIT_REMAINING] = '3'
+    headers[RATE_LIMIT_RESET_AFTER] = '2.5'
+    
+    rate_limit_broker = RateLimitBrokerLocal()
+    rate_limit_broker.release('1:0', headers)
+    rate_limit_broker.release(None, headers)
+    rate_limit_broker.release('2:0', IgnoreCaseMultiValueDictionary())
+    
+    vampytest.assert_eq([*rate_limit_broker.buckets.keys()], ['1:0'])
+    
+    bucket = rate_limit_broker.buckets['1:0']
+    vampytest.assert_eq(bucket[0], 5)
+    vampytest.assert_eq(bucket[1], 3)
+    vampytest.assert_eq(bucket[3], 2.5)
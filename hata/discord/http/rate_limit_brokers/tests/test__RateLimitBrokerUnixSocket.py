@@ -0,0 +1,98 @@
+from os.path import join as join_paths
+from tempfile import TemporaryDirectory
+
+import vampytest
+from scarletio import LOOP_TIME, ReadWriteProtocolBase
+
+from ....core import KOKORO
+
+from ..unix_socket import RateLimitBrokerUnixSocket
+
+
+def _assert_fields_set(rate_limit_broker):
+    """
+    Asserts whether every attribute is set of the given rate limit broker.
+    
+    Parameters
+    ----------
+    rate_limit_broker : ``RateLimitBrokerUnixSocket``
+        The rate limit broker to check.
+    """
+    vampytest.assert_instance(rate_limit_broker, RateLimitBrokerUnixSocket)
+    vampytest.assert_instance(rate_limit_broker._next_request_id, int)
+    vampytest.assert_instance(rate_limit_broker._reconnect_at, float)
+    vampytest.assert_instance(rate_limit_broker._waiters, dict)
+    vampytest.assert_instance(rate_limit_broker.path, str)
+
+
+def test__RateLimitBrokerUnixSocket__new():
+    """
+    Tests whether ``RateLimitBrokerUnixSocket.__new__`` works as intended.
+    """
+    path = '/tmp/hata_rate_limit_broker.sock'
+    
+    rate_limit_broker = RateLimitBrokerUnixSocket(path)
+    _assert_fields_set(rate_limit_broker)
+    
+    vampytest.assert_eq(rate_limit_broker.path, path)
+
+
+def test__RateLimitBrokerUnixSocket__repr():
+    """
+    Tests whether ``RateLimitBrokerUnixSocket.__repr__`` works as intended.
+    """
+    path = '/tmp/hata_rate_limit_broker.sock'
+    
+    rate_limit_broker = RateLimitBrokerUnixSocket(path)
+    
+    output = repr(rate_limit_broker)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(rate_limit_broker).__name__, output)
+    vampytest.assert_in(repr(path), output)
+
+
+async def test__RateLimitBrokerUnixSocket__acquire__timeout():
+    """
+    Tests whether ``RateLimitBrokerUnixSocket.acquire`` works as intended.
+    
+    Case: The server never replies.
+    
+    This function is a coroutine.
+    """
+    with TemporaryDirectory() as directory_path:
+        path = join_paths(directory_path, 'rate_limit_broker.sock')
+        
+        connections = []
+        
+        def protocol_factory():
+            protocol = ReadWriteProtocolBase(KOKORO)
+            connections.append(protocol)
+            return protocol
+        
+        # The server accepts the connection, but never replies.
+        server = await KOKORO.create_unix_server_to(protocol_factory, path)
+        await server.start()
+        
+        rate_limit_broker = RateLimitBrokerUnixSocket(path)
+        
+        try:
+            mocked = vampytest.mock_globals(
+                type(rate_limit_broker).acquire,
+                ACQUIRE_TIMEOUT = 0.01,
+            )
+            
+            await mocked(rate_limit_broker, 'token:#hash:0')
+            
+            vampytest.assert_eq(len(connections), 1)
+            vampytest.assert_is(rate_limit_broker._protocol, None)
+            vampytest.assert_eq(rate_limit_broker._waiters, {})
+            vampytest.assert_true(rate_limit_broker._reconnect_at > LOOP_TIME())
+            
+            # Till reconnecting the requests are only limited in-process.
+            await mocked(rate_limit_broker, 'token:#hash:0')
+            vampytest.assert_eq(len(connections), 1)
+            vampytest.assert_is(rate_limit_broker._protocol, None)
+        
+        finally:
+            await rate_limit_broker.close()
+            server.close()
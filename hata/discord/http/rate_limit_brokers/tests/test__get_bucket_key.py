@@ -0,0 +1,66 @@
+import vampytest
+
+from ...rate_limit import (
+    LIMITER_CHANNEL, RateLimitGroup, RateLimitHandler, StackedStaticRateLimitHandler, StaticRateLimitGroup,
+    StaticRateLimitHandler
+)
+
+from ..utils import get_bucket_key
+
+
+def _iter_options():
+    group = RateLimitGroup(LIMITER_CHANNEL)
+    yield RateLimitHandler(group, 202510190000), 'koishi', None, f'koishi:{group.group_id}:202510190000'
+    
+    yield RateLimitHandler(RateLimitGroup.unlimited(), 0), 'koishi', None, None
+    
+    static_group = StaticRateLimitGroup(5, 5.0, LIMITER_CHANNEL)
+    yield (
+        StaticRateLimitHandler(static_group, 202510190001),
+        'koishi',
+        None,
+        f'koishi:{static_group.group_id}:202510190001',
+    )
+    
+    static_group_0 = StaticRateLimitGroup(5, 5.0, LIMITER_CHANNEL)
+    static_group_1 = StaticRateLimitGroup(10, 1.0, LIMITER_CHANNEL)
+    yield (
+        StackedStaticRateLimitHandler((static_group_0, static_group_1), 202510190002),
+        'koishi',
+        None,
+        f'koishi:{static_group_0.group_id}:202510190002',
+    )
+    
+    # Discovered groups are keyed by their bucket hash, since their identifier does not match between processes.
+    yield (
+        RateLimitHandler(RateLimitGroup(LIMITER_CHANNEL), 202510190003),
+        'koishi',
+        'pudding',
+        'koishi:#pudding:202510190003',
+    )
+    
+    # Different tokens do not share buckets.
+    yield RateLimitHandler(group, 202510190000), 'satori', None, f'satori:{group.group_id}:202510190000'
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__get_bucket_key(handler, token_key, bucket_hash):
+    """
+    Tests whether ``get_bucket_key`` works as intended.
+    
+    Parameters
+    ----------
+    handler : ``RateLimitHandler``, ``StaticRateLimitHandler``, ``StackedStaticRateLimitHandler``
+        Rate limit handler to get its bucket key of.
+    token_key : `str`
+        The requesting token's owner identifying part.
+    bucket_hash : `None | str`
+        The discovered bucket hash of the request's route.
+    
+    Returns
+    -------
+    output : `None | str`
+    """
+    output = get_bucket_key(handler, token_key, bucket_hash)
+    vampytest.assert_instance(output, str, nullable = True)
+    return output
@@ -0,0 +1,34 @@
+import vampytest
+from scarletio import IgnoreCaseMultiValueDictionary
+
+from ...headers import RATE_LIMIT_LIMIT, RATE_LIMIT_REMAINING, RATE_LIMIT_RESET_AFTER
+
+from ..utils import get_bucket_state_from_headers
+
+
+def _iter_options():
+    yield {}, None
+    yield {RATE_LIMIT_LIMIT: '5'}, None
+    yield {RATE_LIMIT_LIMIT: '5', RATE_LIMIT_REMAINING: 'a'}, None
+    yield {RATE_LIMIT_LIMIT: '5', RATE_LIMIT_REMAINING: '2', RATE_LIMIT_RESET_AFTER: '1.5'}, (5, 2, 1.5)
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__get_bucket_state_from_headers(header_items):
+    """
+    Tests whether ``get_bucket_state_from_headers`` works as intended.
+    
+    Parameters
+    ----------
+    header_items : `dict<str, str>`
+        Response header items.
+    
+    Returns
+    -------
+    output : `None | (int, int, float)`
+    """
+    headers = IgnoreCaseMultiValueDictionary()
+    for key, value in header_items.items():
+        headers[key] = value
+    
+    return get_bucket_state_from_headers(headers)
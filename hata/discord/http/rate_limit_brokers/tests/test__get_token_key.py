@@ -0,0 +1,27 @@
+import vampytest
+
+from ..utils import get_token_key
+
+
+def _iter_options():
+    yield 'MjAyNTEwMTkwMDA0.pudding.cake', 'MjAyNTEwMTkwMDA0'
+    yield 'koishi', 'koishi'
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__get_token_key(token):
+    """
+    Tests whether ``get_token_key`` works as intended.
+    
+    Parameters
+    ----------
+    token : `str`
+        The token.
+    
+    Returns
+    -------
+    output : `str`
+    """
+    output = get_token_key(token)
+    vampytest.assert_instance(output, str)
+    return output
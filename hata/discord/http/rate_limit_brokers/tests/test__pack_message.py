@@ -0,0 +1,28 @@
+import vampytest
+
+from ..utils import MESSAGE_LENGTH_SIZE, pack_message
+
+
+def _iter_options():
+    yield {'id': 1}, b'\x00\x00\x00\x08{"id":1}'
+    yield {}, b'\x00\x00\x00\x02{}'
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__pack_message(data):
+    """
+    Tests whether ``pack_message`` works as intended.
+    
+    Parameters
+    ----------
+    data : `dict<str, object>`
+        The message to pack.
+    
+    Returns
+    -------
+    output : `bytes`
+    """
+    output = pack_message(data)
+    vampytest.assert_instance(output, bytes)
+    vampytest.assert_eq(int.from_bytes(output[:MESSAGE_LENGTH_SIZE], 'big'), len(output) - MESSAGE_LENGTH_SIZE)
+    return output
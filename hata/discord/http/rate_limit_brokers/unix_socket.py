@@ -0,0 +1,248 @@
+__all__ = ('RateLimitBrokerUnixSocket',)
+
+from os import fspath
+
+from scarletio import Future, LOOP_TIME, Task, copy_docs
+
+from ...core import KOKORO
+
+from .base import RateLimitBrokerBase
+from .utils import (
+    OPERATION_ACQUIRE, OPERATION_GLOBAL, OPERATION_RELEASE, get_bucket_state_from_headers, pack_message, read_message
+)
+
+
+ACQUIRE_TIMEOUT = 10.0
+RECONNECT_INTERVAL = 5.0
+
+
+class RateLimitBrokerUnixSocket(RateLimitBrokerBase):
+    """
+    Rate limit broker sharing the rate limits between processes using a rate limit broker server listening on a unix
+    socket.
+    
+    If the server is not reachable or does not reply in time, the requests are only limited in-process, and
+    reconnecting is attempted again after a few seconds.
+    
+    Attributes
+    ----------
+    _connecting : `None | Future`
+        Future resolved when the connection attempt finishes.
+    _next_request_id : `int`
+        The identifier of the next acquire request.
+    _protocol : `None | ReadWriteProtocolBase`
+        The connection to the server.
+    _reconnect_at : `float`
+        When reconnecting can be attempted again (monotonic).
+    _waiters : `dict<int, Future>`
+        Acquire request identifier to waiter relation.
+    path : `str`
+        The unix socket's path.
+    """
+    __slots__ = ('_connecting', '_next_request_id', '_protocol', '_reconnect_at', '_waiters', 'path')
+    
+    def __new__(cls, path):
+        """
+        Creates a new unix socket rate limit broker.
+        
+        Parameters
+        ----------
+        path : `str | PathLike`
+            The unix socket's path the rate limit broker server listens on.
+        
+        Raises
+        ------
+        TypeError
+            - If `path`'s type is incorrect.
+        """
+        path = fspath(path)
+        if not isinstance(path, str):
+            path = path.decode()
+        
+        self = object.__new__(cls)
+        self._connecting = None
+        self._next_request_id = 1
+        self._protocol = None
+        self._reconnect_at = 0.0
+        self._waiters = {}
+        self.path = path
+        return self
+    
+    
+    @copy_docs(RateLimitBrokerBase._put_repr_parts_into)
+    def _put_repr_parts_into(self, repr_parts):
+        repr_parts.append(' path = ')
+        repr_parts.append(repr(self.path))
+        
+        if (self._protocol is not None):
+            repr_parts.append(', connected')
+    
+    
+    async def _get_protocol(self):
+        """
+        Returns the connection to the server. Connects if not yet connected.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        protocol : `None | ReadWriteProtocolBase`
+            Returns `None` if the server is not reachable.
+        """
+        protocol = self._protocol
+        if (protocol is not None):
+            return protocol
+        
+        connecting = self._connecting
+        if (connecting is not None):
+            await connecting
+            return self._protocol
+        
+        if self._reconnect_at > LOOP_TIME():
+            return None
+        
+        self._connecting = connecting = Future(KOKORO)
+        try:
+            try:
+                protocol = await KOKORO.open_unix_connection_to(self.path)
+            except OSError:
+                self._reconnect_at = LOOP_TIME() + RECONNECT_INTERVAL
+                return None
+            
+            self._protocol = protocol
+            Task(KOKORO, self._read_loop(protocol))
+            return protocol
+        
+        finally:
+            self._connecting = None
+            connecting.set_result_if_pending(None)
+    
+    
+    async def _read_loop(self, protocol):
+        """
+        Reads the responses of the server, waking up the respective acquire requests.
+        
+        When the connection is lost, wakes up every waiting acquire request, so they can continue with in-process
+        rate limits only.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        protocol : ``ReadWriteProtocolBase``
+            The connection to the server.
+        """
+        waiters = self._waiters
+        
+        try:
+            while True:
+                try:
+                    data = await read_message(protocol)
+                except (ConnectionError, ValueError):
+                    break
+                
+                waiter = waiters.pop(data.get('id', 0), None)
+                if (waiter is not None):
+                    waiter.set_result_if_pending(None)
+        
+        finally:
+            self._disconnect(protocol)
+            
+            for waiter in waiters.values():
+                waiter.set_result_if_pending(None)
+            
+            waiters.clear()
+    
+    
+    def _disconnect(self, protocol):
+        """
+        Disconnects from the server, so till reconnecting the requests are only limited in-process.
+        
+        Parameters
+        ----------
+        protocol : ``ReadWriteProtocolBase``
+            The connection to the server.
+        """
+        if self._protocol is protocol:
+            self._protocol = None
+            self._reconnect_at = LOOP_TIME() + RECONNECT_INTERVAL
+        
+        protocol.close()
+    
+    
+    def _send(self, data):
+        """
+        Sends the given message to the server if connected.
+        
+        Parameters
+        ----------
+        data : `dict<str, object>`
+            The message to send.
+        
+        Returns
+        -------
+        sent : `bool`
+        """
+        protocol = self._protocol
+        if protocol is None:
+            return False
+        
+        protocol.write(pack_message(data))
+        return True
+    
+    
+    @copy_docs(RateLimitBrokerBase.acquire)
+    async def acquire(self, bucket_key):
+        protocol = await self._get_protocol()
+        if protocol is None:
+            return
+        
+        request_id = self._next_request_id
+        self._next_request_id = request_id + 1
+        
+        waiter = Future(KOKORO)
+        self._waiters[request_id] = waiter
+        
+        try:
+            self._send({'op': OPERATION_ACQUIRE, 'id': request_id, 'bucket': bucket_key})
+            waiter.apply_timeout(ACQUIRE_TIMEOUT)
+            await waiter
+        
+        except TimeoutError:
+            # The server stalled, drop it, so the requests are not blocked till it replies.
+            self._disconnect(protocol)
+        
+        finally:
+            self._waiters.pop(request_id, None)
+    
+    
+    @copy_docs(RateLimitBrokerBase.release)
+    def release(self, bucket_key, headers):
+        if bucket_key is None:
+            return
+        
+        bucket_state = get_bucket_state_from_headers(headers)
+        if bucket_state is None:
+            return
+        
+        limit, remaining, reset_after = bucket_state
+        self._send({
+            'op': OPERATION_RELEASE,
+            'bucket': bucket_key,
+            'limit': limit,
+            'remaining': remaining,
+            'reset_after': reset_after,
+        })
+    
+    
+    @copy_docs(RateLimitBrokerBase.set_global_rate_limit)
+    def set_global_rate_limit(self, retry_after):
+        self._send({'op': OPERATION_GLOBAL, 'retry_after': retry_after})
+    
+    
+    @copy_docs(RateLimitBrokerBase.close)
+    async def close(self):
+        protocol = self._protocol
+        if (protocol is not None):
+            self._protocol = None
+            protocol.close()
@@ -0,0 +1,142 @@
+__all__ = ()
+
+from scarletio import from_json, to_json
+
+from ..headers import RATE_LIMIT_LIMIT, RATE_LIMIT_REMAINING
+from ..rate_limit import StackedStaticRateLimitHandler, get_rate_limit_delay_from_headers
+
+
+MESSAGE_LENGTH_SIZE = 4
+
+OPERATION_ACQUIRE = 'acquire'
+OPERATION_GLOBAL = 'global'
+OPERATION_RELEASE = 'release'
+
+
+def get_token_key(token):
+    """
+    Returns the part of the given token identifying its owner. Used to separate the bucket keys of the tokens sharing
+    the same broker. The token's first part is its owner's base64 encoded identifier, so it is not a secret.
+    
+    Parameters
+    ----------
+    token : `str`
+        The token.
+    
+    Returns
+    -------
+    token_key : `str`
+    """
+    return token.partition('.')[0]
+
+
+def get_bucket_key(handler, token_key, bucket_hash):
+    """
+    Returns the bucket key of the given rate limit handler shared between processes.
+    
+    The predefined rate limit groups' identifiers are generated on import in the same order, so they match between
+    processes running the same version. The groups created by bucket discovery get their identifier at runtime, so
+    they are identified by their discovered bucket hash instead.
+    
+    Parameters
+    ----------
+    handler : ``RateLimitHandler``, ``StaticRateLimitHandler``, ``StackedStaticRateLimitHandler``
+        The rate limit handler.
+    token_key : `str`
+        The requesting token's owner identifying part.
+    bucket_hash : `None | str`
+        The discovered bucket hash of the request's route. `None` if not discovered.
+    
+    Returns
+    -------
+    bucket_key : `None | str`
+        Returns `None` if the handler is unlimited.
+    """
+    if handler.is_unlimited():
+        return None
+    
+    if isinstance(handler, StackedStaticRateLimitHandler):
+        handler = handler.stack[0]
+    
+    if bucket_hash is None:
+        return f'{token_key}:{handler.parent.group_id}:{handler.limiter_id}'
+    
+    return f'{token_key}:#{bucket_hash}:{handler.limiter_id}'
+
+
+def get_bucket_state_from_headers(headers):
+    """
+    Gets the bucket state from the given response headers.
+    
+    Parameters
+    ----------
+    headers : ``IgnoreCaseMultiValueDictionary``
+        Response headers.
+    
+    Returns
+    -------
+    bucket_state : `None | (int, int, float)`
+        The bucket's size, the remaining requests and the delay till reset. Returns `None` if the response has no
+        rate limit information.
+    """
+    limit = headers.get(RATE_LIMIT_LIMIT, None)
+    remaining = headers.get(RATE_LIMIT_REMAINING, None)
+    if (limit is None) or (remaining is None):
+        return None
+    
+    try:
+        limit = int(limit)
+        remaining = int(remaining)
+    except ValueError:
+        return None
+    
+    return limit, remaining, get_rate_limit_delay_from_headers(headers)
+
+
+def pack_message(data):
+    """
+    Packs a broker message to be sent.
+    
+    Messages are json objects prefixed by their length.
+    
+    Parameters
+    ----------
+    data : `dict<str, object>`
+        The message.
+    
+    Returns
+    -------
+    raw_data : `bytes`
+    """
+    raw_data = to_json(data).encode()
+    return len(raw_data).to_bytes(MESSAGE_LENGTH_SIZE, 'big') + raw_data
+
+
+async def read_message(protocol):
+    """
+    Reads a broker message from the given protocol.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    protocol : ``ReadWriteProtocolBase``
+        The protocol to read from.
+    
+    Returns
+    -------
+    data : `dict<str, object>`
+    
+    Raises
+    ------
+    ConnectionError
+        - The connection was closed.
+    ValueError
+        - Invalid message.
+    """
+    length = int.from_bytes(await protocol.read_exactly(MESSAGE_LENGTH_SIZE), 'big')
+    data = from_json((await protocol.read_exactly(length)).decode())
+    if not isinstance(data, dict):
+        raise ValueError(f'Broker message should be an object, got {data!r}.')
+    
+    return data
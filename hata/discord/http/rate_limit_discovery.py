@@ -0,0 +1,344 @@
+__all__ = ()
+
+from re import compile as re_compile
+
+from scarletio import RichAttributeErrorBaseType
+
+from .headers import RATE_LIMIT_HASH
+from .rate_limit import RATE_LIMIT_HASH_GLOBAL, RateLimitGroup, RateLimitHandler
+
+
+ROUTE_SNOWFLAKE_RP = re_compile('\\d{7,}')
+ROUTE_REACTION_RP = re_compile('/reactions/[^/]+')
+ROUTE_TOKEN_RP = re_compile('/(webhooks|interactions)/(\\d{7,})/[^/]+')
+ROUTE_CODE_RP = re_compile('/(invites|templates)/[^/]+')
+
+# The maximal amount of routes to remember the bucket of. If exceeded, the earliest learnt routes are forgotten.
+ROUTE_COUNT_MAX = 4096
+
+
+def get_route_path(url):
+    """
+    Returns the given url's route path, replacing its identifiers, tokens, codes and emojis with placeholders and
+    removing its query string, so every request to the same endpoint has the same route path.
+    
+    Parameters
+    ----------
+    url : `str`
+        The requested url.
+    
+    Returns
+    -------
+    route_path : `str`
+    """
+    url = url.partition('?')[0]
+    url = ROUTE_TOKEN_RP.sub('/\\1/\\2/{token}', url)
+    url = ROUTE_CODE_RP.sub('/\\1/{code}', url)
+    url = ROUTE_REACTION_RP.sub('/reactions/{emoji}', url)
+    url = ROUTE_SNOWFLAKE_RP.sub('{id}', url)
+    return url
+
+
+class RateLimitBucketDiscovery(RichAttributeErrorBaseType):
+    """
+    Discovers which routes share a rate limit bucket using the `X-RateLimit-Bucket` response header.
+    
+    Routes are identified by their static rate limit group, method and route path. After a route's bucket is
+    discovered, its requests are limited by a rate limit group shared between every route with the same bucket (and
+    limiter). Routes with not yet discovered bucket fall back to their static rate limit group.
+    
+    At most `ROUTE_COUNT_MAX` routes are remembered; the bucket rate limit groups are dropped with their last route.
+    
+    Attributes
+    ----------
+    _bucket_static_groups : `dict<str, dict<RateLimitGroup, int>>`
+        Bucket hash to static rate limit group to discovered route count relation.
+    _static_group_buckets : `dict<RateLimitGroup, dict<str, int>>`
+        Static rate limit group to bucket hash to discovered route count relation.
+    agreement_count : `int`
+        How much times a discovered bucket agreed with the static rate limit groups.
+    bucket_groups : `dict<(str, str), RateLimitGroup>`
+        Bucket hash - limiter pair to rate limit group relation.
+    change_count : `int`
+        How much times a route's bucket changed.
+    disagreement_count : `int`
+        How much times a discovered bucket disagreed with the static rate limit groups. It disagrees if a route
+        with the same static group is in an other bucket, or a route with an other static group is in the same bucket.
+    route_buckets : `dict<(RateLimitGroup, str, str), str>`
+        Route to the discovered bucket hash relation.
+    """
+    __slots__ = (
+        '_bucket_static_groups', '_static_group_buckets', 'agreement_count', 'bucket_groups', 'change_count',
+        'disagreement_count', 'route_buckets'
+    )
+    
+    def __new__(cls):
+        """
+        Creates a new rate limit bucket discovery.
+        """
+        self = object.__new__(cls)
+        self._bucket_static_groups = {}
+        self._static_group_buckets = {}
+        self.agreement_count = 0
+        self.bucket_groups = {}
+        self.change_count = 0
+        self.disagreement_count = 0
+        self.route_buckets = {}
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the rate limit bucket discovery's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' route_count = ')
+        repr_parts.append(repr(len(self.route_buckets)))
+        
+        repr_parts.append(', bucket_count = ')
+        repr_parts.append(repr(len(self.bucket_groups)))
+        
+        repr_parts.append(', disagreement_count = ')
+        repr_parts.append(repr(self.disagreement_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def get_route_key(self, handler, method, url):
+        """
+        Returns the route key of a request.
+        
+        Parameters
+        ----------
+        handler : ``RateLimitHandler``
+            The request's static rate limit handler.
+        method : `str`
+            The request's method.
+        url : `str`
+            The requested url.
+        
+        Returns
+        -------
+        route_key : `(RateLimitGroup, str, str)`
+        """
+        return (handler.parent, method, get_route_path(url))
+    
+    
+    def get_bucket_hash(self, route_key):
+        """
+        Returns the discovered bucket hash of the given route.
+        
+        Parameters
+        ----------
+        route_key : `(RateLimitGroup, str, str)`
+            The route's key.
+        
+        Returns
+        -------
+        bucket_hash : `None | str`
+            `None` if the route's bucket is not known yet.
+        """
+        return self.route_buckets.get(route_key, None)
+    
+    
+    def resolve(self, handler, route_key):
+        """
+        Resolves the rate limit handler to use for the given route.
+        
+        Parameters
+        ----------
+        handler : ``RateLimitHandler``
+            The request's static rate limit handler.
+        route_key : `(RateLimitGroup, str, str)`
+            The route's key.
+        
+        Returns
+        -------
+        handler : ``RateLimitHandler``
+            The discovered bucket's rate limit handler, or the given one if the route's bucket is not known yet.
+        """
+        bucket_hash = self.route_buckets.get(route_key, None)
+        if bucket_hash is None:
+            return handler
+        
+        static_group = route_key[0]
+        limiter = static_group.limiter
+        bucket_key = (bucket_hash, limiter)
+        
+        group = self.bucket_groups.get(bucket_key, None)
+        if group is None:
+            group = RateLimitGroup(limiter)
+            # Start from the learnt size, so we do not need to learn it again.
+            size = static_group.size
+            if size > 0:
+                group.size = size
+            
+            self.bucket_groups[bucket_key] = group
+        
+        return RateLimitHandler(group, handler.limiter_id)
+    
+    
+    def learn(self, route_key, headers):
+        """
+        Learns the bucket of the given route from the response headers.
+        
+        Parameters
+        ----------
+        route_key : `(RateLimitGroup, str, str)`
+            The route's key.
+        headers : ``IgnoreCaseMultiValueDictionary``
+            Response headers.
+        """
+        bucket_hash = headers.get(RATE_LIMIT_HASH, None)
+        if (bucket_hash is None) or (bucket_hash == RATE_LIMIT_HASH_GLOBAL):
+            return
+        
+        route_buckets = self.route_buckets
+        old_bucket_hash = route_buckets.get(route_key, None)
+        if old_bucket_hash == bucket_hash:
+            return
+        
+        if (old_bucket_hash is None):
+            if len(route_buckets) >= ROUTE_COUNT_MAX:
+                self._forget(next(iter(route_buckets)))
+        
+        else:
+            self.change_count += 1
+            self._unlink(route_key, old_bucket_hash)
+        
+        route_buckets[route_key] = bucket_hash
+        
+        if self._is_disagreeing_with_static_groups(route_key, bucket_hash):
+            self.disagreement_count += 1
+        else:
+            self.agreement_count += 1
+        
+        self._link(route_key, bucket_hash)
+    
+    
+    def _forget(self, route_key):
+        """
+        Forgets the bucket of the given route.
+        
+        Parameters
+        ----------
+        route_key : `(RateLimitGroup, str, str)`
+            The route's key.
+        """
+        bucket_hash = self.route_buckets.pop(route_key, None)
+        if (bucket_hash is not None):
+            self._unlink(route_key, bucket_hash)
+    
+    
+    def _link(self, route_key, bucket_hash):
+        """
+        Adds the route to the bucket and static group indexes.
+        
+        Parameters
+        ----------
+        route_key : `(RateLimitGroup, str, str)`
+            The route's key.
+        bucket_hash : `str`
+            The route's discovered bucket.
+        """
+        static_group = route_key[0]
+        
+        static_groups = self._bucket_static_groups.setdefault(bucket_hash, {})
+        static_groups[static_group] = static_groups.get(static_group, 0) + 1
+        
+        bucket_hashes = self._static_group_buckets.setdefault(static_group, {})
+        bucket_hashes[bucket_hash] = bucket_hashes.get(bucket_hash, 0) + 1
+    
+    
+    def _unlink(self, route_key, bucket_hash):
+        """
+        Removes the route from the bucket and static group indexes. If it was the last route of the bucket with its
+        limiter, drops the bucket's rate limit group as well.
+        
+        Parameters
+        ----------
+        route_key : `(RateLimitGroup, str, str)`
+            The route's key.
+        bucket_hash : `str`
+            The route's old bucket.
+        """
+        static_group = route_key[0]
+        
+        bucket_static_groups = self._bucket_static_groups
+        static_groups = bucket_static_groups[bucket_hash]
+        count = static_groups[static_group] - 1
+        if count:
+            static_groups[static_group] = count
+        else:
+            del static_groups[static_group]
+            
+            limiter = static_group.limiter
+            for other_static_group in static_groups.keys():
+                if other_static_group.limiter == limiter:
+                    break
+            else:
+                self.bucket_groups.pop((bucket_hash, limiter), None)
+            
+            if not static_groups:
+                del bucket_static_groups[bucket_hash]
+        
+        static_group_buckets = self._static_group_buckets
+        bucket_hashes = static_group_buckets[static_group]
+        count = bucket_hashes[bucket_hash] - 1
+        if count:
+            bucket_hashes[bucket_hash] = count
+        else:
+            del bucket_hashes[bucket_hash]
+            if not bucket_hashes:
+                del static_group_buckets[static_group]
+    
+    
+    def _is_disagreeing_with_static_groups(self, route_key, bucket_hash):
+        """
+        Returns whether the discovered bucket of the route disagrees with the static rate limit groups.
+        
+        Parameters
+        ----------
+        route_key : `(RateLimitGroup, str, str)`
+            The route's key.
+        bucket_hash : `str`
+            The route's discovered bucket.
+        
+        Returns
+        -------
+        disagreeing : `bool`
+        """
+        static_group = route_key[0]
+            
+        # A route with the same static group is in an other bucket.
+        bucket_hashes = self._static_group_buckets.get(static_group, None)
+        if (bucket_hashes is not None):
+            for other_bucket_hash in bucket_hashes.keys():
+                if other_bucket_hash != bucket_hash:
+                    return True
+        
+        # A route with an other static group is in the same bucket.
+        static_groups = self._bucket_static_groups.get(bucket_hash, None)
+        if (static_groups is not None):
+            for other_static_group in static_groups.keys():
+                if other_static_group is not static_group:
+                    return True
+        
+        return False
+    
+    
+    def get_statistics(self):
+        """
+        Returns the bucket discovery's statistics.
+        
+        Returns
+        -------
+        statistics : `dict<str, int>`
+        """
+        return {
+            'agreement_count': self.agreement_count,
+            'bucket_count': len(self.bucket_groups),
+            'change_count': self.change_count,
+            'disagreement_count': self.disagreement_count,
+            'route_count': len(self.route_buckets),
+        }
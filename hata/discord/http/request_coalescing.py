@@ -0,0 +1,243 @@
+__all__ = ()
+
+from marshal import dumps as marshal_dump, loads as marshal_load
+
+from scarletio import RichAttributeErrorBaseType, Task, shield
+from scarletio.web_common.headers import METHOD_GET
+
+from ..core import KOKORO
+
+
+def get_query_key(query):
+    """
+    Returns a hashable key representing the given query string parameters.
+    
+    Parameters
+    ----------
+    query : `None | object`
+        Query string parameters.
+    
+    Returns
+    -------
+    query_key : `None | tuple<(str, str)>`
+        Returns `None` if the query cannot be represented by a key.
+    """
+    if query is None:
+        return ()
+    
+    if isinstance(query, dict):
+        return tuple(sorted((str(key), str(value)) for key, value in query.items()))
+    
+    return None
+
+
+def copy_response_data(response_data):
+    """
+    Copies the given response data, so it can be modified without affecting the other requests sharing it.
+    
+    The data is copied with `marshal`, because it is much faster than `deepcopy` and supports every type a decoded
+    payload can contain.
+    
+    Parameters
+    ----------
+    response_data : `object`
+        The response data to copy.
+    
+    Returns
+    -------
+    response_data : `object`
+    """
+    if isinstance(response_data, (dict, list)):
+        response_data = marshal_load(marshal_dump(response_data))
+    
+    return response_data
+
+
+class RequestCoalescer(RichAttributeErrorBaseType):
+    """
+    Coalesces concurrent identical `GET` requests, so they share one response.
+    
+    Only requests done with the api client's own headers and without payload are coalesced. Each coalesced request
+    gets its own copy of the response data, so they can modify it.
+    
+    Attributes
+    ----------
+    coalesced_request_count : `int`
+        How much requests were coalesced into an already in-flight one.
+    in_flight : `dict<(str, tuple<(str, str)>), _InFlightRequest>`
+        Request key to the in-flight request relation.
+    request_count : `int`
+        How much requests were done by the coalescer.
+    """
+    __slots__ = ('coalesced_request_count', 'in_flight', 'request_count')
+    
+    def __new__(cls):
+        """
+        Creates a new request coalescer.
+        """
+        self = object.__new__(cls)
+        self.coalesced_request_count = 0
+        self.in_flight = {}
+        self.request_count = 0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the request coalescer's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' in_flight_count = ')
+        repr_parts.append(repr(len(self.in_flight)))
+        
+        repr_parts.append(', request_count = ')
+        repr_parts.append(repr(self.request_count))
+        
+        repr_parts.append(', coalesced_request_count = ')
+        repr_parts.append(repr(self.coalesced_request_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def get_request_key(self, method, url, data, query, headers):
+        """
+        Returns the request key of the given request.
+        
+        Parameters
+        ----------
+        method : `str`
+            The method of the request.
+        url : `str`
+            The url to request.
+        data : `None | object`
+            Payload to request with.
+        query : `None | object`
+            Query string parameters.
+        headers : `None | IgnoreCaseMultiValueDictionary`
+            Headers to do the request with.
+        
+        Returns
+        -------
+        request_key : `None | (str, tuple<(str, str)>)`
+            Returns `None` if the request cannot be coalesced.
+        """
+        if (method != METHOD_GET) or (data is not None) or (headers is not None):
+            return None
+        
+        query_key = get_query_key(query)
+        if query_key is None:
+            return None
+        
+        return (url, query_key)
+    
+    
+    async def request(self, request_key, request_factory):
+        """
+        Does the request. If an identical request is already in-flight, waits for its response instead.
+        
+        The request runs in its own task, so cancelling one of the waiters does not cancel it for the others. If the
+        request was coalesced, each waiter gets its own copy of the response data.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        request_key : `(str, tuple<(str, str)>)`
+            The request's key.
+        request_factory : `callable`
+            Returns a coroutine doing the request when called.
+        
+        Returns
+        -------
+        response_data : `object`
+        
+        Raises
+        ------
+        BaseException
+            Any exception raised by the request.
+        """
+        in_flight = self.in_flight
+        in_flight_request = in_flight.get(request_key, None)
+        if in_flight_request is None:
+            in_flight_request = _InFlightRequest(self, request_key, Task(KOKORO, request_factory()))
+            in_flight[request_key] = in_flight_request
+            self.request_count += 1
+        else:
+            in_flight_request.coalesced = True
+            self.coalesced_request_count += 1
+        
+        response_data = await shield(in_flight_request.task, KOKORO)
+        
+        # The shared response data is never returned, so modifying a copy cannot affect the other requests.
+        if in_flight_request.coalesced:
+            response_data = copy_response_data(response_data)
+        
+        return response_data
+    
+    
+    def get_statistics(self):
+        """
+        Returns the request coalescer's statistics.
+        
+        Returns
+        -------
+        statistics : `dict<str, int>`
+        """
+        return {
+            'coalesced_request_count': self.coalesced_request_count,
+            'in_flight_count': len(self.in_flight),
+            'request_count': self.request_count,
+        }
+
+
+class _InFlightRequest:
+    """
+    A request in-flight in a request coalescer. Removes itself from the request coalescer when finished.
+    
+    Attributes
+    ----------
+    coalesced : `bool`
+        Whether other requests were coalesced into the request.
+    request_coalescer : ``RequestCoalescer``
+        The request coalescer to remove the request from.
+    request_key : `(str, tuple<(str, str)>)`
+        The request's key.
+    task : ``Task``
+        The request's task.
+    """
+    __slots__ = ('coalesced', 'request_coalescer', 'request_key', 'task')
+    
+    def __new__(cls, request_coalescer, request_key, task):
+        """
+        Creates a new in-flight request.
+        
+        Parameters
+        ----------
+        request_coalescer : ``RequestCoalescer``
+            The request coalescer to remove the request from.
+        request_key : `(str, tuple<(str, str)>)`
+            The request's key.
+        task : ``Task``
+            The request's task.
+        """
+        self = object.__new__(cls)
+        self.coalesced = False
+        self.request_coalescer = request_coalescer
+        self.request_key = request_key
+        self.task = task
+        task.add_done_callback(self)
+        return self
+    
+    
+    def __call__(self, task):
+        """
+        Removes the finished request.
+        
+        Parameters
+        ----------
+        task : ``Task``
+            The finished request's task.
+        """
+        in_flight = self.request_coalescer.in_flight
+        if in_flight.get(self.request_key, None) is self:
+            del in_flight[self.request_key]
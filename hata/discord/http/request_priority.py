@@ -0,0 +1,236 @@
+__all__ = (
+    'REQUEST_PRIORITY_BACKGROUND', 'REQUEST_PRIORITY_DEFAULT', 'REQUEST_PRIORITY_INTERACTION', 'RequestPriorityQueue',
+    'RequestQueueStatistics'
+)
+
+from collections import deque
+
+from scarletio import RichAttributeErrorBaseType
+
+
+REQUEST_PRIORITY_INTERACTION = 0
+REQUEST_PRIORITY_DEFAULT = 1
+REQUEST_PRIORITY_BACKGROUND = 2
+
+REQUEST_PRIORITY_NAMES = ('interaction', 'default', 'background')
+
+
+def validate_priority(priority):
+    """
+    Validates the given request priority.
+    
+    Parameters
+    ----------
+    priority : `int`
+        The priority to validate.
+    
+    Returns
+    -------
+    priority : `int`
+    
+    Raises
+    ------
+    TypeError
+        - If `priority`'s type is incorrect.
+    ValueError
+        - If `priority`'s value is incorrect.
+    """
+    if type(priority) is int:
+        pass
+    elif isinstance(priority, int):
+        priority = int(priority)
+    else:
+        raise TypeError(
+            f'`priority` can be `int`, got {type(priority).__name__}; {priority!r}.'
+        )
+    
+    if (priority < REQUEST_PRIORITY_INTERACTION) or (priority > REQUEST_PRIORITY_BACKGROUND):
+        raise ValueError(
+            f'`priority` can be in range [{REQUEST_PRIORITY_INTERACTION!r}, {REQUEST_PRIORITY_BACKGROUND!r}], '
+            f'got {priority!r}.'
+        )
+    
+    return priority
+
+
+class RequestPriorityQueue(RichAttributeErrorBaseType):
+    """
+    Queue of waiting requests, ordered by their priority, then by their arrival.
+    
+    Implements the parts of `deque` used by the rate limit handlers.
+    
+    Attributes
+    ----------
+    _queues : `tuple<deque<Future>>`
+        A queue for each priority, from the most urgent to the least urgent.
+    """
+    __slots__ = ('_queues',)
+    
+    def __new__(cls):
+        """
+        Creates a new request priority queue.
+        """
+        self = object.__new__(cls)
+        self._queues = tuple(deque() for priority_name in REQUEST_PRIORITY_NAMES)
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the request priority queue's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        field_added = False
+        for priority_name, queue in zip(REQUEST_PRIORITY_NAMES, self._queues):
+            if field_added:
+                repr_parts.append(',')
+            else:
+                field_added = True
+            
+            repr_parts.append(' ')
+            repr_parts.append(priority_name)
+            repr_parts.append(' = ')
+            repr_parts.append(repr(len(queue)))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __len__(self):
+        """Returns the amount of waiting requests."""
+        return sum(len(queue) for queue in self._queues)
+    
+    
+    def __bool__(self):
+        """Returns whether there are waiting requests."""
+        for queue in self._queues:
+            if queue:
+                return True
+        
+        return False
+    
+    
+    def __iter__(self):
+        """Iterates over the waiting requests in the order they will be woken up."""
+        for queue in self._queues:
+            yield from queue
+    
+    
+    def append(self, future, priority = REQUEST_PRIORITY_DEFAULT):
+        """
+        Adds a waiting request to the queue.
+        
+        Parameters
+        ----------
+        future : ``Future``
+            The request's waiter.
+        priority : `int` = `REQUEST_PRIORITY_DEFAULT`, Optional
+            The request's priority.
+        """
+        self._queues[priority].append(future)
+    
+    
+    def popleft(self):
+        """
+        Removes and returns the waiting request which should be woken up next.
+        
+        Returns
+        -------
+        future : ``Future``
+        
+        Raises
+        ------
+        IndexError
+            - If the queue is empty.
+        """
+        for queue in self._queues:
+            if queue:
+                return queue.popleft()
+        
+        raise IndexError('pop from an empty queue')
+
+
+class RequestQueueStatistics(RichAttributeErrorBaseType):
+    """
+    Collects for how long the requests waited in queue for each priority.
+    
+    Attributes
+    ----------
+    maximal_waits : `list<float>`
+        The longest wait for each priority in seconds.
+    request_counts : `list<int>`
+        The amount of requests for each priority.
+    total_waits : `list<float>`
+        The total waited time for each priority in seconds.
+    """
+    __slots__ = ('maximal_waits', 'request_counts', 'total_waits')
+    
+    def __new__(cls):
+        """
+        Creates a new request queue statistics.
+        """
+        self = object.__new__(cls)
+        self.maximal_waits = [0.0 for priority_name in REQUEST_PRIORITY_NAMES]
+        self.request_counts = [0 for priority_name in REQUEST_PRIORITY_NAMES]
+        self.total_waits = [0.0 for priority_name in REQUEST_PRIORITY_NAMES]
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the request queue statistics' representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' request_count = ')
+        repr_parts.append(repr(sum(self.request_counts)))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def record(self, priority, waited):
+        """
+        Records a request's queueing time.
+        
+        Parameters
+        ----------
+        priority : `int`
+            The request's priority.
+        waited : `float`
+            For how long the request waited in seconds.
+        """
+        self.request_counts[priority] += 1
+        self.total_waits[priority] += waited
+        if waited > self.maximal_waits[priority]:
+            self.maximal_waits[priority] = waited
+    
+    
+    def get_statistics(self):
+        """
+        Returns the queueing statistics for each priority.
+        
+        Returns
+        -------
+        statistics : `dict<str, dict<str, float | int>>`
+        """
+        statistics = {}
+        
+        for priority_name, request_count, total_wait, maximal_wait in zip(
+            REQUEST_PRIORITY_NAMES, self.request_counts, self.total_waits, self.maximal_waits
+        ):
+            statistics[priority_name] = {
+                'average_wait': (total_wait / request_count) if request_count else 0.0,
+                'maximal_wait': maximal_wait,
+                'request_count': request_count,
+                'total_wait': total_wait,
+            }
+        
+        return statistics
+    
+    
+    def reset_statistics(self):
+        """
+        Resets the collected statistics.
+        """
+        for priority in range(len(REQUEST_PRIORITY_NAMES)):
+            self.maximal_waits[priority] = 0.0
+            self.request_counts[priority] = 0
+            self.total_waits[priority] = 0.0
@@ -0,0 +1,310 @@
+__all__ = ()
+
+from re import compile as re_compile
+
+from scarletio import LOOP_TIME, RichAttributeErrorBaseType
+from scarletio.web_common.headers import METHOD_GET
+
+from . import rate_limit_groups as RATE_LIMIT_GROUPS
+from .rate_limit import RateLimitHandler
+from .request_coalescing import copy_response_data, get_query_key
+
+
+RESPONSE_CACHE_GROUPS = frozenset((
+    RATE_LIMIT_GROUPS.channel_get,
+    RATE_LIMIT_GROUPS.guild_channel_get_all,
+    RATE_LIMIT_GROUPS.guild_get,
+    RATE_LIMIT_GROUPS.guild_preview_get,
+    RATE_LIMIT_GROUPS.guild_role_get_all,
+    RATE_LIMIT_GROUPS.voice_region_get_all,
+    RATE_LIMIT_GROUPS.welcome_screen_get,
+))
+
+# These groups are globally limited, so their limiter identifier is not the requested entity's. Their responses are
+# keyed by the entity identifier parsed from the url instead, so they can be invalidated by it.
+RESPONSE_CACHE_GROUPS_KEYED_BY_URL = frozenset((
+    RATE_LIMIT_GROUPS.channel_get,
+    RATE_LIMIT_GROUPS.guild_preview_get,
+))
+
+RESPONSE_CACHE_ENTITY_ID_RP = re_compile('/(?:channels|guilds)/(\\d+)')
+
+RESPONSE_CACHE_GROUPS_CHANNEL = (
+    RATE_LIMIT_GROUPS.channel_get,
+)
+
+RESPONSE_CACHE_GROUPS_GUILD = (
+    RATE_LIMIT_GROUPS.guild_get,
+    RATE_LIMIT_GROUPS.guild_preview_get,
+    RATE_LIMIT_GROUPS.welcome_screen_get,
+)
+
+RESPONSE_CACHE_GROUPS_GUILD_ALL = (
+    RATE_LIMIT_GROUPS.guild_channel_get_all,
+    RATE_LIMIT_GROUPS.guild_get,
+    RATE_LIMIT_GROUPS.guild_preview_get,
+    RATE_LIMIT_GROUPS.guild_role_get_all,
+    RATE_LIMIT_GROUPS.welcome_screen_get,
+)
+
+RESPONSE_CACHE_GROUPS_GUILD_CHANNELS = (
+    RATE_LIMIT_GROUPS.guild_channel_get_all,
+)
+
+RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS = (
+    RATE_LIMIT_GROUPS.guild_get,
+    RATE_LIMIT_GROUPS.guild_preview_get,
+)
+
+RESPONSE_CACHE_GROUPS_GUILD_ROLES = (
+    RATE_LIMIT_GROUPS.guild_get,
+    RATE_LIMIT_GROUPS.guild_role_get_all,
+)
+
+
+class ResponseCache(RichAttributeErrorBaseType):
+    """
+    Caches the responses of read endpoints for a short time.
+    
+    Only the `GET` requests of the endpoints in `RESPONSE_CACHE_GROUPS` done with the api client's own headers are
+    cached. The responses are keyed by their rate limit group, limiter identifier (or for the globally limited groups
+    the requested entity's identifier), url and query, so they can be invalidated by the related dispatch event
+    parsers. A copy of the response data is cached, so the requester can modify its own.
+    
+    Attributes
+    ----------
+    entries : `dict<(RateLimitGroup, int), dict<(str, tuple<(str, str)>), (float, object)>>`
+        Rate limit group and limiter identifier to the cached responses relation. The responses are stored with their
+        expiration time (monotonic).
+    generation : `int`
+        Incremented on every invalidation, so responses requested before an invalidation are not cached.
+    hit_count : `int`
+        How much times a response was found in the cache.
+    invalidation_count : `int`
+        How much cached responses were invalidated.
+    miss_count : `int`
+        How much times a response was not found in the cache.
+    purge_at : `float`
+        When the expired responses should be purged next time (monotonic).
+    time_to_live : `float`
+        For how long the responses are cached.
+    """
+    __slots__ = ('entries', 'generation', 'hit_count', 'invalidation_count', 'miss_count', 'purge_at', 'time_to_live')
+    
+    def __new__(cls, time_to_live):
+        """
+        Creates a new response cache.
+        
+        Parameters
+        ----------
+        time_to_live : `float`
+            For how long the responses are cached.
+        """
+        self = object.__new__(cls)
+        self.entries = {}
+        self.generation = 0
+        self.hit_count = 0
+        self.invalidation_count = 0
+        self.miss_count = 0
+        self.purge_at = 0.0
+        self.time_to_live = float(time_to_live)
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the response cache's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' time_to_live = ')
+        repr_parts.append(repr(self.time_to_live))
+        
+        repr_parts.append(', hit_count = ')
+        repr_parts.append(repr(self.hit_count))
+        
+        repr_parts.append(', miss_count = ')
+        repr_parts.append(repr(self.miss_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def get_request_key(self, handler, method, url, data, query, headers):
+        """
+        Returns the cache key of the given request.
+        
+        Parameters
+        ----------
+        handler : ``RateLimitHandler``, ``StackedStaticRateLimitHandler``
+            Rate limit handler for the request.
+        method : `str`
+            The method of the request.
+        url : `str`
+            The url to request.
+        data : `None | object`
+            Payload to request with.
+        query : `None | object`
+            Query string parameters.
+        headers : `None | IgnoreCaseMultiValueDictionary`
+            Headers to do the request with.
+        
+        Returns
+        -------
+        request_key : `None | (RateLimitGroup, int, str, tuple<(str, str)>)`
+            Returns `None` if the request cannot be cached.
+        """
+        if (method != METHOD_GET) or (data is not None) or (headers is not None):
+            return None
+        
+        if type(handler) is not RateLimitHandler:
+            return None
+        
+        group = handler.parent
+        if group not in RESPONSE_CACHE_GROUPS:
+            return None
+        
+        if group in RESPONSE_CACHE_GROUPS_KEYED_BY_URL:
+            match = RESPONSE_CACHE_ENTITY_ID_RP.search(url)
+            if match is None:
+                return None
+            
+            limiter_id = int(match.group(1))
+        
+        else:
+            limiter_id = handler.limiter_id
+        
+        query_key = get_query_key(query)
+        if query_key is None:
+            return None
+        
+        return (group, limiter_id, url, query_key)
+    
+    
+    def get(self, request_key):
+        """
+        Returns the cached response of the given request.
+        
+        Parameters
+        ----------
+        request_key : `(RateLimitGroup, int, str, tuple<(str, str)>)`
+            The request's cache key.
+        
+        Returns
+        -------
+        entry : `None | (float, object)`
+            The cached response with its expiration time. Returns `None` if not cached or if expired.
+            The cached response data should be copied before it is handed out.
+        """
+        group, limiter_id, url, query_key = request_key
+        responses = self.entries.get((group, limiter_id), None)
+        if (responses is not None):
+            entry = responses.get((url, query_key), None)
+            if (entry is not None):
+                if entry[0] > LOOP_TIME():
+                    self.hit_count += 1
+                    return entry
+                
+                del responses[url, query_key]
+                if not responses:
+                    del self.entries[group, limiter_id]
+        
+        self.miss_count += 1
+        return None
+    
+    
+    def put(self, request_key, response_data, generation):
+        """
+        Caches a copy of the given response.
+        
+        Parameters
+        ----------
+        request_key : `(RateLimitGroup, int, str, tuple<(str, str)>)`
+            The request's cache key.
+        response_data : `object`
+            The response data.
+        generation : `int`
+            The cache's generation when the request was started. If anything was invalidated since, the response is
+            not cached.
+        """
+        if generation != self.generation:
+            return
+        
+        now = LOOP_TIME()
+        if self.purge_at <= now:
+            self._purge_expired(now)
+        
+        group, limiter_id, url, query_key = request_key
+        entries = self.entries
+        responses = entries.get((group, limiter_id), None)
+        if responses is None:
+            responses = {}
+            entries[group, limiter_id] = responses
+        
+        responses[url, query_key] = (now + self.time_to_live, copy_response_data(response_data))
+    
+    
+    def _purge_expired(self, now):
+        """
+        Removes the expired responses, so responses which are not requested again do not stay in the cache.
+        
+        Parameters
+        ----------
+        now : `float`
+            The current time (monotonic).
+        """
+        self.purge_at = now + self.time_to_live
+        
+        entries = self.entries
+        for entry_key, responses in [*entries.items()]:
+            for response_key, entry in [*responses.items()]:
+                if entry[0] <= now:
+                    del responses[response_key]
+            
+            if not responses:
+                del entries[entry_key]
+    
+    
+    def invalidate(self, groups, limiter_id):
+        """
+        Invalidates the cached responses of the given rate limit groups with the given limiter identifier.
+        
+        Parameters
+        ----------
+        groups : `tuple<RateLimitGroup>`
+            The rate limit groups to invalidate.
+        limiter_id : `int`
+            The limiter's identifier, like a guild's or a channel's.
+        """
+        self.generation += 1
+        
+        entries = self.entries
+        if not entries:
+            return
+        
+        for group in groups:
+            responses = entries.pop((group, limiter_id), None)
+            if (responses is not None):
+                self.invalidation_count += len(responses)
+    
+    
+    def clear(self):
+        """
+        Clears the response cache.
+        """
+        self.generation += 1
+        self.entries.clear()
+    
+    
+    def get_statistics(self):
+        """
+        Returns the response cache's statistics.
+        
+        Returns
+        -------
+        statistics : `dict<str, int>`
+        """
+        return {
+            'entry_count': sum(len(responses) for responses in self.entries.values()),
+            'hit_count': self.hit_count,
+            'invalidation_count': self.invalidation_count,
+            'miss_count': self.miss_count,
+        }
@@ -0,0 +1,258 @@
+__all__ = ()
+
+from collections import deque
+
+from scarletio import CancelledError, Future, RichAttributeErrorBaseType
+
+from ..core import KOKORO
+from ..json_codecs.array_decoder import JsonArrayDecoder
+
+
+async def iter_response_chunks(response):
+    """
+    Iterates over the body of the given response chunk by chunk as they are received.
+    
+    This function is an async generator.
+    
+    Parameters
+    ----------
+    response : ``ClientResponse``, ``HTTP2Response``
+        The response to read.
+    
+    Yields
+    ------
+    chunk : `bytes | memoryview`
+    """
+    payload_stream = response.payload_stream
+    if payload_stream is None:
+        body = await response.read()
+        if (body is not None):
+            yield body
+        return
+    
+    async for chunk in payload_stream:
+        yield chunk
+
+
+class ResponseStream(RichAttributeErrorBaseType):
+    """
+    Buffers the elements of a json array response body while they are received, so they can be consumed before the
+    whole body is received.
+    
+    When the buffer is full, reading the response is paused till the elements are consumed.
+    
+    Attributes
+    ----------
+    _exception : `None | BaseException`
+        Exception to raise when the buffered elements are consumed.
+    _items : `deque<object>`
+        The buffered elements.
+    _reader_waiter : `None | Future`
+        Waiter of the consumer for more elements.
+    _writer_waiter : `None | Future`
+        Waiter of the response reader for free space in the buffer.
+    buffer_limit : `int`
+        The maximal amount of elements to buffer.
+    done : `bool`
+        Whether every element is received.
+    item_count : `int`
+        The amount of received elements.
+    json_codec : `type<JsonCodecBase>`
+        The json codec to decode the elements with.
+    started : `bool`
+        Whether reading the response body started. After this point the request cannot be retried.
+    """
+    __slots__ = (
+        '_exception', '_items', '_reader_waiter', '_writer_waiter', 'buffer_limit', 'done', 'item_count',
+        'json_codec', 'started'
+    )
+    
+    def __new__(cls, json_codec, buffer_limit):
+        """
+        Creates a new response stream.
+        
+        Parameters
+        ----------
+        json_codec : `type<JsonCodecBase>`
+            The json codec to decode the elements with.
+        buffer_limit : `int`
+            The maximal amount of elements to buffer.
+        """
+        self = object.__new__(cls)
+        self._exception = None
+        self._items = deque()
+        self._reader_waiter = None
+        self._writer_waiter = None
+        self.buffer_limit = buffer_limit
+        self.done = False
+        self.item_count = 0
+        self.json_codec = json_codec
+        self.started = False
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the response stream's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' item_count = ')
+        repr_parts.append(repr(self.item_count))
+        
+        repr_parts.append(', buffered = ')
+        repr_parts.append(repr(len(self._items)))
+        
+        if self.done:
+            repr_parts.append(', done')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    async def feed_response(self, response):
+        """
+        Reads the given response's body, buffering its elements.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        response : ``ClientResponse``, ``HTTP2Response``
+            The response to read.
+        
+        Raises
+        ------
+        ValueError
+            - If the body is not a valid json array.
+        """
+        self.started = True
+        
+        decoder = JsonArrayDecoder(self.json_codec)
+        async for chunk in iter_response_chunks(response):
+            items = decoder.feed(chunk)
+            if items:
+                await self.feed_items(items)
+        
+        decoder.close()
+    
+    
+    async def feed_items(self, items):
+        """
+        Buffers the given elements. If the buffer is full, waits till they are consumed.
+        
+        This method is a coroutine.
+        
+        Parameters
+        ----------
+        items : `list<object>`
+            The elements to buffer.
+        """
+        buffered_items = self._items
+        buffered_items.extend(items)
+        self.item_count += len(items)
+        self._wake_up_reader()
+        
+        while len(buffered_items) >= self.buffer_limit:
+            waiter = Future(KOKORO)
+            self._writer_waiter = waiter
+            try:
+                await waiter
+            finally:
+                self._writer_waiter = None
+    
+    
+    def set_done(self):
+        """
+        Marks the stream as every element is received.
+        """
+        self.done = True
+        self._wake_up_reader()
+    
+    
+    def set_exception(self, exception):
+        """
+        Marks the stream as failed. The exception is raised after the already buffered elements are consumed.
+        
+        Parameters
+        ----------
+        exception : `BaseException`
+            The exception to raise.
+        """
+        self._exception = exception
+        self.done = True
+        self._wake_up_reader()
+    
+    
+    def _wake_up_reader(self):
+        """
+        Wakes up the consumer waiting for more elements.
+        """
+        waiter = self._reader_waiter
+        if (waiter is not None):
+            self._reader_waiter = None
+            waiter.set_result_if_pending(None)
+    
+    
+    def __call__(self, task):
+        """
+        Marks the stream as done, when its request's task finishes.
+        
+        Parameters
+        ----------
+        task : ``Task``
+            The request's task.
+        """
+        if task.is_cancelled():
+            self.set_exception(CancelledError())
+            return
+        
+        exception = task.get_exception()
+        if exception is None:
+            self.set_done()
+        else:
+            self.set_exception(exception)
+    
+    
+    def __aiter__(self):
+        """Returns the response stream itself."""
+        return self
+    
+    
+    async def __anext__(self):
+        """
+        Returns the next element.
+        
+        This method is a coroutine.
+        
+        Returns
+        -------
+        item : `object`
+        
+        Raises
+        ------
+        StopAsyncIteration
+            - If every element was consumed.
+        BaseException
+            - Any exception raised by the request.
+        """
+        buffered_items = self._items
+        while not buffered_items:
+            if self.done:
+                exception = self._exception
+                if exception is None:
+                    raise StopAsyncIteration
+                
+                self._exception = None
+                raise exception
+            
+            waiter = Future(KOKORO)
+            self._reader_waiter = waiter
+            await waiter
+        
+        item = buffered_items.popleft()
+        
+        waiter = self._writer_waiter
+        if (waiter is not None) and (len(buffered_items) < self.buffer_limit):
+            self._writer_waiter = None
+            waiter.set_result_if_pending(None)
+        
+        return item
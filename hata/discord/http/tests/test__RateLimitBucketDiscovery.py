@@ -0,0 +1,198 @@
+import vampytest
+from scarletio import IgnoreCaseMultiValueDictionary
+
+from ..headers import RATE_LIMIT_HASH
+from ..rate_limit import LIMITER_CHANNEL, RATE_LIMIT_HASH_GLOBAL, RateLimitGroup, RateLimitHandler
+from ..rate_limit_discovery import RateLimitBucketDiscovery
+
+
+def _assert_fields_set(bucket_discovery):
+    """
+    Asserts whether every attribute is set of the given rate limit bucket discovery.
+    
+    Parameters
+    ----------
+    bucket_discovery : ``RateLimitBucketDiscovery``
+        The instance to check.
+    """
+    vampytest.assert_instance(bucket_discovery, RateLimitBucketDiscovery)
+    vampytest.assert_instance(bucket_discovery._bucket_static_groups, dict)
+    vampytest.assert_instance(bucket_discovery._static_group_buckets, dict)
+    vampytest.assert_instance(bucket_discovery.agreement_count, int)
+    vampytest.assert_instance(bucket_discovery.bucket_groups, dict)
+    vampytest.assert_instance(bucket_discovery.change_count, int)
+    vampytest.assert_instance(bucket_discovery.disagreement_count, int)
+    vampytest.assert_instance(bucket_discovery.route_buckets, dict)
+
+
+def _create_headers(bucket_hash):
+    """
+    Creates response headers with the given bucket hash.
+    
+    Parameters
+    ----------
+    bucket_hash : `None | str`
+        The bucket's hash.
+    
+    Returns
+    -------
+    headers : ``IgnoreCaseMultiValueDictionary``
+    """
+    headers = IgnoreCaseMultiValueDictionary()
+    if (bucket_hash is not None):
+        headers[RATE_LIMIT_HASH] = bucket_hash
+    return headers
+
+
+def test__RateLimitBucketDiscovery__new():
+    """
+    Tests whether ``RateLimitBucketDiscovery.__new__`` works as intended.
+    """
+    bucket_discovery = RateLimitBucketDiscovery()
+    _assert_fields_set(bucket_discovery)
+
+
+def test__RateLimitBucketDiscovery__repr():
+    """
+    Tests whether ``RateLimitBucketDiscovery.__repr__`` works as intended.
+    """
+    bucket_discovery = RateLimitBucketDiscovery()
+    
+    output = repr(bucket_discovery)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(bucket_discovery).__name__, output)
+
+
+def test__RateLimitBucketDiscovery__resolve__not_discovered():
+    """
+    Tests whether ``RateLimitBucketDiscovery.resolve`` works as intended.
+    
+    Case: Bucket not discovered yet.
+    """
+    channel_id = 202510181000
+    handler = RateLimitHandler(RateLimitGroup(LIMITER_CHANNEL), channel_id)
+    
+    bucket_discovery = RateLimitBucketDiscovery()
+    route_key = bucket_discovery.get_route_key(handler, 'GET', f'https://discord.com/api/v10/channels/{channel_id}')
+    
+    bucket_discovery.learn(route_key, _create_headers(None))
+    bucket_discovery.learn(route_key, _create_headers(RATE_LIMIT_HASH_GLOBAL))
+    
+    output = bucket_discovery.resolve(handler, route_key)
+    vampytest.assert_is(output, handler)
+    vampytest.assert_is(bucket_discovery.get_bucket_hash(route_key), None)
+
+
+def test__RateLimitBucketDiscovery__resolve__shared_bucket():
+    """
+    Tests whether ``RateLimitBucketDiscovery.resolve`` works as intended.
+    
+    Case: Two routes of different static groups are discovered to share the same bucket.
+    """
+    channel_id = 202510181001
+    group_0 = RateLimitGroup(LIMITER_CHANNEL)
+    group_0.size = 5
+    group_1 = RateLimitGroup(LIMITER_CHANNEL)
+    handler_0 = RateLimitHandler(group_0, channel_id)
+    handler_1 = RateLimitHandler(group_1, channel_id)
+    
+    bucket_discovery = RateLimitBucketDiscovery()
+    route_key_0 = bucket_discovery.get_route_key(
+        handler_0, 'GET', f'https://discord.com/api/v10/channels/{channel_id}/pins'
+    )
+    route_key_1 = bucket_discovery.get_route_key(
+        handler_1, 'PUT', f'https://discord.com/api/v10/channels/{channel_id}/pins/202510181002'
+    )
+    
+    bucket_discovery.learn(route_key_0, _create_headers('pudding'))
+    bucket_discovery.learn(route_key_1, _create_headers('pudding'))
+    
+    output_0 = bucket_discovery.resolve(handler_0, route_key_0)
+    output_1 = bucket_discovery.resolve(handler_1, route_key_1)
+    
+    vampytest.assert_instance(output_0, RateLimitHandler)
+    vampytest.assert_eq(output_0, output_1)
+    vampytest.assert_eq(output_0.limiter_id, channel_id)
+    vampytest.assert_eq(output_0.parent.size, 5)
+    vampytest.assert_eq(bucket_discovery.get_bucket_hash(route_key_0), 'pudding')
+    
+    vampytest.assert_eq(
+        bucket_discovery.get_statistics(),
+        {
+            'agreement_count': 1,
+            'bucket_count': 1,
+            'change_count': 0,
+            'disagreement_count': 1,
+            'route_count': 2,
+        },
+    )
+
+
+def test__RateLimitBucketDiscovery__learn__split_bucket():
+    """
+    Tests whether ``RateLimitBucketDiscovery.learn`` works as intended.
+    
+    Case: Two routes of the same static group are discovered in different buckets, then one of them changes.
+    """
+    channel_id = 202510181003
+    group = RateLimitGroup(LIMITER_CHANNEL)
+    handler = RateLimitHandler(group, channel_id)
+    
+    bucket_discovery = RateLimitBucketDiscovery()
+    route_key_0 = bucket_discovery.get_route_key(handler, 'PATCH', f'https://discord.com/api/v10/channels/{channel_id}')
+    route_key_1 = bucket_discovery.get_route_key(handler, 'PUT', f'https://discord.com/api/v10/channels/{channel_id}')
+    
+    bucket_discovery.learn(route_key_0, _create_headers('pudding'))
+    bucket_discovery.learn(route_key_1, _create_headers('cake'))
+    
+    vampytest.assert_eq(bucket_discovery.agreement_count, 1)
+    vampytest.assert_eq(bucket_discovery.disagreement_count, 1)
+    
+    vampytest.assert_ne(
+        bucket_discovery.resolve(handler, route_key_0),
+        bucket_discovery.resolve(handler, route_key_1),
+    )
+    
+    # Same bucket again: no new learning
+    bucket_discovery.learn(route_key_1, _create_headers('cake'))
+    vampytest.assert_eq(bucket_discovery.change_count, 0)
+    
+    bucket_discovery.learn(route_key_1, _create_headers('pudding'))
+    vampytest.assert_eq(bucket_discovery.change_count, 1)
+    vampytest.assert_eq(bucket_discovery.agreement_count, 2)
+    
+    vampytest.assert_eq(
+        bucket_discovery.resolve(handler, route_key_0),
+        bucket_discovery.resolve(handler, route_key_1),
+    )
+
+
+def test__RateLimitBucketDiscovery__learn__route_count_max():
+    """
+    Tests whether ``RateLimitBucketDiscovery.learn`` works as intended.
+    
+    Case: Over the maximal route count, the earliest learnt route is forgotten with its bucket's group.
+    """
+    channel_id = 202510181004
+    group = RateLimitGroup(LIMITER_CHANNEL)
+    handler = RateLimitHandler(group, channel_id)
+    
+    bucket_discovery = RateLimitBucketDiscovery()
+    route_key_0 = bucket_discovery.get_route_key(handler, 'PATCH', f'https://discord.com/api/v10/channels/{channel_id}')
+    route_key_1 = bucket_discovery.get_route_key(handler, 'PUT', f'https://discord.com/api/v10/channels/{channel_id}')
+    
+    mocked = vampytest.mock_globals(RateLimitBucketDiscovery.learn, ROUTE_COUNT_MAX = 1)
+    
+    mocked(bucket_discovery, route_key_0, _create_headers('pudding'))
+    bucket_discovery.resolve(handler, route_key_0)
+    vampytest.assert_eq([*bucket_discovery.bucket_groups.keys()], [('pudding', LIMITER_CHANNEL)])
+    
+    mocked(bucket_discovery, route_key_1, _create_headers('cake'))
+    vampytest.assert_eq(bucket_discovery.route_buckets, {route_key_1: 'cake'})
+    vampytest.assert_eq(bucket_discovery.bucket_groups, {})
+    vampytest.assert_eq(bucket_discovery._bucket_static_groups, {'cake': {group: 1}})
+    vampytest.assert_eq(bucket_discovery._static_group_buckets, {group: {'cake': 1}})
+    
+    # The forgotten route does not count as disagreeing.
+    vampytest.assert_eq(bucket_discovery.disagreement_count, 0)
+    vampytest.assert_is(bucket_discovery.resolve(handler, route_key_0), handler)
@@ -0,0 +1,42 @@
+import vampytest
+from scarletio import Task, TaskGroup, skip_ready_cycle
+
+from ...core import KOKORO
+
+from ..rate_limit import RateLimitGroup, RateLimitHandler
+from ..request_priority import REQUEST_PRIORITY_BACKGROUND, REQUEST_PRIORITY_DEFAULT, REQUEST_PRIORITY_INTERACTION
+
+
+async def test__RateLimitHandler__enter__priority():
+    """
+    Tests whether ``RateLimitHandler.enter`` works as intended.
+    
+    Case: Waiting requests are started in the order of their priority.
+    
+    This function is a coroutine.
+    """
+    group = RateLimitGroup()
+    group.size = 1
+    handler = RateLimitHandler(group, 0)
+    entered = []
+    
+    async def enter(name, priority):
+        await handler.enter(priority)
+        entered.append(name)
+        handler.exit(None)
+    
+    # Occupy the handler, so every other request has to wait.
+    await handler.enter()
+    
+    tasks = [
+        Task(KOKORO, enter('background', REQUEST_PRIORITY_BACKGROUND)),
+        Task(KOKORO, enter('default', REQUEST_PRIORITY_DEFAULT)),
+        Task(KOKORO, enter('interaction', REQUEST_PRIORITY_INTERACTION)),
+    ]
+    await skip_ready_cycle()
+    vampytest.assert_eq(len(handler.queue), 3)
+    
+    handler.exit(None)
+    await TaskGroup(KOKORO, tasks).wait_all()
+    
+    vampytest.assert_eq(entered, ['interaction', 'default', 'background'])
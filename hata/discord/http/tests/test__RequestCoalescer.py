@@ -0,0 +1,163 @@
+import vampytest
+from scarletio import Future, IgnoreCaseMultiValueDictionary, Task, TaskGroup, skip_ready_cycle
+from scarletio.web_common.headers import METHOD_GET, METHOD_POST
+
+from ...core import KOKORO
+
+from ..request_coalescing import RequestCoalescer
+
+
+def _assert_fields_set(request_coalescer):
+    """
+    Asserts whether every attribute is set of the given request coalescer.
+    
+    Parameters
+    ----------
+    request_coalescer : ``RequestCoalescer``
+        The request coalescer to check.
+    """
+    vampytest.assert_instance(request_coalescer, RequestCoalescer)
+    vampytest.assert_instance(request_coalescer.coalesced_request_count, int)
+    vampytest.assert_instance(request_coalescer.in_flight, dict)
+    vampytest.assert_instance(request_coalescer.request_count, int)
+
+
+def test__RequestCoalescer__new():
+    """
+    Tests whether ``RequestCoalescer.__new__`` works as intended.
+    """
+    request_coalescer = RequestCoalescer()
+    _assert_fields_set(request_coalescer)
+
+
+def test__RequestCoalescer__repr():
+    """
+    Tests whether ``RequestCoalescer.__repr__`` works as intended.
+    """
+    request_coalescer = RequestCoalescer()
+    
+    output = repr(request_coalescer)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(request_coalescer).__name__, output)
+
+
+def _iter_options__get_request_key():
+    url = 'https://discord.com/api/v10/users/202510190010'
+    
+    yield METHOD_GET, url, None, None, None, (url, ())
+    yield METHOD_GET, url, None, {'limit': 100, 'after': '1'}, None, (url, (('after', '1'), ('limit', '100')))
+    yield METHOD_GET, url, None, [('limit', 100)], None, None
+    yield METHOD_GET, url, {}, None, None, None
+    yield METHOD_GET, url, None, None, IgnoreCaseMultiValueDictionary(), None
+    yield METHOD_POST, url, None, None, None, None
+
+
+@vampytest._(vampytest.call_from(_iter_options__get_request_key()).returning_last())
+def test__RequestCoalescer__get_request_key(method, url, data, query, headers):
+    """
+    Tests whether ``RequestCoalescer.get_request_key`` works as intended.
+    
+    Parameters
+    ----------
+    method : `str`
+        The method of the request.
+    url : `str`
+        The url to request.
+    data : `None | object`
+        Payload to request with.
+    query : `None | object`
+        Query string parameters.
+    headers : `None | IgnoreCaseMultiValueDictionary`
+        Headers to do the request with.
+    
+    Returns
+    -------
+    output : `None | tuple`
+    """
+    request_coalescer = RequestCoalescer()
+    return request_coalescer.get_request_key(method, url, data, query, headers)
+
+
+async def test__RequestCoalescer__request():
+    """
+    Tests whether ``RequestCoalescer.request`` works as intended.
+    
+    This function is a coroutine.
+    
+    Case: Concurrent requests are coalesced, later requests are not.
+    """
+    request_key = ('https://discord.com/api/v10/users/202510190011', ())
+    waiter = Future(KOKORO)
+    calls = []
+    
+    async def request_factory():
+        calls.append(None)
+        return await waiter
+    
+    request_coalescer = RequestCoalescer()
+    
+    tasks = [Task(KOKORO, request_coalescer.request(request_key, request_factory)) for counter in range(3)]
+    # Let the request tasks start, then the request itself.
+    await skip_ready_cycle()
+    await skip_ready_cycle()
+    
+    vampytest.assert_eq(len(calls), 1)
+    vampytest.assert_eq(len(request_coalescer.in_flight), 1)
+    
+    response_data = {'id': '202510190011'}
+    waiter.set_result(response_data)
+    await TaskGroup(KOKORO, tasks).wait_all()
+    
+    # Each coalesced request gets its own copy of the response data.
+    output_0, output_1, output_2 = [task.get_result() for task in tasks]
+    vampytest.assert_eq(output_0, response_data)
+    vampytest.assert_eq(output_1, response_data)
+    vampytest.assert_eq(output_2, response_data)
+    vampytest.assert_is_not(output_0, response_data)
+    vampytest.assert_is_not(output_0, output_1)
+    vampytest.assert_is_not(output_1, output_2)
+    
+    vampytest.assert_eq(len(request_coalescer.in_flight), 0)
+    vampytest.assert_eq(
+        request_coalescer.get_statistics(),
+        {
+            'coalesced_request_count': 2,
+            'in_flight_count': 0,
+            'request_count': 1,
+        },
+    )
+    
+    # Not coalesced requests are not copied.
+    waiter = Future(KOKORO)
+    waiter.set_result(response_data)
+    output = await request_coalescer.request(request_key, request_factory)
+    vampytest.assert_eq(len(calls), 2)
+    vampytest.assert_is(output, response_data)
+
+
+async def test__RequestCoalescer__request__cancel():
+    """
+    Tests whether ``RequestCoalescer.request`` works as intended.
+    
+    This function is a coroutine.
+    
+    Case: Cancelling a waiter does not cancel the request for the others.
+    """
+    request_key = ('https://discord.com/api/v10/users/202510190012', ())
+    waiter = Future(KOKORO)
+    
+    async def request_factory():
+        return await waiter
+    
+    request_coalescer = RequestCoalescer()
+    
+    task_0 = Task(KOKORO, request_coalescer.request(request_key, request_factory))
+    task_1 = Task(KOKORO, request_coalescer.request(request_key, request_factory))
+    await skip_ready_cycle()
+    
+    task_0.cancel()
+    await skip_ready_cycle()
+    
+    waiter.set_result(1)
+    vampytest.assert_eq(await task_1, 1)
+    vampytest.assert_true(task_0.is_cancelled())
@@ -0,0 +1,73 @@
+import vampytest
+from scarletio import Future
+
+from ...core import KOKORO
+
+from ..request_priority import (
+    REQUEST_PRIORITY_BACKGROUND, REQUEST_PRIORITY_DEFAULT, REQUEST_PRIORITY_INTERACTION, RequestPriorityQueue
+)
+
+
+def _assert_fields_set(request_priority_queue):
+    """
+    Asserts whether every attribute is set of the given request priority queue.
+    
+    Parameters
+    ----------
+    request_priority_queue : ``RequestPriorityQueue``
+        The request priority queue to check.
+    """
+    vampytest.assert_instance(request_priority_queue, RequestPriorityQueue)
+    vampytest.assert_instance(request_priority_queue._queues, tuple)
+
+
+def test__RequestPriorityQueue__new():
+    """
+    Tests whether ``RequestPriorityQueue.__new__`` works as intended.
+    """
+    request_priority_queue = RequestPriorityQueue()
+    _assert_fields_set(request_priority_queue)
+    
+    vampytest.assert_eq(len(request_priority_queue), 0)
+    vampytest.assert_false(request_priority_queue)
+
+
+def test__RequestPriorityQueue__repr():
+    """
+    Tests whether ``RequestPriorityQueue.__repr__`` works as intended.
+    """
+    request_priority_queue = RequestPriorityQueue()
+    request_priority_queue.append(Future(KOKORO), REQUEST_PRIORITY_INTERACTION)
+    
+    output = repr(request_priority_queue)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(request_priority_queue).__name__, output)
+    vampytest.assert_in('interaction = 1', output)
+
+
+def test__RequestPriorityQueue__popleft():
+    """
+    Tests whether ``RequestPriorityQueue.popleft`` works as intended.
+    """
+    future_0 = Future(KOKORO)
+    future_1 = Future(KOKORO)
+    future_2 = Future(KOKORO)
+    future_3 = Future(KOKORO)
+    
+    request_priority_queue = RequestPriorityQueue()
+    request_priority_queue.append(future_0, REQUEST_PRIORITY_BACKGROUND)
+    request_priority_queue.append(future_1)
+    request_priority_queue.append(future_2, REQUEST_PRIORITY_INTERACTION)
+    request_priority_queue.append(future_3, REQUEST_PRIORITY_DEFAULT)
+    
+    vampytest.assert_eq(len(request_priority_queue), 4)
+    vampytest.assert_true(request_priority_queue)
+    vampytest.assert_eq([*request_priority_queue], [future_2, future_1, future_3, future_0])
+    
+    vampytest.assert_is(request_priority_queue.popleft(), future_2)
+    vampytest.assert_is(request_priority_queue.popleft(), future_1)
+    vampytest.assert_is(request_priority_queue.popleft(), future_3)
+    vampytest.assert_is(request_priority_queue.popleft(), future_0)
+    
+    with vampytest.assert_raises(IndexError):
+        request_priority_queue.popleft()
@@ -0,0 +1,76 @@
+import vampytest
+
+from ..request_priority import REQUEST_PRIORITY_BACKGROUND, REQUEST_PRIORITY_INTERACTION, RequestQueueStatistics
+
+
+def _assert_fields_set(request_queue_statistics):
+    """
+    Asserts whether every attribute is set of the given request queue statistics.
+    
+    Parameters
+    ----------
+    request_queue_statistics : ``RequestQueueStatistics``
+        The request queue statistics to check.
+    """
+    vampytest.assert_instance(request_queue_statistics, RequestQueueStatistics)
+    vampytest.assert_instance(request_queue_statistics.maximal_waits, list)
+    vampytest.assert_instance(request_queue_statistics.request_counts, list)
+    vampytest.assert_instance(request_queue_statistics.total_waits, list)
+
+
+def test__RequestQueueStatistics__new():
+    """
+    Tests whether ``RequestQueueStatistics.__new__`` works as intended.
+    """
+    request_queue_statistics = RequestQueueStatistics()
+    _assert_fields_set(request_queue_statistics)
+
+
+def test__RequestQueueStatistics__repr():
+    """
+    Tests whether ``RequestQueueStatistics.__repr__`` works as intended.
+    """
+    request_queue_statistics = RequestQueueStatistics()
+    
+    output = repr(request_queue_statistics)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(request_queue_statistics).__name__, output)
+
+
+def test__RequestQueueStatistics__statistics():
+    """
+    Tests whether ``RequestQueueStatistics.record``, ``.get_statistics`` and ``.reset_statistics`` works as intended.
+    """
+    request_queue_statistics = RequestQueueStatistics()
+    request_queue_statistics.record(REQUEST_PRIORITY_INTERACTION, 0.5)
+    request_queue_statistics.record(REQUEST_PRIORITY_INTERACTION, 1.5)
+    request_queue_statistics.record(REQUEST_PRIORITY_BACKGROUND, 4.0)
+    
+    vampytest.assert_eq(
+        request_queue_statistics.get_statistics(),
+        {
+            'interaction': {
+                'average_wait': 1.0,
+                'maximal_wait': 1.5,
+                'request_count': 2,
+                'total_wait': 2.0,
+            },
+            'default': {
+                'average_wait': 0.0,
+                'maximal_wait': 0.0,
+                'request_count': 0,
+                'total_wait': 0.0,
+            },
+            'background': {
+                'average_wait': 4.0,
+                'maximal_wait': 4.0,
+                'request_count': 1,
+                'total_wait': 4.0,
+            },
+        },
+    )
+    
+    request_queue_statistics.reset_statistics()
+    vampytest.assert_eq(request_queue_statistics.request_counts, [0, 0, 0])
+    vampytest.assert_eq(request_queue_statistics.total_waits, [0.0, 0.0, 0.0])
+    vampytest.assert_eq(request_queue_statistics.maximal_waits, [0.0, 0.0, 0.0])
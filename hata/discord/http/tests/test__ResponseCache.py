@@ -0,0 +1,304 @@
+import vampytest
+from scarletio import IgnoreCaseMultiValueDictionary
+from scarletio.web_common.headers import METHOD_GET, METHOD_PATCH
+
+from .. import rate_limit_groups as RATE_LIMIT_GROUPS
+from ..rate_limit import RateLimitHandler
+from ..response_cache import (
+    RESPONSE_CACHE_GROUPS, RESPONSE_CACHE_GROUPS_CHANNEL, RESPONSE_CACHE_GROUPS_GUILD, RESPONSE_CACHE_GROUPS_GUILD_ALL,
+    RESPONSE_CACHE_GROUPS_GUILD_CHANNELS, RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS, RESPONSE_CACHE_GROUPS_GUILD_ROLES,
+    ResponseCache
+)
+
+
+def _assert_fields_set(response_cache):
+    """
+    Asserts whether every attribute is set of the given response cache.
+    
+    Parameters
+    ----------
+    response_cache : ``ResponseCache``
+        The response cache to check.
+    """
+    vampytest.assert_instance(response_cache, ResponseCache)
+    vampytest.assert_instance(response_cache.entries, dict)
+    vampytest.assert_instance(response_cache.generation, int)
+    vampytest.assert_instance(response_cache.hit_count, int)
+    vampytest.assert_instance(response_cache.invalidation_count, int)
+    vampytest.assert_instance(response_cache.miss_count, int)
+    vampytest.assert_instance(response_cache.purge_at, float)
+    vampytest.assert_instance(response_cache.time_to_live, float)
+
+
+def test__ResponseCache__new():
+    """
+    Tests whether ``ResponseCache.__new__`` works as intended.
+    """
+    time_to_live = 5.0
+    
+    response_cache = ResponseCache(time_to_live)
+    _assert_fields_set(response_cache)
+    
+    vampytest.assert_eq(response_cache.time_to_live, time_to_live)
+
+
+def test__ResponseCache__repr():
+    """
+    Tests whether ``ResponseCache.__repr__`` works as intended.
+    """
+    response_cache = ResponseCache(5.0)
+    
+    output = repr(response_cache)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(response_cache).__name__, output)
+    vampytest.assert_in('time_to_live = 5.0', output)
+
+
+def _iter_options__get_request_key():
+    guild_id = 202510190020
+    handler = RateLimitHandler(RATE_LIMIT_GROUPS.guild_get, guild_id)
+    url = f'https://discord.com/api/v10/guilds/{guild_id}'
+    
+    yield (
+        handler,
+        METHOD_GET,
+        url,
+        None,
+        {'with_counts': True},
+        None,
+        (RATE_LIMIT_GROUPS.guild_get, guild_id, url, (('with_counts', 'True'),)),
+    )
+    yield handler, METHOD_GET, url, None, None, None, (RATE_LIMIT_GROUPS.guild_get, guild_id, url, ())
+    yield handler, METHOD_PATCH, url, None, None, None, None
+    yield handler, METHOD_GET, url, None, None, IgnoreCaseMultiValueDictionary(), None
+    yield handler, METHOD_GET, url, None, [('with_counts', True)], None, None
+    yield RateLimitHandler(RATE_LIMIT_GROUPS.guild_edit, guild_id), METHOD_GET, url, None, None, None, None
+    
+    # Globally limited groups are keyed by the requested entity's identifier.
+    channel_id = 202510190025
+    url = f'https://discord.com/api/v10/channels/{channel_id}'
+    yield (
+        RateLimitHandler(RATE_LIMIT_GROUPS.channel_get, channel_id),
+        METHOD_GET,
+        url,
+        None,
+        None,
+        None,
+        (RATE_LIMIT_GROUPS.channel_get, channel_id, url, ()),
+    )
+    
+    url = f'https://discord.com/api/v10/guilds/{guild_id}/preview'
+    yield (
+        RateLimitHandler(RATE_LIMIT_GROUPS.guild_preview_get, guild_id),
+        METHOD_GET,
+        url,
+        None,
+        None,
+        None,
+        (RATE_LIMIT_GROUPS.guild_preview_get, guild_id, url, ()),
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options__get_request_key()).returning_last())
+def test__ResponseCache__get_request_key(handler, method, url, data, query, headers):
+    """
+    Tests whether ``ResponseCache.get_request_key`` works as intended.
+    
+    Parameters
+    ----------
+    handler : ``RateLimitHandler``, ``StackedStaticRateLimitHandler``
+        Rate limit handler for the request.
+    method : `str`
+        The method of the request.
+    url : `str`
+        The url to request.
+    data : `None | object`
+        Payload to request with.
+    query : `None | object`
+        Query string parameters.
+    headers : `None | IgnoreCaseMultiValueDictionary`
+        Headers to do the request with.
+    
+    Returns
+    -------
+    output : `None | tuple`
+    """
+    response_cache = ResponseCache(5.0)
+    return response_cache.get_request_key(handler, method, url, data, query, headers)
+
+
+def test__ResponseCache__get_put():
+    """
+    Tests whether ``ResponseCache.get`` and ``.put`` works as intended.
+    """
+    guild_id = 202510190021
+    request_key = (RATE_LIMIT_GROUPS.guild_get, guild_id, f'https://discord.com/api/v10/guilds/{guild_id}', ())
+    response_data = {'id': str(guild_id)}
+    
+    response_cache = ResponseCache(5.0)
+    vampytest.assert_is(response_cache.get(request_key), None)
+    
+    response_cache.put(request_key, response_data, response_cache.generation)
+    entry = response_cache.get(request_key)
+    vampytest.assert_is_not(entry, None)
+    vampytest.assert_eq(entry[1], response_data)
+    
+    # A copy is cached, so modifying the requester's response data does not affect it.
+    vampytest.assert_is_not(entry[1], response_data)
+    
+    vampytest.assert_eq(response_cache.hit_count, 1)
+    vampytest.assert_eq(response_cache.miss_count, 1)
+
+
+def test__ResponseCache__get__expired():
+    """
+    Tests whether ``ResponseCache.get`` works as intended.
+    
+    Case: Expired response.
+    """
+    guild_id = 202510190022
+    request_key = (RATE_LIMIT_GROUPS.guild_get, guild_id, f'https://discord.com/api/v10/guilds/{guild_id}', ())
+    
+    response_cache = ResponseCache(0.0)
+    response_cache.put(request_key, {}, response_cache.generation)
+    
+    vampytest.assert_is(response_cache.get(request_key), None)
+    vampytest.assert_eq(response_cache.entries, {})
+
+
+def test__ResponseCache__put__invalidated_since():
+    """
+    Tests whether ``ResponseCache.put`` works as intended.
+    
+    Case: Something was invalidated since the request was started.
+    """
+    guild_id = 202510190023
+    request_key = (RATE_LIMIT_GROUPS.guild_get, guild_id, f'https://discord.com/api/v10/guilds/{guild_id}', ())
+    
+    response_cache = ResponseCache(5.0)
+    generation = response_cache.generation
+    response_cache.invalidate(RESPONSE_CACHE_GROUPS_GUILD, guild_id)
+    response_cache.put(request_key, {}, generation)
+    
+    vampytest.assert_is(response_cache.get(request_key), None)
+
+
+def test__ResponseCache__invalidate():
+    """
+    Tests whether ``ResponseCache.invalidate`` works as intended.
+    """
+    guild_id = 202510190024
+    request_key_guild = (
+        RATE_LIMIT_GROUPS.guild_get, guild_id, f'https://discord.com/api/v10/guilds/{guild_id}', ()
+    )
+    request_key_roles = (
+        RATE_LIMIT_GROUPS.guild_role_get_all, guild_id, f'https://discord.com/api/v10/guilds/{guild_id}/roles', ()
+    )
+    request_key_channels = (
+        RATE_LIMIT_GROUPS.guild_channel_get_all, guild_id, f'https://discord.com/api/v10/guilds/{guild_id}/channels', ()
+    )
+    
+    response_cache = ResponseCache(5.0)
+    for request_key in (request_key_guild, request_key_roles, request_key_channels):
+        response_cache.put(request_key, {}, response_cache.generation)
+    
+    response_cache.invalidate(RESPONSE_CACHE_GROUPS_GUILD_ROLES, guild_id)
+    
+    vampytest.assert_is(response_cache.get(request_key_guild), None)
+    vampytest.assert_is(response_cache.get(request_key_roles), None)
+    vampytest.assert_is_not(response_cache.get(request_key_channels), None)
+    
+    vampytest.assert_eq(
+        response_cache.get_statistics(),
+        {
+            'entry_count': 1,
+            'hit_count': 1,
+            'invalidation_count': 2,
+            'miss_count': 2,
+        },
+    )
+
+
+def _iter_options__invalidate__per_group():
+    channel_id = 202510190026
+    guild_id = 202510190027
+    
+    yield (
+        RATE_LIMIT_GROUPS.channel_get,
+        channel_id,
+        f'https://discord.com/api/v10/channels/{channel_id}',
+        RESPONSE_CACHE_GROUPS_CHANNEL,
+    )
+    yield (
+        RATE_LIMIT_GROUPS.guild_channel_get_all,
+        guild_id,
+        f'https://discord.com/api/v10/guilds/{guild_id}/channels',
+        RESPONSE_CACHE_GROUPS_GUILD_CHANNELS,
+    )
+    
+    for groups in (
+        RESPONSE_CACHE_GROUPS_GUILD,
+        RESPONSE_CACHE_GROUPS_GUILD_ALL,
+        RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS,
+        RESPONSE_CACHE_GROUPS_GUILD_ROLES,
+    ):
+        yield RATE_LIMIT_GROUPS.guild_get, guild_id, f'https://discord.com/api/v10/guilds/{guild_id}', groups
+    
+    for groups in (
+        RESPONSE_CACHE_GROUPS_GUILD,
+        RESPONSE_CACHE_GROUPS_GUILD_ALL,
+        RESPONSE_CACHE_GROUPS_GUILD_EXPRESSIONS,
+    ):
+        yield (
+            RATE_LIMIT_GROUPS.guild_preview_get,
+            guild_id,
+            f'https://discord.com/api/v10/guilds/{guild_id}/preview',
+            groups,
+        )
+    
+    for groups in (RESPONSE_CACHE_GROUPS_GUILD_ALL, RESPONSE_CACHE_GROUPS_GUILD_ROLES):
+        yield (
+            RATE_LIMIT_GROUPS.guild_role_get_all,
+            guild_id,
+            f'https://discord.com/api/v10/guilds/{guild_id}/roles',
+            groups,
+        )
+    
+    for groups in (RESPONSE_CACHE_GROUPS_GUILD, RESPONSE_CACHE_GROUPS_GUILD_ALL):
+        yield (
+            RATE_LIMIT_GROUPS.welcome_screen_get,
+            guild_id,
+            f'https://discord.com/api/v10/guilds/{guild_id}/welcome-screen',
+            groups,
+        )
+
+
+@vampytest.call_from(_iter_options__invalidate__per_group())
+def test__ResponseCache__invalidate__per_group(group, entity_id, url, groups):
+    """
+    Tests whether ``ResponseCache.invalidate`` works as intended.
+    
+    Case: The response of the cached group is invalidated by the entity identifier the parsers invalidate with.
+    
+    Parameters
+    ----------
+    group : ``RateLimitGroup``
+        The cached rate limit group.
+    entity_id : `int`
+        The requested entity's identifier.
+    url : `str`
+        The requested url.
+    groups : `tuple<RateLimitGroup>`
+        The rate limit groups to invalidate.
+    """
+    vampytest.assert_in(group, RESPONSE_CACHE_GROUPS)
+    
+    response_cache = ResponseCache(5.0)
+    request_key = response_cache.get_request_key(RateLimitHandler(group, entity_id), METHOD_GET, url, None, None, None)
+    vampytest.assert_is_not(request_key, None)
+    
+    response_cache.put(request_key, {}, response_cache.generation)
+    vampytest.assert_is_not(response_cache.get(request_key), None)
+    
+    response_cache.invalidate(groups, entity_id)
+    vampytest.assert_is(response_cache.get(request_key), None)
@@ -0,0 +1,160 @@
+from collections import deque
+
+import vampytest
+from scarletio import Task, skip_ready_cycle
+
+from ...core import KOKORO
+from ...json_codecs import JsonCodec__standard
+
+from ..response_stream import ResponseStream
+
+
+class PayloadStreamStub:
+    """
+    Payload stream stub yielding the given chunks.
+    
+    Attributes
+    ----------
+    chunks : `list<bytes>`
+        The chunks to yield.
+    """
+    __slots__ = ('chunks',)
+    
+    def __new__(cls, chunks):
+        """
+        Creates a new payload stream stub.
+        
+        Parameters
+        ----------
+        chunks : `list<bytes>`
+            The chunks to yield.
+        """
+        self = object.__new__(cls)
+        self.chunks = chunks
+        return self
+    
+    
+    async def __aiter__(self):
+        """
+        Yields the chunks.
+        
+        This method is an async generator.
+        
+        Yields
+        ------
+        chunk : `bytes`
+        """
+        for chunk in self.chunks:
+            yield chunk
+
+
+class ResponseStub:
+    """
+    Response stub with a payload stream.
+    
+    Attributes
+    ----------
+    payload_stream : ``PayloadStreamStub``
+        The response's payload stream.
+    """
+    __slots__ = ('payload_stream',)
+    
+    def __new__(cls, chunks):
+        """
+        Creates a new response stub.
+        
+        Parameters
+        ----------
+        chunks : `list<bytes>`
+            The chunks of the response's body.
+        """
+        self = object.__new__(cls)
+        self.payload_stream = PayloadStreamStub(chunks)
+        return self
+
+
+def _assert_fields_set(response_stream):
+    """
+    Asserts whether every attribute is set of the given response stream.
+    
+    Parameters
+    ----------
+    response_stream : ``ResponseStream``
+        The response stream to check.
+    """
+    vampytest.assert_instance(response_stream, ResponseStream)
+    vampytest.assert_instance(response_stream._exception, BaseException, nullable = True)
+    vampytest.assert_instance(response_stream._items, deque)
+    vampytest.assert_is(response_stream._reader_waiter, None)
+    vampytest.assert_is(response_stream._writer_waiter, None)
+    vampytest.assert_instance(response_stream.buffer_limit, int)
+    vampytest.assert_instance(response_stream.done, bool)
+    vampytest.assert_instance(response_stream.item_count, int)
+    vampytest.assert_is(response_stream.json_codec, JsonCodec__standard)
+    vampytest.assert_instance(response_stream.started, bool)
+
+
+def test__ResponseStream__new():
+    """
+    Tests whether ``ResponseStream.__new__`` works as intended.
+    """
+    buffer_limit = 10
+    
+    response_stream = ResponseStream(JsonCodec__standard, buffer_limit)
+    _assert_fields_set(response_stream)
+    
+    vampytest.assert_eq(response_stream.buffer_limit, buffer_limit)
+    vampytest.assert_false(response_stream.done)
+    vampytest.assert_false(response_stream.started)
+
+
+def test__ResponseStream__repr():
+    """
+    Tests whether ``ResponseStream.__repr__`` works as intended.
+    """
+    response_stream = ResponseStream(JsonCodec__standard, 10)
+    
+    output = repr(response_stream)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(response_stream).__name__, output)
+
+
+async def test__ResponseStream__feed_response():
+    """
+    Tests whether ``ResponseStream.feed_response`` works as intended.
+    
+    This function is a coroutine.
+    """
+    response_stream = ResponseStream(JsonCodec__standard, 2)
+    response = ResponseStub([b'[{"id": 1', b'}, {"id": 2}, {"i', b'd": 3}, {"id": 4}]'])
+    
+    task = Task(KOKORO, response_stream.feed_response(response))
+    task.add_done_callback(response_stream)
+    
+    await skip_ready_cycle()
+    # The buffer is full, reading is paused.
+    vampytest.assert_true(response_stream.started)
+    vampytest.assert_false(task.is_done())
+    vampytest.assert_eq(response_stream.item_count, 2)
+    
+    output = [item async for item in response_stream]
+    vampytest.assert_eq(output, [{'id': 1}, {'id': 2}, {'id': 3}, {'id': 4}])
+    vampytest.assert_true(task.is_done())
+
+
+async def test__ResponseStream__set_exception():
+    """
+    Tests whether ``ResponseStream.set_exception`` works as intended.
+    
+    This function is a coroutine.
+    """
+    response_stream = ResponseStream(JsonCodec__standard, 10)
+    await response_stream.feed_items([1, 2])
+    response_stream.set_exception(ValueError())
+    
+    output = []
+    with vampytest.assert_raises(ValueError):
+        async for item in response_stream:
+            output.append(item)
+    
+    vampytest.assert_eq(output, [1, 2])
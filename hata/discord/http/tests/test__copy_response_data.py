@@ -0,0 +1,49 @@
+import vampytest
+
+from ..request_coalescing import copy_response_data
+
+
+def _iter_options():
+    yield None, None
+    yield b'aya', b'aya'
+    yield (
+        {'id': '202610210000', 'roles': [{'id': '202610210001'}]},
+        {'id': '202610210000', 'roles': [{'id': '202610210001'}]},
+    )
+    yield [{'id': '202610210002', 'flags': 2, 'nsfw': False}], [{'id': '202610210002', 'flags': 2, 'nsfw': False}]
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__copy_response_data(input_value):
+    """
+    Tests whether ``copy_response_data`` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Response data to copy.
+    
+    Returns
+    -------
+    output : `object`
+    """
+    output = copy_response_data(input_value)
+    if isinstance(input_value, (dict, list)):
+        vampytest.assert_is_not(output, input_value)
+    
+    return output
+
+
+def test__copy_response_data__nested():
+    """
+    Tests whether ``copy_response_data`` works as intended.
+    
+    Case: Modifying the nested data of the copy.
+    """
+    response_data = {'id': '202610210003', 'roles': [{'id': '202610210004'}]}
+    
+    output = copy_response_data(response_data)
+    output['roles'][0].pop('id')
+    output.pop('id')
+    
+    vampytest.assert_eq(response_data, {'id': '202610210003', 'roles': [{'id': '202610210004'}]})
@@ -0,0 +1,61 @@
+import vampytest
+
+from ..rate_limit_discovery import get_route_path
+
+
+def _iter_options():
+    yield (
+        'https://discord.com/api/v10/channels/202510180900/messages/202510180901',
+        'https://discord.com/api/v10/channels/{id}/messages/{id}',
+    )
+    yield (
+        'https://discord.com/api/v10/channels/202510180900/messages/202510180901/reactions/%F0%9F%98%80/@me',
+        'https://discord.com/api/v10/channels/{id}/messages/{id}/reactions/{emoji}/@me',
+    )
+    yield (
+        'https://discord.com/api/v10/channels/202510180900/messages/202510180901/reactions/pudding:202510180902',
+        'https://discord.com/api/v10/channels/{id}/messages/{id}/reactions/{emoji}',
+    )
+    yield (
+        'https://discord.com/api/v10/users/@me',
+        'https://discord.com/api/v10/users/@me',
+    )
+    yield (
+        'https://discord.com/api/v10/webhooks/202510180903/pudding.cake-token/messages/202510180904',
+        'https://discord.com/api/v10/webhooks/{id}/{token}/messages/{id}',
+    )
+    yield (
+        'https://discord.com/api/v10/interactions/202510180905/pudding.cake-token/callback',
+        'https://discord.com/api/v10/interactions/{id}/{token}/callback',
+    )
+    yield (
+        'https://discord.com/api/v10/invites/pudding',
+        'https://discord.com/api/v10/invites/{code}',
+    )
+    yield (
+        'https://discord.com/api/v10/guilds/templates/pudding',
+        'https://discord.com/api/v10/guilds/templates/{code}',
+    )
+    yield (
+        'https://discord.com/api/v10/channels/202510180900/messages?limit=100&before=202510180901',
+        'https://discord.com/api/v10/channels/{id}/messages',
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__get_route_path(url):
+    """
+    Tests whether ``get_route_path`` works as intended.
+    
+    Parameters
+    ----------
+    url : `str`
+        The url to get its route path of.
+    
+    Returns
+    -------
+    output : `str`
+    """
+    output = get_route_path(url)
+    vampytest.assert_instance(output, str)
+    return output
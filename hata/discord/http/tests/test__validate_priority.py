@@ -0,0 +1,47 @@
+import vampytest
+
+from ..request_priority import (
+    REQUEST_PRIORITY_BACKGROUND, REQUEST_PRIORITY_DEFAULT, REQUEST_PRIORITY_INTERACTION, validate_priority
+)
+
+
+def _iter_options__passing():
+    yield REQUEST_PRIORITY_INTERACTION, REQUEST_PRIORITY_INTERACTION
+    yield REQUEST_PRIORITY_DEFAULT, REQUEST_PRIORITY_DEFAULT
+    yield REQUEST_PRIORITY_BACKGROUND, REQUEST_PRIORITY_BACKGROUND
+
+
+def _iter_options__type_error():
+    yield 'a'
+    yield 1.0
+
+
+def _iter_options__value_error():
+    yield -1
+    yield 3
+
+
+@vampytest._(vampytest.call_from(_iter_options__passing()).returning_last())
+@vampytest._(vampytest.call_from(_iter_options__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__value_error()).raising(ValueError))
+def test__validate_priority(input_value):
+    """
+    Tests whether ``validate_priority`` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `object`
+        Value to validate.
+    
+    Returns
+    -------
+    output : `int`
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    output = validate_priority(input_value)
+    vampytest.assert_instance(output, int)
+    return output
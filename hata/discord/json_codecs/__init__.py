@@ -0,0 +1,48 @@
+from .array_decoder import *
+from .base import *
+from .codec_orjson import *
+from .codec_standard import *
+from .codec_ujson import *
+from .utils import *
+
+
+__all__ = (
+    *array_decoder.__all__,
+    *base.__all__,
+    *codec_orjson.__all__,
+    *codec_standard.__all__,
+    *codec_ujson.__all__,
+    *utils.__all__,
+)
+
+# Construct `AVAILABLE_JSON_CODECS` & select `JSON_CODEC`
+
+from ...env import JSON_CODEC_NAME
+
+from .codec_orjson import JsonCodec__orjson
+from .codec_standard import JsonCodec__standard
+from .codec_ujson import JsonCodec__ujson
+from .utils import select_json_codec
+
+
+AVAILABLE_JSON_CODECS = (*sorted(
+    (
+        json_codec for json_codec in
+        (
+            JsonCodec__orjson,
+            JsonCodec__standard,
+            JsonCodec__ujson,
+        )
+        if json_codec.available
+    ),
+    key = (lambda json_codec : json_codec.priority),
+    reverse = True,
+),)
+
+
+JSON_CODEC = select_json_codec(AVAILABLE_JSON_CODECS, JSON_CODEC_NAME)
+
+
+# Import `JsonCodecBase` to shorten imports
+
+from .base import JsonCodecBase
@@ -0,0 +1,260 @@
+__all__ = ('JsonArrayDecoder',)
+
+from re import compile as re_compile
+
+from scarletio import RichAttributeErrorBaseType
+
+
+NON_WHITESPACE_RP = re_compile(b'[^ \\t\\r\\n]')
+STRING_SPECIAL_RP = re_compile(b'["\\\\]')
+STRUCTURE_SPECIAL_RP = re_compile(b'["\\[\\]{},]')
+
+CHARACTER_BACKSLASH = ord('\\')
+CHARACTER_BRACE_OPEN = ord('{')
+CHARACTER_BRACKET_CLOSE = ord(']')
+CHARACTER_BRACKET_OPEN = ord('[')
+CHARACTER_COMMA = ord(',')
+CHARACTER_QUOTE = ord('"')
+
+STATE_BEFORE = 0
+STATE_INSIDE = 1
+STATE_AFTER = 2
+
+
+class JsonArrayDecoder(RichAttributeErrorBaseType):
+    """
+    Incrementally decodes a json array, returning its elements as soon as they are fully received.
+    
+    Only the element boundaries are searched for, the elements themselves are decoded by the json codec.
+    
+    Attributes
+    ----------
+    _depth : `int`
+        The current nesting depth. `1` directly inside of the array.
+    _element_parts : `list<bytes>`
+        The received parts of the current element.
+    _escaped : `bool`
+        Whether the last received byte was an escaping backslash inside of a string.
+    _in_string : `bool`
+        Whether the decoder is inside of a string.
+    item_count : `int`
+        The amount of decoded elements.
+    json_codec : `type<JsonCodecBase>`
+        The json codec to decode the elements with.
+    state : `int`
+        Whether the decoder is before, inside or after the array.
+    """
+    __slots__ = ('_depth', '_element_parts', '_escaped', '_in_string', 'item_count', 'json_codec', 'state')
+    
+    def __new__(cls, json_codec):
+        """
+        Creates a new json array decoder.
+        
+        Parameters
+        ----------
+        json_codec : `type<JsonCodecBase>`
+            The json codec to decode the elements with.
+        """
+        self = object.__new__(cls)
+        self._depth = 0
+        self._element_parts = []
+        self._escaped = False
+        self._in_string = False
+        self.item_count = 0
+        self.json_codec = json_codec
+        self.state = STATE_BEFORE
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the json array decoder's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' json_codec = ')
+        repr_parts.append(self.json_codec.name)
+        
+        repr_parts.append(', item_count = ')
+        repr_parts.append(repr(self.item_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def is_done(self):
+        """
+        Returns whether the whole array is decoded.
+        
+        Returns
+        -------
+        done : `bool`
+        """
+        return self.state == STATE_AFTER
+    
+    
+    def feed(self, data):
+        """
+        Feeds the next chunk of the json array to the decoder.
+        
+        Parameters
+        ----------
+        data : `bytes | memoryview`
+            The received chunk.
+        
+        Returns
+        -------
+        items : `list<object>`
+            The elements fully received with this chunk.
+        
+        Raises
+        ------
+        ValueError
+            - If the data is not a valid json array.
+        """
+        items = []
+        data = bytes(data)
+        position = 0
+        state = self.state
+        
+        if state == STATE_AFTER:
+            if (NON_WHITESPACE_RP.search(data) is not None):
+                raise ValueError('Extra data after the json array.')
+            
+            return items
+        
+        if state == STATE_BEFORE:
+            match = NON_WHITESPACE_RP.search(data)
+            if match is None:
+                return items
+            
+            position = match.start()
+            if data[position] != CHARACTER_BRACKET_OPEN:
+                raise ValueError(f'Expected a json array, got {data[position : position + 20]!r}.')
+            
+            position += 1
+            self._depth = 1
+            self.state = STATE_INSIDE
+        
+        element_start = position
+        depth = self._depth
+        in_string = self._in_string
+        
+        if self._escaped:
+            self._escaped = False
+            position += 1
+        
+        data_length = len(data)
+        
+        while True:
+            if in_string:
+                match = STRING_SPECIAL_RP.search(data, position)
+                if match is None:
+                    break
+                
+                position = match.end()
+                if data[position - 1] == CHARACTER_BACKSLASH:
+                    if position == data_length:
+                        self._escaped = True
+                        break
+                    
+                    position += 1
+                    continue
+                
+                in_string = False
+                continue
+            
+            match = STRUCTURE_SPECIAL_RP.search(data, position)
+            if match is None:
+                break
+            
+            position = match.end()
+            character = data[position - 1]
+            
+            if character == CHARACTER_QUOTE:
+                in_string = True
+                continue
+            
+            if (character == CHARACTER_BRACKET_OPEN) or (character == CHARACTER_BRACE_OPEN):
+                depth += 1
+                continue
+            
+            if character == CHARACTER_COMMA:
+                if depth == 1:
+                    self._finish_element(data[element_start : position - 1], items, False)
+                    element_start = position
+                continue
+            
+            # Closing bracket or brace
+            depth -= 1
+            if depth:
+                continue
+            
+            if character != CHARACTER_BRACKET_CLOSE:
+                raise ValueError('Mismatched closing brace.')
+            
+            self._finish_element(data[element_start : position - 1], items, True)
+            self._depth = 0
+            self._in_string = False
+            self.state = STATE_AFTER
+            
+            if (NON_WHITESPACE_RP.search(data, position) is not None):
+                raise ValueError('Extra data after the json array.')
+            
+            return items
+        
+        if element_start < data_length:
+            self._element_parts.append(data[element_start:])
+        
+        self._depth = depth
+        self._in_string = in_string
+        return items
+    
+    
+    def _finish_element(self, tail, items, last):
+        """
+        Decodes the current element.
+        
+        Parameters
+        ----------
+        tail : `bytes`
+            The last part of the element.
+        items : `list<object>`
+            List to add the decoded element to.
+        last : `bool`
+            Whether the element is closed by the end of the array.
+        
+        Raises
+        ------
+        ValueError
+            - If the element is empty or not a valid json.
+        """
+        element_parts = self._element_parts
+        if element_parts:
+            element_parts.append(tail)
+            element = b''.join(element_parts)
+            element_parts.clear()
+        else:
+            element = tail
+        
+        element = element.strip()
+        if not element:
+            # Empty array.
+            if last and (not self.item_count):
+                return
+            
+            raise ValueError('Empty json array element.')
+        
+        items.append(self.json_codec.decode(element))
+        self.item_count += 1
+    
+    
+    def close(self):
+        """
+        Called when no more data is received.
+        
+        Raises
+        ------
+        ValueError
+            - If the array is incomplete.
+        """
+        if self.state != STATE_AFTER:
+            raise ValueError('Incomplete json array.')
@@ -0,0 +1,81 @@
+__all__ = ()
+
+from scarletio import RichAttributeErrorBaseType
+
+
+class JsonCodecBase(RichAttributeErrorBaseType):
+    """
+    Base json codec.
+    
+    Json codecs are not instanced, their static methods are used directly.
+    
+    Class Attributes
+    ----------------
+    available : `bool` = `False`
+        Whether the codec's backend is installed.
+    name : `str` = `''`
+        The codec's name. Used when selecting it with the `HATA_JSON_CODEC` environmental variable.
+    priority : `int` = `0`
+        The codec's priority. When no codec is requested, the available one with the highest priority is used.
+    """
+    __slots__ = ()
+    
+    available = False
+    name = ''
+    priority = 0
+    
+    
+    def __new__(cls):
+        """
+        Json codecs are not instanced.
+        
+        Raises
+        ------
+        RuntimeError
+        """
+        raise RuntimeError(f'{cls.__name__} cannot be instanced.')
+    
+    
+    @staticmethod
+    def decode(data):
+        """
+        Decodes the given json data.
+        
+        Parameters
+        ----------
+        data : `bytes | str`
+            The data to decode. Passing it as `bytes` is preferred, since most codecs can decode it directly without an
+            intermediate utf-8 decoding.
+        
+        Returns
+        -------
+        value : `object`
+        
+        Raises
+        ------
+        ValueError
+            - If the given data is not a valid json.
+        """
+        raise NotImplementedError
+    
+    
+    @staticmethod
+    def encode(data):
+        """
+        Encodes the given value to json.
+        
+        Parameters
+        ----------
+        data : `object`
+            The value to encode.
+        
+        Returns
+        -------
+        json : `str`
+        
+        Raises
+        ------
+        TypeError
+            - If the given object is / or contains an object with a non convertible type.
+        """
+        raise NotImplementedError
@@ -0,0 +1,50 @@
+__all__ = ()
+
+from scarletio import to_json
+from scarletio.utils.json import added_json_serializer
+
+from .base import JsonCodecBase
+
+try:
+    from orjson import dumps as orjson_dumps, loads as orjson_loads
+except ImportError:
+    orjson_dumps = None
+    orjson_loads = None
+
+
+def orjson_encode(data):
+    """
+    Encodes the given value to json using `orjson`.
+    
+    Parameters
+    ----------
+    data : `object`
+        The value to encode.
+    
+    Returns
+    -------
+    json : `str`
+    
+    Raises
+    ------
+    TypeError
+        - If the given object is / or contains an object with a non convertible type.
+    """
+    return orjson_dumps(data, default = added_json_serializer).decode('utf-8')
+
+
+class JsonCodec__orjson(JsonCodecBase):
+    """
+    Json codec using `orjson`. Decodes `bytes` directly.
+    """
+    __slots__ = ()
+    
+    available = True if (orjson_loads is not None) else False
+    name = 'orjson'
+    priority = 2
+    
+    if (orjson_loads is not None):
+        decode = staticmethod(orjson_loads)
+        encode = staticmethod(orjson_encode)
+    else:
+        encode = staticmethod(to_json)
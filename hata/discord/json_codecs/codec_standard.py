@@ -0,0 +1,19 @@
+__all__ = ()
+
+from scarletio import from_json, to_json
+
+from .base import JsonCodecBase
+
+
+class JsonCodec__standard(JsonCodecBase):
+    """
+    Json codec using the standard library's `json` module.
+    """
+    __slots__ = ()
+    
+    available = True
+    name = 'standard'
+    priority = 0
+    
+    decode = staticmethod(from_json)
+    encode = staticmethod(to_json)
@@ -0,0 +1,29 @@
+__all__ = ()
+
+from scarletio import to_json
+
+from .base import JsonCodecBase
+
+try:
+    from ujson import loads as ujson_loads
+except ImportError:
+    ujson_loads = None
+
+
+class JsonCodec__ujson(JsonCodecBase):
+    """
+    Json codec using `ujson`. Decodes `bytes` directly.
+    
+    Encoding is done with the standard library, because `ujson` has no hook for serializing additional types
+    consistently across its versions.
+    """
+    __slots__ = ()
+    
+    available = True if (ujson_loads is not None) else False
+    name = 'ujson'
+    priority = 1
+    
+    if (ujson_loads is not None):
+        decode = staticmethod(ujson_loads)
+    
+    encode = staticmethod(to_json)
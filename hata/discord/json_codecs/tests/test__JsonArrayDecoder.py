@@ -0,0 +1,131 @@
+import vampytest
+
+from ..array_decoder import JsonArrayDecoder
+from ..codec_standard import JsonCodec__standard
+
+
+def _assert_fields_set(json_array_decoder):
+    """
+    Asserts whether every attribute is set of the given json array decoder.
+    
+    Parameters
+    ----------
+    json_array_decoder : ``JsonArrayDecoder``
+        The json array decoder to check.
+    """
+    vampytest.assert_instance(json_array_decoder, JsonArrayDecoder)
+    vampytest.assert_instance(json_array_decoder._depth, int)
+    vampytest.assert_instance(json_array_decoder._element_parts, list)
+    vampytest.assert_instance(json_array_decoder._escaped, bool)
+    vampytest.assert_instance(json_array_decoder._in_string, bool)
+    vampytest.assert_instance(json_array_decoder.item_count, int)
+    vampytest.assert_is(json_array_decoder.json_codec, JsonCodec__standard)
+    vampytest.assert_instance(json_array_decoder.state, int)
+
+
+def test__JsonArrayDecoder__new():
+    """
+    Tests whether ``JsonArrayDecoder.__new__`` works as intended.
+    """
+    json_array_decoder = JsonArrayDecoder(JsonCodec__standard)
+    _assert_fields_set(json_array_decoder)
+    
+    vampytest.assert_eq(json_array_decoder.item_count, 0)
+    vampytest.assert_false(json_array_decoder.is_done())
+
+
+def test__JsonArrayDecoder__repr():
+    """
+    Tests whether ``JsonArrayDecoder.__repr__`` works as intended.
+    """
+    json_array_decoder = JsonArrayDecoder(JsonCodec__standard)
+    
+    output = repr(json_array_decoder)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(json_array_decoder).__name__, output)
+
+
+def _iter_options__feed():
+    yield b'[]', 1, []
+    yield b'  [ ] \n', 1, []
+    yield b'[1, 2, 3]', 1, [1, 2, 3]
+    yield b'[1, 2, 3]', 2, [1, 2, 3]
+    yield b'[{"a": [1, {"b": "]"}]}, "}"]', 1, [{'a': [1, {'b': ']'}]}, '}']
+    yield b'["a\\"b", "c\\\\", ",[{"]', 1, ['a"b', 'c\\', ',[{']
+    yield b'[{"id": "1", "roles": []}, {"id": "2", "roles": ["3"]}]', 3, [
+        {'id': '1', 'roles': []},
+        {'id': '2', 'roles': ['3']},
+    ]
+
+
+@vampytest._(vampytest.call_from(_iter_options__feed()).returning_last())
+def test__JsonArrayDecoder__feed(data, chunk_size):
+    """
+    Tests whether ``JsonArrayDecoder.feed`` works as intended.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The json array to decode.
+    chunk_size : `int`
+        The size of the chunks to feed the data in.
+    
+    Returns
+    -------
+    output : `list<object>`
+    """
+    json_array_decoder = JsonArrayDecoder(JsonCodec__standard)
+    
+    output = []
+    for index in range(0, len(data), chunk_size):
+        output.extend(json_array_decoder.feed(memoryview(data)[index : index + chunk_size]))
+    
+    json_array_decoder.close()
+    vampytest.assert_true(json_array_decoder.is_done())
+    vampytest.assert_eq(json_array_decoder.item_count, len(output))
+    return output
+
+
+def test__JsonArrayDecoder__feed__early():
+    """
+    Tests whether ``JsonArrayDecoder.feed`` works as intended.
+    
+    Case: Elements are returned as soon as they are fully received.
+    """
+    json_array_decoder = JsonArrayDecoder(JsonCodec__standard)
+    
+    vampytest.assert_eq(json_array_decoder.feed(b'[{"a": 1}, {"b"'), [{'a': 1}])
+    vampytest.assert_eq(json_array_decoder.feed(b': 2}, '), [{'b': 2}])
+    vampytest.assert_eq(json_array_decoder.feed(b'3]'), [3])
+
+
+def _iter_options__feed__value_error():
+    yield b'{"a": 1}'
+    yield b'[1,]'
+    yield b'[1,,2]'
+    yield b'[,]'
+    yield b'[1}'
+    yield b'[1] 2'
+    yield b'[1'
+    yield b'["a]'
+
+
+@vampytest._(vampytest.call_from(_iter_options__feed__value_error()).raising(ValueError))
+def test__JsonArrayDecoder__feed__value_error(data):
+    """
+    Tests whether ``JsonArrayDecoder.feed`` and ``.close`` works as intended.
+    
+    Case: Invalid data.
+    
+    Parameters
+    ----------
+    data : `bytes`
+        The data to decode.
+    
+    Raises
+    ------
+    ValueError
+    """
+    json_array_decoder = JsonArrayDecoder(JsonCodec__standard)
+    json_array_decoder.feed(data)
+    json_array_decoder.close()
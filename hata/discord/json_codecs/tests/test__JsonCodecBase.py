@@ -0,0 +1,20 @@
+import vampytest
+
+from ..base import JsonCodecBase
+
+
+def test__JsonCodecBase__new():
+    """
+    Tests whether ``JsonCodecBase.__new__`` works as intended.
+    """
+    with vampytest.assert_raises(RuntimeError):
+        JsonCodecBase()
+
+
+def test__JsonCodecBase__class_attributes():
+    """
+    Tests whether ``JsonCodecBase``'s class attributes are set as intended.
+    """
+    vampytest.assert_instance(JsonCodecBase.available, bool)
+    vampytest.assert_instance(JsonCodecBase.name, str)
+    vampytest.assert_instance(JsonCodecBase.priority, int)
@@ -0,0 +1,145 @@
+from enum import Enum
+
+import vampytest
+
+from .. import AVAILABLE_JSON_CODECS, JSON_CODEC
+from ..base import JsonCodecBase
+from ..codec_orjson import JsonCodec__orjson
+from ..codec_standard import JsonCodec__standard
+from ..codec_ujson import JsonCodec__ujson
+
+
+class TestEnum(Enum):
+    koishi = 'satori'
+
+
+def _iter_json_codecs():
+    for json_codec in (JsonCodec__orjson, JsonCodec__standard, JsonCodec__ujson):
+        if json_codec.available:
+            yield json_codec
+
+
+def _iter_options__decode():
+    for json_codec in _iter_json_codecs():
+        yield (
+            json_codec,
+            b'{"op":0,"s":12,"t":"MESSAGE_CREATE","d":{"id":"202505100000","content":"koishi \xe3\x81\x93"}}',
+            {'op': 0, 's': 12, 't': 'MESSAGE_CREATE', 'd': {'id': '202505100000', 'content': 'koishi こ'}},
+        )
+        
+        yield (
+            json_codec,
+            '{"op":11,"d":null}',
+            {'op': 11, 'd': None},
+        )
+        
+        yield (
+            json_codec,
+            b'[1,2.5,true,false,null]',
+            [1, 2.5, True, False, None],
+        )
+
+
+@vampytest._(vampytest.call_from(_iter_options__decode()).returning_last())
+def test__JsonCodec__decode(json_codec, data):
+    """
+    Tests whether ``JsonCodec.decode`` works as intended.
+    
+    Parameters
+    ----------
+    json_codec : `type<JsonCodecBase>`
+        The json codec to test.
+    data : `bytes | str`
+        Data to decode.
+    
+    Returns
+    -------
+    output : `object`
+    """
+    return json_codec.decode(data)
+
+
+def _iter_options__decode__invalid():
+    for json_codec in _iter_json_codecs():
+        yield json_codec, b'{"op":'
+        yield json_codec, ''
+
+
+@vampytest._(vampytest.call_from(_iter_options__decode__invalid()))
+def test__JsonCodec__decode__invalid(json_codec, data):
+    """
+    Tests whether ``JsonCodec.decode`` works as intended.
+    
+    Case: invalid data.
+    
+    Parameters
+    ----------
+    json_codec : `type<JsonCodecBase>`
+        The json codec to test.
+    data : `bytes | str`
+        Data to decode.
+    """
+    with vampytest.assert_raises(ValueError):
+        json_codec.decode(data)
+
+
+def _iter_options__encode():
+    for json_codec in _iter_json_codecs():
+        yield (
+            json_codec,
+            {'op': 1, 'd': None},
+            {'op': 1, 'd': None},
+        )
+        
+        yield (
+            json_codec,
+            {'ids': {'202505100001'}, 'tuple': (1, 2), 'enum': TestEnum.koishi, 'float': 0.0},
+            {'ids': ['202505100001'], 'tuple': [1, 2], 'enum': 'satori', 'float': 0.0},
+        )
+        
+        yield (
+            json_codec,
+            {'content': 'koishi こ'},
+            {'content': 'koishi こ'},
+        )
+
+
+@vampytest._(vampytest.call_from(_iter_options__encode()).returning_last())
+def test__JsonCodec__encode(json_codec, data):
+    """
+    Tests whether ``JsonCodec.encode`` works as intended.
+    
+    Parameters
+    ----------
+    json_codec : `type<JsonCodecBase>`
+        The json codec to test.
+    data : `object`
+        Data to encode.
+    
+    Returns
+    -------
+    output : `object`
+        The encoded data decoded with the standard codec.
+    """
+    output = json_codec.encode(data)
+    vampytest.assert_instance(output, str)
+    return JsonCodec__standard.decode(output)
+
+
+def test__AVAILABLE_JSON_CODECS():
+    """
+    Tests whether ``AVAILABLE_JSON_CODECS`` is built as intended.
+    """
+    vampytest.assert_instance(AVAILABLE_JSON_CODECS, tuple)
+    vampytest.assert_in(JsonCodec__standard, AVAILABLE_JSON_CODECS)
+    
+    for json_codec in AVAILABLE_JSON_CODECS:
+        vampytest.assert_subtype(json_codec, JsonCodecBase)
+        vampytest.assert_true(json_codec.available)
+    
+    vampytest.assert_eq(
+        [json_codec.priority for json_codec in AVAILABLE_JSON_CODECS],
+        sorted((json_codec.priority for json_codec in AVAILABLE_JSON_CODECS), reverse = True),
+    )
+    
+    vampytest.assert_in(JSON_CODEC, AVAILABLE_JSON_CODECS)
@@ -0,0 +1,64 @@
+from warnings import catch_warnings, simplefilter
+
+import vampytest
+
+from ..codec_orjson import JsonCodec__orjson
+from ..codec_standard import JsonCodec__standard
+from ..codec_ujson import JsonCodec__ujson
+from ..utils import select_json_codec
+
+
+def _iter_options():
+    yield (
+        (JsonCodec__orjson, JsonCodec__ujson, JsonCodec__standard),
+        None,
+        JsonCodec__orjson,
+        False,
+    )
+    
+    yield (
+        (JsonCodec__orjson, JsonCodec__ujson, JsonCodec__standard),
+        'standard',
+        JsonCodec__standard,
+        False,
+    )
+    
+    yield (
+        (JsonCodec__ujson, JsonCodec__standard),
+        'orjson',
+        JsonCodec__ujson,
+        True,
+    )
+    
+    yield (
+        (JsonCodec__standard,),
+        'satori',
+        JsonCodec__standard,
+        True,
+    )
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__select_json_codec(json_codecs, name, expected_output):
+    """
+    Tests whether ``select_json_codec`` works as intended.
+    
+    Parameters
+    ----------
+    json_codecs : `tuple<type<JsonCodecBase>>`
+        The available json codecs ordered by priority.
+    name : `None | str`
+        The requested codec's name.
+    expected_output : `type<JsonCodecBase>`
+        The expected selected json codec.
+    
+    Returns
+    -------
+    warned : `bool`
+    """
+    with catch_warnings(record = True) as warnings:
+        simplefilter('always')
+        output = select_json_codec(json_codecs, name)
+    
+    vampytest.assert_is(output, expected_output)
+    return len(warnings) > 0
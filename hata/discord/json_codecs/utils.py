@@ -0,0 +1,35 @@
+__all__ = ()
+
+from warnings import warn
+
+
+def select_json_codec(json_codecs, name):
+    """
+    Selects the json codec to use.
+    
+    Parameters
+    ----------
+    json_codecs : `tuple<type<JsonCodecBase>>`
+        The available json codecs ordered by priority.
+    name : `None | str`
+        The requested codec's name.
+    
+    Returns
+    -------
+    json_codec : `type<JsonCodecBase>`
+    """
+    if name is not None:
+        for json_codec in json_codecs:
+            if json_codec.name == name:
+                return json_codec
+        
+        warn(
+            (
+                f'`HATA_JSON_CODEC` is given as {name!r}, but it is not available. '
+                f'Available codecs: {", ".join([json_codec.name for json_codec in json_codecs])}. '
+                f'Defaulting to {json_codecs[0].name!r}.'
+            ),
+            RuntimeWarning,
+        )
+    
+    return json_codecs[0]
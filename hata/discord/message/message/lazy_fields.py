@@ -0,0 +1,234 @@
+__all__ = ()
+
+from .fields import (
+    parse_attachments, parse_components, parse_embeds, parse_referenced_message, parse_resolved, parse_snapshots,
+    parse_stickers
+)
+
+
+def _parse_attachments(message, data):
+    """
+    Parses out the message's attachments.
+    
+    Parameters
+    ----------
+    message : ``Message``
+        The respective message.
+    data : `dict<str, object>`
+        Lazy message data.
+    
+    Returns
+    -------
+    attachments : ``None | tuple<Attachment>``
+    """
+    return parse_attachments(data)
+
+
+def _parse_components(message, data):
+    """
+    Parses out the message's components.
+    
+    Parameters
+    ----------
+    message : ``Message``
+        The respective message.
+    data : `dict<str, object>`
+        Lazy message data.
+    
+    Returns
+    -------
+    components : ``None | tuple<Component>``
+    """
+    return parse_components(data)
+
+
+def _parse_embeds(message, data):
+    """
+    Parses out the message's embeds.
+    
+    Parameters
+    ----------
+    message : ``Message``
+        The respective message.
+    data : `dict<str, object>`
+        Lazy message data.
+    
+    Returns
+    -------
+    embeds : ``None | tuple<Embed>``
+    """
+    return parse_embeds(data)
+
+
+def _parse_referenced_message(message, data):
+    """
+    Parses out the message's referenced message.
+    
+    Parameters
+    ----------
+    message : ``Message``
+        The respective message.
+    data : `dict<str, object>`
+        Lazy message data.
+    
+    Returns
+    -------
+    referenced_message : ``None | Message``
+    """
+    return parse_referenced_message(data)
+
+
+def _parse_resolved(message, data):
+    """
+    Parses out the message's resolved entities.
+    
+    Parameters
+    ----------
+    message : ``Message``
+        The respective message.
+    data : `dict<str, object>`
+        Lazy message data.
+    
+    Returns
+    -------
+    resolved : ``None | Resolved``
+    """
+    return parse_resolved(data, guild_id = message.guild_id)
+
+
+def _parse_snapshots(message, data):
+    """
+    Parses out the message's snapshots.
+    
+    Parameters
+    ----------
+    message : ``Message``
+        The respective message.
+    data : `dict<str, object>`
+        Lazy message data.
+    
+    Returns
+    -------
+    snapshots : ``None | tuple<MessageSnapshot>``
+    """
+    return parse_snapshots(data, message.guild_id)
+
+
+def _parse_stickers(message, data):
+    """
+    Parses out the message's stickers.
+    
+    Parameters
+    ----------
+    message : ``Message``
+        The respective message.
+    data : `dict<str, object>`
+        Lazy message data.
+    
+    Returns
+    -------
+    stickers : ``None | tuple<Sticker>``
+    """
+    return parse_stickers(data)
+
+
+# attribute name -> (payload keys, parser)
+# Every field defaults to `None` if none of its keys are present (or are empty).
+LAZY_FIELDS = {
+    'attachments': (('attachments',), _parse_attachments),
+    'components': (('components',), _parse_components),
+    'embeds': (('embeds',), _parse_embeds),
+    'referenced_message': (('referenced_message', 'message_reference'), _parse_referenced_message),
+    'resolved': (('resolved',), _parse_resolved),
+    'snapshots': (('message_snapshots',), _parse_snapshots),
+    'stickers': (('sticker_items',), _parse_stickers),
+}
+
+
+def set_lazy_fields(message, data):
+    """
+    Sets the lazy fields of the message. The fields without data are set to `None`, the others are removed, so they
+    are parsed out when they are accessed first. Only the data of these fields is kept.
+    
+    Parameters
+    ----------
+    message : ``Message``
+        The message to set the fields of.
+    data : `dict<str, object>`
+        Message data.
+    """
+    lazy_data = None
+    
+    for attribute_name, (keys, parser) in LAZY_FIELDS.items():
+        field_lazy_data = None
+        
+        for key in keys:
+            value = data.get(key, None)
+            if (value is not None) and value:
+                if field_lazy_data is None:
+                    field_lazy_data = {}
+                
+                field_lazy_data[key] = value
+        
+        if field_lazy_data is None:
+            setattr(message, attribute_name, None)
+            continue
+        
+        if lazy_data is None:
+            lazy_data = field_lazy_data
+        else:
+            lazy_data.update(field_lazy_data)
+        
+        # If the field was set before, remove it.
+        try:
+            delattr(message, attribute_name)
+        except AttributeError:
+            pass
+    
+    message._lazy_data = lazy_data
+
+
+def get_lazy_field(message, attribute_name):
+    """
+    Parses out the lazy field of the message. If all of the message's lazy fields are parsed, drops its lazy data.
+    
+    Parameters
+    ----------
+    message : ``Message``
+        The respective message.
+    attribute_name : `str`
+        The field's attribute name.
+    
+    Returns
+    -------
+    found : `bool`
+        Whether the field is a lazy one with data to parse.
+    value : `object`
+        The parsed value.
+    """
+    try:
+        keys, parser = LAZY_FIELDS[attribute_name]
+    except KeyError:
+        return False, None
+    
+    try:
+        lazy_data = message._lazy_data
+    except AttributeError:
+        return False, None
+    
+    if lazy_data is None:
+        return False, None
+    
+    value = parser(message, lazy_data)
+    setattr(message, attribute_name, value)
+    
+    for key in keys:
+        try:
+            del lazy_data[key]
+        except KeyError:
+            pass
+    
+    if not lazy_data:
+        message._lazy_data = None
+    
+    return True, value
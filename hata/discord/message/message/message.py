@@ -5,6 +5,7 @@ from scarletio import export, include
 from ...bases import DiscordEntity, id_sort_key
 from ...core import CHANNELS, GUILDS, MESSAGES
 from ...embed import EXTRA_EMBED_TYPES, Embed
+from ...field_setters import FieldSetter
 from ...emoji import ReactionMapping
 from ...http import urls as module_urls
 from ...poll import Poll
@@ -13,6 +14,8 @@ from ...role import create_partial_role_from_id
 from ...user import ClientUserBase, UserBase, ZEROUSER
 from ...utils import CHANNEL_MENTION_RP, DATETIME_FORMAT_CODE
 
+from ....env import MESSAGE_LAZY_FIELDS
+
 from .constants import (
     EMBED_UPDATE_EMBED_ADD, EMBED_UPDATE_EMBED_REMOVE, EMBED_UPDATE_NONE, EMBED_UPDATE_SIZE_UPDATE,
     MESSAGE_STATE_MASK_CACHE_ALL, MESSAGE_STATE_MASK_CACHE_MENTIONED_CHANNELS, MESSAGE_STATE_MASK_DELETED,
@@ -40,6 +43,7 @@ from .fields import (
     validate_soundboard_sounds, validate_stickers, validate_thread, validate_tts, validate_type
 )
 from .flags import MessageFlag
+from .lazy_fields import get_lazy_field, set_lazy_fields
 from .preinstanced import MESSAGE_DEFAULT_CONVERTER, MessageType
 from .utils import try_resolve_interaction_message
 
@@ -55,6 +59,39 @@ MESSAGE_TYPE_VALUES_WITH_CONTENT_FIELDS = frozenset((
 ))
 
 
+MESSAGE_FIELD_SETTER = FieldSetter(
+    'set_message_fields',
+    (
+        ('activity', parse_activity),
+        ('application', parse_application),
+        ('application_id', parse_application_id),
+        ('call', parse_call),
+        ('content', parse_content),
+        ('edited_at', parse_edited_at),
+        ('flags', parse_flags),
+        ('mentioned_channels_cross_guild', parse_mentioned_channels_cross_guild),
+        ('mentioned_everyone', parse_mentioned_everyone),
+        ('mentioned_role_ids', parse_mentioned_role_ids),
+        ('nonce', parse_nonce),
+        ('pinned', parse_pinned),
+        ('role_subscription', parse_role_subscription),
+        ('soundboard_sounds', parse_soundboard_sounds),
+        ('tts', parse_tts),
+    ),
+)
+
+# Used when `MESSAGE_LAZY_FIELDS` is disabled.
+MESSAGE_LAZY_FIELD_SETTER = FieldSetter(
+    'set_message_lazy_fields',
+    (
+        ('attachments', parse_attachments),
+        ('components', parse_components),
+        ('embeds', parse_embeds),
+        ('stickers', parse_stickers),
+    ),
+)
+
+
 PRECREATE_FIELDS = {
     'activity': ('activity', validate_activity),
     'application': ('application', validate_application),
@@ -227,13 +264,16 @@ class Message(DiscordEntity, immortal = True):
     Message instances are weakreferable.
     
     The `content`, `embeds`, `attachments` and the `components` fields are restricted for the message content intent.
+    
+    If `HATA_MESSAGE_LAZY_FIELDS` is enabled, the `attachments`, `components`, `embeds`, `referenced_message`,
+    `resolved`, `snapshots` and `stickers` fields are parsed out only when they are accessed first.
     """
     __slots__ = (
-        '_cache_mentioned_channels', '_state', 'activity', 'application', 'application_id', 'attachments', 'author',
-        'call', 'channel_id', 'components', 'content', 'edited_at', 'embeds', 'flags', 'guild_id', 'interaction',
-        'mentioned_channels_cross_guild', 'mentioned_everyone', 'mentioned_role_ids', 'mentioned_users', 'nonce',
-        'pinned', 'poll', 'reactions', 'referenced_message', 'resolved', 'role_subscription', 'snapshots',
-        'soundboard_sounds', 'stickers', 'thread', 'tts', 'type'
+        '_cache_mentioned_channels', '_lazy_data', '_state', 'activity', 'application', 'application_id',
+        'attachments', 'author', 'call', 'channel_id', 'components', 'content', 'edited_at', 'embeds', 'flags',
+        'guild_id', 'interaction', 'mentioned_channels_cross_guild', 'mentioned_everyone', 'mentioned_role_ids',
+        'mentioned_users', 'nonce', 'pinned', 'poll', 'reactions', 'referenced_message', 'resolved',
+        'role_subscription', 'snapshots', 'soundboard_sounds', 'stickers', 'thread', 'tts', 'type'
     )
     
     
@@ -800,39 +840,35 @@ class Message(DiscordEntity, immortal = True):
         self.author = parse_author(data, guild_id, channel_id)
         
         # Parse and set extra fields
-        self.activity = parse_activity(data)
-        self.application = parse_application(data)
-        self.application_id = parse_application_id(data)
-        self.attachments = parse_attachments(data)
-        self.call = parse_call(data)
-        self.components = parse_components(data)
-        self.content = parse_content(data)
-        self.edited_at = parse_edited_at(data)
-        self.embeds = parse_embeds(data)
-        self.flags = parse_flags(data)
+        MESSAGE_FIELD_SETTER.function(self, data)
         self.interaction = interaction = parse_interaction(data)
-        self.mentioned_channels_cross_guild = parse_mentioned_channels_cross_guild(data)
-        self.mentioned_everyone = parse_mentioned_everyone(data)
-        self.mentioned_role_ids = parse_mentioned_role_ids(data)
         self.mentioned_users = parse_mentioned_users(data, guild_id)
-        self.nonce = parse_nonce(data)
-        self.pinned = parse_pinned(data)
         self.poll = parse_poll(data, (None if creation else self.poll))
         self.reactions = parse_reactions(data, (None if creation else self.reactions))
-        self.referenced_message = parse_referenced_message(data)
-        self.resolved = parse_resolved(data, guild_id = guild_id)
-        self.role_subscription = parse_role_subscription(data)
-        self.snapshots = parse_snapshots(data, guild_id)
-        self.soundboard_sounds = parse_soundboard_sounds(data)
-        self.stickers = parse_stickers(data)
         self.thread = parse_thread(data, guild_id)
-        self.tts = parse_tts(data)
+        
+        if MESSAGE_LAZY_FIELDS:
+            set_lazy_fields(self, data)
+        else:
+            MESSAGE_LAZY_FIELD_SETTER.function(self, data)
+            self.referenced_message = parse_referenced_message(data)
+            self.resolved = parse_resolved(data, guild_id = guild_id)
+            self.snapshots = parse_snapshots(data, guild_id)
         
         # Postprocess
         if (interaction is not None):
             try_resolve_interaction_message(self, interaction)
     
     
+    def __getattr__(self, attribute_name):
+        """Parses out the message's lazy field if it is not yet parsed."""
+        found, value = get_lazy_field(self, attribute_name)
+        if found:
+            return value
+        
+        return DiscordEntity.__getattr__(self, attribute_name)
+    
+    
     def _late_init(self, data):
         """
         Some message fields might be missing after receiving a payload. This method is called to check and set those
@@ -0,0 +1,130 @@
+import vampytest
+
+from ....embed import Embed
+
+from ..fields import parse_attachments, parse_embeds, parse_stickers
+from ..lazy_fields import LAZY_FIELDS, get_lazy_field, set_lazy_fields
+from ..message import Message
+
+
+def _create_data():
+    """
+    Creates message data with lazy fields.
+    
+    Returns
+    -------
+    data : `dict<str, object>`
+    """
+    return {
+        'attachments': [{'id': '202510190071', 'filename': 'orin.png'}],
+        'components': [],
+        'content': 'Okuu',
+        'embeds': [{'title': 'Satori'}],
+        'sticker_items': [{'id': '202510190072', 'name': 'Koishi', 'format_type': 1}],
+    }
+
+
+def test__set_lazy_fields():
+    """
+    Tests whether ``set_lazy_fields`` works as intended.
+    """
+    message = Message._create_empty(202510190073, 202510190074, 202510190075)
+    data = _create_data()
+    
+    set_lazy_fields(message, data)
+    
+    vampytest.assert_eq(
+        message._lazy_data,
+        {
+            'attachments': data['attachments'],
+            'embeds': data['embeds'],
+            'sticker_items': data['sticker_items'],
+        },
+    )
+    
+    # Fields without data are set.
+    for attribute_name in ('components', 'referenced_message', 'resolved', 'snapshots'):
+        vampytest.assert_is(getattr(type(message), attribute_name).__get__(message, type(message)), None)
+    
+    # Fields with data are not.
+    for attribute_name in ('attachments', 'embeds', 'stickers'):
+        with vampytest.assert_raises(AttributeError):
+            getattr(type(message), attribute_name).__get__(message, type(message))
+
+
+def test__get_lazy_field():
+    """
+    Tests whether ``get_lazy_field`` works as intended.
+    """
+    message = Message._create_empty(202510190076, 202510190077, 202510190078)
+    data = _create_data()
+    
+    vampytest.assert_eq(get_lazy_field(message, 'embeds'), (False, None))
+    
+    set_lazy_fields(message, data)
+    
+    vampytest.assert_eq(get_lazy_field(message, 'content'), (False, None))
+    vampytest.assert_eq(get_lazy_field(message, 'embeds'), (True, parse_embeds(data)))
+    vampytest.assert_eq(message._lazy_data.keys(), {'attachments', 'sticker_items'})
+    vampytest.assert_eq(get_lazy_field(message, 'attachments'), (True, parse_attachments(data)))
+    vampytest.assert_eq(get_lazy_field(message, 'stickers'), (True, parse_stickers(data)))
+    vampytest.assert_is(message._lazy_data, None)
+
+
+def test__Message__lazy_fields__access():
+    """
+    Tests whether the lazy fields of ``Message`` are parsed out on access.
+    """
+    message = Message._create_empty(202510190079, 202510190080, 202510190081)
+    data = _create_data()
+    
+    set_lazy_fields(message, data)
+    
+    vampytest.assert_eq(message.embeds, (Embed(title = 'Satori'),))
+    vampytest.assert_eq(message.attachments, parse_attachments(data))
+    vampytest.assert_is(message.components, None)
+    vampytest.assert_eq(message.stickers, parse_stickers(data))
+    vampytest.assert_is(message._lazy_data, None)
+    
+    with vampytest.assert_raises(AttributeError):
+        message.orin
+
+
+def test__Message__lazy_fields__reset():
+    """
+    Tests whether the lazy fields of ``Message`` are reset when setting them again.
+    """
+    message = Message._create_empty(202510190082, 202510190083, 202510190084)
+    
+    set_lazy_fields(message, _create_data())
+    vampytest.assert_eq(message.embeds, (Embed(title = 'Satori'),))
+    
+    set_lazy_fields(message, {'embeds': [{'title': 'Koishi'}]})
+    vampytest.assert_eq(message.embeds, (Embed(title = 'Koishi'),))
+    vampytest.assert_is(message.attachments, None)
+    vampytest.assert_is(message.stickers, None)
+
+
+def test__Message__lazy_fields__difference_update_attributes():
+    """
+    Tests whether ``Message._difference_update_attributes`` returns the old values of not yet parsed lazy fields.
+    """
+    message = Message._create_empty(202510190085, 202510190086, 202510190087)
+    message._set_attributes({'id': str(message.id), 'content': 'Okuu'}, True)
+    set_lazy_fields(message, _create_data())
+    
+    old_attributes = message._difference_update_attributes({'content': 'Okuu', 'embeds': [{'title': 'Koishi'}]})
+    
+    vampytest.assert_eq(old_attributes.get('embeds', None), (Embed(title = 'Satori'),))
+    vampytest.assert_eq(message.embeds, (Embed(title = 'Koishi'),))
+    vampytest.assert_is(message.attachments, None)
+
+
+def test__LAZY_FIELDS__default():
+    """
+    Tests whether every lazy field defaults to `None` if there is no data for it.
+    """
+    message = Message._create_empty(202510190088, 202510190089, 202510190090)
+    
+    for attribute_name, (keys, parser) in LAZY_FIELDS.items():
+        vampytest.assert_is(parser(message, {}), None)
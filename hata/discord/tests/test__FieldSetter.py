@@ -0,0 +1,91 @@
+import vampytest
+
+from ..field_parsers import entity_id_parser_factory, nullable_string_parser_factory
+from ..field_setters import FieldSetter
+
+
+class Entity:
+    """
+    Entity to set fields to.
+    """
+
+
+def _assert_fields_set(field_setter):
+    """
+    Asserts whether every attribute is set of the given field setter.
+    
+    Parameters
+    ----------
+    field_setter : ``FieldSetter``
+        The field setter to check.
+    """
+    vampytest.assert_instance(field_setter, FieldSetter)
+    vampytest.assert_instance(field_setter.attribute_parsers, tuple)
+    vampytest.assert_instance(field_setter.name, str)
+
+
+def test__FieldSetter__new():
+    """
+    Tests whether ``FieldSetter.__new__`` works as intended.
+    """
+    name = 'set_fields'
+    attribute_parsers = (('id', entity_id_parser_factory('id')),)
+    
+    field_setter = FieldSetter(name, attribute_parsers)
+    _assert_fields_set(field_setter)
+    
+    vampytest.assert_eq(field_setter.name, name)
+    vampytest.assert_is(field_setter.attribute_parsers, attribute_parsers)
+    vampytest.assert_false(field_setter.is_compiled())
+
+
+def test__FieldSetter__repr():
+    """
+    Tests whether ``FieldSetter.__repr__`` works as intended.
+    """
+    name = 'set_fields'
+    attribute_parsers = (('id', entity_id_parser_factory('id')),)
+    
+    field_setter = FieldSetter(name, attribute_parsers)
+    
+    output = repr(field_setter)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(field_setter).__name__, output)
+    vampytest.assert_in(f'name = {name!r}', output)
+
+
+def test__FieldSetter__call():
+    """
+    Tests whether ``FieldSetter.__call__`` works as intended.
+    """
+    field_setter = FieldSetter(
+        'set_fields',
+        (
+            ('id', entity_id_parser_factory('id')),
+            ('name', nullable_string_parser_factory('name')),
+        ),
+    )
+    
+    entity = Entity()
+    field_setter(entity, {'id': '202510190060', 'name': 'Orin'})
+    vampytest.assert_true(field_setter.is_compiled())
+    vampytest.assert_eq(entity.id, 202510190060)
+    vampytest.assert_eq(entity.name, 'Orin')
+    
+    function = field_setter.function
+    field_setter(entity, {'name': ''})
+    vampytest.assert_is(field_setter.function, function)
+    vampytest.assert_eq(entity.id, 0)
+    vampytest.assert_is(entity.name, None)
+
+
+def test__FieldSetter__function():
+    """
+    Tests whether calling ``FieldSetter.function`` directly works as intended.
+    """
+    field_setter = FieldSetter('set_fields', (('id', entity_id_parser_factory('id')),))
+    
+    entity = Entity()
+    field_setter.function(entity, {'id': '202510190061'})
+    vampytest.assert_true(field_setter.is_compiled())
+    vampytest.assert_eq(entity.id, 202510190061)
@@ -0,0 +1,111 @@
+import vampytest
+
+from ..field_parsers import (
+    bool_parser_factory, default_date_time_parser_factory, default_entity_parser_factory,
+    entity_id_array_parser_factory, entity_id_parser_factory, field_parser_factory, flag_parser_factory,
+    float_parser_factory, force_string_parser_factory, int_parser_factory, int_postprocess_parser_factory,
+    negated_bool_parser_factory, nullable_date_time_parser_factory, nullable_entity_array_parser_factory,
+    nullable_entity_parser_factory, nullable_flag_parser_factory, nullable_functional_parser_factory,
+    nullable_int_parser_factory, nullable_object_array_parser_factory, nullable_string_parser_factory,
+    preinstanced_parser_factory
+)
+from ..field_setters import PARSER_TEMPLATES, compile_field_setter
+from ..message import Attachment, MessageFlag, MessageType
+from ..user import AvatarDecoration
+
+
+class Entity:
+    """
+    Entity to set fields to.
+    """
+
+
+def _iter_options():
+    yield entity_id_parser_factory('id'), [{}, {'id': None}, {'id': '202510190050'}]
+    yield (
+        entity_id_array_parser_factory('ids'),
+        [{}, {'ids': None}, {'ids': []}, {'ids': ['202510190052', '202510190051']}],
+    )
+    yield (
+        entity_id_array_parser_factory('ids', ordered = False),
+        [{}, {'ids': None}, {'ids': []}, {'ids': ['202510190052', '202510190051']}],
+    )
+    yield preinstanced_parser_factory('type', MessageType, MessageType.default), [{}, {'type': 19}]
+    yield bool_parser_factory('tts', True), [{}, {'tts': None}, {'tts': False}]
+    yield float_parser_factory('ratio', 1.5), [{}, {'ratio': 0.5}]
+    yield int_parser_factory('count', 0), [{}, {'count': 6}]
+    yield int_postprocess_parser_factory('count', 0, lambda value: value * 2), [{}, {'count': 6}]
+    yield flag_parser_factory('flags', MessageFlag), [{}, {'flags': None}, {'flags': 12}]
+    yield nullable_flag_parser_factory('flags', MessageFlag), [{}, {'flags': 12}]
+    yield negated_bool_parser_factory('enabled', False), [{}, {'enabled': False}, {'enabled': True}]
+    yield (
+        nullable_date_time_parser_factory('timestamp'),
+        [{}, {'timestamp': None}, {'timestamp': '2016-05-14T00:00:00.123000+00:00'}],
+    )
+    yield default_date_time_parser_factory('timestamp', 0), [{}, {'timestamp': '2016-05-14T00:00:00+00:00'}]
+    yield force_string_parser_factory('name'), [{}, {'name': None}, {'name': 'Orin'}]
+    yield field_parser_factory('value'), [{}, {'value': ''}, {'value': 'Orin'}, {'value': 12}]
+    yield nullable_string_parser_factory('name'), [{}, {'name': ''}, {'name': 'Orin'}]
+    yield nullable_int_parser_factory('count'), [{}, {'count': 6}]
+    yield (
+        nullable_entity_parser_factory('avatar_decoration_data', AvatarDecoration),
+        [{}, {'avatar_decoration_data': {'asset': 'a_' + '00' * 16, 'sku_id': '202510190053'}}],
+    )
+    yield (
+        default_entity_parser_factory('avatar_decoration_data', AvatarDecoration, default_factory = lambda: 0),
+        [{}, {'avatar_decoration_data': {'asset': 'a_' + '00' * 16, 'sku_id': '202510190054'}}],
+    )
+    yield (
+        nullable_entity_array_parser_factory('attachments', Attachment),
+        [{}, {'attachments': []}, {'attachments': [{'id': '202510190056'}, {'id': '202510190055'}]}],
+    )
+    yield (
+        nullable_object_array_parser_factory('attachments', Attachment),
+        [{}, {'attachments': []}, {'attachments': [{'id': '202510190058'}, {'id': '202510190057'}]}],
+    )
+    yield nullable_functional_parser_factory('count', lambda value: value + 1), [{}, {'count': 6}]
+
+
+@vampytest._(vampytest.call_from(_iter_options()))
+def test__compile_field_setter(parser, datas):
+    """
+    Tests whether ``compile_field_setter`` sets the same values as the parser returns.
+    
+    Parameters
+    ----------
+    parser : `FunctionType`
+        Parser to test with.
+    datas : `list<dict<str, object>>`
+        Payloads to test with.
+    """
+    function = compile_field_setter('set_fields', (('field_0', parser), ('field_1', parser)))
+    vampytest.assert_true(callable(function))
+    
+    for data in datas:
+        entity = Entity()
+        function(entity, data)
+        
+        expected_output = parser(data)
+        for output in (entity.field_0, entity.field_1):
+            vampytest.assert_eq(output, expected_output)
+            vampytest.assert_is(type(output), type(expected_output))
+
+
+def test__compile_field_setter__empty():
+    """
+    Tests whether ``compile_field_setter`` works as intended.
+    
+    Case: no fields.
+    """
+    function = compile_field_setter('set_fields', ())
+    
+    entity = Entity()
+    function(entity, {'id': '202510190059'})
+    vampytest.assert_eq(vars(entity), {})
+
+
+def test__PARSER_TEMPLATES():
+    """
+    Tests whether the parser templates are registered for each generated parser.
+    """
+    vampytest.assert_eq(len(PARSER_TEMPLATES), 17)
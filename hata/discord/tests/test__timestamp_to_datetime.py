@@ -0,0 +1,64 @@
+from datetime import datetime as DateTime, timezone as TimeZone
+
+import vampytest
+
+from ..utils import TIMESTAMP_CACHE, TIMESTAMP_CACHE_SIZE, timestamp_to_datetime, timestamp_to_datetime_soft
+
+
+def _iter_options():
+    yield '2019-04-28T15:14:38+00:00', DateTime(2019, 4, 28, 15, 14, 38, tzinfo = TimeZone.utc)
+    yield '2019-07-17T18:52:50.758993+00:00', DateTime(2019, 7, 17, 18, 52, 50, 758, tzinfo = TimeZone.utc)
+    yield '2019-07-17T18:52:50.758000+00:00', DateTime(2019, 7, 17, 18, 52, 50, 758, tzinfo = TimeZone.utc)
+    yield '2019-07-17T18:52:50.000999+00:00', DateTime(2019, 7, 17, 18, 52, 50, 0, tzinfo = TimeZone.utc)
+    # Formats parsed by the regex.
+    yield '2019-07-17T18:52:50+01:00', DateTime(2019, 7, 17, 18, 52, 50, tzinfo = TimeZone.utc)
+    yield '2019-07-17T18:52:50.758Z', DateTime(2019, 7, 17, 18, 52, 50, 758, tzinfo = TimeZone.utc)
+    yield '2019-07-17T18:52:50', DateTime(2019, 7, 17, 18, 52, 50, tzinfo = TimeZone.utc)
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__timestamp_to_datetime(input_value):
+    """
+    Tests whether ``timestamp_to_datetime`` works as intended.
+    
+    Parameters
+    ----------
+    input_value : `str`
+        Value to test with.
+    
+    Returns
+    -------
+    output : `DateTime`
+    """
+    TIMESTAMP_CACHE.clear()
+    
+    output = timestamp_to_datetime(input_value)
+    vampytest.assert_instance(output, DateTime)
+    vampytest.assert_is(output.tzinfo, TimeZone.utc)
+    vampytest.assert_is(timestamp_to_datetime(input_value), output)
+    return output
+
+
+def test__timestamp_to_datetime_soft__invalid():
+    """
+    Tests whether ``timestamp_to_datetime_soft`` works as intended.
+    
+    Case: invalid timestamp.
+    """
+    input_value = '2019-W01-1T18:52:50+00:00'
+    
+    output = timestamp_to_datetime_soft(input_value)
+    vampytest.assert_is(output, None)
+    vampytest.assert_not_in(input_value, TIMESTAMP_CACHE)
+
+
+def test__timestamp_to_datetime__cache_size():
+    """
+    Tests whether ``timestamp_to_datetime`` keeps its cache under its size limit.
+    """
+    TIMESTAMP_CACHE.clear()
+    
+    for index in range(TIMESTAMP_CACHE_SIZE + 1):
+        timestamp_to_datetime(f'2019-04-28T15:{index // 60 % 60:02}:{index % 60:02}+00:00')
+    
+    vampytest.assert_eq(len(TIMESTAMP_CACHE), 1)
@@ -2,6 +2,7 @@ from .constants import *
 from .fields import *
 from .flags import *
 from .guild_profile import *
+from .member_store import *
 from .utils import *
 
 
@@ -10,5 +11,6 @@ __all__ = (
     *fields.__all__,
     *flags.__all__,
     *guild_profile.__all__,
+    *member_store.__all__,
     *utils.__all__,
 )
@@ -5,6 +5,7 @@ from scarletio import include
 from ...bases import IconSlot, IconType, Slotted
 from ...color import Color
 from ...core import ROLES
+from ...field_setters import FieldSetter
 from ...http import urls as module_urls
 from ...utils import DISCORD_EPOCH_START
 
@@ -24,6 +25,19 @@ create_partial_role_from_id = include('create_partial_role_from_id')
 GUILD_PROFILE_AVATAR = IconSlot('avatar', 'avatar', None, None)
 GUILD_PROFILE_BANNER = IconSlot('banner', 'banner', None, None)
 
+GUILD_PROFILE_FIELD_SETTER = FieldSetter(
+    'set_guild_profile_fields',
+    (
+        ('avatar_decoration', parse_avatar_decoration),
+        ('boosts_since', parse_boosts_since),
+        ('flags', parse_flags),
+        ('nick', parse_nick),
+        ('pending', parse_pending),
+        ('role_ids', parse_role_ids),
+        ('timed_out_until', parse_timed_out_until),
+    ),
+)
+
 
 class GuildProfile(metaclass = Slotted):
     """
@@ -389,14 +403,8 @@ class GuildProfile(metaclass = Slotted):
             Received guild profile data.
         """
         self._set_avatar(data)
-        self.avatar_decoration = parse_avatar_decoration(data)
         self._set_banner(data)
-        self.boosts_since = parse_boosts_since(data)
-        self.flags = parse_flags(data)
-        self.nick = parse_nick(data)
-        self.pending = parse_pending(data)
-        self.role_ids = parse_role_ids(data)
-        self.timed_out_until = parse_timed_out_until(data)
+        GUILD_PROFILE_FIELD_SETTER.function(self, data)
     
     
     def _difference_update_attributes(self, data):
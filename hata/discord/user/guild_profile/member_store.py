@@ -0,0 +1,793 @@
+__all__ = ('GUILD_MEMBER_STORES', 'GuildMemberStore', 'GuildProfileMapping',)
+
+from array import array as Array
+from datetime import datetime as DateTime, timedelta as TimeDelta, timezone as TimeZone
+from sys import intern
+
+from scarletio import RichAttributeErrorBaseType
+
+from ...core import CLIENTS
+
+from ....env import MEMBER_STORE_THRESHOLD
+
+from .fields import (
+    parse_boosts_since, parse_flags, parse_joined_at, parse_nick, parse_pending, parse_role_ids,
+    parse_timed_out_until
+)
+from .flags import GuildProfileFlag
+from .guild_profile import GuildProfile
+
+
+GUILD_MEMBER_STORES = {}
+
+EPOCH = DateTime(1970, 1, 1, tzinfo = TimeZone.utc)
+ONE_MICROSECOND = TimeDelta(microseconds = 1)
+TIMESTAMP_NONE = -(1 << 63)
+
+# Guild profiles with these fields are not stored, they are rare and would need their own columns.
+NOT_STORED_KEYS = ('avatar', 'avatar_decoration_data', 'banner')
+
+
+def _datetime_to_timestamp(date_time):
+    """
+    Converts the given date time to microseconds since unix epoch.
+    
+    Parameters
+    ----------
+    date_time : `None | DateTime`
+        The date time to convert.
+    
+    Returns
+    -------
+    timestamp : `int`
+    """
+    if date_time is None:
+        return TIMESTAMP_NONE
+    
+    return (date_time - EPOCH) // ONE_MICROSECOND
+
+
+def _timestamp_to_datetime(timestamp):
+    """
+    Converts the given microseconds since unix epoch to date time.
+    
+    Parameters
+    ----------
+    timestamp : `int`
+        The timestamp to convert.
+    
+    Returns
+    -------
+    date_time : `None | DateTime`
+    """
+    if timestamp == TIMESTAMP_NONE:
+        return None
+    
+    return EPOCH + TimeDelta(microseconds = timestamp)
+
+
+class GuildMemberStore(RichAttributeErrorBaseType):
+    """
+    Stores the guild profiles of a guild's users in columns instead of ``GuildProfile`` instances.
+    
+    Every user has a row. Timestamps are stored as integers, nicks are interned and role identifiers are stored as an
+    index of their (shared) role set. Guild profiles with avatar, banner or avatar decoration are not stored.
+    
+    Guild profiles are created from their rows when they are accessed through ``GuildProfileMapping``, at which
+    point the row is removed, so the created profile can be updated as usual.
+    
+    Attributes
+    ----------
+    boosts_since : `array<int>`
+        Since when the users boost the guild in microseconds since unix epoch.
+    flags : `array<int>`
+        The guild profiles' flags.
+    free_rows : `list<int>`
+        Rows of the removed users to reuse.
+    guild_id : `int`
+        The guild's identifier.
+    joined_at : `array<int>`
+        When the users joined the guild in microseconds since unix epoch.
+    materialized_count : `int`
+        How much guild profiles were created from the store.
+    nicks : `list<None | str>`
+        The users' nicks.
+    pending : `bytearray`
+        Whether the users did not pass the guild's membership screening yet.
+    role_id_set_indexes : `dict<None | tuple<int>, int>`
+        Role set to index relation.
+    role_id_sets : `list<None | tuple<int>>`
+        The stored role sets.
+    role_sets : `array<int>`
+        The users' role set indexes.
+    rows : `dict<int, int>`
+        User identifier to row relation.
+    timed_out_until : `array<int>`
+        Till when the users are timed out in microseconds since unix epoch.
+    user_ids : `array<int>`
+        The stored users' identifiers. `0` for removed users.
+    """
+    __slots__ = (
+        'boosts_since', 'flags', 'free_rows', 'guild_id', 'joined_at', 'materialized_count', 'nicks', 'pending',
+        'role_id_set_indexes', 'role_id_sets', 'role_sets', 'rows', 'timed_out_until', 'user_ids'
+    )
+    
+    def __new__(cls, guild_id):
+        """
+        Creates a new guild member store.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The guild's identifier.
+        """
+        self = object.__new__(cls)
+        self.boosts_since = Array('q')
+        self.flags = Array('Q')
+        self.free_rows = []
+        self.guild_id = guild_id
+        self.joined_at = Array('q')
+        self.materialized_count = 0
+        self.nicks = []
+        self.pending = bytearray()
+        self.role_id_set_indexes = {None: 0}
+        self.role_id_sets = [None]
+        self.role_sets = Array('I')
+        self.rows = {}
+        self.timed_out_until = Array('q')
+        self.user_ids = Array('Q')
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the guild member store's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' guild_id = ')
+        repr_parts.append(repr(self.guild_id))
+        
+        repr_parts.append(', user_count = ')
+        repr_parts.append(repr(len(self.rows)))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def __len__(self):
+        """Returns how much users are stored."""
+        return len(self.rows)
+    
+    
+    def __contains__(self, user_id):
+        """Returns whether the user is stored."""
+        return user_id in self.rows
+    
+    
+    def store(self, user_id, data):
+        """
+        Stores the given guild profile data. If the user is already stored, updates its row.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The user's identifier.
+        data : `dict<str, object>`
+            Guild profile data.
+        
+        Returns
+        -------
+        stored : `bool`
+            Whether the guild profile could be stored.
+        """
+        for key in NOT_STORED_KEYS:
+            if (data.get(key, None) is not None):
+                return False
+        
+        row = self.rows.get(user_id, None)
+        if row is None:
+            joined_at = parse_joined_at(data)
+        else:
+            joined_at = _timestamp_to_datetime(self.joined_at[row])
+            if joined_at is None:
+                joined_at = parse_joined_at(data)
+        
+        self._set(
+            user_id,
+            joined_at,
+            parse_boosts_since(data),
+            parse_flags(data),
+            parse_nick(data),
+            parse_pending(data),
+            parse_role_ids(data),
+            parse_timed_out_until(data),
+        )
+        return True
+    
+    
+    def store_guild_profile(self, user_id, guild_profile):
+        """
+        Stores the given guild profile.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The user's identifier.
+        guild_profile : ``GuildProfile``
+            The guild profile to store.
+        
+        Returns
+        -------
+        stored : `bool`
+            Whether the guild profile could be stored.
+        """
+        if (
+            (guild_profile.avatar_decoration is not None) or
+            guild_profile.avatar_hash or
+            guild_profile.banner_hash
+        ):
+            return False
+        
+        self._set(
+            user_id,
+            guild_profile.joined_at,
+            guild_profile.boosts_since,
+            guild_profile.flags,
+            guild_profile.nick,
+            guild_profile.pending,
+            guild_profile.role_ids,
+            guild_profile.timed_out_until,
+        )
+        return True
+    
+    
+    def _set(self, user_id, joined_at, boosts_since, flags, nick, pending, role_ids, timed_out_until):
+        """
+        Sets the row of the given user.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The user's identifier.
+        joined_at : `None | DateTime`
+            When the user joined the guild.
+        boosts_since : `None | DateTime`
+            Since when the user boosts the guild.
+        flags : ``GuildProfileFlag``
+            The guild profile's flags.
+        nick : `None | str`
+            The user's nick.
+        pending : `bool`
+            Whether the user did not pass the guild's membership screening yet.
+        role_ids : `None | tuple<int>`
+            The user's roles' identifiers.
+        timed_out_until : `None | DateTime`
+            Till when the user is timed out.
+        """
+        role_set = self.role_id_set_indexes.get(role_ids, None)
+        if role_set is None:
+            role_set = len(self.role_id_sets)
+            self.role_id_sets.append(role_ids)
+            self.role_id_set_indexes[role_ids] = role_set
+        
+        if (nick is not None):
+            nick = intern(nick)
+        
+        row = self.rows.get(user_id, None)
+        if row is None:
+            free_rows = self.free_rows
+            if free_rows:
+                row = free_rows.pop()
+            else:
+                row = len(self.user_ids)
+                self.boosts_since.append(0)
+                self.flags.append(0)
+                self.joined_at.append(0)
+                self.nicks.append(None)
+                self.pending.append(0)
+                self.role_sets.append(0)
+                self.timed_out_until.append(0)
+                self.user_ids.append(0)
+            
+            self.rows[user_id] = row
+            self.user_ids[row] = user_id
+        
+        self.boosts_since[row] = _datetime_to_timestamp(boosts_since)
+        self.flags[row] = flags
+        self.joined_at[row] = _datetime_to_timestamp(joined_at)
+        self.nicks[row] = nick
+        self.pending[row] = pending
+        self.role_sets[row] = role_set
+        self.timed_out_until[row] = _datetime_to_timestamp(timed_out_until)
+    
+    
+    def get(self, user_id):
+        """
+        Creates the guild profile of the given user. The user's row is kept.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The user's identifier.
+        
+        Returns
+        -------
+        guild_profile : ``None | GuildProfile``
+        """
+        row = self.rows.get(user_id, None)
+        if row is None:
+            return None
+        
+        guild_profile = GuildProfile._create_empty()
+        guild_profile.boosts_since = _timestamp_to_datetime(self.boosts_since[row])
+        guild_profile.flags = GuildProfileFlag(self.flags[row])
+        guild_profile.joined_at = _timestamp_to_datetime(self.joined_at[row])
+        guild_profile.nick = self.nicks[row]
+        guild_profile.pending = bool(self.pending[row])
+        guild_profile.role_ids = self.role_id_sets[self.role_sets[row]]
+        guild_profile.timed_out_until = _timestamp_to_datetime(self.timed_out_until[row])
+        
+        self.materialized_count += 1
+        return guild_profile
+    
+    
+    def pop(self, user_id):
+        """
+        Creates the guild profile of the given user and removes its row.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The user's identifier.
+        
+        Returns
+        -------
+        guild_profile : ``None | GuildProfile``
+        """
+        guild_profile = self.get(user_id)
+        if (guild_profile is not None):
+            self.remove(user_id)
+        
+        return guild_profile
+    
+    
+    def remove(self, user_id):
+        """
+        Removes the row of the given user.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The user's identifier.
+        
+        Returns
+        -------
+        removed : `bool`
+        """
+        row = self.rows.pop(user_id, None)
+        if row is None:
+            return False
+        
+        self.user_ids[row] = 0
+        self.nicks[row] = None
+        self.free_rows.append(row)
+        return True
+    
+    
+    def iter_user_ids(self):
+        """
+        Iterates over the stored users' identifiers.
+        
+        This method is an iterable generator.
+        
+        Yields
+        ------
+        user_id : `int`
+        """
+        yield from self.rows.keys()
+    
+    
+    def compact(self, users):
+        """
+        Moves the created guild profiles of the given users back into the store.
+        
+        Parameters
+        ----------
+        users : `iterable<ClientUserBase>`
+            The users to compact the guild profiles of. Usually the guild's users.
+        
+        Returns
+        -------
+        compacted_count : `int`
+        """
+        guild_id = self.guild_id
+        compacted_count = 0
+        
+        for user in users:
+            guild_profiles = user.guild_profiles
+            if type(guild_profiles) is not GuildProfileMapping:
+                continue
+            
+            guild_profile = dict.get(guild_profiles, guild_id, None)
+            if guild_profile is None:
+                continue
+            
+            if not self.store_guild_profile(user.id, guild_profile):
+                continue
+            
+            dict.__delitem__(guild_profiles, guild_id)
+            compacted_count += 1
+        
+        return compacted_count
+    
+    
+    def get_statistics(self):
+        """
+        Returns the store's statistics.
+        
+        Returns
+        -------
+        statistics : `dict<str, int>`
+        """
+        return {
+            'free_row_count': len(self.free_rows),
+            'materialized_count': self.materialized_count,
+            'role_set_count': len(self.role_id_sets),
+            'row_count': len(self.user_ids),
+            'user_count': len(self.rows),
+        }
+
+
+class GuildProfileMapping(dict):
+    """
+    Guild identifier to guild profile mapping of a user, who has guild profiles in ``GuildMemberStore``-s too.
+    
+    Accessing a stored guild profile creates it and moves it into the mapping.
+    
+    Attributes
+    ----------
+    user_id : `int`
+        The user's identifier.
+    """
+    __slots__ = ('user_id',)
+    
+    def __init__(self, user_id, guild_profiles = None):
+        """
+        Creates a new guild profile mapping.
+        
+        Parameters
+        ----------
+        user_id : `int`
+            The user's identifier.
+        guild_profiles : `None | dict<int, GuildProfile>` = `None`, Optional
+            Guild profiles to start with.
+        """
+        if (guild_profiles is not None):
+            dict.__init__(self, guild_profiles)
+        
+        self.user_id = user_id
+    
+    
+    def __repr__(self):
+        """Returns the guild profile mapping's representation."""
+        repr_parts = [type(self).__name__, '(']
+        
+        repr_parts.append(dict.__repr__(self))
+        
+        stored_guild_ids = self._get_stored_guild_ids()
+        if stored_guild_ids:
+            repr_parts.append(', stored_guild_ids = ')
+            repr_parts.append(repr(stored_guild_ids))
+        
+        repr_parts.append(')')
+        return ''.join(repr_parts)
+    
+    
+    def _get_stored_guild_ids(self):
+        """
+        Returns the identifiers of the guilds, where the user's guild profile is stored.
+        
+        Returns
+        -------
+        stored_guild_ids : `list<int>`
+        """
+        user_id = self.user_id
+        return [guild_id for guild_id, member_store in GUILD_MEMBER_STORES.items() if user_id in member_store]
+    
+    
+    def _materialize(self, guild_id):
+        """
+        Creates the stored guild profile of the given guild and moves it into the mapping.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The guild's identifier.
+        
+        Returns
+        -------
+        guild_profile : ``None | GuildProfile``
+        """
+        member_store = GUILD_MEMBER_STORES.get(guild_id, None)
+        if member_store is None:
+            return None
+        
+        guild_profile = member_store.pop(self.user_id)
+        if (guild_profile is not None):
+            dict.__setitem__(self, guild_id, guild_profile)
+        
+        return guild_profile
+    
+    
+    def _materialize_all(self):
+        """
+        Creates every stored guild profile of the user and moves them into the mapping.
+        """
+        for guild_id in self._get_stored_guild_ids():
+            self._materialize(guild_id)
+    
+    
+    def __missing__(self, guild_id):
+        """Called by `__getitem__` if the guild profile is not in the mapping."""
+        guild_profile = self._materialize(guild_id)
+        if guild_profile is None:
+            raise KeyError(guild_id)
+        
+        return guild_profile
+    
+    
+    def get(self, guild_id, default = None):
+        """
+        Returns the guild profile for the given guild.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The guild's identifier.
+        default : `object` = `None`, Optional
+            Default value to return if the user has no guild profile in the guild.
+        
+        Returns
+        -------
+        guild_profile : ``GuildProfile | default``
+        """
+        guild_profile = dict.get(self, guild_id, None)
+        if guild_profile is None:
+            guild_profile = self._materialize(guild_id)
+            if guild_profile is None:
+                return default
+        
+        return guild_profile
+    
+    
+    def __contains__(self, guild_id):
+        """Returns whether the user has guild profile in the given guild."""
+        if dict.__contains__(self, guild_id):
+            return True
+        
+        member_store = GUILD_MEMBER_STORES.get(guild_id, None)
+        if member_store is None:
+            return False
+        
+        return self.user_id in member_store
+    
+    
+    def pop(self, guild_id, *default):
+        """
+        Removes and returns the guild profile for the given guild.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The guild's identifier.
+        *default : `object`
+            Default value to return if the user has no guild profile in the guild.
+        
+        Returns
+        -------
+        guild_profile : ``GuildProfile | default``
+        
+        Raises
+        ------
+        KeyError
+            - If the user has no guild profile in the guild and `default` is not given.
+        """
+        self._materialize(guild_id)
+        return dict.pop(self, guild_id, *default)
+    
+    
+    def __delitem__(self, guild_id):
+        """Removes the guild profile for the given guild."""
+        member_store = GUILD_MEMBER_STORES.get(guild_id, None)
+        if (member_store is not None) and member_store.remove(self.user_id):
+            dict.pop(self, guild_id, None)
+            return
+        
+        dict.__delitem__(self, guild_id)
+    
+    
+    def setdefault(self, guild_id, default = None):
+        """
+        Returns the guild profile for the given guild. If the user has no guild profile in it, sets `default`.
+        
+        Parameters
+        ----------
+        guild_id : `int`
+            The guild's identifier.
+        default : `object` = `None`, Optional
+            Value to set if the user has no guild profile in the guild.
+        
+        Returns
+        -------
+        guild_profile : ``GuildProfile | default``
+        """
+        self._materialize(guild_id)
+        return dict.setdefault(self, guild_id, default)
+    
+    
+    def keys(self):
+        """
+        Returns the guild identifiers, where the user has guild profile.
+        
+        Returns
+        -------
+        guild_ids : `list<int>`
+        """
+        return [*dict.keys(self), *self._get_stored_guild_ids()]
+    
+    
+    def __iter__(self):
+        """Iterates over the guild identifiers, where the user has guild profile."""
+        return iter(self.keys())
+    
+    
+    def __len__(self):
+        """Returns in how much guilds the user has guild profile."""
+        return dict.__len__(self) + len(self._get_stored_guild_ids())
+    
+    
+    def items(self):
+        """
+        Returns the guild identifier - guild profile pairs of the user. Creates every stored guild profile.
+        
+        Returns
+        -------
+        items : `dict_items`
+        """
+        self._materialize_all()
+        return dict.items(self)
+    
+    
+    def values(self):
+        """
+        Returns the guild profiles of the user. Creates every stored guild profile.
+        
+        Returns
+        -------
+        values : `dict_values`
+        """
+        self._materialize_all()
+        return dict.values(self)
+    
+    
+    def popitem(self):
+        """
+        Removes and returns a guild identifier - guild profile pair.
+        
+        Returns
+        -------
+        item : `(int, GuildProfile)`
+        
+        Raises
+        ------
+        KeyError
+            - If the user has no guild profiles.
+        """
+        self._materialize_all()
+        return dict.popitem(self)
+    
+    
+    def clear(self):
+        """
+        Removes every guild profile of the user.
+        """
+        user_id = self.user_id
+        for member_store in GUILD_MEMBER_STORES.values():
+            member_store.remove(user_id)
+        
+        dict.clear(self)
+    
+    
+    def copy(self):
+        """
+        Copies the mapping. Creates every stored guild profile.
+        
+        Returns
+        -------
+        new : `dict<int, GuildProfile>`
+        """
+        self._materialize_all()
+        return dict.copy(self)
+    
+    
+    def __eq__(self, other):
+        """Returns whether the two mappings are equal. Creates every stored guild profile."""
+        self._materialize_all()
+        return dict.__eq__(self, other)
+    
+    
+    def __ne__(self, other):
+        """Returns whether the two mappings are not equal. Creates every stored guild profile."""
+        self._materialize_all()
+        return dict.__ne__(self, other)
+    
+    
+    __hash__ = None
+
+
+def create_guild_member_store(guild_id, user_count, threshold = MEMBER_STORE_THRESHOLD):
+    """
+    Creates a member store for the given guild if it is large enough.
+    
+    Parameters
+    ----------
+    guild_id : `int`
+        The guild's identifier.
+    user_count : `int`
+        The guild's user count.
+    threshold : `int` = `MEMBER_STORE_THRESHOLD`, Optional
+        The minimal user count of a guild to have a member store. `0` to disable.
+    
+    Returns
+    -------
+    member_store : ``None | GuildMemberStore``
+    """
+    if (not threshold) or (user_count < threshold):
+        return None
+    
+    member_store = GUILD_MEMBER_STORES.get(guild_id, None)
+    if member_store is None:
+        member_store = GuildMemberStore(guild_id)
+        GUILD_MEMBER_STORES[guild_id] = member_store
+    
+    return member_store
+
+
+def store_guild_profile(user, guild_id, guild_profile_data):
+    """
+    Stores the guild profile of the user in the guild's member store if applicable.
+    
+    Parameters
+    ----------
+    user : ``ClientUserBase``
+        The user to store the guild profile of.
+    guild_id : `int`
+        The guild's identifier.
+    guild_profile_data : `dict<str, object>`
+        Guild profile data.
+    
+    Returns
+    -------
+    stored : `bool`
+        Whether the guild profile was stored. If not, it should be handled as usual.
+    """
+    member_store = GUILD_MEMBER_STORES.get(guild_id, None)
+    if member_store is None:
+        return False
+    
+    user_id = user.id
+    # Clients are accessing their own guild profiles all the time.
+    if user_id in CLIENTS:
+        return False
+    
+    guild_profiles = user.guild_profiles
+    # Already created, update it instead.
+    if dict.__contains__(guild_profiles, guild_id):
+        return False
+    
+    if not member_store.store(user_id, guild_profile_data):
+        return False
+    
+    if type(guild_profiles) is not GuildProfileMapping:
+        user.guild_profiles = GuildProfileMapping(user_id, guild_profiles)
+    
+    return True
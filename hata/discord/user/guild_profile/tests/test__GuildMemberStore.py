@@ -0,0 +1,217 @@
+from array import array as Array
+from datetime import datetime as DateTime, timezone as TimeZone
+
+import vampytest
+
+from ..flags import GuildProfileFlag
+from ..guild_profile import GuildProfile
+from ..member_store import GUILD_MEMBER_STORES, GuildMemberStore, create_guild_member_store
+
+
+def _assert_fields_set(member_store):
+    """
+    Asserts whether every attribute is set of the given guild member store.
+    
+    Parameters
+    ----------
+    member_store : ``GuildMemberStore``
+        The guild member store to check.
+    """
+    vampytest.assert_instance(member_store, GuildMemberStore)
+    vampytest.assert_instance(member_store.boosts_since, Array)
+    vampytest.assert_instance(member_store.flags, Array)
+    vampytest.assert_instance(member_store.free_rows, list)
+    vampytest.assert_instance(member_store.guild_id, int)
+    vampytest.assert_instance(member_store.joined_at, Array)
+    vampytest.assert_instance(member_store.materialized_count, int)
+    vampytest.assert_instance(member_store.nicks, list)
+    vampytest.assert_instance(member_store.pending, bytearray)
+    vampytest.assert_instance(member_store.role_id_set_indexes, dict)
+    vampytest.assert_instance(member_store.role_id_sets, list)
+    vampytest.assert_instance(member_store.role_sets, Array)
+    vampytest.assert_instance(member_store.rows, dict)
+    vampytest.assert_instance(member_store.timed_out_until, Array)
+    vampytest.assert_instance(member_store.user_ids, Array)
+
+
+def test__GuildMemberStore__new():
+    """
+    Tests whether ``GuildMemberStore.__new__`` works as intended.
+    """
+    guild_id = 202510190010
+    
+    member_store = GuildMemberStore(guild_id)
+    _assert_fields_set(member_store)
+    
+    vampytest.assert_eq(member_store.guild_id, guild_id)
+    vampytest.assert_eq(len(member_store), 0)
+
+
+def test__GuildMemberStore__repr():
+    """
+    Tests whether ``GuildMemberStore.__repr__`` works as intended.
+    """
+    guild_id = 202510190011
+    
+    member_store = GuildMemberStore(guild_id)
+    
+    output = repr(member_store)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(member_store).__name__, output)
+    vampytest.assert_in(f'guild_id = {guild_id!r}', output)
+
+
+def _iter_options__store():
+    yield {}
+    yield {
+        'communication_disabled_until': '2030-01-01T00:00:00+00:00',
+        'flags': int(GuildProfileFlag().update_by_keys(bypasses_verification = True)),
+        'joined_at': '2020-01-01T00:00:00.123456+00:00',
+        'nick': 'Orin',
+        'pending': True,
+        'premium_since': '2021-01-01T00:00:00+00:00',
+        'roles': ['202510190013', '202510190012'],
+    }
+
+
+@vampytest._(vampytest.call_from(_iter_options__store()))
+def test__GuildMemberStore__store(data):
+    """
+    Tests whether ``GuildMemberStore.store`` and ``.get`` works as intended.
+    
+    Parameters
+    ----------
+    data : `dict<str, object>`
+        Guild profile data.
+    """
+    user_id = 202510190014
+    
+    member_store = GuildMemberStore(202510190015)
+    output = member_store.store(user_id, data)
+    vampytest.assert_true(output)
+    vampytest.assert_in(user_id, member_store)
+    
+    guild_profile = member_store.get(user_id)
+    vampytest.assert_instance(guild_profile, GuildProfile)
+    vampytest.assert_eq(guild_profile, GuildProfile.from_data(data))
+    vampytest.assert_eq(guild_profile.joined_at, GuildProfile.from_data(data).joined_at)
+    
+    # Row is kept
+    vampytest.assert_in(user_id, member_store)
+
+
+def test__GuildMemberStore__store__not_stored():
+    """
+    Tests whether ``GuildMemberStore.store`` works as intended.
+    
+    Case: Guild profile with avatar.
+    """
+    user_id = 202510190016
+    
+    member_store = GuildMemberStore(202510190017)
+    output = member_store.store(user_id, {'avatar': 'a_' + '00' * 16})
+    vampytest.assert_false(output)
+    vampytest.assert_not_in(user_id, member_store)
+
+
+def test__GuildMemberStore__store__update():
+    """
+    Tests whether ``GuildMemberStore.store`` works as intended.
+    
+    Case: Updating a row keeps the join date and shares role sets.
+    """
+    user_id_0 = 202510190018
+    user_id_1 = 202510190019
+    role_ids = ['202510190020']
+    
+    member_store = GuildMemberStore(202510190021)
+    member_store.store(user_id_0, {'joined_at': '2020-01-01T00:00:00+00:00', 'roles': role_ids})
+    member_store.store(user_id_1, {'roles': role_ids})
+    member_store.store(user_id_0, {'nick': 'Okuu', 'roles': role_ids})
+    
+    guild_profile = member_store.get(user_id_0)
+    vampytest.assert_eq(guild_profile.joined_at, DateTime(2020, 1, 1, tzinfo = TimeZone.utc))
+    vampytest.assert_eq(guild_profile.nick, 'Okuu')
+    vampytest.assert_eq(guild_profile.role_ids, (202510190020,))
+    
+    vampytest.assert_eq(len(member_store), 2)
+    vampytest.assert_eq(len(member_store.role_id_sets), 2)
+
+
+def test__GuildMemberStore__pop():
+    """
+    Tests whether ``GuildMemberStore.pop`` and ``.remove`` works as intended.
+    """
+    user_id_0 = 202510190022
+    user_id_1 = 202510190023
+    
+    member_store = GuildMemberStore(202510190024)
+    member_store.store(user_id_0, {'nick': 'Orin'})
+    
+    guild_profile = member_store.pop(user_id_0)
+    vampytest.assert_eq(guild_profile, GuildProfile(nick = 'Orin'))
+    vampytest.assert_not_in(user_id_0, member_store)
+    vampytest.assert_is(member_store.pop(user_id_0), None)
+    vampytest.assert_false(member_store.remove(user_id_0))
+    
+    # Removed rows are reused
+    member_store.store(user_id_1, {})
+    vampytest.assert_eq(member_store.get_statistics()['row_count'], 1)
+
+
+def test__GuildMemberStore__get_statistics():
+    """
+    Tests whether ``GuildMemberStore.get_statistics`` works as intended.
+    """
+    member_store = GuildMemberStore(202510190025)
+    member_store.store(202510190026, {'roles': ['202510190027']})
+    member_store.store(202510190028, {})
+    member_store.remove(202510190028)
+    member_store.get(202510190026)
+    
+    vampytest.assert_eq(
+        member_store.get_statistics(),
+        {
+            'free_row_count': 1,
+            'materialized_count': 1,
+            'role_set_count': 2,
+            'row_count': 2,
+            'user_count': 1,
+        },
+    )
+
+
+def _iter_options__create_guild_member_store():
+    yield 100, 0, False
+    yield 100, 101, False
+    yield 100, 100, True
+
+
+@vampytest._(vampytest.call_from(_iter_options__create_guild_member_store()).returning_last())
+def test__create_guild_member_store(user_count, threshold):
+    """
+    Tests whether ``create_guild_member_store`` works as intended.
+    
+    Parameters
+    ----------
+    user_count : `int`
+        The guild's user count.
+    threshold : `int`
+        The minimal user count of a guild to have a member store.
+    
+    Returns
+    -------
+    created : `bool`
+    """
+    guild_id = 202510190029
+    
+    try:
+        output = create_guild_member_store(guild_id, user_count, threshold)
+        vampytest.assert_is(output, GUILD_MEMBER_STORES.get(guild_id, None))
+        
+        if (output is not None):
+            vampytest.assert_is(create_guild_member_store(guild_id, user_count, threshold), output)
+        
+        return (output is not None)
+    finally:
+        GUILD_MEMBER_STORES.pop(guild_id, None)
@@ -0,0 +1,185 @@
+import vampytest
+
+from ...user import User
+
+from ..guild_profile import GuildProfile
+from ..member_store import GUILD_MEMBER_STORES, GuildMemberStore, GuildProfileMapping, store_guild_profile
+
+
+def _assert_fields_set(guild_profile_mapping):
+    """
+    Asserts whether every attribute is set of the given guild profile mapping.
+    
+    Parameters
+    ----------
+    guild_profile_mapping : ``GuildProfileMapping``
+        The guild profile mapping to check.
+    """
+    vampytest.assert_instance(guild_profile_mapping, GuildProfileMapping)
+    vampytest.assert_instance(guild_profile_mapping.user_id, int)
+
+
+def test__GuildProfileMapping__new():
+    """
+    Tests whether ``GuildProfileMapping.__new__`` works as intended.
+    """
+    user_id = 202510190030
+    guild_id = 202510190031
+    guild_profile = GuildProfile(nick = 'Orin')
+    
+    guild_profile_mapping = GuildProfileMapping(user_id, {guild_id: guild_profile})
+    _assert_fields_set(guild_profile_mapping)
+    
+    vampytest.assert_eq(guild_profile_mapping.user_id, user_id)
+    vampytest.assert_eq(guild_profile_mapping, {guild_id: guild_profile})
+
+
+def test__GuildProfileMapping__repr():
+    """
+    Tests whether ``GuildProfileMapping.__repr__`` works as intended.
+    """
+    user_id = 202510190032
+    guild_id = 202510190033
+    
+    member_store = GuildMemberStore(guild_id)
+    member_store.store(user_id, {})
+    
+    GUILD_MEMBER_STORES[guild_id] = member_store
+    try:
+        guild_profile_mapping = GuildProfileMapping(user_id)
+        
+        output = repr(guild_profile_mapping)
+        vampytest.assert_instance(output, str)
+        vampytest.assert_in(type(guild_profile_mapping).__name__, output)
+        vampytest.assert_in(f'stored_guild_ids = {[guild_id]!r}', output)
+    finally:
+        GUILD_MEMBER_STORES.pop(guild_id, None)
+
+
+def test__GuildProfileMapping__access():
+    """
+    Tests whether ``GuildProfileMapping`` creates the stored guild profiles on access.
+    """
+    user_id = 202510190034
+    guild_id_0 = 202510190035
+    guild_id_1 = 202510190036
+    guild_id_2 = 202510190037
+    guild_profile_0 = GuildProfile(nick = 'Orin')
+    
+    member_store = GuildMemberStore(guild_id_1)
+    member_store.store(user_id, {'nick': 'Okuu'})
+    
+    GUILD_MEMBER_STORES[guild_id_1] = member_store
+    try:
+        guild_profile_mapping = GuildProfileMapping(user_id, {guild_id_0: guild_profile_0})
+        
+        vampytest.assert_eq(len(guild_profile_mapping), 2)
+        vampytest.assert_eq(sorted(guild_profile_mapping.keys()), [guild_id_0, guild_id_1])
+        vampytest.assert_eq(sorted(guild_profile_mapping), [guild_id_0, guild_id_1])
+        vampytest.assert_in(guild_id_1, guild_profile_mapping)
+        vampytest.assert_not_in(guild_id_2, guild_profile_mapping)
+        
+        # Checking containment should not create it.
+        vampytest.assert_in(user_id, member_store)
+        
+        vampytest.assert_is(guild_profile_mapping.get(guild_id_2), None)
+        
+        with vampytest.assert_raises(KeyError):
+            guild_profile_mapping[guild_id_2]
+        
+        guild_profile_1 = guild_profile_mapping[guild_id_1]
+        vampytest.assert_eq(guild_profile_1, GuildProfile(nick = 'Okuu'))
+        vampytest.assert_not_in(user_id, member_store)
+        vampytest.assert_is(guild_profile_mapping.get(guild_id_1), guild_profile_1)
+        vampytest.assert_eq(len(guild_profile_mapping), 2)
+    finally:
+        GUILD_MEMBER_STORES.pop(guild_id_1, None)
+
+
+def test__GuildProfileMapping__items():
+    """
+    Tests whether ``GuildProfileMapping.items`` and ``.values`` works as intended.
+    """
+    user_id = 202510190038
+    guild_id = 202510190039
+    
+    member_store = GuildMemberStore(guild_id)
+    member_store.store(user_id, {'nick': 'Okuu'})
+    
+    GUILD_MEMBER_STORES[guild_id] = member_store
+    try:
+        guild_profile_mapping = GuildProfileMapping(user_id)
+        
+        vampytest.assert_eq([*guild_profile_mapping.items()], [(guild_id, GuildProfile(nick = 'Okuu'))])
+        vampytest.assert_eq([*guild_profile_mapping.values()], [GuildProfile(nick = 'Okuu')])
+        vampytest.assert_not_in(user_id, member_store)
+    finally:
+        GUILD_MEMBER_STORES.pop(guild_id, None)
+
+
+def test__GuildProfileMapping__delete():
+    """
+    Tests whether ``GuildProfileMapping.__delitem__`` and ``.pop`` works as intended.
+    """
+    user_id = 202510190040
+    guild_id_0 = 202510190041
+    guild_id_1 = 202510190042
+    
+    member_store_0 = GuildMemberStore(guild_id_0)
+    member_store_0.store(user_id, {})
+    member_store_1 = GuildMemberStore(guild_id_1)
+    member_store_1.store(user_id, {'nick': 'Okuu'})
+    
+    GUILD_MEMBER_STORES[guild_id_0] = member_store_0
+    GUILD_MEMBER_STORES[guild_id_1] = member_store_1
+    try:
+        guild_profile_mapping = GuildProfileMapping(user_id)
+        
+        del guild_profile_mapping[guild_id_0]
+        vampytest.assert_not_in(guild_id_0, guild_profile_mapping)
+        vampytest.assert_not_in(user_id, member_store_0)
+        
+        with vampytest.assert_raises(KeyError):
+            del guild_profile_mapping[guild_id_0]
+        
+        vampytest.assert_eq(guild_profile_mapping.pop(guild_id_1), GuildProfile(nick = 'Okuu'))
+        vampytest.assert_not_in(guild_id_1, guild_profile_mapping)
+        vampytest.assert_not_in(user_id, member_store_1)
+        vampytest.assert_is(guild_profile_mapping.pop(guild_id_1, None), None)
+        
+        vampytest.assert_eq(len(guild_profile_mapping), 0)
+    finally:
+        GUILD_MEMBER_STORES.pop(guild_id_0, None)
+        GUILD_MEMBER_STORES.pop(guild_id_1, None)
+
+
+def test__store_guild_profile():
+    """
+    Tests whether ``store_guild_profile`` works as intended.
+    """
+    user_id = 202510190043
+    guild_id_0 = 202510190044
+    guild_id_1 = 202510190045
+    
+    user = User.precreate(user_id)
+    
+    vampytest.assert_false(store_guild_profile(user, guild_id_0, {}))
+    
+    member_store = GuildMemberStore(guild_id_0)
+    GUILD_MEMBER_STORES[guild_id_0] = member_store
+    try:
+        vampytest.assert_false(store_guild_profile(user, guild_id_0, {'avatar': 'a_' + '00' * 16}))
+        vampytest.assert_not_in(user_id, member_store)
+        
+        user.guild_profiles[guild_id_1] = GuildProfile()
+        
+        vampytest.assert_true(store_guild_profile(user, guild_id_0, {'nick': 'Okuu'}))
+        vampytest.assert_in(user_id, member_store)
+        vampytest.assert_instance(user.guild_profiles, GuildProfileMapping)
+        vampytest.assert_eq(sorted(user.guild_profiles.keys()), [guild_id_0, guild_id_1])
+        vampytest.assert_eq(user.get_guild_profile_for(guild_id_0), GuildProfile(nick = 'Okuu'))
+        
+        # Created guild profiles are not stored again.
+        vampytest.assert_false(store_guild_profile(user, guild_id_0, {'nick': 'Orin'}))
+    finally:
+        GUILD_MEMBER_STORES.pop(guild_id_0, None)
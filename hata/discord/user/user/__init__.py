@@ -7,6 +7,7 @@ from .matching import *
 from .helpers import *
 from .orin_user_base import *
 from .preinstanced import *
+from .presence_cache import *
 from .user import *
 from .user_base import *
 from .utils import *
@@ -22,6 +23,7 @@ __all__ = (
     *matching.__all__,
     *orin_user_base.__all__,
     *preinstanced.__all__,
+    *presence_cache.__all__,
     *user.__all__,
     *user_base.__all__,
     *utils.__all__,
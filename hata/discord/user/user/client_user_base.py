@@ -8,6 +8,7 @@ from ...color import Color
 from ...core import GUILDS, USERS
 
 from ..guild_profile import GuildProfile
+from ..guild_profile.member_store import GUILD_MEMBER_STORES, store_guild_profile
 
 from .fields import parse_id, validate_bot
 from .flags import UserFlag
@@ -226,9 +227,19 @@ class ClientUserBase(OrinUserBase):
     
     @copy_docs(OrinUserBase._update_profile)
     def _update_profile(self, data, guild):
-        guild_profile = self.guild_profiles.get(guild.id, None)
+        guild_id = guild.id
+        if (guild_id in GUILD_MEMBER_STORES):
+            # Update the stored guild profile without creating it.
+            existed = guild_id in self.guild_profiles
+            if store_guild_profile(self, guild_id, data):
+                if not existed:
+                    guild.users[self.id] = self
+                
+                return existed
+        
+        guild_profile = self.guild_profiles.get(guild_id, None)
         if guild_profile is None:
-            self.guild_profiles[guild.id] = GuildProfile.from_data(data)
+            self.guild_profiles[guild_id] = GuildProfile.from_data(data)
             guild.users[self.id] = self
             return False
         
@@ -4,6 +4,8 @@ from itertools import count
 
 from scarletio import copy_docs
 
+from ....env import PRESENCE_FAST_PATH, PRESENCE_STATUS_ONLY
+
 from ...activity import Activity, ActivityType
 
 from ..activity_change import ActivityChange
@@ -15,11 +17,57 @@ from .fields import (
 )
 from .flags import UserFlag
 from .preinstanced import Status
+from .presence_cache import PRESENCE_CACHE
 
 
 ACTIVITY_TYPE_CUSTOM = ActivityType.custom
 
 
+if PRESENCE_STATUS_ONLY:
+    def _parse_activities(data):
+        """
+        Activities are not stored if `HATA_PRESENCE_STATUS_ONLY` is enabled.
+        
+        Parameters
+        ----------
+        data : `dict<str, object>`
+            User presence data.
+        
+        Returns
+        -------
+        activities : `None`
+        """
+        return None
+    
+    create_activity = Activity.from_data
+
+elif PRESENCE_FAST_PATH:
+    def _parse_activities(data):
+        """
+        Parses the activities out from the given presence data. Equal activities are shared between users.
+        
+        Parameters
+        ----------
+        data : `dict<str, object>`
+            User presence data.
+        
+        Returns
+        -------
+        activities : `None | list<Activity>`
+        """
+        activity_datas = data.get('activities', None)
+        if (activity_datas is None) or (not activity_datas):
+            return None
+        
+        return [create_activity(activity_data) for activity_data in activity_datas]
+    
+    create_activity = PRESENCE_CACHE.create_activity
+
+else:
+    _parse_activities = parse_activities
+    create_activity = Activity.from_data
+
+
 class ClientUserPBase(ClientUserBase):
     """
     Base class for discord users and clients. This class is used as ``User`` superclass only if presence is enabled,
@@ -229,7 +277,7 @@ class ClientUserPBase(ClientUserBase):
     
     @copy_docs(ClientUserBase._update_presence)
     def _update_presence(self, data):
-        self.activities = parse_activities(data)
+        self.activities = _parse_activities(data)
         self.status = parse_status(data)
         self.statuses = parse_statuses(data)
     
@@ -248,6 +296,9 @@ class ClientUserPBase(ClientUserBase):
             old_attributes['status'] = self.status
             self.status = status
         
+        if PRESENCE_STATUS_ONLY:
+            return old_attributes
+        
         activity_datas = data['activities']
         
         old_activities = self.activities
@@ -256,7 +307,7 @@ class ClientUserPBase(ClientUserBase):
         if activity_datas:
             if old_activities is None:
                 for activity_data in activity_datas:
-                    activity = Activity.from_data(activity_data)
+                    activity = create_activity(activity_data)
                     
                     if new_activities is None:
                         new_activities = []
@@ -283,7 +334,16 @@ class ClientUserPBase(ClientUserBase):
                         
                         del removed_activities[index]
                         
-                        activity_old_attributes = activity._difference_update_attributes(activity_data)
+                        # Shared activities are not updated in place.
+                        if PRESENCE_FAST_PATH:
+                            new_activity = activity.copy()
+                            activity_old_attributes = new_activity._difference_update_attributes(activity_data)
+                            if activity_old_attributes:
+                                activity = PRESENCE_CACHE.share_activity(new_activity)
+                        
+                        else:
+                            activity_old_attributes = activity._difference_update_attributes(activity_data)
+                        
                         if activity_old_attributes:
                             activity_update = ActivityUpdate.from_fields(activity, activity_old_attributes)
                             
@@ -298,7 +358,7 @@ class ClientUserPBase(ClientUserBase):
                         new_activities.append(activity)
                         break
                     else:
-                        activity = Activity.from_data(activity_data)
+                        activity = create_activity(activity_data)
                         
                         if new_activities is None:
                             new_activities = []
@@ -3,6 +3,7 @@ __all__ = ('OrinUserBase',)
 from scarletio import copy_docs
 
 from ...bases import ICON_TYPE_NONE
+from ...field_setters import FieldSetter
 
 from .fields import (
     parse_avatar_decoration, parse_banner_color, parse_discriminator, parse_display_name, parse_flags,
@@ -13,6 +14,19 @@ from .flags import UserFlag
 from .user_base import USER_BANNER, UserBase
 
 
+ORIN_USER_FIELD_SETTER = FieldSetter(
+    'set_orin_user_fields',
+    (
+        ('avatar_decoration', parse_avatar_decoration),
+        ('banner_color', parse_banner_color),
+        ('discriminator', parse_discriminator),
+        ('display_name', parse_display_name),
+        ('flags', parse_flags),
+        ('primary_guild_badge', parse_primary_guild_badge),
+    ),
+)
+
+
 class OrinUserBase(UserBase):
     """
     Base class for actual user entities, like oauth2 user and normal users.
@@ -173,13 +187,8 @@ class OrinUserBase(UserBase):
     def _update_attributes(self, data):
         UserBase._update_attributes(self, data)
         
-        self.avatar_decoration = parse_avatar_decoration(data)
         self._set_banner(data)
-        self.banner_color = parse_banner_color(data)
-        self.discriminator = parse_discriminator(data)
-        self.display_name = parse_display_name(data)
-        self.flags = parse_flags(data)
-        self.primary_guild_badge = parse_primary_guild_badge(data)
+        ORIN_USER_FIELD_SETTER.function(self, data)
         
     
     @copy_docs(UserBase._difference_update_attributes)
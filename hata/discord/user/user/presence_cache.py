@@ -0,0 +1,297 @@
+__all__ = ('PRESENCE_CACHE', 'PresenceCache',)
+
+from marshal import dumps as marshal_dump
+
+from scarletio import RichAttributeErrorBaseType
+
+from ....env import PRESENCE_STATUS_ONLY
+
+from ...activity import Activity
+
+from .preinstanced import Status
+
+
+ACTIVITY_CACHE_SIZE = 4096
+
+
+class PresenceCache(RichAttributeErrorBaseType):
+    """
+    Stores the hash of the users' last received presence data and shares equal activities between users.
+    
+    Used only if `HATA_PRESENCE_FAST_PATH` is enabled. Then presence updates with the same data as the user's last one
+    are skipped, and activities are not updated in place, so they can be shared.
+    
+    Attributes
+    ----------
+    _activities : `dict<Activity, Activity>`
+        The shared activities.
+    _states : `dict<int, (int, Status, None | dict<str, str>, None | list<Activity>)>`
+        User identifier to last presence hash, status, statuses and activities relation. Only online users are stored.
+    activities_enabled : `bool`
+        Whether activities are stored. If disabled, only status changes are dispatched.
+    received_count : `int`
+        The amount of received presence updates.
+    shared_activity_count : `int`
+        The amount of times an already existing equal activity was shared.
+    skipped_count : `int`
+        The amount of presence updates skipped, because their data was the same as the last one.
+    """
+    __slots__ = (
+        '_activities', '_states', 'activities_enabled', 'received_count', 'shared_activity_count', 'skipped_count'
+    )
+    
+    def __new__(cls, activities_enabled = True):
+        """
+        Creates a new presence cache.
+        
+        Parameters
+        ----------
+        activities_enabled : `bool` = `True`, Optional
+            Whether activities are stored.
+        """
+        self = object.__new__(cls)
+        self._activities = {}
+        self._states = {}
+        self.activities_enabled = activities_enabled
+        self.received_count = 0
+        self.shared_activity_count = 0
+        self.skipped_count = 0
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the presence cache's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        if not self.activities_enabled:
+            repr_parts.append(' activities_enabled = False,')
+        
+        repr_parts.append(' received_count = ')
+        repr_parts.append(repr(self.received_count))
+        
+        repr_parts.append(', skipped_count = ')
+        repr_parts.append(repr(self.skipped_count))
+        
+        repr_parts.append(', shared_activity_count = ')
+        repr_parts.append(repr(self.shared_activity_count))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def get_statistics(self):
+        """
+        Returns the presence cache's statistics.
+        
+        Returns
+        -------
+        statistics : `dict<str, int>`
+        """
+        return {
+            'activity_count': len(self._activities),
+            'received_count': self.received_count,
+            'shared_activity_count': self.shared_activity_count,
+            'skipped_count': self.skipped_count,
+            'user_count': len(self._states),
+        }
+    
+    
+    def reset_statistics(self):
+        """
+        Resets the presence cache's counters.
+        """
+        self.received_count = 0
+        self.shared_activity_count = 0
+        self.skipped_count = 0
+    
+    
+    def clear(self):
+        """
+        Clears the stored presence hashes and the shared activities.
+        """
+        self._activities.clear()
+        self._states.clear()
+    
+    
+    def hash_presence_data(self, data):
+        """
+        Hashes the given presence data. The user and guild fields are ignored.
+        
+        The data is serialized with `marshal`, because it is much faster than `repr` and supports every type a
+        decoded payload can contain.
+        
+        Parameters
+        ----------
+        data : `dict<str, object>`
+            Presence data.
+        
+        Returns
+        -------
+        presence_hash : `int`
+        """
+        if self.activities_enabled:
+            activity_datas = data.get('activities', None)
+        else:
+            activity_datas = None
+        
+        return hash(marshal_dump((data.get('status', None), data.get('client_status', None), activity_datas)))
+    
+    
+    def get_presence_hash(self, user, data):
+        """
+        Returns the hash of the given presence data. If it is the same as the user's last one, returns `None`, so the
+        presence update can be skipped.
+        
+        Parameters
+        ----------
+        user : ``ClientUserBase``
+            The respective user.
+        data : `dict<str, object>`
+            Presence data.
+        
+        Returns
+        -------
+        presence_hash : `None | int`
+        """
+        self.received_count += 1
+        
+        presence_hash = self.hash_presence_data(data)
+        
+        # If the presence was set from an other source (like guild create) since, the presence hash is outdated.
+        state = self._states.get(user.id, None)
+        if (
+            (state is not None) and
+            (state[0] == presence_hash) and
+            (state[1] is user.status) and
+            (state[2] is user.statuses) and
+            (state[3] is user.activities)
+        ):
+            self.skipped_count += 1
+            return None
+        
+        return presence_hash
+    
+    
+    def set_presence_hash(self, user, presence_hash):
+        """
+        Stores the hash of the user's presence data. Should be called after the user's presence is updated.
+        
+        Parameters
+        ----------
+        user : ``ClientUserBase``
+            The respective user.
+        presence_hash : `int`
+            The presence data's hash.
+        """
+        status = user.status
+        if status is Status.offline:
+            self._states.pop(user.id, None)
+        else:
+            self._states[user.id] = (presence_hash, status, user.statuses, user.activities)
+    
+    
+    def update_presence(self, user, data):
+        """
+        Updates the user's presence. If the presence data is the same as the user's last one, skips it.
+        
+        Parameters
+        ----------
+        user : ``ClientUserBase``
+            The respective user.
+        data : `dict<str, object>`
+            Presence data.
+        
+        Returns
+        -------
+        updated : `bool`
+        """
+        presence_hash = self.get_presence_hash(user, data)
+        if presence_hash is None:
+            return False
+        
+        user._update_presence(data)
+        self.set_presence_hash(user, presence_hash)
+        return True
+    
+    
+    def difference_update_presence(self, user, data):
+        """
+        Updates the user's presence and returns the changed attributes. If the presence data is the same as the
+        user's last one, skips it.
+        
+        Parameters
+        ----------
+        user : ``ClientUserBase``
+            The respective user.
+        data : `dict<str, object>`
+            Presence data.
+        
+        Returns
+        -------
+        old_attributes : `None | dict<str, object>`
+            `None` if the presence update was skipped.
+            
+            The returned dictionary may contain the following items:
+            
+            +---------------+-------------------------------------------+
+            | Keys          | Values                                    |
+            +===============+===========================================+
+            | activities    | ``ActivityChange``                        |
+            +---------------+-------------------------------------------+
+            | status        | ``Status``                                |
+            +---------------+-------------------------------------------+
+            | statuses      | `None`, `dict` of (`str`, `str`) items    |
+            +---------------+-------------------------------------------+
+        """
+        presence_hash = self.get_presence_hash(user, data)
+        if presence_hash is None:
+            return None
+        
+        old_attributes = user._difference_update_presence(data)
+        self.set_presence_hash(user, presence_hash)
+        return old_attributes
+    
+    
+    def share_activity(self, activity):
+        """
+        Returns an already existing activity equal to the given one. If there is none, stores the given one.
+        
+        Parameters
+        ----------
+        activity : ``Activity``
+            The activity to share.
+        
+        Returns
+        -------
+        activity : ``Activity``
+        """
+        activities = self._activities
+        shared_activity = activities.get(activity, None)
+        if (shared_activity is not None):
+            self.shared_activity_count += 1
+            return shared_activity
+        
+        if len(activities) >= ACTIVITY_CACHE_SIZE:
+            activities.clear()
+        
+        activities[activity] = activity
+        return activity
+    
+    
+    def create_activity(self, activity_data):
+        """
+        Creates an activity from the given data and shares it.
+        
+        Parameters
+        ----------
+        activity_data : `dict<str, object>`
+            Activity data.
+        
+        Returns
+        -------
+        activity : ``Activity``
+        """
+        return self.share_activity(Activity.from_data(activity_data))
+
+
+PRESENCE_CACHE = PresenceCache(not PRESENCE_STATUS_ONLY)
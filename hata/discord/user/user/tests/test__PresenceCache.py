@@ -0,0 +1,280 @@
+import vampytest
+
+from .....env import PRESENCE_STATUS_ONLY
+
+from ....activity import Activity
+
+from ..preinstanced import Status
+from ..presence_cache import PresenceCache
+from ..user import User
+
+
+def _assert_fields_set(presence_cache):
+    """
+    Asserts whether every attribute is set of the given presence cache.
+    
+    Parameters
+    ----------
+    presence_cache : ``PresenceCache``
+        The presence cache to check.
+    """
+    vampytest.assert_instance(presence_cache, PresenceCache)
+    vampytest.assert_instance(presence_cache._activities, dict)
+    vampytest.assert_instance(presence_cache._states, dict)
+    vampytest.assert_instance(presence_cache.activities_enabled, bool)
+    vampytest.assert_instance(presence_cache.received_count, int)
+    vampytest.assert_instance(presence_cache.shared_activity_count, int)
+    vampytest.assert_instance(presence_cache.skipped_count, int)
+
+
+def _create_presence_data(status = 'online', activity_name = 'Touhou'):
+    """
+    Creates presence data.
+    
+    Parameters
+    ----------
+    status : `str` = `'online'`, Optional
+        The user's status.
+    activity_name : `str` = `'Touhou'`, Optional
+        The user's activity's name.
+    
+    Returns
+    -------
+    data : `dict<str, object>`
+    """
+    return {
+        'status': status,
+        'client_status': {'desktop': status},
+        'activities': [{'type': 0, 'name': activity_name, 'id': 'aya'}],
+    }
+
+
+def test__PresenceCache__new__no_fields():
+    """
+    Tests whether ``PresenceCache.__new__`` works as intended.
+    
+    Case: No fields given.
+    """
+    presence_cache = PresenceCache()
+    _assert_fields_set(presence_cache)
+    
+    vampytest.assert_eq(presence_cache.activities_enabled, True)
+    vampytest.assert_eq(presence_cache.get_statistics()['received_count'], 0)
+
+
+def test__PresenceCache__new__all_fields():
+    """
+    Tests whether ``PresenceCache.__new__`` works as intended.
+    
+    Case: All fields given.
+    """
+    presence_cache = PresenceCache(False)
+    _assert_fields_set(presence_cache)
+    
+    vampytest.assert_eq(presence_cache.activities_enabled, False)
+
+
+def test__PresenceCache__repr():
+    """
+    Tests whether ``PresenceCache.__repr__`` works as intended.
+    """
+    presence_cache = PresenceCache(False)
+    
+    output = repr(presence_cache)
+    vampytest.assert_instance(output, str)
+
+
+def test__PresenceCache__skip():
+    """
+    Tests whether ``PresenceCache`` skips presence updates with the same data.
+    """
+    presence_cache = PresenceCache()
+    user = User.precreate(202510190110)
+    
+    vampytest.assert_true(presence_cache.update_presence(user, _create_presence_data()))
+    vampytest.assert_false(presence_cache.update_presence(user, _create_presence_data()))
+    vampytest.assert_true(presence_cache.update_presence(user, _create_presence_data(activity_name = 'Okuu')))
+    
+    vampytest.assert_eq(presence_cache.received_count, 3)
+    vampytest.assert_eq(presence_cache.skipped_count, 1)
+
+
+def test__PresenceCache__skip__outdated():
+    """
+    Tests whether ``PresenceCache`` does not skip presence updates if the user's presence was updated from other
+    source since.
+    """
+    presence_cache = PresenceCache()
+    user = User.precreate(202510190111)
+    
+    presence_cache.update_presence(user, _create_presence_data())
+    user._update_presence({})
+    
+    vampytest.assert_true(presence_cache.update_presence(user, _create_presence_data()))
+    vampytest.assert_is(user.status, Status.online)
+
+
+def test__PresenceCache__skip__activities_disabled():
+    """
+    Tests whether ``PresenceCache`` skips presence updates with only activity changes if activities are disabled.
+    """
+    presence_cache = PresenceCache(False)
+    user = User.precreate(202510190112)
+    
+    vampytest.assert_true(presence_cache.update_presence(user, _create_presence_data()))
+    vampytest.assert_false(presence_cache.update_presence(user, _create_presence_data(activity_name = 'Okuu')))
+    vampytest.assert_true(presence_cache.update_presence(user, _create_presence_data(status = 'idle')))
+
+
+def test__PresenceCache__difference_update_presence():
+    """
+    Tests whether ``PresenceCache.difference_update_presence`` works as intended.
+    """
+    presence_cache = PresenceCache()
+    user = User.precreate(202510190115)
+    
+    output = presence_cache.difference_update_presence(user, _create_presence_data())
+    vampytest.assert_instance(output, dict)
+    vampytest.assert_in('status', output)
+    
+    output = presence_cache.difference_update_presence(user, _create_presence_data())
+    vampytest.assert_is(output, None)
+    
+    output = presence_cache.difference_update_presence(user, _create_presence_data(status = 'idle'))
+    vampytest.assert_instance(output, dict)
+    vampytest.assert_eq(output.get('status', None), Status.online)
+    vampytest.assert_is(user.status, Status.idle)
+
+
+def test__PresenceCache__skip__shared_user():
+    """
+    Tests whether ``PresenceCache`` skips presence updates of a user shared by multiple clients.
+    
+    Case: Every client receives the same presence update.
+    """
+    presence_cache = PresenceCache()
+    user = User.precreate(202510190116)
+    
+    # The first client applies the presence update, the other ones skip it, so events are dispatched only once.
+    vampytest.assert_is_not(presence_cache.difference_update_presence(user, _create_presence_data()), None)
+    vampytest.assert_is(presence_cache.difference_update_presence(user, _create_presence_data()), None)
+    vampytest.assert_is(presence_cache.difference_update_presence(user, _create_presence_data()), None)
+    
+    vampytest.assert_eq(presence_cache.received_count, 3)
+    vampytest.assert_eq(presence_cache.skipped_count, 2)
+    vampytest.assert_eq(len(presence_cache._states), 1)
+    
+    # A changed presence is applied by the first client receiving it, then skipped again.
+    vampytest.assert_is_not(
+        presence_cache.difference_update_presence(user, _create_presence_data(status = 'idle')), None
+    )
+    vampytest.assert_is(
+        presence_cache.difference_update_presence(user, _create_presence_data(status = 'idle')), None
+    )
+    vampytest.assert_is(user.status, Status.idle)
+    vampytest.assert_eq(presence_cache.skipped_count, 3)
+
+
+@vampytest.skip_if(PRESENCE_STATUS_ONLY)
+def test__PresenceCache__skip__shared_user__activity_change():
+    """
+    Tests whether ``PresenceCache`` skips presence updates of a user shared by multiple clients.
+    
+    Case: Only the user's activity changes.
+    """
+    presence_cache = PresenceCache()
+    user = User.precreate(202510190118)
+    
+    vampytest.assert_is_not(presence_cache.difference_update_presence(user, _create_presence_data()), None)
+    vampytest.assert_is(presence_cache.difference_update_presence(user, _create_presence_data()), None)
+    
+    vampytest.assert_is_not(
+        presence_cache.difference_update_presence(user, _create_presence_data(activity_name = 'Okuu')), None
+    )
+    vampytest.assert_is(
+        presence_cache.difference_update_presence(user, _create_presence_data(activity_name = 'Okuu')), None
+    )
+    vampytest.assert_eq(user.activities[0].name, 'Okuu')
+    vampytest.assert_eq(presence_cache.skipped_count, 2)
+
+
+def test__PresenceCache__skip__shared_user__other_source():
+    """
+    Tests whether ``PresenceCache`` skips presence updates of a user shared by multiple clients.
+    
+    Case: One of the clients sets the user's presence from an other source (like guild create) in between.
+    """
+    presence_cache = PresenceCache()
+    user = User.precreate(202510190117)
+    
+    vampytest.assert_true(presence_cache.update_presence(user, _create_presence_data()))
+    vampytest.assert_false(presence_cache.update_presence(user, _create_presence_data()))
+    
+    user._update_presence(_create_presence_data(status = 'idle'))
+    
+    # The stored state is outdated, so the next client receiving the old presence must apply it.
+    vampytest.assert_true(presence_cache.update_presence(user, _create_presence_data()))
+    vampytest.assert_is(user.status, Status.online)
+    vampytest.assert_false(presence_cache.update_presence(user, _create_presence_data()))
+
+
+def test__PresenceCache__set_presence_hash__offline():
+    """
+    Tests whether ``PresenceCache.set_presence_hash`` does not store offline users.
+    """
+    presence_cache = PresenceCache()
+    user = User.precreate(202510190113)
+    
+    presence_cache.update_presence(user, _create_presence_data())
+    vampytest.assert_in(user.id, presence_cache._states)
+    
+    presence_cache.update_presence(user, {'status': 'offline', 'activities': []})
+    vampytest.assert_not_in(user.id, presence_cache._states)
+
+
+def test__PresenceCache__share_activity():
+    """
+    Tests whether ``PresenceCache.share_activity`` works as intended.
+    """
+    presence_cache = PresenceCache()
+    activity_data = {'type': 0, 'name': 'Touhou', 'id': 'aya'}
+    
+    activity_0 = presence_cache.create_activity(activity_data)
+    activity_1 = presence_cache.create_activity(activity_data)
+    activity_2 = presence_cache.share_activity(Activity('Okuu'))
+    
+    vampytest.assert_is(activity_0, activity_1)
+    vampytest.assert_is_not(activity_0, activity_2)
+    vampytest.assert_eq(presence_cache.shared_activity_count, 1)
+
+
+def test__PresenceCache__statistics():
+    """
+    Tests whether ``PresenceCache.get_statistics`` and ``.reset_statistics`` work as intended.
+    """
+    presence_cache = PresenceCache()
+    user = User.precreate(202510190114)
+    
+    presence_cache.update_presence(user, _create_presence_data())
+    presence_cache.update_presence(user, _create_presence_data())
+    presence_cache.create_activity({'type': 0, 'name': 'Touhou', 'id': 'aya'})
+    presence_cache.create_activity({'type': 0, 'name': 'Touhou', 'id': 'aya'})
+    
+    vampytest.assert_eq(
+        presence_cache.get_statistics(),
+        {
+            'activity_count': 1,
+            'received_count': 2,
+            'shared_activity_count': 1,
+            'skipped_count': 1,
+            'user_count': 1,
+        },
+    )
+    
+    presence_cache.reset_statistics()
+    vampytest.assert_eq(presence_cache.received_count, 0)
+    vampytest.assert_eq(presence_cache.shared_activity_count, 0)
+    vampytest.assert_eq(presence_cache.skipped_count, 0)
+    
+    presence_cache.clear()
+    vampytest.assert_eq(presence_cache.get_statistics()['user_count'], 0)
@@ -8,6 +8,7 @@ from ...core import GUILDS, USERS
 from ...precreate_helpers import process_precreate_parameters_and_raise_extra
 
 from ..guild_profile import GuildProfile
+from ..guild_profile.member_store import store_guild_profile
 
 from .client_user_base import ClientUserBase
 from .client_user_presence_base import ClientUserPBase
@@ -146,13 +147,14 @@ class User(USER_BASE_TYPE):
             self._update_attributes(user_data)
             
             if (guild_profile_data is not None) and guild_id:
-                try:
-                    guild_profile = self.guild_profiles[guild_id]
-                except KeyError:
-                    self.guild_profiles[guild_id] = GuildProfile.from_data(guild_profile_data)
-                else:
-                    guild_profile._set_joined(guild_profile_data)
-                    guild_profile._update_attributes(guild_profile_data)
+                if not store_guild_profile(self, guild_id, guild_profile_data):
+                    try:
+                        guild_profile = self.guild_profiles[guild_id]
+                    except KeyError:
+                        self.guild_profiles[guild_id] = GuildProfile.from_data(guild_profile_data)
+                    else:
+                        guild_profile._set_joined(guild_profile_data)
+                        guild_profile._update_attributes(guild_profile_data)
                 
                 if strong_cache:
                     try:
@@ -184,13 +186,14 @@ class User(USER_BASE_TYPE):
             self._update_attributes(user_data)
             
             if (guild_profile_data is not None) and guild_id:
-                try:
-                    guild_profile = self.guild_profiles[guild_id]
-                except KeyError:
-                    self.guild_profiles[guild_id] = GuildProfile.from_data(guild_profile_data)
-                else:
-                    guild_profile._set_joined(guild_profile_data)
-                    guild_profile._update_attributes(guild_profile_data)
+                if not store_guild_profile(self, guild_id, guild_profile_data):
+                    try:
+                        guild_profile = self.guild_profiles[guild_id]
+                    except KeyError:
+                        self.guild_profiles[guild_id] = GuildProfile.from_data(guild_profile_data)
+                    else:
+                        guild_profile._set_joined(guild_profile_data)
+                        guild_profile._update_attributes(guild_profile_data)
                 
                 if strong_cache:
                     try:
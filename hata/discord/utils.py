@@ -142,6 +142,10 @@ DISCORD_EPOCH = 1420070400000
 
 PARSE_TIMESTAMP_RP = re_compile('(\\d{4})-(\\d{2})-(\\d{2})T(\\d{2}):(\\d{2}):(\\d{2})(?:\\.(\\d{3})?)?.*')
 
+# Parsed timestamps are cached, since same timestamps come repeatedly, like at message updates.
+TIMESTAMP_CACHE = {}
+TIMESTAMP_CACHE_SIZE = 1024
+
 
 def _datetime_from_parsed(parsed):
     """
@@ -172,6 +176,76 @@ def _datetime_from_parsed(parsed):
     return DateTime(year, month, day, hour, minute, second, micro, tzinfo = TimeZone.utc)
 
 
+def _parse_timestamp(timestamp):
+    """
+    Parses the given timestamp.
+    
+    The two formats Discord sends (`2019-04-28T15:14:38+00:00` and `2019-07-17T18:52:50.758993+00:00`) are parsed
+    by `DateTime.fromisoformat`, the rest falls back to ``PARSE_TIMESTAMP_RP``. Both give the same result.
+    
+    Parameters
+    ----------
+    timestamp : `str`
+        The timestamp to parse.
+    
+    Returns
+    -------
+    time : `None | DateTime`
+    """
+    # `timestamp[4:20:3]` are the separators.
+    length = len(timestamp)
+    if length == 25 and timestamp[4:20:3] == '--T::+':
+        iso_timestamp = timestamp
+    
+    # Only milliseconds are parsed, but they are stored as microseconds, so we pad them to the left.
+    elif length == 32 and timestamp[4:20:3] == '--T::.' and timestamp[26] == '+':
+        iso_timestamp = f'{timestamp[:20]}000{timestamp[20:23]}{timestamp[26:]}'
+    
+    else:
+        iso_timestamp = None
+    
+    if (iso_timestamp is not None):
+        try:
+            date_time = DateTime.fromisoformat(iso_timestamp)
+        except ValueError:
+            pass
+        else:
+            # The timezone is ignored by the regex, but we should not get anything else than utc anyways.
+            if date_time.tzinfo is TimeZone.utc:
+                return date_time
+    
+    parsed = PARSE_TIMESTAMP_RP.fullmatch(timestamp)
+    if parsed is None:
+        return None
+    
+    return _datetime_from_parsed(parsed)
+
+
+def _timestamp_to_datetime(timestamp):
+    """
+    Parses the given timestamp. Looks it up from ``TIMESTAMP_CACHE`` first.
+    
+    Parameters
+    ----------
+    timestamp : `str`
+        The timestamp to parse.
+    
+    Returns
+    -------
+    time : `None | DateTime`
+    """
+    date_time = TIMESTAMP_CACHE.get(timestamp, None)
+    if (date_time is None):
+        date_time = _parse_timestamp(timestamp)
+        if (date_time is not None):
+            if len(TIMESTAMP_CACHE) >= TIMESTAMP_CACHE_SIZE:
+                TIMESTAMP_CACHE.clear()
+            
+            TIMESTAMP_CACHE[timestamp] = date_time
+    
+    return date_time
+
+
 def timestamp_to_datetime(timestamp):
     """
     Parses the given timestamp.
@@ -201,12 +275,12 @@ def timestamp_to_datetime(timestamp):
     -----
     I already noted that timestamp formats are inconsistent, but even our baka Chiruno could have fix it...
     """
-    parsed = PARSE_TIMESTAMP_RP.fullmatch(timestamp)
-    if parsed is None:
+    date_time = _timestamp_to_datetime(timestamp)
+    if date_time is None:
         sys.stderr.write(f'Cannot parse timestamp: `{timestamp}`, returning `DISCORD_EPOCH_START`\n')
         return DISCORD_EPOCH_START
     
-    return _datetime_from_parsed(parsed)
+    return date_time
 
 
 def timestamp_to_datetime_soft(timestamp):
@@ -226,9 +300,7 @@ def timestamp_to_datetime_soft(timestamp):
     --------
     - ``timestamp_to_datetime`` : Hard timestamp parsing.
     """
-    parsed = PARSE_TIMESTAMP_RP.fullmatch(timestamp)
-    if (parsed is not None):
-        return _datetime_from_parsed(parsed)
+    return _timestamp_to_datetime(timestamp)
 
 
 def datetime_to_timestamp(date_time):
@@ -39,6 +39,22 @@ HATA_DOCS_ENABLED : `bool` = `True`
     
     If python is run with `-OO`, then this always defaults to `False`.
 
+HATA_HTTP2 : `bool` = `False`
+    Whether the api clients should do their requests over http/2, multiplexing them over a few connections. Requires
+    the `h2` library (`hata[http2]` extra). Requests which cannot be done over http/2 fall back to http/1.1.
+
+HATA_HTTP2_MAX_CONCURRENT_STREAMS : `int` = `100`
+    The maximal amount of concurrent requests on one http/2 connection. Lowered to the server's limit if it is less.
+
+HATA_HTTP2_MAX_CONNECTIONS : `int` = `2`
+    The maximal amount of http/2 connections per host.
+
+HATA_JSON_CODEC : `None | str` = `None`
+    The json codec to decode (and encode) gateway and rest payloads with. Can be `'orjson'`, `'ujson'` or `'standard'`.
+    
+    If not given, the fastest installed one is used. If the requested one is not installed, a warning message will
+    show up and the fastest installed one is used instead.
+
 HATA_LIBRARY_AGENT_APPENDIX : `str` = `None`
     Library agent appendix used instead of the default generated one.
 
@@ -51,14 +67,54 @@ HATA_LIBRARY_URL : `str` = `'https://github.com/HuyaneMatsu/hata'`
 HATA_LIBRARY_VERSION : `str` = `None`
     Library version used in user agents.
 
+HATA_MEMBER_STORE_THRESHOLD : `int` = `0`
+    Guilds with at least this many users store their users' guild profiles in a compact ``GuildMemberStore`` and
+    create the ``GuildProfile``-s only when they are accessed. `0` to disable.
+
+HATA_MESSAGE_CACHE_LIMIT : `int` = `0`
+    The maximal amount of messages kept in all channels' message histories combined. When exceeded the least recently
+    active channels' oldest messages are dropped. `0` means unlimited.
+
+HATA_MESSAGE_CACHE_MINIMUM : `int` = `1`
+    The amount of messages every channel can keep even if `HATA_MESSAGE_CACHE_LIMIT` is exceeded.
+
 HATA_MESSAGE_CACHE_SIZE : `int` = `10`
     The default message cache size per channel.
 
+HATA_MESSAGE_LAZY_FIELDS : `bool` = `False`
+    Whether the expensive fields of messages (like embeds, components and attachments) should be parsed only when
+    they are accessed first.
+
+HATA_PRESENCE_FAST_PATH : `bool` = `False`
+    Whether presence updates with the same data as the user's last one should be skipped and whether equal activities
+    should be shared between users. The activities are not updated in place, so they can be shared.
+
+HATA_PRESENCE_STATUS_ONLY : `bool` = `False`
+    Whether only the status of the users should be stored, without their activities. Activity changes are not
+    dispatched either.
+
+HATA_RATE_LIMIT_BROKER_PATH : `None | str` = `None`
+    Path of the unix socket a rate limit broker server listens on. If given, the api clients share their rate limits
+    with every other process using the same broker. The broker server can be started with the
+    `$ python3 -m hata rate-limit-broker PATH` command.
+
+HATA_RATE_LIMIT_BUCKET_DISCOVERY : `bool` = `False`
+    Whether the api clients should discover which endpoints share rate limits from the `X-RateLimit-Bucket` response
+    header instead of relying only on the predefined rate limit groups.
+
+HATA_RESPONSE_CACHE_TIME_TO_LIVE : `int` = `0`
+    For how much seconds the responses of the cacheable read endpoints (like getting a guild) should be cached by the
+    api clients. The cached responses are invalidated by the related dispatch events as well. `0` to disable.
+
 HATA_RICH_DISCORD_EXCEPTION : `bool` = `False`
     Whether ``DiscordException``-s should show the request data as well.
 
 HATA_STATUS_ENDPOINT : `None | str` = `None`
     Discord status endpoint.
+
+HATA_USER_REQUEST_LAZY_THRESHOLD : `int` = `0`
+    Guilds with at least this many users do not have their users requested on startup, only when first needed, see
+    ``Client.ensure_all_users_of``. `0` to request the users of every guild on startup.
 """
 
 from .env_getter import *
@@ -1,8 +1,11 @@
 __all__ = (
     'ALLOW_DEBUG_MESSAGES', 'API_VERSION', 'CACHE_PRESENCE', 'CACHE_USER', 'CUSTOM_API_ENDPOINT', 'CUSTOM_CDN_ENDPOINT',
     'CUSTOM_DISCORD_ENDPOINT', 'CUSTOM_INVITE_ENDPOINT', 'CUSTOM_MEDIA_ENDPOINT', 'CUSTOM_STATUS_ENDPOINT',
-    'DOCS_ENABLED', 'LIBRARY_AGENT_APPENDIX', 'LIBRARY_NAME', 'LIBRARY_URL', 'LIBRARY_VERSION', 'MESSAGE_CACHE_SIZE',
-    'RICH_DISCORD_EXCEPTION'
+    'DOCS_ENABLED', 'HTTP2', 'HTTP2_MAX_CONCURRENT_STREAMS', 'HTTP2_MAX_CONNECTIONS', 'JSON_CODEC_NAME',
+    'LIBRARY_AGENT_APPENDIX', 'LIBRARY_NAME', 'LIBRARY_URL', 'LIBRARY_VERSION', 'MEMBER_STORE_THRESHOLD',
+    'MESSAGE_CACHE_LIMIT', 'MESSAGE_CACHE_MINIMUM', 'MESSAGE_CACHE_SIZE', 'MESSAGE_LAZY_FIELDS', 'PRESENCE_FAST_PATH',
+    'PRESENCE_STATUS_ONLY', 'RATE_LIMIT_BROKER_PATH', 'RATE_LIMIT_BUCKET_DISCOVERY', 'RESPONSE_CACHE_TIME_TO_LIVE',
+    'RICH_DISCORD_EXCEPTION', 'USER_REQUEST_LAZY_THRESHOLD'
 )
 
 from warnings import warn
@@ -28,6 +31,23 @@ MESSAGE_CACHE_SIZE = get_int_env('HATA_MESSAGE_CACHE_SIZE', 10)
 if (MESSAGE_CACHE_SIZE < 0):
     MESSAGE_CACHE_SIZE = 0
 
+MEMBER_STORE_THRESHOLD = get_int_env('HATA_MEMBER_STORE_THRESHOLD', 0)
+
+if (MEMBER_STORE_THRESHOLD < 0):
+    MEMBER_STORE_THRESHOLD = 0
+
+MESSAGE_CACHE_LIMIT = get_int_env('HATA_MESSAGE_CACHE_LIMIT', 0)
+
+if (MESSAGE_CACHE_LIMIT < 0):
+    MESSAGE_CACHE_LIMIT = 0
+
+MESSAGE_CACHE_MINIMUM = get_int_env('HATA_MESSAGE_CACHE_MINIMUM', 1)
+
+if (MESSAGE_CACHE_MINIMUM < 0):
+    MESSAGE_CACHE_MINIMUM = 0
+
+MESSAGE_LAZY_FIELDS = get_bool_env('HATA_MESSAGE_LAZY_FIELDS', False)
+
 DOCS_ENABLED = get_bool_env('HATA_DOCS_ENABLED', (get_bool_env is not None))
 if not DOCS_ENABLED:
     get_bool_env.__doc__ = None
@@ -75,10 +95,37 @@ if API_VERSION != DEFAULT_API_VERSION:
         )
 
 
+HTTP2 = get_bool_env('HATA_HTTP2', False)
+HTTP2_MAX_CONCURRENT_STREAMS = get_int_env('HATA_HTTP2_MAX_CONCURRENT_STREAMS', 100)
+
+if (HTTP2_MAX_CONCURRENT_STREAMS < 1):
+    HTTP2_MAX_CONCURRENT_STREAMS = 1
+
+HTTP2_MAX_CONNECTIONS = get_int_env('HATA_HTTP2_MAX_CONNECTIONS', 2)
+
+if (HTTP2_MAX_CONNECTIONS < 1):
+    HTTP2_MAX_CONNECTIONS = 1
+
+
+JSON_CODEC_NAME = get_str_env('HATA_JSON_CODEC', None)
+
 LIBRARY_AGENT_APPENDIX = get_str_env('HATA_LIBRARY_AGENT_APPENDIX', None)
 LIBRARY_NAME = get_str_env('HATA_LIBRARY_NAME', 'hata')
 LIBRARY_URL = get_str_env('HATA_LIBRARY_URL', 'https://github.com/HuyaneMatsu/hata')
 LIBRARY_VERSION = get_str_env('HATA_LIBRARY_VERSION', None)
 
 
+PRESENCE_FAST_PATH = get_bool_env('HATA_PRESENCE_FAST_PATH', False)
+PRESENCE_STATUS_ONLY = get_bool_env('HATA_PRESENCE_STATUS_ONLY', False)
+
+RATE_LIMIT_BROKER_PATH = get_str_env('HATA_RATE_LIMIT_BROKER_PATH', None)
+RATE_LIMIT_BUCKET_DISCOVERY = get_bool_env('HATA_RATE_LIMIT_BUCKET_DISCOVERY', False)
+
+RESPONSE_CACHE_TIME_TO_LIVE = get_int_env('HATA_RESPONSE_CACHE_TIME_TO_LIVE', 0)
+
 RICH_DISCORD_EXCEPTION = get_bool_env('HATA_RICH_DISCORD_EXCEPTION', False)
+
+USER_REQUEST_LAZY_THRESHOLD = get_int_env('HATA_USER_REQUEST_LAZY_THRESHOLD', 0)
+
+if (USER_REQUEST_LAZY_THRESHOLD < 0):
+    USER_REQUEST_LAZY_THRESHOLD = 0
@@ -0,0 +1,17 @@
+from .cluster import *
+from .constants import *
+from .utils import *
+from .worker import *
+
+
+__all__ = (
+    *cluster.__all__,
+    *constants.__all__,
+    *utils.__all__,
+    *worker.__all__,
+)
+
+
+from .. import register_library_extension
+register_library_extension('HuyaneMatsu.cluster')
+del register_library_extension
@@ -0,0 +1,363 @@
+__all__ = ('ShardCluster',)
+
+import signal
+from multiprocessing import get_context
+from multiprocessing.connection import wait as wait_for_objects
+from os import cpu_count
+from threading import current_thread, main_thread
+from time import sleep as blocking_sleep
+
+from scarletio import RichAttributeErrorBaseType
+
+from .constants import IDENTIFY_INTERVAL, SUPERVISE_INTERVAL, WORKER_READY_TIMEOUT
+from .utils import split_shard_ids
+from .worker import ClusterWorker
+
+
+def _validate_positive_int(value, name):
+    """
+    Validates the given positive integer.
+    
+    Parameters
+    ----------
+    value : `int`
+        The value to validate.
+    name : `str`
+        The parameter's name.
+    
+    Returns
+    -------
+    value : `int`
+    
+    Raises
+    ------
+    TypeError
+        - If `value`'s type is incorrect.
+    ValueError
+        - If `value` is not positive.
+    """
+    if type(value) is int:
+        pass
+    elif isinstance(value, int):
+        value = int(value)
+    else:
+        raise TypeError(
+            f'`{name}` can be `int`, got {value.__class__.__name__}; {value!r}.'
+        )
+    
+    if value < 1:
+        raise ValueError(
+            f'`{name}` must be positive, got {value!r}.'
+        )
+    
+    return value
+
+
+class ShardCluster(RichAttributeErrorBaseType):
+    """
+    Runs the shards of a client spread across multiple worker processes.
+    
+    Each worker process creates its own client running only a continuous range of the shards with its own caches.
+    The workers are launched one after the other, a worker is only launched after the previous one reported its
+    shards to be up and an identify interval passed. Like this the `max_concurrency` identify buckets are respected
+    across the processes too.
+    
+    If a worker process dies, it is relaunched. On rolling restart the workers are restarted one after the other
+    the same way, so only one worker's shards are down at a time.
+    
+    Attributes
+    ----------
+    _rolling_restart_requested : `bool`
+        Whether rolling restart was requested.
+    _running : `bool`
+        Whether the cluster is running.
+    client_keyword_parameters : `dict<str, object>`
+        Additional keyword parameters to create the clients with.
+    max_concurrency : `int`
+        The maximal amount of shards that can be launched at the same time.
+    setup : `callable`
+        Function to call with each created client to set it up.
+    shard_count : `int`
+        The total amount of shards.
+    token : `str`
+        The client's token.
+    workers : `tuple<ClusterWorker>`
+        The cluster's workers.
+    """
+    __slots__ = (
+        '_rolling_restart_requested', '_running', 'client_keyword_parameters', 'max_concurrency', 'setup',
+        'shard_count', 'token', 'workers'
+    )
+    
+    def __new__(
+        cls,
+        token,
+        setup,
+        shard_count,
+        *,
+        client_keyword_parameters = None,
+        max_concurrency = 1,
+        worker_count = None,
+    ):
+        """
+        Creates a new shard cluster.
+        
+        Parameters
+        ----------
+        token : `str`
+            The client's token.
+        setup : `callable`
+            Function to call with each created client to set it up, like registering its commands and event handlers.
+            Must be accepting `1` parameter, the client. Since it is called inside of the worker processes, it must
+            be importable, so defined on module level.
+        shard_count : `int`
+            The total amount of shards. You can get the recommended one using ``Client.client_gateway``.
+        client_keyword_parameters : `None | dict<str, object>` = `None`, Optional (Keyword only)
+            Additional keyword parameters to create the clients with. Must be picklable.
+            
+            Passing a shared `identify_coordinator`, like ``IdentifyCoordinatorFile``, lets the workers identify
+            without waiting an additional identify interval between them.
+        max_concurrency : `int` = `1`, Optional (Keyword only)
+            The maximal amount of shards that can be launched at the same time. You can get it using
+            ``Client.client_gateway``.
+        worker_count : `None | int` = `None`, Optional (Keyword only)
+            The amount of worker processes to spread the shards between. Defaults to the amount of cpus.
+        
+        Raises
+        ------
+        TypeError
+            - If a parameter's type is incorrect.
+        ValueError
+            - If a parameter's value is incorrect.
+        """
+        if not isinstance(token, str):
+            raise TypeError(
+                f'`token` can be `str`, got {token.__class__.__name__}; {token!r}.'
+            )
+        
+        if not callable(setup):
+            raise TypeError(
+                f'`setup` can be `callable`, got {setup.__class__.__name__}; {setup!r}.'
+            )
+        
+        shard_count = _validate_positive_int(shard_count, 'shard_count')
+        max_concurrency = _validate_positive_int(max_concurrency, 'max_concurrency')
+        
+        if worker_count is None:
+            worker_count = cpu_count() or 1
+        else:
+            worker_count = _validate_positive_int(worker_count, 'worker_count')
+        
+        if client_keyword_parameters is None:
+            client_keyword_parameters = {}
+        
+        elif isinstance(client_keyword_parameters, dict):
+            for key in ('shard_count', 'shard_ids'):
+                if key in client_keyword_parameters:
+                    raise ValueError(
+                        f'`client_keyword_parameters` cannot contain {key!r}, it is set by the cluster; got '
+                        f'{client_keyword_parameters!r}.'
+                    )
+            
+            client_keyword_parameters = client_keyword_parameters.copy()
+        
+        else:
+            raise TypeError(
+                f'`client_keyword_parameters` can be `None`, `dict`, got '
+                f'{client_keyword_parameters.__class__.__name__}; {client_keyword_parameters!r}.'
+            )
+        
+        workers = tuple(
+            ClusterWorker(worker_id, shard_ids) for worker_id, shard_ids
+            in enumerate(split_shard_ids(shard_count, worker_count, max_concurrency))
+        )
+        
+        self = object.__new__(cls)
+        self._rolling_restart_requested = False
+        self._running = False
+        self.client_keyword_parameters = client_keyword_parameters
+        self.max_concurrency = max_concurrency
+        self.setup = setup
+        self.shard_count = shard_count
+        self.token = token
+        self.workers = workers
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the shard cluster's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' shard_count = ')
+        repr_parts.append(repr(self.shard_count))
+        
+        repr_parts.append(', worker_count = ')
+        repr_parts.append(repr(len(self.workers)))
+        
+        repr_parts.append(', max_concurrency = ')
+        repr_parts.append(repr(self.max_concurrency))
+        
+        if self._running:
+            repr_parts.append(', running')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def run(self):
+        """
+        Runs the cluster, blocking till it is stopped.
+        
+        On platforms supporting it, rolling restart can be requested by sending `SIGHUP` to the process.
+        
+        Raises
+        ------
+        RuntimeError
+            - If the cluster is already running.
+        """
+        if self._running:
+            raise RuntimeError(f'{self!r} is already running.')
+        
+        self._running = True
+        
+        previous_signal_handler = None
+        handle_signal = hasattr(signal, 'SIGHUP') and (current_thread() is main_thread())
+        if handle_signal:
+            previous_signal_handler = signal.signal(signal.SIGHUP, self._handle_rolling_restart_signal)
+        
+        try:
+            context = get_context('spawn')
+            
+            for worker in self.workers:
+                if not self._running:
+                    break
+                
+                self._launch_worker(context, worker)
+            
+            while self._running:
+                if self._rolling_restart_requested:
+                    self._rolling_restart_requested = False
+                    self._rolling_restart(context)
+                    continue
+                
+                self._supervise(context)
+        
+        except KeyboardInterrupt:
+            pass
+        
+        finally:
+            self._running = False
+            
+            if handle_signal:
+                signal.signal(signal.SIGHUP, previous_signal_handler)
+            
+            for worker in self.workers:
+                worker.stop()
+    
+    
+    def stop(self):
+        """
+        Requests the cluster to stop. The workers are stopped by ``.run`` before returning.
+        """
+        self._running = False
+    
+    
+    def request_rolling_restart(self):
+        """
+        Requests the cluster to restart its workers one after the other.
+        """
+        self._rolling_restart_requested = True
+    
+    
+    def _handle_rolling_restart_signal(self, signal_number, frame):
+        """
+        Signal handler requesting rolling restart.
+        
+        Parameters
+        ----------
+        signal_number : `int`
+            The received signal.
+        frame : `None | FrameType`
+            The interrupted frame.
+        """
+        self.request_rolling_restart()
+    
+    
+    def _launch_worker(self, context, worker):
+        """
+        Launches the given worker and waits till its shards are up, then waits an identify interval, so the next
+        worker's identifies do not collide with its. The interval is not waited if the workers share an identify
+        coordinator.
+        
+        Parameters
+        ----------
+        context : ``BaseContext``
+            Multiprocessing context to create the process with.
+        worker : ``ClusterWorker``
+            The worker to launch.
+        
+        Returns
+        -------
+        ready : `bool`
+            Whether the worker reported ready.
+        """
+        worker.start(context, self.token, self.shard_count, self.setup, self.client_keyword_parameters)
+        ready = worker.wait_ready(WORKER_READY_TIMEOUT)
+        
+        # If the workers share an identify coordinator, it already respects the identify buckets.
+        if 'identify_coordinator' not in self.client_keyword_parameters:
+            blocking_sleep(IDENTIFY_INTERVAL)
+        
+        return ready
+    
+    
+    def _rolling_restart(self, context):
+        """
+        Restarts the workers one after the other.
+        
+        Parameters
+        ----------
+        context : ``BaseContext``
+            Multiprocessing context to create the processes with.
+        """
+        for worker in self.workers:
+            if not self._running:
+                break
+            
+            worker.stop()
+            self._launch_worker(context, worker)
+    
+    
+    def _supervise(self, context):
+        """
+        Waits for any of the workers to send a message or to die. Relaunches the dead ones.
+        
+        Parameters
+        ----------
+        context : ``BaseContext``
+            Multiprocessing context to create the processes with.
+        """
+        objects = []
+        for worker in self.workers:
+            process = worker.process
+            if (process is not None):
+                objects.append(process.sentinel)
+            
+            connection = worker.connection
+            if (connection is not None):
+                objects.append(connection)
+        
+        if objects:
+            wait_for_objects(objects, SUPERVISE_INTERVAL)
+        else:
+            blocking_sleep(SUPERVISE_INTERVAL)
+        
+        for worker in self.workers:
+            if not self._running:
+                break
+            
+            worker.poll_messages()
+            
+            if not worker.is_alive():
+                worker.stop()
+                self._launch_worker(context, worker)
@@ -0,0 +1,19 @@
+__all__ = ()
+
+# Sent by the worker when its client's `ready` event is fired, meaning all of its shards are up.
+CLUSTER_MESSAGE_READY = 'ready'
+
+# Sent by the cluster to tell the worker to stop its client and exit.
+CLUSTER_MESSAGE_STOP = 'stop'
+
+# Each identify bucket can be used once every 5 seconds.
+IDENTIFY_INTERVAL = 5.0
+
+# How long to wait for a worker to report ready before launching the next one anyway.
+WORKER_READY_TIMEOUT = 600.0
+
+# How long to wait for a worker to exit after asked to before killing it.
+WORKER_STOP_TIMEOUT = 60.0
+
+# How frequently the cluster checks its workers.
+SUPERVISE_INTERVAL = 1.0
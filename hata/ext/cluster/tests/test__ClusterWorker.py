@@ -0,0 +1,60 @@
+import vampytest
+
+from ..worker import ClusterWorker
+
+
+def _assert_fields_set(worker):
+    """
+    Asserts whether every attribute is set of the given cluster worker.
+    
+    Parameters
+    ----------
+    worker : ``ClusterWorker``
+        The worker to check.
+    """
+    vampytest.assert_instance(worker, ClusterWorker)
+    vampytest.assert_instance(worker.ready, bool)
+    vampytest.assert_instance(worker.shard_ids, tuple)
+    vampytest.assert_instance(worker.worker_id, int)
+
+
+def test__ClusterWorker__new():
+    """
+    Tests whether ``ClusterWorker.__new__`` works as intended.
+    """
+    worker_id = 2
+    shard_ids = range(4, 8)
+    
+    worker = ClusterWorker(worker_id, shard_ids)
+    _assert_fields_set(worker)
+    
+    vampytest.assert_eq(worker.worker_id, worker_id)
+    vampytest.assert_eq(worker.shard_ids, (4, 5, 6, 7))
+    vampytest.assert_is(worker.connection, None)
+    vampytest.assert_is(worker.process, None)
+    vampytest.assert_false(worker.ready)
+
+
+def test__ClusterWorker__repr():
+    """
+    Tests whether ``ClusterWorker.__repr__`` works as intended.
+    """
+    worker = ClusterWorker(2, range(4, 8))
+    
+    output = repr(worker)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in('4-7', output)
+
+
+def test__ClusterWorker__not_started():
+    """
+    Tests whether ``ClusterWorker``'s methods work as intended when the worker is not started.
+    """
+    worker = ClusterWorker(2, range(4, 8))
+    
+    vampytest.assert_false(worker.is_alive())
+    vampytest.assert_false(worker.wait_ready(0.0))
+    worker.poll_messages()
+    worker.stop()
+    
+    vampytest.assert_false(worker.ready)
@@ -0,0 +1,148 @@
+import vampytest
+
+from ..cluster import ShardCluster
+from ..worker import ClusterWorker
+
+
+def setup(client):
+    pass
+
+
+def _assert_fields_set(cluster):
+    """
+    Asserts whether every attribute is set of the given shard cluster.
+    
+    Parameters
+    ----------
+    cluster : ``ShardCluster``
+        The cluster to check.
+    """
+    vampytest.assert_instance(cluster, ShardCluster)
+    vampytest.assert_instance(cluster._rolling_restart_requested, bool)
+    vampytest.assert_instance(cluster._running, bool)
+    vampytest.assert_instance(cluster.client_keyword_parameters, dict)
+    vampytest.assert_instance(cluster.max_concurrency, int)
+    vampytest.assert_instance(cluster.shard_count, int)
+    vampytest.assert_instance(cluster.token, str)
+    vampytest.assert_instance(cluster.workers, tuple)
+
+
+def test__ShardCluster__new__min_fields():
+    """
+    Tests whether ``ShardCluster.__new__`` works as intended.
+    
+    Case: Minimal amount of fields given.
+    """
+    token = 'token_202505110008'
+    shard_count = 4
+    
+    cluster = ShardCluster(token, setup, shard_count)
+    _assert_fields_set(cluster)
+    
+    vampytest.assert_eq(cluster.token, token)
+    vampytest.assert_is(cluster.setup, setup)
+    vampytest.assert_eq(cluster.shard_count, shard_count)
+    vampytest.assert_eq(cluster.max_concurrency, 1)
+    vampytest.assert_eq(cluster.client_keyword_parameters, {})
+    vampytest.assert_eq(
+        [shard_id for worker in cluster.workers for shard_id in worker.shard_ids],
+        [*range(shard_count)],
+    )
+
+
+def test__ShardCluster__new__all_fields():
+    """
+    Tests whether ``ShardCluster.__new__`` works as intended.
+    
+    Case: All fields given.
+    """
+    token = 'token_202505110009'
+    shard_count = 32
+    client_keyword_parameters = {'extensions': 'slash'}
+    max_concurrency = 16
+    worker_count = 2
+    
+    cluster = ShardCluster(
+        token,
+        setup,
+        shard_count,
+        client_keyword_parameters = client_keyword_parameters,
+        max_concurrency = max_concurrency,
+        worker_count = worker_count,
+    )
+    _assert_fields_set(cluster)
+    
+    vampytest.assert_eq(cluster.shard_count, shard_count)
+    vampytest.assert_eq(cluster.max_concurrency, max_concurrency)
+    vampytest.assert_eq(cluster.client_keyword_parameters, client_keyword_parameters)
+    vampytest.assert_is_not(cluster.client_keyword_parameters, client_keyword_parameters)
+    
+    vampytest.assert_eq(len(cluster.workers), worker_count)
+    for worker_id, (worker, shard_ids) in enumerate(zip(cluster.workers, (range(0, 16), range(16, 32)))):
+        vampytest.assert_instance(worker, ClusterWorker)
+        vampytest.assert_eq(worker.worker_id, worker_id)
+        vampytest.assert_eq(worker.shard_ids, tuple(shard_ids))
+
+
+def _iter_options__type_error():
+    yield 12, setup, 4, {}
+    yield 'token', None, 4, {}
+    yield 'token', setup, 4.0, {}
+    yield 'token', setup, 4, {'max_concurrency': 1.0}
+    yield 'token', setup, 4, {'worker_count': '2'}
+    yield 'token', setup, 4, {'client_keyword_parameters': ['extensions']}
+
+
+def _iter_options__value_error():
+    yield 'token', setup, 0, {}
+    yield 'token', setup, 4, {'max_concurrency': 0}
+    yield 'token', setup, 4, {'worker_count': 0}
+    yield 'token', setup, 4, {'client_keyword_parameters': {'shard_count': 4}}
+    yield 'token', setup, 4, {'client_keyword_parameters': {'shard_ids': [1]}}
+
+
+@vampytest._(vampytest.call_from(_iter_options__type_error()).raising(TypeError))
+@vampytest._(vampytest.call_from(_iter_options__value_error()).raising(ValueError))
+def test__ShardCluster__new__error(token, setup, shard_count, keyword_parameters):
+    """
+    Tests whether ``ShardCluster.__new__`` works as intended.
+    
+    Case: Error.
+    
+    Parameters
+    ----------
+    token : `object`
+        The client's token.
+    setup : `object`
+        Function to call with each created client.
+    shard_count : `object`
+        The total amount of shards.
+    keyword_parameters : `dict<str, object>`
+        Additional keyword parameters.
+    
+    Raises
+    ------
+    TypeError
+    ValueError
+    """
+    ShardCluster(token, setup, shard_count, **keyword_parameters)
+
+
+def test__ShardCluster__repr():
+    """
+    Tests whether ``ShardCluster.__repr__`` works as intended.
+    """
+    cluster = ShardCluster('token_202505110010', setup, 4, worker_count = 2)
+    
+    output = repr(cluster)
+    vampytest.assert_instance(output, str)
+
+
+def test__ShardCluster__request_rolling_restart():
+    """
+    Tests whether ``ShardCluster.request_rolling_restart`` works as intended.
+    """
+    cluster = ShardCluster('token_202505110011', setup, 4, worker_count = 2)
+    
+    cluster.request_rolling_restart()
+    vampytest.assert_true(cluster._rolling_restart_requested)
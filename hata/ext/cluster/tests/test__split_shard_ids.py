@@ -0,0 +1,37 @@
+import vampytest
+
+from ..utils import split_shard_ids
+
+
+def _iter_options():
+    yield 1, 4, 1, [range(0, 1)]
+    yield 10, 3, 1, [range(0, 3), range(3, 6), range(6, 10)]
+    yield 64, 4, 16, [range(0, 16), range(16, 32), range(32, 48), range(48, 64)]
+    yield 64, 3, 16, [range(0, 16), range(16, 32), range(32, 64)]
+    yield 20, 2, 16, [range(0, 16), range(16, 20)]
+
+
+@vampytest._(vampytest.call_from(_iter_options()).returning_last())
+def test__split_shard_ids(shard_count, worker_count, max_concurrency):
+    """
+    Tests whether ``split_shard_ids`` works as intended.
+    
+    Parameters
+    ----------
+    shard_count : `int`
+        The total amount of shards.
+    worker_count : `int`
+        The amount of workers to split the shards between.
+    max_concurrency : `int`
+        The maximal amount of shards that can be launched at the same time.
+    
+    Returns
+    -------
+    output : `list<range>`
+    """
+    output = split_shard_ids(shard_count, worker_count, max_concurrency)
+    vampytest.assert_instance(output, list)
+    
+    # Check whether every shard is covered exactly once.
+    vampytest.assert_eq([shard_id for shard_id_range in output for shard_id in shard_id_range], [*range(shard_count)])
+    return output
@@ -0,0 +1,33 @@
+__all__ = ('split_shard_ids',)
+
+
+def split_shard_ids(shard_count, worker_count, max_concurrency):
+    """
+    Splits the shards' identifiers into continuous ranges for each worker.
+    
+    The ranges are aligned to `max_concurrency`, so each worker's identify batches use every identify bucket.
+    
+    Parameters
+    ----------
+    shard_count : `int`
+        The total amount of shards.
+    worker_count : `int`
+        The amount of workers to split the shards between. If there are not enough shards, less ranges are returned.
+    max_concurrency : `int`
+        The maximal amount of shards that can be launched at the same time.
+    
+    Returns
+    -------
+    shard_id_ranges : `list<range>`
+    """
+    block_count = (shard_count + max_concurrency - 1) // max_concurrency
+    worker_count = min(worker_count, block_count)
+    
+    shard_id_ranges = []
+    
+    for worker_index in range(worker_count):
+        block_start = (worker_index * block_count) // worker_count
+        block_end = ((worker_index + 1) * block_count) // worker_count
+        shard_id_ranges.append(range(block_start * max_concurrency, min(block_end * max_concurrency, shard_count)))
+    
+    return shard_id_ranges
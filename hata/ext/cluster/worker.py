@@ -0,0 +1,262 @@
+__all__ = ('ClusterWorker',)
+
+from time import monotonic, sleep as blocking_sleep
+
+from scarletio import RichAttributeErrorBaseType
+
+from ...discord.client import Client
+from ...discord.core import KOKORO
+
+from .constants import CLUSTER_MESSAGE_READY, CLUSTER_MESSAGE_STOP, SUPERVISE_INTERVAL, WORKER_STOP_TIMEOUT
+
+
+def run_worker(connection, token, shard_count, shard_ids, setup, client_keyword_parameters):
+    """
+    Runs a cluster worker. This is the entry point of the worker processes.
+    
+    Creates a client running only the given shards, sets it up, starts it and runs it till the cluster asks it to
+    stop or till the client stops. Stops the event loop before returning.
+    
+    Parameters
+    ----------
+    connection : ``Connection``
+        Connection to communicate with the cluster.
+    token : `str`
+        The client's token.
+    shard_count : `int`
+        The total amount of shards.
+    shard_ids : `tuple<int>`
+        The shards' identifiers to run.
+    setup : `callable`
+        Function to call with the created client to set it up. Must be accepting `1` parameter, the client.
+    client_keyword_parameters : `dict<str, object>`
+        Additional keyword parameters to create the client with.
+    """
+    client = Client(token, shard_count = shard_count, shard_ids = shard_ids, **client_keyword_parameters)
+    
+    try:
+        setup(client)
+        
+        async def ready(client):
+            nonlocal connection
+            connection.send(CLUSTER_MESSAGE_READY)
+        
+        client.events(ready)
+        
+        if not client.start():
+            return
+        
+        while client.running:
+            if not connection.poll(SUPERVISE_INTERVAL):
+                continue
+            
+            try:
+                message = connection.recv()
+            except EOFError:
+                break
+            
+            if message == CLUSTER_MESSAGE_STOP:
+                break
+    
+    finally:
+        if client.running:
+            client.stop()
+        
+        connection.close()
+        
+        # Stop the event loop, so the process can exit.
+        KOKORO.stop()
+
+
+class ClusterWorker(RichAttributeErrorBaseType):
+    """
+    Represents a cluster's worker process from the cluster's side.
+    
+    Attributes
+    ----------
+    connection : `None | Connection`
+        Connection to communicate with the worker process.
+    process : `None | Process`
+        The running worker process.
+    ready : `bool`
+        Whether the worker reported that its shards are up.
+    shard_ids : `tuple<int>`
+        The shards' identifiers ran by the worker.
+    worker_id : `int`
+        The worker's identifier inside of its cluster.
+    """
+    __slots__ = ('connection', 'process', 'ready', 'shard_ids', 'worker_id')
+    
+    def __new__(cls, worker_id, shard_ids):
+        """
+        Creates a new cluster worker.
+        
+        Parameters
+        ----------
+        worker_id : `int`
+            The worker's identifier inside of its cluster.
+        shard_ids : `iterable<int>`
+            The shards' identifiers ran by the worker.
+        """
+        self = object.__new__(cls)
+        self.connection = None
+        self.process = None
+        self.ready = False
+        self.shard_ids = tuple(shard_ids)
+        self.worker_id = worker_id
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the cluster worker's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' worker_id = ')
+        repr_parts.append(repr(self.worker_id))
+        
+        shard_ids = self.shard_ids
+        if shard_ids:
+            repr_parts.append(', shards = ')
+            repr_parts.append(repr(shard_ids[0]))
+            repr_parts.append('-')
+            repr_parts.append(repr(shard_ids[-1]))
+        
+        process = self.process
+        if (process is not None):
+            repr_parts.append(', pid = ')
+            repr_parts.append(repr(process.pid))
+        
+        if self.ready:
+            repr_parts.append(', ready')
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def is_alive(self):
+        """
+        Returns whether the worker process is running.
+        
+        Returns
+        -------
+        is_alive : `bool`
+        """
+        process = self.process
+        if process is None:
+            return False
+        
+        return process.is_alive()
+    
+    
+    def start(self, context, token, shard_count, setup, client_keyword_parameters):
+        """
+        Starts the worker process.
+        
+        Parameters
+        ----------
+        context : ``BaseContext``
+            Multiprocessing context to create the process with.
+        token : `str`
+            The client's token.
+        shard_count : `int`
+            The total amount of shards.
+        setup : `callable`
+            Function to call with the created client to set it up.
+        client_keyword_parameters : `dict<str, object>`
+            Additional keyword parameters to create the client with.
+        """
+        connection, child_connection = context.Pipe(duplex = True)
+        process = context.Process(
+            target = run_worker,
+            args = (child_connection, token, shard_count, self.shard_ids, setup, client_keyword_parameters),
+            name = f'hata-cluster-worker-{self.worker_id}',
+        )
+        process.start()
+        child_connection.close()
+        
+        self.connection = connection
+        self.process = process
+        self.ready = False
+    
+    
+    def poll_messages(self):
+        """
+        Processes the messages sent by the worker process.
+        """
+        connection = self.connection
+        if connection is None:
+            return
+        
+        try:
+            while connection.poll():
+                message = connection.recv()
+                if message == CLUSTER_MESSAGE_READY:
+                    self.ready = True
+        
+        except (EOFError, OSError):
+            pass
+    
+    
+    def wait_ready(self, timeout):
+        """
+        Waits till the worker reports that its shards are up.
+        
+        Parameters
+        ----------
+        timeout : `float`
+            The maximal time to wait.
+        
+        Returns
+        -------
+        ready : `bool`
+            Whether the worker reported ready. Returns `False` if the worker process died or on timeout.
+        """
+        connection = self.connection
+        if connection is None:
+            return False
+        
+        deadline = monotonic() + timeout
+        
+        while not self.ready:
+            if not self.is_alive():
+                return False
+            
+            remaining = deadline - monotonic()
+            if remaining <= 0.0:
+                return False
+            
+            try:
+                connection.poll(min(remaining, SUPERVISE_INTERVAL))
+            except (EOFError, OSError):
+                # The process is probably closing, give it some time to exit
+                blocking_sleep(SUPERVISE_INTERVAL)
+            
+            self.poll_messages()
+        
+        return True
+    
+    
+    def stop(self):
+        """
+        Stops the worker process. If it does not exit in time, it is killed.
+        """
+        connection = self.connection
+        process = self.process
+        self.connection = None
+        self.process = None
+        self.ready = False
+        
+        if (connection is not None):
+            try:
+                connection.send(CLUSTER_MESSAGE_STOP)
+            except (BrokenPipeError, OSError):
+                pass
+        
+        if (process is not None):
+            process.join(WORKER_STOP_TIMEOUT)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        
+        if (connection is not None):
+            connection.close()
@@ -0,0 +1,381 @@
+__all__ = ()
+
+from re import UNICODE as RE_UNICODE, compile as re_compile, error as RegexError
+
+from scarletio import RichAttributeErrorBaseType
+
+
+REGEX_SPECIAL_CHARACTERS = frozenset('.^$*+?{}[]|()\\')
+REGEX_QUANTIFIER_CHARACTERS = frozenset('*+?{')
+
+TRIE_ENTRIES_KEY = None
+
+
+def get_literal_prefix(pattern_string):
+    """
+    Returns the literal prefix of the given regex pattern, so every string matched by the pattern starts with it.
+    
+    Parameters
+    ----------
+    pattern_string : `str`
+        The regex pattern's string.
+    
+    Returns
+    -------
+    literal_prefix : `str`
+    """
+    length = len(pattern_string)
+    index = 0
+    
+    # Leading `^` is no-op with full matching.
+    if pattern_string.startswith('^'):
+        index = 1
+    
+    characters = []
+    
+    while index < length:
+        character = pattern_string[index]
+        if character == '\\':
+            if index + 1 >= length:
+                break
+            
+            character = pattern_string[index + 1]
+            # `\d`, `\w`, `\1` and such are not literals.
+            if character.isalnum() or character == '_':
+                break
+            
+            step = 2
+        
+        elif character in REGEX_SPECIAL_CHARACTERS:
+            break
+        
+        else:
+            step = 1
+        
+        index += step
+        # A quantified character is not part of the prefix.
+        if (index < length) and (pattern_string[index] in REGEX_QUANTIFIER_CHARACTERS):
+            break
+        
+        characters.append(character)
+    
+    return ''.join(characters)
+
+
+def get_combinable_pattern(pattern_string):
+    """
+    Returns the given regex pattern with its every capturing group turned into non-capturing, so it can be combined
+    with other patterns into a single alternation.
+    
+    Parameters
+    ----------
+    pattern_string : `str`
+        The regex pattern's string.
+    
+    Returns
+    -------
+    combinable_pattern_string : `None | str`
+        Returns `None` if the pattern cannot be combined, because it uses back references, conditionals or comments.
+    top_level_alternation : `bool`
+        Whether the pattern has alternation outside of its groups.
+    """
+    length = len(pattern_string)
+    index = 0
+    depth = 0
+    combinable = True
+    top_level_alternation = False
+    parts = []
+    
+    # Even if the pattern cannot be combined, we scan it through, so alternation after the non-combinable part is
+    # detected as well.
+    
+    while index < length:
+        character = pattern_string[index]
+        
+        if character == '\\':
+            escaped = pattern_string[index + 1 : index + 2]
+            if escaped.isdigit():
+                combinable = False
+            
+            parts.append(pattern_string[index : index + 2])
+            index += 2
+            continue
+        
+        if character == '[':
+            end = index + 1
+            if pattern_string.startswith('^', end):
+                end += 1
+            
+            # `]` right after the opening is a literal.
+            if pattern_string.startswith(']', end):
+                end += 1
+            
+            while end < length:
+                class_character = pattern_string[end]
+                if class_character == '\\':
+                    end += 2
+                    continue
+                
+                end += 1
+                if class_character == ']':
+                    break
+            
+            parts.append(pattern_string[index : end])
+            index = end
+            continue
+        
+        if character == '(':
+            depth += 1
+            
+            if pattern_string.startswith('?P<', index + 1):
+                name_end = pattern_string.find('>', index + 4)
+                if name_end != -1:
+                    parts.append('(?:')
+                    index = name_end + 1
+                    continue
+                
+                combinable = False
+            
+            elif pattern_string.startswith(('?P=', '?(', '?#'), index + 1):
+                combinable = False
+            
+            if pattern_string.startswith('?', index + 1):
+                parts.append('(')
+            else:
+                parts.append('(?:')
+            
+            index += 1
+            continue
+        
+        if character == ')':
+            depth -= 1
+        
+        elif (character == '|') and (not depth):
+            top_level_alternation = True
+        
+        parts.append(character)
+        index += 1
+    
+    if not combinable:
+        return None, top_level_alternation
+    
+    combinable_pattern_string = ''.join(parts)
+    
+    # Validate the output; if we missed anything, do not combine.
+    try:
+        regex_pattern = re_compile(combinable_pattern_string)
+    except RegexError:
+        return None, top_level_alternation
+    
+    if regex_pattern.groups:
+        return None, top_level_alternation
+    
+    return combinable_pattern_string, top_level_alternation
+
+
+class CustomIdRouter(RichAttributeErrorBaseType):
+    """
+    Resolves which regex based custom id command matches a `custom_id`.
+    
+    The registered patterns are indexed by their literal prefix in a trie, so only the patterns which can match the
+    `custom_id` are checked. The candidate patterns are combined into a single alternation regex with a named group
+    per pattern, so a `custom_id` is matched against them in one pass. Patterns which cannot be combined (because of
+    flags or back references) are matched one by one. Either way the first registered matching pattern wins.
+    
+    The router is compiled lazily and it must be invalidated when its commands change.
+    
+    Attributes
+    ----------
+    _entries : `None | list<(RegexMatcher, CommandBaseCustomId, None | str)>`
+        Regex matcher, command, combinable pattern string triplets in registration order. `None` if not compiled.
+    _plans : `dict<tuple<int>, tuple<(RegexMatcher | re.Pattern, None | dict<str, RegexMatcher>)>>`
+        Candidate entry indexes to match plan relation.
+    _trie : `dict<None | str, dict | list<int>>`
+        Literal prefix trie. Under the `None` key the indexes of the entries ending at the node are stored.
+    regex_custom_id_to_command : `dict<RegexMatcher, CommandBaseCustomId>`
+        Regex matcher to command relation to route.
+    """
+    __slots__ = ('_entries', '_plans', '_trie', 'regex_custom_id_to_command')
+    
+    def __new__(cls, regex_custom_id_to_command):
+        """
+        Creates a new custom id router.
+        
+        Parameters
+        ----------
+        regex_custom_id_to_command : `dict<RegexMatcher, CommandBaseCustomId>`
+            Regex matcher to command relation to route.
+        """
+        self = object.__new__(cls)
+        self._entries = None
+        self._plans = {}
+        self._trie = {}
+        self.regex_custom_id_to_command = regex_custom_id_to_command
+        return self
+    
+    
+    def __repr__(self):
+        """Returns the custom id router's representation."""
+        repr_parts = ['<', type(self).__name__]
+        
+        repr_parts.append(' pattern_count = ')
+        repr_parts.append(repr(len(self.regex_custom_id_to_command)))
+        
+        repr_parts.append(', compiled = ')
+        repr_parts.append(repr(self._entries is not None))
+        
+        repr_parts.append('>')
+        return ''.join(repr_parts)
+    
+    
+    def invalidate(self):
+        """
+        Invalidates the router. Should be called when its commands change.
+        """
+        self._entries = None
+        self._plans.clear()
+        self._trie.clear()
+    
+    
+    def _compile(self):
+        """
+        Builds the literal prefix trie of the registered patterns.
+        
+        Returns
+        -------
+        entries : `list<(RegexMatcher, CommandBaseCustomId, None | str)>`
+        """
+        entries = []
+        trie = self._trie
+        
+        for index, (regex_matcher, command) in enumerate(self.regex_custom_id_to_command.items()):
+            regex_pattern = regex_matcher.regex_pattern
+            pattern_string = regex_pattern.pattern
+            
+            if regex_pattern.flags & ~RE_UNICODE:
+                combinable_pattern_string = None
+                literal_prefix = ''
+            else:
+                combinable_pattern_string, top_level_alternation = get_combinable_pattern(pattern_string)
+                literal_prefix = '' if top_level_alternation else get_literal_prefix(pattern_string)
+            
+            entries.append((regex_matcher, command, combinable_pattern_string))
+            
+            node = trie
+            for character in literal_prefix:
+                node = node.setdefault(character, {})
+            
+            node.setdefault(TRIE_ENTRIES_KEY, []).append(index)
+        
+        self._entries = entries
+        return entries
+    
+    
+    def _get_plan(self, entries, candidate_indexes):
+        """
+        Creates a match plan for the given candidates. Consecutive combinable patterns are combined into a single
+        alternation regex.
+        
+        Parameters
+        ----------
+        entries : `list<(RegexMatcher, CommandBaseCustomId, None | str)>`
+            The router's entries.
+        candidate_indexes : `tuple<int>`
+            The candidate entries' indexes in registration order.
+        
+        Returns
+        -------
+        plan : `tuple<(RegexMatcher | re.Pattern, None | dict<str, RegexMatcher>)>`
+        """
+        plan = []
+        run = []
+        
+        for index in (*candidate_indexes, -1):
+            if index != -1:
+                regex_matcher, command, combinable_pattern_string = entries[index]
+                if (combinable_pattern_string is not None):
+                    run.append((regex_matcher, combinable_pattern_string))
+                    continue
+            
+            if len(run) == 1:
+                plan.append((run[0][0], None))
+            
+            elif run:
+                group_name_to_regex_matcher = {}
+                alternatives = []
+                for run_index, (run_regex_matcher, run_pattern_string) in enumerate(run):
+                    group_name = f'_{run_index}'
+                    group_name_to_regex_matcher[group_name] = run_regex_matcher
+                    alternatives.append(f'(?P<{group_name}>{run_pattern_string})')
+                
+                plan.append((re_compile('|'.join(alternatives)), group_name_to_regex_matcher))
+            
+            run.clear()
+            
+            if index != -1:
+                plan.append((regex_matcher, None))
+        
+        plan = tuple(plan)
+        self._plans[candidate_indexes] = plan
+        return plan
+    
+    
+    def get(self, custom_id):
+        """
+        Returns the command matching the given `custom_id`.
+        
+        Parameters
+        ----------
+        custom_id : `str`
+            The custom id to match.
+        
+        Returns
+        -------
+        command_and_regex_match : `None | (CommandBaseCustomId, RegexMatch)`
+        """
+        entries = self._entries
+        if entries is None:
+            if not self.regex_custom_id_to_command:
+                return None
+            
+            entries = self._compile()
+        
+        node = self._trie
+        candidate_indexes = node.get(TRIE_ENTRIES_KEY, None)
+        candidate_indexes = [] if candidate_indexes is None else [*candidate_indexes]
+        
+        for character in custom_id:
+            node = node.get(character, None)
+            if node is None:
+                break
+            
+            indexes = node.get(TRIE_ENTRIES_KEY, None)
+            if (indexes is not None):
+                candidate_indexes.extend(indexes)
+        
+        if not candidate_indexes:
+            return None
+        
+        candidate_indexes.sort()
+        candidate_indexes = tuple(candidate_indexes)
+        
+        plan = self._plans.get(candidate_indexes, None)
+        if plan is None:
+            plan = self._get_plan(entries, candidate_indexes)
+        
+        for matcher, group_name_to_regex_matcher in plan:
+            if group_name_to_regex_matcher is None:
+                regex_matcher = matcher
+            
+            else:
+                matched = matcher.fullmatch(custom_id)
+                if matched is None:
+                    continue
+                
+                regex_matcher = group_name_to_regex_matcher[matched.lastgroup]
+            
+            regex_match = regex_matcher(custom_id)
+            if (regex_match is not None):
+                return self.regex_custom_id_to_command[regex_matcher], regex_match
+        
+        return None
@@ -24,6 +24,7 @@ from .command import (
 )
 from .command.component_command.constants import COMMAND_TARGETS_COMPONENT_COMMAND
 from .command.form_submit_command.constants import COMMAND_TARGETS_FORM_COMPONENT_COMMAND
+from .custom_id_router import CustomIdRouter
 from .exceptions import (
     SlasherSyncError, _validate_random_error_message_getter, default_slasher_exception_handler,
     default_slasher_random_error_message_getter
@@ -867,6 +868,9 @@ class Slasher(
         | UNLOADING_BEHAVIOUR_KEEP      | 1     |
         +-------------------------------+-------+
     
+    _component_command_router : ``CustomIdRouter``
+        Router resolving regex based component commands.
+    
     _component_commands : `set` of ``ComponentCommand``
         The component commands added to the slasher.
     
@@ -906,6 +910,9 @@ class Slasher(
         | handled           | `bool`    |
         +-------------------+-----------+
     
+    _form_submit_command_router : ``CustomIdRouter``
+        Router resolving regex based form submit commands.
+    
     _form_submit_commands : `set` of ``FormSubmitCommand``
         The form commands added to the slasher.
     
@@ -973,13 +980,14 @@ class Slasher(
     """
     __slots__ = (
         '__weakref__', '_assert_application_command_permission_missmatch_at', '_auto_completers', '_call_later',
-        '_client_reference', '_command_states', '_command_unloading_behaviour', '_component_commands',
-        '_component_interaction_waiters', '_enforce_application_command_permissions', '_exception_handlers',
-        '_form_submit_commands', '_get_permission_tasks', '_guild_level_permission_overwrites', '_owners_access',
-        '_owners_access_get_impossible', '_owners_access_get_task', '_random_error_message_getter',
-        '_regex_custom_id_to_component_command', '_regex_custom_id_to_form_submit_command', '_self_reference',
-        '_string_custom_id_to_component_command', '_string_custom_id_to_form_submit_command', '_sync_done',
-        '_sync_should', '_sync_tasks', '_synced_permissions', '_translation_table', 'command_id_to_command'
+        '_client_reference', '_command_states', '_command_unloading_behaviour', '_component_command_router',
+        '_component_commands', '_component_interaction_waiters', '_enforce_application_command_permissions',
+        '_exception_handlers', '_form_submit_command_router', '_form_submit_commands', '_get_permission_tasks',
+        '_guild_level_permission_overwrites', '_owners_access', '_owners_access_get_impossible',
+        '_owners_access_get_task', '_random_error_message_getter', '_regex_custom_id_to_component_command',
+        '_regex_custom_id_to_form_submit_command', '_self_reference', '_string_custom_id_to_component_command',
+        '_string_custom_id_to_form_submit_command', '_sync_done', '_sync_should', '_sync_tasks', '_synced_permissions',
+        '_translation_table', 'command_id_to_command'
     )
     
     __event_name__ = 'interaction_create'
@@ -1161,10 +1169,12 @@ class Slasher(
         self._component_commands = set()
         self._string_custom_id_to_component_command = {}
         self._regex_custom_id_to_component_command = {}
+        self._component_command_router = CustomIdRouter(self._regex_custom_id_to_component_command)
         
         self._form_submit_commands = set()
         self._string_custom_id_to_form_submit_command = {}
         self._regex_custom_id_to_form_submit_command = {}
+        self._form_submit_command_router = CustomIdRouter(self._regex_custom_id_to_form_submit_command)
         
         self._exception_handlers = exception_handlers
         self._self_reference = None
@@ -1265,15 +1275,11 @@ class Slasher(
         try:
             component_command = self._string_custom_id_to_component_command[custom_id]
         except KeyError:
-            for regex_matcher in self._regex_custom_id_to_component_command:
-                regex_match = regex_matcher(custom_id)
-                if (regex_match is None):
-                    continue
-                
-                component_command = self._regex_custom_id_to_component_command[regex_matcher]
-                break
-            else:
+            routed = self._component_command_router.get(custom_id)
+            if routed is None:
                 return
+                
+            component_command, regex_match = routed
         else:
             regex_match = None
         
@@ -1330,15 +1336,11 @@ class Slasher(
         try:
             form_submit_command = self._string_custom_id_to_form_submit_command[custom_id]
         except KeyError:
-            for regex_matcher in self._regex_custom_id_to_form_submit_command:
-                regex_match = regex_matcher(custom_id)
-                if (regex_match is None):
-                    continue
-                
-                form_submit_command = self._regex_custom_id_to_form_submit_command[regex_matcher]
-                break
-            else:
+            routed = self._form_submit_command_router.get(custom_id)
+            if routed is None:
                 return
+                
+            form_submit_command, regex_match = routed
         else:
             regex_match = None
         
@@ -3031,6 +3033,7 @@ class Slasher(
             component_command, self._component_commands,
             self._string_custom_id_to_component_command,
             self._regex_custom_id_to_component_command,
+            self._component_command_router,
         )
         return component_command
     
@@ -3054,6 +3057,7 @@ class Slasher(
             self._form_submit_commands,
             self._string_custom_id_to_form_submit_command,
             self._regex_custom_id_to_form_submit_command,
+            self._form_submit_command_router,
         )
         return form_submit_command
     
@@ -3064,6 +3068,7 @@ class Slasher(
         custom_id_based_commands,
         string_custom_id_to_custom_id_based_command,
         regex_custom_id_to_custom_id_based_command,
+        custom_id_router,
     ):
         """
         Adds a custom id based command to the ``Slasher`` if applicable.
@@ -3078,6 +3083,8 @@ class Slasher(
             A dictionary which contains commands by their `custom_id`.
         regex_custom_id_to_custom_id_based_command : ``dict` of (``RegexMatcher``, ``CommandBaseCustomId``) items
             A dictionary which contains commands based on regex patterns.
+        custom_id_router : ``CustomIdRouter``
+            Router to invalidate if regex based commands change.
         
         Raises
         ------
@@ -3150,6 +3157,8 @@ class Slasher(
             for regex_custom_id in regex_custom_ids:
                 regex_custom_id_to_custom_id_based_command[regex_custom_id] = custom_id_based_command
         
+            custom_id_router.invalidate()
+        
         custom_id_based_commands.add(custom_id_based_command)
     
     
@@ -3164,7 +3173,7 @@ class Slasher(
         """
         self._remove_custom_id_based_command(
             component_command, self._component_commands, self._string_custom_id_to_component_command,
-            self._regex_custom_id_to_component_command
+            self._regex_custom_id_to_component_command, self._component_command_router
         )
     
     
@@ -3177,15 +3186,15 @@ class Slasher(
         form_submit_command : ``FormSubmitCommand``
             The command to remove.
         """
-        self._add_custom_id_based_command(
+        self._remove_custom_id_based_command(
             form_submit_command, self._form_submit_commands, self._string_custom_id_to_form_submit_command,
-            self._regex_custom_id_to_form_submit_command
+            self._regex_custom_id_to_form_submit_command, self._form_submit_command_router
         )
     
     
     def _remove_custom_id_based_command(
         self, custom_id_based_command, custom_id_based_commands,
-        string_custom_id_to_custom_id_based_command, regex_custom_id_to_custom_id_based_command
+        string_custom_id_to_custom_id_based_command, regex_custom_id_to_custom_id_based_command, custom_id_router
     ):
         """
         Removes a custom id based command from the ``Slasher`` if applicable.
@@ -3200,6 +3209,8 @@ class Slasher(
             A dictionary which contains commands by their `custom_id`.
         regex_custom_id_to_custom_id_based_command : ``dict` of (``RegexMatcher``, ``CommandBaseCustomId``) items
             A dictionary which contains commands based on regex patterns.
+        custom_id_router : ``CustomIdRouter``
+            Router to invalidate if regex based commands change.
         """
         try:
             custom_id_based_commands.remove(custom_id_based_command)
@@ -3218,6 +3229,8 @@ class Slasher(
                 for regex_custom_id in regex_custom_ids:
                     if regex_custom_id_to_custom_id_based_command[regex_custom_id] is custom_id_based_command:
                         del regex_custom_id_to_custom_id_based_command[regex_custom_id]
+                
+                custom_id_router.invalidate()
     
     
     def get_global_command_count(self):
@@ -0,0 +1,209 @@
+from re import I as re_ignore_case, compile as re_compile
+
+import vampytest
+
+from ..converters import RegexMatch, RegexMatcher
+from ..custom_id_router import CustomIdRouter, get_combinable_pattern, get_literal_prefix
+
+
+def _assert_fields_set(custom_id_router):
+    """
+    Asserts whether every attribute is set of the given custom id router.
+    
+    Parameters
+    ----------
+    custom_id_router : ``CustomIdRouter``
+        The custom id router to check.
+    """
+    vampytest.assert_instance(custom_id_router, CustomIdRouter)
+    vampytest.assert_instance(custom_id_router._entries, list, nullable = True)
+    vampytest.assert_instance(custom_id_router._plans, dict)
+    vampytest.assert_instance(custom_id_router._trie, dict)
+    vampytest.assert_instance(custom_id_router.regex_custom_id_to_command, dict)
+
+
+def _create_router(*patterns):
+    """
+    Creates a custom id router with the given patterns, routing to their index.
+    
+    Parameters
+    ----------
+    *patterns : `str | re.Pattern`
+        The patterns to route.
+    
+    Returns
+    -------
+    custom_id_router : ``CustomIdRouter``
+    """
+    return CustomIdRouter({
+        RegexMatcher(pattern if not isinstance(pattern, str) else re_compile(pattern)): index
+        for index, pattern in enumerate(patterns)
+    })
+
+
+def test__CustomIdRouter__new():
+    """
+    Tests whether ``CustomIdRouter.__new__`` works as intended.
+    """
+    regex_custom_id_to_command = {}
+    
+    custom_id_router = CustomIdRouter(regex_custom_id_to_command)
+    _assert_fields_set(custom_id_router)
+    
+    vampytest.assert_is(custom_id_router.regex_custom_id_to_command, regex_custom_id_to_command)
+    vampytest.assert_is(custom_id_router._entries, None)
+
+
+def test__CustomIdRouter__repr():
+    """
+    Tests whether ``CustomIdRouter.__repr__`` works as intended.
+    """
+    custom_id_router = _create_router('page_(\\d+)')
+    
+    output = repr(custom_id_router)
+    vampytest.assert_instance(output, str)
+    vampytest.assert_in(type(custom_id_router).__name__, output)
+    vampytest.assert_in('pattern_count = 1', output)
+
+
+def _iter_options__get():
+    patterns = (
+        'page_(\\d+)',
+        'page_(\\d+)_(\\d+)',
+        'role\\.(?P<role_id>\\d+)',
+        re_compile('ROLE\\.\\d+', re_ignore_case),
+        'vote_(yes|no)|poll',
+        '(\\w)\\1',
+        'pa?ge',
+        '.*_end',
+    )
+    
+    yield patterns, 'page_12', (0, RegexMatch(False, ('12',)))
+    yield patterns, 'page_12_3', (1, RegexMatch(False, ('12', '3')))
+    yield patterns, 'role.5', (2, RegexMatch(True, {'role_id': '5'}))
+    yield patterns, 'Role.5', (3, RegexMatch(False, ()))
+    yield patterns, 'vote_no', (4, RegexMatch(False, ('no',)))
+    yield patterns, 'poll', (4, RegexMatch(False, (None,)))
+    yield patterns, 'aa', (5, RegexMatch(False, ('a',)))
+    yield patterns, 'pge', (6, RegexMatch(False, ()))
+    yield patterns, 'page_end', (7, RegexMatch(False, ()))
+    yield patterns, 'page_', None
+    yield (), 'page_12', None
+    
+    # Not combinable pattern with alternation after its back reference.
+    yield ('a(x)\\1|cd',), 'cd', (0, RegexMatch(False, (None,)))
+    yield ('a(x)\\1|cd',), 'axx', (0, RegexMatch(False, ('x',)))
+
+
+@vampytest._(vampytest.call_from(_iter_options__get()).returning_last())
+def test__CustomIdRouter__get(patterns, custom_id):
+    """
+    Tests whether ``CustomIdRouter.get`` works as intended.
+    
+    Parameters
+    ----------
+    patterns : `tuple<str | re.Pattern>`
+        The patterns to route.
+    custom_id : `str`
+        Custom id to route.
+    
+    Returns
+    -------
+    output : `None | (int, RegexMatch)`
+    """
+    custom_id_router = _create_router(*patterns)
+    output = custom_id_router.get(custom_id)
+    
+    # Should match the first registered matching pattern, like a linear search.
+    for regex_matcher, command in custom_id_router.regex_custom_id_to_command.items():
+        regex_match = regex_matcher(custom_id)
+        if (regex_match is not None):
+            expected_output = (command, regex_match)
+            break
+    else:
+        expected_output = None
+    
+    vampytest.assert_eq(output, expected_output)
+    return output
+
+
+def test__CustomIdRouter__invalidate():
+    """
+    Tests whether ``CustomIdRouter.invalidate`` works as intended.
+    """
+    custom_id_router = _create_router('page_(\\d+)')
+    
+    vampytest.assert_eq(custom_id_router.get('page_12'), (0, RegexMatch(False, ('12',))))
+    vampytest.assert_is_not(custom_id_router._entries, None)
+    
+    custom_id_router.regex_custom_id_to_command.clear()
+    custom_id_router.regex_custom_id_to_command[RegexMatcher(re_compile('page_(\\d+)_(\\d+)'))] = 1
+    custom_id_router.invalidate()
+    
+    vampytest.assert_is(custom_id_router._entries, None)
+    vampytest.assert_eq(custom_id_router._plans, {})
+    vampytest.assert_eq(custom_id_router._trie, {})
+    
+    vampytest.assert_eq(custom_id_router.get('page_12'), None)
+    vampytest.assert_eq(custom_id_router.get('page_12_3'), (1, RegexMatch(False, ('12', '3'))))
+
+
+def _iter_options__get_literal_prefix():
+    yield 'page_(\\d+)', 'page_'
+    yield '^page_(\\d+)', 'page_'
+    yield 'role\\.\\d+', 'role.'
+    yield 'pa?ge', 'p'
+    yield 'pa{2}ge', 'p'
+    yield '[a-z]+', ''
+    yield '\\d+', ''
+    yield 'page', 'page'
+
+
+@vampytest._(vampytest.call_from(_iter_options__get_literal_prefix()).returning_last())
+def test__get_literal_prefix(pattern_string):
+    """
+    Tests whether ``get_literal_prefix`` works as intended.
+    
+    Parameters
+    ----------
+    pattern_string : `str`
+        The regex pattern's string.
+    
+    Returns
+    -------
+    output : `str`
+    """
+    output = get_literal_prefix(pattern_string)
+    vampytest.assert_instance(output, str)
+    return output
+
+
+def _iter_options__get_combinable_pattern():
+    yield 'page_(\\d+)', ('page_(?:\\d+)', False)
+    yield 'role\\.(?P<role_id>\\d+)', ('role\\.(?:\\d+)', False)
+    yield 'vote_(?:yes|no)', ('vote_(?:yes|no)', False)
+    yield 'vote|poll_(\\d+)', ('vote|poll_(?:\\d+)', True)
+    yield 'x[()]', ('x[()]', False)
+    yield '[]()]+', ('[]()]+', False)
+    yield '(\\w)\\1', (None, False)
+    yield '(?P<a>\\w)(?P=a)', (None, False)
+    yield 'a(?#comment)', (None, False)
+    yield 'a(x)\\1|cd', (None, True)
+    yield '(?P<a>\\w)(?P=a)|cd', (None, True)
+
+
+@vampytest._(vampytest.call_from(_iter_options__get_combinable_pattern()).returning_last())
+def test__get_combinable_pattern(pattern_string):
+    """
+    Tests whether ``get_combinable_pattern`` works as intended.
+    
+    Parameters
+    ----------
+    pattern_string : `str`
+        The regex pattern's string.
+    
+    Returns
+    -------
+    output : `(None | str, bool)`
+    """
+    return get_combinable_pattern(pattern_string)
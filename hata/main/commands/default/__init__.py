@@ -5,5 +5,6 @@ from .scaffold import *
 from .help import *
 from .interpreter import *
 from .profiling import *
+from .rate_limit_broker import *
 from .run import *
 from .version import *
@@ -0,0 +1,62 @@
+__all__ = ()
+
+import sys
+from datetime import datetime as DateTime, timezone as TimeZone
+
+from ....discord import DATETIME_FORMAT_CODE, KOKORO, wait_for_interruption
+from ....discord.http.rate_limit_brokers import RateLimitBrokerServer
+from ....discord.http.rate_limit_brokers.local import GLOBAL_RATE_LIMIT_SIZE
+from ...core import register
+
+
+def _log(message):
+    """
+    Logs the given message.
+    
+    Parameters
+    ----------
+    message : `str`
+        The message to log.
+    """
+    sys.stdout.write(f'{DateTime.now(TimeZone.utc):{DATETIME_FORMAT_CODE}} {message}\n')
+
+
+@register
+def rate_limit_broker(
+    path : str,
+    *,
+    global_limit : int = GLOBAL_RATE_LIMIT_SIZE,
+):
+    """
+    Starts a rate limit broker server listening on the given unix socket path.
+    
+    Processes started with the `HATA_RATE_LIMIT_BROKER_PATH` environmental variable set to the same path share their
+    rate limits through it.
+    
+    On keyboard interrupt shuts the server down.
+    
+    When `--global-limit` is defined, it limits the requests per second shared by all processes.
+    """
+    if sys.platform == 'win32':
+        return 'Unix sockets are not supported on this platform.\n'
+    
+    if global_limit < 1:
+        return f'`--global-limit` must be positive, got {global_limit!r}.\n'
+    
+    server = RateLimitBrokerServer(path, global_limit = global_limit)
+    
+    try:
+        KOKORO.run(server.start())
+    except OSError as err:
+        return f'Could not start rate limit broker on {path!r}: {err!s}.\n'
+    
+    _log(f'Rate limit broker listening on {path!r}.')
+    
+    try:
+        wait_for_interruption()
+    except KeyboardInterrupt as err:
+        raise SystemExit from err
+    
+    finally:
+        server.close()
+        _log('Rate limit broker stopped.')
@@ -0,0 +1,142 @@
+"""
+Compares the linear regex scan with ``CustomIdRouter`` at resolving regex based component commands.
+
+Usage:
+
+```
+$ python3 scripts/benchmarks/benchmark_custom_id_router.py
+```
+
+The linear scan is how the slasher resolved the commands before ``CustomIdRouter`` was introduced. Two pattern sets
+are measured: patterns with a distinct literal prefix (the usual `action_(\\d+)` layout) and patterns without one,
+which can be only resolved by the combined alternation regex.
+"""
+
+from re import compile as re_compile
+from timeit import repeat
+
+from hata.ext.slash.converters import RegexMatcher
+from hata.ext.slash.custom_id_router import CustomIdRouter
+
+
+REPEAT = 5
+
+
+def create_commands(count, prefixed):
+    """
+    Creates regex matcher to command relation.
+    
+    Parameters
+    ----------
+    count : `int`
+        The amount of patterns to create.
+    prefixed : `bool`
+        Whether the patterns should have a distinct literal prefix.
+    
+    Returns
+    -------
+    regex_custom_id_to_command : `dict<RegexMatcher, int>`
+    custom_ids : `list<str>`
+        Custom ids matching the first, the middle and the last pattern, and one matching none of them.
+    """
+    regex_custom_id_to_command = {}
+    
+    for index in range(count):
+        if prefixed:
+            pattern = f'action_{index}_(\\d+)_(\\d+)'
+        else:
+            pattern = f'(\\d+)_(?:{index})_action'
+        
+        regex_custom_id_to_command[RegexMatcher(re_compile(pattern))] = index
+    
+    custom_ids = []
+    for index in (0, count >> 1, count - 1):
+        if prefixed:
+            custom_id = f'action_{index}_123456789_987654321'
+        else:
+            custom_id = f'123456789_{index}_action'
+        
+        custom_ids.append(custom_id)
+    
+    custom_ids.append('unknown_123456789')
+    return regex_custom_id_to_command, custom_ids
+
+
+def resolve_linear(regex_custom_id_to_command, custom_ids):
+    """
+    Resolves the commands of the given custom ids by calling every regex matcher till one matches.
+    
+    Parameters
+    ----------
+    regex_custom_id_to_command : `dict<RegexMatcher, int>`
+        Regex matcher to command relation.
+    custom_ids : `list<str>`
+        Custom ids to resolve.
+    """
+    for custom_id in custom_ids:
+        for regex_matcher in regex_custom_id_to_command:
+            regex_match = regex_matcher(custom_id)
+            if (regex_match is not None):
+                break
+
+
+def resolve_router(custom_id_router, custom_ids):
+    """
+    Resolves the commands of the given custom ids with ``CustomIdRouter``.
+    
+    Parameters
+    ----------
+    custom_id_router : ``CustomIdRouter``
+        The router to use.
+    custom_ids : `list<str>`
+        Custom ids to resolve.
+    """
+    for custom_id in custom_ids:
+        custom_id_router.get(custom_id)
+
+
+def measure(function, number):
+    """
+    Measures the given function's best run time per call in microseconds.
+    
+    Parameters
+    ----------
+    function : `FunctionType`
+        The function to measure.
+    number : `int`
+        How much times to call the function per repeat.
+    
+    Returns
+    -------
+    elapsed : `float`
+    """
+    return min(repeat(function, number = number, repeat = REPEAT)) / number * 1_000_000.0
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    print(f'{"patterns":<12}{"count":>8}  {"resolver":<16}{"us / custom_id":>16}')
+    
+    for prefixed in (True, False):
+        case = 'prefixed' if prefixed else 'unprefixed'
+        
+        for count, number in ((10, 2000), (100, 200), (1000, 20)):
+            regex_custom_id_to_command, custom_ids = create_commands(count, prefixed)
+            
+            elapsed = measure(lambda: resolve_linear(regex_custom_id_to_command, custom_ids), number)
+            elapsed /= len(custom_ids)
+            print(f'{case:<12}{count:>8}  {"linear":<16}{elapsed:>16.2f}')
+            
+            custom_id_router = CustomIdRouter(regex_custom_id_to_command)
+            # Compile ahead, we measure routing.
+            resolve_router(custom_id_router, custom_ids)
+            
+            elapsed = measure(lambda: resolve_router(custom_id_router, custom_ids), number)
+            elapsed /= len(custom_ids)
+            print(f'{case:<12}{count:>8}  {"CustomIdRouter":<16}{elapsed:>16.2f}')
+
+
+if __name__ == '__main__':
+    main()
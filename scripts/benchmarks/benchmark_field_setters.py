@@ -0,0 +1,154 @@
+"""
+Compares calling every field's parser one after the other with the generated ``FieldSetter`` functions.
+
+Usage:
+
+```
+$ python3 scripts/benchmarks/benchmark_field_setters.py
+```
+
+`MESSAGE_CREATE` is measured by creating messages, `GUILD_MEMBER_UPDATE` by updating a user and its guild profile.
+The parser calling functions are generated as well, they are the same as the entities' methods were before. After the
+events each field setter is measured alone too, since the events' throughput depends on much more than them.
+"""
+
+from timeit import repeat
+
+from hata import GuildProfile, Message, User
+from hata.discord.message.message.message import MESSAGE_FIELD_SETTER
+from hata.discord.user.guild_profile.guild_profile import GUILD_PROFILE_FIELD_SETTER
+from hata.discord.user.user.orin_user_base import ORIN_USER_FIELD_SETTER
+
+from payloads import create_guild_member_payload, create_message_create_payload
+
+
+REPEAT = 5
+NUMBER = 20000
+MESSAGE_COUNT = 1000
+MEMBER_COUNT = 1000
+
+FIELD_SETTERS = (MESSAGE_FIELD_SETTER, GUILD_PROFILE_FIELD_SETTER, ORIN_USER_FIELD_SETTER)
+
+
+def create_parser_calling_function(field_setter):
+    """
+    Creates a function that sets the fields of the given field setter by calling their parsers.
+    
+    Parameters
+    ----------
+    field_setter : ``FieldSetter``
+        The field setter to create the function for.
+    
+    Returns
+    -------
+    function : `(object, dict<str, object>) -> None`
+    """
+    namespace = {}
+    source_parts = [f'def {field_setter.name}(entity, data):\n']
+    
+    for index, (attribute_name, parser) in enumerate(field_setter.attribute_parsers):
+        namespace[f'parser_{index}'] = parser
+        source_parts.append(f'    entity.{attribute_name} = parser_{index}(data)\n')
+    
+    exec(''.join(source_parts), namespace)
+    return namespace[field_setter.name]
+
+
+def create_messages(payloads):
+    """
+    Creates the messages of the given payloads, like on `MESSAGE_CREATE` events.
+    
+    Parameters
+    ----------
+    payloads : `list<dict<str, object>>`
+        Message payloads.
+    """
+    for data in payloads:
+        Message.from_data(data)
+
+
+def update_members(users, guild_profiles, payloads):
+    """
+    Updates the given users and guild profiles, like on `GUILD_MEMBER_UPDATE` events.
+    
+    Parameters
+    ----------
+    users : `list<ClientUserBase>`
+        The users to update.
+    guild_profiles : `list<GuildProfile>`
+        The guild profiles to update.
+    payloads : `list<dict<str, object>>`
+        Guild member payloads.
+    """
+    for user, guild_profile, data in zip(users, guild_profiles, payloads):
+        user._update_attributes(data['user'])
+        guild_profile._update_attributes(data)
+
+
+class Entity:
+    """
+    Entity to set fields to.
+    """
+
+
+def measure(function, count):
+    """
+    Measures how much times the function's event can be handled in a second.
+    
+    Parameters
+    ----------
+    function : `FunctionType`
+        The function to measure.
+    count : `int`
+        How much events the function handles per call.
+    
+    Returns
+    -------
+    events_per_second : `float`
+    """
+    return count / min(repeat(function, number = 1, repeat = REPEAT))
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    message_payloads = [create_message_create_payload(index) for index in range(MESSAGE_COUNT)]
+    member_payloads = [create_guild_member_payload(index) for index in range(MEMBER_COUNT)]
+    users = [User.from_data(data['user']) for data in member_payloads]
+    guild_profiles = [GuildProfile.from_data(data) for data in member_payloads]
+    
+    functions = {
+        'parser calls': [create_parser_calling_function(field_setter) for field_setter in FIELD_SETTERS],
+        'FieldSetter': [field_setter.compile() for field_setter in FIELD_SETTERS],
+    }
+    
+    print(f'{"event":<22}{"setter":<16}{"events / s":>14}')
+    
+    for setter_name, setter_functions in functions.items():
+        for field_setter, function in zip(FIELD_SETTERS, setter_functions):
+            field_setter.function = function
+        
+        events_per_second = measure(lambda: create_messages(message_payloads), MESSAGE_COUNT)
+        print(f'{"MESSAGE_CREATE":<22}{setter_name:<16}{events_per_second:>14.0f}')
+        
+        events_per_second = measure(lambda: update_members(users, guild_profiles, member_payloads), MEMBER_COUNT)
+        print(f'{"GUILD_MEMBER_UPDATE":<22}{setter_name:<16}{events_per_second:>14.0f}')
+    
+    print()
+    print(f'{"fields of":<28}{"setter":<16}{"us / call":>10}')
+    
+    # Use payloads without embeds, so entity creation does not dominate.
+    message_data = message_payloads[1]
+    member_data = member_payloads[1]
+    datas = (message_data, member_data, member_data['user'])
+    
+    for setter_name, setter_functions in functions.items():
+        for field_setter, function, data in zip(FIELD_SETTERS, setter_functions, datas):
+            entity = Entity()
+            elapsed = min(repeat(lambda: function(entity, data), number = NUMBER, repeat = REPEAT))
+            print(f'{field_setter.name:<28}{setter_name:<16}{elapsed / NUMBER * 1_000_000.0:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,297 @@
+"""
+Compares doing concurrent requests over http/1.1 with ``HTTPClient`` and over http/2 with ``HTTP2Client``.
+
+Usage:
+
+```
+$ python3 scripts/benchmarks/benchmark_http2.py
+```
+
+Requires the `h2` library (`hata[http2]` extra).
+
+The requests are done against a local stub server, which answers every request after a fixed delay, simulating the
+latency towards Discord. It speaks http/1.1 with keep-alive, or http/2 with prior knowledge if the connection starts
+with the http/2 connection preface. The server counts the opened connections as well.
+"""
+
+import os
+from time import perf_counter
+
+from scarletio import IgnoreCaseMultiValueDictionary, Task
+from scarletio.core.protocols_and_transports.abstract import AbstractProtocolBase
+from scarletio.http_client import HTTPClient
+
+from hata.discord.core import KOKORO
+from hata.discord.http.http2 import HTTP2Client
+from hata.discord.http.http2.utils import HTTP2_AVAILABLE
+
+if HTTP2_AVAILABLE:
+    from h2.config import H2Configuration
+    from h2.connection import H2Connection
+    from h2.events import RequestReceived
+
+
+REPEAT = 5
+
+HOST = '127.0.0.1'
+
+LATENCY = 0.05
+
+HTTP2_PREFACE = b'PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n'
+
+RESPONSE_BODY = b'{"url": "wss://gateway.discord.gg"}'
+
+HTTP1_RESPONSE = (
+    b'HTTP/1.1 200 OK\r\n'
+    b'Content-Type: application/json\r\n'
+    b'Content-Length: ' + str(len(RESPONSE_BODY)).encode() + b'\r\n'
+    b'Connection: keep-alive\r\n'
+    b'\r\n' + RESPONSE_BODY
+)
+
+
+class ServerStatistics:
+    """
+    Statistics of the stub server.
+    
+    Attributes
+    ----------
+    connection_count : `int`
+        The amount of opened connections.
+    """
+    __slots__ = ('connection_count',)
+    
+    def __new__(cls):
+        """
+        Creates new server statistics.
+        """
+        self = object.__new__(cls)
+        self.connection_count = 0
+        return self
+
+
+class StubServerProtocol(AbstractProtocolBase):
+    """
+    Stub server protocol answering every request after ``LATENCY``.
+    
+    Attributes
+    ----------
+    buffer : `bytes`
+        Received, not yet processed data.
+    h2 : `None | H2Connection`
+        The http/2 state machine. `None` if the connection speaks http/1.1.
+    transport : `None | AbstractTransportLayerBase`
+        The connection's transport.
+    """
+    __slots__ = ('buffer', 'h2', 'transport')
+    
+    def __new__(cls, statistics):
+        """
+        Creates a new stub server protocol.
+        
+        Parameters
+        ----------
+        statistics : ``ServerStatistics``
+            Statistics to count the connections in.
+        """
+        statistics.connection_count += 1
+        
+        self = object.__new__(cls)
+        self.buffer = b''
+        self.h2 = None
+        self.transport = None
+        return self
+    
+    
+    def connection_made(self, transport):
+        self.transport = transport
+    
+    
+    def connection_lost(self, exception):
+        self.transport = None
+    
+    
+    def data_received(self, data):
+        h2 = self.h2
+        if (h2 is not None):
+            self._h2_data_received(data)
+            return
+        
+        buffer = self.buffer + data
+        if HTTP2_PREFACE.startswith(buffer[:len(HTTP2_PREFACE)]):
+            if len(buffer) < len(HTTP2_PREFACE):
+                self.buffer = buffer
+                return
+            
+            self.buffer = b''
+            h2 = H2Connection(H2Configuration(client_side = False, header_encoding = None))
+            h2.initiate_connection()
+            self.h2 = h2
+            self._h2_data_received(buffer)
+            return
+        
+        # Http/1.1, requests without body.
+        while True:
+            index = buffer.find(b'\r\n\r\n')
+            if index == -1:
+                break
+            
+            buffer = buffer[index + 4:]
+            KOKORO.call_after(LATENCY, self._write, HTTP1_RESPONSE)
+        
+        self.buffer = buffer
+    
+    
+    def _h2_data_received(self, data):
+        h2 = self.h2
+        for event in h2.receive_data(data):
+            if type(event) is RequestReceived:
+                KOKORO.call_after(LATENCY, self._h2_respond, event.stream_id)
+        
+        self._write(h2.data_to_send())
+    
+    
+    def _h2_respond(self, stream_id):
+        h2 = self.h2
+        h2.send_headers(
+            stream_id,
+            [
+                (':status', '200'),
+                ('content-type', 'application/json'),
+                ('content-length', str(len(RESPONSE_BODY))),
+            ],
+        )
+        h2.send_data(stream_id, RESPONSE_BODY, end_stream = True)
+        self._write(h2.data_to_send())
+    
+    
+    def _write(self, data):
+        transport = self.transport
+        if (transport is not None) and data:
+            transport.write(data)
+    
+    
+    def eof_received(self):
+        return False
+
+
+async def run_round(client, url, concurrency):
+    """
+    Does the given amount of concurrent requests.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    client : ``HTTPClient``, ``HTTP2Client``
+        The client to request with.
+    url : `str`
+        The url to request.
+    concurrency : `int`
+        The amount of requests to do concurrently.
+    
+    Returns
+    -------
+    elapsed : `float`
+    """
+    async def request():
+        response = await client._request('GET', url, IgnoreCaseMultiValueDictionary())
+        try:
+            body = await response.read()
+        finally:
+            response.release()
+        
+        if body != RESPONSE_BODY:
+            raise RuntimeError(f'Unexpected response body: {body!r}.')
+    
+    start = perf_counter()
+    tasks = [Task(KOKORO, request()) for counter in range(concurrency)]
+    for task in tasks:
+        await task
+    
+    return perf_counter() - start
+
+
+async def measure(client_type, url, concurrency, statistics):
+    """
+    Measures the best round time of the given client type and the amount of connections it opened.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    client_type : `type`
+        The client type to measure.
+    url : `str`
+        The url to request.
+    concurrency : `int`
+        The amount of requests to do concurrently.
+    statistics : ``ServerStatistics``
+        The server's statistics.
+    
+    Returns
+    -------
+    elapsed : `float`
+        Best round time in milliseconds.
+    connection_count : `int`
+    """
+    http = HTTPClient(KOKORO)
+    if client_type is HTTP2Client:
+        client = HTTP2Client(KOKORO, http)
+    else:
+        client = http
+    
+    statistics.connection_count = 0
+    
+    elapsed = min([await run_round(client, url, concurrency) for counter in range(REPEAT)]) * 1000.0
+    connection_count = statistics.connection_count
+    
+    if client_type is HTTP2Client:
+        client.close()
+    
+    return elapsed, connection_count
+
+
+async def run_benchmark():
+    """
+    Runs the benchmark.
+    
+    This function is a coroutine.
+    """
+    statistics = ServerStatistics()
+    server = await KOKORO.create_server_to(lambda: StubServerProtocol(statistics), HOST, 0)
+    await server.start()
+    port = server.sockets[0].getsockname()[1]
+    url = f'http://{HOST}:{port}/api/v10/gateway'
+    
+    print(f'latency: {LATENCY * 1000.0:.0f} ms')
+    print(f'{"requests":>10}  {"client":<14}{"ms / round":>12}{"connections":>14}')
+    
+    try:
+        for concurrency in (1, 10, 50, 200):
+            for client_type in (HTTPClient, HTTP2Client):
+                elapsed, connection_count = await measure(client_type, url, concurrency, statistics)
+                print(f'{concurrency:>10}  {client_type.__name__:<14}{elapsed:>12.2f}{connection_count:>14}')
+    finally:
+        server.close()
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    if not HTTP2_AVAILABLE:
+        print('The `h2` library is not installed.')
+        return
+    
+    try:
+        KOKORO.run(run_benchmark())
+    finally:
+        KOKORO.stop()
+    
+    # Do not wait for the open connections to be closed.
+    os._exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Compares the available json codecs at decoding gateway dispatch payloads.
+
+Usage:
+
+```
+$ python3 scripts/benchmarks/benchmark_json_codecs.py
+```
+
+The `standard` codec is measured both decoding from `bytes` and from an already utf-8 decoded `str`, the latter being
+how payloads were decoded before json codecs were introduced.
+"""
+
+from timeit import repeat
+
+from hata.discord.json_codecs import AVAILABLE_JSON_CODECS, JSON_CODEC
+from hata.discord.json_codecs.codec_standard import JsonCodec__standard
+
+from payloads import create_guild_create_payload, create_message_create_payload, create_ready_payload
+
+
+REPEAT = 5
+
+
+def create_dispatch(event_name, data):
+    """
+    Wraps the given data into a dispatch event and encodes it.
+    
+    Parameters
+    ----------
+    event_name : `str`
+        The dispatch event's name.
+    data : `dict<str, object>`
+        The event's data.
+    
+    Returns
+    -------
+    raw_data : `bytes`
+    """
+    return JsonCodec__standard.encode({'op': 0, 's': 1, 't': event_name, 'd': data}).encode('utf-8')
+
+
+def measure(function, data, number):
+    """
+    Measures the given function's best run time per call in microseconds.
+    
+    Parameters
+    ----------
+    function : `FunctionType`
+        The function to measure.
+    data : `object`
+        Parameter to call the function with.
+    number : `int`
+        How much times to call the function per repeat.
+    
+    Returns
+    -------
+    elapsed : `float`
+    """
+    return min(repeat(lambda: function(data), number = number, repeat = REPEAT)) / number * 1_000_000.0
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    cases = (
+        ('READY', create_dispatch('READY', create_ready_payload(2500)), 20),
+        ('GUILD_CREATE', create_dispatch('GUILD_CREATE', create_guild_create_payload(202505100000, 250)), 50),
+        ('MESSAGE_CREATE', create_dispatch('MESSAGE_CREATE', create_message_create_payload(0)), 5000),
+    )
+    
+    print(f'Selected codec: {JSON_CODEC.name}')
+    print(f'{"event":<16}{"size":>10}  {"codec":<24}{"us / payload":>14}')
+    
+    for event_name, raw_data, number in cases:
+        string_data = raw_data.decode('utf-8')
+        elapsed = measure(lambda data: JsonCodec__standard.decode(data.decode('utf-8')), raw_data, number)
+        print(f'{event_name:<16}{len(raw_data):>10}  {"standard (str)":<24}{elapsed:>14.2f}')
+        
+        for json_codec in AVAILABLE_JSON_CODECS:
+            elapsed = measure(json_codec.decode, raw_data, number)
+            print(f'{event_name:<16}{len(raw_data):>10}  {json_codec.name + " (bytes)":<24}{elapsed:>14.2f}')
+        
+        # Make sure all of them produce the same result.
+        expected = JsonCodec__standard.decode(string_data)
+        for json_codec in AVAILABLE_JSON_CODECS:
+            assert json_codec.decode(raw_data) == expected, json_codec.name
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""
+Compares the memory usage of the guild profiles of a synthetic large guild with and without ``GuildMemberStore``.
+
+Usage:
+
+```
+$ python3 scripts/benchmarks/benchmark_member_store.py [user_count]
+```
+
+The users are created the same way as when a `GUILD_CREATE` event is received. Memory is measured with `tracemalloc`.
+The users are created without guild profiles as well, so the guild profiles' own memory usage can be shown.
+"""
+
+import sys
+from gc import collect
+from random import Random
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+from hata import User
+from hata.discord.user.guild_profile.member_store import GUILD_MEMBER_STORES, create_guild_member_store
+
+
+USER_COUNT_DEFAULT = 500_000
+ROLE_COUNT = 50
+
+LAYOUT_USERS_ONLY = 0
+LAYOUT_GUILD_PROFILE = 1
+LAYOUT_GUILD_MEMBER_STORE = 2
+
+LAYOUT_NAMES = {
+    LAYOUT_USERS_ONLY: 'users only',
+    LAYOUT_GUILD_PROFILE: 'GuildProfile',
+    LAYOUT_GUILD_MEMBER_STORE: 'GuildMemberStore',
+}
+
+
+def iter_guild_profile_datas(user_count, user_id_base, seed = 0):
+    """
+    Iterates over synthetic guild profile data, like the `members` of a `GUILD_CREATE` event.
+    
+    This function is an iterable generator.
+    
+    Parameters
+    ----------
+    user_count : `int`
+        The amount of users to generate.
+    user_id_base : `int`
+        The first user's identifier.
+    seed : `int` = `0`, Optional
+        Random seed.
+    
+    Yields
+    ------
+    guild_profile_data : `dict<str, object>`
+    """
+    random = Random(seed)
+    role_ids = [str(user_id_base - index - 1) for index in range(ROLE_COUNT)]
+    
+    for index in range(user_count):
+        user_id = str(user_id_base + index)
+        
+        guild_profile_data = {
+            'user': {
+                'id': user_id,
+                'username': f'user_{index}',
+                'global_name': None,
+                'avatar': None,
+                'discriminator': '0',
+            },
+            'roles': random.sample(role_ids, random.randrange(0, 4)),
+            'joined_at': (
+                f'20{random.randrange(15, 25)}-{random.randrange(1, 13):02}-{random.randrange(1, 29):02}T'
+                f'{random.randrange(0, 24):02}:{random.randrange(0, 60):02}:{random.randrange(0, 60):02}.'
+                f'{random.randrange(0, 1000000):06}+00:00'
+            ),
+            'nick': (f'nick_{random.randrange(0, 1000)}' if random.random() < 0.2 else None),
+            'premium_since': ('2024-01-01T00:00:00+00:00' if random.random() < 0.01 else None),
+            'pending': False,
+            'flags': 0,
+            'mute': False,
+            'deaf': False,
+        }
+        
+        yield guild_profile_data
+
+
+def measure(user_count, user_id_base, guild_id, layout):
+    """
+    Creates the users of a synthetic guild and measures their memory usage.
+    
+    Parameters
+    ----------
+    user_count : `int`
+        The amount of users to create.
+    user_id_base : `int`
+        The first user's identifier.
+    guild_id : `int`
+        The guild's identifier.
+    layout : `int`
+        Which layout to measure. Can be `LAYOUT_USERS_ONLY`, `LAYOUT_GUILD_PROFILE`, `LAYOUT_GUILD_MEMBER_STORE`.
+    
+    Returns
+    -------
+    memory : `int`
+        Allocated memory in bytes.
+    elapsed : `float`
+        Creation time in seconds.
+    """
+    collect()
+    start()
+    memory_before, peak = get_traced_memory()
+    
+    if layout == LAYOUT_GUILD_MEMBER_STORE:
+        create_guild_member_store(guild_id, user_count, 1)
+    
+    started_at = perf_counter()
+    users = {}
+    for guild_profile_data in iter_guild_profile_datas(user_count, user_id_base):
+        if layout == LAYOUT_USERS_ONLY:
+            user = User.from_data(guild_profile_data['user'])
+        else:
+            user = User.from_data(guild_profile_data['user'], guild_profile_data, guild_id, strong_cache = False)
+        
+        users[user.id] = user
+    
+    elapsed = perf_counter() - started_at
+    
+    collect()
+    memory_after, peak = get_traced_memory()
+    stop()
+    
+    memory = memory_after - memory_before
+    
+    users.clear()
+    GUILD_MEMBER_STORES.pop(guild_id, None)
+    return memory, elapsed
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    if len(sys.argv) > 1:
+        user_count = int(sys.argv[1])
+    else:
+        user_count = USER_COUNT_DEFAULT
+    
+    print(
+        f'{"layout":<18}{"users":>10}{"MB":>10}{"bytes / user":>14}{"profile bytes / user":>22}{"seconds":>10}'
+    )
+    
+    users_only_memory = 0
+    
+    for layout in (LAYOUT_USERS_ONLY, LAYOUT_GUILD_PROFILE, LAYOUT_GUILD_MEMBER_STORE):
+        # Use new users every time, so they are not updated instead of created.
+        memory, elapsed = measure(user_count, (layout + 1) << 40, (layout + 1) << 32, layout)
+        if layout == LAYOUT_USERS_ONLY:
+            users_only_memory = memory
+        
+        print(
+            f'{LAYOUT_NAMES[layout]:<18}{user_count:>10}{memory / 1048576.0:>10.1f}{memory / user_count:>14.1f}'
+            f'{(memory - users_only_memory) / user_count:>22.1f}{elapsed:>10.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
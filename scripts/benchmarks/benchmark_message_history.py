@@ -0,0 +1,155 @@
+"""
+Compares `deque` with ``MessageRing`` at storing a channel's message history.
+
+Usage:
+
+```
+$ python3 scripts/benchmarks/benchmark_message_history.py
+```
+
+The `deque` is measured with the generic binary search, how message histories were stored before ``MessageRing`` was
+introduced.
+"""
+
+from collections import deque
+from timeit import repeat
+
+from hata.discord.channel.message_history import MessageRing, message_relative_index
+
+
+REPEAT = 5
+
+
+class MessageStub:
+    """
+    Message stub only having an identifier.
+    
+    Attributes
+    ----------
+    id : `int`
+        The message's identifier.
+    """
+    __slots__ = ('id',)
+    
+    def __new__(cls, message_id):
+        """
+        Creates a new message stub.
+        
+        Parameters
+        ----------
+        message_id : `int`
+            The message's identifier.
+        """
+        self = object.__new__(cls)
+        self.id = message_id
+        return self
+
+
+def create_messages(count):
+    """
+    Creates messages ordered from the newest to the oldest.
+    
+    Parameters
+    ----------
+    count : `int`
+        The amount of messages to create.
+    
+    Returns
+    -------
+    messages : `list<MessageStub>`
+    """
+    return [MessageStub((count - index) << 1) for index in range(count)]
+
+
+def insert_out_of_order(container_type, messages, inserted_ids):
+    """
+    Creates a message history and inserts messages into it in the middle, like when messages are received out of
+    order.
+    
+    Parameters
+    ----------
+    container_type : `type`
+        The container to store the messages in.
+    messages : `list<MessageStub>`
+        The messages to fill the history with.
+    inserted_ids : `list<int>`
+        The identifiers of the messages to insert.
+    """
+    history = container_type(messages)
+    for message_id in inserted_ids:
+        history.insert(message_relative_index(history, message_id), MessageStub(message_id))
+
+
+def delete_deque(messages, deleted_ids):
+    """
+    Bulk deletes messages from a `deque` one by one, like before ``MessageRing`` was introduced.
+    
+    Parameters
+    ----------
+    messages : `list<MessageStub>`
+        The messages to fill the history with.
+    deleted_ids : `list<int>`
+        The identifiers of the messages to delete, ordered from the newest to the oldest.
+    """
+    history = deque(messages)
+    for message_id in deleted_ids:
+        del history[message_relative_index(history, message_id)]
+
+
+def delete_message_ring(messages, deleted_ids):
+    """
+    Bulk deletes messages from a ``MessageRing`` in one pass.
+    
+    Parameters
+    ----------
+    messages : `list<MessageStub>`
+        The messages to fill the history with.
+    deleted_ids : `list<int>`
+        The identifiers of the messages to delete, ordered from the newest to the oldest.
+    """
+    history = MessageRing(messages)
+    history.delete_indexes([history.relative_index(message_id) for message_id in deleted_ids])
+
+
+def measure(function, number):
+    """
+    Measures the given function's best run time per call in microseconds.
+    
+    Parameters
+    ----------
+    function : `FunctionType`
+        The function to measure.
+    number : `int`
+        How much times to call the function per repeat.
+    
+    Returns
+    -------
+    elapsed : `float`
+    """
+    return min(repeat(function, number = number, repeat = REPEAT)) / number * 1_000_000.0
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    print(f'{"case":<24}{"messages":>10}  {"container":<16}{"us / case":>14}')
+    
+    for count, number in ((100, 500), (10000, 20)):
+        messages = create_messages(count)
+        # Spread the touched messages across the whole history. Every odd identifier is between two existing messages.
+        step = max(count // 100, 2)
+        inserted_ids = [message.id - 1 for message in messages[::step]]
+        deleted_ids = [message.id for message in messages[::step]]
+        
+        for container_type in (deque, MessageRing):
+            elapsed = measure(lambda: insert_out_of_order(container_type, messages, inserted_ids), number)
+            print(f'{"insert out of order":<24}{count:>10}  {container_type.__name__:<16}{elapsed:>14.2f}')
+        
+        for container_name, function in (('deque', delete_deque), ('MessageRing', delete_message_ring)):
+            elapsed = measure(lambda: function(messages, deleted_ids), number)
+            print(f'{"bulk delete":<24}{count:>10}  {container_name:<16}{elapsed:>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+Compares creating messages with and without lazy fields (`HATA_MESSAGE_LAZY_FIELDS`).
+
+Usage:
+
+```
+$ python3 scripts/benchmarks/benchmark_message_lazy_fields.py [message_count]
+```
+
+Every message has an attachment, a component and half of them an embed as well. Messages are created like on
+`MESSAGE_CREATE` events and then only their `content` and `author` are read, as most handlers do. After it all of
+their fields are accessed too, to show the cost of parsing them later. Memory is measured with `tracemalloc` while the
+messages are kept alive.
+"""
+
+import sys
+from gc import collect
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+from hata import Message
+from hata.discord.message.message import message as module_message
+from hata.discord.message.message.lazy_fields import LAZY_FIELDS
+
+from payloads import create_message_create_payload
+
+
+MESSAGE_COUNT_DEFAULT = 20000
+
+
+def create_payloads(message_count, message_id_base):
+    """
+    Creates message payloads with lazy fields.
+    
+    Parameters
+    ----------
+    message_count : `int`
+        The amount of payloads to create.
+    message_id_base : `int`
+        Added to the messages' identifiers, so each run creates new messages.
+    
+    Returns
+    -------
+    payloads : `list<dict<str, object>>`
+    """
+    payloads = []
+    
+    for index in range(message_count):
+        data = create_message_create_payload(index + message_id_base)
+        data['attachments'] = [
+            {
+                'id': data['id'],
+                'filename': f'image_{index}.png',
+                'size': 123456,
+                'url': f'https://cdn.discordapp.com/attachments/1/{index}/image_{index}.png',
+                'proxy_url': f'https://media.discordapp.net/attachments/1/{index}/image_{index}.png',
+                'width': 800,
+                'height': 600,
+                'content_type': 'image/png',
+            },
+        ]
+        data['components'] = [
+            {
+                'type': 1,
+                'components': [
+                    {'type': 2, 'style': 1, 'label': 'Orin', 'custom_id': f'orin_{index}'},
+                    {'type': 2, 'style': 2, 'label': 'Okuu', 'custom_id': f'okuu_{index}'},
+                ],
+            },
+        ]
+        if index & 1:
+            data['embeds'] = [{'type': 'rich', 'title': f'Embed {index}', 'description': 'Satori ' * 20}]
+        
+        payloads.append(data)
+    
+    return payloads
+
+
+def measure(payloads, lazy):
+    """
+    Creates messages from the given payloads and measures it.
+    
+    Parameters
+    ----------
+    payloads : `list<dict<str, object>>`
+        Message payloads.
+    lazy : `bool`
+        Whether lazy fields should be used.
+    
+    Returns
+    -------
+    create_elapsed : `float`
+        Seconds to create the messages and to read their `content` and `author`.
+    memory : `int`
+        Memory used by the messages in bytes.
+    access_elapsed : `float`
+        Seconds to access every lazy field of the messages.
+    """
+    module_message.MESSAGE_LAZY_FIELDS = lazy
+    
+    collect()
+    start()
+    memory_before, peak = get_traced_memory()
+    
+    started_at = perf_counter()
+    messages = []
+    for data in payloads:
+        message = Message.from_data(data)
+        message.content
+        message.author
+        messages.append(message)
+    
+    create_elapsed = perf_counter() - started_at
+    
+    collect()
+    memory_after, peak = get_traced_memory()
+    stop()
+    
+    started_at = perf_counter()
+    for message in messages:
+        for attribute_name in LAZY_FIELDS:
+            getattr(message, attribute_name)
+    
+    access_elapsed = perf_counter() - started_at
+    
+    messages.clear()
+    return create_elapsed, memory_after - memory_before, access_elapsed
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    if len(sys.argv) > 1:
+        message_count = int(sys.argv[1])
+    else:
+        message_count = MESSAGE_COUNT_DEFAULT
+    
+    print(
+        f'{"mode":<8}{"messages":>10}{"create us / message":>22}{"bytes / message":>18}'
+        f'{"access us / message":>22}'
+    )
+    
+    for index, lazy in enumerate((False, True)):
+        payloads = create_payloads(message_count, index * message_count)
+        create_elapsed, memory, access_elapsed = measure(payloads, lazy)
+        
+        print(
+            f'{("lazy" if lazy else "eager"):<8}{message_count:>10}'
+            f'{create_elapsed / message_count * 1_000_000.0:>22.2f}{memory / message_count:>18.1f}'
+            f'{access_elapsed / message_count * 1_000_000.0:>22.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
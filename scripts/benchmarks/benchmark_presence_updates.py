@@ -0,0 +1,187 @@
+"""
+Compares handling `PRESENCE_UPDATE` events with and without `HATA_PRESENCE_FAST_PATH` and `HATA_PRESENCE_STATUS_ONLY`.
+
+Usage:
+
+```
+$ python3 scripts/benchmarks/benchmark_presence_updates.py [user_count]
+```
+
+Every user is in `GUILD_COUNT` guilds with the client, so every presence update is received once for each guild. In
+every round `CHANGE_RATIO` of the users change their game or song. The events are handled by the calculating parser
+with a `user_presence_update` event handler registered. Since the modes are selected when hata is imported, each mode
+is measured in its own process.
+"""
+
+import os, sys
+from subprocess import run
+from time import perf_counter
+
+from payloads import BASE_ID, create_presence_update_payload, create_user_payload
+
+
+USER_COUNT_DEFAULT = 5000
+GUILD_COUNT = 3
+ROUND_COUNT = 6
+CHANGE_RATIO = 0.25
+ACTIVITY_COUNT = 20
+
+MODES = {
+    'default': {},
+    'fast path': {'HATA_PRESENCE_FAST_PATH': '1'},
+    'status only': {'HATA_PRESENCE_FAST_PATH': '1', 'HATA_PRESENCE_STATUS_ONLY': '1'},
+}
+
+
+def create_round_payloads(user_count, round_index):
+    """
+    Creates the presence update payloads of a round.
+    
+    Parameters
+    ----------
+    user_count : `int`
+        The amount of users.
+    round_index : `int`
+        The round's index.
+    
+    Returns
+    -------
+    payloads : `list<dict<str, object>>`
+    """
+    change_step = round(1.0 / CHANGE_RATIO)
+    payloads = []
+    
+    for index in range(user_count):
+        # Every user changes once in `change_step` rounds, the others send their same presence again.
+        activity_index = (index + (round_index + index % change_step) // change_step) % ACTIVITY_COUNT
+        
+        for guild_index in range(GUILD_COUNT):
+            payloads.append(create_presence_update_payload(index, BASE_ID + 500000 + guild_index, activity_index))
+    
+    return payloads
+
+
+async def user_presence_update(client, user, old_attributes):
+    """
+    Event handler registered to the client, so the calculating parser is used.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    client : ``Client``
+        The client who received the event.
+    user : ``ClientUserBase``
+        The user whose presence was updated.
+    old_attributes : `dict<str, object>`
+        The user's presence's old attributes.
+    """
+    pass
+
+
+async def run_mode(user_count):
+    """
+    Runs the benchmark in the current mode.
+    
+    This function is a coroutine.
+    
+    Parameters
+    ----------
+    user_count : `int`
+        The amount of users.
+    
+    Returns
+    -------
+    events_per_second : `float`
+    statistics : `dict<str, int>`
+    """
+    from scarletio import skip_ready_cycle
+    
+    from hata import Client, PRESENCE_CACHE, User
+    from hata.discord.events.core import PARSER_SETTINGS
+    
+    client = Client('token_20251019', client_id = BASE_ID + 999999)
+    client.events(user_presence_update)
+    parser = PARSER_SETTINGS['PRESENCE_UPDATE'].parser_cal_sc
+    
+    users = [User.from_data(create_user_payload(index)) for index in range(user_count)]
+    
+    # The first round sets the presences.
+    for data in create_round_payloads(user_count, 0):
+        parser(client, data)
+    
+    await skip_ready_cycle()
+    PRESENCE_CACHE.reset_statistics()
+    
+    event_count = 0
+    elapsed = 0.0
+    
+    for round_index in range(1, ROUND_COUNT + 1):
+        payloads = create_round_payloads(user_count, round_index)
+        
+        started_at = perf_counter()
+        for data in payloads:
+            parser(client, data)
+        
+        # Run the dispatched event handlers as well.
+        await skip_ready_cycle()
+        elapsed += perf_counter() - started_at
+        event_count += len(payloads)
+    
+    statistics = PRESENCE_CACHE.get_statistics()
+    client._delete()
+    users.clear()
+    return event_count / elapsed, statistics
+
+
+def measure_mode(mode_name, user_count):
+    """
+    Measures the given mode in the current process and prints the result.
+    
+    Parameters
+    ----------
+    mode_name : `str`
+        The mode's name.
+    user_count : `int`
+        The amount of users.
+    """
+    from hata import KOKORO
+    
+    try:
+        events_per_second, statistics = KOKORO.run(run_mode(user_count))
+    finally:
+        KOKORO.stop()
+    
+    print(
+        f'{mode_name:<14}{events_per_second:>14.0f}{statistics["skipped_count"]:>10}'
+        f'{statistics["shared_activity_count"]:>10}'
+    )
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    if len(sys.argv) > 2:
+        measure_mode(sys.argv[2], int(sys.argv[1]))
+        return
+    
+    if len(sys.argv) > 1:
+        user_count = int(sys.argv[1])
+    else:
+        user_count = USER_COUNT_DEFAULT
+    
+    print(f'{user_count} users, {GUILD_COUNT} guilds, {ROUND_COUNT} rounds, {CHANGE_RATIO:.0%} changing per round')
+    print(f'{"mode":<14}{"events / s":>14}{"skipped":>10}{"shared":>10}')
+    sys.stdout.flush()
+    
+    for mode_name, environment in MODES.items():
+        run(
+            [sys.executable, __file__, str(user_count), mode_name],
+            env = {**os.environ, **environment},
+            check = True,
+        )
+
+
+if __name__ == '__main__':
+    main()
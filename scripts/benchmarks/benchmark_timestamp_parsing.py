@@ -0,0 +1,174 @@
+"""
+Compares parsing the timestamps of a `GUILD_MEMBERS_CHUNK` event with the regex and with `DateTime.fromisoformat`.
+
+Usage:
+
+```
+$ python3 scripts/benchmarks/benchmark_timestamp_parsing.py [member_count]
+```
+
+The chunk's `joined_at` and `premium_since` timestamps are parsed alone first. The cache is cleared before each
+chunk, so only the timestamps repeated within the chunk are looked up from it. After it the chunk's guild profiles are
+created with each parser as well.
+
+Most timestamps of a chunk are unique, but the same ones are received again and again at other events, like the
+`joined_at` of the `member` of each `MESSAGE_CREATE` event. This is measured as well by parsing the same amount of
+timestamps of `ACTIVE_USER_COUNT` users.
+"""
+
+import sys
+from timeit import repeat
+
+from hata import GuildProfile
+from hata.discord import field_setters
+from hata.discord.user.guild_profile.guild_profile import GUILD_PROFILE_FIELD_SETTER
+from hata.discord.utils import (
+    DISCORD_EPOCH_START, PARSE_TIMESTAMP_RP, TIMESTAMP_CACHE, _datetime_from_parsed, _parse_timestamp,
+    timestamp_to_datetime
+)
+
+from payloads import create_guild_members_chunk_payload
+
+
+MEMBER_COUNT_DEFAULT = 1000
+GUILD_ID = 202510190100
+REPEAT = 7
+NUMBER = 20
+ACTIVE_USER_COUNT = 50
+
+
+def timestamp_to_datetime_regex(timestamp):
+    """
+    Parses the given timestamp with the regex only, as it was before.
+    
+    Parameters
+    ----------
+    timestamp : `str`
+        The timestamp to parse.
+    
+    Returns
+    -------
+    time : `DateTime`
+    """
+    parsed = PARSE_TIMESTAMP_RP.fullmatch(timestamp)
+    if parsed is None:
+        return DISCORD_EPOCH_START
+    
+    return _datetime_from_parsed(parsed)
+
+
+def timestamp_to_datetime_uncached(timestamp):
+    """
+    Parses the given timestamp with `DateTime.fromisoformat` without caching.
+    
+    Parameters
+    ----------
+    timestamp : `str`
+        The timestamp to parse.
+    
+    Returns
+    -------
+    time : `DateTime`
+    """
+    date_time = _parse_timestamp(timestamp)
+    if date_time is None:
+        return DISCORD_EPOCH_START
+    
+    return date_time
+
+
+PARSERS = {
+    'regex': timestamp_to_datetime_regex,
+    'fromisoformat': timestamp_to_datetime_uncached,
+    'fromisoformat + cache': timestamp_to_datetime,
+}
+
+
+def parse_timestamps(parser, timestamps):
+    """
+    Parses the given timestamps, like they are parsed at a `GUILD_MEMBERS_CHUNK` event.
+    
+    Parameters
+    ----------
+    parser : `FunctionType`
+        The parser to use.
+    timestamps : `list<str>`
+        The timestamps to parse.
+    """
+    TIMESTAMP_CACHE.clear()
+    
+    for timestamp in timestamps:
+        parser(timestamp)
+
+
+def create_guild_profiles(member_datas):
+    """
+    Creates the guild profiles of the given member payloads, like at a `GUILD_MEMBERS_CHUNK` event.
+    
+    Parameters
+    ----------
+    member_datas : `list<dict<str, object>>`
+        Guild member payloads.
+    """
+    TIMESTAMP_CACHE.clear()
+    
+    for data in member_datas:
+        GuildProfile.from_data(data)
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    if len(sys.argv) > 1:
+        member_count = int(sys.argv[1])
+    else:
+        member_count = MEMBER_COUNT_DEFAULT
+    
+    member_datas = create_guild_members_chunk_payload(GUILD_ID, member_count)['members']
+    timestamps = []
+    for data in member_datas:
+        for key in ('joined_at', 'premium_since'):
+            timestamp = data.get(key, None)
+            if (timestamp is not None):
+                timestamps.append(timestamp)
+    
+    message_timestamps = [member_datas[index % ACTIVE_USER_COUNT]['joined_at'] for index in range(member_count)]
+    
+    print(
+        f'{"parser":<24}{"chunk us / timestamp":>22}{"chunk guild profiles us":>26}'
+        f'{"messages us / timestamp":>26}'
+    )
+    
+    original_parser = field_setters.timestamp_to_datetime
+    
+    try:
+        for parser_name, parser in PARSERS.items():
+            elapsed = min(repeat(lambda: parse_timestamps(parser, timestamps), number = NUMBER, repeat = REPEAT))
+            elapsed /= NUMBER
+            
+            message_elapsed = min(
+                repeat(lambda: parse_timestamps(parser, message_timestamps), number = NUMBER, repeat = REPEAT)
+            )
+            message_elapsed /= NUMBER
+            
+            # Guild profiles set their timestamps with a generated function, so compile it again with the parser.
+            field_setters.timestamp_to_datetime = parser
+            GUILD_PROFILE_FIELD_SETTER.function = GUILD_PROFILE_FIELD_SETTER.compile()
+            
+            profiles_elapsed = min(repeat(lambda: create_guild_profiles(member_datas), number = NUMBER, repeat = REPEAT))
+            profiles_elapsed /= NUMBER
+            
+            print(
+                f'{parser_name:<24}{elapsed / len(timestamps) * 1_000_000.0:>22.3f}'
+                f'{profiles_elapsed * 1_000_000.0:>26.1f}'
+                f'{message_elapsed / len(message_timestamps) * 1_000_000.0:>26.3f}'
+            )
+    
+    finally:
+        field_setters.timestamp_to_datetime = original_parser
+        GUILD_PROFILE_FIELD_SETTER.function = GUILD_PROFILE_FIELD_SETTER.compile()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,329 @@
+"""
+Payload generators shared by the benchmarks.
+
+The generated payloads mirror the shape of the ones recorded from the gateway, only their identifiers and contents
+are synthetic.
+"""
+
+__all__ = (
+    'create_guild_create_payload', 'create_guild_member_payload', 'create_guild_members_chunk_payload',
+    'create_message_create_payload', 'create_presence_update_payload', 'create_ready_payload', 'create_user_payload'
+)
+
+BASE_ID = 202505100000000000
+
+
+def create_user_payload(index):
+    """
+    Creates a user payload.
+    
+    Parameters
+    ----------
+    index : `int`
+        The user's index, used to generate its identifier and name.
+    
+    Returns
+    -------
+    data : `dict<str, object>`
+    """
+    return {
+        'id': str(BASE_ID + index),
+        'username': f'user_{index}',
+        'global_name': f'User {index}',
+        'discriminator': '0',
+        'avatar': 'a_' + format(index, '030x'),
+        'avatar_decoration_data': None,
+        'public_flags': 64,
+        'bot': False,
+    }
+
+
+def create_guild_member_payload(index, role_count = 3):
+    """
+    Creates a guild member payload.
+    
+    Parameters
+    ----------
+    index : `int`
+        The member's index.
+    role_count : `int` = `3`, Optional
+        How much roles the member should have.
+    
+    Returns
+    -------
+    data : `dict<str, object>`
+    """
+    return {
+        'user': create_user_payload(index),
+        'roles': [str(BASE_ID + 900000 + (index + role_index) % 50) for role_index in range(role_count)],
+        'nick': (f'nick {index}' if index % 3 == 0 else None),
+        'avatar': None,
+        'banner': None,
+        'flags': 0,
+        'joined_at': (
+            f'2021-{1 + index % 12:02}-{1 + index % 28:02}T{index % 24:02}:{index % 60:02}:05.{index % 1000000:06}'
+            f'+00:00'
+        ),
+        'premium_since': ('2023-02-11T18:09:39.554000+00:00' if index % 25 == 0 else None),
+        'communication_disabled_until': None,
+        'deaf': False,
+        'mute': False,
+        'pending': False,
+    }
+
+
+def create_guild_members_chunk_payload(guild_id, member_count):
+    """
+    Creates a `GUILD_MEMBERS_CHUNK` dispatch event payload.
+    
+    Parameters
+    ----------
+    guild_id : `int`
+        The guild's identifier.
+    member_count : `int`
+        How much members to include.
+    
+    Returns
+    -------
+    data : `dict<str, object>`
+    """
+    return {
+        'guild_id': str(guild_id),
+        'members': [create_guild_member_payload(index) for index in range(member_count)],
+        'chunk_index': 0,
+        'chunk_count': 1,
+        'not_found': [],
+        'nonce': None,
+    }
+
+
+def create_message_create_payload(index, guild_id = BASE_ID + 500000, channel_id = BASE_ID + 600000):
+    """
+    Creates a `MESSAGE_CREATE` dispatch event payload.
+    
+    Parameters
+    ----------
+    index : `int`
+        The message's index.
+    guild_id : `int`, Optional
+        The guild's identifier.
+    channel_id : `int`, Optional
+        The channel's identifier.
+    
+    Returns
+    -------
+    data : `dict<str, object>`
+    """
+    return {
+        'id': str(BASE_ID + 700000 + index),
+        'channel_id': str(channel_id),
+        'guild_id': str(guild_id),
+        'type': 0,
+        'content': f'Message number {index} with some content to make it look like a real one :3',
+        'author': create_user_payload(index % 100),
+        'member': {
+            'roles': [str(BASE_ID + 900001)],
+            'joined_at': '2021-05-06T12:34:56.789000+00:00',
+            'premium_since': None,
+            'deaf': False,
+            'mute': False,
+            'flags': 0,
+            'pending': False,
+            'nick': None,
+            'avatar': None,
+            'communication_disabled_until': None,
+        },
+        'timestamp': '2025-05-10T12:34:56.789000+00:00',
+        'edited_timestamp': None,
+        'tts': False,
+        'mention_everyone': False,
+        'mentions': [],
+        'mention_roles': [],
+        'attachments': [],
+        'embeds': [
+            {
+                'type': 'rich',
+                'title': 'Embed title',
+                'description': 'Embed description',
+                'color': 0x00ff00,
+                'fields': [{'name': f'field {field_index}', 'value': 'value', 'inline': True} for field_index in range(3)],
+            },
+        ] if index % 4 == 0 else [],
+        'components': [],
+        'pinned': False,
+        'flags': 0,
+        'nonce': str(BASE_ID + 800000 + index),
+    }
+
+
+def create_guild_create_payload(guild_id, member_count, channel_count = 50, role_count = 50):
+    """
+    Creates a `GUILD_CREATE` dispatch event payload.
+    
+    Parameters
+    ----------
+    guild_id : `int`
+        The guild's identifier.
+    member_count : `int`
+        How much members to include.
+    channel_count : `int` = `50`, Optional
+        How much channels to include.
+    role_count : `int` = `50`, Optional
+        How much roles to include.
+    
+    Returns
+    -------
+    data : `dict<str, object>`
+    """
+    return {
+        'id': str(guild_id),
+        'name': f'Guild {guild_id}',
+        'icon': None,
+        'owner_id': str(BASE_ID),
+        'afk_timeout': 300,
+        'verification_level': 1,
+        'default_message_notifications': 1,
+        'explicit_content_filter': 2,
+        'features': ['COMMUNITY', 'NEWS', 'INVITE_SPLASH'],
+        'mfa_level': 0,
+        'premium_tier': 1,
+        'premium_subscription_count': 4,
+        'preferred_locale': 'en-US',
+        'nsfw_level': 0,
+        'large': member_count > 250,
+        'member_count': member_count,
+        'joined_at': '2021-05-06T12:34:56.789000+00:00',
+        'roles': [
+            {
+                'id': str(BASE_ID + 900000 + index),
+                'name': f'role {index}',
+                'color': index * 1000,
+                'hoist': False,
+                'position': index,
+                'permissions': '1071698660929',
+                'managed': False,
+                'mentionable': False,
+                'flags': 0,
+            }
+            for index in range(role_count)
+        ],
+        'channels': [
+            {
+                'id': str(BASE_ID + 600000 + index),
+                'type': 0,
+                'name': f'channel-{index}',
+                'position': index,
+                'topic': None,
+                'nsfw': False,
+                'rate_limit_per_user': 0,
+                'last_message_id': str(BASE_ID + 700000 + index),
+                'permission_overwrites': [
+                    {'id': str(BASE_ID + 900000), 'type': 0, 'allow': '1024', 'deny': '0'},
+                ],
+                'flags': 0,
+            }
+            for index in range(channel_count)
+        ],
+        'emojis': [],
+        'stickers': [],
+        'threads': [],
+        'stage_instances': [],
+        'guild_scheduled_events': [],
+        'soundboard_sounds': [],
+        'voice_states': [],
+        'members': [create_guild_member_payload(index) for index in range(min(member_count, 250))],
+        'presences': [
+            {
+                'user': {'id': str(BASE_ID + index)},
+                'status': 'online',
+                'client_status': {'desktop': 'online'},
+                'activities': [{'type': 0, 'name': 'Touhou', 'created_at': 1715000000000}],
+            }
+            for index in range(min(member_count, 250))
+        ],
+    }
+
+
+def create_presence_update_payload(index, guild_id = BASE_ID + 500000, activity_index = 0):
+    """
+    Creates a `PRESENCE_UPDATE` dispatch event payload.
+    
+    Every second user is listening to Spotify with user specific timestamps, the others are playing a game, which
+    is the same for all users playing it.
+    
+    Parameters
+    ----------
+    index : `int`
+        The user's index.
+    guild_id : `int`, Optional
+        The guild's identifier.
+    activity_index : `int` = `0`, Optional
+        The index of the game or song.
+    
+    Returns
+    -------
+    data : `dict<str, object>`
+    """
+    if index & 1:
+        activity = {
+            'type': 2,
+            'name': 'Spotify',
+            'id': 'spotify:1',
+            'created_at': 1715000000000 + index,
+            'timestamps': {'start': 1715000000000 + index, 'end': 1715000200000 + index},
+            'assets': {'large_image': f'spotify:ab67616d0000b273{activity_index:016x}', 'large_text': 'Album'},
+            'details': f'Song {activity_index}',
+            'state': 'Artist',
+            'party': {'id': f'spotify:{BASE_ID + index}'},
+            'sync_id': f'{activity_index:022x}',
+            'session_id': f'{index:032x}',
+            'flags': 48,
+        }
+    else:
+        activity = {
+            'type': 0,
+            'name': f'Game {activity_index}',
+            'id': 'ec0b28a579ecb4bd',
+            'application_id': str(BASE_ID + 700000 + activity_index),
+            'assets': {'large_image': f'{BASE_ID + 710000 + activity_index}', 'large_text': 'Stage 6'},
+            'details': 'Lunatic',
+        }
+    
+    return {
+        'user': {'id': str(BASE_ID + index)},
+        'guild_id': str(guild_id),
+        'status': 'online',
+        'client_status': {'desktop': 'online'},
+        'activities': [activity],
+    }
+
+
+def create_ready_payload(guild_count):
+    """
+    Creates a `READY` dispatch event payload.
+    
+    Parameters
+    ----------
+    guild_count : `int`
+        How much unavailable guilds to include.
+    
+    Returns
+    -------
+    data : `dict<str, object>`
+    """
+    return {
+        'v': 10,
+        'user': {**create_user_payload(0), 'bot': True, 'verified': True, 'mfa_enabled': True, 'flags': 0},
+        'guilds': [{'id': str(BASE_ID + 500000 + index), 'unavailable': True} for index in range(guild_count)],
+        'session_id': 'f' * 32,
+        'resume_gateway_url': 'wss://gateway-us-east1-b.discord.gg',
+        'session_type': 'normal',
+        'shard': [0, 1],
+        'application': {'id': str(BASE_ID), 'flags': 8953856},
+        'private_channels': [],
+        'relationships': [],
+        'presences': [],
+        'guild_join_requests': [],
+        'geo_ordered_rtc_regions': ['rotterdam', 'frankfurt', 'stockholm', 'milan', 'madrid'],
+        '_trace': ['["gateway-prd-us-east1-b-xxxx",{"micros":0.0}]'],
+    }
@@ -126,6 +126,10 @@ setup(
         'hata.discord.events.soundboard_sounds_event_handler',
         'hata.discord.exceptions',
         'hata.discord.gateway',
+        'hata.discord.gateway.encodings',
+        'hata.discord.gateway.identify_coordinators',
+        'hata.discord.gateway.session_stores',
+        'hata.discord.gateway.transport_compressions',
         'hata.discord.guild',
         'hata.discord.guild.ban_add_multiple_result',
         'hata.discord.guild.ban_entry',
@@ -151,6 +155,8 @@ setup(
         'hata.discord.guild.welcome_screen',
         'hata.discord.guild.welcome_screen_channel',
         'hata.discord.http',
+        'hata.discord.http.http2',
+        'hata.discord.http.rate_limit_brokers',
         'hata.discord.integration',
         'hata.discord.integration.integration',
         'hata.discord.integration.integration_account',
@@ -165,6 +171,7 @@ setup(
         'hata.discord.interaction.responding',
         'hata.discord.invite',
         'hata.discord.invite.invite',
+        'hata.discord.json_codecs',
         'hata.discord.localization',
         'hata.discord.message',
         'hata.discord.message.attachment',
@@ -231,6 +238,7 @@ setup(
         'hata.env',
         'hata.ext',
         'hata.ext.asyncio',
+        'hata.ext.cluster',
         'hata.ext.command_utils',
         'hata.ext.commands_v2',
         'hata.ext.commands_v2.helps',
@@ -313,16 +321,25 @@ setup(
         'all': [
             'PyNaCl>=1.3.0',
             'cchardet>=2.0',
+            'erlpack',
+            'h2>=4.0',
             'inotify_simple>=1.3.5',
+            'orjson',
             'python-dateutil>=2.0',
             'snakeviz',
             'yappi',
+            'zstandard',
         ],
         'autoreload': [
             'inotify_simple>=1.3.5',
         ],
         'cpythonspeedups': [
             'cchardet>=2.0',
+            'erlpack',
+            'orjson',
+        ],
+        'http2': [
+            'h2>=4.0',
         ],
         'profiling': [
             'snakeviz',
@@ -335,6 +352,9 @@ setup(
             'PyNaCl>=1.3.0',
             'libnacl',
         ],
+        'zstd': [
+            'zstandard',
+        ],
     },
     entry_points = {
         'console_scripts': [